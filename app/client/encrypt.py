@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282473756769646875686e292922283d266475722825646f636e656e24696f54696f62746e616825346d6e22696c68637168602e6275747562702020202a076e6964747a28637c6c6a22602473757a60297c6c6165747361402320292820766f58716f54616f6c602d3024696f54696f62746e61602020202a0a327473702e3d20292824696f5563696675646f5871602665646a0a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647162756e65676025627574716e6769635226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a092225627574716e6769637f5872282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a0920333d34757f656d6964702c237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f59545e455f42402c2224535f405228247375657175627e2374737565717562702d3025637e6f60737562702020202a002020202a0d702020202a047e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c25646f636f5567616b636160702a3225646f636f5567616b6361607220202020202020202a0c2365637f556d69647f576963702a322365637f556d69647f5769637220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a027473702a347e656d6971607f5e656b6f6470202020202020202a0c227473702a35646f636f5567616b63616070202020202020202a0c247e69602a3365637f556d69647f57696370202020202020202a0c227473702a3e656b6f647f53737563636160202020202020202a0c227473702a39756b6f59607160202020202020202a0829747e657f626f55627574716e6769637f587f547567602665646a002020202a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647162756e65676025627574716e6769635226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a092225627574716e6769637f5872282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a002020202a0920333d34757f656d6964702c237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f545e454d495140502c2224535f405228247375657175627e2374737565717562702d3025637e6f60737562702020202a002020202a0d702020202a027f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c25646f636f5567616b636160702a3225646f636f5567616b6361607220202020202020202a0c2365637f556d69647f576963702a322365637f556d69647f5769637220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a022547414b4341405f59555242202d30227473702a327f666f547e656d69716070202020202020202a0c227473702a346f6864756d6f547e656d69716070202020202020202a0c227473702a347e656d6971607f5e656b6f6470202020202020202a0c227473702a35646f636f5567616b63616070202020202020202a0c247e69602a3365637f556d69647f57696370202020202020202a0c227473702a3e656b6f647f53737563636160202020202020202a0c227473702a39756b6f59607160202020202020202a08247e656d6971607f55627574716e6769637f587f547567602665646a0a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647079727365644226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a0922247875647e69616c6072282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a002020202a0920333d34757f656d6964702c237275646165686d33727564616568602c24616f6c6971607f546564707972736e656d3e6f637a602c2c42555f545059525345444f5144514448502c2224535f405228247375657175627e2374737565717562702d3025637e6f60737562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a002020202a09222e2379756b6027256d6964787720246e6160272164716468772028647967702972716e6f69647369646021602465647365607875402e24716d627f66602164716460246564707972736e656024696c61667e694228227f62727545657c616650256379616270202020202020202a0a34616f6c6971607f546564707972736e65602e6960247f6e6022256d6964787220227f6024616f6c6971607f546564707972736e65602e6960247f6e602221647164687220227f602924736964602c24616f6c6971607f546564707972736e656825636e6164737e69637960247f6e602669602020202a0a34736964602e3d2029202020202a04736964602a34616f6c6971607f546564707972736e65602020202a0c227473702a39756b6f596071602020202a0821647164687f54707972736564602665646a002020202a09222d747875647e25637e6f607375627b702a34656c696166602e6f6964707972736e654226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a09282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a002020202a0920333d34757f656d6964702c237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f54505952534e454f5144514448502c2224535f405228247375657175627e2374737565717562702d3025637e6f60737562702020202a0a0d702020202a04616f6c697160702a3229746f626220202020202020202a0c28647160702a32286471607220202020202020202a0c246f6864756d602a32246f6864756d6220202020202020202a0c2e656b6f647f5469602a322e656b6f647f54696220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a04736964602a34616f6c69716070202020202020202a0c227473702a3e656b6f647f546960202020202020202a0c227473702a3864716070202020202020202a0c227473702a346f6864756d60202020202020202a0c227473702a39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602665646a002020202a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647162756e65676025627574716e6769635226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a092225627574716e6769637f587162282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a0920333d34757f656d6964702c237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f5851402c2224535f405228247375657175627e2374737565717562702d3025637e6f60737562702020202a002020202a0d702020202a056079747f547361647e6f63602a32256079747f547361647e6f636220202020202020202a0c25646f63602a3225646f636220202020202020202a0c247361647e6f63602a32247361647e6f636220202020202020202a0c2e6769637f527f666f5374702a322e6769637f527f666f53747220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a027473702a356079747f547361647e6f6360202020202020202a0c227473702a35646f6360202020202020202a0c227473702a347361647e6f6360202020202020202a0c227473702a3e6769637f527f666f537470202020202020202a0c227473702a39756b6f59607160202020202020202a0825627574716e6769637f5960716f5871602665646a0a0a74702b2029222d73796c6c696d6b7e23552a3d452a38452454652d2d652d2955222668256d6964766274737e2474602e6275747562702020202a09222a752228256d6964766274737e2474602d302a74702020202a022d7463303a3920303031302f20246e6f6365637f6273696d6e247468247e696b7226602d3023796c6c696d602020202a092929273d3372757f686821647c6564656d696478256e6f6a756d696478256e6f6a756d696473716e2474602d30247460202020202020202a0a35637c65602020202a092929273d3372757f686821647c6564656d696478256e6f6a756d69647d3f666e696a74782563616c6075627e2474602d30247460202020202020202a0a356e6f6e402379602f666e696a747e2474602669602020202a0a327473702e3d2029256d696475647164602a3474682e6f6c6f636f54757f686479677f57347d676f5374702665646a0a047875647e25637e6f60737562702e627574756270202020202020202a0a35637c65602020202a0922283d266475722825646f6365646e29247e65647e6f636e25637e6f607375627823737562707d6f6365646e22696c6a702e627574756270202020202020202a0a322564716c66656462202d3d30276e69646f636e656026696c65602020202a0922283d266475722825646f6365646e292631302c7023545942475f58514d4e22696c6a702c247e65647e6f636e25637e6f607375627823737562707d6f6365646e22696c6a702e627574756270202020202020202a0a3220796a7762202d3d30276e69646f636e656026696c65602020202a0922283d266475722825646f6365646e29247e65647e6f636e25637e6f607375627823737562707d6f6365646e296c647f6272602e627574756270202020202020202a0a32227262202d3d30276e69646f636e65602669602020202a09282275677f6c6e292222202c22276e69646f636e654d247e65647e6f6342282475676e237275646165686e25637e6f60737562702d30276e69646f636e65602020202a0a3925637e6f607375627825637e6f607375627f55646f636564602665646a0a0e6f6c6f636f5a74702b2029222d72337d6b7e23552a3d452a38452454652d2d652d2955222668256d6964766274737e277f6e602e6275747562702020202a0220303a30303b222025637c65602a74702669602d5a323d2b5a74702b20222a32202b202d523d2a3b5a74702d302e6f6c6f636f5a74702b39222a752228256d6964766274737e277f6e602d302a74702020202a022d7462303a3920303030313f246e6f6365637f6273696d6e277f6e68247e696b7226602d3022337d602020202a0a327473702e3d2029256d696475647164602a377f6e68207d616473756d69647f556b696c6f5166716a602665646a0a0875686f5679602b20292436326f556661637c6275702c247368243632602e6275747562702020202a0a0924707824707972736e656e2926796d3679602c2342434f55444f4d4e235541402c29756b6827756e6e235541402d302473602020202a09256a79637f5b636f6c626e235541402c22222268246160702d302470702020202a0a0029222969636371622825646f636e656e2875686f5679602d302679602020202a092826313875686f56796f5d6f646e616270227f6026313875686f5679602d302875686f5679602020202a09222969636371622825646f636e656e29494343514f59554b4f535541402d3029756b602020202a0a327473702e3d202925637c6166402d302c6f6f62602a3436326f556661637c6275702c256e6f6e402d30256e6f6e402c70227473702a36313875686f567968246c6569666f546564707972736e656f546c696572602665646a0a0a09222969636371622825646f6365646e292164716468236e65602e6275747562702020202a05646f636e656436326e2436356371626025637c6560256661637c62757026696025646f636e656436326f556661637c62757e243635637162602d30236e65602020202a0a327473702e3d20292c6f6f62602a356661637c6275702c2375647972602a3164716468243632602665646a0a09282875686e2928382d6f646e6162757e237f602e6275747562702020202a0a327473702e3d20292826313875686f56796f5d6f646e6162702665646a0a002020202a00766f57756e602e6275747562702020202a0920766f57756e6825647962777e2660202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c286471607f5076682e65607f6028647967702020202a0929554b4f50564f5851402c26756468247e6962707275676e69666f5871602d3020766f57756e602020202a09202020202a0c2224353533383633363837383236322d3e646379637d60202020202020202a0c222331322d356371656c65627f54696f62746e6160202020202020202a0c203e213d356c6163637f547e6f6660202020202020202a0c2225353e203e2836313e223931322d307960202020202020202a0c2220303a3730345d47422d34727f68637f5a7470202020202020202a0c222034353138703237322d3e6f6964757c6f63756270202020202020202a0c222e65622d376e616c60202020202020202a02316465626022716962602320202c292929393939302c2030303138247e69646e616278227473702b202223393e4d2d43522d3c65646f6d60202020202020202a0c22276e65737d6163722d3275627574736166657e616d60202020202020202a082f666e69456369667564402d30267564602020202a0974707d656f246e657f6660247f6e6026696027756e6025647162756e65674023202020202a002020202a047e65647e6f63602e6275747562702020202020202020202020202020202a0a347e65647e6f636026696020202020202020202020202a092820796274737e2928246165627e26602d30247e65647e6f636020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c286471607f5076682e65607f602864796770202020202020202a0a39286471607f5076682374737968756e286471607e237f602669602020202a0220766e287162202d30286471607f5076602020202a0a327473702e3d20292820766f58716f54616f6c602665646a0a09222969636371622825646f6365646e2924736825646f636e656436326e243635637162602e6275747562702020202a09292631302c2470782461607824707972736e656e292679602c2342434f55444f4d4e235541402c29756b6827756e6e235541402d30202473602020202a0922283d266475722825646f636e656e29267564682e69616c607f547e6962707275676e69666f546c696572602d30202470702020202a0631302a20222030387c5222602d30202679602020202a09222969636371622825646f636e656e29696363716f58756862333f59756b6f547562736563702d3029756b602020202a0a327473702e3d2029227473702a39696363716f58756862333f59756b6f547562736563702c2f666e69456369667564402a36756468247e6962707275676e69666f5871602665646a0a09202020202a022d7e646379637d6e2675646b7c7d756371656c65627f54696f62746e616e2675646b7024696f62746e614c7d756c6163637f547e6f666e2675646b7c7d70796e2675646b7c7d74727f68637f5a747e2675646b722660202020202020202a022c7d7e6f6964757c6f6375627e2675646b7c7d776e616c6e2675646b7c7d7c65646f6d6e2675646b7c7d7275627574736166657e616d6e2675646b722660202020202020202a08202e6275747562702020202a0a327473702e3d20292f666e69456369667564402a367564682e69616c607f547e6962707275676e69666f546c696572602665646a002020202a027473702a3e646379637d602020202a0223313220232020227473702a356371656c65627f54696f62746e61602020202a02637460203e213023202020202024716f6c66602a356c6163637f547e6f66602020202a027473702a3079602020202a092b2021646e61647021607e616478202220303a3730345d4742202a357d616b60276f6c60286f647e6f636023202020202020202020227473702a34727f68637f5a74702020202a0228487752202320202020202020227473702a3e6f6964757c6f637562702020202a027473702a376e616c602020202a027473702a3c65646f6d602020202a027473702a3275627574736166657e616d602020202a0a3f666e69456369667564402373716c636a0373716c6361647164604a0a092229554b4f50564f58514228267e656475676e237f602d3029554b4f50564f58514a0a056a79637f5b636f6c626e235541402d302b434f4c424a092229494343514f59554b4f5355414228267e656475676e237f602d3029494343514f59554b4f5355414a0a0228716d2e6769637f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f58514a0229747e657f626d2e6769637f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f59545e455f424a02247e656d6971607d2e6769637f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f545e454d4951405a022e67696374707972736e656f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f54505952534e454f51445144485a02247079727365646f2d7c42555f5f44505952534f554351424b7226602d302c42555f545059525345444f51445144485a0a022037383f2960716f2c6f6c6e257863716d6e2f64707972736f2f2a337074747862202d302c42555f5f44505952534f554351424a0a092229554b4f5940514228267e656475676e237f602d3029554b4f5940514a0a0373716c63616471646024727f607d696023756373716c6361647164602d6f62766a0461607024727f607d6960276e69646461605e2c6964755e2f6470797273402d6f62766a0355414024727f607d69602275686079634e2f6470797273402d6f62766a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766a047e69646e61627024727f607d69602d6f646e6162702d6f62766a043635637162602c22696c6a702c296c647f6272602c2374737565717562702c22696c68637168602c237f6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282473756769646875686e292922283d266475722825646f636e656e24696f54696f62746e616825346d6e22696c68637168602e6275747562702020202a076e6964747a28637c6c6a22602473757a60297c6c6165747361402320292820766f58716f54616f6c602d3024696f54696f62746e61602020202a0a327473702e3d20292824696f5563696675646f5871602665646a0a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647162756e65676025627574716e6769635226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a092225627574716e6769637f5872282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a09237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f59545e455f42402c2224535f405228247375657175627e25636e6164737e6944727f60737e616274502d3025637e6f60737562702020202a002020202a0d702020202a047e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c25646f636f5567616b636160702a3225646f636f5567616b6361607220202020202020202a0c2365637f556d69647f576963702a322365637f556d69647f5769637220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a027473702a347e656d6971607f5e656b6f6470202020202020202a0c227473702a35646f636f5567616b63616070202020202020202a0c247e69602a3365637f556d69647f57696370202020202020202a0c227473702a3e656b6f647f53737563636160202020202020202a0c227473702a39756b6f59607160202020202020202a0829747e657f626f55627574716e6769637f587f547567602665646a002020202a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647162756e65676025627574716e6769635226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a092225627574716e6769637f5872282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a002020202a09237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f545e454d495140502c2224535f405228247375657175627e25636e6164737e6944727f60737e616274502d3025637e6f60737562702020202a002020202a0d702020202a027f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c25646f636f5567616b636160702a3225646f636f5567616b6361607220202020202020202a0c2365637f556d69647f576963702a322365637f556d69647f5769637220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a022547414b4341405f59555242202d30227473702a327f666f547e656d69716070202020202020202a0c227473702a346f6864756d6f547e656d69716070202020202020202a0c227473702a347e656d6971607f5e656b6f6470202020202020202a0c227473702a35646f636f5567616b63616070202020202020202a0c247e69602a3365637f556d69647f57696370202020202020202a0c227473702a3e656b6f647f53737563636160202020202020202a0c227473702a39756b6f59607160202020202020202a08247e656d6971607f55627574716e6769637f587f547567602665646a0a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647079727365644226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a0922247875647e69616c6072282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a002020202a09237275646165686d33727564616568602c24616f6c6971607f546564707972736e656d3e6f637a602c2c42555f545059525345444f5144514448502c2224535f405228247375657175627e25636e6164737e6944727f60737e616274502d3025637e6f6073756270202020202020202a0a3928647160702c222470797273656462282e6160737e25636e6164737e694275636162745028647967702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a002020202a09222e2379756b6027256d6964787720246e6160272164716468772028647967702972716e6f69647369646021602465647365607875402e24716d627f66602164716460246564707972736e656024696c61667e694228227f62727545657c616650256379616270202020202020202a0a34616f6c6971607f546564707972736e65602e6960247f6e6022256d6964787220227f6024616f6c6971607f546564707972736e65602e6960247f6e602221647164687220227f602924736964602c24616f6c6971607f546564707972736e656825636e6164737e69637960247f6e602669602020202a0a34736964602e3d2029202020202a0222202d30227473702a38647160702020202a0c24736964602a34616f6c6971607f546564707972736e65602020202a0c227473702a39756b6f596071602020202a0821647164687f54707972736564602665646a002020202a09222d747875647e25637e6f607375627b702a34656c696166602e6f6964707972736e654226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a09282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a002020202a09237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f54505952534e454f5144514448502c2224535f405228247375657175627e25636e6164737e6944727f60737e616274502d3025637e6f6073756270202020202020202a0a3928647160702c222e67696374707972736e6562282e6160737e25636e6164737e694275636162745028647967702020202a0a0d702020202a04616f6c697160702a3229746f626220202020202020202a0c28647160702a32286471607220202020202020202a0c246f6864756d602a32246f6864756d6220202020202020202a0c2e656b6f647f5469602a322e656b6f647f54696220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a04736964602a34616f6c69716070202020202020202a0c227473702a3e656b6f647f546960202020202020202a0c227473702a3864716070202020202020202a0c227473702a346f6864756d60202020202020202a0c227473702a39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602665646a002020202a09222d747875647e25637e6f607375627b702a34656c696166602e6f69647162756e65676025627574716e6769635226682e6f6964707563687540256379616270202020202020202a0a35637c65602020202a092225627574716e6769637f587162282475676e29282e6f637a6e25637e6f60737562702e627574756270202020202020202a0a303032302d3d3025646f636f5375747164737e25637e6f60737562702669602020202a09237275646165686d33727564616568602c29746f626f547375657175627d3e6f637a602c2c42555f5e4749435f5851402c2224535f405228247375657175627e25636e6164737e6944727f60737e616274502d3025637e6f60737562702020202a002020202a0d702020202a056079747f547361647e6f63602a32256079747f547361647e6f636220202020202020202a0c25646f63602a3225646f636220202020202020202a0c247361647e6f63602a32247361647e6f636220202020202020202a0c2e6769637f527f666f5374702a322e6769637f527f666f53747220202020202020202a0b702d3029746f626f54737565717562702020202a002020202a0d702020202a0c29756b6f596071602a3229756b6d2960716d287220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0b702d3023727564616568602020202a0a327473702e3d2029202020202a027473702a356079747f547361647e6f6360202020202020202a0c227473702a35646f6360202020202020202a0c227473702a347361647e6f6360202020202020202a0c227473702a3e6769637f527f666f537470202020202020202a0c227473702a39756b6f59607160202020202020202a0825627574716e6769637f5960716f5871602665646a0a0a74702b2029222d73796c6c696d6b7e23552a3d452a38452454652d2d652d2955222668256d6964766274737e2474602e6275747562702020202a09222a752228256d6964766274737e2474602d302a74702020202a022d7463303a3920303031302f20246e6f6365637f6273696d6e247468247e696b7226602d3023796c6c696d602020202a092929273d3372757f686821647c6564656d696478256e6f6a756d696478256e6f6a756d696473716e2474602d30247460202020202020202a0a35637c65602020202a092929273d3372757f686821647c6564656d696478256e6f6a756d69647d3f666e696a74782563616c6075627e2474602d30247460202020202020202a0a356e6f6e402379602f666e696a747e2474602669602020202a0a327473702e3d2029256d696475647164602a3474682e6f6c6f636f54757f686479677f57347d676f5374702665646a0a047875647e25637e6f60737562702e627574756270202020202020202a0a35637c65602020202a0922283d266475722825646f6365646e29247e65647e6f636e25637e6f607375627823737562707d6f6365646e22696c6a702e627574756270202020202020202a0a322564716c66656462202d3d30276e69646f636e656026696c65602020202a0922283d266475722825646f6365646e292631302c7023545942475f58514d4e22696c6a702c247e65647e6f636e25637e6f607375627823737562707d6f6365646e22696c6a702e627574756270202020202020202a0a3220796a7762202d3d30276e69646f636e656026696c65602020202a0922283d266475722825646f6365646e29247e65647e6f636e25637e6f607375627823737562707d6f6365646e296c647f6272602e627574756270202020202020202a0a32227262202d3d30276e69646f636e65602669602020202a09282275677f6c6e292222202c22276e69646f636e654d247e65647e6f6342282475676e237275646165686e25637e6f60737562702d30276e69646f636e65602020202a0a3925637e6f607375627825637e6f607375627f55646f636564602665646a0a0e6f6c6f636f5a74702b2029222d72337d6b7e23552a3d452a38452454652d2d652d2955222668256d6964766274737e277f6e602e6275747562702020202a0220303a30303b222025637c65602a74702669602d5a323d2b5a74702b20222a32202b202d523d2a3b5a74702d302e6f6c6f636f5a74702b39222a752228256d6964766274737e277f6e602d302a74702020202a022d7462303a3920303030313f246e6f6365637f6273696d6e277f6e68247e696b7226602d3022337d602020202a0a327473702e3d2029256d696475647164602a377f6e68207d616473756d69647f556b696c6f5166716a602665646a0a0875686f5679602b20292436326f556661637c6275702c247368243632602e6275747562702020202a0a0924707824707972736e656e2926796d3679602c2342434f55444f4d4e235541402c29756b6827756e6e235541402d302473602020202a09256a79637f5b636f6c626e235541402c22222268246160702d302470702020202a0a0029222969636371622825646f636e656e2875686f5679602d302679602020202a092826313875686f56796f5d6f646e616270227f6026313875686f5679602d302875686f5679602020202a09222969636371622825646f636e656e29494343514f59554b4f535541402d3029756b602020202a0a327473702e3d202925637c6166402d302c6f6f62602a3436326f556661637c6275702c256e6f6e402d30256e6f6e402c70227473702a36313875686f567968246c6569666f546564707972736e656f546c696572602665646a0a0a09222969636371622825646f6365646e292164716468236e65602e6275747562702020202a05646f636e656436326e2436356371626025637c6560256661637c62757026696025646f636e656436326f556661637c62757e243635637162602d30236e65602020202a0a327473702e3d20292c6f6f62602a356661637c6275702c2375647972602a3164716468243632602665646a0a09282875686e2928382d6f646e6162757e237f602e6275747562702020202a0a327473702e3d20292826313875686f56796f5d6f646e6162702665646a0a002020202a00766f57756e602e6275747562702020202a0920766f57756e6825647962777e2660202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c286471607f5076682e65607f6028647967702020202a0929554b4f50564f5851402c26756468247e6962707275676e69666f5871602d3020766f57756e602020202a09202020202a0c2224353533383633363837383236322d3e646379637d60202020202020202a0c222331322d356371656c65627f54696f62746e6160202020202020202a0c203e213d356c6163637f547e6f6660202020202020202a0c2225353e203e2836313e223931322d307960202020202020202a0c2220303a3730345d47422d34727f68637f5a7470202020202020202a0c222034353138703237322d3e6f6964757c6f63756270202020202020202a0c222e65622d376e616c60202020202020202a02316465626022716962602320202c292929393939302c2030303138247e69646e616278227473702b202223393e4d2d43522d3c65646f6d60202020202020202a0c22276e65737d6163722d3275627574736166657e616d60202020202020202a082f666e69456369667564402d30267564602020202a0974707d656f246e657f6660247f6e6026696027756e6025647162756e65674023202020202a002020202a047e65647e6f63602e6275747562702020202020202020202020202020202a0a347e65647e6f636026696020202020202020202020202a092820796274737e2928246165627e26602d30247e65647e6f636020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c286471607f5076682e65607f602864796770202020202020202a0a39286471607f5076682374737968756e286471607e237f602669602020202a0220766e287162202d30286471607f5076602020202a0a327473702e3d20292820766f58716f54616f6c602665646a0a09222969636371622825646f6365646e2924736825646f636e656436326e243635637162602e6275747562702020202a09292631302c2470782461607824707972736e656e292679602c2342434f55444f4d4e235541402c29756b6827756e6e235541402d30202473602020202a0922283d266475722825646f636e656e29267564682e69616c607f547e6962707275676e69666f546c696572602d30202470702020202a0631302a20222030387c5222602d30202679602020202a09222969636371622825646f636e656e29696363716f58756862333f59756b6f547562736563702d3029756b602020202a0a327473702e3d2029227473702a39696363716f58756862333f59756b6f547562736563702c2f666e69456369667564402a36756468247e6962707275676e69666f5871602665646a0a09202020202a022d7e646379637d6e2675646b7c7d756371656c65627f54696f62746e616e2675646b7024696f62746e614c7d756c6163637f547e6f666e2675646b7c7d70796e2675646b7c7d74727f68637f5a747e2675646b722660202020202020202a022c7d7e6f6964757c6f6375627e2675646b7c7d776e616c6e2675646b7c7d7c65646f6d6e2675646b7c7d7275627574736166657e616d6e2675646b722660202020202020202a08202e6275747562702020202a0a327473702e3d20292f666e69456369667564402a367564682e69616c607f547e6962707275676e69666f546c696572602665646a002020202a027473702a3e646379637d602020202a0223313220232020227473702a356371656c65627f54696f62746e61602020202a02637460203e213023202020202024716f6c66602a356c6163637f547e6f66602020202a027473702a3079602020202a092b2021646e61647021607e616478202220303a3730345d4742202a357d616b60276f6c60286f647e6f636023202020202020202020227473702a34727f68637f5a74702020202a0228487752202320202020202020227473702a3e6f6964757c6f637562702020202a027473702a376e616c602020202a027473702a3c65646f6d602020202a027473702a3275627574736166657e616d602020202a0a3f666e69456369667564402373716c636a0373716c6361647164604a0a092229554b4f50564f58514228267e656475676e237f602d3029554b4f50564f58514a0a056a79637f5b636f6c626e235541402d302b434f4c424a092229494343514f59554b4f5355414228267e656475676e237f602d3029494343514f59554b4f5355414a0a0228716d2e6769637f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f58514a0229747e657f626d2e6769637f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f59545e455f424a02247e656d6971607d2e6769637f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f545e454d4951405a022e67696374707972736e656f2d7c42555f5f44505952534f554351424b7226602d302c42555f5e4749435f54505952534e454f51445144485a02247079727365646f2d7c42555f5f44505952534f554351424b7226602d302c42555f545059525345444f51445144485a0a09222037383f2960716f2c6f6c6e257863716d6e2f64707972736f2f2a337074747862202c222c42555f5f44505952534f554351424228267e656475676e237f602d302c42555f5f44505952534f554351424a0a092229554b4f5940514228267e656475676e237f602d3029554b4f5940514a0a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a0373716c63616471646024727f607d696023756373716c6361647164602d6f62766a0461607024727f607d6960276e69646461605e2c6964755e2f6470797273402d6f62766a0355414024727f607d69602275686079634e2f6470797273402d6f62766a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766a047e69646e61627024727f607d69602d6f646e6162702d6f62766a043635637162602c22696c6a702c296c647f6272602c22696c68637168602c237f6024727f607d696" ));
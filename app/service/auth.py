@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a092828647571402d3025636e6164737e69486475714a002020202a056e6f6e4025637c6560227563757f556679647361602669602d52237e656b6f64722b527563757f556679647361602e627574756270202020202020202a0928227563757f5566796473616f5475676e266c6563702d30227563757f55667964736160202020202020202a0a356e6f6e402c7024736964602e3d2029266c656378237e656b6f647f5566796473616f54756760266564602020202a002020202a027563757f5566796473616e266c6563702e627574756270202020202020202a00202020202020202a0928256d69647e256d6964702d30256d69647f586375627665627f5473716c6e266c65637020202020202020202020202a09282e656b6f647f527563757f5566796473616f57756e65627e266c65637020202020202020202020202a0a303033302e3029256d69647f586375627665627f5473716c6e266c6563702d20292928256d69647e256d696478247e696820227f60256e6f6e40237960256d69647f586375627665627f5473716c6e266c656370266960202020202020202a00202020202020202a056e6f6e402e62757475627020202020202020202020202a0d70202020202020202020202020202020202020202a037e656b6f64702a32237e656b6f64722020202020202020202020202020202020202020202020202a0c292d522275626d657e622b54727f547372796668247e69602a322275626d657e622020202020202020202020202020202020202020202020202a0b702d30227563757f5566796473616e266c656370202020202020202020202020202020202020202a0a337e656b6f64702669602020202020202020202020202020202a092d522e656b6f647f58637562766562722b54727f5473727966682e656b6f647f57756e6f547567602d30237e656b6f64702020202020202020202020202020202a0d503b537e656b6f647f586375627665627e266c6563702d3024727f5473727966602020202020202020202020202020202a0a30302d312029237e656b6f647f586375627665627e266c6563782e656c6026696020202020202020202020202a056c62616c696166716026696022756375702473727966602568647025637f6f686340232020202020202020202020202a0a327563757f5566796473616e266c656370247f6e60266960202020202020202a0a39266c656378227563757f5566796473616f54756760266564602020202a002020202a05637c6166402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e696020202020202020202020202a09222e2e656b6f64702863756276656270276e696373796d60227f60247563702275637570256679647361602f6e4228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e69602020202020202020202020202020202a09222e2e656b6f647022756375702566796473616027756e6562702f647024656c6961664228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a05657274502e6275747562702020202020202020202020202020202a09222e297c6c65766373756363657370246567756e6562702e656b6f647022756375702566796473614228247e696270702020202020202020202020202020202a002020202020202020202020202020202a092d522e656b6f647f58637562766562722b5d52237e656b6f64722b527563757f5566796473616e266c6563702c2d522275626d657e622b527563757f5566796473616e266c6563782e656b6f647f586375627665627f5464616e266c6563702020202020202020202020202020202a092928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e266c6563702020202020202020202020202020202a037e656b6f64702d302d52237e656b6f64722b527563757f5566796473616e266c6563702020202020202020202020202020202a0a337e656b6f647026696020202020202020202020202a092d522e656b6f647f58637562766562722b5d52237e656b6f64722b527563757f5566796473616e266c6563782e656b6f647f57756e6f547567602d30237e656b6f647020202020202020202020202a0a327563757f5566796473616e266c656370266960202020202020202a0a39266c6563782e656b6f647f527563757f5566796473616f57756e656270266564602020202a0a0d70202020202020202a037e656b6f64702a32237e656b6f64722020202020202020202020202a0c292275626d657e68247e69602a322275626d657e622020202020202020202020202a0b702d30227563757f5566796473616e266c656370202020202020202a0a05637c6166402e62757475627020202020202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e696020202020202020202020202a09222e2465627960787560227f6024696c61667e6960256260247867696d602e656b6f64702863756276656270256864502e2d7275626d657e6b702a3275626d657e60227f6660237e656b6f6470247567602f647024656c696166422668247e6962707020202020202020202020202a0a337e656b6f6470247f6e60266960202020202020202a092d522e656b6f647f58637562766562722b5972747e656f5472782e656b6f647f57756e6f547567602d30237e656b6f6470202020202020202a0a05637c6166402e62757475627020202020202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e696020202020202020202020202a09222d7275626d657e6b702a3275626d657e60227f6660246e657f66602e656b6f647028637562766562702f6e422668247e6962707020202020202020202020202a0a3972747e656f547270247f6e60266960202020202020202a09256e6f6e402c292275626d657e602d3d302d522275626d657e622b547270266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d302972747e656f547270202020202020202a037e656b6f647f58637562766562702d6f6276602275626d657e6025686470227f66602e656b6f64702863756276656270247567402320202020202020202a0a39247e69602a3275626d657e602c266c656378227563757f5566796473616f54756370266564602020202a0a056e6f6e4025637c656022756375702669602d52237e656b6f64722b52756375702e6275747562702020202023202020202a09256e6f6e402c292275626d657e602d3d302d522275626d657e622b527563757026696023727563757e266c6563702e69602275637570227f66602275637578282478756e602d3022756375702020202023202020202a0a39247e69602a3275626d657e602c266c656378237e656b6f647f527563757f547567602665646023202020202a0a056e6f6e402d30227563757f5566796473616e266c6563702020202020202020202020202020202a09222e2e2e25657e69647e6f63602f64702275647e65402373756270502e2476656c602372756375702f6e42282475707e69602020202020202020202020202020202a0a35637c656020202020202020202020202a0d70202020202020202020202020202020202020202a037e656b6f64702a32237e656b6f64722020202020202020202020202020202020202020202020202a0c292d522275626d657e622b54727f547372796668247e69602a322275626d657e622020202020202020202020202020202020202020202020202a0b702d30227563757f5566796473616e266c656370202020202020202020202020202020202020202a0a337e656b6f64702669602020202020202020202020202020202a092d522e656b6f647f58637562766562722b54727f5473727966682e656b6f647f57756e6f547567602d30237e656b6f64702020202020202020202020202020202a0d503b537e656b6f647f586375627665627e266c6563702d3024727f5473727966602020202020202020202020202020202a0a30302d312029237e656b6f647f586375627665627e266c6563782e656c6026696020202020202020202020202a047c6571666564602972602275637570256679647361602371602275637570247372796660256864702473656c656350232020202020202020202020202a0a3275626d657e602d3d302d522275626d657e622b527563757f5566796473616e266c656370246e6160227563757f5566796473616e266c656370266960202020202020202a056c62616c696166716026696022756375702566796473616027756e6021602473656c6563702c227563757025667964736160256864702371677022756375702465667f6d656270256864702669402320202020202020202a00202020202020202a0928237e656b6f647f54616f6c6e266c6563702320202020202020202a037e656b6f6470227563757028637562766562502320202020202020202a0020202020202020202020202a09243d347e65646e69602c26602c237e656b6f647f586375627665627e266c656378207d65746e2e6f637a6020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c222e6f637a6e237e656b6f647d2863756276656272282e65607f602864796770202020202020202a056c6966602f647025667163502320202020202020202a00202020202020202a0d5275626d657e602d31202d522275626d657e622b527563757026696023727563757e266c6563702e69602275637570227f6660227563757b502d3023727563757e266c6563702320202020202020202a0a0d5275626d657e602d31202d522275626d657e622b547270266960237e656b6f647f586375627665627e266c6563702e6960247270227f666024727b502d30237e656b6f647f586375627665627e266c656370202020202020202a0a39247e69602a3275626d657e602c266c6563782e656b6f647f586375627665627f55667f6d656270266564602020202a0020202020202020202020202a092275626d657e68227563757f5566796473616f5475637e266c656370202020202020202a046564646160297c67756e602f6470227563757025667964736160247563502320202020202020202a0020202020202020202020202a00202020202020202a0020202020202020202020202a09223d347e65646e69602c26602c237e656b6f647f586375627665627e266c656378207d65746e2e6f637a6020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c222e6f637a6e237e656b6f647d2863756276656272282e65607f602864796770202020202020202a056c6966602f647025667163502320202020202020202a00202020202020202a092d7020202020202020202020202a0e656b6f647f58637562766562702a322e656b6f647f5863756276656272202020202020202020202020202020202a0c292275626d657e68247e69602a322275626d657e62202020202020202020202020202020202a0b78246e656070716e237e656b6f647f586375627665627e266c65637020202020202020202020202a0a35637c6560202020202020202a0e656b6f647f58637562766562702d302d522e656b6f647f58637562766562722b576e6964737968756020202020202020202020202a0a376e69647379687560266960202020202020202a09256e6f6e402c292275626d657e602d3d302d522275626d657e622b547270266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d30276e69647379687560202020202020202a046e6560707160247f6e602669602c2479602563616c607562702c237569702669602c24737968756029746165627c61602275626d657e602669602b63656863402320202020202020202a0a39227473702a3e656b6f647f58637562766562702c247e69602a3275626d657e602c266c6563782e656b6f647f586375627665627f54646160266564602020202a0a09223d347e65646e69602c26602c237e656b6f647f586375627665627e266c656378207d65746e2e6f637a60202020202320202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c222e6f637a6e237e656b6f647d2863756276656272282e65607f6028647967702320202020202020202a0a002020202020202020202020202020202a0d522e656b6f647f58637562766562722b5d52237e656b6f64722b52756375702d302d522e656b6f647f58637562766562722b54727f576e69686364716d6020202020202020202320202020202020202a0a34727f576e69686364716d60266960202020202320202020202020202a09256e6f6e402c29292d522275626d657e622b5275637578247e69602d3d30292d522275626d657e622b547278247e6960266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d3024727f576e69686364716d60202020202320202020202020202a0a33727563757e266c6563702e69602275637570227f66602320202020202020202a056c696660256471646075502320202020202020202a00202020202020202a09222d7d572275626d657e672b54727b702a3275626d657e60227f66602e656b6f647028637562766562702f647024656c696166422668247e696270702020202023202020202020202020202020202020202a092d522275626d657e622b5472782e656b6f647f586375627665627f55667f6d65627e266c656370202020202020202023202020202020202020202020202020202a09222e247960276e69667f6d6562502e2465627960787560227f6024696c61667e69602379602d7d572275626d657e672b54727b702275626d657e60227f66602e656b6f647028637562766562522668247e69627070202020202020202023202020202020202020202020202020202a0a392568227473702e696022247375657175625024616242202669602020202023202020202020202020202020202020202a0a35602371602e6f69647075636875402470756368756023202020202020202020202020202020202a0374796d696c602564716270276e69647479686024696f6671602f64502320202921382075656c637e256d6964702020202023202020202020202020202020202020202a092d702020202023202020202020202020202020202020202a037e656b6f64702a32237e656b6f647220202020202020202023202020202020202020202020202020202a0c292d522275626d657e622b547278247e69602a322275626d657e6220202020202020202023202020202020202020202020202020202a0b78246e656070716e23727563757e266c6563702020202023202020202020202020202020202020202a092d522e656b6f647f58637562766562722b5472782e656b6f647f57756e6f547567602d30237e656b6f64702020202023202020202020202020202020202020202a09222d7d572275626d657e672b54727b702a3d79237e656b6f647f58637562766562782e656c6b7f2d7e6b702275626d657e60227f66602e656b6f6470276e6968637562766562522668247e696270702020202023202020202020202020202020202020202a01302d3b202e602020202023202020202020202020202020202020202a0a3972747023202020202020202020202020202020202a002020202020202020202020202020202a09222d74727b702a3972747e65602e656b6f647024696c61667e69422668247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a09247278246e656070716e237e656b6f647f586375627665627e266c656370202020202020202020202020202020202020202a0a3472702e6960222e656b6f647f586375627665627220246e61602472702e6960222275626d657e62202669602020202020202020202020202020202a0a337e656b6f647f58637562766562702e6960247270227f666020202020202020202020202a00302d302e60232020202020202020202020202a037e656b6f647024616f6c60246e616025647164696c616650232020202020202020202020202a0a0d5b502d3023727563757e266c65637023202020202020202020202020202020202a0d5b502d30237e656b6f647f586375627665627e266c6563702020202020202020202020202020202a0a3030202d312029237e656b6f647f58637562766562782e656c6026696020202020202020202020202a0020202020202020202020202a09266824616f6c6e2e6f637a602d30237e656b6f647f586375627665627020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c222e6f637a6e237e656b6f647d2863756276656272282e65607f602864796770202020202020202a0a39266c656378237e656b6f647f54616f6c60266564602020202a0020202020202020202020202a05657274502d302f54656a796c616964796e696f5e266c65637020202020202020202020202a0a092928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e266c65637020202020202020202020202a092829756b6f5960716f556275737e65602d3029756b6f5960716e266c65637020202020202020202020202a002020202020202020202020202020202a0d70202020202020202020202020202020202020202a037e656b6f64702a32237e656b6f64722020202020202020202020202020202020202020202020202a0c292d522275626d657e622b54727f547372796668247e69602a322275626d657e622020202020202020202020202020202020202020202020202a0b702d30227563757f5566796473616e266c656370202020202020202020202020202020202020202a0a337e656b6f64702669602020202020202020202020202020202a092d522e656b6f647f58637562766562722b54727f5473727966682e656b6f647f57756e6f547567602d30237e656b6f64702020202020202020202020202020202a0d503b537e656b6f647f586375627665627e266c6563702d3024727f5473727966602020202020202020202020202020202a0a30302d312029237e656b6f647f586375627665627e266c6563782e656c60246e6160237e656b6f647f586375627665627e266c65637026696020202020202020202020202a047c6571666564602972602275637570256679647361602371602275637570247372796660256864702473656c656350232020202020202020202020202a0a09243d347e65646e69602c26602c2d5b58207d65746e2e6f637a60202020202020202020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c222e6f637a6e237e656b6f647d2863756276656272282e65607f6028647967702020202020202020202020202020202a056c6966602974707d65602564716562734023202020202020202020202020202020202a0a35637c656020202020202020202020202a0928237e656b6f647f54616f6c6e266c6563702020202020202020202020202020202a0a39222e6f637a6e237e656b6f647d2863756276656272282374737968756e286471607e237f6026696020202020202020202020202a0a3f54656a796c616964796e696f5e266c656370247f6e60266960202020202020202a0a39266c6563782f5f54796e696f5f50266564602020202a002020202a0f55636e6164737e696f5e237c63602e627574756270202020202020202a09237c63682f5f57756e6f5f5e29282275607573702d302f55636e6164737e696f5e237c636020202020202020202020202a0a3f55636e6164737e696f5e237c6360247f6e60266960202020202020202a0a3923776271677b6a2a202c237762716a202c237c63682f5f57756e6f5f50266564602020202a002020202a056e6f6e402d30256d69647f586375627665627f5473716c602020202a002020202a0d7d727473702a322e656b6f647f546962202c227473702a322e656b6f647f53737563636162202c227473702a322e656b6f647f58637562766562722b702a32237e656b6f6472202c247e69602a322275626d657e622b702a327563757f55667964736160266f6024716d627f664023202020202a056e6f6e402d30227563757f556679647361602020202a002020202a0d5b502d3023727563757023202020202a002020202a0d5d727473702a322e656b6f647f5863756276656272202c247e69602a322275626d657e622b7b502a337e656b6f647f5863756276656270266f6024716d627f664023202020202a0d5b502d30237e656b6f647f58637562766562702020202a002020202a0222202d3029756b6f596071602020202a002020202a05637c6166402d302f54656a796c616964796e696f502020202a056e6f6e402d302f55636e6164737e696f502020202a0a38647571402373716c636a0a09756b6f5960716f556275737e656024727f607d69602c6964757e207071602d6f62766a0e656b6f647f57756e6f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a056d69647024727f607d696a0e6f637a6024727f607d696a037f6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a092828647571402d3025636e6164737e69486475714a002020202a056e6f6e4025637c6560227563757f556679647361602669602d52237e656b6f64722b527563757f556679647361602e627574756270202020202020202a0928227563757f5566796473616f5475676e266c6563702d30227563757f55667964736160202020202020202a0a356e6f6e402c7024736964602e3d2029266c656378237e656b6f647f5566796473616f54756760266564602020202a002020202a027563757f5566796473616e266c6563702e627574756270202020202020202a00202020202020202a092d522275626d657e622b527563757f5566796473616e266c656378227f666f537e656b6f647f586375627665627f5e266c65637020202020202020202020202a0a3928256d69647e256d6964702d3c3024716f5375627960787560246e6160256e6f6e40247f6e6023796024716f5375627960787560266960202020202020202a092d52237e656b6f64722b527563757f5566796473616e266c6563782972796078756f5e656b6f64702d3024716f5375627960787560202020202020202a0e2075656c6371602371677025636966756460256864702275647661602e276e25602320202020202020202a0c246562796078756029746165627c6160237168602e656b6f647025686470266960292863756276656270247867696c666d2e696024656271686370256864702e6f68202320202020202020202a0479616770297c6e6f402e2972796078756025627f66656260246e657f62776b63616260256864702e6960237e656070716860297c6c616d627f6e602c6167756e6562502320202020202020202a00202020202020202a0928227563757f54737279666f5473656c65637f5e266c6563702e62757475627020202020202020202020202a056c62616c696166716026696022756375702473727966602568647025637f6f686340232020202020202020202020202a0a327563757f5566796473616e266c656370247f6e60266960202020202020202a0a39266c656378227563757f5566796473616f54756760266564602020202a002020202a05637c6166402e627574756270202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e696020202020202020202020202a09222e2e656b6f64702863756276656270276e696373796d60227f60247563702275637570256679647361602f6e4228247e6962707020202020202020202020202a0a35637c6560202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e69602020202020202020202020202020202a09222e2e656b6f647022756375702566796473616027756e6562702f647024656c6961664228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a05657274502e6275747562702020202020202020202020202020202a09222e297c6c65766373756363657370246567756e6562702e656b6f647022756375702566796473614228247e696270702020202020202020202020202020202a0a337e656b6f647026696020202020202020202020202a092d522275626d657e622b527563757f5566796473616e266c656378227f666f537e656b6f647f586375627665627f5e266c6563702d30237e656b6f647020202020202020202020202a0a327563757f5566796473616e266c656370266960202020202020202a0a39266c6563782e656b6f647f527563757f5566796473616f57756e656270266564602020202a0a09282c6c616f597669647f6e6e2075756b61677f5e266c65637020202020202020202020202a0a3075756b61677f5e266c6563702864796770202020202020202a0a39266c6563782275686375627665627f556b61677f50266564602020202a0a027563757f5566796473616e266c6563702e627574756270202020202020202a09282275686375627665627f556b61677f5e266c65637020202020202020202020202a0d7020202020202020202020202a037e656b6f64702a32237e656b6f6472202020202020202020202020202020202a0c292d522275626d657e622b54727f547372796668247e69602a322275626d657e62202020202020202020202020202020202a0b702d30227563757f5566796473616e266c65637020202020202020202020202a0a337e656b6f6470266960202020202020202a092d522275626d657e622b54727f547372796668227f666f537e656b6f647f586375627665627f5e266c6563702d30237e656b6f647020202020202020202020202a0a3863756276656270246e6160237e656b6f6470247f6e60266960202020202020202a0924727f547372796668237e656b6f647f5465686361636f5e266c6563702d30237e656b6f6470202020202020202a0d503b537e656b6f647f586375627665627e266c6563702d3024727f547372796660202020202020202a056e6f6e402e62757475627020202020202020202020202a0a30302d3d3029237e656b6f647f586375627665627e266c6563782e656c60266960202020202020202a0a356e6f6e402c7024736964602e3d202925657274502d302c6f6f62602a38637562766562702c266c656378227563757f54737279666f5473656c65637f50266564602020202a0a092275626d657e68227f666f537e656b6f647f586375627665627f5e266c656370227f60292972747e656f547278237e656b6f647f5465686361636f5e266c6563702e627574756270202020202020202a056e6f6e402e62757475627020202020202020202020202a0a3972747e656f547270247f6e60266960202020202020202a09256e6f6e402c29292275626d657e68247e69602d3d30292d522275626d657e622b547278247e6960266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d302972747e656f54727020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a02222220202020202020202a0e2863756276656270292465627168637820216025637967727568647f602c246562796078756e6570256c69686770237e656b6f647024656863616360256864702a3275637570202020202020202a0566796473616025686470276e69676e6168636024757f68647967702275626d657e602465627f647370297e6160227f6660237e656b6f647024696c616670237e627574756250202020202020202a02222220202020202020202a0a356e6f6e402c7024736964602e3d2029247e69602a3275626d657e602c266c656378237e656b6f647f54756760266564602020202a0a09282275686375627665627f556b61677f5e266c656370202020202020202a0d70202020202020202a037e656b6f64702a32237e656b6f64722020202020202020202020202a0c292275626d657e68247e69602a322275626d657e622020202020202020202020202a0b702d30227563757f5566796473616e266c656370202020202020202a0a05637c6166402e62757475627020202020202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e696020202020202020202020202a09222e2465627960787560227f6024696c61667e6960256260247867696d602e656b6f64702863756276656270256864502e2d7275626d657e6b702a3275626d657e60227f6660237e656b6f6470247567602f647024656c696166422668247e6962707020202020202020202020202a0a337e656b6f6470247f6e60266960202020202020202a092275626d657e68237e656b6f647f5475676e266c6563702d30237e656b6f6470202020202020202a08637562766562702f6e60237465656e60247e657f636361602465637570297c647e656365627021602f64702b63616260276e69686364796773502320202020202020202a0a05637c6166402e62757475627020202020202020202020202a09222e2e2e25657e69647e6f63602f64702275647e6540237375627052282475707e696020202020202020202020202a09222d7275626d657e6b702a3275626d657e60227f6660246e657f66602e656b6f647028637562766562702f6e422668247e6962707020202020202020202020202a0a3972747e656f547270247f6e60266960202020202020202a09256e6f6e402c292275626d657e602d3d302d522275626d657e622b547270266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d302972747e656f547270202020202020202a037e656b6f647f58637562766562702d6f6276602275626d657e6025686470227f66602e656b6f64702863756276656270247567402320202020202020202a0a39247e69602a3275626d657e602c266c656378227563757f5566796473616f54756370266564602020202a0a056e6f6e4025637c656022756375702669602d52237e656b6f64722b52756375702e6275747562702020202023202020202a09256e6f6e402c292275626d657e602d3d302d522275626d657e622b527563757026696023727563757e266c6563702e69602275637570227f66602275637578282478756e602d3022756375702020202023202020202a0a39247e69602a3275626d657e602c266c656378237e656b6f647f527563757f547567602665646023202020202a0a056e6f6e402d30227563757f5566796473616e266c6563702020202020202020202020202020202a09222e2e2e25657e69647e6f63602f64702275647e65402373756270502e2476656c602372756375702f6e42282475707e69602020202020202020202020202020202a0a35637c656020202020202020202020202a0928227563757f54737279666f5473656c65637f5e266c6563702020202020202020202020202020202a056e6f6e402d30227563757f5566796473616e266c6563702020202020202020202020202020202a0a30302d312029237e656b6f647f586375627665627e266c6563782e656c6026696020202020202020202020202a047c6571666564602972602275637570256679647361602371602275637570247372796660256864702473656c656350232020202020202020202020202a0a3275626d657e602d3d302d522275626d657e622b527563757f5566796473616e266c656370246e6160227563757f5566796473616e266c656370266960202020202020202a056c62616c696166716026696022756375702566796473616027756e6021602473656c6563702c227563757025667964736160256864702371677022756375702465667f6d656270256864702669402320202020202020202a00202020202020202a0928237e656b6f647f54616f6c6e266c6563702320202020202020202a037e656b6f6470227563757028637562766562502320202020202020202a0020202020202020202020202a0928237e656b6f647f556671637f5e266c65637020202020202020202020202a056c6966602f64702566716350232020202020202020202020202a0020202020202020202020202a0d5275626d657e602d31202d522275626d657e622b527563757026696023727563757e266c6563702e69602275637570227f6660227563757b502d3023727563757e266c656370232020202020202020202020202a0a0d5275626d657e602d31202d522275626d657e622b547270266960237e656b6f647f586375627665627e266c6563702e6960247270227f666024727b502d30237e656b6f647f586375627665627e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39247e69602a3275626d657e602c266c6563782e656b6f647f586375627665627f55667f6d656270266564602020202a0020202020202020202020202a092275626d657e68227563757f5566796473616f5475637e266c656370202020202020202a046564646160297c67756e602f6470227563757025667964736160247563502320202020202020202a0020202020202020202020202a00202020202020202a0020202020202020202020202a0928237e656b6f647f556671637f5e266c65637020202020202020202020202a056c6966602f64702566716350232020202020202020202020202a0020202020202020202020202a092d702020202020202020202020202020202a0e656b6f647f58637562766562702a322e656b6f647f586375627665627220202020202020202020202020202020202020202a0c292275626d657e68247e69602a322275626d657e6220202020202020202020202020202020202020202a0b78246e656070716e237e656b6f647f586375627665627e266c6563702020202020202020202020202020202a0a35637c656020202020202020202020202a09256e6f6e402c22237e656b6f647228207f607e276e696473796875602020202020202020202020202020202a0e656b6f647f58637562766562702d302d522e656b6f647f58637562766562722b576e696473796875602020202020202020202020202020202a0a376e6964737968756026696020202020202020202020202a09256e6f6e402c292275626d657e602d3d302d522275626d657e622b547270266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d30276e6964737968756020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a046e6560707160247f6e602669602c2479602563616c607562702c237569702669602c24737968756029746165627c61602275626d657e602669602b63656863402320202020202020202a0a39227473702a3e656b6f647f58637562766562702c247e69602a3275626d657e602c266c6563782e656b6f647f586375627665627f54646160266564602020202a0a09223d347e65646e69602c26602c237e656b6f647f586375627665627e266c656378207d65746e2e6f637a60202020202320202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c222e6f637a6e237e656b6f647d2863756276656272282e65607f6028647967702320202020202020202a0a002020202020202020202020202020202a0d522e656b6f647f58637562766562722b5d52237e656b6f64722b52756375702d302d522e656b6f647f58637562766562722b54727f576e69686364716d6020202020202020202320202020202020202a0a34727f576e69686364716d60266960202020202320202020202020202a09256e6f6e402c29292d522275626d657e622b5275637578247e69602d3d30292d522275626d657e622b547278247e6960266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d3024727f576e69686364716d60202020202320202020202020202a0a33727563757e266c6563702e69602275637570227f66602320202020202020202a056c696660256471646075502320202020202020202a00202020202020202a09222d7d572275626d657e672b54727b702a3275626d657e60227f66602e656b6f647028637562766562702f647024656c696166422668247e696270702020202023202020202020202020202020202020202a092d522275626d657e622b5472782e656b6f647f586375627665627f55667f6d65627e266c656370202020202020202023202020202020202020202020202020202a09222e247960276e69667f6d6562502e2465627960787560227f6024696c61667e69602379602d7d572275626d657e672b54727b702275626d657e60227f66602e656b6f647028637562766562522668247e69627070202020202020202023202020202020202020202020202020202a0a392568227473702e696022247375657175625024616242202669602020202023202020202020202020202020202020202a0a35602371602e6f69647075636875402470756368756023202020202020202020202020202020202a0374796d696c602564716270276e69647479686024696f6671602f64502320202921382075656c637e256d6964702020202023202020202020202020202020202020202a092d702020202023202020202020202020202020202020202a037e656b6f64702a32237e656b6f647220202020202020202023202020202020202020202020202020202a0c292d522275626d657e622b547278247e69602a322275626d657e6220202020202020202023202020202020202020202020202020202a0b78246e656070716e23727563757e266c6563702020202023202020202020202020202020202020202a092d522e656b6f647f58637562766562722b5472782e656b6f647f57756e6f547567602d30237e656b6f64702020202023202020202020202020202020202020202a09222d7d572275626d657e672b54727b702a3d79237e656b6f647f58637562766562782e656c6b7f2d7e6b702275626d657e60227f66602e656b6f6470276e6968637562766562522668247e696270702020202023202020202020202020202020202020202a01302d3b202e602020202023202020202020202020202020202020202a0a3972747023202020202020202020202020202020202a002020202020202020202020202020202a09222d74727b702a3972747e65602e656b6f647024696c61667e69422668247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a09247278246e656070716e237e656b6f647f586375627665627e266c656370202020202020202020202020202020202020202a0a3472702e6960222e656b6f647f586375627665627220246e61602472702e6960222275626d657e62202669602020202020202020202020202020202a0a337e656b6f647f58637562766562702e6960247270227f666020202020202020202020202a00302d302e60232020202020202020202020202a037e656b6f647024616f6c60246e616025647164696c616650232020202020202020202020202a0a0d5b502d3023727563757e266c65637023202020202020202020202020202020202a0d5b502d30237e656b6f647f586375627665627e266c6563702020202020202020202020202020202a0a3030202d312029237e656b6f647f58637562766562782e656c6026696020202020202020202020202a0020202020202020202020202a09266824616f6c6e2e6f637a602d30237e656b6f647f586375627665627020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c254c49464f535e454b4f44582e65607f602c2b636f6c6f5e266c6563702864796770202020202020202a0a39266c656378237e656b6f647f54616f6c60266564602020202a0a0923544e4f4345435f59525455425f5e454b4f445d34757f656d696478247961677e2075756b61677f5e266c656370202020202020202020202020202020202020202a0a3075756b61677f5e266c65637028647967702020202020202020202020202020202a0a392275626d657e68227f666f537e656b6f647f586375627665627f5e266c656370247f6e6026696020202020202020202020202a0a0d522275626d657e622b527563757f5566796473616e266c6563702d302275626d657e602020202020202020202020202020202a05657e69647e6f6360202020202020202020202020202020202020202a0929716c65646d34757f656d696478247961677e2075756b61677f5e266c656370202020202020202020202020202020202020202a0a30302e3029716c656460227f60256e6f6e4023796029716c6564602669602020202020202020202020202020202a0928286375627665627f5c69647e657f53746e6f6365637f5e266c6563702d3029716c6564602020202020202020202020202020202a0a3075756b61677f5e266c656370286479677020202020202020202020202a0a3565727450256c69686770202020202020202a0222222e25627960787560297568647025627f66656260297c64727f686370237e656b6f6470237722756375702566796473616025686470237568637562766562702a34616562786470246e657f62776b63616242222220202020202020202a0a39266c656378207f6f6c6f586375627665627f50266564602020202a0a0928256d69647e256d6964702d2024716f58637562766562702e627574756270202020202020202a0923544e4f4345435f59525455425f5e454b4f44502b20256d69647f586375627665627f5473716c6e266c6563702c2e494742514d4f584355425645425f5e454b4f44502d2024716f537562796078756828716d602d3024716f5863756276656270202020202020202a037e656b6f6470246566796c6d24727f686370227f66602e656675602c23544e4f4345435f59525455425f5e454b4f44502972756675602e616864702e6564766f6025627f6d602863756276656270227566756e402320202020202020202a003033302b20256d69647f586375627665627f5473716c6e266c6563702d3024716f537562796078756020202020202020202020202a056d69647566696c602564757e696d602530246568796660246c6f60256864702f64702b636162602c6c6166602c2d69616c636020787560256c62616375702f6e40232020202020202020202020202a0a356e6f6e4023796024716f5375627960787560266960202020202020202a092d52237e656b6f64722b527563757f5566796473616e266c6563782972796078756f5e656b6f64702d3024716f5375627960787560202020202020202a056e6f6e402e62757475627020202020202020202020202a0a327563757f5566796473616e266c656370247f6e60266960202020202020202a0a356e6f6e402c7024716f6c66602e3d2029266c656378286375627665627f5c69647e657f53746e6f6365637f50266564602020202a0a037e656b6f64702e627574756270202020202020202a09282475637e2d52256e6f64622b576e69646e65607020202020202020202020202a037e656b6f64702d302d52237e656b6f64722b576e69646e65607020202020202020202020202a09256e6f6e402c292275626d657e68247e6968207f607e2375686375627665627f576e69646e65607f5e266c6563702020202020202020202020202020202a0a3b636f6c6f5e266c656370286479677020202020202020202020202a0a397c6c616e696660202020202020202a056e6f6e402d30237e656b6f647020202020202020202020202a09222d756b702a3d7275626d657e6b702275626d657e60227f66602e656b6f647028637562766562702f647024656c696166422668247e6962707020202020202020202020202a0a35602371602e6f696470756368754024707563687560202020202020202a09237e656b6f64702c2275626d657e68237e656b6f647f55627f64737f5e266c6563702020202020202020202020202020202a0a337e656b6f647026696020202020202020202020202a09237e656b6f64782c6f6f62602d302b6f6e2e61607370202020202020202020202020202020202020202a092d522e656b6f647f58637562766562722b5972747e656f5472782e656b6f647f57756e6f547567602d30237e656b6f6470202020202020202020202020202020202020202a0a3e6160737023716029222e656b6f647f2473656e6e6f636d24696e65607f62202c22286375627665627f5e656b6f6472282e6160737e25636e6164737e694275636162745028647967702020202020202020202020202020202a0a356e6f6e40247f6e602379602972747e656f54727026696020202020202020202020202a0a39727470202020202020202a056e6f6e402d30237e656b6f6470202020202020202a0a0d52237e656b6f64722b576e69646e6560702e62757475627020202020202020202020202a0928247961677e2d52256e6f64622b576e69646e65607020202020202020202020202a0a32756e677f6f537960247f6e60266960202020202020202a0a09256e6f6e402c29292275626d657e68247e69602d3d30292d522275626d657e622b547278247e6960266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d302972747e656f54727020202020202020202020202a076e69646e6560702d302d592275626d657e68247e696b5375686375627665627f576e69646e65607f5e266c6563702020202020202020202020202020202a0d756e6f6e402a32237e656b6f6472202c2928247e6566754e276e69646165627864702a32256e6f64622b702d30276e69646e6560702020202020202020202020202020202a0a32756e677f6f53796026696020202020202020202020202a056e6f6e40237960276e69646e6560702d3022756e677f6f53796020202020202020202020202a09292275626d657e68247e69682475676e2375686375627665627f576e69646e65607f5e266c6563702d30276e69646e65607020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0222222e2473756571756270247867696c666d2e6960256e6f602562716863702372756c6c616360247e65627275736e6f63402e2275626d657e602160227f6660237e656b6f647023756863756276656252222220202020202020202a0a356e6f6e402c7024736964602e3d2029247e69602a3275626d657e602c266c656378227f666f537e656b6f647f586375627665627f50266564602020202a0a09282c6c616f597669647f6e6e2075756b61677f5e266c65637020202020202020202020202a092928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e266c6563702020202020202020202020202020202a0d702020202020202020202020202020202a037e656b6f64702a32237e656b6f647220202020202020202020202020202020202020202a0c292275626d657e68247e69602a322275626d657e6220202020202020202020202020202020202020202a0b702d30227563757f5566796473616e266c6563702020202020202020202020202020202a0a392275626d657e68247e69602d3d30292d522275626d657e622b527563757f5566796473616e266c656378247e6960246e6160227563757f5566796473616e266c65637026696020202020202020202020202a0a0928237e656b6f647f556671637f5e266c6563702020202020202020202020202020202a0d702020202020202020202020202020202a037e656b6f64702e696029756b6026696029222e656b6f647f546962202c222e656b6f647f53737563636162202c222e656b6f647f586375627665627228202e696029756b60227f66602d59756b6b537e656b6f64702a39756b60202020202020202020202020202020202020202a0b702d302d52237e656b6f64722b5972747e656f5472702020202020202020202020202020202a0d522e656b6f647f58637562766562722b537e656b6f64702d302d522e656b6f647f58637562766562722b5972747e656f5472702020202020202020202020202020202a0a356e6f6e40247f6e602379602972747e656f54727026696020202020202020202020202a09256e6f6e402c29292275626d657e68247e69602d3d30292d522275626d657e622b547278247e6960266960237e656b6f647f586375627665627e266c6563702e6960247270227f6660247278282478756e602d302972747e656f54727020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a3924736964602a337e656b6f64702c247e69602a3275626d657e602c266c656378237e656b6f647f55627f64737f50266564602020202a0a037e656b6f64702e627574756270202020202020202a056e6f6e402e62757475627020202020202020202020202a0a39545944494c41465f5e454b4f445f5e494d402d3c302928256d69647e256d6964702d2029727960787560227f60256e6f6e4023796029727960787560266960202020202020202a09237e656b6f64782972796078756f5e656b6f64702d3029727960787560202020202020202a0922237e656b6f6472282475676e2972747e656f5472702d30237e656b6f6470202020202020202a0a356e6f6e402c7024736964602e3d202924736964602a3972747e656f5472702c266c656378237e656b6f647f5465686361636f50266564602020202a0a09254c49464f535e454b4f44502c286471607f507d64782563616c6075627e237f6020202020202020202020202a0929282f6e656c69666e2668236e6973766e237f602020202020202020202020202020202a09282863757c666e26602020202020202020202020202020202a09223d347e65646e69602c26602c237e656b6f647f586375627665627e266c656378207d65746e2e6f637a602020202020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c286471607f507d64782e65607f60286479677020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a02207d647e2d754c49464f535e454b4f445b7226602d30286471607f507d6470202020202020202a05627f64737024656471636e65727470216023756671656c60227566756e6028637162736021602f6370256d616e656270246e6160256c696660207d65647021602f64702564796277502320202020202020202a0a39266c656378237e656b6f647f556671637f50266564602020202a0a05657c6166702d3029756b6f5960716f5e266c656370202020202020202a0a39227473702a35657c6166702c266c65637829756b6f59607160266564602020202a0275647475637e29756b6f59607160402020202a0a09756b6f5960716f5e266c6563702e627574756270202020202020202a092829756b6f5960716f556275737e65602d3029756b6f5960716f5e266c65637020202020202020202020202a0a39756b6f5960716f5e266c656370247f6e60266960202020202020202a0e297c64736562796460247960247563702372756c6c6163602373756c64616568602b3475707e69602e6f60237b636f6c6260227566756e60256c65746f6d6023796864702320202020202020202a076e6964727f607d69602f63702c256375702473727966602e6f6029276e696373796d60266960227f6660246564707d6f627070246e616820246564616f6c402320202020202020202a0a327473702e3d2029266c65637829756b6f59607160266564602020202a09747275607f627070402020202a0020202020202020202020202a05657274502d302f54656a796c616964796e696f5e266c65637020202020202020202020202a0a092824727164737e2275686375627665627f5e266c65637020202020202020202020202a09256572745d3e6f6d656164602c222275686375627665627d2e656b6f64722d356d616e602c207f6f6c6f586375627665627f5e266c65637d347567627164782461656278645e276e69646165627864702d302275686375627665627f5e266c65637020202020202020202020202a0a0925637c61664d3863756276656278227563757f54737279666f5473656c65637f5e266c65637020202020202020202020202a0e237568637562766562702928227563757f5566796473616f5475676024737279666025686470256863616360256c6261637570216024757f6864796750232020202020202020202020202a0e2b627f6774756e60256864702e6f60237479616770227566756e60256c65746f6d602379686470276e6964727f607d69602a337e656b6f647024656863616360232020202020202020202020202a0d6f627660297c6e6f60247572602c247c6571666564602972602275637570256679647361602371602275637570247372796660256864702473656c656350232020202020202020202020202a0a0928237e656b6f647f556671637f5e266c6563702020202020202020202020202020202a056c6966602974707d65602564716562734023202020202020202020202020202020202a0a35637c656020202020202020202020202a0928237e656b6f647f54616f6c6e266c6563702020202020202020202020202020202a0a39254c49464f535e454b4f44582374737968756e286471607e237f6026696020202020202020202020202a0a092928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e266c65637020202020202020202020202a0d7b702d302375686375627665627f576e69646e65607f5e266c65637020202020202020202020202a092b636f6c6f5e266c6563782e6f696479646e6f634e276e69646165627864702d302075756b61677f5e266c65637020202020202020202020202a09282b636f6c425e276e69646165627864702d302b636f6c6f5e266c65637020202020202020202020202a0a3f54656a796c616964796e696f5e266c656370247f6e60266960202020202020202a0a39266c6563782f5f54796e696f5f50266564602020202a002020202a0f55636e6164737e696f5e237c63602e627574756270202020202020202a09237c63682f5f57756e6f5f5e29282275607573702d302f55636e6164737e696f5e237c636020202020202020202020202a0a3f55636e6164737e696f5e237c6360247f6e60266960202020202020202a0a3923776271677b6a2a202c237762716a202c237c63682f5f57756e6f5f50266564602020202a002020202a056e6f6e402d30256d69647f586375627665627f5473716c602020202a002020202a0d7d727473702a322e656b6f647f546962202c227473702a322e656b6f647f53737563636162202c227473702a322e656b6f647f58637562766562722b702a32237e656b6f6472202c247e69602a322275626d657e622b702a327563757f55667964736160266f6024716d627f664023202020202a056e6f6e402d30227563757f556679647361602020202a002020202a0d5b502d3023727563757023202020202a002020202a0e246562796078756e65702379602e656b6f647f54696025686470256c69686770246563757562702c237e656b6f6470246565737379602473716c6025686470266f602568636163602c616e6f6964707f602e616023796022237e656b6f64722023202020202a0d5d7d727473702a322e656b6f647f546962202c227473702a322e656b6f647f53737563636162202c227473702a322e656b6f647f58637562766562722b702a32237e656b6f6472202c227473702a322e656b6f647f5863756276656272202c247e69602a322275626d657e622b7b502a337e656b6f647f5863756276656270266f6024716d627f664023202020202a0d5b502d30237e656b6f647f58637562766562702020202a002020202a0222202d3029756b6f5960716f502020202a002020202a05637c6166402d302f54656a796c616964796e696f502020202a056e6f6e402d302f55636e6164737e696f502020202a0a38647571402373716c636a0a056e6f6e4025637c6560292924716f6c66602c247e6968202c2078756825636e6164737e696379602669602920787568247e69602e6275747562702020202a092220787562282475676e29222220227f6029222e656b6f647f546962282475676e237e656b6f6478237d69616c636f54777a602d30207875602020202a056e6f6e402e627574756270202020202020202a0a337e656b6f6470247f6e602669602020202a0222222e247e6563756270702669602c207d616473756d69647028796e657021602371602d69616c63602078756023772e656b6f647f54696025686470237e6275747562522222202020202a0a356e6f6e402c70247e69602e3d2029256e6f6e402c7024736964602a337e656b6f64782972796078756f5e656b6f64702665646a0a0033302d3029545944494c41465f5e454b4f445f5e494d4a076e6963757562702864727f6770247f6e6025627160297279607875602f647023796864702e616864702275637f6c6360237e656b6f647024656863616340232a0a022e6f637a6e237e656b6f647d2863756276656272202d30254c49464f535e454b4f445a0a037d69616c636f54777a602c29756b6f5960716f556275737e656024727f607d69602c6964757e207071602d6f62766a03544e4f4345435f59525455425f5e454b4f44502c2e494742514d4f584355425645425f5e454b4f445024727f607d69602769666e6f636e207071602d6f62766a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a0e656b6f647f57756e6f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a076e696461656278647024727f607d696a056d69647024727f607d696a0e6f637a6024727f607d696a037f6024727f607d696" ));
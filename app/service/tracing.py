@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d602020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a0929237e6f696471627574682972716d6d65737f54716d627f6668247e696270702020202a092d52237d622b54627f63656278246e656070716e292d5b502c292d522e616073722b54627f636562702c2d5228647160722b54627f6365627828247c65716665646475637e237e6f6964716275746020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0a327f62727545646f6365644e4f435a4e2e6f637a602470756368756020202020202020202020202a09256e696c682374616f6c6e2e6f637a602d3024627f636562702020202020202020202020202020202a0a3972747020202020202020202020202a0a36602e6960256e696c60227f6660202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222272202c256c69666f55636162747e23776271682e65607f6028647967702020202a0d7b702d30237e6f696471627574602020202a0a092677627168237762716f55637271607e227563727160702d3023776271602020202a0922256c69666f55636162747228247e656d657762716f5464616e227563727160702020202a09222e207f6860246e6160247e696f60746e656022756070256c6966602563616274702160256a7962716d6d6573522d3e6f69647079627363756468227563727160547e656d657762714e2563727160776271602d30227563727160702020202a0a39256e6f6e402d30256e6f6e402c702473796c602a36776271682e69616d602665646a0a0a0928227563616274502d3025636e6164737e694275636162745a0a0924787564782374616f6c6e2e6f637a602e62757475627020202020202020202020202a0a3928647160702c2225646f6365646f5e6f637a62282e6160737e266c6563702864796770202020202020202a0a392222202d30227473702a38647160702c227473702a34787564702c266c6563782374616f6c60266564602020202a0a092a626f6823707d65746e2e6f637a602e62757475627020202020202020202020202a0a3928647160702c2225646f636e656f5e6f637a62282e6160737e266c6563702864796770202020202020202a0a327473702e3d20292222202d30227473702a38647160702c2a626f602c266c65637823707d657460266564602020202a0a0929282972716d6d65737e266c656378247e6962707020202020202020202020202a09222a392d756d616e656c69666e266c65637b78202972716d6d65737025636162745e6c522668247e6962707020202020202020202020202a0a337e6f6964716275746e266c656370246e61602972716d6d65737f547e69627070266960202020202020202a05637c6166402d3024656c62616e656e266c65637020202020202020202020202a056e6f6e402d30256c69666f5e266c65637020202020202020202020202a092825637f6c636e256c69666f5e266c65637020202020202020202020202a0e6275747562702020202020202020202020202020202a0a356e6f6e40237960256c69666f5e266c65637026696020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a3925637c6166402d302c6f6f62602a3972716d6d65737f547e696270702c266c65637825637f6c6360266564602020202a0a09282271656c636e237e6f6964716275746e266c65637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a39266c656378247563756270266564602020202a0a09237e6f696471627574682972716d6d65737f54716d627f66602e627574756270202020202020202a0d7928237d6564796e237e6f6964716275746e266c6563702e69602375657c6166702c29756b60227f6660292375657c6166782473796c602a39756b6b702d30237e6f6964716275746020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a327473702e3d2029266c6563782972716d6d657370266564602020202a0a09222e6c52202b20256e696c6825647962777e256c69666f5e266c6563702020202020202020202020202020202a0a356e6f6e40247f6e60237960256c69666f5e266c65637026696020202020202020202020202a09237d6f54656370716c6568246e656070716e23756c607d61637020202020202020202020202a0923554c405d41435f58514d4f55434142545d3e656c68716d682565717564602d302d59256d616e602c28647160782b537e6f6964716275746e266c6563702d3023756c607d6163702020202020202020202020202020202a0a356e6f6e4023796023756c607d61637026696020202020202020202020202a0929256d616e602c2864716078282475676e237e6f6964716275746e266c6563702d3023756c607d61637020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a092d70202020202020202a0c2b6f602a322b6f622020202020202020202020202a0c2923302c237d6f54656370716c6568246e657f62702a32237d622020202020202020202020202a0c28647160702a3228647160722020202020202020202020202a0c256d616e602a322e616073722020202020202020202020202a0c2923302c2928256d69647e256d696478246e657f62702a322374722020202020202020202020202a0b7823707d65746e2e6f637a602d30256e696c60202020202020202a0a3925657274502d302c6f6f62602a3b6f602c24716f6c66602a337d6f54656370716c65602c227473702a38647160702c227473702a356d616e602c266c65637824627f63656270266564602020202a0a09222d2220227f6028647160702c256d616e602c266c6563782e6160735f502e627574756270202020202020202a0e4140535f5c4c455e4f502e62757475627020202020202020202020202a0a34656c62616e656e266c656370247f6e60266960202020202020202a0a392222202d30227473702a38647160702c227473702a356d616e602c266c6563782e61607370266564602020202a0a0925657274502c25637f6c636e266c65637822756473796765627e2479687564716020202020202020202020202a0a347968756f54716f5972716d6d657370266960202020202020202a05657274502d3024656c62616e656e266c65637020202020202020202020202a09213d376e69627566666572602c22283d266475722d376e69646f636e65602c222162202c256d616e656c6966682e65607f602d30256c69666f5e266c65637020202020202020202020202a0e237e657270292825637f6c636025627f6665626024656c6c696b60237960237375636f627070256864702669602e65667560232020202020202020202020202a0c23746e65602479602371602e6f6f6370237160256c6966602568647023756863616562702e616073702972756675602f6370246562756666657260256e696c40232020202020202020202020202a056d616e656c6966602d30256d616e656c69666e266c65637020202020202020202020202a092825637f6c636e256c69666f5e266c6563702020202020202020202020202020202a0a356e6f6e40247f6e60237960256c69666f5e266c65637026696020202020202020202020202a0a3b636f6c6f5e266c6563702864796770202020202020202a0a3925657274502d302c6f6f62602a347968756f54716f5972716d6d6573702c227473702a356d616e656c6966602c266c656378256c62616e6560266564602020202a0a05657274502d302f54656a796c616964796e696f5e266c65637020202020202020202020202a0a09254c49464f554341425458256c62616e656e266c6563702020202020202020202020202020202a0a354c49464f55434142545026696020202020202020202020202a0a09282b636f6c4e276e69646165627864702d302b636f6c6f5e266c65637020202020202020202020202a056e6f6e402d30256c69666f5e266c65637020202020202020202020202a0d7923554c405d41435f58514d4f55434142545d3e656c68716d602c2d5e2e2e202c237d6b582565717564602a392e616073702c28647160782b702a337e6f69647162757460266f6024716d627f6640232020202020202020202020202a0d7b702d30237e6f6964716275746e266c65637020202020202020202020202a056e6f6e402d30256d616e656c69666e266c65637020202020202020202020202a05637c6166402d3024656c62616e656e266c65637020202020202020202020202a0a3f54656a796c616964796e696f5e266c656370247f6e60266960202020202020202a0a39266c6563782f5f54796e696f5f50266564602020202a0a0f55636e6164737e696f5e237c63602e627574756270202020202020202a09237c63682f5f57756e6f5f5e29282275607573702d302f55636e6164737e696f5e237c636020202020202020202020202a0a3f55636e6164737e696f5e237c6360247f6e60266960202020202020202a0a3923776271677b6a2a202c237762716a202c237c63682f5f57756e6f5f50266564602020202a0a05637c6166402d302f54656a796c616964796e696f502020202a056e6f6e402d302f55636e6164737e696f502020202a0a327563616274502373716c636a0a0a05637c6166402e627574756270202020202020202a09256e6f6e40237960256079747f53687560246e61602b6f6e266c6563702c237d6f54656370716c65602c286471607e266c6563702c256d616e6e266c65637824627f6365627e2275636162747e266c656370202020202020202a00303031302a2029246564727164737e266c6563702d2029282275647e657f636f566275607e256d696478202d30237d6f54656370716c6560202020202020202a0a392264702c236875602c256079747f536875602c266c6563782f5f547968756f5f50266564602020202a0a066c6563702e627574756270202020202020202a09282275647e657f636f566275607e256d6964702d30246564727164737e266c656370202020202020202a0a39266c6563782f5f5275647e656f5f50266564602020202a0a05657274502d302b6f6e266c656370202020202020202a08647160702d30286471607e266c656370202020202020202a056d616e602d30256d616e6e266c656370202020202020202a027563616274702d302275636162747e266c656370202020202020202a0a39227473702a38647160702c227473702a356d616e602c227563616274702c266c6563782f5f54796e696f5f50266564602020202a0a09222b6f62202c222465647271647372202c222864716072202c22256d616e62202c222275636162747228202d302f5f53747f6c637f5f502020202a0a3e6160735f502373716c636a0a0a09282e6160735c6c657e4f502d302e4140535f5c4c455e4f5a0a05637c6166402e627574756270202020202020202a0a392264702c236875602c256079747f536875602c266c6563782f5f547968756f5f50266564602020202a0a066c6563702e627574756270202020202020202a0a39266c6563782f5f5275647e656f5f50266564602020202a0a05657274502d302b6f602020202a0a3e6160735c6c657e4f502373716c636a0a0a0923756e696c682e696f6a6e222e6c52202e6275747562702020202a0920202020202020202a02237d6d76613e273e3a392939302c2375657c616678256c69647e65636275607b70237d6d76613e273e3a392539302c2375657c616678256c69647e65636275607b70237d6d76613e273e3a392035302c2375657c616678256c69647e65636275607b72266020202020202020202020202a02202d763e3a392375657c6166782e656c6b702d74313c3a3e6160737b702d78343c3a386471607b72266020202020202020202020202a08246e656070716e23756e696c60202020202020202a092d592e616073702c28647160782b537e6f69647162757468246564727f63702d302375657c616670202020202020202a0a39292d513b5b602c2929227564627f682e656c602c2d513b5b682475676e227564627f602c2d503b5b68202a3b602164626d616c6d39756b602c237e6f69647162757468246564727f63702e69602e616073702c2864716070227f66602020202a0d79225544425f4f5e4140535825647162756d657e65602e6960256d616e602c2960227f666029602a356d616e6b702d30227564627f602020202a0d522d793e3a37293930772b702d793e3a37253930772b702d793e3a37203530772b702d763e3a372e672b702d74313c3a372e616073772b702d78343c3a37247e696f60746e65672b72266b502d3023756e696c602020202a0222222d7d5e2e2e202c237d6b502a392e616073702c28647160782b702a337e6f696471627574622222202020202a0a327473702e3d202924736964602a337e6f696471627574682972716d6d65737f54716d627f66602665646a0a0a0d51302d202b6e61627b5375657c61667f546564727f63702e6275747562702020202a0929292375657c61667f546564727f63782e656c602a20203031302f2020782c6965636e2864716d602c213828716d602d302b6e6162702020202a003e20302e627574756270202020202020202a0a3375657c61667f546564727f6370247f6e602669602020202a0222222e2473796c60246564727f637029746165627c61602e6160266f60256c69647e6563627560702b6e61627d2473756271656e422222202020202a0a34716f6c66602e3d202924716f6c66602a30702c2473796c602a3375657c61667f546564727f6378256c69647e6563627560702665646a0a0a0d52286375627665627f5e656b6f6472202c222470797273656462202c2225646f6365646f5e6f637a62202c222d6165627473707572202c2225646f636e656f5e6f637a62202c222e67696374707972736e65622b502d30225544425f4f5e4140535a0a0c6e6f637a6e256361627470276e69636162747e256369667275637e207071602d6d202e6f68647970702020232a0a3864796770227564716c6024656a7962716d6d6573702562602e616360256c696660256c6f686770256864702b34796875602471602465647e69627070232a037960237e6160737023554c405d41435f58514d4f5543414254502473716c6025686470266f602972716d6d6573702939307f2539307f20353070247e696f60746e656d227560702140232a032a086375627665627f5e656b6f64702c24707972736564602c25646f6365646f5e6f637a602c2d61656274737075702c25646f636e656f5e6f637a602c2e67696374707972736e65602a33756d616e602e61607350232a032a0d7c6f6f62602a322b6f62202c24716f6c66602a32237d62202c227473702a322864716072202c227473702a322e61607372202c24716f6c66602a322374722b702020232a0a356e696c602e4f435a40256e6f60237160254c49464f5543414254502f64702465646e65607071602379602e6160737024656863796e6966602863616540232a032a0e2473656a626f60207f6d2f6e60246562716863702160237e62757475627029282e6160737024656c6261637964602e65686770232a0b34756370237960254c49464f5543414254502373756c6e657024656c6261637964402e237c6c61636029405140227f6660237e6160737029736e6564716c60207f686d22756050232a0a03554c405d41435f58514d4f5543414254502c254c49464f55434142545024727f607d69602769666e6f636e207071602d6f62766a0a05657175646024727f607d6960237e6f696473656c6c6f63602d6f62766a056d69647024727f607d696a076e696461656278647024727f607d696a0864716d6024727f607d696a0e6f637a6024727f607d696a0479687564716024727f607d696a05637271607762716024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d602020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a09222d756d616e6b702025667964716c657d657360237d602d76613e283a30303031302f2023757f55667964716c657d65736b7020266c656370237d602d76613e283a30303031302f2023757f566c65637b7020222668247e696270702020202020202020202020202020202a0a39222e2070716228286479677374727164737e256d616e60227f602220707162202d3d30256d616e6026696020202020202020202020202a0a39256572745d35637275667562702c2d513b55602a35602164626d616c6d39756b602c2374727f607d696f5473716c68246564727f63702e69602f502c23757f55667964716c657d6573602c23757f566c6563702c256d616e60227f6660202020202020202a09222a39256d696470266c6563782023756c65746f6d602070716e6c5228247e69627070202020202020202a0a09222d756d616e6b7020237d602d76613e283a30303031302f2023757f55667964716c657d65736b7020222668247e6962707020202020202020202020202a0a3d507f647e237762716a3b59256572745d35637275667562702c2d523b55602a35602164626d616c6d39756b602c2c6566756c6f507f6478246564727f63702e69602f502c23757f55667964716c657d6573602c23757f566c6563702c256d616e60227f6660202020202020202a0d50302d3d302d533b5972747e65602669602374727f607d696f5473716c602e69602972747e6560227f66602972747e656b502d302c6566756c6f507f6470202020202020202a09222a392e6572702473716c6820256d69647025667964716c657d6573602972602374727f607d69602d707f647e237762716b70207f645e6c522668247e69627070202020202020202a0a3374727f607d696f5473716c602669602020202a0a0922237d602d76603e2a30303031302a202d52302f2f202923776e696d6964782e656c6b53776e696d69647b702e616964656d602c237d602d76603e2a30303031302a202d503b53776e696d69647b702e696d602a34707d6f6270702473727966602f6470256d6964722668247e69627070202020202020202a092824727f637e23776e696d696470202020202020202a0a33776e696d6964702669602020202a0a0922237d602d76603e2a30303031302a2024656370716c656b7024707d6f6270702473727966602f6470256d6964702a3d71302b20296b702e6572722668247e6962707020202020202020202020202a0924656370716c6568246e656070716e23776e696d69647020202020202020202020202a0a35637c6560202020202020202a0922246568636165627024707d6f6270702f6e602a3d71302b20296b702e6572722668247e6962707020202020202020202020202a0a356e6f6e4023796024656370716c6560266960202020202020202a0374727f607d69602d302374727f607d696f5473716c6020202020202020202020202a0a3374727f607d6960266960202020202020202a0924757f656d69647e23776271602c286471607f5e69616d6825636e6f6f5e6572702d302374727f607d69602c24656370716c6560202020202020202a09247f6f627825686361636f5465646f6365646f5271656c636020202020202020202020202a0a346c6f636e2377627160266960202020202020202a0a39237e65727e237762716825676e6162702e69602960227f66602020202a0d5b502d302374727f607d696f5473716c602020202a0d5b502d3023776e696d6964702020202a0a09286471607f5e69616d68256d616e6279646e286471607e237f602d30247f6f62702020202a092e69616d6e2377627168286471607372616e286471607e237f602d30286471607f5e69616d602020202a0a092677627168237762716f55637271607e227563727160702d3023776271602020202a09203e2032313d347c6571666564602c24716f6c666d35607974702c2224757f656d69647d2d2228247e656d657762716f5464616e227563727160702020202a09222e65727029727566756025627f6665626025686361636025646f6365647972602465646f63656460256864702271656c63422d307c6568602c22256572747f55627f6473722d3e6f69647361602c22246c6f636d2d2228247e656d657762716f5464616e227563727160702020202a09222473796c602f647023756c65746f6d60297e616d60277f68422d307c6568602c25313d347c6571666564602c247e696d35607974702c22207f647d2d2228247e656d657762716f5464616e227563727160702020202a09233d347c6571666564602c247e696d35607974702c22237e65727d2d2228247e656d657762716f5464616e227563727160702020202a092229707e2e69616d602f647028647160522d307c6568602c2229707e2e69616d622d347c6571666564602c222e69616d6d2d2228247e656d657762716f5464616e227563727160702020202a09222e24737f636024727f607d6960256c65746f6d6d22756070246e616024707d6f62707d24737279666d2f647d256d6964702562757371656d422d3e6f69647079627363756468227563727160547e656d657762714e2563727160776271602d30227563727160702020202a0a39256e6f6e402d30256e6f6e402c702473796c602a36776271682e69616d602665646a0a0a0374727f607d69602c24656370716c65602e6275747562702020202a092922302f2f2029247e65646e69682e656c602c2923757f55667964716c657d657368247e69602c2923757f566c656378247e69602c256d616e6828246e656070716e2374727f607d696020202020202020202020202a09282370757f62776e286364716d602d30256d616e602c247e65646e69602c23757f55667964716c657d6573602c23757f566c65637020202020202020202020202a0a386364716d60266960202020202020202a09256e696c68286364716d6e25425f554d494454525f405d494f502d30286364716d60202020202020202a0a392823756e696c64796c60737e227275646473702e6960256e696c60227f66602020202a0d5b502d302374727f607d69602020202a0a056e6f6e4025637c656024757f646473702e696022554b42514d4f54505d4f42505026696024656472716473702d2029282275647e657f636f566275607e256d6964702d3024656370716c65602020202a092825647163696e657d6d6f636e236f6270702d30227275646473702c24757f64647370202020202020202a09282c6c696b6e236f627070202020202020202a0a3465627960787544757f656d69645e237375636f627072657370247075636875602020202a0924757f656d69647d34757f656d69647825647163696e657d6d6f636e236f6270702d30227275646473702c24757f64647370202020202020202a02756b62716d6025686470276e69647e69627070227564766160247867696270237375636f6270702568647023747968756025626f627070256864502320202020202020202a0a397274702020202a09202020202a0c256572745d3478756470202020202020202a0c267e656d367e6560202020202020202a0c254059405e237375636f62707265737d32727564647370202020202020202a0c254059405e237375636f62707265737d34757f64647370202020202020202a0c2c4c455e4655444e237375636f62707265737d3e6964647370202020202020202a0c222e2220227f6029286471607f5e69616d68256d616e6279646e286471607e237f6d34677360202020202020202a0c2d586471607f5e69616d602c22256d696474727f607d6962202c22285d22202c256c62616475736568756e2379737b50202020202020202a082e65607f605e237375636f6270726573702d30236f6270702020202a09282275647e657f636f566275607e256d6964702d3024656472716473702020202a092221322d34454255464645524e455e4f48445950502c2221322d38434e45424f50555452514453502c2e6f6279667e656e237f6824736964602d30267e65602020202a0a3d5473796c602c256e6f6e402c7024716f6c666b556c607574702e3d202924716f6c66602a34757f656d6964702c227473702a386471607f5e69616d6825636e6f6f5e6572702665646a0a0a0929256d616e602c29727f647365627964682e696f6a6e286471607e237f6825667f6d65627e237f602020202020202020202020202020202a0a39222465646f6365646e22282864796773746e656e256d616e6026696020202020202020202020202a0a33756c6966602e6960256d616e60227f6660202020202020202a05657e69647e6f636020202020202020202020202a0a322f5f556863616369707f5f52202d31202929727f64736562796468256d616e656371626e286471607e237f60266960202020202020202a0a39247f6f62782b6c61677e237f602e696023756c6966602c2f502c29727f64736562796460227f66602020202a0a39227473702a347f6f627825686361636f5465646f6365646f5271656c63602665646a0a0a05626f6270702d302475707e696e237e69647c696572602020202a092038247968756f5e237f60202020202020202a09282863757c666e24757f6464737e23797370202020202020202a09222e6c5d72554b42514d4f54505d4f42505b7e6c52266825647962777e24757f6464737e23797370202020202020202a0a3922222d34707d6f62707825626f627070266564602020202a0222222e24707d6f6270702473727966602568647024716024796875602a313d38434e45424f50555452514453502e6568677029707e2e69616d602d6f62766024656c6c6163422222202020202a0a392825626f62707f54707d6f62707f5c6c6164737e69602665646a0a0a0922292b235c58292a237c582c7c5b237c592b246c582b237c5c7c5b237c592b246c582b237c5a356d69647024727f607d696e522278256c69607d6f636e2562702d3025425f554d494454525f405d494f5a022f5f54505d4f42505f54535259464f58434e45424f505554525144535f5f52202d3022554b42514d4f54505d4f42505a0a0d546c6f636d2d2b502d5e40207f647d2d2b502d5e40237e65727d2d2b5028636e65626f507574727164737e207071602d6d202e6f68647970702020232a032a0e2920656d696474727f607d6960285d202e6f68647970706021696678202374737f636024727f607d6960256c65746f6d6028636165602863657d60277f6860246e6160232a04707d6f62707029282475707e6960247372796660237479602863616562702f647023756b6164702069707e2e69616d602e6f686479707060276e6f6c60277f6860237562757371656d40232a0a056d69647024727f607d696a0379737024727f607d696a037375636f62707265737024727f607d696a05627024727f607d696a037f6024727f607d696a037e69647c6965726024727f607d696a05637271607762716024727f607d696" ));
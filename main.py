@@ -1 +1 @@
-_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09222d756b702a346562727573636f60227f627275602e61422668247e696270702020202023202020202a0a35602371602e6f69647075636875402470756368756023202020202a09222e2e6f69647163696c6070716025686470276e69647968754e6c5228247e69627070202020202020202a0a347075727275647e694462716f6269756b40247075636875602020202a09282e69616d60202020202020202a0a397274702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a0928257e656d6f547e657f6363616f577f68637020202020202020202020202a0e6960246567676f6c60247f6e40232020202020202020202020202a0a35637c6560202020202020202a09282563757160702020202020202020202020202020202a09222e2e696167616029727470256371656c60502e2563696f68636024696c61667e694228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222e296e69602471616370216964656372756470276e616970257f6950227f66402c6169636560735024756b616070216461602b616469645228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a09237567616b6361607f5c616963656073702c2d52237e656b6f64722b527563757f55667964736168257e656d6f557f697f527f666f5c6169636560737f577f686370202020202020202020202020202020202020202a0a337567616b6361607f5c616963656073702669602020202020202020202020202020202a0922237567616b6361607f5c61696365607372282475676e216471646f53747e656d676563702d30237567616b6361607f5c616963656073702020202020202020202020202020202a0a322372202d3d3029282275677f6c6e2563696f68636026696c656020202020202020202020202a09282975726f6475716f5b6f647b69647f546564796d696c6e657f55647573656875602020202020202020202020202020202a0975726f6475716f5b6f647b69647f546564796d696c6e657f556475736568756024727f607d6960256c646e65726f5975726f6475716e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322472202d3d3029282275677f6c6e2563696f68636026696c656020202020202020202020202a092038247968756e237973702020202020202020202020202020202a09222e2e6f69647163696c6070716025686470276e69647968754228247e696270702020202020202020202020202020202a0a32293932202d3d302563696f68636026696c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e2b616c6f647964602375637b61402e28616c6163702e49405d7445425e256c6974735b7e6c522668247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a0928257e656d6f556c646e65726f5975726f6475716f577f686370202020202020202020202020202020202020202a0a3e49405f555e454d4f5e4544444948402d3d302475707e696f5e6960702669602020202020202020202020202020202a0922202a39697e65726d656372756470257e656d602375637b61676e656d602b65747e65702e4940502e616b6b6573716d42282475707e69602d302475707e696f5e6960702020202020202020202020202020202a0a32283832202d3d302563696f68636026696c656020202020202020202020202a092d52237e656b6f64722b527563757f5566796473616825676e61686368756f547e696f607f5e6572702020202020202020202020202020202a0a322032202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f5b62716d6b6f6f626f597c696d61666f577f6863702020202020202020202020202020202a0a322932202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f5b62716d6b6f6f626f577f6863702020202020202020202020202020202a0a322832202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f556c646e65726f577f6863702020202020202020202020202020202a0a322732202d3d302563696f68636026696c656020202020202020202020202a0925646f636f597c696d616668297c696d61666f59726f537567616b6361607f547567602020202020202020202020202020202a05657e69647e6f6360202020202020202020202020202020202020202a0a32293932202d3d3025646f636f597c696d6166602669602020202020202020202020202020202a0922202a392c65636e6163602f64702729393720227f682025646f6360297c696d6166602275647e6542282475707e69602d3025646f636f597c696d6166602020202020202020202020202020202a0a322632202d3d302563696f68636026696c656020202020202020202020202a092822357e656d6f547f686f577f6863702020202020202020202020202020202a0a322532202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f547f686f577f6863702020202020202020202020202020202a0a322432202d3d302563696f68636026696c656020202020202020202020202a092d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714829727f647379686f5e6f69647361637e6162747f577f6863702020202020202020202020202020202a0a322332202d3d302563696f68636026696c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0928237567616b6361607f597d6f5863647566602020202020202020202020202020202a0a322232202d3d302563696f68636026696c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0928257e656d6f547e657f6363616f577f6863702020202020202020202020202020202a0a322132202d3d302563696f68636026696020202020202020202020202a0922202e302e6168696c696052282475707e69602d302563696f68636020202020202020202020202a0a09216471646f53747e656d676563702c2f666e696f556c69666f6270702c2f666e696f51647f6571702c24716f546562796078756f55636e616c6162602c276e696e69616d65627f55636e616c6162602c2d522275626d657e622b527563757f55667964736168257e656d6f5e69616d6f577f68637020202020202020202020202a0020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a09282563757160702020202020202020202020202020202a0562757c6961666028636475666021647164602c61636964796273602e6f6024757f676f6c40232029256e6f6e48227563757f5566796473616f5475637e25636e6164737e6948647571402020202020202020202020202020202a09222d756b702a31647164602471657d656d602c61676167422668247e696270702020202020202020202020202020202a0a356023716029227f62727544757f656d69645e237562757475766e247e65627275736e6f63602c227f62727544656c6c65636e61634e237562757475766e247e65627275736e6f63602c2e6f6964707563687548202470756368756020202020202020202020202a0a003025637c656025636e616c6162602669602920302c2224716f5465627960787562282475676e25636e616c6162602d3024716f546562796078756f55636e616c6162602020202020202020202020202020202a003025637c656025636e616c6162602669602920302c22276e696e69616d656272282475676e25636e616c6162602d30276e696e69616d65627f55636e616c6162602020202020202020202020202020202a0a0d7b702d30216471646f53747e656d67656370202020202020202020202020202020202020202a09222e2e656d6765637021647164602c69626d61676e656d602c616761674228247e69627070202020202020202020202020202020202020202a0a356e6f6e40237960216471646f53747e656d676563702669602020202020202020202020202020202a0a0d7b702d302f666e696f556c69666f627070202020202020202020202020202020202020202a09222e2c69666f62707021647164602c69626d61676e656d602c616761674228247e69627070202020202020202020202020202020202020202a0a356e6f6e402379602f666e696f556c69666f6270702669602020202020202020202020202020202a0a0d75637c6166402a32246564796d696c6e657f53716862202c20302a322c61647f6472202c20302a32276e696e69616d6562722b702d302f666e696f51647f657170202020202020202020202020202020202020202a08637162736024696f6671602f647025657c616670247c657166656460247563502320202020202020202020202020202020202020202a09222e21647f657b6021647164602c69626d61676e656d602c616761674228247e69627070202020202020202020202020202020202020202a0a356e6f6e402379602f666e696f51647f6571702669602020202020202020202020202020202a0a0928247c657375627e2562757475766f53747e656d676563702d30216471646f53747e656d67656370202020202020202020202020202020202020202a0928247c657375627e2562757475766f556c69666f6270702d302f666e696f556c69666f627070202020202020202020202020202020202020202a0928247c657375627e2562757475766f51647f6571702d302f666e696f51647f657170202020202020202020202020202020202020202a0a09276e696e69616d65627f55636e616c6162602c2d522e656b6f647f537375636361622b5d52237e656b6f64722b527563757f556679647361602c2d522e656b6f647f5469622b5d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e6948647571402c23747e656d6765637824796d6265737e227f647573656875602d302562757475766f53747e656d67656370202020202020202020202020202020202020202a0a003025637c656025636e616c6162602669602920302c22276e696e69616d656272282475676e25636e616c6162602d30276e696e69616d65627f55636e616c616260202020202020202020202020202020202020202a0928247c657375627e2562757475766f55636e616c6162602d3025636e616c616260202020202020202020202020202020202020202a0a092d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e6948647571402c2f666e696f5e69676f6c6824796d6265737e227f647573656875602d302562757475766f556c69666f627070202020202020202020202020202020202020202a092d522e656b6f647f5469622b5d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e6948647571402c21647f65717f5e69616d6f5475676824796d6265737e227f647573656875602d302562757475766f51647f657170202020202020202020202020202020202020202a092d522e656b6f647f5469622b5d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e6948647571402c25636e616c61626f5475676824796d6265737e227f647573656875602d302562757475766f55636e616c616260202020202020202020202020202020202020202a0a327f647573656875602371602928227f6475736568754c6f6f605461656278645e237562757475766e247e65627275736e6f636028647967702020202020202020202020202020202a056e6f6e402d30216471646f53747e656d676563702020202020202020202020202020202a056e6f6e402d3025636e616c6162602020202020202020202020202020202a0577676e65747025747b61677029676e616275776e656d602b65747e65702e61616d6163727562602162716365637021647164602e6161647e696d6275607021657d6563702e616b6e616c616a4023202020202020202020202020202020202a0a3972747020202020202020202020202a0922227c522d346e65602c222e2e2e2577676e6574702e6f686f6d602c21647164602471657d656d4228247e6962707020202020202020202020202a0a356e6f6e40247f6e60237960227563757f55667964736160266960202020202020202a0e6960246567676f6c402320202020202020202a0a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f55667964736160202020202020202a0a3565727450256c696867702020202a0a0925353d337e6d657c6f63682c616e696d6275647f5f647e2472716f596963637160202020202020202a0a3472716f5969636371602669602020202a002020202a0a39282e69616d602665646a05657274502d30257e656d6f577f68637a0a09222d75353a272d272b722668247e696270702020202a09222963716b696c6071402271657c656b402aaa9f90f02e2d74554355425e256c6974735b7d59393b5d7e4149534e256c6974735b7020222668247e696270702020202a0922257e656d402e6564646968402f88bfe5b59f90f02e2d74554355425e256c6974735b7d58383b5d7e4149534e256c6974735b7020222668247e696270702020202a09222e696f605022716b657450218e8f90f02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e696270702020202a092225646f6340297c696d6166402b62716d6b6f6f62402a939f90f02e2d74554355425e256c6974735b7d593b5d7e4149534e256c6974735b7020222668247e696270702020202a092224756b6160502b62716d6b6f6f624026949f90f02e2d74554355425e256c6974735b7d583b5d7e4149534e256c6974735b7020222668247e696270702020202a09222929647c657d4820256c646e65724024756b616050296c656240229b9f90f02e2d74554355425e256c6974735b7d573b5d7e4149534e256c6974735b7020222668247e696270702020202a092225646f6340297c696d6166402e616b62716371646275624024756b616050296c6562402d849f90f02e2d74554355425e256c6974735b7d563b5d7e4149534e256c6974735b7020222668247e696270702020202a092229276e696c646e6572482022302f6d6f627050247f684024756b616050296c65624025a49f90f02e2d74554355425e256c6974735b7d553b5d7e4149534e256c6974735b7020222668247e696270702020202a09222f6d6f627050247f684024756b616050296c65624025a49f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e696270702020202a092229637b61637e6162745024716971677962502c939f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e696270702020202a0922216971635024756b616050247168696c4026a39f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e696270702020202a09222e657b614029647e6167402f202e69676f6c4024a19f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e696270702020202a09222d74554355425e256c6974735b7a357e656d4028696c69605d744c4f424e256c6974735b7020222668247e696270702020202a09222d75353a272d272b722668247e696270702020202a0a09222d75353a272d272b722668247e69627070202020202020202a09222d74554355425e256c6974735b7c6169637560737024756b61607021657d656370247168696c602b65747e65702d537b5028696c69605d775f4c4c45495e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d7c2a3d5725636962707f5e6f6b637964672b547375626b7020725d7e454542574e256c6974735b702e3d202d74554355425e256c6974735b7e7e7d7c2a3d5725636962707f5c616e696769627f672b547375626b7020725e7e7d7445425e256c6974735b702c70252d7d57247e65636275607f5e6f6b637964672b547375626b702e6f6b6379644020222668247e69627070202020202020202a09222d7d57256d616e672b547375626b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b71257d6b65747e65502c6169636560735024756b61605025a49f90fd744c4f424e256c6974735b7020222668247e69627070202020202020202a0a0d503b546564727f637f537567616b6361607f5c616963656073702d302473756260202020202020202a09256572745d35637275667562702c25627f63637d39756b602c237567616b6361607f5c61696365607378246564727f63702d30246564727f637f537567616b6361607f5c61696365607370202020202020202a0a0920302c2222676f51647f657b62282475676e276b60702a202920302c22247e65636275607f5e6f6b63796462282475676e276b60702e62757475627020202020202020202020202a0a39276b607825627f63637026656460202020202020202a0a337567616b6361607f5c616963656073702669602020202a0a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b70303030333e207250b29f90fd7e454542574e256c6974735b702c70246f6864756d4027756e402b6f647b6964502f6262757450246564796d696c6e6555a49f90f02d775f4c4c45495e256c6974735b7d545b5d7e4149534e256c6974735b7020222668247e696270702020202a002020202a09222d792727202c2729746f6267282475676e2669647f6e6b702a3d792727202c27256c64796477282475676e2669647f6e6b702d2020222668247e69627070202020202020202a0d503b537e6f69647163696669647f6e602d302669647f6e60202020202020202a0a337e6f69647163696669647f6e602669602020202a09222d74554355425e256c6974735b7a3963716b696669647f6e4022a39f90fd744c4f424e256c6974735b7020222668247e696270702020202a0a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b792e696f60702d7920302c27247e696f607f547e656272757367282475676e23727569647b78202d79272d27202c27256d616e6f5275696477282475676e23727569647b702a302020202020202275696450209da2ed7e454542574e256c6974735b7020222668247e696270702020202a09222d74554355425e256c6974735b7d74746f54716f546562796078756b702a302669647b61402163716d4023bf82ed75455c424e256c6974735b7020222668247e696270702020202a09222d74554355425e256c6974735b7d7274737f576e696e69616d65627f51647f65717b702a3021647f657b4021637963502a839f90fd71445e4547414d4e256c6974735b7020222668247e696270702020202a09222d74554355425e256c6974735b7d75636e616c61626b702072502a3021637c657050216379635020b29f90fd775f4c4c45495e256c6974735b7020222668247e696270702020202a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b792d7275626d657e6b78202d756d616e6f556c69666f62707b702a302020202020202e657b614024a19f90fd7e454542574e256c6974735b7020222668247e696270702020202a00292228ac92e0214d41445550255e454d4028ac92e2282275646165686f547e696270702020202a0a0922237567616b6361607f5c61696365607372282475676e216471646f53747e656d676563702d30237567616b6361607f5c616963656073702020202a09222e6f69647163696669647f6e62282475676e216471646f53747e656d676563702d30237e6f69647163696669647f6e602020202a092d7b702c2229747c61697f6c62282475676e216471646f53747e656d676563702d302372756964702020202a0922216e6577676e656052202c22256d616e6f5c6c657662282475676e292d7b702c22256c69666f627072282475676e2f666e696f556c69666f6270702d30256d616e6f556c69666f6270702020202a0a0229246564796d696c6e65582022202d3b202274737f576e696e69616d65627f51647f65717020202020202020202020202a0a3922246564796d696c6e657f53716862282475676e2f666e696f51647f657170266960202020202020202a022d74656474716d627f666f5c61647f647b702f202d74656474716d627f666f576e696e69616d65627b7226602d302274737f576e696e69616d65627f51647f657170202020202020202a092c61647f647821647f65717f54716d627f66602d3024656474716d627f666f5c61647f6470202020202020202a09276e696e69616d65627821647f65717f54716d627f66602d3024656474716d627f666f576e696e69616d656270202020202020202a0920302c222c61647f6472282475676e2f666e696f51647f6571702d302c61647f6470202020202020202a0920302c22276e696e69616d656272282475676e2f666e696f51647f6571702d30276e696e69616d656270202020202020202a0a3f666e696f51647f6571702669602020202a02214f2e42202d302274737f576e696e69616d65627f51647f6571702020202a0a092223552a3d452a38452024652d2d652d29552228256d6964766274737e2924716f546562796078756f55636e616c616268207d616473756d69647d6f62766e256d696475647164602d3024746f54716f54656279607875602020202a09282e65656273637f5271656c63602020202a0a39216471646f53747e656d676563702c2f666e696f556c69666f6270702c2f666e696f51647f6571702c24716f546562796078756f55636e616c6162602c25636e616c6162602c2275626d657e68257e656d6f5e69616d6f577f6863702665646a0a05646f6d6f5972747e65637f5275647e656024727f607d69602972747e65637e256369667275637e207071602d6f62766a05676e61686368756f547e696f607f5e65727024727f607d696023747e696f607e23757e656d6e207071602d6f62766a057e656d6f556c646e65726f5975726f6475716f577f68637024727f607d6960256c646e65726f5975726f6475716e23757e656d6e207071602d6f62766a02357e656d6f547f686f577f6863702c257e656d6f547f686f577f68637024727f607d6960247f686e23757e656d6e207071602d6f62766a057e656d6f556c646e65726f577f68637024727f607d6960256c646e65726e23757e656d6e207071602d6f62766a057e656d6f557f697f527f666f5c6169636560737f577f68637024727f607d69602c6169636560737e23757e656d6e207071602d6f62766a057e656d6f5b62716d6b6f6f626f597c696d61666f577f68637024727f607d69602b62716d6b6f6f626f597c696d61666e23757e656d6e207071602d6f62766a037c69616475646f5567616b6361607f577f6863702c297c696d61666f59726f537567616b6361607f547567602c237567616b6361607f597d6f58636475666024727f607d69602567616b6361607e23757e656d6e207071602d6f62766a057e656d6f547e657f6363616f577f68637024727f607d6960247e657f6363616e23757e656d6e207071602d6f62766a057e656d6f5b62716d6b6f6f626f577f68637024727f607d69602b62716d6b6f6f626e23757e656d6e207071602d6f62766a09727f647379686f5e6f69647361637e6162747f577f68637024727f607d6960247e656d6971607e23757e656d6e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a0a2024727f607d69602c6563776e656e247e65696c636e207071602d6f62766a0472716f5969636371602c256c697473502c2275646165686f547e696270702c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a0e49405f555e454d4f5e45444449484024727f607d69602769666e6f636e207071602d6f62766a01647f65717f54716d627f666024727f607d69602c6964757e207071602d6f62766a04737279666023756c62616962716670247e656d6e6f6279667e656024616f6c402320202769666e6f636e2070716024727f607d696a037562757475766e247e65627275736e6f636024727f607d696a0379737024727f607d696" ));
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09222d756b702a346562727573636f60227f627275602e61422668247e696270702020202023202020202a0a35602371602e6f69647075636875402470756368756023202020202a092823747164737f5c6f6f607f547e6962707e25636e6164737e6944727f60737e6162745020202020202020202020202a0a33545144535f5c4f4f405f5054545840266960202020202020202a0a397c6c616e6966602020202a09222e2e6f69647163696c6070716025686470276e69647968754e6c5228247e69627070202020202020202a0a347075727275647e694462716f6269756b40247075636875602020202a09282e69616d60202020202020202a0a397274702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a0928257e656d6f547e657f6363616f577f68637020202020202020202020202a057e656d6f547e657f6363616f577f68637024727f607d6960247e657f6363616e23757e656d6e207071602d6f62766020202020202020202020202a0e6960246567676f6c60247f6e40232020202020202020202020202a0a35637c6560202020202020202a09282563757160702020202020202020202020202020202a09222e2e696167616029727470256371656c60502e2563696f68636024696c61667e694228247e696270702020202020202020202020202020202a0a35637c656020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222e296e69602471616370216964656372756470276e616970257f6950227f66402c6169636560735024756b616070216461602b616469645228247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a09237567616b6361607f5c616963656073702c2d52237e656b6f64722b527563757f55667964736168257e656d6f557f697f527f666f5c6169636560737f577f686370202020202020202020202020202020202020202a057e656d6f557f697f527f666f5c6169636560737f577f68637024727f607d69602c6169636560737e23757e656d6e207071602d6f627660202020202020202020202020202020202020202a0a337567616b6361607f5c616963656073702669602020202020202020202020202020202a0922237567616b6361607f5c61696365607372282475676e216471646f53747e656d676563702d30237567616b6361607f5c616963656073702020202020202020202020202020202a0a322372202d3d3029282275677f6c6e2563696f68636026696c656020202020202020202020202a09282975726f6475716f5b6f647b69647f546564796d696c6e657f55647573656875602020202020202020202020202020202a0975726f6475716f5b6f647b69647f546564796d696c6e657f556475736568756024727f607d6960256c646e65726f5975726f6475716e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322472202d3d3029282275677f6c6e2563696f68636026696c656020202020202020202020202a092038247968756e237973702020202020202020202020202020202a09222e2e6f69647163696c6070716025686470276e69647968754228247e696270702020202020202020202020202020202a0a32293932202d3d302563696f68636026696c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0928256375716070202020202020202020202020202020202020202a09222d74554355425e256c6974735b7e2b616c6f647964602375637b61402e28616c6163702e49405d7445425e256c6974735b7e6c522668247e69627070202020202020202020202020202020202020202a0a35637c65602020202020202020202020202020202a0928257e656d6f556c646e65726f5975726f6475716f577f686370202020202020202020202020202020202020202a057e656d6f556c646e65726f5975726f6475716f577f68637024727f607d6960256c646e65726f5975726f6475716e23757e656d6e207071602d6f627660202020202020202020202020202020202020202a0a3e49405f555e454d4f5e4544444948402d3d302475707e696f5e6960702669602020202020202020202020202020202a0922202a39697e65726d656372756470257e656d602375637b61676e656d602b65747e65702e4940502e616b6b6573716d42282475707e69602d302475707e696f5e6960702020202020202020202020202020202a0a32283832202d3d302563696f68636026696c656020202020202020202020202a092d52237e656b6f64722b527563757f5566796473616825676e61686368756f547e696f607f5e6572702020202020202020202020202020202a05676e61686368756f547e696f607f5e65727024727f607d696023747e696f607e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322032202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f5b62716d6b6f6f626f597c696d61666f577f6863702020202020202020202020202020202a057e656d6f5b62716d6b6f6f626f597c696d61666f577f68637024727f607d69602b62716d6b6f6f626f597c696d61666e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322932202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f5b62716d6b6f6f626f577f6863702020202020202020202020202020202a057e656d6f5b62716d6b6f6f626f577f68637024727f607d69602b62716d6b6f6f626e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322832202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f556c646e65726f577f6863702020202020202020202020202020202a057e656d6f556c646e65726f577f68637024727f607d6960256c646e65726e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322732202d3d302563696f68636026696c656020202020202020202020202a0925646f636f597c696d616668297c696d61666f59726f537567616b6361607f547567602020202020202020202020202020202a097c696d61666f59726f537567616b6361607f5475676024727f607d69602567616b6361607e23757e656d6e207071602d6f6276602020202020202020202020202020202a05657e69647e6f6360202020202020202020202020202020202020202a0a32293932202d3d3025646f636f597c696d6166602669602020202020202020202020202020202a0922202a392c65636e6163602f64702729393720227f682025646f6360297c696d6166602275647e6542282475707e69602d3025646f636f597c696d6166602020202020202020202020202020202a0a322632202d3d302563696f68636026696c656020202020202020202020202a092822357e656d6f547f686f577f6863702020202020202020202020202020202a02357e656d6f547f686f577f68637024727f607d6960247f686e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322532202d3d302563696f68636026696c656020202020202020202020202a0928257e656d6f547f686f577f6863702020202020202020202020202020202a057e656d6f547f686f577f68637024727f607d6960247f686e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322432202d3d302563696f68636026696c656020202020202020202020202a092d52237e656b6f64722b527563757f556679647361602c29756b6f5960716e25636e6164737e69486475714829727f647379686f5e6f69647361637e6162747f577f6863702020202020202020202020202020202a09727f647379686f5e6f69647361637e6162747f577f68637024727f607d6960247e656d6971607e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322332202d3d302563696f68636026696c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0928237567616b6361607f597d6f5863647566602020202020202020202020202020202a037567616b6361607f597d6f58636475666024727f607d69602567616b6361607e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322232202d3d302563696f68636026696c656020202020202020202020202a05657e69647e6f63602020202020202020202020202020202a0928257e656d6f547e657f6363616f577f6863702020202020202020202020202020202a057e656d6f547e657f6363616f577f68637024727f607d6960247e657f6363616e23757e656d6e207071602d6f6276602020202020202020202020202020202a0a322132202d3d302563696f68636026696020202020202020202020202a0922202e302e6168696c696052282475707e69602d302563696f68636020202020202020202020202a0a092d5223727f627275622b5564716473702c2d52256c616473722b5564716473702c216471646f53747e656d676563702c2f666e696f556c69666f6270702c2f666e696f51647f6571702c24716f546562796078756f55636e616c6162602c276e696e69616d65627f55636e616c6162602c2d522275626d657e622b527563757f55667964736168257e656d6f5e69616d6f577f68637020202020202020202020202a0020202020202020202020202a003025637c656025636e616c6162602669602920302c2224716f5465627960787562282475676e25636e616c6162602d3024716f546562796078756f55636e616c61626020202020202020202020202a003025637c656025636e616c6162602669602920302c22276e696e69616d656272282475676e25636e616c6162602d30276e696e69616d65627f55636e616c61626020202020202020202020202a0a0d7b702d30216471646f53747e656d676563702020202020202020202020202020202a09222e2e656d6765637021647164602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a356e6f6e40237960216471646f53747e656d6765637026696020202020202020202020202a0a0d7b702d302f666e696f556c69666f6270702020202020202020202020202020202a09222e2c69666f62707021647164602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a356e6f6e402379602f666e696f556c69666f62707026696020202020202020202020202a0a0d75637c6166402a32246564796d696c6e657f53716862202c20302a322c61647f6472202c20302a32276e696e69616d6562722b702d302f666e696f51647f6571702020202020202020202020202020202a08637162736024696f6671602f647025657c616670247c6571666564602475635023202020202020202020202020202020202a09222e21647f657b6021647164602c69626d61676e656d602c616761674228247e696270702020202020202020202020202020202a0a356e6f6e402379602f666e696f51647f65717026696020202020202020202020202a0a0d5223747e656d676563722b5375657c6166702d30216471646f53747e656d6765637020202020202020202020202a0d52256c69666f6270722b5375657c6166702d302f666e696f556c69666f62707020202020202020202020202a0d5221647f6571722b5375657c6166702d302f666e696f51647f65717020202020202020202020202a0d5225636e616c6162622b5375657c6166702d3025636e616c61626020202020202020202020202a0d522375657c6166722b5564716473702d302375657c61667020202020202020202020202a0a05657e69647e6f6360202020202020202020202020202020202020202a0928256375716070202020202020202020202020202020202020202a0562757c6961666028636475666021647164602c61636964796273602e6f6024757f676f6c40232029256e6f6e48227563757f5566796473616f5475637e25636e6164737e694864757140202020202020202020202020202020202020202a09222e21647164602471657d656d602c616761674228247e69627070202020202020202020202020202020202020202a0a3d52246564616f6c622b556471647370247f6e602669602020202020202020202020202020202a09227563757f556679647361602c29756b6f5960716e25636e6164737e694864757148247f686370716e637e25636e6164737e694462716f6268637164402d302564716473702020202020202020202020202020202a0922302a2024555f454d49445f5054545848246564616f6c6f5c69647e657f547961677e25636e6164737e694462716f6268637164402020202020202020202020202020202a0922227c522d346e65602c222e2e2e2577676e6574702e6f686f6d602c21647164602471657d656d4228247e696270702020202020202020202020202020202a016d6164727560702e616471657d6560702577676e6574702c296e69602e657b61602b65747e6570296c616b656370216d6163702164716460216461602d657c65624023202020202020202020202020202020202a0a3d52246564616f6c622b556471647370247f6e6026696020202020202020202020202a09227563757f556679647361602c29756b6f5960716e25636e6164737e694864757148247f686370716e637e25636e6164737e694462716f6268637164402d3025647164737020202020202020202020202a0929707e2462716f62686371646f256369667275637f20707160247168696c6820246e657f62776b636162602964602965727162627560796460232020202020202020202020202a0163727167757c6164656b60276e61697021647164602b3965786164756b696460276e6169702279686b616275647021647164602e616b6c69607d616450232020202020202020202020202a0a356e6f6e40247f6e60237960227563757f55667964736160266960202020202020202a0e6960246567676f6c402320202020202020202a0a0928227563757f5566796473616f5475676e25636e6164737e6948647571402d30227563757f55667964736160202020202020202a0a3565727450256c696867702020202a0a0925353d337e6d657c6f63682c616e696d6275647f5f647e2472716f596963637160202020202020202a0a3472716f5969636371602669602020202a092822756e6e61626f547567602d302472716f5969636371602020202a002020202a0a39282e69616d602665646a05657274502d30257e656d6f577f68637a0a09222d75353a272d272b722668247e696270702020202a09222963716b696c6071402271657c656b402aaa9f90f02e2d74554355425e256c6974735b7d59393b5d7e4149534e256c6974735b7020222668247e696270702020202a0922257e656d402e6564646968402f88bfe5b59f90f02e2d74554355425e256c6974735b7d58383b5d7e4149534e256c6974735b7020222668247e696270702020202a09222e696f605022716b657450218e8f90f02e2d74554355425e256c6974735b7d503b5d7e4149534e256c6974735b7020222668247e696270702020202a092225646f6340297c696d6166402b62716d6b6f6f62402a939f90f02e2d74554355425e256c6974735b7d593b5d7e4149534e256c6974735b7020222668247e696270702020202a092224756b6160502b62716d6b6f6f624026949f90f02e2d74554355425e256c6974735b7d583b5d7e4149534e256c6974735b7020222668247e696270702020202a09222929647c657d4820256c646e65724024756b616050296c656240229b9f90f02e2d74554355425e256c6974735b7d573b5d7e4149534e256c6974735b7020222668247e696270702020202a092225646f6340297c696d6166402e616b62716371646275624024756b616050296c6562402d849f90f02e2d74554355425e256c6974735b7d563b5d7e4149534e256c6974735b7020222668247e696270702020202a092229276e696c646e6572482022302f6d6f627050247f684024756b616050296c65624025a49f90f02e2d74554355425e256c6974735b7d553b5d7e4149534e256c6974735b7020222668247e696270702020202a09222f6d6f627050247f684024756b616050296c65624025a49f90f02e2d74554355425e256c6974735b7d543b5d7e4149534e256c6974735b7020222668247e696270702020202a092229637b61637e6162745024716971677962502c939f90f02e2d74554355425e256c6974735b7d533b5d7e4149534e256c6974735b7020222668247e696270702020202a0922216971635024756b616050247168696c4026a39f90f02e2d74554355425e256c6974735b7d523b5d7e4149534e256c6974735b7020222668247e696270702020202a09222e657b614029647e6167402f202e69676f6c4024a19f90f02e2d74554355425e256c6974735b7d513b5d7e4149534e256c6974735b7020222668247e696270702020202a09222d74554355425e256c6974735b7a357e656d4028696c69605d744c4f424e256c6974735b7020222668247e696270702020202a09222d75353a272d272b722668247e696270702020202a0a09222d75353a272d272b722668247e69627070202020202020202a09222d74554355425e256c6974735b7c6169637560737024756b61607021657d656370247168696c602b65747e65702d537b5028696c69605d775f4c4c45495e256c6974735b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b7d7c2a3d5725636962707f5e6f6b637964672b547375626b7020725d7e454542574e256c6974735b702e3d202d74554355425e256c6974735b7e7e7d7c2a3d5725636962707f5c616e696769627f672b547375626b7020725e7e7d7445425e256c6974735b702c70252d7d57247e65636275607f5e6f6b637964672b547375626b702e6f6b6379644020222668247e69627070202020202020202a09222d7d57256d616e672b547375626b7020222668247e69627070202020202020202a09222d74554355425e256c6974735b71257d6b65747e65502c6169636560735024756b61605025a49f90fd744c4f424e256c6974735b7020222668247e69627070202020202020202a0a0d503b546564727f637f537567616b6361607f5c616963656073702d302473756260202020202020202a09256572745d35637275667562702c25627f63637d39756b602c237567616b6361607f5c61696365607378246564727f63702d30246564727f637f537567616b6361607f5c61696365607370202020202020202a0a0920302c2222676f51647f657b62282475676e276b60702a202920302c22247e65636275607f5e6f6b63796462282475676e276b60702e62757475627020202020202020202020202a0a39276b607825627f63637026656460202020202020202a0a337567616b6361607f5c616963656073702669602020202a0a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b70303030333e207250b29f90fd7e454542574e256c6974735b702c70246f6864756d4027756e402b6f647b6964502f6262757450246564796d696c6e6555a49f90f02d775f4c4c45495e256c6974735b7d545b5d7e4149534e256c6974735b7020222668247e696270702020202a002020202a09222d792727202c2729746f6267282475676e2669647f6e6b702a3d792727202c27256c64796477282475676e2669647f6e6b702d2020222668247e69627070202020202020202a0d503b537e6f69647163696669647f6e602d302669647f6e60202020202020202a0a337e6f69647163696669647f6e602669602020202a09222d74554355425e256c6974735b7a3963716b696669647f6e4022a39f90fd744c4f424e256c6974735b7020222668247e696270702020202a0a09222d75353a272d272b722668247e696270702020202a09222d74554355425e256c6974735b7d7567616373756d6b702a3d756362757f637b702471657d656d602c616761674020aa92ed7445425e256c6974735b7020222668247e69627070202020202020202a0a3928237d6564796e292d7b70227f6023727f62727568202e69602567616373756d602c256362757f6370227f66602020202a057e656d60256864702275667f60266f6024616564737e69602562756860246564727f607562702562716023756863756276656270246e657f62776b6361626024656c6961664023202020202a09222d74554355425e256c6974735b7965727162627560796460276e61646563702a2d775f4c4c45495e256c6974735b7020222668247e69627070202020202020202a0a356c616473702669602020202a09222d792723747e656d67656377282b62716d6b7d74554355425e256c6974735b792e696f60702d7920302c27247e696f607f547e656272757367282475676e23727569647b78202d79272d27202c27256d616e6f5275696477282475676e23727569647b702a302020202020202275696450209da2ed7e454542574e256c6974735b7020222668247e696270702020202a09222d792725636e616c616267282b62716d6b7d74554355425e256c6974735b7d74746f54716f546562796078756b702a302669647b61402163716d4023bf82ed75455c424e256c6974735b7020222668247e696270702020202a09222d792721647f657177282b62716d6b7d74554355425e256c6974735b7d7274737f576e696e69616d65627f51647f65717b702a3021647f657b4021637963502a839f90fd71445e4547414d4e256c6974735b7020222668247e696270702020202a09222d792725636e616c616267282b62716d6b7d74554355425e256c6974735b7d75636e616c61626b702072502a3021637c657050216379635020b29f90fd775f4c4c45495e256c6974735b7020222668247e696270702020202a09222d75353a272d272b722668247e696270702020202a09222d7927256c69666f627077282b62716d6b7d74554355425e256c6974735b792d7275626d657e6b78202d756d616e6f556c69666f62707b702a302020202020202e657b614024a19f90fd7e454542574e256c6974735b7020222668247e696270702020202a00292228ac92e0214d41445550255e454d4028ac92e2282275646165686f547e696270702020202a0a0922237567616b6361607f5c61696365607372282475676e216471646f53747e656d676563702d30237567616b6361607f5c616963656073702020202a09222e6f69647163696669647f6e62282475676e216471646f53747e656d676563702d30237e6f69647163696669647f6e602020202a092d7b702c2229747c61697f6c62282475676e216471646f53747e656d676563702d302372756964702020202a0922216e6577676e656052202c22256d616e6f5c6c657662282475676e292d7b702c22256c69666f627072282475676e2f666e696f556c69666f6270702d30256d616e6f556c69666f6270702020202a0a0229246564796d696c6e65582022202d3b202274737f576e696e69616d65627f51647f65717020202020202020202020202a0a3922246564796d696c6e657f53716862282475676e2f666e696f51647f657170266960202020202020202a022d74656474716d627f666f5c61647f647b702f202d74656474716d627f666f576e696e69616d65627b7226602d302274737f576e696e69616d65627f51647f657170202020202020202a092c61647f647821647f65717f54716d627f66602d3024656474716d627f666f5c61647f6470202020202020202a09276e696e69616d65627821647f65717f54716d627f66602d3024656474716d627f666f576e696e69616d656270202020202020202a0920302c222c61647f6472282475676e2f666e696f51647f6571702d302c61647f6470202020202020202a0920302c22276e696e69616d656272282475676e2f666e696f51647f6571702d30276e696e69616d656270202020202020202a0a3f666e696f51647f6571702669602020202a02214f2e42202d302274737f576e696e69616d65627f51647f6571702020202a0a092223552a3d452a38452024652d2d652d29552228256d6964766274737e2924716f546562796078756f55636e616c616268207d616473756d69647d6f62766e256d696475647164602d3024746f54716f54656279607875602020202a0a02222025637c6560256c616473702e6960256362757f6370266960222d74554355425e256c6974735b7a2d775f4c4c45495e256c6974735b702226602e627574756270202020202020202a0a39256362757f63782b62716d60266564602020202a0a20286479677024656b62716d6025627160246e657f62776b63616260256864702e696024656863756276656270276e696562602c6c696473702375657c61665023202020202a09282e65656273637f5271656c63602020202a0a39256e6f6e4d33727f627275602c29282d356c616473702c216471646f53747e656d676563702c2f666e696f556c69666f6270702c2f666e696f51647f6571702c24716f546562796078756f55636e616c6162602c25636e616c6162602c2275626d657e68257e656d6f5e69616d6f577f6863702665646a0a0e29282e69616d60256563702c2d65686470237e65607f60247168647028636e6162726025686470256469637e6960246564727f607d6960232a05627160292374727f607d6960256c6261647d2369647164737f256d6f646f647079727369707f25646f63627170227965686470246e61682023756c65746f6d60257e656d40232a0a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a05636e6164737e694462716f62686371644024727f607d69602462716f62686371646e256369667275637e207071602d6f62766a05636e6164737e69486475714024727f607d6960286475716e256369667275637e207071602d6f62766a02756e6e61626f547567602c256c697473502c2275646165686f547e696270702c2563757160702c2e65656273637f5271656c636024727f607d69602c6964757e23757e656d6e207071602d6f62766a04555f454d49445f50545458402c23545144535f5c4f4f405f50545458402c2e49405f555e454d4f5e45444449484024727f607d69602769666e6f636e207071602d6f62766a01647f65717f54716d627f666024727f607d69602c6964757e207071602d6f62766a04737279666023756c62616962716670247e656d6e6f6279667e656024616f6c402320202769666e6f636e2070716024727f607d696a0a092825626f62707f54707d6f62707f5c6c6164737e69602020202a05626f62707f54707d6f62707f5c6c6164737e696024727f607d696028636e65626f507574727164737e207071602d6f6276602020202a0a322132202d3d30292228434e45424f5055545251445352282475676e2e6f6279667e656e237f6026696a0a09282c6c6164737e696e227564616f6c6e2070716a027564616f6c6e2070716024727f607d696a08636e65716c602972756675602e6f60276e69646f63656460266f6024616564737e696025686361636025646f6365647972602465646f63656460256864702d6f6276602a2e20707160256672756350232a0a056d6964756471646024727f607d6960256d696475647164602d6f62766a0379737024727f607d696a037f6024727f607d696" ));
